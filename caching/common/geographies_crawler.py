@@ -58,7 +58,7 @@ class GeographiesAPICrawler:
             topic=topic
         )
         geography_type_data_models: list[GeographyTypeData] = (
-            self._convert_to_geography_type_models(response_data=response.data)
+            self._convert_to_geography_type_models(response_data=response.json())
         )
 
         logger.info("Completed processing of geographies API for `%s` page", topic)
@@ -23,6 +23,7 @@ DUAL_CATEGORY_DOWNLOADS_ENDPOINT_PATH = f"{API_PREFIX}downloads/dual-category/v1
 
 CACHE_FORCE_REFRESH_HEADER_KEY = "Cache-Force-Refresh"
 CACHE_RESERVED_NAMESPACE_HEADER_KEY = "Cache-Reserved-Namespace"
+CACHE_GENERATION_HEADER_KEY = "Cache-Generation"
 
 
 PAGE_TYPES_WITH_NO_ADDITIONAL_QUERY_PARAMS = (
@@ -46,6 +47,7 @@ class InternalAPIClient:
         *,
         client: APIClient | None = None,
         reserved_namespace: bool = False,
+        cache_generation: str | None = None,
     ):
         self._client = client or self.create_api_client()
 
@@ -69,6 +71,7 @@ class InternalAPIClient:
 
         # Header configurations
         self.reserved_namespace = reserved_namespace
+        self.cache_generation = cache_generation
 
     # API client
 
@@ -84,10 +87,16 @@ class InternalAPIClient:
 
     # Headers
 
-    def _build_headers(self) -> dict[str, bool]:
-        return {
+    def _build_headers(self) -> dict[str, bool | str]:
+        headers = {
             CACHE_RESERVED_NAMESPACE_HEADER_KEY: self.reserved_namespace,
         }
+        if self.cache_generation is not None:
+            # Directs the responses to be written into the
+            # generation of the default cache which is being hydrated
+            headers[CACHE_GENERATION_HEADER_KEY] = self.cache_generation
+
+        return headers
 
     # Query parameters
 
@@ -0,0 +1,156 @@
+import gzip
+from dataclasses import dataclass
+
+from django.http import HttpResponse
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+GZIP_CONTENT_ENCODING = "gzip"
+GZIP_COMPRESSION_LEVEL = 6
+
+# Only the headers which are set by the views themselves are kept.
+# All other headers are added on the way out by the middleware
+CACHED_HEADER_NAMES = ("Content-Disposition", "Cache-Control")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """The compact form of a rendered response, as held in the cache
+
+    Notes:
+        This holds only what is needed to serve the response,
+        rather than the whole `Response` object along with its renderer state.
+        Unpickling this on each cache hit is therefore
+        much cheaper than unpickling the original `Response`.
+
+    Attributes:
+        status_code: The HTTP status code of the response
+        content_type: The value of the `Content-Type` header
+        headers: The selected headers which were set on the response by the view
+        body: The rendered content of the response,
+            which will be compressed if the `content_encoding` is set
+        content_encoding: The encoding which has been applied to the `body`.
+            E.g. "gzip" or None if the `body` is not compressed
+
+    """
+
+    status_code: int
+    content_type: str
+    headers: tuple[tuple[str, str], ...]
+    body: bytes
+    content_encoding: str | None = None
+
+    @property
+    def is_compressed(self) -> bool:
+        return self.content_encoding == GZIP_CONTENT_ENCODING
+
+    def decompress_body(self) -> bytes:
+        """Returns the `body` in its original uncompressed form"""
+        if self.is_compressed:
+            return gzip.decompress(self.body)
+        return self.body
+
+
+def build_cached_response(
+    *, response: Response | HttpResponse, compression_threshold_in_bytes: int
+) -> CachedResponse:
+    """Builds the `CachedResponse` for the given rendered `response`
+
+    Args:
+        response: The rendered response to be saved in the cache
+        compression_threshold_in_bytes: The size in bytes of the content
+            at which point the body will be gzip compressed.
+            Smaller bodies are stored as they are,
+            since they do not benefit enough to be worth the CPU
+
+    Returns:
+        The `CachedResponse` which can be saved in the cache
+
+    """
+    body: bytes = response.content
+    content_encoding: str | None = None
+
+    if len(body) >= compression_threshold_in_bytes:
+        body = gzip.compress(body, compresslevel=GZIP_COMPRESSION_LEVEL, mtime=0)
+        content_encoding = GZIP_CONTENT_ENCODING
+
+    headers = tuple(
+        (header_name, response[header_name])
+        for header_name in CACHED_HEADER_NAMES
+        if response.has_header(header_name)
+    )
+
+    return CachedResponse(
+        status_code=response.status_code,
+        content_type=response["Content-Type"],
+        headers=headers,
+        body=body,
+        content_encoding=content_encoding,
+    )
+
+
+def build_http_response(
+    *, cached_response: CachedResponse, accepts_gzip: bool
+) -> HttpResponse:
+    """Builds the `HttpResponse` to be served from the given `cached_response`
+
+    Notes:
+        If the `cached_response` was compressed and the client accepts gzip,
+        then the compressed body is served as it is
+        along with the `Content-Encoding` header.
+        Otherwise, the body is decompressed before being served.
+
+    Args:
+        cached_response: The `CachedResponse` which was retrieved from the cache
+        accepts_gzip: Whether the client accepts gzip encoded responses
+
+    Returns:
+        The `HttpResponse` which can be served to the client
+
+    """
+    serve_compressed: bool = cached_response.is_compressed and accepts_gzip
+    body: bytes = (
+        cached_response.body if serve_compressed else cached_response.decompress_body()
+    )
+
+    response = HttpResponse(
+        content=body,
+        status=cached_response.status_code,
+        content_type=cached_response.content_type,
+    )
+    for header_name, header_value in cached_response.headers:
+        response[header_name] = header_value
+
+    if cached_response.is_compressed:
+        response["Vary"] = "Accept-Encoding"
+    if serve_compressed:
+        response["Content-Encoding"] = cached_response.content_encoding
+
+    return response
+
+
+def request_accepts_gzip(*, request: Request) -> bool:
+    """Checks whether the `Accept-Encoding` header of the given `request` allows for gzip
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        True if the client accepts gzip encoded responses, False otherwise
+
+    """
+    accept_encoding: str = request.headers.get("Accept-Encoding", "")
+    qualities: dict[str, float] = {}
+
+    for encoding in accept_encoding.split(","):
+        coding, _, parameters = encoding.partition(";")
+        quality: str = parameters.strip().removeprefix("q=").strip() or "1"
+        try:
+            qualities[coding.strip().lower()] = float(quality)
+        except ValueError:
+            continue
+
+    quality_for_gzip: float = qualities.get(
+        GZIP_CONTENT_ENCODING, qualities.get("*", 0)
+    )
+    return quality_for_gzip > 0
@@ -1,15 +1,23 @@
 import logging
+import uuid
 from typing import Any
 
 from django.core.cache import caches
 from django.core.cache.backends.redis import RedisCache
 
+from caching.private_api.local_cache import (
+    CACHE_TIER_METRICS,
+    LocalCache,
+    get_local_cache,
+)
+
 logger = logging.getLogger(__name__)
 
 
 RESERVED_NAMESPACE_KEY_PREFIX = "ns2"
 RESERVED_CACHE_NAME = "reserved"
 DEFAULT_CACHE_NAME = "default"
+LOCAL_CACHE_GENERATION_KEY = "local-cache-generation"
 
 
 class CacheClient:
@@ -25,6 +33,11 @@ class CacheClient:
         If False, the connection will be made to the cache designated for more ephemeral / normal data
         Defaults to False
 
+        If `PRIVATE_API_LOCAL_CACHE_ENABLED` is set,
+        then reads which opt in via `use_local_cache` are first served
+        from a bounded, in-process `LocalCache` in front of each cache.
+        The local caches are dropped across all processes whenever a cache is cleared.
+
     """
 
     def __init__(self, *, is_reserved_namespace: bool = False):
@@ -48,12 +61,24 @@ class CacheClient:
             self.pre_selected_cache_name = DEFAULT_CACHE_NAME
         self.pre_selected_cache: RedisCache = caches[self.pre_selected_cache_name]
 
-    def _select_cache_for_key(self, *, cache_entry_key: str) -> RedisCache:
+    def _select_cache_name_for_key(self, *, cache_entry_key: str) -> str:
         if cache_entry_key.startswith(f"{self._reserved_namespace_key_prefix}-"):
-            return caches[RESERVED_CACHE_NAME]
-        return caches[DEFAULT_CACHE_NAME]
+            return RESERVED_CACHE_NAME
+        return DEFAULT_CACHE_NAME
+
+    def _select_cache_for_key(self, *, cache_entry_key: str) -> RedisCache:
+        cache_name: str = self._select_cache_name_for_key(
+            cache_entry_key=cache_entry_key
+        )
+        return caches[cache_name]
+
+    def _select_local_cache_for_key(self, *, cache_entry_key: str) -> LocalCache | None:
+        cache_name: str = self._select_cache_name_for_key(
+            cache_entry_key=cache_entry_key
+        )
+        return get_local_cache(cache_name=cache_name)
 
-    def get(self, *, cache_entry_key: str) -> Any | None:
+    def get(self, *, cache_entry_key: str, use_local_cache: bool = False) -> Any | None:
         """Retrieves the cache entry associated with the given `cache_entry_key`
 
         Notes:
@@ -62,9 +87,20 @@ class CacheClient:
             then the item will be fetched from the reserved cache.
             Otherwise, it will be fetched from the default cache
 
+            If `use_local_cache` is True and the local cache is enabled,
+            then the entry is first looked up in the in-process `LocalCache`.
+            Entries which are then found in the shared cache
+            are copied into the local cache.
+            This should only be used for entries which can tolerate
+            being stale for the timeout of the local cache.
+            i.e. not for leases or generation pointers.
+
         Args:
             cache_entry_key: The string which acts as the
                 identifier for the cache entry
+            use_local_cache: Switch to read through
+                the in-process `LocalCache`.
+                Defaults to False
 
         Returns:
             The value associated with the cache entry or None if not found
@@ -73,7 +109,40 @@ class CacheClient:
         selected_cache: RedisCache = self._select_cache_for_key(
             cache_entry_key=cache_entry_key
         )
-        return selected_cache.get(key=cache_entry_key, default=None)
+        if not use_local_cache:
+            return selected_cache.get(key=cache_entry_key, default=None)
+
+        local_cache: LocalCache | None = self._select_local_cache_for_key(
+            cache_entry_key=cache_entry_key
+        )
+        if local_cache is not None:
+            self._sync_local_cache_generation(
+                local_cache=local_cache, selected_cache=selected_cache
+            )
+            value = local_cache.get(cache_entry_key=cache_entry_key)
+            CACHE_TIER_METRICS.record(tier="local", is_hit=value is not None)
+            if value is not None:
+                return value
+
+        value = selected_cache.get(key=cache_entry_key, default=None)
+        CACHE_TIER_METRICS.record(tier="remote", is_hit=value is not None)
+
+        if local_cache is not None and value is not None:
+            local_cache.put(cache_entry_key=cache_entry_key, value=value)
+
+        return value
+
+    @staticmethod
+    def _sync_local_cache_generation(
+        *, local_cache: LocalCache, selected_cache: RedisCache
+    ) -> None:
+        if not local_cache.is_generation_check_due():
+            return
+
+        generation: str | None = selected_cache.get(
+            key=LOCAL_CACHE_GENERATION_KEY, default=None
+        )
+        local_cache.sync_generation(generation=generation)
 
     def put(self, *, cache_entry_key: str, value: Any, timeout: int | None) -> None:
         """Persists the entry within the cache
@@ -100,6 +169,166 @@ class CacheClient:
             cache_entry_key=cache_entry_key
         )
         selected_cache.set(key=cache_entry_key, value=value, timeout=timeout)
+        self._delete_from_local_cache(cache_entry_key=cache_entry_key)
+
+    def get_many(self, *, cache_entry_keys: list[str]) -> dict[str, Any]:
+        """Retrieves the cache entries associated with the given `cache_entry_keys`
+
+        Notes:
+            For the redis cache, this is a wrapper around the `MGET` redis command.
+            So the entries held in each cache are fetched in 1 round trip
+
+        Args:
+            cache_entry_keys: The strings which act as the
+                identifiers for the cache entries
+
+        Returns:
+            Dict of the values keyed by their `cache_entry_key`.
+            Keys which were not found are omitted
+
+        """
+        retrieved_entries: dict[str, Any] = {}
+        for cache_name, keys in self._group_keys_by_cache_name(
+            cache_entry_keys=cache_entry_keys
+        ).items():
+            retrieved_entries |= caches[cache_name].get_many(keys=keys)
+
+        return retrieved_entries
+
+    def set_many(self, *, entries: dict[str, Any], timeout: int | None) -> None:
+        """Persists all the given `entries` within the cache
+
+        Notes:
+            For the redis cache, this is a wrapper around the `MSET` redis command
+            followed by an `EXPIRE` for each key, which are sent in 1 pipeline.
+            As with `put()`, entries with keys beginning with `ns2-`
+            are placed in the reserved cache.
+
+        Args:
+            entries: Dict of the values to be stored
+                keyed by their `cache_entry_key`
+            timeout: The number of seconds after which the entries
+                are expired and evicted from the cache
+
+        Returns:
+            None
+
+        """
+        for cache_name, keys in self._group_keys_by_cache_name(
+            cache_entry_keys=list(entries)
+        ).items():
+            caches[cache_name].set_many(
+                data={key: entries[key] for key in keys}, timeout=timeout
+            )
+
+        for cache_entry_key in entries:
+            self._delete_from_local_cache(cache_entry_key=cache_entry_key)
+
+    def _group_keys_by_cache_name(
+        self, *, cache_entry_keys: list[str]
+    ) -> dict[str, list[str]]:
+        grouped_keys: dict[str, list[str]] = {}
+        for cache_entry_key in cache_entry_keys:
+            cache_name: str = self._select_cache_name_for_key(
+                cache_entry_key=cache_entry_key
+            )
+            grouped_keys.setdefault(cache_name, []).append(cache_entry_key)
+
+        return grouped_keys
+
+    def _delete_from_local_cache(self, *, cache_entry_key: str) -> None:
+        local_cache: LocalCache | None = self._select_local_cache_for_key(
+            cache_entry_key=cache_entry_key
+        )
+        if local_cache is not None:
+            local_cache.delete(cache_entry_key=cache_entry_key)
+
+    def add(self, *, cache_entry_key: str, value: Any, timeout: int | None) -> bool:
+        """Persists the entry within the cache, only if the `cache_entry_key` is not already taken
+
+        Notes:
+            For the redis cache, this is a wrapper around the `SET NX` redis command.
+            So this is atomic across all the processes which share the cache
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+            value: The content being stored in the cache
+                for this entry
+            timeout: The number of seconds after which the entry
+                is expired and evicted from the cache
+
+        Returns:
+            True if the entry was added.
+            False if the `cache_entry_key` was already taken
+
+        """
+        selected_cache: RedisCache = self._select_cache_for_key(
+            cache_entry_key=cache_entry_key
+        )
+        return selected_cache.add(key=cache_entry_key, value=value, timeout=timeout)
+
+    def incr(self, *, cache_entry_key: str, delta: int) -> int:
+        """Increments the counter held in the entry associated with the given `cache_entry_key`
+
+        Notes:
+            For the redis cache, this is a wrapper around the `INCRBY` redis command.
+            So this is atomic across all the processes which share the cache.
+            The counter is created without a timeout if it does not already exist.
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+            delta: The amount to increment the counter by
+
+        Returns:
+            The value of the counter after it has been incremented
+
+        """
+        selected_cache: RedisCache = self._select_cache_for_key(
+            cache_entry_key=cache_entry_key
+        )
+        selected_cache.add(key=cache_entry_key, value=0, timeout=None)
+        return selected_cache.incr(key=cache_entry_key, delta=delta)
+
+    def touch(self, *, cache_entry_key: str, timeout: int | None) -> bool:
+        """Sets a new timeout on the entry associated with the given `cache_entry_key`
+
+        Notes:
+            For the redis cache, this is a wrapper around the `EXPIRE` redis command.
+            The value of the entry is left as it is.
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+            timeout: The number of seconds from now after which the entry
+                is expired and evicted from the cache
+
+        Returns:
+            True if the entry exists and its timeout was set, False otherwise
+
+        """
+        selected_cache: RedisCache = self._select_cache_for_key(
+            cache_entry_key=cache_entry_key
+        )
+        return selected_cache.touch(key=cache_entry_key, timeout=timeout)
+
+    def delete(self, *, cache_entry_key: str) -> None:
+        """Deletes the entry associated with the given `cache_entry_key`
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+
+        Returns:
+            None
+
+        """
+        selected_cache: RedisCache = self._select_cache_for_key(
+            cache_entry_key=cache_entry_key
+        )
+        selected_cache.delete(key=cache_entry_key)
+        self._delete_from_local_cache(cache_entry_key=cache_entry_key)
 
     def clear(self) -> None:
         """Deletes all the keys in the cache - this is a wrapper around the FLUSHDB redis command
@@ -118,6 +347,10 @@ class CacheClient:
             code cluster-aware i.e. iterating through each node
             and performing operations on each one.
 
+            A new local cache generation token is then written,
+            so that every process drops its `LocalCache`
+            the next time it checks the token.
+
         Returns:
             None
 
@@ -129,6 +362,15 @@ class CacheClient:
             is_cleared,
         )
 
+        self.pre_selected_cache.set(
+            key=LOCAL_CACHE_GENERATION_KEY, value=uuid.uuid4().hex, timeout=None
+        )
+        local_cache: LocalCache | None = get_local_cache(
+            cache_name=self.pre_selected_cache_name
+        )
+        if local_cache is not None:
+            local_cache.clear()
+
 
 class InMemoryCacheClient(CacheClient):
     """The client abstraction used to interact with an in-memory version the cache.
@@ -149,7 +391,7 @@ class InMemoryCacheClient(CacheClient):
         )
         self._cache = {}
 
-    def get(self, *, cache_entry_key: str) -> Any:
+    def get(self, *, cache_entry_key: str, **kwargs) -> Any:
         """Retrieves the cache entry associated with the given `cache_entry_key`
 
         Args:
@@ -177,6 +419,98 @@ class InMemoryCacheClient(CacheClient):
         """
         self._cache[cache_entry_key] = value
 
+    def get_many(self, *, cache_entry_keys: list[str]) -> dict[str, Any]:
+        """Retrieves the cache entries associated with the given `cache_entry_keys`
+
+        Args:
+            cache_entry_keys: The strings which act as the
+                identifiers for the cache entries
+
+        Returns:
+            Dict of the values keyed by their `cache_entry_key`.
+            Keys which were not found are omitted
+
+        """
+        return {
+            cache_entry_key: self._cache[cache_entry_key]
+            for cache_entry_key in cache_entry_keys
+            if cache_entry_key in self._cache
+        }
+
+    def set_many(self, *, entries: dict[str, Any], **kwargs) -> None:
+        """Persists all the given `entries` within the cache
+
+        Args:
+            entries: Dict of the values to be stored
+                keyed by their `cache_entry_key`
+
+        Returns:
+            None
+
+        """
+        self._cache.update(entries)
+
+    def add(self, *, cache_entry_key: str, value: Any, **kwargs) -> bool:
+        """Persists the entry within the cache, only if the `cache_entry_key` is not already taken
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+            value: The content being stored in the cache
+                for this entry
+
+        Returns:
+            True if the entry was added.
+            False if the `cache_entry_key` was already taken
+
+        """
+        if cache_entry_key in self._cache:
+            return False
+
+        self._cache[cache_entry_key] = value
+        return True
+
+    def incr(self, *, cache_entry_key: str, delta: int) -> int:
+        """Increments the counter held in the entry associated with the given `cache_entry_key`
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+            delta: The amount to increment the counter by
+
+        Returns:
+            The value of the counter after it has been incremented
+
+        """
+        self._cache[cache_entry_key] = self._cache.get(cache_entry_key, 0) + delta
+        return self._cache[cache_entry_key]
+
+    def touch(self, *, cache_entry_key: str, **kwargs) -> bool:
+        """Checks the entry exists, since entries are never expired from the in-memory cache
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+
+        Returns:
+            True if the entry exists, False otherwise
+
+        """
+        return cache_entry_key in self._cache
+
+    def delete(self, *, cache_entry_key: str) -> None:
+        """Deletes the entry associated with the given `cache_entry_key`
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+
+        Returns:
+            None
+
+        """
+        self._cache.pop(cache_entry_key, None)
+
     def clear(self) -> None:
         """Deletes all keys in the cache
 
@@ -0,0 +1,200 @@
+import logging
+import threading
+from dataclasses import dataclass
+
+from caching.private_api.cached_response import CachedResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_TIMEOUT = 30
+DEFAULT_WAIT_TIMEOUT = 5.0
+DEFAULT_POLL_INTERVAL = 0.1
+DEFAULT_STALE_TIMEOUT = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class RequestCoalescing:
+    """Configures how concurrent cache misses for the same cache entry key are coalesced
+
+    Notes:
+        On a cache miss, only the worker which acquires the lease
+        for the cache entry key calculates the response.
+        All other workers either serve a stale copy of the response
+        if one exists, or wait for the response to be calculated.
+
+        Threads within the same process wait on the calculation itself
+        and are handed the response as soon as it has been calculated.
+        Only 1 thread per process polls the cache
+        for a response being calculated by another process.
+
+    Attributes:
+        lease_timeout: The number of seconds after which a lease
+            is released, even if the worker holding it has not finished.
+        wait_timeout: The maximum number of seconds a worker waits
+            for the response before calculating the response itself.
+            This is capped at the `lease_timeout`.
+        poll_interval: The number of seconds between each
+            check of the cache whilst waiting on another process.
+        serve_stale: Whether to serve a stale copy of the response
+            whilst the response is being recalculated.
+        stale_timeout: The number of seconds after which a stale copy
+            is expired and evicted from the cache.
+            Stale copies are kept regardless of the timeout of the response itself.
+            If set to `None`, the stale copy is kept
+            until the cache is flushed intentionally.
+
+    """
+
+    lease_timeout: int = DEFAULT_LEASE_TIMEOUT
+    wait_timeout: float = DEFAULT_WAIT_TIMEOUT
+    poll_interval: float = DEFAULT_POLL_INTERVAL
+    serve_stale: bool = True
+    stale_timeout: int | None = DEFAULT_STALE_TIMEOUT
+
+    @property
+    def bounded_wait_timeout(self) -> float:
+        return min(self.wait_timeout, self.lease_timeout)
+
+
+class InFlightCalculation:
+    """Holds the response for a cache entry key which is being calculated by 1 thread of this process"""
+
+    def __init__(self):
+        self._finished = threading.Event()
+        self._cached_response: CachedResponse | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self._finished.is_set()
+
+    def finish(self, *, cached_response: CachedResponse | None) -> None:
+        """Hands the `cached_response` over to all the threads waiting on this calculation
+
+        Args:
+            cached_response: The calculated response.
+                None if the response could not be shared
+                e.g. the view raised an error or streamed its response
+
+        Returns:
+            None
+
+        """
+        self._cached_response = cached_response
+        self._finished.set()
+
+    def wait(self, *, timeout: float) -> CachedResponse | None:
+        """Blocks until the calculation has finished or the `timeout` has passed
+
+        Args:
+            timeout: The maximum number of seconds to wait
+
+        Returns:
+            The calculated response or None if it was not
+            calculated within the `timeout` or could not be shared
+
+        """
+        self._finished.wait(timeout=timeout)
+        return self._cached_response
+
+
+class InFlightCalculations:
+    """Tracks the cache entry keys which are being calculated by the threads of this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calculations: dict[str, InFlightCalculation] = {}
+
+    def join(self, *, cache_entry_key: str) -> tuple[InFlightCalculation, bool]:
+        """Joins the calculation for the given `cache_entry_key`, starting it if there is not one in flight
+
+        Args:
+            cache_entry_key: The key of the item in the cache
+
+        Returns:
+            Tuple of the `InFlightCalculation` and a boolean
+            which is True if the calling thread has started the calculation
+            and is therefore responsible for finishing it
+
+        """
+        with self._lock:
+            in_flight_calculation = self._calculations.get(cache_entry_key)
+            if in_flight_calculation is not None:
+                return in_flight_calculation, False
+
+            in_flight_calculation = InFlightCalculation()
+            self._calculations[cache_entry_key] = in_flight_calculation
+            return in_flight_calculation, True
+
+    def finish(
+        self, *, cache_entry_key: str, cached_response: CachedResponse | None
+    ) -> None:
+        """Finishes the calculation for the given `cache_entry_key` and hands the `cached_response` to its waiters
+
+        Args:
+            cache_entry_key: The key of the item in the cache
+            cached_response: The calculated response.
+                None if the response could not be shared
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            in_flight_calculation = self._calculations.pop(cache_entry_key, None)
+
+        if in_flight_calculation is not None:
+            in_flight_calculation.finish(cached_response=cached_response)
+
+
+class RequestCoalescingMetrics:
+    """Counts the outcomes of coalesced cache misses within this process
+
+    Notes:
+        The counts are shared across all the threads of the process.
+        Each outcome is also logged so that it can be aggregated across processes.
+
+    """
+
+    OUTCOMES = ("calculated", "coalesced", "waited", "stale_served", "wait_timed_out")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] = dict.fromkeys(self.OUTCOMES, 0)
+
+    def record(self, *, outcome: str, cache_entry_key: str) -> None:
+        """Increments the count for the given `outcome`
+
+        Args:
+            outcome: The outcome of the cache miss. One of:
+                - "calculated": The worker held the lease and calculated the response
+                - "coalesced": The worker was served the response
+                    which was calculated by another worker
+                - "waited": The worker waited for another worker
+                    to calculate the response
+                - "stale_served": The worker was served a stale copy of the response
+                - "wait_timed_out": The worker gave up waiting
+                    and calculated the response itself
+            cache_entry_key: The key of the item in the cache
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._counts[outcome] += 1
+
+        logger.info("Request coalescing `%s` for `%s`", outcome, cache_entry_key)
+
+    def snapshot(self) -> dict[str, int]:
+        """Returns a copy of the current counts for each outcome"""
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        """Resets the counts for each outcome back to 0"""
+        with self._lock:
+            self._counts = dict.fromkeys(self.OUTCOMES, 0)
+
+
+REQUEST_COALESCING_METRICS = RequestCoalescingMetrics()
+IN_FLIGHT_CALCULATIONS = InFlightCalculations()
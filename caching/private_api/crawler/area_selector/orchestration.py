@@ -9,6 +9,7 @@ from caching.private_api.crawler import PrivateAPICrawler
 from caching.private_api.crawler.area_selector.concurrency import (
     call_with_star_map_multiprocessing,
 )
+from caching.private_api.write_buffer import buffer_cache_writes
 from cms.topic.models import TopicPage
 
 logger = logging.getLogger(__name__)
@@ -17,10 +18,15 @@ logger = logging.getLogger(__name__)
 class AreaSelectorOrchestrator:
     """Responsible for spinning up instances of the `PrivateAPICrawler` to process geography/page combinations"""
 
-    def __init__(self, geographies_api_crawler: GeographiesAPICrawler | None = None):
+    def __init__(
+        self,
+        geographies_api_crawler: GeographiesAPICrawler | None = None,
+        cache_generation: str | None = None,
+    ):
         self._geographies_api_crawler = (
             geographies_api_crawler or GeographiesAPICrawler()
         )
+        self._cache_generation = cache_generation
 
     def process_pages(self, pages: list[TopicPage]) -> None:
         """Delegates each valid geography/page combination to a dedicated `PrivateAPICrawler` to be processed
@@ -42,11 +48,15 @@ class AreaSelectorOrchestrator:
             self.parallel_process_all_geography_combinations_for_page(
                 geography_combinations=geographies_for_page,
                 page=page,
+                cache_generation=self._cache_generation,
             )
 
     @classmethod
     def parallel_process_all_geography_combinations_for_page(
-        cls, geography_combinations: list[GeographyData], page: TopicPage
+        cls,
+        geography_combinations: list[GeographyData],
+        page: TopicPage,
+        cache_generation: str | None = None,
     ) -> None:
         """Process all `geography_combinations` in parallel for the given `page`
 
@@ -59,6 +69,8 @@ class AreaSelectorOrchestrator:
                 representing each individual geography combination
             page: The `Page` model object to be processed.
                 Currently, this is only expected to be a `TopicPage` type
+            cache_generation: The generation of the default cache
+                which is being hydrated, if any.
 
         Returns:
             None
@@ -66,7 +78,10 @@ class AreaSelectorOrchestrator:
         """
         start_time = time.time()
 
-        args = [(geography_data, page.id) for geography_data in geography_combinations]
+        args = [
+            (geography_data, page.id, cache_generation)
+            for geography_data in geography_combinations
+        ]
         call_with_star_map_multiprocessing(
             func=cls.process_geography_page_combination,
             items=args,
@@ -83,7 +98,10 @@ class AreaSelectorOrchestrator:
 
     @classmethod
     def process_geography_page_combination(
-        cls, geography_data: GeographyData, page_id: int
+        cls,
+        geography_data: GeographyData,
+        page_id: int,
+        cache_generation: str | None = None,
     ) -> None:
         """Processes the individual `geography_data` and `page_id` combination with a new `PrivateAPICrawler` instance
 
@@ -91,6 +109,7 @@ class AreaSelectorOrchestrator:
             The created `PrivateAPICrawler` will be set to forcibly refresh the cache
             if the cache key is found.
             So it will overwrite the cache keys that it comes across.
+            The calculated responses are written to the cache in batches.
 
             The `page_id` parameter is provided as an ID and not the `Page` object itself
             so that it can be either:
@@ -101,18 +120,23 @@ class AreaSelectorOrchestrator:
             geography_data: An enriched `GeographyData` model
                 for an individual geography combination
             page_id: The ID of the page which is to be processed
+            cache_generation: The generation of the default cache
+                which is being hydrated, if any.
 
         Returns:
             None
 
         """
-        private_api_crawler = PrivateAPICrawler.create_crawler_for_default_cache()
+        private_api_crawler = PrivateAPICrawler.create_crawler_for_default_cache(
+            cache_generation=cache_generation
+        )
 
         # Since the payload to this method is intended to be serializable
         # via pickle -> multiprocessing or a message broker of some sort
         # the arguments remain as simple types.
         # Hence, the model manager dependency was not injected in.
         page = TopicPage.objects.get(id=page_id)
-        private_api_crawler.process_all_sections_in_page(
-            page=page, geography_data=geography_data
-        )
+        with buffer_cache_writes():
+            private_api_crawler.process_all_sections_in_page(
+                page=page, geography_data=geography_data
+            )
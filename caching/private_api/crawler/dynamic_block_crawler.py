@@ -5,6 +5,9 @@ from caching.internal_api_client import InternalAPIClient
 from caching.private_api.crawler.request_payload_builder import RequestPayloadBuilder
 from caching.private_api.crawler.type_hints import CMS_COMPONENT_BLOCK_TYPE
 from cms.dynamic_content.global_filter_deconstruction import GlobalFilterCMSBlockParser
+from metrics.interfaces.charts.common.shared_data import (
+    share_chart_data_across_widths,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -192,17 +195,36 @@ class DynamicContentBlockCrawler:
             self._internal_api_client.hit_tables_endpoint(data=tables_data)
 
     def process_download_for_chart_block(self, *, chart_block: dict, file_format: str):
+        downloads_data = self.build_download_request_data_for_chart_block(
+            chart_block=chart_block, file_format=file_format
+        )
         if is_dual_category_chart_block(chart_block):
-            downloads_data = self._request_payload_builder.build_dual_category_downloads_request_data(
-                chart_block=chart_block, file_format=file_format
-            )
             return self._internal_api_client.hit_dual_category_downloads_endpoint(
                 data=downloads_data
             )
-        downloads_data = self._request_payload_builder.build_downloads_request_data(
+        return self._internal_api_client.hit_downloads_endpoint(data=downloads_data)
+
+    def build_download_request_data_for_chart_block(
+        self, *, chart_block: dict, file_format: str
+    ) -> dict:
+        """Builds the payload for the relevant downloads endpoint for the given `chart_block`
+
+        Args:
+            chart_block: The chart block CMS information.
+            file_format: The request format for downloaded data.
+
+        Returns:
+            A dict which can be used as the payload to either
+            the dual category downloads endpoint or the downloads endpoint
+
+        """
+        if is_dual_category_chart_block(chart_block):
+            return self._request_payload_builder.build_dual_category_downloads_request_data(
+                chart_block=chart_block, file_format=file_format
+            )
+        return self._request_payload_builder.build_downloads_request_data(
             chart_block=chart_block, file_format=file_format
         )
-        return self._internal_api_client.hit_downloads_endpoint(data=downloads_data)
 
     def _process_chart_for_both_possible_widths(
         self, *, chart_block: CMS_COMPONENT_BLOCK_TYPE
@@ -214,6 +236,10 @@ class DynamicContentBlockCrawler:
             1 for the double width chart, 1100.
             And another for the single width chart, 515
 
+            Each width is held in its own cache entry.
+            But the data for the chart is only queried for the first request
+            and then shared with the request for the other width.
+
         Args:
             chart_block: The chart block CMS information.
 
@@ -221,24 +247,26 @@ class DynamicContentBlockCrawler:
             None
 
         """
-
-        for chart_is_double_width in (True, False):
-            if is_dual_category_chart_block(chart_block):
-                charts_data = self._request_payload_builder.build_dual_category_chart_request_data(
-                    chart_block=chart_block,
-                    chart_is_double_width=chart_is_double_width,
-                )
-
-                self._internal_api_client.hit_dual_category_charts_endpoint(
-                    data=charts_data
-                )
-            else:
-                charts_data = self._request_payload_builder.build_chart_request_data(
-                    chart_block=chart_block,
-                    chart_is_double_width=chart_is_double_width,
-                )
-
-                self._internal_api_client.hit_charts_endpoint(data=charts_data)
+        with share_chart_data_across_widths():
+            for chart_is_double_width in (True, False):
+                if is_dual_category_chart_block(chart_block):
+                    charts_data = self._request_payload_builder.build_dual_category_chart_request_data(
+                        chart_block=chart_block,
+                        chart_is_double_width=chart_is_double_width,
+                    )
+
+                    self._internal_api_client.hit_dual_category_charts_endpoint(
+                        data=charts_data
+                    )
+                else:
+                    charts_data = (
+                        self._request_payload_builder.build_chart_request_data(
+                            chart_block=chart_block,
+                            chart_is_double_width=chart_is_double_width,
+                        )
+                    )
+
+                    self._internal_api_client.hit_charts_endpoint(data=charts_data)
 
     # Sub methods for processing headline number blocks
 
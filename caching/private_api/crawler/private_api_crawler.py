@@ -1,5 +1,6 @@
 import logging
 import re
+from collections.abc import Iterator
 from typing import Self
 
 import django
@@ -29,6 +30,9 @@ from caching.private_api.crawler.type_hints import (  # noqa: E402
 from cms.common.models import CommonPage  # noqa: E402
 from cms.dynamic_content.blocks_deconstruction import CMSBlockParser  # noqa: E402
 from cms.topic.models import TopicPage  # noqa: E402
+from metrics.domain.bulk_downloads.member_index import (  # noqa: E402
+    DownloadMemberIndex,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +56,7 @@ class PrivateAPICrawler:
         internal_api_client: InternalAPIClient | None = None,
         cms_block_parser: CMSBlockParser | None = None,
         dynamic_content_block_crawler: DynamicContentBlockCrawler | None = None,
+        download_member_index: DownloadMemberIndex | None = None,
     ):
         self._internal_api_client = internal_api_client or InternalAPIClient()
         self.geography_api_crawler = GeographiesAPICrawler(
@@ -67,13 +72,24 @@ class PrivateAPICrawler:
                 internal_api_client=self._internal_api_client,
             )
         )
+        self._download_member_index = download_member_index
 
     # Class constructors
 
     @classmethod
-    def create_crawler_for_default_cache(cls) -> Self:
-        internal_api_client = InternalAPIClient(reserved_namespace=False)
-        return cls(internal_api_client=internal_api_client)
+    def create_crawler_for_default_cache(
+        cls,
+        *,
+        cache_generation: str | None = None,
+        download_member_index: DownloadMemberIndex | None = None,
+    ) -> Self:
+        internal_api_client = InternalAPIClient(
+            reserved_namespace=False, cache_generation=cache_generation
+        )
+        return cls(
+            internal_api_client=internal_api_client,
+            download_member_index=download_member_index,
+        )
 
     @classmethod
     def create_crawler_for_reserved_cache(cls) -> Self:
@@ -266,14 +282,72 @@ class PrivateAPICrawler:
             filename = self.create_filename_for_chart_card(
                 file_name=chart_card_content["title"], file_format=file_format
             )
+            downloads.append(
+                self.get_download_for_chart_block(
+                    chart_block=chart_card_content,
+                    filename=filename,
+                    file_format=file_format,
+                )
+            )
+
+        return downloads
+
+    def get_download_for_chart_block(
+        self,
+        *,
+        chart_block: CMS_COMPONENT_BLOCK_TYPE,
+        filename: str,
+        file_format: str,
+    ) -> CHART_DOWNLOAD:
+        """Get the download for the given `chart_block`
+
+        Notes:
+            If the crawler was given a `DownloadMemberIndex`,
+            then the download is fingerprinted
+            and the content from the previous bulk downloads archive
+            is reused if the fingerprint has not changed.
+            In which case, no request is made to the downloads endpoint.
+
+        Args:
+            chart_block: The chart block CMS information.
+            filename: The name of the file for the download.
+            file_format: The format for download response data.
+                supports csv or json
+
+        Returns:
+            A dict containing the filename and the content of the download.
+            Along with the fingerprint of the download
+            if the crawler was given a `DownloadMemberIndex`
+
+        """
+        if self._download_member_index is None:
             response = (
                 self._dynamic_content_block_crawler.process_download_for_chart_block(
-                    chart_block=chart_card_content, file_format=file_format
+                    chart_block=chart_block, file_format=file_format
                 )
             )
-            downloads.append({"name": filename, "content": response.content})
+            return {"name": filename, "content": response.getvalue()}
 
-        return downloads
+        request_data: dict = (
+            self._dynamic_content_block_crawler.build_download_request_data_for_chart_block(
+                chart_block=chart_block, file_format=file_format
+            )
+        )
+        fingerprint: str = self._download_member_index.build_fingerprint(
+            request_data=request_data
+        )
+        content: bytes | None = self._download_member_index.get_previous_content(
+            fingerprint=fingerprint
+        )
+        if content is None:
+            response = (
+                self._dynamic_content_block_crawler.process_download_for_chart_block(
+                    chart_block=chart_block, file_format=file_format
+                )
+            )
+            content = response.getvalue()
+
+        return {"name": filename, "content": content, "fingerprint": fingerprint}
 
     def get_downloads_from_chart_cards(
         self,
@@ -338,40 +412,61 @@ class PrivateAPICrawler:
 
         return downloads
 
-    def get_all_downloads(
+    def iterate_all_downloads(
         self,
         *,
         pages: [TopicPage, CommonPage],
         file_format: str,
-    ) -> list[CHART_DOWNLOAD]:
-        """Get all chart downloads from supported pages.
+    ) -> Iterator[dict]:
+        """Lazily get all chart downloads from supported pages, 1 page at a time.
             These include `HomePage` and `TopicPage`, unsupported pages are
             filtered out.
 
+        Notes:
+            The downloads for each page are only requested
+            once the previous page has been consumed.
+            This allows callers to stream the downloads on
+            before all the pages have been processed.
+
         Args:
             pages: A list of pages to process for downloads.
             file_format: the file_format for response data.
 
-        Returns:
-            A list of dictionaries containing filename and download content in
-            either csv or json grouped by page name.
+        Yields:
+            A dictionary containing the directory name for the page
+            and the filename and download content of each of the charts
+            in either csv or json.
         """
-        downloads = []
-
         for page in pages:
             try:
-                downloads.append(
-                    {
-                        "directory_name": self.create_directory_name_for_downloads(
-                            file_name=page.title
-                        ),
-                        "downloads": self.get_downloads_from_page_sections(
-                            sections=page.body.raw_data, file_format=file_format
-                        ),
-                    }
-                )
+                yield {
+                    "directory_name": self.create_directory_name_for_downloads(
+                        file_name=page.title
+                    ),
+                    "downloads": self.get_downloads_from_page_sections(
+                        sections=page.body.raw_data, file_format=file_format
+                    ),
+                }
             except AttributeError:
                 logger.info("Page %s does not contain chart data", page)
                 continue
 
-        return downloads
+    def get_all_downloads(
+        self,
+        *,
+        pages: [TopicPage, CommonPage],
+        file_format: str,
+    ) -> list[CHART_DOWNLOAD]:
+        """Get all chart downloads from supported pages.
+            These include `HomePage` and `TopicPage`, unsupported pages are
+            filtered out.
+
+        Args:
+            pages: A list of pages to process for downloads.
+            file_format: the file_format for response data.
+
+        Returns:
+            A list of dictionaries containing filename and download content in
+            either csv or json grouped by page name.
+        """
+        return list(self.iterate_all_downloads(pages=pages, file_format=file_format))
@@ -1,2 +1,2 @@
 CMS_COMPONENT_BLOCK_TYPE = dict[str, str | dict[str, str] | list[dict[str, str]]]
-CHART_DOWNLOAD = dict[str, str]
+CHART_DOWNLOAD = dict[str, str | bytes]
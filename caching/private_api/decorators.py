@@ -1,10 +1,23 @@
 import logging
 import os
+import time
 from functools import wraps
 
+from django.http import StreamingHttpResponse
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from caching.private_api.cached_response import (
+    CachedResponse,
+    build_http_response,
+    request_accepts_gzip,
+)
+from caching.private_api.coalescing import (
+    IN_FLIGHT_CALCULATIONS,
+    REQUEST_COALESCING_METRICS,
+    InFlightCalculation,
+    RequestCoalescing,
+)
 from caching.private_api.management import CacheManagement, CacheMissError
 from common.request_caching import get_request_caching
 
@@ -22,6 +35,7 @@ def cache_response(
     *,
     timeout: int | None = None,
     is_reserved_namespace: bool = False,
+    request_coalescing: RequestCoalescing | None = None,
 ):
     """Decorator to wrap API views to use a previously cached response. Otherwise, calculate and save on the way out.
 
@@ -46,6 +60,10 @@ def cache_response(
         is_reserved_namespace: Boolean switch to store the data
             in the reserved / long-lived namespace within the cache.
             Defaults to `False`.
+        request_coalescing: Optional `RequestCoalescing` config
+            used to ensure concurrent cache misses for the same request
+            are only calculated once across all workers.
+            If not provided, each cache miss is calculated independently.
 
     Returns:
         The response containing the results of the request.
@@ -69,6 +87,7 @@ def cache_response(
                 is_public,
                 request_caching_disabled,
                 *args,
+                request_coalescing=request_coalescing,
                 **kwargs,
             )
 
@@ -88,6 +107,7 @@ def _retrieve_response_from_cache_or_calculate(
     is_public,
     request_caching_disabled: str | None,
     *args,
+    request_coalescing: RequestCoalescing | None = None,
     **kwargs,
 ) -> Response:
     """Gets the response from the cache, otherwise recalculates from the view
@@ -110,6 +130,8 @@ def _retrieve_response_from_cache_or_calculate(
             and evicted from the cache
         is_reserved_namespace: Boolean switch to store the data
             in the reserved / long-lived namespace within the cache
+        request_coalescing: Optional `RequestCoalescing` config
+            used to coalesce concurrent cache misses for the same request
         *args: args provided by the rest framework middleware
         **kwargs: kwargs provided by the rest framework middleware
             Note that `cache_management` can be injected in through the kwargs
@@ -142,25 +164,314 @@ def _retrieve_response_from_cache_or_calculate(
     # It doesn't matter which cache the `CacheManagement` is initially pointed at
     # When we get or save items the `CacheClient` will figure out which cache it needs to go
 
+    cache_generation: str | None = (
+        None
+        if is_reserved_namespace
+        else cache_management.get_generation_for_request(request=request)
+    )
     cache_entry_key: str = cache_management.build_cache_entry_key_for_request(
         request=request,
         is_reserved_namespace=is_reserved_namespace,
+        cache_generation=cache_generation,
     )
 
+    # Clients which accept gzip can be served compressed cache entries as they are
+    accepts_gzip: bool = request_accepts_gzip(request=request)
+
     try:
         return cache_management.retrieve_item_from_cache(
-            cache_entry_key=cache_entry_key
+            cache_entry_key=cache_entry_key, accepts_gzip=accepts_gzip
         )
     except CacheMissError:
+        pass
+
+    if request_coalescing is None or timeout == 0:
         # If it is not in the cache then we'll write it
         # on the way out after calculating the response
         return _calculate_response_and_save_in_cache(
             view_function, timeout, cache_management, cache_entry_key, *args, **kwargs
         )
 
+    return _coalesce_response_calculation(
+        view_function,
+        timeout,
+        cache_management,
+        cache_entry_key,
+        request_coalescing,
+        *args,
+        accepts_gzip=accepts_gzip,
+        **kwargs,
+    )
+
+
+def _coalesce_response_calculation(
+    view_function,
+    timeout,
+    cache_management: CacheManagement,
+    cache_entry_key: str,
+    request_coalescing: RequestCoalescing,
+    *args,
+    accepts_gzip: bool = False,
+    **kwargs,
+) -> Response:
+    """Calculates the response for a cache miss, once across all workers which share the cache
+
+    Notes:
+        Only 1 thread per process handles the cache miss for the `cache_entry_key`.
+        Other threads of the same process are served a stale copy of the response
+        if one exists. Otherwise, they wait on that thread
+        and are handed the response as soon as it is available.
+
+        Across processes, the worker which acquires the lease for the `cache_entry_key`
+        calculates the response and saves it in the cache,
+        along with a stale copy of it.
+        All other workers are served the stale copy if one exists.
+        Otherwise, they poll the cache until the response has been saved.
+        If the response is not saved within the `wait_timeout`
+        or the lease is released without the response being saved,
+        then the waiting worker falls back to calculating the response itself.
+
+    Args:
+        view_function: The view associated with the endpoint
+        timeout: The number of seconds after which the response is expired
+            and evicted from the cache
+        cache_management: The `CacheManagement` used to interact with the cache
+        cache_entry_key: The key of the response in the cache
+        request_coalescing: The `RequestCoalescing` config for the view
+        accepts_gzip: Whether the client accepts gzip encoded responses
+            when being served from the cache
+        *args: args provided by the rest framework middleware
+        **kwargs: kwargs provided by the rest framework middleware
+
+    Returns:
+        The response associated with the request
+
+    """
+    in_flight_calculation, is_calculating_thread = IN_FLIGHT_CALCULATIONS.join(
+        cache_entry_key=cache_entry_key
+    )
+    if not is_calculating_thread:
+        return _wait_for_in_flight_calculation(
+            view_function,
+            timeout,
+            cache_management,
+            cache_entry_key,
+            request_coalescing,
+            in_flight_calculation,
+            *args,
+            accepts_gzip=accepts_gzip,
+            **kwargs,
+        )
+
+    cached_response: CachedResponse | None = None
+    try:
+        response, cached_response = _coalesce_response_calculation_across_processes(
+            view_function,
+            timeout,
+            cache_management,
+            cache_entry_key,
+            request_coalescing,
+            *args,
+            accepts_gzip=accepts_gzip,
+            **kwargs,
+        )
+        return response
+    finally:
+        IN_FLIGHT_CALCULATIONS.finish(
+            cache_entry_key=cache_entry_key, cached_response=cached_response
+        )
+
+
+def _wait_for_in_flight_calculation(
+    view_function,
+    timeout,
+    cache_management: CacheManagement,
+    cache_entry_key: str,
+    request_coalescing: RequestCoalescing,
+    in_flight_calculation: InFlightCalculation,
+    *args,
+    accepts_gzip: bool = False,
+    **kwargs,
+) -> Response:
+    stale_response: Response | None = _retrieve_stale_response(
+        cache_management=cache_management,
+        cache_entry_key=cache_entry_key,
+        request_coalescing=request_coalescing,
+        accepts_gzip=accepts_gzip,
+    )
+    if stale_response is not None:
+        return stale_response
+
+    REQUEST_COALESCING_METRICS.record(outcome="waited", cache_entry_key=cache_entry_key)
+    cached_response: CachedResponse | None = in_flight_calculation.wait(
+        timeout=request_coalescing.bounded_wait_timeout
+    )
+    if cached_response is not None:
+        REQUEST_COALESCING_METRICS.record(
+            outcome="coalesced", cache_entry_key=cache_entry_key
+        )
+        return build_http_response(
+            cached_response=cached_response, accepts_gzip=accepts_gzip
+        )
+
+    if in_flight_calculation.is_finished:
+        # The other thread was served a response which it could not hand over
+        # e.g. by another process, so it may have been saved in the cache
+        try:
+            response: Response = cache_management.retrieve_item_from_cache(
+                cache_entry_key=cache_entry_key, accepts_gzip=accepts_gzip
+            )
+        except CacheMissError:
+            pass
+        else:
+            REQUEST_COALESCING_METRICS.record(
+                outcome="coalesced", cache_entry_key=cache_entry_key
+            )
+            return response
+
+    REQUEST_COALESCING_METRICS.record(
+        outcome="wait_timed_out", cache_entry_key=cache_entry_key
+    )
+    return _calculate_response_and_save_in_cache(
+        view_function, timeout, cache_management, cache_entry_key, *args, **kwargs
+    )
+
+
+def _coalesce_response_calculation_across_processes(
+    view_function,
+    timeout,
+    cache_management: CacheManagement,
+    cache_entry_key: str,
+    request_coalescing: RequestCoalescing,
+    *args,
+    accepts_gzip: bool = False,
+    **kwargs,
+) -> tuple[Response, CachedResponse | None]:
+    lease_token: str | None = cache_management.acquire_lease(
+        cache_entry_key=cache_entry_key, timeout=request_coalescing.lease_timeout
+    )
+    if lease_token is not None:
+        REQUEST_COALESCING_METRICS.record(
+            outcome="calculated", cache_entry_key=cache_entry_key
+        )
+        try:
+            return _calculate_response_and_save_with_stale_copy(
+                view_function,
+                timeout,
+                cache_management,
+                cache_entry_key,
+                request_coalescing,
+                *args,
+                **kwargs,
+            )
+        finally:
+            cache_management.release_lease(
+                cache_entry_key=cache_entry_key, token=lease_token
+            )
+
+    stale_response: Response | None = _retrieve_stale_response(
+        cache_management=cache_management,
+        cache_entry_key=cache_entry_key,
+        request_coalescing=request_coalescing,
+        accepts_gzip=accepts_gzip,
+    )
+    if stale_response is not None:
+        return stale_response, None
+
+    REQUEST_COALESCING_METRICS.record(outcome="waited", cache_entry_key=cache_entry_key)
+    deadline: float = time.monotonic() + request_coalescing.bounded_wait_timeout
+
+    while time.monotonic() < deadline:
+        time.sleep(request_coalescing.poll_interval)
+        try:
+            response: Response = cache_management.retrieve_item_from_cache(
+                cache_entry_key=cache_entry_key, accepts_gzip=accepts_gzip
+            )
+        except CacheMissError:
+            if not cache_management.is_lease_held(cache_entry_key=cache_entry_key):
+                # The other worker has finished without saving the response
+                # e.g. the view raised an error. So there is nothing to wait for
+                break
+            continue
+
+        REQUEST_COALESCING_METRICS.record(
+            outcome="coalesced", cache_entry_key=cache_entry_key
+        )
+        return response, None
+
+    REQUEST_COALESCING_METRICS.record(
+        outcome="wait_timed_out", cache_entry_key=cache_entry_key
+    )
+    return _calculate_response_and_save_with_stale_copy(
+        view_function,
+        timeout,
+        cache_management,
+        cache_entry_key,
+        request_coalescing,
+        *args,
+        **kwargs,
+    )
+
+
+def _retrieve_stale_response(
+    *,
+    cache_management: CacheManagement,
+    cache_entry_key: str,
+    request_coalescing: RequestCoalescing,
+    accepts_gzip: bool,
+) -> Response | None:
+    if not request_coalescing.serve_stale:
+        return None
+
+    try:
+        stale_response: Response = cache_management.retrieve_stale_item_from_cache(
+            cache_entry_key=cache_entry_key, accepts_gzip=accepts_gzip
+        )
+    except CacheMissError:
+        return None
+
+    REQUEST_COALESCING_METRICS.record(
+        outcome="stale_served", cache_entry_key=cache_entry_key
+    )
+    return stale_response
+
+
+def _calculate_response_and_save_with_stale_copy(
+    view_function,
+    timeout,
+    cache_management: CacheManagement,
+    cache_entry_key: str,
+    request_coalescing: RequestCoalescing,
+    *args,
+    **kwargs,
+) -> tuple[Response, CachedResponse | None]:
+    response: Response = _calculate_response_from_view(
+        view_function, *args, is_public=True, **kwargs
+    )
+
+    if isinstance(response, StreamingHttpResponse):
+        # Streamed responses are produced lazily as they are sent to the client.
+        # These are reserved for large responses which should not be held in the cache
+        return response, None
+
+    cached_response: CachedResponse = (
+        cache_management.save_item_and_stale_copy_in_cache(
+            cache_entry_key=cache_entry_key,
+            item=response,
+            timeout=timeout,
+            stale_timeout=request_coalescing.stale_timeout,
+        )
+    )
+    return response, cached_response
+
 
 def _calculate_response_and_save_in_cache(
-    view_function, timeout, cache_management, cache_entry_key, *args, **kwargs
+    view_function,
+    timeout,
+    cache_management,
+    cache_entry_key,
+    *args,
+    **kwargs,
 ) -> Response:
     response: Response = _calculate_response_from_view(
         view_function, *args, is_public=True, **kwargs
@@ -168,6 +479,11 @@ def _calculate_response_and_save_in_cache(
     if timeout == 0:
         return response
 
+    if isinstance(response, StreamingHttpResponse):
+        # Streamed responses are produced lazily as they are sent to the client.
+        # These are reserved for large responses which should not be held in the cache
+        return response
+
     cache_management.save_item_in_cache(
         cache_entry_key=cache_entry_key, item=response, timeout=timeout
     )
@@ -0,0 +1,122 @@
+import threading
+import time
+from collections.abc import Callable
+
+import config
+from caching.private_api.client import CacheClient
+
+GENERATION_KEYS_PREFIX = "keys-of"
+DEFAULT_GENERATION_KEY_SLOTS_PER_RESERVATION = 100
+
+
+def build_generation_key_count_key(*, cache_generation: str) -> str:
+    return f"{GENERATION_KEYS_PREFIX}-{cache_generation}-count"
+
+
+def build_generation_key_slot_key(*, cache_generation: str, slot: int) -> str:
+    return f"{GENERATION_KEYS_PREFIX}-{cache_generation}-{slot}"
+
+
+class CacheGenerationState:
+    """Holds the in-process state used to serve and track the generations of the default cache
+
+    Notes:
+        The active generation pointer is held in-process for `pointer_timeout` seconds.
+        So that requests do not need a round trip to redis
+        just to find out which generation to be served from.
+        When this process activates a new generation, the pointer is updated at once.
+        Other processes pick up the new generation within the `pointer_timeout`.
+
+        Each key written to a generation without a timeout
+        is recorded in a numbered slot for that generation.
+        So that those keys can be expired once the generation is superseded,
+        without having to scan every key across the cache.
+        The slots are reserved from a shared counter in blocks,
+        so that most writes do not need an extra round trip to reserve a slot.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        pointer_timeout: float,
+        slots_per_reservation: int = DEFAULT_GENERATION_KEY_SLOTS_PER_RESERVATION,
+    ):
+        self.pointer_timeout = pointer_timeout
+        self.slots_per_reservation = slots_per_reservation
+
+        self._lock = threading.Lock()
+        self._active_generation: str | None = None
+        self._active_generation_fetched_at: float | None = None
+        self._reserved_slots: dict[str, tuple[int, int]] = {}
+
+    def get_active_generation(self, *, fetch: Callable[[], str | None]) -> str | None:
+        """Returns the active generation, calling `fetch` only if the pointer held in-process has expired
+
+        Args:
+            fetch: Callable which returns the active generation from the shared cache
+
+        Returns:
+            The active generation or None
+            if a generation has never been activated
+
+        """
+        with self._lock:
+            if self._is_active_generation_fresh():
+                return self._active_generation
+
+        active_generation: str | None = fetch()
+        self.set_active_generation(cache_generation=active_generation)
+        return active_generation
+
+    def _is_active_generation_fresh(self) -> bool:
+        if self._active_generation_fetched_at is None:
+            return False
+
+        elapsed: float = time.monotonic() - self._active_generation_fetched_at
+        return elapsed < self.pointer_timeout
+
+    def set_active_generation(self, *, cache_generation: str | None) -> None:
+        """Updates the active generation pointer held in-process
+
+        Args:
+            cache_generation: The generation which is now active
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._active_generation = cache_generation
+            self._active_generation_fetched_at = time.monotonic()
+
+    def reserve_slot(self, *, client: CacheClient, cache_generation: str) -> int:
+        """Reserves a slot in which to record a key written to the given `cache_generation`
+
+        Args:
+            client: The client used to reserve a new block of slots
+                from the shared counter, when this process has used up its block
+            cache_generation: The generation which the key is being written to
+
+        Returns:
+            The number of the reserved slot
+
+        """
+        with self._lock:
+            next_slot, last_slot = self._reserved_slots.get(cache_generation, (1, 0))
+            if next_slot > last_slot:
+                last_slot: int = client.incr(
+                    cache_entry_key=build_generation_key_count_key(
+                        cache_generation=cache_generation
+                    ),
+                    delta=self.slots_per_reservation,
+                )
+                next_slot = last_slot - self.slots_per_reservation + 1
+
+            self._reserved_slots[cache_generation] = (next_slot + 1, last_slot)
+            return next_slot
+
+
+CACHE_GENERATION_STATE = CacheGenerationState(
+    pointer_timeout=config.CACHE_GENERATION_POINTER_TIMEOUT_SECONDS
+)
@@ -1,4 +1,6 @@
 import logging
+import os
+from collections.abc import Iterator
 from timeit import default_timer
 
 from caching.common.pages import (
@@ -11,7 +13,12 @@ from caching.private_api.crawler.area_selector.orchestration import (
     AreaSelectorOrchestrator,
 )
 from caching.private_api.management import CacheManagement
+from caching.private_api.write_buffer import (
+    CACHE_WRITE_BATCH_SIZE_ENV_VARIABLE,
+    buffer_cache_writes,
+)
 from cms.topic.models import TopicPage
+from metrics.domain.bulk_downloads.member_index import DownloadMemberIndex
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +35,10 @@ def crawl_all_pages(
         - The home page with the slug of "dashboard"
         - All live/published topic pages
 
+        The responses calculated whilst crawling are buffered
+        and written to the cache in batches.
+        See `PRIVATE_API_CACHE_WRITE_BATCH_SIZE`
+
     Args:
         private_api_crawler: A `PrivateAPICrawler` object which will be used
             to process and crawl the various CMS blocks
@@ -44,7 +55,8 @@ def crawl_all_pages(
     logger.info("Commencing refresh of cache")
 
     all_pages: ALL_PAGE_TYPES = collect_all_pages()
-    private_api_crawler.process_pages(pages=all_pages)
+    with buffer_cache_writes():
+        private_api_crawler.process_pages(pages=all_pages)
 
     topic_pages: list[TopicPage] = extract_area_selectable_pages(all_pages=all_pages)
     area_selector_orchestrator.process_pages(pages=topic_pages)
@@ -62,23 +74,27 @@ def refresh_default_cache(
 
     Args:
         `cache_management`: A `CacheManagement` object
-            which will be used to clear the cache
-            prior to filling the cache again.
+            which will be used to start and then activate
+            a new generation of the default cache.
             Defaults to a concrete `CacheManagement` object
         `private_api_crawler`: A `PrivateAPICrawler` object
             which will be used to process the pages.
             Defaults to an object with an `InternalAPIClient`
-            set to force cache refreshes.
+            set to write to the new generation of the default cache.
 
     Notes:
         Currently "all pages" means the following:
         - The home page with the slug of "dashboard"
         - All live/published topic pages
 
-        This will write to the cache 1 by 1.
-        This currently does not support blue/green cache hydration.
-        As such, if the cache is hit during the invocation of this,
-        then it is feasible that the request will be routed to the origin
+        This implements blue/green cache hydration.
+        The crawler writes to a new generation of the default cache 1 by 1,
+        whilst requests continue to be served from the active generation.
+        Once the crawl has completed, the new generation is activated in 1 write.
+        The previous generation is not flushed,
+        instead its entries are left to expire.
+        The cache is only flushed before the very first generation is hydrated,
+        to remove the entries which were saved without a generation.
 
     Returns:
         None
@@ -87,23 +103,25 @@ def refresh_default_cache(
     cache_management = cache_management or CacheManagement(
         in_memory=False, is_reserved_namespace=False
     )
-    logger.info("Clearing all keys in default cache")
-    # By pointing the `CacheManagement` at the normal namespace
-    # this flush command will empty the normal/ephemeral data cache
-    # i.e. it will leave the reserved/long-lived data cache untouched
-    cache_management.clear()
+    cache_generation: str = cache_management.start_new_generation()
 
     private_api_crawler = (
-        private_api_crawler or PrivateAPICrawler.create_crawler_for_default_cache()
+        private_api_crawler
+        or PrivateAPICrawler.create_crawler_for_default_cache(
+            cache_generation=cache_generation
+        )
     )
     area_selector_orchestrator = AreaSelectorOrchestrator(
-        geographies_api_crawler=private_api_crawler.geography_api_crawler
+        geographies_api_crawler=private_api_crawler.geography_api_crawler,
+        cache_generation=cache_generation,
     )
     crawl_all_pages(
         private_api_crawler=private_api_crawler,
         area_selector_orchestrator=area_selector_orchestrator,
     )
 
+    cache_management.activate_generation(cache_generation=cache_generation)
+
 
 def refresh_reserved_cache(
     *,
@@ -158,12 +176,73 @@ def refresh_reserved_cache(
     )
 
 
-def get_all_downloads(*, file_format: str = "csv") -> list[dict[str, str]]:
+def benchmark_reserved_cache_refresh(
+    *, cache_write_batch_size: int, refresh_count: int = 1
+) -> dict[str, float]:
+    """Times full refreshes of the reserved cache with unbuffered and then batched cache writes
+
+    Notes:
+        The batch size is passed via the `PRIVATE_API_CACHE_WRITE_BATCH_SIZE`
+        env variable so that it is inherited by the subprocesses
+        spun up by the `AreaSelectorOrchestrator`.
+        This is intended to be run against a deployed redis cache,
+        since the in-memory caches do not incur any network round trips.
+
+    Args:
+        cache_write_batch_size: The batch size to benchmark
+            against unbuffered writes
+        refresh_count: The number of times to refresh the cache
+            for each mode. The fastest run for each mode is reported.
+            Defaults to 1
+
+    Returns:
+        Dict of the wall-clock time in seconds
+        taken to refresh the reserved cache for each mode
+
+    """
+    modes: dict[str, int] = {"unbuffered": 1, "batched": cache_write_batch_size}
+    previous_batch_size: str | None = os.environ.get(
+        CACHE_WRITE_BATCH_SIZE_ENV_VARIABLE
+    )
+    durations: dict[str, float] = {}
+
+    try:
+        for mode, batch_size in modes.items():
+            os.environ[CACHE_WRITE_BATCH_SIZE_ENV_VARIABLE] = str(batch_size)
+            run_durations: list[float] = []
+            for _ in range(refresh_count):
+                start: float = default_timer()
+                refresh_reserved_cache()
+                run_durations.append(default_timer() - start)
+
+            durations[mode] = round(min(run_durations), 2)
+            logger.info(
+                "Refreshed reserved cache with `%s` writes in %s seconds",
+                mode,
+                durations[mode],
+            )
+    finally:
+        if previous_batch_size is None:
+            os.environ.pop(CACHE_WRITE_BATCH_SIZE_ENV_VARIABLE, None)
+        else:
+            os.environ[CACHE_WRITE_BATCH_SIZE_ENV_VARIABLE] = previous_batch_size
+
+    return durations
+
+
+def get_all_downloads(
+    *,
+    file_format: str = "csv",
+    download_member_index: DownloadMemberIndex | None = None,
+) -> list[dict[str, str]]:
     """Get all downloads from chart cards on supported pages
 
     Args:
         file_format: the format for download response data supports csv and json
             defaults to csv.
+        download_member_index: Optional `DownloadMemberIndex`
+            from which unchanged downloads are reused
+            instead of being requested from the downloads endpoint again.
 
     Notes:
         You can pass all pages to the crawler's `get_all_downloads'
@@ -175,5 +254,30 @@ def get_all_downloads(*, file_format: str = "csv") -> list[dict[str, str]]:
 
     """
     pages = collect_all_pages()
-    crawler = PrivateAPICrawler.create_crawler_for_default_cache()
+    crawler = PrivateAPICrawler.create_crawler_for_default_cache(
+        download_member_index=download_member_index
+    )
     return crawler.get_all_downloads(pages=pages, file_format=file_format)
+
+
+def iterate_all_downloads(*, file_format: str = "csv") -> Iterator[dict]:
+    """Lazily get all downloads from chart cards on supported pages, 1 page at a time
+
+    Notes:
+        The downloads for each page are only requested
+        once the previous page has been consumed.
+        So the first page of downloads is available
+        without waiting for all the other pages to be crawled.
+
+    Args:
+        file_format: the format for download response data supports csv and json
+            defaults to csv.
+
+    Yields:
+        A dictionary containing the directory name for the page
+        and the filename and download content of each of its charts.
+
+    """
+    pages = collect_all_pages()
+    crawler = PrivateAPICrawler.create_crawler_for_default_cache()
+    yield from crawler.iterate_all_downloads(pages=pages, file_format=file_format)
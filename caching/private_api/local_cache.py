@@ -0,0 +1,264 @@
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class _LocalCacheEntry(NamedTuple):
+    serialized_value: bytes
+    expires_at: float
+
+
+class LocalCache:
+    """A bounded, in-process LRU cache which sits in front of the shared redis cache
+
+    Notes:
+        Values are held in their pickled form.
+        So each read returns a new copy of the value,
+        which means mutable objects such as `Response` objects
+        are never shared between concurrent requests.
+        The byte size of the pickled values is what counts towards the `max_size_in_bytes`.
+
+        Each entry is expired after the `timeout`.
+        In addition, the whole cache is dropped when the generation token
+        held in the shared cache changes. e.g. when the shared cache is flushed.
+        This token is checked at most once every `generation_check_interval` seconds.
+
+        The reserved cache is flushed on each refresh, so this token changes every time.
+        The default cache is only flushed before its first cache generation.
+        After that, each refresh switches the default cache to a new generation of keys instead.
+        The entries of the previous generation are then never read again
+        and are dropped once they reach their `timeout`.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size_in_bytes: int,
+        timeout: float,
+        generation_check_interval: float,
+    ):
+        self.max_size_in_bytes = max_size_in_bytes
+        self.timeout = timeout
+        self.generation_check_interval = generation_check_interval
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _LocalCacheEntry] = OrderedDict()
+        self._size_in_bytes = 0
+        self._generation: str | None = None
+        self._generation_checked_at: float | None = None
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._size_in_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, *, cache_entry_key: str) -> Any | None:
+        """Retrieves the value associated with the given `cache_entry_key`
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+
+        Returns:
+            A copy of the value or None if not found or expired
+
+        """
+        with self._lock:
+            entry: _LocalCacheEntry | None = self._entries.get(cache_entry_key)
+            if entry is None:
+                return None
+
+            if entry.expires_at <= time.monotonic():
+                self._remove(cache_entry_key=cache_entry_key)
+                return None
+
+            self._entries.move_to_end(cache_entry_key)
+
+        return pickle.loads(entry.serialized_value)  # noqa: S301
+
+    def put(self, *, cache_entry_key: str, value: Any) -> None:
+        """Persists the entry, evicting the least recently used entries to stay within the size budget
+
+        Notes:
+            Values which cannot be pickled
+            or which exceed the size budget on their own are not stored.
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+            value: The content being stored in the cache
+                for this entry
+
+        Returns:
+            None
+
+        """
+        try:
+            serialized_value: bytes = pickle.dumps(
+                value, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.debug("Unable to store `%s` in the local cache", cache_entry_key)
+            return
+
+        size_in_bytes: int = len(serialized_value)
+        if size_in_bytes > self.max_size_in_bytes:
+            return
+
+        entry = _LocalCacheEntry(
+            serialized_value=serialized_value,
+            expires_at=time.monotonic() + self.timeout,
+        )
+
+        with self._lock:
+            self._remove(cache_entry_key=cache_entry_key)
+            while self._entries and (
+                self._size_in_bytes + size_in_bytes > self.max_size_in_bytes
+            ):
+                least_recently_used_key: str = next(iter(self._entries))
+                self._remove(cache_entry_key=least_recently_used_key)
+
+            self._entries[cache_entry_key] = entry
+            self._size_in_bytes += size_in_bytes
+
+    def delete(self, *, cache_entry_key: str) -> None:
+        """Deletes the entry associated with the given `cache_entry_key`, if there is one"""
+        with self._lock:
+            self._remove(cache_entry_key=cache_entry_key)
+
+    def clear(self) -> None:
+        """Deletes all the entries in the local cache"""
+        with self._lock:
+            self._entries.clear()
+            self._size_in_bytes = 0
+
+    def _remove(self, *, cache_entry_key: str) -> None:
+        entry: _LocalCacheEntry | None = self._entries.pop(cache_entry_key, None)
+        if entry is not None:
+            self._size_in_bytes -= len(entry.serialized_value)
+
+    # Generation handling
+
+    def is_generation_check_due(self) -> bool:
+        """Checks whether the generation token should be re-read from the shared cache"""
+        if self._generation_checked_at is None:
+            return True
+
+        elapsed: float = time.monotonic() - self._generation_checked_at
+        return elapsed >= self.generation_check_interval
+
+    def sync_generation(self, *, generation: str | None) -> None:
+        """Drops all the entries if the given `generation` differs from the one they were stored under
+
+        Args:
+            generation: The generation token
+                currently held in the shared cache
+
+        Returns:
+            None
+
+        """
+        if generation != self._generation:
+            self.clear()
+            self._generation = generation
+
+        self._generation_checked_at = time.monotonic()
+
+
+class CacheTierMetrics:
+    """Counts the hits and misses for each tier of the cache within this process
+
+    Notes:
+        The "local" tier is the in-process `LocalCache`
+        and the "remote" tier is the shared redis cache.
+        The counts are shared across all the threads of the process.
+
+    """
+
+    TIERS = ("local", "remote")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] = self._build_empty_counts()
+
+    @classmethod
+    def _build_empty_counts(cls) -> dict[str, int]:
+        return {
+            f"{tier}_{outcome}": 0
+            for tier in cls.TIERS
+            for outcome in ("hits", "misses")
+        }
+
+    def record(self, *, tier: str, is_hit: bool) -> None:
+        """Increments the hit or miss count for the given `tier`
+
+        Args:
+            tier: Either "local" or "remote"
+            is_hit: Whether the entry was found in the `tier`
+
+        Returns:
+            None
+
+        """
+        outcome = "hits" if is_hit else "misses"
+        with self._lock:
+            self._counts[f"{tier}_{outcome}"] += 1
+
+    def snapshot(self) -> dict[str, int]:
+        """Returns a copy of the current counts for each tier"""
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        """Resets the counts for each tier back to 0"""
+        with self._lock:
+            self._counts = self._build_empty_counts()
+
+
+CACHE_TIER_METRICS = CacheTierMetrics()
+
+_local_caches: dict[str, LocalCache] = {}
+_local_caches_lock = threading.Lock()
+
+
+def get_local_cache(*, cache_name: str) -> LocalCache | None:
+    """Returns the process-wide `LocalCache` for the given `cache_name`
+
+    Notes:
+        The local caches are created lazily on first use
+        and shared by all the `CacheClient` objects within the process.
+
+    Args:
+        cache_name: The name of the shared cache
+            which the local cache sits in front of.
+            E.g. "default" or "reserved"
+
+    Returns:
+        The `LocalCache` or None if the local cache
+        has not been enabled via `PRIVATE_API_LOCAL_CACHE_ENABLED`
+
+    """
+    if not config.PRIVATE_API_LOCAL_CACHE_ENABLED:
+        return None
+
+    with _local_caches_lock:
+        local_cache: LocalCache | None = _local_caches.get(cache_name)
+        if local_cache is None:
+            local_cache = LocalCache(
+                max_size_in_bytes=config.PRIVATE_API_LOCAL_CACHE_MAX_SIZE_IN_BYTES,
+                timeout=config.PRIVATE_API_LOCAL_CACHE_TIMEOUT_SECONDS,
+                generation_check_interval=config.PRIVATE_API_LOCAL_CACHE_GENERATION_CHECK_SECONDS,
+            )
+            _local_caches[cache_name] = local_cache
+
+    return local_cache
@@ -1,15 +1,47 @@
 import hashlib
 import json
+import logging
+import uuid
 
+from django.http import HttpResponse
 from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+import config
+from caching.internal_api_client import CACHE_GENERATION_HEADER_KEY
+from caching.private_api.cached_response import (
+    CachedResponse,
+    build_cached_response,
+    build_http_response,
+)
 from caching.private_api.client import (
     RESERVED_NAMESPACE_KEY_PREFIX,
     CacheClient,
     InMemoryCacheClient,
 )
+from caching.private_api.generations import (
+    CACHE_GENERATION_STATE,
+    CacheGenerationState,
+    build_generation_key_count_key,
+    build_generation_key_slot_key,
+)
+from caching.private_api.write_buffer import (
+    CacheWriteBuffer,
+    get_active_cache_write_buffer,
+)
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY_SUFFIX = "lease"
+STALE_KEY_SUFFIX = "stale"
+
+# Note that the cache entry keys are hex digests,
+# so they can never clash with the generation prefix
+GENERATION_KEY_PREFIX = "gen"
+ACTIVE_GENERATION_KEY = "generation-active"
+PENDING_GENERATION_KEY = "generation-pending"
+GENERATION_EXPIRY_BATCH_SIZE = 500
 
 
 class CacheMissError(Exception): ...
@@ -22,6 +54,11 @@ class CacheManagement:
         By passing `in_memory=True` to the constructor, an entirely in-memory cache
         can be used. Otherwise, the `django.core.cache` will be used.
 
+        The process-wide `CACHE_GENERATION_STATE` is only used with the `django.core.cache`.
+        Otherwise, a `CacheGenerationState` is created for the given cache
+        which does not hold onto the active generation pointer,
+        unless one is provided via `generation_state`.
+
     """
 
     def __init__(
@@ -30,11 +67,18 @@ class CacheManagement:
         in_memory: bool,
         is_reserved_namespace: bool = True,
         client: CacheClient | None = None,
+        generation_state: CacheGenerationState | None = None,
     ):
+        uses_shared_cache: bool = client is None and not in_memory
         self._client = client or self._create_cache_client(
             in_memory=in_memory,
             is_reserved_namespace=is_reserved_namespace,
         )
+        self._generation_state = generation_state or (
+            CACHE_GENERATION_STATE
+            if uses_shared_cache
+            else CacheGenerationState(pointer_timeout=0)
+        )
 
     @staticmethod
     def _create_cache_client(
@@ -62,11 +106,22 @@ class CacheManagement:
             return InMemoryCacheClient()
         return CacheClient(is_reserved_namespace=is_reserved_namespace)
 
-    def retrieve_item_from_cache(self, *, cache_entry_key: str) -> Response:
+    def retrieve_item_from_cache(
+        self, *, cache_entry_key: str, accepts_gzip: bool = False
+    ) -> Response | HttpResponse:
         """Retrieves the item from the cache matching the given `cache_entry_key`
 
+        Notes:
+            Items are held in the cache as `CachedResponse` objects,
+            which are converted back into an `HttpResponse` on the way out.
+            Entries which were saved before this format was introduced
+            are returned as they are.
+
         Args:
             cache_entry_key: The key of the item in the cache
+            accepts_gzip: Whether the client accepts gzip encoded responses.
+                If True, compressed items are served without being decompressed.
+                Defaults to False
 
         Returns:
             The item which was previously saved in the cache
@@ -75,11 +130,18 @@ class CacheManagement:
             `CacheMissError`: If the item was not found in the cache
 
         """
-        retrieved_entry = self._client.get(cache_entry_key=cache_entry_key)
+        retrieved_entry = self._client.get(
+            cache_entry_key=cache_entry_key, use_local_cache=True
+        )
 
         if retrieved_entry is None:
             raise CacheMissError
 
+        if isinstance(retrieved_entry, CachedResponse):
+            return build_http_response(
+                cached_response=retrieved_entry, accepts_gzip=accepts_gzip
+            )
+
         return retrieved_entry
 
     def save_item_in_cache(
@@ -89,7 +151,14 @@ class CacheManagement:
 
         Notes:
             Depending on the client implementation,
-            this will override the existing key if a clash is detected
+            this will override the existing key if a clash is detected.
+
+            The item is rendered and then saved as a compact `CachedResponse`,
+            with its body compressed if it is at least
+            `PRIVATE_API_CACHE_COMPRESSION_THRESHOLD_IN_BYTES` in size.
+
+            If cache writes are being buffered via `buffer_cache_writes()`,
+            then the item is only written to the cache when the buffer is flushed
 
         Args:
             cache_entry_key: The key of the item in the cache
@@ -102,9 +171,355 @@ class CacheManagement:
 
         """
         item = self._render_response(response=item)
-        self._client.put(cache_entry_key=cache_entry_key, value=item, timeout=timeout)
+        self._put_item(
+            cache_entry_key=cache_entry_key,
+            value=self._build_cached_response(response=item),
+            timeout=timeout,
+        )
         return item
 
+    def save_item_and_stale_copy_in_cache(
+        self,
+        *,
+        cache_entry_key: str,
+        item: Response,
+        timeout: int | None,
+        stale_timeout: int | None,
+    ) -> CachedResponse:
+        """Saves the item in the cache along with a stale copy, which outlives the entry for the given `cache_entry_key`
+
+        Notes:
+            The stale copy can be served whilst the
+            entry for the `cache_entry_key` is being recalculated.
+            It is kept regardless of the `timeout` of the entry itself,
+            and is shared between the generations of the default cache.
+
+            The item is rendered and converted to a `CachedResponse` once,
+            which is then saved under both keys.
+
+        Args:
+            cache_entry_key: The key of the item in the cache
+            item: The item to be saved into the cache
+            timeout: The number of seconds after which the response
+                is expired and evicted from the cache
+            stale_timeout: The number of seconds after which the stale copy
+                is expired and evicted from the cache
+
+        Returns:
+            The `CachedResponse` which was saved in the cache
+
+        """
+        item = self._render_response(response=item)
+        cached_response: CachedResponse = self._build_cached_response(response=item)
+
+        self._put_item(
+            cache_entry_key=cache_entry_key,
+            value=cached_response,
+            timeout=timeout,
+        )
+        self._put_item(
+            cache_entry_key=self._build_stale_key(cache_entry_key=cache_entry_key),
+            value=cached_response,
+            timeout=stale_timeout,
+        )
+        return cached_response
+
+    def _put_item(
+        self, *, cache_entry_key: str, value: CachedResponse, timeout: int | None
+    ) -> None:
+        entries: dict[str, CachedResponse | str] = {cache_entry_key: value}
+        if timeout is None and self._is_generation_key(cache_entry_key=cache_entry_key):
+            # Entries in the active generation are held indefinitely.
+            # So each key is recorded for its generation,
+            # in order to be expired once that generation is superseded
+            entries[
+                self._build_generation_key_slot_key(cache_entry_key=cache_entry_key)
+            ] = cache_entry_key
+
+        cache_write_buffer: CacheWriteBuffer | None = get_active_cache_write_buffer()
+        if cache_write_buffer is not None:
+            for key, entry in entries.items():
+                cache_write_buffer.put(
+                    cache_entry_key=key, value=entry, timeout=timeout
+                )
+            return
+
+        if len(entries) == 1:
+            self._client.put(
+                cache_entry_key=cache_entry_key, value=value, timeout=timeout
+            )
+            return
+
+        self._client.set_many(entries=entries, timeout=timeout)
+
+    def _build_generation_key_slot_key(self, *, cache_entry_key: str) -> str:
+        cache_generation, _ = cache_entry_key.split("-", 1)
+        slot: int = self._generation_state.reserve_slot(
+            client=self._client, cache_generation=cache_generation
+        )
+        return build_generation_key_slot_key(
+            cache_generation=cache_generation, slot=slot
+        )
+
+    def retrieve_stale_item_from_cache(
+        self, *, cache_entry_key: str, accepts_gzip: bool = False
+    ) -> Response | HttpResponse:
+        """Retrieves the stale copy of the item from the cache matching the given `cache_entry_key`
+
+        Args:
+            cache_entry_key: The key of the item in the cache
+            accepts_gzip: Whether the client accepts gzip encoded responses.
+                Defaults to False
+
+        Returns:
+            The stale copy of the item
+            which was previously saved in the cache
+
+        Raises:
+            `CacheMissError`: If no stale copy was found in the cache
+
+        """
+        return self.retrieve_item_from_cache(
+            cache_entry_key=self._build_stale_key(cache_entry_key=cache_entry_key),
+            accepts_gzip=accepts_gzip,
+        )
+
+    def acquire_lease(self, *, cache_entry_key: str, timeout: int) -> str | None:
+        """Attempts to take out the lease to calculate the item for the given `cache_entry_key`
+
+        Notes:
+            Only 1 lease can be held per `cache_entry_key` at any one time,
+            across all the processes which share the cache.
+            The lease is automatically expired after the `timeout`,
+            so that a crashed process cannot hold onto it indefinitely.
+
+        Args:
+            cache_entry_key: The key of the item in the cache
+            timeout: The number of seconds after which
+                the lease is expired and evicted from the cache
+
+        Returns:
+            A token identifying the lease if it was acquired.
+            None if the lease is already held elsewhere
+
+        """
+        token = uuid.uuid4().hex
+        is_acquired: bool = self._client.add(
+            cache_entry_key=self._build_lease_key(cache_entry_key=cache_entry_key),
+            value=token,
+            timeout=timeout,
+        )
+        return token if is_acquired else None
+
+    def release_lease(self, *, cache_entry_key: str, token: str) -> None:
+        """Releases the lease for the given `cache_entry_key`, if it is still held with the given `token`
+
+        Args:
+            cache_entry_key: The key of the item in the cache
+            token: The token returned when the lease was acquired
+
+        Returns:
+            None
+
+        """
+        lease_key: str = self._build_lease_key(cache_entry_key=cache_entry_key)
+        if self._client.get(cache_entry_key=lease_key) == token:
+            self._client.delete(cache_entry_key=lease_key)
+
+    def is_lease_held(self, *, cache_entry_key: str) -> bool:
+        """Checks whether the lease for the given `cache_entry_key` is currently held
+
+        Args:
+            cache_entry_key: The key of the item in the cache
+
+        Returns:
+            True if the lease is held, False otherwise
+
+        """
+        lease_key: str = self._build_lease_key(cache_entry_key=cache_entry_key)
+        return self._client.get(cache_entry_key=lease_key) is not None
+
+    @staticmethod
+    def _build_lease_key(*, cache_entry_key: str) -> str:
+        # The key retains the prefix of the `cache_entry_key`
+        # so that it is placed in the same cache as the item itself
+        return f"{cache_entry_key}-{LEASE_KEY_SUFFIX}"
+
+    @classmethod
+    def _build_stale_key(cls, *, cache_entry_key: str) -> str:
+        # Stale copies are shared between the generations of the default cache
+        # so that they can still be served after switching over to a new generation
+        if cls._is_generation_key(cache_entry_key=cache_entry_key):
+            _, cache_entry_key = cache_entry_key.split("-", 1)
+
+        return f"{cache_entry_key}-{STALE_KEY_SUFFIX}"
+
+    # Generations of the default cache
+
+    def get_active_generation(self) -> str | None:
+        """Returns the generation of the default cache which is currently being served
+
+        Notes:
+            The active generation pointer is held in-process
+            for `CACHE_GENERATION_POINTER_TIMEOUT_SECONDS`.
+            So this only reads the pointer from the cache
+            when the in-process pointer has expired.
+
+        Returns:
+            The active generation or None
+            if a generation has never been activated
+
+        """
+        return self._generation_state.get_active_generation(
+            fetch=self._fetch_active_generation
+        )
+
+    def _fetch_active_generation(self) -> str | None:
+        return self._client.get(cache_entry_key=ACTIVE_GENERATION_KEY)
+
+    def get_generation_for_request(self, *, request: Request) -> str | None:
+        """Returns the generation of the default cache which the given `request` should be served from
+
+        Notes:
+            Requests made by the crawler whilst hydrating
+            a new generation of the default cache
+            carry that generation in the `Cache-Generation` header.
+            This is only honoured if it matches the pending generation.
+            All other requests are served from the active generation
+
+        Args:
+            request: The incoming request
+
+        Returns:
+            The generation which the `request` should be served from.
+            None if a generation has never been activated
+
+        """
+        requested_generation: str | None = request.headers.get(
+            CACHE_GENERATION_HEADER_KEY
+        )
+        if requested_generation and requested_generation == self._client.get(
+            cache_entry_key=PENDING_GENERATION_KEY
+        ):
+            return requested_generation
+
+        return self.get_active_generation()
+
+    def start_new_generation(self) -> str:
+        """Creates a new generation of the default cache which can be hydrated without affecting the active generation
+
+        Notes:
+            Entries which were saved before any generation had been activated
+            are keyed by their bare hash and are not recorded against a generation.
+            So they would never be expired by `activate_generation()`.
+            The cache can only be flushed as a whole,
+            so it is cleared once, before the very first generation is hydrated.
+
+        Returns:
+            The new pending generation
+
+        """
+        if self._fetch_active_generation() is None:
+            logger.info("Clearing entries saved before the first cache generation")
+            self.clear()
+
+        cache_generation = f"{GENERATION_KEY_PREFIX}{uuid.uuid4().hex[:12]}"
+        self._client.put(
+            cache_entry_key=PENDING_GENERATION_KEY,
+            value=cache_generation,
+            timeout=None,
+        )
+        logger.info("Started hydration of `%s` cache generation", cache_generation)
+        return cache_generation
+
+    def activate_generation(self, *, cache_generation: str) -> None:
+        """Switches the default cache over to serve from the given `cache_generation`
+
+        Notes:
+            This is a single write to the pointer for the active generation,
+            so all subsequent requests are served from the new generation at once.
+            Other processes pick up the new generation
+            once their in-process pointer has expired.
+            The entries of the previous generation are then given
+            a timeout of `CACHE_GENERATION_TIMEOUT_SECONDS`
+
+        Args:
+            cache_generation: The pending generation which has been hydrated
+
+        Returns:
+            None
+
+        """
+        previous_generation: str | None = self._fetch_active_generation()
+        self._client.put(
+            cache_entry_key=ACTIVE_GENERATION_KEY,
+            value=cache_generation,
+            timeout=None,
+        )
+        self._client.delete(cache_entry_key=PENDING_GENERATION_KEY)
+        self._generation_state.set_active_generation(cache_generation=cache_generation)
+        logger.info(
+            "Activated `%s` cache generation, superseding `%s`",
+            cache_generation,
+            previous_generation,
+        )
+
+        if previous_generation and previous_generation != cache_generation:
+            self.expire_generation(cache_generation=previous_generation)
+
+    def expire_generation(self, *, cache_generation: str) -> None:
+        """Sets a timeout of `CACHE_GENERATION_TIMEOUT_SECONDS` on every entry recorded for the given `cache_generation`
+
+        Notes:
+            The entries are not deleted outright,
+            so that requests which are still being served
+            from the superseded generation can complete.
+
+        Args:
+            cache_generation: The superseded generation
+
+        Returns:
+            None
+
+        """
+        timeout: int = config.CACHE_GENERATION_TIMEOUT_SECONDS
+        count_key: str = build_generation_key_count_key(
+            cache_generation=cache_generation
+        )
+        number_of_slots: int = self._client.get(cache_entry_key=count_key) or 0
+
+        number_of_expired_entries = 0
+        for start_slot in range(1, number_of_slots + 1, GENERATION_EXPIRY_BATCH_SIZE):
+            slot_keys: list[str] = [
+                build_generation_key_slot_key(
+                    cache_generation=cache_generation, slot=slot
+                )
+                for slot in range(
+                    start_slot,
+                    min(start_slot + GENERATION_EXPIRY_BATCH_SIZE, number_of_slots + 1),
+                )
+            ]
+            recorded_keys: dict[str, str] = self._client.get_many(
+                cache_entry_keys=slot_keys
+            )
+            for slot_key, cache_entry_key in recorded_keys.items():
+                number_of_expired_entries += self._client.touch(
+                    cache_entry_key=cache_entry_key, timeout=timeout
+                )
+                self._client.touch(cache_entry_key=slot_key, timeout=timeout)
+
+        self._client.touch(cache_entry_key=count_key, timeout=timeout)
+        logger.info(
+            "Expiring %s No. entries of superseded `%s` cache generation in %s seconds",
+            number_of_expired_entries,
+            cache_generation,
+            timeout,
+        )
+
+    @staticmethod
+    def _is_generation_key(*, cache_entry_key: str) -> bool:
+        return cache_entry_key.startswith(GENERATION_KEY_PREFIX)
+
     def clear(self):
         """Deletes all keys in the current cache
 
@@ -129,6 +544,13 @@ class CacheManagement:
         response.render()
         return response
 
+    @staticmethod
+    def _build_cached_response(*, response: Response | HttpResponse) -> CachedResponse:
+        return build_cached_response(
+            response=response,
+            compression_threshold_in_bytes=config.PRIVATE_API_CACHE_COMPRESSION_THRESHOLD_IN_BYTES,
+        )
+
     # Cache key construction
 
     def build_cache_entry_key_for_request(
@@ -136,6 +558,7 @@ class CacheManagement:
         *,
         request: Request,
         is_reserved_namespace: bool,
+        cache_generation: str | None = None,
     ) -> str:
         """Builds a hashed cache entry key for a request
 
@@ -143,6 +566,9 @@ class CacheManagement:
             request: The incoming request which is to be hashed
             is_reserved_namespace: Boolean switch to store the data
                 directly in the reserved / long-lived namespace within the cache.
+            cache_generation: The generation of the default cache
+                which the key belongs to, if any.
+                This has no effect for the reserved namespace.
 
         Returns:
             A hashed string representation
@@ -160,6 +586,9 @@ class CacheManagement:
         if is_reserved_namespace:
             return f"{RESERVED_NAMESPACE_KEY_PREFIX}-{cache_key}"
 
+        if cache_generation:
+            return f"{cache_generation}-{cache_key}"
+
         return cache_key
 
     def _build_standalone_key_for_request(self, *, request: Request) -> str:
@@ -0,0 +1,138 @@
+import logging
+import os
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from caching.private_api.client import CacheClient
+
+logger = logging.getLogger(__name__)
+
+CACHE_WRITE_BATCH_SIZE_ENV_VARIABLE = "PRIVATE_API_CACHE_WRITE_BATCH_SIZE"
+DEFAULT_CACHE_WRITE_BATCH_SIZE = 100
+
+
+def get_cache_write_batch_size() -> int:
+    return int(
+        os.environ.get(
+            CACHE_WRITE_BATCH_SIZE_ENV_VARIABLE, DEFAULT_CACHE_WRITE_BATCH_SIZE
+        )
+    )
+
+
+class CacheWriteBuffer:
+    """Holds onto cache writes so that they can be flushed to the cache in batches
+
+    Notes:
+        Each flush is written with 1 `set_many()` call per timeout,
+        which is pipelined into a single round trip to redis.
+        Entries are only visible to readers of the cache
+        once they have been flushed.
+
+    """
+
+    def __init__(self, *, client: CacheClient, batch_size: int):
+        self._client = client
+        self.batch_size = batch_size
+        self._pending_entries: defaultdict[int | None, dict[str, Any]] = defaultdict(
+            dict
+        )
+        self._pending_count = 0
+
+    def __len__(self) -> int:
+        return self._pending_count
+
+    def put(self, *, cache_entry_key: str, value: Any, timeout: int | None) -> None:
+        """Adds the entry to the buffer, flushing the buffer if it has reached the `batch_size`
+
+        Args:
+            cache_entry_key: The string which acts as the
+                identifier for the cache entry
+            value: The content being stored in the cache
+                for this entry
+            timeout: The number of seconds after which the entry
+                is expired and evicted from the cache
+
+        Returns:
+            None
+
+        """
+        entries_for_timeout: dict[str, Any] = self._pending_entries[timeout]
+        if cache_entry_key not in entries_for_timeout:
+            self._pending_count += 1
+        entries_for_timeout[cache_entry_key] = value
+
+        if self._pending_count >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all the pending entries to the cache
+
+        Returns:
+            None
+
+        """
+        if not self._pending_count:
+            return
+
+        for timeout, entries in self._pending_entries.items():
+            self._client.set_many(entries=entries, timeout=timeout)
+
+        logger.debug("Flushed %s buffered cache writes", self._pending_count)
+        self._pending_entries.clear()
+        self._pending_count = 0
+
+
+_active_cache_write_buffer: ContextVar[CacheWriteBuffer | None] = ContextVar(
+    "active_cache_write_buffer", default=None
+)
+
+
+def get_active_cache_write_buffer() -> CacheWriteBuffer | None:
+    """Returns the `CacheWriteBuffer` for the current context, if writes are being buffered"""
+    return _active_cache_write_buffer.get()
+
+
+@contextmanager
+def buffer_cache_writes(
+    *, batch_size: int | None = None, client: CacheClient | None = None
+) -> Iterator[CacheWriteBuffer | None]:
+    """Buffers the items saved in the cache within this context and writes them in batches
+
+    Notes:
+        This is intended for the crawlers which hydrate the cache.
+        The crawlers hit the private API in-process,
+        so the items saved by the `cache_response` decorator
+        are picked up by the buffer of the current context.
+        Any remaining entries are flushed on the way out of the context.
+
+    Args:
+        batch_size: The number of entries to hold
+            before they are flushed to the cache.
+            A `batch_size` of 1 or less disables buffering.
+            Defaults to the `PRIVATE_API_CACHE_WRITE_BATCH_SIZE` env variable
+        client: The `CacheClient` used to flush the entries.
+            Defaults to a concrete `CacheClient`
+
+    Yields:
+        The active `CacheWriteBuffer`
+        or None if buffering has been disabled
+
+    """
+    if batch_size is None:
+        batch_size = get_cache_write_batch_size()
+    if batch_size <= 1:
+        yield None
+        return
+
+    cache_write_buffer = CacheWriteBuffer(
+        client=client or CacheClient(), batch_size=batch_size
+    )
+    context_token = _active_cache_write_buffer.set(cache_write_buffer)
+    try:
+        yield cache_write_buffer
+    finally:
+        _active_cache_write_buffer.reset(context_token)
+        cache_write_buffer.flush()
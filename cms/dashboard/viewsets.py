@@ -15,7 +15,7 @@ from cms.dashboard.serializers import ListablePageSerializer
 from cms.metrics_documentation.models.child import MetricsDocumentationChildEntry
 from cms.topic.models import TopicPage
 from common.auth.logging import log_user_permission_summary
-from common.auth.permissions import check_page_permissions
+from common.auth.permissions import get_compiled_permission_sets
 from common.page_previews import (
     get_cms_auth_bearer_token,
     get_cms_auth_payload,
@@ -95,7 +95,9 @@ class BaseCMSPagesAPIViewSet(PagesAPIViewSet):
             if has_global_access:
                 filtered_queryset = queryset
             else:
-                user_permissions = req.user.permission_sets["permission_sets"]
+                compiled_permission_sets = get_compiled_permission_sets(
+                    permission_sets=req.user.permission_sets["permission_sets"]
+                )
                 pages_to_check = chain(
                     ((page.id, page.topicpage) for page in queryset.type(TopicPage)),
                     (
@@ -107,8 +109,7 @@ class BaseCMSPagesAPIViewSet(PagesAPIViewSet):
                     page_id
                     for page_id, page in pages_to_check
                     if page.is_public
-                    or check_page_permissions(
-                        permission_sets=user_permissions,
+                    or compiled_permission_sets.has_page_access(
                         theme_id=page.theme,
                         sub_theme_id=page.sub_theme,
                         topic_id=page.topic,
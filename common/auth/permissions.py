@@ -1,6 +1,8 @@
+import contextvars
+from dataclasses import dataclass, field
 from typing import TypedDict
 
-from common.metrics_interface.interface import MetricsAPIInterface
+from common.auth.resource_ids import ChartResourceIds, resource_id_resolver
 
 WILDCARD_ID_VALUE = "-1"
 
@@ -39,7 +41,14 @@ def check_chart_permissions_by_name(
     geography_type: str,
     geography_name: str,
 ) -> bool:
-    """Convert permission resource names into ids (before checking CHART permissions)."""
+    """Convert permission resource names into ids (before checking CHART permissions).
+
+    Notes:
+        The ids are resolved via the process-wide `resource_id_resolver`
+        and the outcome of each check is memoised for the current request.
+        So repeated checks for the same chart resources
+        do not make any additional queries to the database.
+    """
 
     if not isinstance(permission_sets, dict):
         return False
@@ -53,257 +62,385 @@ def check_chart_permissions_by_name(
     if permission_sets.get("summary").get("has_global_access"):
         return True
 
-    topic_manager = MetricsAPIInterface.get_topic_manager()
-    metric_manager = MetricsAPIInterface.get_metric_manager()
-    geography_type_manager = MetricsAPIInterface.get_geography_type_manager()
-    geography_manager = MetricsAPIInterface.get_geography_manager()
-
-    theme_id, sub_theme_id, topic_id = topic_manager.get_id_by_name(
-        theme_name, sub_theme_name, topic_name
+    permission_checks_memo: PermissionChecksMemo = _get_permission_checks_memo(
+        permission_sets=permission_sets
+    )
+    chart_names = (
+        theme_name,
+        sub_theme_name,
+        topic_name,
+        metric_name,
+        geography_type,
+        geography_name,
+    )
+    try:
+        return permission_checks_memo.results[chart_names]
+    except KeyError:
+        pass
+
+    resource_ids: ChartResourceIds = resource_id_resolver.resolve_chart_resource_ids(
+        theme_name=theme_name,
+        sub_theme_name=sub_theme_name,
+        topic_name=topic_name,
+        metric_name=metric_name,
+        geography_type=geography_type,
+        geography_name=geography_name,
     )
-    metric_id = metric_manager.get_id_by_name(metric_name)
-    geography_type_id = geography_type_manager.get_id_by_name(geography_type)
-    geography_id = geography_manager.get_code_by_name(geography_name, geography_type)
 
     # Sanity check, because front-end must always
     # send content for any of these 6 requests
-    if any(
-        value is None
-        for value in (
-            theme_id,
-            sub_theme_id,
-            topic_id,
-            metric_id,
-            geography_type_id,
-            geography_id,
+    if any(resource_id is None for resource_id in resource_ids):
+        has_permission = False
+    else:
+        has_permission = check_chart_permissions(
+            permission_sets=permission_sets.get("permission_sets"),
+            theme_id=resource_ids.theme_id,
+            sub_theme_id=resource_ids.sub_theme_id,
+            topic_id=resource_ids.topic_id,
+            metric_id=resource_ids.metric_id,
+            geography_type=resource_ids.geography_type_id,
+            geography_id=resource_ids.geography_id,
         )
-    ):
-        return False
 
-    return check_chart_permissions(
-        permission_sets=permission_sets.get("permission_sets"),
-        theme_id=theme_id,
-        sub_theme_id=sub_theme_id,
-        topic_id=topic_id,
-        metric_id=metric_id,
-        geography_type=geography_type_id,
-        geography_id=geography_id,
-    )
+    permission_checks_memo.results[chart_names] = has_permission
+    return has_permission
 
 
-def check_chart_permissions(  # noqa: PLR0914
-    *,
-    permission_sets: list[PermissionRowType],
-    theme_id: str,
-    sub_theme_id: str,
-    topic_id: str,
-    metric_id: str,
-    geography_type: str,
-    geography_id: str,
-) -> bool:
-    """Check permissions whether the end-user can access a specific CHART through the API."""
+@dataclass
+class PermissionChecksMemo:
+    """Holds the outcome of the permission checks made for a set of permissions
 
-    if not isinstance(permission_sets, list):
-        return False
+    Notes:
+        The memo is bound to the given `permission_sets` object
+        and to the generation of the resource IDs cache.
+        So the outcomes are discarded if the permissions are swapped
+        or if any of the underlying resources are changed.
 
-    resource_ids = _normalize_resource_ids(
-        theme_id,
-        sub_theme_id,
-        topic_id,
-        metric_id,
-        geography_type,
-        geography_id,
-    )
-    if resource_ids is None:
-        return False
-    (
-        theme_id,
-        sub_theme_id,
-        topic_id,
-        metric_id,
-        geography_type,
-        geography_id,
-    ) = resource_ids
+    """
 
-    for permission_set in permission_sets:
-        if not isinstance(permission_set, dict):
-            return False
+    permission_sets: PermissionSetsType
+    resource_ids_generation: int
+    results: dict[tuple[str, ...], bool] = field(default_factory=dict)
 
-        permission_ids = _normalize_permission_ids(
-            "theme",
-            "sub_theme",
-            "topic",
-            "metric",
-            "geography_type",
-            "geography",
-            permission_set=permission_set,
+
+_permission_checks_memo_ctx: contextvars.ContextVar[PermissionChecksMemo | None] = (
+    contextvars.ContextVar("_permission_checks_memo_ctx", default=None)
+)
+
+
+def _get_permission_checks_memo(
+    *, permission_sets: PermissionSetsType
+) -> PermissionChecksMemo:
+    """Gets the memo of permission checks for the current request context
+
+    Notes:
+        A new memo is started if there is no memo for the current context,
+        or if the existing memo is for a different set of permissions
+        or for an outdated generation of resource IDs.
+
+    Args:
+        permission_sets: The JWT permissions extracted from the Cognito token.
+
+    Returns:
+        The `PermissionChecksMemo` for the given `permission_sets`
+
+    """
+    permission_checks_memo: PermissionChecksMemo | None = (
+        _permission_checks_memo_ctx.get()
+    )
+    if (
+        permission_checks_memo is None
+        or permission_checks_memo.permission_sets is not permission_sets
+        or permission_checks_memo.resource_ids_generation
+        != resource_id_resolver.generation
+    ):
+        permission_checks_memo = PermissionChecksMemo(
+            permission_sets=permission_sets,
+            resource_ids_generation=resource_id_resolver.generation,
         )
+        _permission_checks_memo_ctx.set(permission_checks_memo)
+
+    return permission_checks_memo
+
+
+def clear_permission_checks_memo() -> None:
+    """Clear the memo of permission checks for the current request context."""
+    _permission_checks_memo_ctx.set(None)
+    _compiled_permission_sets_ctx.set(None)
+
+
+class CompiledPermissionSets:
+    """Indexes a list of permission rows, so that each check only needs a few lookups
+
+    Notes:
+        Themes, sub themes & topics have their own dependency hierarchy,
+        as do geography types & geographies.
+        Within each hierarchy, wildcards can only be at the end.
+        So each permission row is indexed by the IDs leading up to
+        the first wildcard in each hierarchy.
+        E.g. a row with theme `1` and a wildcard sub theme
+        is indexed by the theme/sub theme/topic pattern `("1",)`.
+
+        Checking a resource then means looking up each prefix
+        of the resource IDs in those hierarchies,
+        rather than evaluating every one of the permission rows.
+
+        The checks deny access as soon as they come across a malformed row.
+        To preserve this, only the rows before the first malformed row are indexed.
+        Charts and pages require different fields,
+        so this cut-off is applied separately to each.
 
-        # All permission fields must be present
-        if permission_ids is None:
+    """
+
+    def __init__(self, *, permission_sets: list[PermissionRowType]):
+        self._chart_patterns: set[tuple[tuple[str, ...], str, tuple[str, ...]]] = set()
+        self._page_patterns: set[tuple[str, ...]] = set()
+
+        if isinstance(permission_sets, list):
+            self._index_chart_patterns(permission_sets=permission_sets)
+            self._index_page_patterns(permission_sets=permission_sets)
+
+    def _index_chart_patterns(self, *, permission_sets: list[PermissionRowType]):
+        for permission_set in permission_sets:
+            if not isinstance(permission_set, dict):
+                return
+
+            permission_ids = _normalize_permission_ids(
+                "theme",
+                "sub_theme",
+                "topic",
+                "metric",
+                "geography_type",
+                "geography",
+                permission_set=permission_set,
+            )
+
+            # All permission fields must be present
+            if permission_ids is None:
+                return
+            (
+                permission_theme_id,
+                permission_sub_theme_id,
+                permission_topic_id,
+                permission_metric_id,
+                permission_geography_type,
+                permission_geography_id,
+            ) = permission_ids
+
+            self._chart_patterns.add(
+                (
+                    _build_hierarchy_pattern(
+                        permission_theme_id,
+                        permission_sub_theme_id,
+                        permission_topic_id,
+                    ),
+                    permission_metric_id,
+                    _build_hierarchy_pattern(
+                        permission_geography_type, permission_geography_id
+                    ),
+                )
+            )
+
+    def _index_page_patterns(self, *, permission_sets: list[PermissionRowType]):
+        for permission_set in permission_sets:
+            if not isinstance(permission_set, dict):
+                return
+
+            # Theme must be present, but other permission fields are
+            # optional, as wildcard hierarchy allows early short-circuit
+            permission_theme_id = _normalize_permission_id(
+                field_name="theme", permission_set=permission_set
+            )
+            if permission_theme_id is None:
+                return
+            permission_sub_theme_id = (
+                _normalize_permission_id(
+                    field_name="sub_theme", permission_set=permission_set
+                )
+                or ""
+            )
+            permission_topic_id = (
+                _normalize_permission_id(
+                    field_name="topic", permission_set=permission_set
+                )
+                or ""
+            )
+
+            self._page_patterns.add(
+                _build_hierarchy_pattern(
+                    permission_theme_id,
+                    permission_sub_theme_id,
+                    permission_topic_id,
+                )
+            )
+
+    def has_chart_access(
+        self,
+        *,
+        theme_id: int | str | None,
+        sub_theme_id: int | str | None,
+        topic_id: int | str | None,
+        metric_id: int | str | None,
+        geography_type: int | str | None,
+        geography_id: int | str | None,
+    ) -> bool:
+        """Checks whether the permissions grant access to the given CHART resources"""
+        resource_ids = _normalize_resource_ids(
+            theme_id,
+            sub_theme_id,
+            topic_id,
+            metric_id,
+            geography_type,
+            geography_id,
+        )
+        if resource_ids is None:
             return False
         (
-            permission_theme_id,
-            permission_sub_theme_id,
-            permission_topic_id,
-            permission_metric_id,
-            permission_geography_type,
-            permission_geography_id,
-        ) = permission_ids
-
-        # Themes, sub themes, topics & metrics have their own
-        # dependency hierarchy (means wildcards can be at the end)
-        has_theme_sub_theme_topic_permissions = check_theme_sub_theme_topic_permissions(
-            permission_theme_id=permission_theme_id,
-            permission_sub_theme_id=permission_sub_theme_id,
-            permission_topic_id=permission_topic_id,
-            theme_id=theme_id,
-            sub_theme_id=sub_theme_id,
-            topic_id=topic_id,
+            theme_id,
+            sub_theme_id,
+            topic_id,
+            metric_id,
+            geography_type,
+            geography_id,
+        ) = resource_ids
+
+        theme_sub_theme_topic_patterns = _build_hierarchy_prefixes(
+            theme_id, sub_theme_id, topic_id
         )
-        has_metric_permissions = check_metric_permissions(
-            permission_metric_id=permission_metric_id,
-            metric_id=metric_id,
+        geography_patterns = _build_hierarchy_prefixes(geography_type, geography_id)
+
+        return any(
+            (
+                theme_sub_theme_topic_pattern,
+                metric_pattern,
+                geography_pattern,
+            )
+            in self._chart_patterns
+            for theme_sub_theme_topic_pattern in theme_sub_theme_topic_patterns
+            for metric_pattern in (WILDCARD_ID_VALUE, metric_id)
+            for geography_pattern in geography_patterns
         )
 
-        # Geographies have their own dependency hierarchy too
-        has_geography_permissions = check_geography_permissions(
-            permission_geography_type=permission_geography_type,
-            permission_geography_id=permission_geography_id,
-            geography_type=geography_type,
-            geography_id=geography_id,
+    def has_page_access(
+        self,
+        *,
+        theme_id: int | str | None,
+        sub_theme_id: int | str | None,
+        topic_id: int | str | None,
+    ) -> bool:
+        """Checks whether the permissions grant access to the given CMS PAGE"""
+        resource_ids = _normalize_resource_ids(theme_id, sub_theme_id, topic_id)
+        if resource_ids is None:
+            return False
+
+        return any(
+            pattern in self._page_patterns
+            for pattern in _build_hierarchy_prefixes(*resource_ids)
         )
 
-        if (
-            has_theme_sub_theme_topic_permissions
-            and has_metric_permissions
-            and has_geography_permissions
-        ):
-            return True
 
-    return False
+_compiled_permission_sets_ctx: contextvars.ContextVar[
+    tuple[list[PermissionRowType], CompiledPermissionSets] | None
+] = contextvars.ContextVar("_compiled_permission_sets_ctx", default=None)
 
 
-def check_page_permissions(
+def get_compiled_permission_sets(
+    *, permission_sets: list[PermissionRowType]
+) -> CompiledPermissionSets:
+    """Gets the `CompiledPermissionSets` for the given `permission_sets`
+
+    Notes:
+        The compiled permissions are held for the current request context.
+        So they are only built once for the permissions of the current user,
+        regardless of how many resources are checked against them.
+
+    Args:
+        permission_sets: The list of permission rows
+            extracted from the Cognito token.
+
+    Returns:
+        The `CompiledPermissionSets` for the given `permission_sets`
+
+    """
+    compiled_entry = _compiled_permission_sets_ctx.get()
+    if compiled_entry is not None and compiled_entry[0] is permission_sets:
+        return compiled_entry[1]
+
+    compiled_permission_sets = CompiledPermissionSets(permission_sets=permission_sets)
+    _compiled_permission_sets_ctx.set((permission_sets, compiled_permission_sets))
+    return compiled_permission_sets
+
+
+def check_chart_permissions(
     *,
     permission_sets: list[PermissionRowType],
     theme_id: str,
     sub_theme_id: str,
     topic_id: str,
+    metric_id: str,
+    geography_type: str,
+    geography_id: str,
 ) -> bool:
-    """Check permissions whether the end-user can access a specific CMS PAGE through the API."""
+    """Check permissions whether the end-user can access a specific CHART through the API."""
 
     if not isinstance(permission_sets, list):
         return False
 
-    resource_ids = _normalize_resource_ids(theme_id, sub_theme_id, topic_id)
-    if resource_ids is None:
-        return False
-    theme_id, sub_theme_id, topic_id = resource_ids
-
-    for permission_set in permission_sets:
-        if not isinstance(permission_set, dict):
-            return False
-
-        # Theme must be present, but other permission fields are
-        # optional, as wildcard hierarchy allows early short-circuit
-        permission_theme_id = _normalize_permission_id(
-            field_name="theme", permission_set=permission_set
-        )
-        if permission_theme_id is None:
-            return False
-        permission_sub_theme_id = (
-            _normalize_permission_id(
-                field_name="sub_theme", permission_set=permission_set
-            )
-            or ""
-        )
-        permission_topic_id = (
-            _normalize_permission_id(field_name="topic", permission_set=permission_set)
-            or ""
-        )
-
-        if check_theme_sub_theme_topic_permissions(
-            permission_theme_id=permission_theme_id,
-            permission_sub_theme_id=permission_sub_theme_id,
-            permission_topic_id=permission_topic_id,
-            theme_id=theme_id,
-            sub_theme_id=sub_theme_id,
-            topic_id=topic_id,
-        ):
-            return True
-
-    return False
+    compiled_permission_sets = get_compiled_permission_sets(
+        permission_sets=permission_sets
+    )
+    return compiled_permission_sets.has_chart_access(
+        theme_id=theme_id,
+        sub_theme_id=sub_theme_id,
+        topic_id=topic_id,
+        metric_id=metric_id,
+        geography_type=geography_type,
+        geography_id=geography_id,
+    )
 
 
-def check_theme_sub_theme_topic_permissions(
+def check_page_permissions(
     *,
-    permission_theme_id: str,
-    permission_sub_theme_id: str,
-    permission_topic_id: str,
+    permission_sets: list[PermissionRowType],
     theme_id: str,
     sub_theme_id: str,
     topic_id: str,
 ) -> bool:
-    """
-    Evaluate the theme/sub-theme/topic portion of a permission row
-    with its own dependency hierarchy (means wildcards can be at the end)
-    """
-
-    if permission_theme_id == WILDCARD_ID_VALUE:
-        return True
+    """Check permissions whether the end-user can access a specific CMS PAGE through the API."""
 
-    if permission_theme_id == theme_id and permission_sub_theme_id == WILDCARD_ID_VALUE:
-        return True
+    if not isinstance(permission_sets, list):
+        return False
 
-    if (  # noqa: SIM103
-        permission_theme_id == theme_id
-        and permission_sub_theme_id == sub_theme_id
-        and (permission_topic_id in {WILDCARD_ID_VALUE, topic_id})
-    ):
-        return True
+    compiled_permission_sets = get_compiled_permission_sets(
+        permission_sets=permission_sets
+    )
+    return compiled_permission_sets.has_page_access(
+        theme_id=theme_id, sub_theme_id=sub_theme_id, topic_id=topic_id
+    )
 
-    return False
 
+def _build_hierarchy_pattern(*permission_ids: str) -> tuple[str, ...]:
+    """Build the pattern for a permission hierarchy, up to its first wildcard.
 
-def check_metric_permissions(
-    *,
-    permission_metric_id: str,
-    metric_id: str,
-) -> bool:
+    E.g. `("1", "-1", "3")` gives `("1",)`
     """
-    Evaluate the metric portion of a permission row
-    for it to be either a wildcard or a match.
-    """
-
-    if permission_metric_id in {WILDCARD_ID_VALUE, metric_id}:  # noqa: SIM103
-        return True
 
-    return False
+    pattern: list[str] = []
+    for permission_id in permission_ids:
+        if permission_id == WILDCARD_ID_VALUE:
+            break
+        pattern.append(permission_id)
 
+    return tuple(pattern)
 
-def check_geography_permissions(
-    *,
-    permission_geography_type: str,
-    permission_geography_id: str,
-    geography_type: str,
-    geography_id: str,
-) -> bool:
-    """
-    Evaluate the geography_type/geography portion of a permission row
-    with its own dependency hierarchy (means wildcards can be at the end)
-    """
 
-    if permission_geography_type == WILDCARD_ID_VALUE:
-        return True
+def _build_hierarchy_prefixes(*resource_ids: str) -> tuple[tuple[str, ...], ...]:
+    """Build every pattern which would match the given resource hierarchy.
 
-    if (  # noqa: SIM103
-        permission_geography_type == geography_type
-        and permission_geography_id in {WILDCARD_ID_VALUE, geography_id}
-    ):
-        return True
+    E.g. `("1", "2")` gives `((), ("1",), ("1", "2"))`
+    """
 
-    return False
+    return tuple(resource_ids[:index] for index in range(len(resource_ids) + 1))
 
 
 def _get_id_string_or_none(my_id: int | str | None) -> str | None:
@@ -0,0 +1,209 @@
+"""Resolves the names of the resources referenced by permission checks into their IDs.
+
+The IDs are held in a bounded, process-wide cache.
+So repeated permission checks for the same resources
+do not need to go back to the database.
+The cache is invalidated whenever any of the supporting models are changed,
+and each entry is expired after a timeout
+to pick up any changes which were made by other processes.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+import config
+from common.metrics_interface.interface import MetricsAPIInterface
+
+# The names of the models from which the resource IDs are resolved.
+# Any changes to these models will invalidate the cached resource IDs
+RESOURCE_ID_MODELS: set[str] = {
+    "Theme",
+    "SubTheme",
+    "Topic",
+    "Metric",
+    "GeographyType",
+    "Geography",
+}
+
+
+class ChartResourceIds(NamedTuple):
+    theme_id: int | None
+    sub_theme_id: int | None
+    topic_id: int | None
+    metric_id: int | None
+    geography_type_id: int | None
+    geography_id: str | None
+
+
+class ResourceIdResolver:
+    """Resolves resource names into IDs, holding them in a bounded in-process cache
+
+    Notes:
+        Lookups which do not resolve to an ID are not held in the cache.
+        This means that resources which are created at a later point
+        by another process will be picked up by the next lookup.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int | None = None,
+        timeout_seconds: float | None = None,
+        metrics_api_interface: type[MetricsAPIInterface] = MetricsAPIInterface,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_size: int = (
+            config.PERMISSIONS_RESOURCE_ID_CACHE_MAX_SIZE
+            if max_size is None
+            else max_size
+        )
+        self._timeout_seconds: float = (
+            config.PERMISSIONS_RESOURCE_ID_CACHE_TIMEOUT_SECONDS
+            if timeout_seconds is None
+            else timeout_seconds
+        )
+        self._metrics_api_interface = metrics_api_interface
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, ...], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation: int = 0
+
+    @property
+    def generation(self) -> int:
+        """The number of times the cache has been invalidated"""
+        return self._generation
+
+    def invalidate(self) -> None:
+        """Removes all the resource IDs from the cache"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def resolve_chart_resource_ids(
+        self,
+        *,
+        theme_name: str,
+        sub_theme_name: str,
+        topic_name: str,
+        metric_name: str,
+        geography_type: str,
+        geography_name: str,
+    ) -> ChartResourceIds:
+        """Resolves the IDs for each of the resources of a chart
+
+        Args:
+            theme_name: The name of the theme being queried.
+                E.g. `infectious_disease`
+            sub_theme_name: The name of the sub theme being queried.
+                E.g. `respiratory`
+            topic_name: The name of the topic being queried.
+                E.g. `COVID-19`
+            metric_name: The name of the metric being queried.
+                E.g. `COVID-19_deaths_ONSByDay`
+            geography_type: The name of the geography type being queried.
+                E.g. `Nation`
+            geography_name: The name of the geography being queried.
+                E.g. `England`
+
+        Returns:
+            `ChartResourceIds` holding the ID for each resource.
+            Any resource which could not be found will be None
+
+        """
+        topic_manager = self._metrics_api_interface.get_topic_manager()
+        metric_manager = self._metrics_api_interface.get_metric_manager()
+        geography_type_manager = (
+            self._metrics_api_interface.get_geography_type_manager()
+        )
+        geography_manager = self._metrics_api_interface.get_geography_manager()
+
+        theme_id, sub_theme_id, topic_id = self._get_or_resolve(
+            key=("topic", theme_name, sub_theme_name, topic_name),
+            resolve=lambda: topic_manager.get_id_by_name(
+                theme_name, sub_theme_name, topic_name
+            ),
+            is_resolved=lambda ids: None not in ids,
+        )
+        metric_id = self._get_or_resolve(
+            key=("metric", metric_name),
+            resolve=lambda: metric_manager.get_id_by_name(metric_name),
+        )
+        geography_type_id = self._get_or_resolve(
+            key=("geography_type", geography_type),
+            resolve=lambda: geography_type_manager.get_id_by_name(geography_type),
+        )
+        geography_id = self._get_or_resolve(
+            key=("geography", geography_name, geography_type),
+            resolve=lambda: geography_manager.get_code_by_name(
+                geography_name, geography_type
+            ),
+        )
+
+        return ChartResourceIds(
+            theme_id=theme_id,
+            sub_theme_id=sub_theme_id,
+            topic_id=topic_id,
+            metric_id=metric_id,
+            geography_type_id=geography_type_id,
+            geography_id=geography_id,
+        )
+
+    def _get_or_resolve(
+        self,
+        *,
+        key: tuple[str, ...],
+        resolve: Callable[[], Any],
+        is_resolved: Callable[[Any], bool] = lambda value: value is not None,
+    ) -> Any:
+        now: float = self._clock()
+
+        with self._lock:
+            generation: int = self._generation
+            entry: tuple[float, Any] | None = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if now < expires_at:
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+
+        value = resolve()
+        if not is_resolved(value) or self._max_size <= 0:
+            return value
+
+        with self._lock:
+            if generation != self._generation:
+                # The cache was invalidated whilst the value was being resolved,
+                # so the value may already be stale
+                return value
+
+            self._entries[key] = (now + self._timeout_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return value
+
+
+resource_id_resolver = ResourceIdResolver()
+
+
+def invalidate_resource_ids() -> None:
+    """Removes all the resource IDs from the process-wide cache"""
+    resource_id_resolver.invalidate()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_resource_ids_on_change(sender, **kwargs) -> None:
+    if sender.__name__ not in RESOURCE_ID_MODELS:
+        return
+
+    invalidate_resource_ids()
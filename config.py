@@ -1,5 +1,6 @@
 import logging
 import os
+import tempfile
 
 import django.core.management.utils
 from dotenv import load_dotenv
@@ -54,12 +55,119 @@ if not REDIS_RESERVED_HOST:
     logger.info("No REDIS_RESERVED_HOST given, falling back to localhost")
     REDIS_RESERVED_HOST = "redis://127.0.0.1:6379"
 
+# Switch to hold a bounded, in-process copy of the hottest private API cache entries
+# in front of the shared redis cache, along with its size budget and timeouts
+PRIVATE_API_LOCAL_CACHE_ENABLED: bool = os.environ.get(
+    "PRIVATE_API_LOCAL_CACHE_ENABLED", ""
+).lower() in {"true", "1"}
+PRIVATE_API_LOCAL_CACHE_MAX_SIZE_IN_BYTES: int = int(
+    os.environ.get("PRIVATE_API_LOCAL_CACHE_MAX_SIZE_IN_BYTES", 64 * 1024 * 1024)
+)
+PRIVATE_API_LOCAL_CACHE_TIMEOUT_SECONDS: float = float(
+    os.environ.get("PRIVATE_API_LOCAL_CACHE_TIMEOUT_SECONDS", 60)
+)
+PRIVATE_API_LOCAL_CACHE_GENERATION_CHECK_SECONDS: float = float(
+    os.environ.get("PRIVATE_API_LOCAL_CACHE_GENERATION_CHECK_SECONDS", 5)
+)
+
+# The size in bytes of a rendered private API response at which point
+# its body is gzip compressed before being saved in the cache
+PRIVATE_API_CACHE_COMPRESSION_THRESHOLD_IN_BYTES: int = int(
+    os.environ.get("PRIVATE_API_CACHE_COMPRESSION_THRESHOLD_IN_BYTES", 1024)
+)
+
+# Where the precomputed bulk downloads archives are stored.
+# Either "local" to store them on disk in the `BULK_DOWNLOADS_LOCAL_DIRECTORY`,
+# or "s3" to store them in the `BULK_DOWNLOADS_BUCKET_NAME` s3 bucket.
+# Defaults to an empty string, in which case the archive is built on each request instead.
+# The archives are rebuilt by whichever container refreshes the cache,
+# so "local" is only suitable when that container also serves the requests
+BULK_DOWNLOADS_STORAGE_BACKEND: str = os.environ.get(
+    "BULK_DOWNLOADS_STORAGE_BACKEND", ""
+)
+BULK_DOWNLOADS_LOCAL_DIRECTORY: str = os.environ.get(
+    "BULK_DOWNLOADS_LOCAL_DIRECTORY",
+    os.path.join(tempfile.gettempdir(), "bulk_downloads"),
+)
+BULK_DOWNLOADS_BUCKET_NAME = os.environ.get("BULK_DOWNLOADS_BUCKET_NAME")
+
+# The number of records in a chart download above which the download is streamed back
+# from a server-side cursor, instead of being built in memory in full
+DOWNLOADS_STREAMING_THRESHOLD_IN_ROWS: int = int(
+    os.environ.get("DOWNLOADS_STREAMING_THRESHOLD_IN_ROWS", 10_000)
+)
+# The number of records fetched from the server-side cursor at a time
+# when a chart download is being streamed
+DOWNLOADS_STREAMING_CHUNK_SIZE: int = int(
+    os.environ.get("DOWNLOADS_STREAMING_CHUNK_SIZE", 2000)
+)
+
+# The number of warm headless renderer processes held by each worker process
+# for exporting charts as static images. If this is set to 0, then the pool is disabled
+# and every chart is rendered by plotly's own single renderer instead.
+# The pool is disabled by default and should be enabled per environment,
+# once the memory available to each worker has been sized for the extra renderers
+CHART_RENDERER_POOL_SIZE: int = int(os.environ.get("CHART_RENDERER_POOL_SIZE", 0))
+# The number of chart requests which can wait for a free renderer from the pool,
+# along with the number of seconds they wait for before falling back to plotly's renderer
+CHART_RENDERER_POOL_MAX_QUEUE_SIZE: int = int(
+    os.environ.get("CHART_RENDERER_POOL_MAX_QUEUE_SIZE", 4)
+)
+CHART_RENDERER_POOL_ACQUIRE_TIMEOUT_SECONDS: float = float(
+    os.environ.get("CHART_RENDERER_POOL_ACQUIRE_TIMEOUT_SECONDS", 2)
+)
+# The number of seconds after which a renderer from the pool is killed
+# if it has not finished rendering a chart
+CHART_RENDERER_TIMEOUT_SECONDS: float = float(
+    os.environ.get("CHART_RENDERER_TIMEOUT_SECONDS", 30)
+)
+# The optimizer used to reduce the size of the SVGs exported for encoded charts.
+# This can be either `minify` or `scour`
+CHART_SVG_OPTIMIZER: str = os.environ.get("CHART_SVG_OPTIMIZER", "minify")
+# The number of decimal places which coordinates are rounded to
+# when SVGs are optimized with the `minify` optimizer
+CHART_SVG_DECIMAL_PLACES: int = int(os.environ.get("CHART_SVG_DECIMAL_PLACES", 1))
+
+# The maximum number of resource IDs held in the in-process cache used for permission checks,
+# along with the number of seconds after which each of those resource IDs are expired
+PERMISSIONS_RESOURCE_ID_CACHE_MAX_SIZE: int = int(
+    os.environ.get("PERMISSIONS_RESOURCE_ID_CACHE_MAX_SIZE", 4096)
+)
+PERMISSIONS_RESOURCE_ID_CACHE_TIMEOUT_SECONDS: float = float(
+    os.environ.get("PERMISSIONS_RESOURCE_ID_CACHE_TIMEOUT_SECONDS", 300)
+)
+
+# The number of seconds after which entries in a generation of the default cache are expired,
+# once that generation has been superseded by a new one.
+# Superseded generations are never read again, so this is how they are evicted from the cache.
+# This should be comfortably longer than the longest request served from a superseded generation
+CACHE_GENERATION_TIMEOUT_SECONDS: int = int(
+    os.environ.get("CACHE_GENERATION_TIMEOUT_SECONDS", 7 * 24 * 60 * 60)
+)
+# The number of seconds for which the active generation pointer of the default cache is held in-process.
+# Processes other than the one which switches generations are served from the previous generation
+# for up to this long after the switch
+CACHE_GENERATION_POINTER_TIMEOUT_SECONDS: float = float(
+    os.environ.get("CACHE_GENERATION_POINTER_TIMEOUT_SECONDS", 5)
+)
+
 # The name of the s3 bucket used for ingestion
 INGESTION_BUCKET_NAME = os.environ.get("INGESTION_BUCKET_NAME")
 # The name of the s3 bucket used for archiving files which have been successfully ingested
 INGESTION_ARCHIVE_BUCKET_NAME = os.environ.get("INGESTION_ARCHIVE_BUCKET_NAME")
 # The name of the AWS profile to use for the AWS client used for ingestion
 AWS_PROFILE_NAME = os.environ.get("AWS_PROFILE_NAME")
+# Switch to write ingested records via PostgreSQL `COPY` instead of batched `INSERT` statements.
+# This has no effect for other database backends, such as the sqlite db used locally
+INGESTION_COPY_WRITES_ENABLED: bool = os.environ.get(
+    "INGESTION_COPY_WRITES_ENABLED", ""
+).lower() in {"true", "1"}
+
+# Switch to ingest all the files in each lambda invocation in bulk with the `BatchConsumer`,
+# instead of 1 file at a time with the `Consumer`
+INGESTION_BATCH_MODE_ENABLED: bool = os.environ.get(
+    "INGESTION_BATCH_MODE_ENABLED", ""
+).lower() in {"true", "1"}
 
 JWT_AUTH_HEADER = os.environ.get("JWT_AUTH_HEADER", "HTTP_AUTHORIZATION")
 
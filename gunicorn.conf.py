@@ -1,5 +1,9 @@
 import gunicorn
 
+import config
+from metrics.api.enums import AppMode
+from metrics.interfaces.charts.common.rendering import chart_renderer_pool
+
 workers = 3
 threads = 3
 worker_class = "gthread"
@@ -7,3 +11,20 @@ timeout = 120
 
 gunicorn.SERVER = "undisclosed"
 gunicorn.SERVER_SOFTWARE = "0.0.0"
+
+
+def post_worker_init(worker) -> None:
+    # The chart renderers are started after the worker has been forked,
+    # so that each worker holds its own pool of renderer processes
+    app_mode: str | None = config.APP_MODE
+    if app_mode and app_mode not in AppMode.dependent_on_chart_rendering():
+        return
+
+    try:
+        chart_renderer_pool.warm_up()
+    except Exception:
+        worker.log.exception("Failed to warm up the chart renderer pool")
+
+
+def worker_exit(server, worker) -> None:
+    chart_renderer_pool.shutdown()
@@ -0,0 +1,287 @@
+import contextlib
+import logging
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import Manager
+
+from ingestion.consumer import (
+    API_TIME_SERIES_MODEL,
+    CORE_HEADLINE_MODEL,
+    CORE_TIME_SERIES_MODEL,
+    DEFAULT_API_TIME_SERIES_DIMENSION_MANAGER,
+    Consumer,
+)
+from ingestion.data_transfer_models.headline import HeadlineDTO
+from ingestion.data_transfer_models.time_series import TimeSeriesDTO
+from ingestion.operations.batch_record_creation import create_records
+from ingestion.operations.supporting_models_cache import (
+    SUPPORTING_MODELS_CACHE,
+    SupportingModelsCache,
+    SupportingModelsLookup,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FILES_PER_BATCH = 250
+DEFAULT_RECORDS_PER_WRITE = 5000
+
+
+@dataclass
+class IngestionStageTimings:
+    """Records the wall-clock time, in seconds, spent in each stage of a batched ingestion"""
+
+    warm_supporting_models_cache: float = 0.0
+    resolve_supporting_models: float = 0.0
+    clear_stale_records: float = 0.0
+    build_records: float = 0.0
+    write_records: float = 0.0
+    refresh_current_views: float = 0.0
+    number_of_dtos: int = 0
+    number_of_batches: int = 0
+
+    @contextlib.contextmanager
+    def measure(self, *, stage: str) -> Iterator[None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            setattr(self, stage, getattr(self, stage) + elapsed)
+
+    @property
+    def total(self) -> float:
+        return (
+            self.warm_supporting_models_cache
+            + self.resolve_supporting_models
+            + self.clear_stale_records
+            + self.build_records
+            + self.write_records
+            + self.refresh_current_views
+        )
+
+    def log(self) -> None:
+        logger.info(
+            "Ingested %s No. files in %s No. batches in %s seconds - "
+            "warm cache: %s, resolve supporting models: %s, "
+            "clear stale records: %s, build records: %s, write records: %s, "
+            "refresh current views: %s",
+            self.number_of_dtos,
+            self.number_of_batches,
+            round(self.total, 2),
+            round(self.warm_supporting_models_cache, 2),
+            round(self.resolve_supporting_models, 2),
+            round(self.clear_stale_records, 2),
+            round(self.build_records, 2),
+            round(self.write_records, 2),
+            round(self.refresh_current_views, 2),
+        )
+
+
+class BatchConsumer:
+    """Ingests many inbound DTOs at once, sharing the supporting models lookup and the database writes between them
+
+    Notes:
+    ------
+    Compared to running a `Consumer` per file, this:
+        a) Resolves the supporting models (`Theme`, `Topic`, `Metric` etc)
+            for every DTO via the process-wide `SupportingModelsCache`.
+            Which costs at most 2 queries per supporting table
+            for the entire collection of DTOs.
+        b) Clears stale records and writes the new `CoreHeadline`,
+            `CoreTimeSeries` and `APITimeSeries` records for each batch of DTOs
+            within 1 transaction, using large batches for the inserts.
+            The current views of the time series records are refreshed
+            within the same transaction.
+
+    Stale records are cleared for every DTO in a batch
+    before any of the new records in that batch are written.
+    Except where DTOs in the same batch are for the same series.
+    In which case, the batch is split into rounds so that each of those DTOs
+    is cleared and written after the previous one, in the order they were given.
+    This means they supersede each other
+    as they would if they had been ingested one at a time.
+
+    Parameters:
+    -----------
+    dtos : list[HeadlineDTO | TimeSeriesDTO]
+        The parsed and validated DTOs to be ingested
+    files_per_batch : int
+        The number of DTOs to be written within each transaction.
+        Defaults to `DEFAULT_FILES_PER_BATCH`
+    records_per_write : int
+        The number of records created in a single insert query.
+        Defaults to `DEFAULT_RECORDS_PER_WRITE`
+    supporting_models_cache : `SupportingModelsCache`
+        The cache used to resolve the supporting models.
+        Defaults to the process-wide `SUPPORTING_MODELS_CACHE`
+    core_headline_manager : `CoreHeadlineManager`
+        The model manager for `CoreHeadline`
+        Defaults to the concrete `CoreHeadlineManager` via `CoreHeadline.objects`
+    core_timeseries_manager : `CoreTimeSeriesManager`
+        The model manager for `CoreTimeSeries`
+        Defaults to the concrete `CoreTimeSeriesManager` via `CoreTimeSeries.objects`
+    api_timeseries_manager : `APITimeSeriesManager`
+        The model manager for `APITimeSeries`
+        Defaults to the concrete `APITimeSeriesManager` via `APITimeSeries.objects`
+    api_timeseries_dimension_manager : `APITimeSeriesDimensionManager`
+        The model manager for the `APITimeSeriesDimension` catalogue
+        Defaults to the concrete `APITimeSeriesDimensionManager`
+        via `APITimeSeriesDimension.objects`
+
+    """
+
+    def __init__(
+        self,
+        *,
+        dtos: list[HeadlineDTO | TimeSeriesDTO],
+        files_per_batch: int = DEFAULT_FILES_PER_BATCH,
+        records_per_write: int = DEFAULT_RECORDS_PER_WRITE,
+        supporting_models_cache: SupportingModelsCache = SUPPORTING_MODELS_CACHE,
+        core_headline_manager: Manager = CORE_HEADLINE_MODEL.objects,
+        core_timeseries_manager: Manager = CORE_TIME_SERIES_MODEL.objects,
+        api_timeseries_manager: Manager = API_TIME_SERIES_MODEL.objects,
+        api_timeseries_dimension_manager: Manager = (
+            DEFAULT_API_TIME_SERIES_DIMENSION_MANAGER
+        ),
+    ):
+        self.dtos = dtos
+        self.files_per_batch = files_per_batch
+        self.records_per_write = records_per_write
+        self.supporting_models_cache = supporting_models_cache
+
+        # Model managers
+        self.core_headline_manager = core_headline_manager
+        self.core_timeseries_manager = core_timeseries_manager
+        self.api_timeseries_manager = api_timeseries_manager
+        self.api_timeseries_dimension_manager = api_timeseries_dimension_manager
+
+    def process(self) -> IngestionStageTimings:
+        """Creates the supporting models and the `CoreHeadline`, `CoreTimeSeries` & `APITimeSeries` records for all DTOs
+
+        Notes:
+            The supporting models are resolved before any of the batch transactions are opened.
+            This ensures the process-wide cache never holds IDs
+            for records which were rolled back along with a failed batch.
+
+        Returns:
+            An `IngestionStageTimings` object
+            detailing the time spent in each stage
+
+        """
+        timings = IngestionStageTimings(number_of_dtos=len(self.dtos))
+
+        if not self.supporting_models_cache.is_warm:
+            with timings.measure(stage="warm_supporting_models_cache"):
+                self.supporting_models_cache.warm()
+
+        with timings.measure(stage="resolve_supporting_models"):
+            supporting_models_lookups: list[SupportingModelsLookup] = (
+                self.supporting_models_cache.resolve(dtos=self.dtos)
+            )
+
+        consumers: list[Consumer] = [
+            self._build_consumer(dto=dto, supporting_models_lookup=lookup)
+            for dto, lookup in zip(self.dtos, supporting_models_lookups, strict=True)
+        ]
+
+        for start_index in range(0, len(consumers), self.files_per_batch):
+            batch = consumers[start_index : start_index + self.files_per_batch]
+            self._process_batch(consumers=batch, timings=timings)
+            timings.number_of_batches += 1
+
+        timings.log()
+        return timings
+
+    def _build_consumer(
+        self,
+        *,
+        dto: HeadlineDTO | TimeSeriesDTO,
+        supporting_models_lookup: SupportingModelsLookup,
+    ) -> Consumer:
+        return Consumer(
+            dto=dto,
+            filename="",
+            supporting_models_lookup=supporting_models_lookup,
+            core_headline_manager=self.core_headline_manager,
+            core_timeseries_manager=self.core_timeseries_manager,
+            api_timeseries_manager=self.api_timeseries_manager,
+            api_timeseries_dimension_manager=self.api_timeseries_dimension_manager,
+        )
+
+    @staticmethod
+    def _split_into_rounds(*, consumers: list[Consumer]) -> list[list[Consumer]]:
+        """Splits the `consumers` into rounds, each of which holds at most 1 consumer per series
+
+        Notes:
+            The consumers for the same series are placed in consecutive rounds,
+            in the order in which they were given.
+
+        """
+        rounds: list[list[Consumer]] = []
+        number_of_rounds_by_series: dict[tuple[bool | str, ...], int] = {}
+
+        for consumer in consumers:
+            round_index: int = number_of_rounds_by_series.get(consumer.series_key, 0)
+            number_of_rounds_by_series[consumer.series_key] = round_index + 1
+
+            if round_index == len(rounds):
+                rounds.append([])
+            rounds[round_index].append(consumer)
+
+        return rounds
+
+    def _process_batch(
+        self, *, consumers: list[Consumer], timings: IngestionStageTimings
+    ) -> None:
+        with transaction.atomic():
+            for round_of_consumers in self._split_into_rounds(consumers=consumers):
+                self._process_round(consumers=round_of_consumers, timings=timings)
+
+            with timings.measure(stage="refresh_current_views"):
+                refreshed_series_keys: set[tuple[bool | str, ...]] = set()
+                for consumer in consumers:
+                    if consumer.is_headline_data:
+                        continue
+                    if consumer.series_key in refreshed_series_keys:
+                        continue
+                    consumer.refresh_current_timeseries()
+                    refreshed_series_keys.add(consumer.series_key)
+
+    def _process_round(
+        self, *, consumers: list[Consumer], timings: IngestionStageTimings
+    ) -> None:
+        with timings.measure(stage="clear_stale_records"):
+            for consumer in consumers:
+                if consumer.is_headline_data:
+                    consumer.clear_stale_headlines()
+                else:
+                    consumer.clear_stale_timeseries()
+
+        core_headlines = []
+        core_time_series = []
+        api_time_series = []
+        with timings.measure(stage="build_records"):
+            for consumer in consumers:
+                if consumer.is_headline_data:
+                    core_headlines += consumer.build_core_headlines()
+                else:
+                    core_time_series += consumer.build_core_time_series()
+                    api_time_series += consumer.build_api_time_series()
+
+        with timings.measure(stage="write_records"):
+            for model_manager, model_instances in (
+                (self.core_headline_manager, core_headlines),
+                (self.core_timeseries_manager, core_time_series),
+                (self.api_timeseries_manager, api_time_series),
+            ):
+                create_records(
+                    model_manager=model_manager,
+                    model_instances=model_instances,
+                    batch_size=self.records_per_write,
+                )
+            self.api_timeseries_dimension_manager.record_dimensions(
+                api_time_series=api_time_series
+            )
@@ -1,5 +1,4 @@
-from typing import NamedTuple
-
+from django.db import transaction
 from django.db.models import Manager
 
 from ingestion.data_transfer_models.handlers import (
@@ -13,6 +12,7 @@ from ingestion.metrics_interface.interface import (
     MetricsAPIInterface,
 )
 from ingestion.operations.batch_record_creation import create_records
+from ingestion.operations.supporting_models_cache import SupportingModelsLookup
 from ingestion.utils import type_hints
 
 DEFAULT_THEME_MANAGER = MetricsAPIInterface.get_theme_manager()
@@ -25,17 +25,13 @@ DEFAULT_GEOGRAPHY_MANAGER = MetricsAPIInterface.get_geography_manager()
 DEFAULT_AGE_MANAGER = MetricsAPIInterface.get_age_manager()
 DEFAULT_STRATUM_MANAGER = MetricsAPIInterface.get_stratum_manager()
 API_TIME_SERIES_MODEL = MetricsAPIInterface.get_api_timeseries()
+DEFAULT_API_TIME_SERIES_DIMENSION_MANAGER = (
+    MetricsAPIInterface.get_api_timeseries_dimension_manager()
+)
 CORE_TIME_SERIES_MODEL = MetricsAPIInterface.get_core_timeseries()
 CORE_HEADLINE_MODEL = MetricsAPIInterface.get_core_headline()
 
 
-class SupportingModelsLookup(NamedTuple):
-    metric_id: int
-    geography_id: int
-    stratum_id: int
-    age_id: int
-
-
 class Consumer:
     """Ingests inbound data and ultimately creates the core & api models in the database
 
@@ -52,11 +48,17 @@ class Consumer:
 
     Parameters:
     -----------
-    source_data: dict[str, str | list[dict[str, str | float]]]
-        The raw source data to be ingested
+    source_data: dict[str, str | list[dict[str, str | float]]] | None
+        The raw source data to be ingested.
+        This can be omitted if the `dto` is provided instead.
     dto: HeadlineDTO | TimeSeriesDTO | None
         The parsed and validated DTO for the headline or timeseries data.
         If not provided, this will be created from the source data
+    supporting_models_lookup: SupportingModelsLookup | None
+        The IDs of the supporting models which have already
+        been resolved for the `dto`, typically by a `BatchConsumer`.
+        If not provided, the supporting models will be
+        fetched or created individually for this `dto`.
     reader : `Reader`
         The reader object used to parse the data
         Defaults to a `Reader` object
@@ -96,15 +98,20 @@ class Consumer:
     api_timeseries_manager : `APITimeSeriesManager`
         The model manager for `APITimeSeries`
         Defaults to the concrete `APITimeSeriesManager` via `APITimeSeries.objects`
+    api_timeseries_dimension_manager : `APITimeSeriesDimensionManager`
+        The model manager for the `APITimeSeriesDimension` catalogue
+        Defaults to the concrete `APITimeSeriesDimensionManager`
+        via `APITimeSeriesDimension.objects`
 
     """
 
     def __init__(
         self,
         *,
-        source_data: type_hints.INCOMING_DATA_TYPE,
         filename: str,
+        source_data: type_hints.INCOMING_DATA_TYPE | None = None,
         dto: HeadlineDTO | TimeSeriesDTO | None = None,
+        supporting_models_lookup: SupportingModelsLookup | None = None,
         theme_manager: Manager = DEFAULT_THEME_MANAGER,
         sub_theme_manager: Manager = DEFAULT_SUB_THEME_MANAGER,
         topic_manager: Manager = DEFAULT_TOPIC_MANAGER,
@@ -117,10 +124,14 @@ class Consumer:
         core_headline_manager: Manager = CORE_HEADLINE_MODEL.objects,
         core_timeseries_manager: Manager = CORE_TIME_SERIES_MODEL.objects,
         api_timeseries_manager: Manager = API_TIME_SERIES_MODEL.objects,
+        api_timeseries_dimension_manager: Manager = (
+            DEFAULT_API_TIME_SERIES_DIMENSION_MANAGER
+        ),
     ):
         self._source_data = source_data
         self.filename = filename
         self.dto = dto or self._build_dto()
+        self.supporting_models_lookup = supporting_models_lookup
 
         # Model managers
         self.theme_manager = theme_manager
@@ -135,6 +146,7 @@ class Consumer:
         self.core_headline_manager = core_headline_manager
         self.core_timeseries_manager = core_timeseries_manager
         self.api_timeseries_manager = api_timeseries_manager
+        self.api_timeseries_dimension_manager = api_timeseries_dimension_manager
 
     def _build_dto(self) -> HeadlineDTO | TimeSeriesDTO:
         if self.is_headline_data:
@@ -148,8 +160,26 @@ class Consumer:
 
     @property
     def is_headline_data(self) -> bool:
+        if self._source_data is None:
+            return self.dto.metric_group == DataSourceFileType.headline.value
+
         return self._source_data["metric_group"] == DataSourceFileType.headline.value
 
+    @property
+    def series_key(self) -> tuple[bool | str, ...]:
+        """The fields which identify the series of the ingested data
+
+        Notes:
+            Records within the same series supersede each other.
+            So 2 inbound files with the same `series_key`
+            must be ingested one after the other.
+
+        Returns:
+            Tuple of the data type and the identifying fields of the series
+
+        """
+        return self.is_headline_data, *self._build_api_timeseries_params().values()
+
     # get or create supporting model methods
 
     @staticmethod
@@ -322,9 +352,14 @@ class Consumer:
         Returns:
             An enriched `SupportingModelsLookup` named tuple
             which can be used to provide quick lookup info
-            when creating the `CoreHeadline` or `CoreTimeSeries` records
+            when creating the `CoreHeadline` or `CoreTimeSeries` records.
+            If the `supporting_models_lookup` was provided
+            at initialization, then that will be returned instead.
 
         """
+        if self.supporting_models_lookup is not None:
+            return self.supporting_models_lookup
+
         theme = self._get_or_create_theme()
         sub_theme = self._get_or_create_sub_theme(theme=theme)
         topic = self._get_or_create_topic(sub_theme=sub_theme)
@@ -373,12 +408,17 @@ class Consumer:
             then a new `Topic` model will be created
             and that record will be inserted into the database.
 
+        The current views of the records are then refreshed
+            within the same transaction as the deletes and writes.
+
         Returns:
             None
 
         """
-        self.clear_stale_timeseries()
-        self.create_core_and_api_timeseries()
+        with transaction.atomic():
+            self.clear_stale_timeseries()
+            self.create_core_and_api_timeseries()
+            self.refresh_current_timeseries()
 
     # build and create model methods
 
@@ -573,14 +613,21 @@ class Consumer:
     def create_api_time_series(self) -> None:
         """Creates `APITimeSeries` database records from the ingested data
 
+        Notes:
+            The dimensions of the created records are also
+            added to the `APITimeSeriesDimension` catalogue.
+
         Returns:
             None
 
         """
         api_time_series = self.build_api_time_series()
-        return create_records(
+        create_records(
             model_manager=self.api_timeseries_manager, model_instances=api_time_series
         )
+        self.api_timeseries_dimension_manager.record_dimensions(
+            api_time_series=api_time_series
+        )
 
     def create_core_and_api_timeseries(self) -> None:
         """Creates `APITimeSeries` and `CoreTimeSeries` database records from the ingested data
@@ -603,7 +650,36 @@ class Consumer:
         self._clear_stale_api_timeseries()
 
     def _clear_stale_core_timeseries(self):
-        params = {
+        params = self._build_core_timeseries_params()
+        self.core_timeseries_manager.delete_superseded_data(**params, is_public=True)
+        self.core_timeseries_manager.delete_superseded_data(**params, is_public=False)
+
+    def _clear_stale_api_timeseries(self):
+        params = self._build_api_timeseries_params()
+        self.api_timeseries_manager.delete_superseded_data(**params, is_public=True)
+        self.api_timeseries_manager.delete_superseded_data(**params, is_public=False)
+
+    def refresh_current_timeseries(self) -> None:
+        """Refreshes the current views of both `CoreTimeSeries` and `APITimeSeries` for the ingested series
+
+        Notes:
+            This should be called after the stale records
+            have been cleared and the new records have been created.
+            Within the same transaction as those changes.
+
+        Returns:
+            None
+
+        """
+        self.core_timeseries_manager.refresh_current_view(
+            **self._build_core_timeseries_params()
+        )
+        self.api_timeseries_manager.refresh_current_view(
+            **self._build_api_timeseries_params()
+        )
+
+    def _build_core_timeseries_params(self) -> dict[str, str]:
+        return {
             "metric": self.dto.metric,
             "geography": self.dto.geography,
             "geography_type": self.dto.geography_type,
@@ -612,11 +688,9 @@ class Consumer:
             "sex": self.dto.sex,
             "age": self.dto.age,
         }
-        self.core_timeseries_manager.delete_superseded_data(**params, is_public=True)
-        self.core_timeseries_manager.delete_superseded_data(**params, is_public=False)
 
-    def _clear_stale_api_timeseries(self):
-        params = {
+    def _build_api_timeseries_params(self) -> dict[str, str]:
+        return {
             "theme": self.dto.parent_theme,
             "sub_theme": self.dto.child_theme,
             "topic": self.dto.topic,
@@ -628,5 +702,3 @@ class Consumer:
             "sex": self.dto.sex,
             "age": self.dto.age,
         }
-        self.api_timeseries_manager.delete_superseded_data(**params, is_public=True)
-        self.api_timeseries_manager.delete_superseded_data(**params, is_public=False)
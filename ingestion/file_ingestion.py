@@ -1,5 +1,6 @@
 import json
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 
 import django
@@ -12,8 +13,16 @@ import django
 # to a 1-to-1 of job:ingested file then multiprocessing can be reconfigured
 django.setup()
 
+from ingestion.batch_consumer import (  # noqa: E402
+    DEFAULT_FILES_PER_BATCH,
+    BatchConsumer,
+    IngestionStageTimings,
+)
 from ingestion.consumer import Consumer  # noqa: E402
+from ingestion.operations.payload_stream import PayloadStreamReader  # noqa: E402
+from ingestion.stream_consumer import StreamConsumer  # noqa: E402
 from ingestion.utils.type_hints import INCOMING_DATA_TYPE  # noqa: E402
+from validation.data_transfer_models.base import MissingFieldError  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +33,15 @@ class FileIngestionFailedError(Exception):
         super().__init__(message)
 
 
+class BatchFileIngestionFailedError(Exception):
+    def __init__(self, file_names: list[str]):
+        self.file_names = file_names
+        message = (
+            f"Upload failed for {len(file_names)} No. files: {', '.join(file_names)}"
+        )
+        super().__init__(message)
+
+
 def data_ingester(*, data: INCOMING_DATA_TYPE, filename: str) -> None:
     """Consumes the data in the given `data` and populates the database
 
@@ -44,6 +62,20 @@ def data_ingester(*, data: INCOMING_DATA_TYPE, filename: str) -> None:
     return consumer.process_core_and_api_timeseries()
 
 
+def stream_data_ingester(*, reader: PayloadStreamReader, filename: str) -> None:
+    """Consumes the payload from the given `reader` and populates the database, 1 chunk of items at a time
+
+    Args:
+        reader: The `PayloadStreamReader` for the incoming source data.
+        filename: The source filename for the inbound payload.
+
+    Returns:
+        None
+    """
+    stream_consumer = StreamConsumer(reader=reader, filename=filename)
+    stream_consumer.process()
+
+
 def upload_data(*, key: str, data: INCOMING_DATA_TYPE) -> None:
     """Ingests the given `data` and records logs for starting and finishing points
 
@@ -70,10 +102,144 @@ def upload_data(*, key: str, data: INCOMING_DATA_TYPE) -> None:
     logger.info("Completed ingestion of %s", key)
 
 
-def _upload_data_as_file(*, filepath: Path) -> None:
-    """Reads and uploads data from a JSON file."""
-    logger.info("Uploading %s", filepath.name)
+def upload_data_stream(*, key: str, reader: PayloadStreamReader) -> None:
+    """Ingests the payload from the given `reader` and records logs for starting and finishing points
+
+    Args:
+        key: The key of the corresponding file
+        reader: The `PayloadStreamReader` for the incoming data to be ingested
+
+    Returns:
+        None
+
+    """
+    logger.info("Uploading %s", key)
+
+    try:
+        # Drop folder names, eg "my_file.json" instead
+        # of "in/2026/04/my_file.json"
+        filename = Path(key).name
 
+        stream_data_ingester(reader=reader, filename=filename)
+    except Exception as error:
+        logger.warning("Failed upload of %s due to %s", key, error)
+        raise FileIngestionFailedError(file_name=key) from error
+
+    logger.info("Completed ingestion of %s", key)
+
+
+def _upload_data_as_file(*, filepath: Path) -> None:
+    """Reads and uploads data from a JSON file, without reading the whole file into memory."""
     with open(filepath, encoding="utf-8") as file:
-        deserialized_data = json.load(file)
-        upload_data(key=filepath.name, data=deserialized_data)
+        upload_data_stream(key=filepath.name, reader=PayloadStreamReader(stream=file))
+
+
+def batch_data_ingester(
+    *, items: Iterable[tuple[str, INCOMING_DATA_TYPE]]
+) -> IngestionStageTimings:
+    """Consumes the data in each of the given `items` and populates the database in bulk
+
+    Notes:
+        Any item which fails validation is logged and held back,
+        so that the rest of the items can still be ingested.
+        The failures are then raised once the valid items have been ingested.
+
+    Args:
+        items: Iterable of (filename, data) tuples.
+            Whereby the data is expected to be the dict
+            not the file handler or stream.
+
+    Returns:
+        An `IngestionStageTimings` object
+        detailing the time spent in each stage
+
+    Raises:
+        `BatchFileIngestionFailedError`: If any of the items
+            failed validation. This is raised after
+            the valid items have been ingested.
+
+    """
+    dtos = []
+    failed_file_names: list[str] = []
+    for filename, data in items:
+        try:
+            dtos.append(Consumer(source_data=data, filename=filename).dto)
+        except (MissingFieldError, ValueError) as error:
+            logger.warning("Failed validation of %s due to %s", filename, error)
+            failed_file_names.append(filename)
+
+    timings: IngestionStageTimings = BatchConsumer(dtos=dtos).process()
+
+    if failed_file_names:
+        raise BatchFileIngestionFailedError(file_names=failed_file_names)
+
+    return timings
+
+
+def upload_batch_of_data(*, items: list[tuple[str, INCOMING_DATA_TYPE]]) -> None:
+    """Ingests the given `items` in bulk and records logs for starting and finishing points
+
+    Args:
+        items: List of (key, data) tuples.
+            Whereby the key is that of the corresponding file
+            and the data is the incoming data to be ingested
+
+    Returns:
+        None
+
+    Raises:
+        `BatchFileIngestionFailedError`: If any of the files failed,
+            detailing the keys of those files.
+            If the batch could not be written at all,
+            then the keys of all the files are given
+
+    """
+    logger.info("Uploading batch of %s No. files", len(items))
+
+    try:
+        # Drop folder names, eg "my_file.json" instead
+        # of "in/2026/04/my_file.json"
+        batch_data_ingester(items=((Path(key).name, data) for key, data in items))
+    except BatchFileIngestionFailedError as error:
+        failed_keys = [key for key, _ in items if Path(key).name in error.file_names]
+        raise BatchFileIngestionFailedError(file_names=failed_keys) from error
+    except Exception as error:
+        logger.warning("Failed upload of batch due to %s", error)
+        raise BatchFileIngestionFailedError(
+            file_names=[key for key, _ in items]
+        ) from error
+
+    logger.info("Completed ingestion of batch of %s No. files", len(items))
+
+
+def _upload_data_as_files_in_batches(
+    *, filepaths: list[Path], files_per_batch: int = DEFAULT_FILES_PER_BATCH
+) -> None:
+    """Reads and uploads data from the given JSON files, `files_per_batch` files at a time.
+
+    Notes:
+        Upload will continue onto the next batch
+        if any of the files in a batch fail validation.
+        The failed files from all batches are then raised at the end.
+
+    Raises:
+        `BatchFileIngestionFailedError`: If any of the files failed validation
+
+    """
+    failed_file_names: list[str] = []
+    for start_index in range(0, len(filepaths), files_per_batch):
+        batch_of_filepaths = filepaths[start_index : start_index + files_per_batch]
+        logger.info("Uploading batch of %s No. files", len(batch_of_filepaths))
+
+        try:
+            batch_data_ingester(
+                items=(
+                    (filepath.name, json.loads(filepath.read_text(encoding="utf-8")))
+                    for filepath in batch_of_filepaths
+                )
+            )
+        except BatchFileIngestionFailedError as error:
+            failed_file_names += error.file_names
+
+    if failed_file_names:
+        raise BatchFileIngestionFailedError(file_names=failed_file_names)
@@ -52,6 +52,18 @@ class MetricsAPIInterface:
     def get_api_timeseries_manager():
         return api_models.APITimeSeries.objects
 
+    @staticmethod
+    def get_api_timeseries_dimension_manager():
+        return api_models.APITimeSeriesDimension.objects
+
+    @staticmethod
+    def get_core_timeseries_current_view_manager():
+        return core_models.CoreTimeSeriesCurrentView.objects
+
+    @staticmethod
+    def get_api_timeseries_current_view_manager():
+        return api_models.APITimeSeriesCurrentView.objects
+
     @staticmethod
     def get_time_period_enum() -> TimePeriod:
         return TimePeriod
@@ -1,6 +1,18 @@
-from django.db import models
+import datetime
+import io
+from collections.abc import Iterable
+
+from django.db import connections, models, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+import config
 
 DEFAULT_BATCH_SIZE = 100
+DEFAULT_COPY_CHUNK_SIZE = 10_000
+POSTGRESQL_VENDOR = "postgresql"
+
+# Representation of a `NULL` value in the `COPY` text format
+COPY_NULL_VALUE = r"\N"
 
 
 def create_records(
@@ -8,9 +20,16 @@ def create_records(
     model_instances: list[models.Model],
     model_manager: models.Manager,
     batch_size: int = DEFAULT_BATCH_SIZE,
+    copy_writes_enabled: bool = config.INGESTION_COPY_WRITES_ENABLED,
 ) -> None:
     """Writes records to the database from the list of `model_instances`
 
+    Notes:
+        If `copy_writes_enabled` is True and the database is PostgreSQL,
+        then the records are written with `copy_records()`.
+        Otherwise, the records are written with batched `INSERT` statements.
+        In both cases, records which conflict with existing records are ignored.
+
     Args:
         model_instances: A list of enriched model instances
             which are ready to be written to the database
@@ -19,13 +38,153 @@ def create_records(
         batch_size: Controls the number of objects created
             in a single write query to the database.
             Defaults to 100.
+        copy_writes_enabled: Switch to write the records
+            via PostgreSQL `COPY` where possible.
+            Defaults to the `INGESTION_COPY_WRITES_ENABLED` config value.
 
     Returns:
         None
 
     """
+    if copy_writes_enabled and _supports_copy(model_manager=model_manager):
+        copy_records(model_instances=model_instances, model_manager=model_manager)
+        return
+
     model_manager.bulk_create(
         objs=model_instances,
         ignore_conflicts=True,
         batch_size=batch_size,
     )
+
+
+def _supports_copy(*, model_manager: models.Manager) -> bool:
+    return connections[model_manager.db].vendor == POSTGRESQL_VENDOR
+
+
+def copy_records(
+    *,
+    model_instances: Iterable[models.Model],
+    model_manager: models.Manager,
+    chunk_size: int = DEFAULT_COPY_CHUNK_SIZE,
+) -> None:
+    """Writes records to a PostgreSQL database by streaming them into a staging table with `COPY`
+
+    Notes:
+        The rows are streamed in chunks of `chunk_size` into a temporary staging table,
+        which has the same columns as the target table but no constraints.
+        The staging table is then merged into the target table
+        with `INSERT ... ON CONFLICT DO NOTHING`.
+        This matches the behaviour of `bulk_create(ignore_conflicts=True)`,
+        in that any rows which conflict with existing records are ignored.
+
+        All of this happens within a single transaction,
+        so either all of the rows are merged or none of them are.
+
+    Args:
+        model_instances: The enriched model instances
+            which are ready to be written to the database
+        model_manager: The model manager associated
+            with the target table of the `model_instances`
+        chunk_size: The number of rows to buffer in memory
+            before they are sent to the staging table.
+            Defaults to 10,000.
+
+    Returns:
+        None
+
+    """
+    model_options = model_manager.model._meta  # noqa: SLF001
+    connection: BaseDatabaseWrapper = connections[model_manager.db]
+    quote_name = connection.ops.quote_name
+
+    fields = [field for field in model_options.concrete_fields if not field.primary_key]
+    columns = ", ".join(quote_name(field.column) for field in fields)
+    target_table = quote_name(model_options.db_table)
+    staging_table = quote_name(f"{model_options.db_table}_staging")
+
+    with transaction.atomic(using=model_manager.db), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {staging_table} ON COMMIT DROP AS "  # noqa: S608
+            f"SELECT {columns} FROM {target_table} WITH NO DATA"
+        )
+
+        buffer = io.StringIO()
+        number_of_buffered_rows = 0
+        for model_instance in model_instances:
+            buffer.write(
+                _serialize_row(
+                    model_instance=model_instance, fields=fields, connection=connection
+                )
+            )
+            number_of_buffered_rows += 1
+
+            if number_of_buffered_rows == chunk_size:
+                _copy_buffer(
+                    cursor=cursor, buffer=buffer, table=staging_table, columns=columns
+                )
+                buffer = io.StringIO()
+                number_of_buffered_rows = 0
+
+        if number_of_buffered_rows:
+            _copy_buffer(
+                cursor=cursor, buffer=buffer, table=staging_table, columns=columns
+            )
+
+        cursor.execute(
+            f"INSERT INTO {target_table} ({columns}) "  # noqa: S608
+            f"SELECT {columns} FROM {staging_table} "
+            "ON CONFLICT DO NOTHING"
+        )
+        # The staging table would otherwise only be dropped when the outermost transaction is committed.
+        # Which would prevent another call for the same table within that transaction.
+        cursor.execute(f"DROP TABLE {staging_table}")
+
+
+def _copy_buffer(*, cursor, buffer: io.StringIO, table: str, columns: str) -> None:
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN", buffer)
+
+
+def _serialize_row(
+    *,
+    model_instance: models.Model,
+    fields: list[models.Field],
+    connection: BaseDatabaseWrapper,
+) -> str:
+    values = (
+        field.get_db_prep_save(
+            getattr(model_instance, field.attname), connection=connection
+        )
+        for field in fields
+    )
+    return "\t".join(_serialize_value(value=value) for value in values) + "\n"
+
+
+def _serialize_value(*, value) -> str:
+    """Serializes the given `value` into the PostgreSQL `COPY` text format
+
+    Args:
+        value: The database-ready value of a single column
+
+    Returns:
+        The string representation of the `value`.
+        With `NULL` represented as `\\N`
+        and any backslashes, tabs and newlines escaped.
+
+    """
+    if value is None:
+        return COPY_NULL_VALUE
+
+    if isinstance(value, bool):
+        return "t" if value else "f"
+
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
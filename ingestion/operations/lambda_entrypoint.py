@@ -1,4 +1,5 @@
 import base64
+import io
 import json
 
 import django
@@ -6,10 +7,13 @@ import django
 django.setup()
 
 
-from ingestion.file_ingestion import INCOMING_DATA_TYPE  # noqa: E402
+import config  # noqa: E402
+from ingestion.operations.payload_stream import PayloadStreamReader  # noqa: E402
 from ingestion.operations.upload import (  # noqa: E402
+    ingest_batch_of_data_and_post_process,
     ingest_data_and_post_process,
 )
+from ingestion.utils.type_hints import INCOMING_DATA_TYPE  # noqa: E402
 
 
 def decode_base64(*, encoded: bytes) -> str:
@@ -27,26 +31,40 @@ def decode_base64(*, encoded: bytes) -> str:
     return decoded_bytes.decode("utf-8")
 
 
-def deserialize_json(*, serialized: str) -> dict:
+def extract_contents_from_record(*, record: dict) -> tuple[str, PayloadStreamReader]:
     """
-    Deserializes the given JSON string to a Python object
+    Extracts the "name" and a reader for the "data" from the given `record`
+
+    Notes:
+        The `record` refers to a Kinesis data stream record.
+        The "data" is not deserialized up front,
+        instead it is read incrementally via the returned `PayloadStreamReader`
 
     Args:
-        serialized: The serialized JSON string
+        record: The incoming Kinesis data stream record
 
     Returns:
-        The deserialized Python object representation
-            of the given `serialized` JSON strong
+        Tuple containing the following:
+        1) The "name" of the file,
+            written to the data of the record
+        2) A `PayloadStreamReader` for the "data" of the contents,
+            written to the data of the record
     """
-    return json.loads(serialized)
+    decoded_string: str = decode_base64(encoded=record["kinesis"]["data"])
+    stream = io.StringIO(decoded_string)
+
+    name: str = PayloadStreamReader(stream=stream).read_value(key="name")
+    return name, PayloadStreamReader(stream=stream, payload_key="data")
 
 
-def extract_contents_from_record(*, record: dict) -> tuple[str, INCOMING_DATA_TYPE]:
+def extract_data_from_record(*, record: dict) -> tuple[str, INCOMING_DATA_TYPE]:
     """
-    Extracts the "name" and the "data" from the given `record`
+    Extracts the "name" and the deserialized "data" from the given `record`
 
     Notes:
-        The `record` refers to a Kinesis data stream record
+        Unlike `extract_contents_from_record()`,
+        the "data" is deserialized in full up front.
+        This is used when the records are ingested in bulk
 
     Args:
         record: The incoming Kinesis data stream record
@@ -59,9 +77,7 @@ def extract_contents_from_record(*, record: dict) -> tuple[str, INCOMING_DATA_TY
             written to the data of the record
     """
     decoded_string: str = decode_base64(encoded=record["kinesis"]["data"])
-    message: dict[str, str | INCOMING_DATA_TYPE] = deserialize_json(
-        serialized=decoded_string
-    )
+    message: dict = json.loads(decoded_string)
     return message["name"], message["data"]
 
 
@@ -69,6 +85,11 @@ def handler(event, context) -> None:
     """
     Consumes incoming lambda events subscribing to the data stream
 
+    Notes:
+        If `INGESTION_BATCH_MODE_ENABLED` is set,
+        then all the records in the event are ingested in bulk.
+        Otherwise, each record is ingested 1 at a time
+
     Args:
         event: The lambda event provided by the AWS runtime.
             This contains the messages which are to be ingested
@@ -79,6 +100,11 @@ def handler(event, context) -> None:
     """
     records: list[dict] = event["Records"]
 
+    if config.INGESTION_BATCH_MODE_ENABLED:
+        items = [extract_data_from_record(record=record) for record in records]
+        ingest_batch_of_data_and_post_process(items=items)
+        return
+
     for record in records:
-        key, inbound_data = extract_contents_from_record(record=record)
-        ingest_data_and_post_process(data=inbound_data, key=key)
+        key, reader = extract_contents_from_record(record=record)
+        ingest_data_and_post_process(reader=reader, key=key)
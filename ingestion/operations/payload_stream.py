@@ -0,0 +1,304 @@
+import json
+import re
+from collections.abc import Iterator
+from typing import Any, TextIO
+
+from validation.data_transfer_models.base import MissingFieldError
+
+DEFAULT_READ_SIZE = 64 * 1024
+STREAMED_ARRAY_KEYS = frozenset({"time_series", "data"})
+
+_WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARACTERS_PATTERN = re.compile(r"[0-9+\-.eE]*")
+
+
+class MalformedPayloadError(ValueError):
+    def __init__(self, *, reason: str):
+        message = f"The inbound payload is not valid JSON: {reason}"
+        super().__init__(message)
+
+
+class _JSONStream:
+    """Incrementally tokenizes the JSON document in the given `stream`
+
+    Notes:
+        Only a window of the `stream` is held in memory at any one time.
+        Objects and arrays are walked member by member,
+        whilst each individual value is decoded with the C-accelerated `json` decoder.
+
+    """
+
+    def __init__(self, *, stream: TextIO, read_size: int):
+        self._stream = stream
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._is_exhausted = False
+
+    def _read_more(self) -> bool:
+        chunk: str = self._stream.read(self._read_size)
+        if not chunk:
+            self._is_exhausted = True
+            return False
+
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            self._position = _WHITESPACE_PATTERN.match(
+                self._buffer, self._position
+            ).end()
+            if self._position < len(self._buffer) or not self._read_more():
+                return
+
+    def _peek(self) -> str:
+        self._skip_whitespace()
+        try:
+            return self._buffer[self._position]
+        except IndexError as error:
+            raise MalformedPayloadError(reason="unexpected end of payload") from error
+
+    def _consume(self, *, character: str) -> None:
+        found_character: str = self._peek()
+        if found_character != character:
+            raise MalformedPayloadError(
+                reason=f"expected `{character}` but found `{found_character}`"
+            )
+        self._position += 1
+
+    def is_next_value_an_array(self) -> bool:
+        return self._peek() == "["
+
+    def decode_value(self) -> Any:
+        """Decodes and returns the entire value at the current position"""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as error:
+                if self._read_more():
+                    continue
+                raise MalformedPayloadError(reason=error.msg) from error
+
+            # A number which is followed by nothing but number characters
+            # up to the end of the buffer may have been cut short by the read.
+            # e.g. `12` of `123` or `1` of `1.75` when the buffer ends at `1.`
+            if self._is_number(value=value) and self._read_more_if_number_is_cut_short(
+                end=end
+            ):
+                continue
+
+            self._position = end
+            return value
+
+    @staticmethod
+    def _is_number(*, value: Any) -> bool:
+        return isinstance(value, int | float) and not isinstance(value, bool)
+
+    def _read_more_if_number_is_cut_short(self, *, end: int) -> bool:
+        end_of_number_characters: int = _NUMBER_CHARACTERS_PATTERN.match(
+            self._buffer, end
+        ).end()
+        if end_of_number_characters < len(self._buffer):
+            return False
+        return self._read_more()
+
+    def skip_value(self) -> None:
+        """Moves past the value at the current position, without holding all of it in memory"""
+        next_character: str = self._peek()
+
+        if next_character == "{":
+            for _ in self.iterate_object():
+                self.skip_value()
+            return
+
+        if next_character == "[":
+            for _ in self.iterate_array():
+                self.decode_value()
+            return
+
+        self.decode_value()
+
+    def iterate_object(self) -> Iterator[str]:
+        """Yields each key of the object at the current position
+
+        Notes:
+            After each key is yielded, the stream is positioned at the corresponding value.
+            The caller must consume that value before asking for the next key.
+
+        """
+        self._consume(character="{")
+        if self._peek() == "}":
+            self._position += 1
+            return
+
+        while True:
+            key = self.decode_value()
+            if not isinstance(key, str):
+                raise MalformedPayloadError(reason=f"expected a key but found `{key}`")
+            self._consume(character=":")
+
+            yield key
+
+            if self._peek() == "}":
+                self._position += 1
+                return
+            self._consume(character=",")
+
+    def iterate_array(self) -> Iterator[None]:
+        """Yields once per item of the array at the current position
+
+        Notes:
+            After each yield, the stream is positioned at the corresponding item.
+            The caller must consume that item before asking for the next one.
+
+        """
+        self._consume(character="[")
+        if self._peek() == "]":
+            self._position += 1
+            return
+
+        while True:
+            yield
+
+            if self._peek() == "]":
+                self._position += 1
+                return
+            self._consume(character=",")
+
+
+class PayloadStreamReader:
+    """Reads an inbound payload from a text stream, without holding all of its items in memory at once
+
+    Notes:
+    ------
+    The top-level fields of a payload do not have to precede
+    the `time_series` or `data` array.
+    e.g. `refresh_date` is typically written after the array.
+    So the stream is read in 2 passes:
+        a) `read_header()` reads all the top-level fields,
+            skipping over the items of the `time_series` / `data` array.
+        b) `iterate_items()` yields the items of the array 1 at a time.
+
+    As such, the given `stream` must be seekable.
+
+    Parameters:
+    -----------
+    stream : TextIO
+        The seekable text stream containing the JSON payload
+    payload_key : str | None
+        The key of the payload within the top-level JSON object.
+        e.g. "data" for a message of the form `{"name": ..., "data": {...}}`.
+        If not provided, the top-level JSON object is treated as the payload.
+    read_size : int
+        The number of characters to read from the `stream` at a time.
+        Defaults to `DEFAULT_READ_SIZE`
+
+    """
+
+    def __init__(
+        self,
+        *,
+        stream: TextIO,
+        payload_key: str | None = None,
+        read_size: int = DEFAULT_READ_SIZE,
+    ):
+        self._stream = stream
+        self._payload_key = payload_key
+        self._read_size = read_size
+        self.streamed_array_keys: set[str] = set()
+
+    def _open_json_stream(self) -> _JSONStream:
+        self._stream.seek(0)
+        return _JSONStream(stream=self._stream, read_size=self._read_size)
+
+    def _iterate_payload_fields(self) -> Iterator[tuple[str, _JSONStream]]:
+        json_stream = self._open_json_stream()
+
+        if self._payload_key is None:
+            for key in json_stream.iterate_object():
+                yield key, json_stream
+            return
+
+        for key in json_stream.iterate_object():
+            if key == self._payload_key:
+                for payload_key in json_stream.iterate_object():
+                    yield payload_key, json_stream
+                return
+
+            json_stream.skip_value()
+
+        raise MissingFieldError(field=self._payload_key)
+
+    def read_value(self, *, key: str) -> Any:
+        """Returns the value of the given `key` from the top-level JSON object
+
+        Notes:
+            This reads from the top-level JSON object,
+            regardless of the `payload_key` of this reader.
+
+        Args:
+            key: The key of the value to be read
+
+        Returns:
+            The decoded value
+
+        Raises:
+            `MissingFieldError`: If the `key` could not be found
+
+        """
+        json_stream = self._open_json_stream()
+
+        for found_key in json_stream.iterate_object():
+            if found_key == key:
+                return json_stream.decode_value()
+            json_stream.skip_value()
+
+        raise MissingFieldError(field=key)
+
+    def read_header(self) -> dict[str, Any]:
+        """Returns all the fields of the payload, except for the items of the `time_series` / `data` array
+
+        Notes:
+            The keys of any arrays which were skipped
+            are recorded on the `streamed_array_keys` attribute.
+            These can then be read with `iterate_items()`
+
+        Returns:
+            Dict of the top-level fields of the payload
+
+        """
+        header = {}
+        self.streamed_array_keys = set()
+
+        for key, json_stream in self._iterate_payload_fields():
+            if key in STREAMED_ARRAY_KEYS and json_stream.is_next_value_an_array():
+                json_stream.skip_value()
+                self.streamed_array_keys.add(key)
+                continue
+
+            header[key] = json_stream.decode_value()
+
+        return header
+
+    def iterate_items(self, *, key: str) -> Iterator[dict[str, Any]]:
+        """Yields the items of the array of the given `key` 1 at a time
+
+        Args:
+            key: The key of the array within the payload.
+                E.g. "time_series" or "data"
+
+        Returns:
+            Iterator of the decoded items
+
+        """
+        for found_key, json_stream in self._iterate_payload_fields():
+            if found_key == key and json_stream.is_next_value_an_array():
+                for _ in json_stream.iterate_array():
+                    yield json_stream.decode_value()
+                return
+
+            json_stream.skip_value()
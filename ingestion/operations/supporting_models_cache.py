@@ -0,0 +1,264 @@
+import logging
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+from django.db.models import Manager, Q
+
+from ingestion.data_transfer_models.headline import HeadlineDTO
+from ingestion.data_transfer_models.time_series import TimeSeriesDTO
+from ingestion.metrics_interface.interface import MetricsAPIInterface
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THEME_MANAGER = MetricsAPIInterface.get_theme_manager()
+DEFAULT_SUB_THEME_MANAGER = MetricsAPIInterface.get_sub_theme_manager()
+DEFAULT_TOPIC_MANAGER = MetricsAPIInterface.get_topic_manager()
+DEFAULT_METRIC_GROUP_MANAGER = MetricsAPIInterface.get_metric_group_manager()
+DEFAULT_METRIC_MANAGER = MetricsAPIInterface.get_metric_manager()
+DEFAULT_GEOGRAPHY_TYPE_MANAGER = MetricsAPIInterface.get_geography_type_manager()
+DEFAULT_GEOGRAPHY_MANAGER = MetricsAPIInterface.get_geography_manager()
+DEFAULT_AGE_MANAGER = MetricsAPIInterface.get_age_manager()
+DEFAULT_STRATUM_MANAGER = MetricsAPIInterface.get_stratum_manager()
+
+SUPPORTING_MODEL_KEY_TYPE = tuple[str | int | None, ...]
+DTO_TYPE = HeadlineDTO | TimeSeriesDTO
+
+
+class SupportingModelsLookup(NamedTuple):
+    metric_id: int
+    geography_id: int
+    stratum_id: int
+    age_id: int
+
+
+class SupportingModelResolutionError(Exception):
+    def __init__(self, *, model_name: str, keys: Iterable[SUPPORTING_MODEL_KEY_TYPE]):
+        message = (
+            f"Could not resolve `{model_name}` records for {sorted(keys, key=str)}"
+        )
+        super().__init__(message)
+
+
+class _SupportingModelSpec(NamedTuple):
+    """Describes how a supporting model is keyed and how to derive that key for a given DTO"""
+
+    name: str
+    manager: Manager
+    key_fields: tuple[str, ...]
+    build_key: Callable[[DTO_TYPE, dict[str, int]], SUPPORTING_MODEL_KEY_TYPE]
+
+
+class SupportingModelsCache:
+    """Process-wide lookup of supporting model IDs, keyed by the same fields used to `get_or_create()` them
+
+    Notes:
+        The cache is warmed with a single query per table.
+        Thereafter, the supporting models for a collection of DTOs
+        are resolved one table at a time, so that any records
+        which have not been seen before are inserted with 1 bulk write
+        and fetched back with 1 read per table.
+
+        Supporting models are resolved in dependency order.
+        i.e. the `Theme` ID is needed to key the `SubTheme`,
+        which in turn is needed to key the `Topic` etc.
+
+        The cached IDs are only valid for as long as the underlying records exist.
+        If the supporting tables are cleared then `clear()` must be called.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        theme_manager: Manager = DEFAULT_THEME_MANAGER,
+        sub_theme_manager: Manager = DEFAULT_SUB_THEME_MANAGER,
+        topic_manager: Manager = DEFAULT_TOPIC_MANAGER,
+        metric_group_manager: Manager = DEFAULT_METRIC_GROUP_MANAGER,
+        metric_manager: Manager = DEFAULT_METRIC_MANAGER,
+        geography_type_manager: Manager = DEFAULT_GEOGRAPHY_TYPE_MANAGER,
+        geography_manager: Manager = DEFAULT_GEOGRAPHY_MANAGER,
+        age_manager: Manager = DEFAULT_AGE_MANAGER,
+        stratum_manager: Manager = DEFAULT_STRATUM_MANAGER,
+    ):
+        self._specs: tuple[_SupportingModelSpec, ...] = (
+            _SupportingModelSpec(
+                name="theme",
+                manager=theme_manager,
+                key_fields=("name",),
+                build_key=lambda dto, ids: (dto.parent_theme,),
+            ),
+            _SupportingModelSpec(
+                name="sub_theme",
+                manager=sub_theme_manager,
+                key_fields=("name", "theme_id"),
+                build_key=lambda dto, ids: (dto.child_theme, ids["theme"]),
+            ),
+            _SupportingModelSpec(
+                name="topic",
+                manager=topic_manager,
+                key_fields=("name", "sub_theme_id"),
+                build_key=lambda dto, ids: (dto.topic, ids["sub_theme"]),
+            ),
+            _SupportingModelSpec(
+                name="geography_type",
+                manager=geography_type_manager,
+                key_fields=("name",),
+                build_key=lambda dto, ids: (dto.geography_type,),
+            ),
+            _SupportingModelSpec(
+                name="geography",
+                manager=geography_manager,
+                key_fields=("name", "geography_code", "geography_type_id"),
+                build_key=lambda dto, ids: (
+                    dto.geography,
+                    dto.geography_code,
+                    ids["geography_type"],
+                ),
+            ),
+            _SupportingModelSpec(
+                name="metric_group",
+                manager=metric_group_manager,
+                key_fields=("name", "topic_id"),
+                build_key=lambda dto, ids: (dto.metric_group, ids["topic"]),
+            ),
+            _SupportingModelSpec(
+                name="metric",
+                manager=metric_manager,
+                key_fields=("name", "metric_group_id", "topic_id"),
+                build_key=lambda dto, ids: (
+                    dto.metric,
+                    ids["metric_group"],
+                    ids["topic"],
+                ),
+            ),
+            _SupportingModelSpec(
+                name="stratum",
+                manager=stratum_manager,
+                key_fields=("name",),
+                build_key=lambda dto, ids: (dto.stratum,),
+            ),
+            _SupportingModelSpec(
+                name="age",
+                manager=age_manager,
+                key_fields=("name",),
+                build_key=lambda dto, ids: (dto.age,),
+            ),
+        )
+        self._ids: dict[str, dict[SUPPORTING_MODEL_KEY_TYPE, int]] = {
+            spec.name: {} for spec in self._specs
+        }
+        self.is_warm = False
+
+    def clear(self) -> None:
+        """Drops all cached IDs, the next call to `warm()` will re-read each table"""
+        for cached_ids in self._ids.values():
+            cached_ids.clear()
+        self.is_warm = False
+
+    def warm(self) -> None:
+        """Loads the IDs of every existing supporting model with 1 query per table
+
+        Returns:
+            None
+
+        """
+        for spec in self._specs:
+            self._ids[spec.name].update(self._fetch_ids(spec=spec))
+
+        self.is_warm = True
+
+    def resolve(self, *, dtos: Iterable[DTO_TYPE]) -> list[SupportingModelsLookup]:
+        """Resolves the supporting model IDs for each of the given `dtos`, creating any missing records in bulk
+
+        Args:
+            dtos: The `HeadlineDTO` and/or `TimeSeriesDTO` models
+                to resolve the supporting models for
+
+        Returns:
+            List of `SupportingModelsLookup` named tuples,
+            in the same order as the given `dtos`
+
+        Raises:
+            `SupportingModelResolutionError`: If a record could not
+                be read back after being written.
+                This happens when the new record conflicts with
+                an existing one on a unique constraint
+                which is not part of the lookup key.
+                e.g. a known `Geography` name with a different code.
+
+        """
+        dtos = list(dtos)
+        resolved_ids: list[dict[str, int]] = [{} for _ in dtos]
+
+        for spec in self._specs:
+            keys = [
+                spec.build_key(dto, ids)
+                for dto, ids in zip(dtos, resolved_ids, strict=True)
+            ]
+            self._create_missing_records(spec=spec, keys=set(keys))
+
+            cached_ids = self._ids[spec.name]
+            for ids, key in zip(resolved_ids, keys, strict=True):
+                ids[spec.name] = cached_ids[key]
+
+        return [
+            SupportingModelsLookup(
+                metric_id=ids["metric"],
+                geography_id=ids["geography"],
+                stratum_id=ids["stratum"],
+                age_id=ids["age"],
+            )
+            for ids in resolved_ids
+        ]
+
+    def _create_missing_records(
+        self, *, spec: _SupportingModelSpec, keys: set[SUPPORTING_MODEL_KEY_TYPE]
+    ) -> None:
+        cached_ids = self._ids[spec.name]
+        missing_keys = keys - cached_ids.keys()
+        if not missing_keys:
+            return
+
+        # Another process may have created some of these records since the cache was warmed.
+        # In which case the conflicting inserts are skipped, and the existing IDs are read back below
+        spec.manager.bulk_create(
+            objs=[
+                spec.manager.model(**dict(zip(spec.key_fields, key, strict=True)))
+                for key in missing_keys
+            ],
+            ignore_conflicts=True,
+        )
+
+        missing_keys_filter = Q()
+        for key in missing_keys:
+            missing_keys_filter |= Q(**dict(zip(spec.key_fields, key, strict=True)))
+
+        cached_ids.update(self._fetch_ids(spec=spec, filters=missing_keys_filter))
+
+        unresolved_keys = missing_keys - cached_ids.keys()
+        if unresolved_keys:
+            raise SupportingModelResolutionError(
+                model_name=spec.manager.model.__name__, keys=unresolved_keys
+            )
+
+        logger.info(
+            "Created %s No. `%s` records",
+            len(missing_keys),
+            spec.manager.model.__name__,
+        )
+
+    @staticmethod
+    def _fetch_ids(
+        *, spec: _SupportingModelSpec, filters: Q | None = None
+    ) -> dict[SUPPORTING_MODEL_KEY_TYPE, int]:
+        queryset = spec.manager.all()
+        if filters is not None:
+            queryset = queryset.filter(filters)
+
+        return {
+            tuple(row[1:]): row[0]
+            for row in queryset.values_list("id", *spec.key_fields)
+        }
+
+
+SUPPORTING_MODELS_CACHE = SupportingModelsCache()
@@ -4,9 +4,13 @@ from pathlib import Path
 
 from django.db import models
 
-from ingestion.file_ingestion import _upload_data_as_file
+from ingestion.file_ingestion import (
+    _upload_data_as_file,
+    _upload_data_as_files_in_batches,
+)
 from ingestion.metrics_interface.interface import MetricsAPIInterface
 from ingestion.operations.concurrency import run_with_multiple_processes
+from ingestion.operations.supporting_models_cache import SUPPORTING_MODELS_CACHE
 from metrics.api.settings import ROOT_LEVEL_BASE_DIR
 
 """
@@ -33,8 +37,11 @@ def collect_all_metric_model_managers() -> tuple[models.Manager, ...]:
     """Collects all model managers associated with the metrics app"""
     return (
         MetricsAPIInterface.get_core_headline_manager(),
+        MetricsAPIInterface.get_core_timeseries_current_view_manager(),
+        MetricsAPIInterface.get_api_timeseries_current_view_manager(),
         MetricsAPIInterface.get_core_timeseries_manager(),
         MetricsAPIInterface.get_api_timeseries_manager(),
+        MetricsAPIInterface.get_api_timeseries_dimension_manager(),
         MetricsAPIInterface.get_metric_manager(),
         MetricsAPIInterface.get_metric_group_manager(),
         MetricsAPIInterface.get_age_manager(),
@@ -64,7 +71,10 @@ def clear_metrics_tables() -> None:
             - Stratum
             - CoreHeadline
             - CoreTimeSeries
+            - CoreTimeSeriesCurrentView
             - APITimeSeries
+            - APITimeSeriesCurrentView
+            - APITimeSeriesDimension
 
     Returns:
          None
@@ -76,10 +86,15 @@ def clear_metrics_tables() -> None:
         logger.info("Deleting records of %s", model_manager.model.__name__)
         model_manager.all().delete()
 
+    # The cached supporting model IDs now point at deleted records
+    SUPPORTING_MODELS_CACHE.clear()
+
     logger.info("Completed deleting existing metrics records")
 
 
-def upload_truncated_test_data(*, multiprocessing_enabled: bool = True) -> None:
+def upload_truncated_test_data(
+    *, multiprocessing_enabled: bool = True, batch_ingestion_enabled: bool = False
+) -> None:
     """Uploads the truncated test data set to the database after clearing existing metrics records
 
     Args:
@@ -87,6 +102,9 @@ def upload_truncated_test_data(*, multiprocessing_enabled: bool = True) -> None:
             by making use of N processes on the current machine.
             Whereby the N == No. of cores on the current machine.
             Otherwise, upload synchronously.
+        batch_ingestion_enabled: Whether to upload the truncated test data
+            in batches of files within a single process.
+            Takes precedence over `multiprocessing_enabled`.
 
     Notes:
         This will create records for all `CoreHeadline`, `CoreTimeSeries`
@@ -104,7 +122,9 @@ def upload_truncated_test_data(*, multiprocessing_enabled: bool = True) -> None:
 
     test_source_data_file_paths: list[Path] = _gather_test_data_source_file_paths()
 
-    if multiprocessing_enabled:
+    if batch_ingestion_enabled:
+        _upload_data_as_files_in_batches(filepaths=test_source_data_file_paths)
+    elif multiprocessing_enabled:
         run_with_multiple_processes(
             upload_function=_upload_data_as_file, items=test_source_data_file_paths
         )
@@ -4,26 +4,29 @@ from pathlib import Path
 
 from ingestion.aws_client import AWSClient
 from ingestion.file_ingestion import (
-    INCOMING_DATA_TYPE,
+    BatchFileIngestionFailedError,
     FileIngestionFailedError,
     _upload_data_as_file,
-    upload_data,
+    upload_batch_of_data,
+    upload_data_stream,
 )
+from ingestion.operations.payload_stream import PayloadStreamReader
+from ingestion.utils.type_hints import INCOMING_DATA_TYPE
 
 logger = logging.getLogger(__name__)
 
 
 def ingest_data_and_post_process(
-    *, data: INCOMING_DATA_TYPE, key: str, client: AWSClient | None = None
+    *, reader: PayloadStreamReader, key: str, client: AWSClient | None = None
 ) -> None:
-    """Ingests the data and moves the file of the given `key` to the appropriate outbound folder in the s3 bucket
+    """Ingests the payload from the `reader` and moves the file of the given `key` to the appropriate outbound folder in the s3 bucket
 
     Notes:
         If the ingest of data fails
         then the file will be moved to the `failed/` folder
 
     Args:
-        data: The inbound data to be ingested
+        reader: The `PayloadStreamReader` for the inbound data to be ingested
         key: The key of the item to be processed
         client: The `AWSClient` used to interact with s3.
             If not provided, the `AWSClient` will be initialized
@@ -34,13 +37,49 @@ def ingest_data_and_post_process(
     """
     client = client or AWSClient()
     try:
-        upload_data(data=data, key=key)
+        upload_data_stream(reader=reader, key=key)
     except FileIngestionFailedError:
         return client.move_file_to_failed_folder(key=key)
 
     return client.move_file_to_processed_folder(key=key)
 
 
+def ingest_batch_of_data_and_post_process(
+    *,
+    items: list[tuple[str, INCOMING_DATA_TYPE]],
+    client: AWSClient | None = None,
+) -> None:
+    """Ingests the given `items` in bulk and moves each corresponding file to the appropriate outbound folder in the s3 bucket
+
+    Notes:
+        Files which fail to be ingested
+        will be moved to the `failed/` folder.
+        The remaining files will be moved to the `processed/` folder
+
+    Args:
+        items: List of (key, data) tuples
+            for each of the inbound files to be ingested
+        client: The `AWSClient` used to interact with s3.
+            If not provided, the `AWSClient` will be initialized
+
+    Returns:
+        None
+
+    """
+    client = client or AWSClient()
+    failed_keys: list[str] = []
+    try:
+        upload_batch_of_data(items=items)
+    except BatchFileIngestionFailedError as error:
+        failed_keys = error.file_names
+
+    for key, _ in items:
+        if key in failed_keys:
+            client.move_file_to_failed_folder(key=key)
+        else:
+            client.move_file_to_processed_folder(key=key)
+
+
 def _upload_file_and_remove_local_copy(*, filepath: str) -> None:
     """Ingest the file at the given `filepath` and remove from the filesystem after uploading
 
@@ -0,0 +1,245 @@
+import itertools
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Manager
+
+import validation
+from ingestion.consumer import (
+    API_TIME_SERIES_MODEL,
+    CORE_HEADLINE_MODEL,
+    CORE_TIME_SERIES_MODEL,
+    DEFAULT_API_TIME_SERIES_DIMENSION_MANAGER,
+    Consumer,
+)
+from ingestion.data_transfer_models.handlers import (
+    build_headline_dto_from_source,
+    build_time_series_dto_from_source,
+)
+from ingestion.data_transfer_models.headline import HeadlineDTO
+from ingestion.data_transfer_models.time_series import TimeSeriesDTO
+from ingestion.metrics_interface.interface import DataSourceFileType
+from ingestion.operations.payload_stream import PayloadStreamReader
+from ingestion.operations.supporting_models_cache import SupportingModelsLookup
+
+DEFAULT_ITEMS_PER_CHUNK = 5000
+
+
+class StreamConsumer:
+    """Ingests a single inbound payload from a `PayloadStreamReader`, 1 fixed-size chunk of items at a time
+
+    Notes:
+    ------
+    Compared to a `Consumer`, the payload is never fully deserialized
+    and a complete DTO for the payload is never built.
+    Instead, the items of the `time_series` / `data` array are read
+    and validated in chunks of `items_per_chunk`,
+    with each chunk being written to the database before the next one is read.
+    So the peak memory usage is bounded by the chunk size, regardless of the payload size.
+
+    Validation which spans the entire payload is carried across chunks:
+        a) The `in_reporting_delay_period` values must only
+            contain a trailing section of True values.
+        b) The `is_public` values must all match the metric and the filename.
+
+    Stale records are cleared before the first chunk is written.
+    And the current views of the time series records are refreshed
+    after the last chunk is written.
+    The entire payload is ingested within 1 transaction.
+    So if any chunk fails validation, none of the payload is written.
+
+    Parameters:
+    -----------
+    reader : `PayloadStreamReader`
+        The reader for the inbound payload
+    filename : str
+        The source filename for the inbound payload
+    items_per_chunk : int
+        The number of items to validate and write at a time.
+        Defaults to `DEFAULT_ITEMS_PER_CHUNK`
+    core_headline_manager : `CoreHeadlineManager`
+        The model manager for `CoreHeadline`
+        Defaults to the concrete `CoreHeadlineManager` via `CoreHeadline.objects`
+    core_timeseries_manager : `CoreTimeSeriesManager`
+        The model manager for `CoreTimeSeries`
+        Defaults to the concrete `CoreTimeSeriesManager` via `CoreTimeSeries.objects`
+    api_timeseries_manager : `APITimeSeriesManager`
+        The model manager for `APITimeSeries`
+        Defaults to the concrete `APITimeSeriesManager` via `APITimeSeries.objects`
+    api_timeseries_dimension_manager : `APITimeSeriesDimensionManager`
+        The model manager for the `APITimeSeriesDimension` catalogue
+        Defaults to the concrete `APITimeSeriesDimensionManager`
+        via `APITimeSeriesDimension.objects`
+
+    """
+
+    def __init__(
+        self,
+        *,
+        reader: PayloadStreamReader,
+        filename: str,
+        items_per_chunk: int = DEFAULT_ITEMS_PER_CHUNK,
+        core_headline_manager: Manager = CORE_HEADLINE_MODEL.objects,
+        core_timeseries_manager: Manager = CORE_TIME_SERIES_MODEL.objects,
+        api_timeseries_manager: Manager = API_TIME_SERIES_MODEL.objects,
+        api_timeseries_dimension_manager: Manager = (
+            DEFAULT_API_TIME_SERIES_DIMENSION_MANAGER
+        ),
+    ):
+        self.reader = reader
+        self.filename = filename
+        self.items_per_chunk = items_per_chunk
+
+        # Model managers
+        self.core_headline_manager = core_headline_manager
+        self.core_timeseries_manager = core_timeseries_manager
+        self.api_timeseries_manager = api_timeseries_manager
+        self.api_timeseries_dimension_manager = api_timeseries_dimension_manager
+
+    def process(self) -> None:
+        """Creates the `CoreHeadline` or `CoreTimeSeries` & `APITimeSeries` records for the payload
+
+        Returns:
+            None
+
+        Raises:
+            `MissingFieldError`: If a field which was expected
+                to be found in the payload could not be found.
+            `ValidationError`: If any of the fields do not conform
+                to the underlying validation checks
+            `ValueError`: If the `in_reporting_delay_period`
+                or `is_public` values are invalid across the payload
+
+        """
+        header: dict[str, Any] = self.reader.read_header()
+        is_headline_data: bool = (
+            header.get("metric_group") == DataSourceFileType.headline.value
+        )
+
+        with transaction.atomic():
+            supporting_models_lookup: SupportingModelsLookup | None = None
+            consumer: Consumer | None = None
+
+            for dto in self._build_dtos(
+                header=header, is_headline_data=is_headline_data
+            ):
+                consumer = Consumer(
+                    dto=dto,
+                    filename=self.filename,
+                    supporting_models_lookup=supporting_models_lookup,
+                    core_headline_manager=self.core_headline_manager,
+                    core_timeseries_manager=self.core_timeseries_manager,
+                    api_timeseries_manager=self.api_timeseries_manager,
+                    api_timeseries_dimension_manager=(
+                        self.api_timeseries_dimension_manager
+                    ),
+                )
+
+                if supporting_models_lookup is None:
+                    # The supporting models are only fetched or created once for the payload
+                    supporting_models_lookup = consumer.update_supporting_models()
+                    consumer.supporting_models_lookup = supporting_models_lookup
+                    self._clear_stale_records(consumer=consumer)
+
+                if is_headline_data:
+                    consumer.create_core_headlines()
+                else:
+                    consumer.create_core_and_api_timeseries()
+
+            if consumer is not None and not is_headline_data:
+                # The series is the same for every chunk of the payload.
+                # So its current views only need to be refreshed once
+                consumer.refresh_current_timeseries()
+
+    @staticmethod
+    def _clear_stale_records(*, consumer: Consumer) -> None:
+        if consumer.is_headline_data:
+            consumer.clear_stale_headlines()
+        else:
+            consumer.clear_stale_timeseries()
+
+    def _build_dtos(
+        self, *, header: dict[str, Any], is_headline_data: bool
+    ) -> Iterator[HeadlineDTO | TimeSeriesDTO]:
+        items_key: str = "data" if is_headline_data else "time_series"
+        build_dto_function: Callable = (
+            build_headline_dto_from_source
+            if is_headline_data
+            else build_time_series_dto_from_source
+        )
+
+        if items_key not in self.reader.streamed_array_keys:
+            # The items are either missing or were not given as an array.
+            # So the DTO is built from the header alone to raise the appropriate error
+            yield build_dto_function(source_data=header, filename=self.filename)
+            return
+
+        items: Iterator[dict[str, Any]] = self.reader.iterate_items(key=items_key)
+        last_in_reporting_delay_period: bool | None = None
+
+        for chunk in self._chunk_items(items=items):
+            dto = build_dto_function(
+                source_data={**header, items_key: chunk}, filename=self.filename
+            )
+
+            if not is_headline_data:
+                last_in_reporting_delay_period = (
+                    self._validate_in_reporting_delay_period_across_chunks(
+                        dto=dto,
+                        last_in_reporting_delay_period=last_in_reporting_delay_period,
+                    )
+                )
+
+            yield dto
+
+    def _chunk_items(
+        self, *, items: Iterator[dict[str, Any]]
+    ) -> Iterator[list[dict[str, Any]]]:
+        # The first chunk is always yielded, even if it is empty.
+        # So that a payload without any items is still validated and clears stale records
+        chunk = list(itertools.islice(items, self.items_per_chunk))
+        yield chunk
+
+        while chunk := list(itertools.islice(items, self.items_per_chunk)):
+            yield chunk
+
+    @staticmethod
+    def _validate_in_reporting_delay_period_across_chunks(
+        *, dto: TimeSeriesDTO, last_in_reporting_delay_period: bool | None
+    ) -> bool | None:
+        """Validates the `in_reporting_delay_period` values of the `dto` follow on from the previous chunk
+
+        Notes:
+            Each `TimeSeriesDTO` validates its own chunk of items.
+            So only the boundary with the previous chunk needs to be checked here.
+            i.e. a chunk cannot contain False values
+            if the previous chunk ended with a True value.
+
+        Args:
+            dto: The `TimeSeriesDTO` for the current chunk
+            last_in_reporting_delay_period: The final `in_reporting_delay_period` value
+                of the previous chunks, or None if there have been none so far.
+
+        Returns:
+            The final `in_reporting_delay_period` value
+            to be carried onto the next chunk
+
+        Raises:
+            `ValueError`: If there are any True values
+                in the leading section of the payload
+
+        """
+        in_reporting_delay_period_values: list[bool] = [
+            time_series.in_reporting_delay_period for time_series in dto.time_series
+        ]
+        if last_in_reporting_delay_period is not None:
+            in_reporting_delay_period_values.insert(0, last_in_reporting_delay_period)
+
+        validation.validate_in_reporting_delay_period(
+            in_reporting_delay_period_values=in_reporting_delay_period_values
+        )
+
+        if in_reporting_delay_period_values:
+            return in_reporting_delay_period_values[-1]
+        return last_in_reporting_delay_period
@@ -24,6 +24,10 @@ class AppMode(Enum):
     def dependent_on_cache(cls) -> list[str]:
         return [cls.PRIVATE_API.value]
 
+    @classmethod
+    def dependent_on_chart_rendering(cls) -> list[str]:
+        return [cls.PRIVATE_API.value]
+
 
 class Alerts(Enum):
     ALERT_GEOGRAPHY_TYPE_NAME = "Government Office Region"
@@ -0,0 +1,27 @@
+"""Middleware for scoping the memo of permission checks to each individual request.
+
+The outcome of each permission check is memoised for the current request context,
+so that charts with several plots for the same resources only resolve them once.
+The memo is always cleared after the request completes,
+so that it cannot be carried over to the next request handled by the same thread.
+"""
+
+from django.http import HttpRequest, HttpResponse
+
+from common.auth.permissions import clear_permission_checks_memo
+
+
+class PermissionChecksMemoMiddleware:
+    """Clear the request-scoped memo of permission checks around each request."""
+
+    def __init__(self, get_response):
+        """Store the downstream callable for middleware execution."""
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Dispatch the request with an empty memo of permission checks."""
+        clear_permission_checks_memo()
+        try:
+            return self.get_response(request)
+        finally:
+            clear_permission_checks_memo()
@@ -8,6 +8,7 @@ from metrics.domain.common.utils import (
     DEFAULT_X_AXIS,
     DEFAULT_Y_AXIS,
     ChartAxisFields,
+    ChartEncodings,
 )
 
 FILE_FORMAT_CHOICES: list[str] = ["svg", "png", "jpg", "jpeg"]
@@ -106,6 +107,12 @@ class BaseChartsSerializer(serializers.Serializer):
         default=None,
         help_text=help_texts.DATA_CLASSIFICATION_FIELD,
     )
+    chart_encoding = serializers.ChoiceField(
+        choices=ChartEncodings.choices(),
+        required=False,
+        default=ChartEncodings.uri.value,
+        help_text=help_texts.CHART_ENCODING_FIELD,
+    )
 
 
 class ChartPreviewQueryParamsSerializer(serializers.Serializer):
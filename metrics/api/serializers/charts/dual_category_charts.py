@@ -13,6 +13,7 @@ from metrics.domain.common.utils import (
     DEFAULT_CHART_WIDTH,
     DEFAULT_X_AXIS,
     DEFAULT_Y_AXIS,
+    ChartEncodings,
     ChartTypes,
     DataSourceFileType,
     DEFAULT_Y_AXIS_MINIMUM_VAlUE,
@@ -144,4 +145,5 @@ class DualCategoryChartSerializer(BaseChartsSerializer):
             legend_title=self.data.get("legend_title", ""),
             is_public=is_public,
             data_classification=data_classification,
+            chart_encoding=self.data.get("chart_encoding", ChartEncodings.uri.value),
         )
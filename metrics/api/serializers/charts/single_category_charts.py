@@ -15,6 +15,7 @@ from metrics.domain.common.utils import (
     DEFAULT_CHART_WIDTH,
     DEFAULT_X_AXIS,
     DEFAULT_Y_AXIS,
+    ChartEncodings,
     ChartTypes,
     DEFAULT_Y_AXIS_MINIMUM_VAlUE,
 )
@@ -104,6 +105,7 @@ class ChartsSerializer(BaseChartsSerializer):
             confidence_colour=self.data.get("confidence_colour", ""),
             is_public=is_public,
             data_classification=data_classification,
+            chart_encoding=self.data.get("chart_encoding", ChartEncodings.uri.value),
             request=request,
         )
 
@@ -7,6 +7,7 @@ from metrics.api.serializers import help_texts
 from metrics.domain.common.utils import (
     DEFAULT_CHART_HEIGHT,
     DEFAULT_CHART_WIDTH,
+    ChartEncodings,
     DEFAULT_Y_AXIS_MINIMUM_VAlUE,
 )
 from metrics.domain.models.charts.subplot_charts import SubplotChartRequestParameters
@@ -167,6 +168,12 @@ class SubplotChartRequestSerializer(serializers.Serializer):
         default=None,
         help_text=help_texts.DATA_CLASSIFICATION_FIELD,
     )
+    chart_encoding = serializers.ChoiceField(
+        choices=ChartEncodings.choices(),
+        required=False,
+        default=ChartEncodings.uri.value,
+        help_text=help_texts.CHART_ENCODING_FIELD,
+    )
 
     chart_parameters = ChartParametersSerializer()
     subplots = SubplotsSerializer()
@@ -226,5 +233,8 @@ class SubplotChartRequestSerializer(serializers.Serializer):
             subplots=self.validated_data["subplots"],
             is_public=is_public,
             data_classification=data_classification,
+            chart_encoding=self.validated_data.get(
+                "chart_encoding", ChartEncodings.uri.value
+            ),
             request=request,
         )
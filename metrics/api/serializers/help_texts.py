@@ -108,7 +108,8 @@ CHART_LEGEND_TITLE: str = """
 An optional title to display for the legend.
 """
 ENCODED_CHARTS_RESPONSE: str = """
-The specified chart in the requested format as a URI encoded string (default format = svg)
+The specified chart in the requested format (default format = svg).
+Encoded with the requested `chart_encoding`, which defaults to a URI encoded string.
 """
 ENCODED_CHARTS_LAST_UPDATED: str = """
 The date that the chart data goes up to
@@ -136,6 +137,13 @@ IS_PUBLIC_FIELD: str = """
 Whether the chart data is intended for public display. Defaults to True.
 When False, a data classification watermark will be applied to the chart.
 """
+CHART_ENCODING_FIELD: str = """
+The encoding to apply to the chart in the response of the encoded charts endpoints.
+This can be one of the following:
+- `uri` - The SVG as a URI encoded string. This is the default.
+- `base64` - The SVG as a base64 encoded string.
+- `raw` - The SVG markup as is.
+"""
 DATA_CLASSIFICATION_FIELD: str = """
 The data classification watermark to apply on non-public charts, eg "OFFICIAL-SENSITIVE".
 """
@@ -96,6 +96,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "metrics.api.middleware.current_user.CurrentUserMiddleware",
+    "metrics.api.middleware.permissions.PermissionChecksMemoMiddleware",
     "metrics.api.middleware.preview.EmbargoMiddleware",
     "metrics.api.middleware.preview.RequestScopedCachingConfigMiddleware",
 ]
@@ -10,6 +10,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 import config
+from caching.private_api.coalescing import RequestCoalescing
 from caching.private_api.decorators import cache_response
 from metrics.api.enums import AppMode
 from metrics.api.serializers.charts import (
@@ -191,7 +192,7 @@ class DualCategoryChartsView(APIView):
 
         return Response(data=serializer.data)
 
-    @cache_response()
+    @cache_response(request_coalescing=RequestCoalescing())
     def _process_post_request_as_encoded_svg(
         self, request, *args, **kwargs
     ) -> Response:
@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 import config
+from caching.private_api.coalescing import RequestCoalescing
 from caching.private_api.decorators import cache_response
 from metrics.api.decorators.auth import require_authorisation
 from metrics.api.enums import AppMode
@@ -273,7 +274,7 @@ class EncodedChartsView(APIView):
             ),
         ],
     )
-    @cache_response()
+    @cache_response(request_coalescing=RequestCoalescing())
     @require_authorisation
     def post(cls, request, *args, **kwargs):
         """This endpoint can be used to generate charts conforming to the UK Gov Specification.
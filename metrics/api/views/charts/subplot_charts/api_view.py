@@ -7,6 +7,7 @@ from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from caching.private_api.coalescing import RequestCoalescing
 from caching.private_api.decorators import cache_response
 from metrics.api.serializers.charts.common import (
     ChartPreviewQueryParamsSerializer,
@@ -79,7 +80,7 @@ class SubplotChartsView(APIView):
             subplot_chart_parameters=subplot_chart_parameters
         )
 
-    @cache_response()
+    @cache_response(request_coalescing=RequestCoalescing())
     def _process_post_request_as_encoded_svg(
         self, request, *args, **kwargs
     ) -> Response:
@@ -1,12 +1,22 @@
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from drf_spectacular.utils import extend_schema
 from rest_framework.views import APIView
 
 from metrics.api.serializers import BulkDownloadsSerializer
 from metrics.api.views.downloads.common import DOWNLOADS_API_TAG
+from metrics.domain.bulk_downloads.archive import BulkDownloadsArchive
 from metrics.domain.bulk_downloads.get_downloads_archive import (
-    get_bulk_downloads_archive,
+    generate_zip_filename,
+    get_precomputed_bulk_downloads_archive,
+    stream_bulk_downloads_archive,
 )
+from metrics.domain.bulk_downloads.storage import (
+    BulkDownloadsStorage,
+    get_bulk_downloads_storage,
+)
+from metrics.interfaces.downloads.bulk_downloads import get_data_version_for_metrics
 
 
 class BulkDownloadsView(APIView):
@@ -21,6 +31,13 @@ class BulkDownloadsView(APIView):
         Note this endpoint will return a zipfile containing a collection of folders based on page names, each
         folder will contain a series of csv or json files named after the charts currently published on the dashboard.
 
+        The zip file is built ahead of time after each refresh of the cache and streamed back from storage.
+        The `ETag` and `Last-Modified` headers describe the contents of the zip file,
+        so conditional requests will receive a 304 Not Modified response if the contents have not changed.
+
+        If precomputed archives have been disabled, the zip file is instead built
+        and streamed back in chunks as the downloads for each page are collected.
+
         # Main errors
 
         If any of the charts fail to be retrieved a 500 server error will be returned and the file
@@ -36,12 +53,44 @@ class BulkDownloadsView(APIView):
 
         file_format = request_serializer.data["file_format"]
 
-        compressed_downloads = get_bulk_downloads_archive(file_format=file_format)
+        storage: BulkDownloadsStorage | None = get_bulk_downloads_storage()
+        if storage is not None:
+            return cls._build_response_for_precomputed_archive(
+                request=request, file_format=file_format, storage=storage
+            )
+
+        response = StreamingHttpResponse(
+            stream_bulk_downloads_archive(file_format=file_format),
+            content_type="application/zip",
+        )
+        response["Content-Disposition"] = (
+            f"attachment; filename={generate_zip_filename()}"
+        )
+        return response
+
+    @classmethod
+    def _build_response_for_precomputed_archive(
+        cls, *, request, file_format: str, storage: BulkDownloadsStorage
+    ) -> FileResponse | HttpResponse:
+        archive: BulkDownloadsArchive = get_precomputed_bulk_downloads_archive(
+            file_format=file_format,
+            storage=storage,
+            data_version_resolver=get_data_version_for_metrics,
+        )
+        etag: str = quote_etag(archive.manifest.content_hash)
+        last_modified: int = int(archive.manifest.last_modified.timestamp())
 
-        response = HttpResponse(
-            compressed_downloads["zip_file_data"], content_type="application/zip"
+        conditional_response: HttpResponse | None = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
         )
+        if conditional_response is not None:
+            archive.file.close()
+            return conditional_response
+
+        response = FileResponse(archive.file, content_type="application/zip")
         response["Content-Disposition"] = (
-            f"attachment; filename={compressed_downloads['zip_file_name']}"
+            f"attachment; filename={generate_zip_filename()}"
         )
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
         return response
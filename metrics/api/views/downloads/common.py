@@ -1 +1,28 @@
+from collections.abc import Iterator
+
+from django.http import StreamingHttpResponse
+
 DOWNLOADS_API_TAG = "downloads"
+
+
+def build_streaming_download_response(
+    *, streaming_content: Iterator[str], content_type: str, content_disposition: str
+) -> StreamingHttpResponse:
+    """Builds a response which streams the given `streaming_content` back as an attachment
+
+    Notes:
+        Streamed responses are not saved in the cache.
+
+    Args:
+        streaming_content: Iterator of the chunks of the download
+        content_type: The media type of the download. E.g. "text/csv"
+        content_disposition: The value of the `Content-Disposition` header,
+            which sets the filename of the download
+
+    Returns:
+        A `StreamingHttpResponse` for the download
+
+    """
+    response = StreamingHttpResponse(streaming_content, content_type=content_type)
+    response["Content-Disposition"] = content_disposition
+    return response
@@ -1,31 +1,42 @@
 import io
+from collections.abc import Iterator
 from http import HTTPStatus
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 
+from caching.private_api.coalescing import RequestCoalescing
 from caching.private_api.decorators import cache_response
 from metrics.api.decorators.auth import require_authorisation
 from metrics.api.serializers import DualCategoryDownloadSerializer
-from metrics.api.views.downloads.common import DOWNLOADS_API_TAG
+from metrics.api.views.downloads.common import (
+    DOWNLOADS_API_TAG,
+    build_streaming_download_response,
+)
 from metrics.api.views.downloads.single_category_downloads import (
     SingleCategoryDownloadsView,
 )
 from metrics.data.managers.core_models.headline import CoreHeadlineQuerySet
 from metrics.data.managers.core_models.time_series import CoreTimeSeriesQuerySet
 from metrics.domain.common.utils import DataSourceFileType
+from metrics.domain.exports.csv_output import FIELDS
 from metrics.domain.exports.dual_category_output import (
     build_dual_category_csv_headers,
+    iterate_pivoted_dual_category_download_rows,
     pivot_dual_category_download_rows,
+    stream_dual_category_data_to_csv,
     write_dual_category_data_to_csv,
 )
+from metrics.domain.exports.json_output import stream_json_array
 from metrics.domain.models.downloads.dual_category import (
     DualCategoryDownloadRequestParams,
 )
 from metrics.interfaces.downloads.dual_category.access import (
     get_dual_category_downloads_data,
 )
+from metrics.interfaces.downloads.streaming import should_stream_download
 from metrics.interfaces.plots.access import DataNotFoundForAnyPlotError
 
 EXAMPLE_DUAL_CATEGORY_DOWNLOAD_REQUEST_PAYLOAD = {
@@ -95,12 +106,47 @@ class DualCategoryDownloadsView(SingleCategoryDownloadsView):
             secondary_category=chart_plot_models.secondary_category,
         )
 
+    def _iterate_pivoted_queryset_data(
+        self,
+        *,
+        queryset: CoreTimeSeriesQuerySet | CoreHeadlineQuerySet,
+        chart_plot_models: DualCategoryDownloadRequestParams,
+    ) -> Iterator[dict]:
+        """Lazily serialize and pivot queryset data for a streamed dual-category download export.
+
+        Notes:
+            The merged queryset is ordered by date.
+            For any other `x_axis`, the queryset is re-ordered
+            so that all the records which share a primary axis value are adjacent
+            and can be pivoted without holding all the records in memory.
+
+        Args:
+            queryset: Merged queryset for the requested plots.
+            chart_plot_models: Validated dual-category download request parameters.
+
+        Returns:
+            Iterator of pivoted rows ready for JSON or CSV export.
+        """
+        x_axis: str = chart_plot_models.x_axis
+        if x_axis != "date":
+            queryset = queryset.order_by(FIELDS.get(x_axis, x_axis), "-date")
+
+        records = self._iterate_serialized_records(
+            queryset=queryset,
+            metric_group=chart_plot_models.metric_group,
+        )
+        return iterate_pivoted_dual_category_download_rows(
+            rows=records,
+            x_axis=x_axis,
+            secondary_category=chart_plot_models.secondary_category,
+        )
+
     def _handle_json(
         self,
         *,
         queryset: CoreTimeSeriesQuerySet | CoreHeadlineQuerySet,
         chart_plot_models: DualCategoryDownloadRequestParams,
-    ) -> Response:
+    ) -> Response | StreamingHttpResponse:
         """Return pivoted dual-category download data as a JSON attachment.
 
         Args:
@@ -109,7 +155,23 @@ class DualCategoryDownloadsView(SingleCategoryDownloadsView):
 
         Returns:
             JSON attachment response containing pivoted download rows.
+            Large timeseries downloads are streamed.
         """
+        if should_stream_download(
+            queryset=queryset, metric_group=chart_plot_models.metric_group
+        ):
+            pivoted_rows = self._iterate_pivoted_queryset_data(
+                queryset=queryset,
+                chart_plot_models=chart_plot_models,
+            )
+            return build_streaming_download_response(
+                streaming_content=stream_json_array(
+                    items=pivoted_rows, encoder_class=JSONEncoder
+                ),
+                content_type="application/json",
+                content_disposition="attachment; filename=dual_category_download.json",
+            )
+
         pivoted_rows = self._pivot_queryset_data(
             queryset=queryset,
             chart_plot_models=chart_plot_models,
@@ -126,7 +188,7 @@ class DualCategoryDownloadsView(SingleCategoryDownloadsView):
         *,
         queryset: CoreTimeSeriesQuerySet | CoreHeadlineQuerySet,
         chart_plot_models: DualCategoryDownloadRequestParams,
-    ) -> io.StringIO:
+    ) -> io.StringIO | StreamingHttpResponse:
         """Return pivoted dual-category download data as a CSV attachment.
 
         Args:
@@ -135,7 +197,31 @@ class DualCategoryDownloadsView(SingleCategoryDownloadsView):
 
         Returns:
             CSV attachment response containing pivoted download rows.
+            Large timeseries downloads are streamed.
         """
+        is_headline = DataSourceFileType[chart_plot_models.metric_group].is_headline
+        headers = build_dual_category_csv_headers(
+            is_headline=is_headline,
+            x_axis=chart_plot_models.x_axis,
+            secondary_category=chart_plot_models.secondary_category,
+            segment_secondary_values=chart_plot_models.segment_secondary_values,
+        )
+
+        if should_stream_download(
+            queryset=queryset, metric_group=chart_plot_models.metric_group
+        ):
+            pivoted_rows = self._iterate_pivoted_queryset_data(
+                queryset=queryset,
+                chart_plot_models=chart_plot_models,
+            )
+            return build_streaming_download_response(
+                streaming_content=stream_dual_category_data_to_csv(
+                    rows=pivoted_rows, headers=headers
+                ),
+                content_type="text/csv",
+                content_disposition='attachment; filename="dual_category_download.csv"',
+            )
+
         pivoted_rows = self._pivot_queryset_data(
             queryset=queryset,
             chart_plot_models=chart_plot_models,
@@ -144,13 +230,6 @@ class DualCategoryDownloadsView(SingleCategoryDownloadsView):
         response["Content-Disposition"] = (
             'attachment; filename="dual_category_download.csv"'
         )
-        is_headline = DataSourceFileType[chart_plot_models.metric_group].is_headline
-        headers = build_dual_category_csv_headers(
-            is_headline=is_headline,
-            x_axis=chart_plot_models.x_axis,
-            secondary_category=chart_plot_models.secondary_category,
-            segment_secondary_values=chart_plot_models.segment_secondary_values,
-        )
         return write_dual_category_data_to_csv(
             file=response,
             rows=pivoted_rows,
@@ -168,7 +247,7 @@ class DualCategoryDownloadsView(SingleCategoryDownloadsView):
             )
         ],
     )
-    @cache_response()
+    @cache_response(request_coalescing=RequestCoalescing())
     @require_authorisation
     def post(self, request, *args, **kwargs):
         """Handle a dual-category download request and return JSON or CSV data.
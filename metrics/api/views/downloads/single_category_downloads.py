@@ -1,12 +1,15 @@
 import io
+from collections.abc import Iterator
 from http import HTTPStatus
 
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework.renderers import JSONOpenAPIRenderer
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
 
+from caching.private_api.coalescing import RequestCoalescing
 from caching.private_api.decorators import cache_response
 from metrics.api.decorators.auth import require_authorisation
 from metrics.api.serializers import (
@@ -14,15 +17,24 @@ from metrics.api.serializers import (
     CoreTimeSeriesSerializer,
     SingleCategoryDownloadsSerializer,
 )
-from metrics.api.views.downloads.common import DOWNLOADS_API_TAG
+from metrics.api.views.downloads.common import (
+    DOWNLOADS_API_TAG,
+    build_streaming_download_response,
+)
 from metrics.data.managers.core_models.headline import CoreHeadlineQuerySet
 from metrics.data.managers.core_models.time_series import CoreTimeSeriesQuerySet
 from metrics.domain.common.utils import DataSourceFileType
 from metrics.domain.exports.csv_output import (
+    stream_data_to_csv,
     write_data_to_csv,
     write_headline_data_to_csv,
 )
+from metrics.domain.exports.json_output import stream_json_array
 from metrics.interfaces.downloads import access
+from metrics.interfaces.downloads.streaming import (
+    iterate_queryset_in_chunks,
+    should_stream_download,
+)
 from metrics.interfaces.plots.access import DataNotFoundForAnyPlotError
 
 DEFAULT_VALUE_ERROR_MESSAGE = "Invalid metric_group provided"
@@ -62,13 +74,45 @@ class SingleCategoryDownloadsView(APIView):
         except KeyError as error:
             raise ValueError(DEFAULT_VALUE_ERROR_MESSAGE) from error
 
+    def _iterate_serialized_records(
+        self,
+        *,
+        queryset: CoreTimeSeriesQuerySet | CoreHeadlineQuerySet,
+        metric_group: str,
+    ) -> Iterator[dict]:
+        """Lazily serializes each record of the `queryset`, fetching them in chunks
+
+        Returns:
+            An iterator of the serialized records.
+            Only 1 chunk of the records is held in memory at any one time
+        """
+        serializer = self._get_serializer_class(
+            queryset=queryset, metric_group=metric_group
+        )
+        return (
+            serializer.child.to_representation(record)
+            for record in iterate_queryset_in_chunks(queryset=queryset)
+        )
+
     def _handle_json(
         self,
         *,
         queryset: CoreTimeSeriesQuerySet | CoreHeadlineQuerySet,
         metric_group: str,
-    ) -> Response:
+    ) -> Response | StreamingHttpResponse:
         # Return the requested data in json format
+        if should_stream_download(queryset=queryset, metric_group=metric_group):
+            records = self._iterate_serialized_records(
+                queryset=queryset, metric_group=metric_group
+            )
+            return build_streaming_download_response(
+                streaming_content=stream_json_array(
+                    items=records, encoder_class=JSONEncoder
+                ),
+                content_type="application/json",
+                content_disposition="attachment; filename=chart_download.json",
+            )
+
         serializer = self._get_serializer_class(
             queryset=queryset, metric_group=metric_group
         )
@@ -83,8 +127,17 @@ class SingleCategoryDownloadsView(APIView):
         *,
         queryset: CoreTimeSeriesQuerySet | CoreHeadlineQuerySet,
         metric_group: str,
-    ) -> io.StringIO:
+    ) -> io.StringIO | StreamingHttpResponse:
         # Return the requested data in csv format
+        if should_stream_download(queryset=queryset, metric_group=metric_group):
+            return build_streaming_download_response(
+                streaming_content=stream_data_to_csv(
+                    rows=iterate_queryset_in_chunks(queryset=queryset)
+                ),
+                content_type="text/csv",
+                content_disposition='attachment; filename="chart_download.csv"',
+            )
+
         response = HttpResponse(content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="chart_download.csv"'
 
@@ -100,7 +153,7 @@ class SingleCategoryDownloadsView(APIView):
         return write_data_to_csv(file=response, core_time_series_queryset=queryset)
 
     @extend_schema(request=SingleCategoryDownloadsSerializer, tags=[DOWNLOADS_API_TAG])
-    @cache_response()
+    @cache_response(request_coalescing=RequestCoalescing())
     @require_authorisation
     def post(self, request, *args, **kwargs):
         """This endpoint will return the query output in json/csv format
@@ -128,6 +181,8 @@ class SingleCategoryDownloadsView(APIView):
         | `date_from`       | The date to pull the data from                                            | `2020-01-20`              |
         | `date_to`         | The date to pull the data up until                                        | `2023-01-20`              |
 
+        Large timeseries downloads are streamed back as they are read from the database.
+
         """
         request_serializer = SingleCategoryDownloadsSerializer(data=request.data)
         request_serializer.is_valid(raise_exception=True)
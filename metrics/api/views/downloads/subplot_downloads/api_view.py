@@ -1,11 +1,16 @@
-from django.http.response import HttpResponse
+from django.http.response import HttpResponse, StreamingHttpResponse
 from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 
+from caching.private_api.coalescing import RequestCoalescing
 from caching.private_api.decorators import cache_response
 from metrics.api.decorators.auth import require_authorisation
 from metrics.api.serializers.charts.subplot_charts import SubplotChartRequestSerializer
-from metrics.api.views.downloads.common import DOWNLOADS_API_TAG
+from metrics.api.views.downloads.common import (
+    DOWNLOADS_API_TAG,
+    build_streaming_download_response,
+)
 from metrics.api.views.downloads.single_category_downloads import (
     SingleCategoryDownloadsView,
 )
@@ -16,11 +21,17 @@ from metrics.data.managers.core_models.headline import CoreHeadlineQuerySet
 from metrics.data.managers.core_models.time_series import CoreTimeSeriesQuerySet
 from metrics.domain.common.utils import DataSourceFileType
 from metrics.domain.exports.csv_output import (
+    stream_data_to_csv,
     write_data_to_csv,
     write_headline_data_to_csv,
 )
+from metrics.domain.exports.json_output import stream_json_array
 from metrics.domain.models import ChartRequestParams
 from metrics.domain.models.charts.subplot_charts import SubplotChartRequestParameters
+from metrics.interfaces.downloads.streaming import (
+    iterate_queryset_in_chunks,
+    should_stream_download,
+)
 from metrics.interfaces.downloads.subplot_downloads import access
 from metrics.interfaces.plots.access import DataNotFoundForAnyPlotError
 
@@ -37,7 +48,7 @@ class SubplotDownloadsView(SingleCategoryDownloadsView):
         ],
         tags=[DOWNLOADS_API_TAG],
     )
-    @cache_response()
+    @cache_response(request_coalescing=RequestCoalescing())
     @require_authorisation
     def post(self, request, *args, **kwargs):
         request_serializer = SubplotChartRequestSerializer(data=request.data)
@@ -61,8 +72,8 @@ class SubplotDownloadsView(SingleCategoryDownloadsView):
 
     def _handle_json(
         self, *, charts_request_param_models: list[ChartRequestParams]
-    ) -> Response:
-        data = []
+    ) -> Response | StreamingHttpResponse:
+        querysets: list[tuple[CoreTimeSeriesQuerySet, str]] = []
         for charts_request_param in charts_request_param_models:
             try:
                 queryset: CoreTimeSeriesQuerySet = access.get_downloads_data(
@@ -71,8 +82,31 @@ class SubplotDownloadsView(SingleCategoryDownloadsView):
             except DataNotFoundForAnyPlotError:
                 continue
 
+            querysets.append((queryset, charts_request_param.metric_group))
+
+        if any(
+            should_stream_download(queryset=queryset, metric_group=metric_group)
+            for queryset, metric_group in querysets
+        ):
+            # Each subplot is encoded lazily as a nested array
+            subplots = (
+                self._iterate_serialized_records(
+                    queryset=queryset, metric_group=metric_group
+                )
+                for queryset, metric_group in querysets
+            )
+            return build_streaming_download_response(
+                streaming_content=stream_json_array(
+                    items=subplots, encoder_class=JSONEncoder
+                ),
+                content_type="application/json",
+                content_disposition="attachment; filename=chart_download.json",
+            )
+
+        data = []
+        for queryset, metric_group in querysets:
             serializer = self._get_serializer_class(
-                queryset=queryset, metric_group=charts_request_param.metric_group
+                queryset=queryset, metric_group=metric_group
             )
             data.append(serializer.data)
 
@@ -83,18 +117,28 @@ class SubplotDownloadsView(SingleCategoryDownloadsView):
 
     def _handle_csv(
         self, *, charts_request_param_models: list[ChartRequestParams]
-    ) -> HttpResponse:
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = 'attachment; filename="charts-download.csv"'
-
+    ) -> HttpResponse | StreamingHttpResponse:
         queryset: CoreTimeSeriesQuerySet | CoreHeadlineQuerySet = (
             access.get_subplot_downloads_data(
                 charts_request_param_models=charts_request_param_models
             )
         )
+        metric_group: str = charts_request_param_models[0].metric_group
+
+        if should_stream_download(queryset=queryset, metric_group=metric_group):
+            return build_streaming_download_response(
+                streaming_content=stream_data_to_csv(
+                    rows=iterate_queryset_in_chunks(queryset=queryset)
+                ),
+                content_type="text/csv",
+                content_disposition='attachment; filename="charts-download.csv"',
+            )
+
+        response = HttpResponse(content_type="text/csv")
+        response["Content-Disposition"] = 'attachment; filename="charts-download.csv"'
 
         self._write_headline_to_csv(
-            metric_group=charts_request_param_models[0].metric_group,
+            metric_group=metric_group,
             queryset=queryset,
             response=response,
             headers=None,
@@ -6,6 +6,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from caching.private_api.coalescing import RequestCoalescing
 from caching.private_api.decorators import cache_response
 from metrics.api.serializers.maps import MapsRequestSerializer
 from metrics.interfaces.maps.access import MapOutput, get_maps_output
@@ -32,7 +33,7 @@ class MapsView(APIView):
             )
         ],
     )
-    @cache_response(is_reserved_namespace=True)
+    @cache_response(is_reserved_namespace=True, request_coalescing=RequestCoalescing())
     def post(cls, request: Request) -> Response:
         start_time = time.time()
 
@@ -4,6 +4,7 @@ from drf_spectacular.utils import extend_schema
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from caching.private_api.coalescing import RequestCoalescing
 from caching.private_api.decorators import cache_response
 from metrics.api.decorators.auth import require_authorisation
 from metrics.api.serializers.tables import TablesResponseSerializer, TablesSerializer
@@ -24,7 +25,7 @@ class TablesView(APIView):
         responses={HTTPStatus.OK.value: TablesResponseSerializer},
         tags=[TABLES_API_TAG],
     )
-    @cache_response()
+    @cache_response(request_coalescing=RequestCoalescing())
     @require_authorisation
     def post(cls, request, *args, **kwargs):
         """This endpoint can be used to generate chart data in tabular format.
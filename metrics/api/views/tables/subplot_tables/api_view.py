@@ -4,6 +4,7 @@ from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from caching.private_api.coalescing import RequestCoalescing
 from caching.private_api.decorators import cache_response
 from metrics.api.decorators.auth import require_authorisation
 from metrics.api.serializers.charts.subplot_charts import SubplotChartRequestSerializer
@@ -30,7 +31,7 @@ class TablesSubplotView(APIView):
         ],
         tags=[TABLES_API_TAG],
     )
-    @cache_response()
+    @cache_response(request_coalescing=RequestCoalescing())
     @require_authorisation
     def post(cls, request, *args, **kwargs):
         serializer = SubplotChartRequestSerializer(data=request.data)
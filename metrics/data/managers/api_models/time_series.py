@@ -11,6 +11,26 @@ from django.db import models
 from django.db.models.functions.window import Rank
 
 from common.virtual_clock import get_embargo_time
+from metrics.data.managers.time_series_current_view import (
+    build_live_time_series_filter,
+)
+
+# The fields which together identify the records which supersede each other.
+# These are used to build the entries of the `APITimeSeriesCurrentView`
+CURRENT_VIEW_PARTITION_FIELDS: tuple[str, ...] = (
+    "theme",
+    "sub_theme",
+    "topic",
+    "metric",
+    "geography",
+    "geography_type",
+    "geography_code",
+    "stratum",
+    "age",
+    "sex",
+    "date",
+    "is_public",
+)
 
 
 class APITimeSeriesQuerySet(models.QuerySet):
@@ -91,6 +111,8 @@ class APITimeSeriesQuerySet(models.QuerySet):
         geography: str,
         metric: str,
         restrict_to_public: bool,
+        restrict_to_latest_refresh_dates: bool = True,
+        use_current_view: bool = False,
     ) -> Self:
         """Filters by the given fields to provide a slice of the timeseries data as per the fields.
 
@@ -111,6 +133,16 @@ class APITimeSeriesQuerySet(models.QuerySet):
             restrict_to_public: Boolean switch to restrict the query
                 to only return public records.
                 If False, then non-public records will be included.
+            restrict_to_latest_refresh_dates: Boolean switch to restrict the query
+                to only return the latest record for each date.
+                If False, then the caller is expected to apply
+                `filter_for_latest_refresh_date_records()` itself.
+                E.g. after restricting the slice to a range of dates.
+                Defaults to True.
+            use_current_view: Boolean switch to read the latest records
+                from the `APITimeSeriesCurrentView`.
+                If False, the latest records are ranked as part of the query.
+                Defaults to False.
 
         Returns:
             QuerySet: An ordered queryset from oldest -> newest
@@ -140,9 +172,16 @@ class APITimeSeriesQuerySet(models.QuerySet):
             queryset = queryset.filter(is_public=True)
 
         queryset = self._exclude_data_under_embargo(queryset=queryset)
-        return self.filter_for_latest_refresh_date_records(queryset=queryset)
+        if not restrict_to_latest_refresh_dates:
+            return queryset
 
-    def filter_for_latest_refresh_date_records(self, *, queryset: Self) -> Self:
+        return self.filter_for_latest_refresh_date_records(
+            queryset=queryset, use_current_view=use_current_view
+        )
+
+    def filter_for_latest_refresh_date_records(
+        self, *, queryset: Self, use_current_view: bool = False
+    ) -> Self:
         """Filters the given `queryset` to ensure the latest record is returned for each individual date
 
         Notes:
@@ -167,14 +206,29 @@ class APITimeSeriesQuerySet(models.QuerySet):
             and returns records with the latest `refresh_date`
             from each window
 
+            If `use_current_view` is True, then the ranking is skipped.
+            Instead, the records are joined onto the `APITimeSeriesCurrentView`,
+            which the ingestion keeps up to date with the latest records.
+            Note that the current view ranks the public
+            and non-public records separately.
+
         Args:
             queryset: The queryset to filter against
+            use_current_view: Boolean switch to read the latest records
+                from the `APITimeSeriesCurrentView`.
+                Defaults to False.
 
         Returns:
             A new filtered queryset containing
             only the latest records for each date
 
         """
+        if use_current_view:
+            current_time = get_embargo_time()
+            return queryset.filter(
+                build_live_time_series_filter(current_time=current_time)
+            )
+
         # Filter the queryset to get records with a ranking of 1.
         # This will return the records with the latest `refresh_date` within each partition
         queryset = self._partition_and_rank_data(
@@ -502,3 +556,73 @@ class APITimeSeriesManager(models.Manager):
             is_public=is_public,
         )
         superseded_records.delete()
+
+    def refresh_current_view(
+        self,
+        *,
+        theme: str,
+        sub_theme: str,
+        topic: str,
+        metric: str,
+        geography: str,
+        geography_type: str,
+        geography_code: str,
+        stratum: str,
+        sex: str,
+        age: str,
+    ) -> None:
+        """Rebuilds the `APITimeSeriesCurrentView` entries for the records of the given series
+
+        Notes:
+            Both the public and non-public records of the series are refreshed.
+            This should be called after any stale records have been deleted
+            and the new records have been written,
+            within the same transaction.
+
+        Args:
+           theme: The name of the parent theme being queried.
+               E.g. `infectious_disease`
+           sub_theme: The name of the child theme being queried.
+               E.g. `respiratory`
+           topic: The name of the threat being queried.
+               E.g. `COVID-19`
+           metric: The name of the metric being queried.
+               E.g. `COVID-COVID-19_cases_countRollingMean`
+           geography: The name of the geography being queried.
+               E.g. `England`
+           geography_type: The name of the geography type being queried.
+               E.g. `Nation`
+           geography_code: Code associated with the geography being queried.
+               E.g. "E45000010"
+           stratum: The value of the stratum to apply additional filtering to.
+               E.g. `default`, which would be used to capture all strata.
+           sex: The gender to apply additional filtering to.
+               E.g. `F`, would be used to capture Females.
+               Note that options are `M`, `F`, or `ALL`.
+           age: The age range to apply additional filtering to.
+               E.g. `0_4` would be used to capture the age of 0-4 years old
+
+        Returns:
+           None
+
+        """
+        time_series = self.filter(
+            theme=theme,
+            sub_theme=sub_theme,
+            topic=topic,
+            metric=metric,
+            geography=geography,
+            geography_type=geography_type,
+            geography_code=geography_code,
+            stratum=stratum,
+            age=age,
+            sex=sex,
+        )
+        current_view_model = self.model.current_view_entry.related.related_model
+        current_view_model.objects.refresh_entries(
+            time_series=time_series,
+            partition_fields=CURRENT_VIEW_PARTITION_FIELDS,
+            # The records are ranked by a descending `refresh_date`
+            # which places records without a `refresh_date` first in PostgreSQL
+            null_refresh_date_is_latest=True,
+        )
@@ -0,0 +1,113 @@
+"""
+This file contains the custom QuerySet and Manager classes associated with the `APITimeSeriesDimension` model.
+
+Note that the application layer should only call into the `Manager` class.
+The application should not interact directly with the `QuerySet` class.
+"""
+
+from collections.abc import Iterable
+
+from django.db import models
+
+DIMENSION_FIELDS: tuple[str, ...] = (
+    "theme",
+    "sub_theme",
+    "topic",
+    "geography_type",
+    "geography",
+    "metric",
+    "is_public",
+)
+
+
+class APITimeSeriesDimensionQuerySet(models.QuerySet):
+    """Custom queryset which can be used by the `APITimeSeriesDimensionManager`"""
+
+    def get_distinct_column_values_with_filters(
+        self, *, lookup_field: str, restrict_to_public: bool, **kwargs
+    ) -> "APITimeSeriesDimensionQuerySet":
+        """Filters for unique values in the column denoted by `lookup_field` via the given **kwargs.
+
+        Args:
+            lookup_field: A column to query and retrieve unique values for.
+            restrict_to_public: Boolean switch to restrict the query
+                to only return public records.
+                If False, then non-public records will be included.
+            **kwargs: The filters to apply to the query.
+
+        Returns:
+            APITimeSeriesDimensionQuerySet: The unique column values as a queryset.
+            Examples:
+                `<APITimeSeriesDimensionQuerySet ['infectious_disease']>`
+
+        """
+        queryset = self.filter(**kwargs)
+        if restrict_to_public:
+            queryset = queryset.filter(is_public=True)
+
+        return queryset.values_list(lookup_field, flat=True).distinct()
+
+
+class APITimeSeriesDimensionManager(models.Manager):
+    """Custom model manager class for the `APITimeSeriesDimension` model."""
+
+    def get_queryset(self) -> APITimeSeriesDimensionQuerySet:
+        return APITimeSeriesDimensionQuerySet(model=self.model, using=self.db)
+
+    def get_distinct_column_values_with_filters(
+        self, *, lookup_field: str, restrict_to_public: bool, **kwargs
+    ) -> APITimeSeriesDimensionQuerySet:
+        """Filters for unique values in the column denoted by `lookup_field` via the given **kwargs.
+
+        Notes:
+            This matches the signature of the method on the `APITimeSeriesManager`.
+            But only reads from the catalogue of dimensions,
+            rather than scanning every `APITimeSeries` record.
+
+        Args:
+            lookup_field: A column to query and retrieve unique values for.
+            restrict_to_public: Boolean switch to restrict the query
+                to only return public records.
+                If False, then non-public records will be included.
+            **kwargs: The filters to apply to the query.
+
+        Returns:
+            APITimeSeriesDimensionQuerySet: The unique column values as a queryset.
+            Examples:
+                `<APITimeSeriesDimensionQuerySet ['infectious_disease']>`
+
+        """
+        return self.get_queryset().get_distinct_column_values_with_filters(
+            lookup_field=lookup_field, restrict_to_public=restrict_to_public, **kwargs
+        )
+
+    def record_dimensions(self, *, api_time_series: Iterable[models.Model]) -> None:
+        """Adds the dimensions of the given `api_time_series` to the catalogue
+
+        Notes:
+            The distinct dimensions are found in memory first,
+            so that typically only 1 row is written per ingested file.
+            Dimensions which are already held in the catalogue are ignored.
+
+        Args:
+            api_time_series: The `APITimeSeries` model instances
+                which have been written to the database
+
+        Returns:
+            None
+
+        """
+        dimensions: set[tuple] = {
+            tuple(getattr(record, field) for field in DIMENSION_FIELDS)
+            for record in api_time_series
+        }
+        if not dimensions:
+            return
+
+        self.bulk_create(
+            objs=[
+                self.model(**dict(zip(DIMENSION_FIELDS, dimension, strict=True)))
+                for dimension in dimensions
+            ],
+            ignore_conflicts=True,
+        )
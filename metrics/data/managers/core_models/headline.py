@@ -10,6 +10,7 @@ from collections.abc import Iterable
 from typing import Optional, Self
 
 from django.db import models
+from django.db.models.functions.window import RowNumber
 
 from common.virtual_clock import get_embargo_time
 from metrics.api.permissions.fluent_permissions import (
@@ -21,12 +22,20 @@ class CoreHeadlineQuerySet(models.QuerySet):
     """Custom queryset which can be used by the `CoreHeadlineManager`"""
 
     @staticmethod
+    def _newest_to_oldest_ordering(*, apply_refresh_date_only: bool) -> list[str]:
+        if apply_refresh_date_only:
+            return ["-refresh_date"]
+        return ["-period_end", "-refresh_date"]
+
+    @classmethod
     def _newest_to_oldest(
-        *, queryset: models.QuerySet, apply_refresh_date_only: bool
+        cls, *, queryset: models.QuerySet, apply_refresh_date_only: bool
     ) -> models.QuerySet:
-        if apply_refresh_date_only:
-            return queryset.order_by("-refresh_date")
-        return queryset.order_by("-period_end", "-refresh_date")
+        return queryset.order_by(
+            *cls._newest_to_oldest_ordering(
+                apply_refresh_date_only=apply_refresh_date_only
+            )
+        )
 
     @staticmethod
     def _filter_by_geography(
@@ -265,6 +274,79 @@ class CoreHeadlineQuerySet(models.QuerySet):
             queryset=queryset, apply_refresh_date_only=apply_refresh_date_only
         )
 
+    def get_latest_public_headlines_for_geography_codes(
+        self,
+        *,
+        topic: str,
+        metric: str,
+        geography_codes: Iterable[str],
+        geography: str,
+        geography_type: str,
+        stratum: str,
+        sex: str,
+        age: str,
+    ) -> Self:
+        """Filters for the latest public record for each of the given `geography_codes`
+
+        Notes:
+            The record returned for each geography code matches the first record
+            from `get_public_only_headlines_released_from_embargo()`
+            for that individual geography code.
+            The records are ranked within each geography code by the database,
+            so the latest records for all geography codes are fetched in 1 query.
+
+        Args:
+            topic: The name of the disease being queried.
+                E.g. `COVID-19`
+            metric: The name of the metric being queried.
+                E.g. `COVID-19_deaths_ONSByDay`
+            geography_codes: Codes associated with the geographies being queried.
+                E.g. ["E45000010", "E45000020"]
+            geography: The name of the geography being queried.
+                E.g. `England`
+            geography_type: The name of the geography
+                type being queried.
+                E.g. `Nation`
+            stratum: The value of the stratum to apply additional filtering to.
+                E.g. `default`, which would be used to capture all strata.
+            sex: The gender to apply additional filtering to.
+                E.g. `F`, would be used to capture Females.
+                Note that options are `M`, `F`, or `ALL`.
+            age: The age range to apply additional filtering to.
+                E.g. `0_4` would be used to capture the age of 0-4 years old
+
+        Returns:
+            A queryset containing at most 1 record for each geography code.
+            Geography codes without any records are omitted.
+
+        """
+        queryset = self.filter(
+            metric__topic__name=topic,
+            metric__name=metric,
+            geography__geography_code__in=list(geography_codes),
+            is_public=True,
+        )
+        queryset = self._filter_for_any_optional_fields(
+            queryset=queryset,
+            geography_type=geography_type,
+            geography=geography,
+            geography_code=None,
+            stratum=stratum,
+            age=age,
+            sex=sex,
+        )
+        queryset = self._exclude_data_under_embargo(queryset=queryset)
+
+        apply_refresh_date_only: bool = "alert" in topic
+        window = models.Window(
+            expression=RowNumber(),
+            partition_by=["geography__geography_code"],
+            order_by=self._newest_to_oldest_ordering(
+                apply_refresh_date_only=apply_refresh_date_only
+            ),
+        )
+        return queryset.annotate(recency_ranking=window).filter(recency_ranking=1)
+
     @staticmethod
     def _exclude_data_under_embargo(*, queryset: models.QuerySet) -> models.QuerySet:
         """Excludes any data which is currently embargoed from the given `queryset`
@@ -312,6 +394,36 @@ class CoreHeadlineQuerySet(models.QuerySet):
         except self.model.DoesNotExist:
             return None
 
+    def find_latest_refresh_date_and_released_embargo_for_metrics(
+        self, *, metrics: Iterable[str]
+    ) -> tuple[datetime.datetime | None, datetime.datetime | None]:
+        """Finds the latest `refresh_date` and the latest released `embargo` for the associated `metrics`
+
+        Args:
+            metrics: Iterable of metric names
+                to search the latest `refresh_date`
+                and `embargo` timestamps against.
+
+        Returns:
+            Tuple of the latest `refresh_date`
+            and the latest `embargo` which has been released.
+            Either of which will be None if no data could be found.
+
+        """
+        current_time = get_embargo_time()
+        aggregation: dict[str, datetime.datetime | None] = self.filter(
+            metric__name__in=metrics
+        ).aggregate(
+            latest_refresh_date=models.Max("refresh_date"),
+            latest_released_embargo=models.Max(
+                "embargo", filter=models.Q(embargo__lte=current_time)
+            ),
+        )
+        return (
+            aggregation["latest_refresh_date"],
+            aggregation["latest_released_embargo"],
+        )
+
 
 class CoreHeadlineManager(models.Manager):
     """Custom model manager class for the `CoreHeadline` model."""
@@ -611,6 +723,13 @@ class CoreHeadlineManager(models.Manager):
     ) -> dict[str, Optional["CoreHeadline"]]:
         """Grabs by the latest records by the given `topic` and `metric` with a current `period_end`
 
+        Notes:
+            The latest records for all the `geography_codes`
+            are fetched within a single query.
+            The semantics for embargo, `period_end` and `is_public`
+            match those of `get_latest_headline()`
+            for each individual geography code.
+
         Args:
             topic: The name of the disease being queried.
                 E.g. `COVID-19`
@@ -639,17 +758,25 @@ class CoreHeadlineManager(models.Manager):
             Otherwise, the value will be None
 
         """
-        return {
-            geography_code: self.get_latest_headline(
+        latest_headlines = (
+            self.get_queryset().get_latest_public_headlines_for_geography_codes(
                 topic=topic,
                 metric=metric,
+                geography_codes=geography_codes,
                 geography=geography,
                 geography_type=geography_type,
-                geography_code=geography_code,
                 stratum=stratum,
                 sex=sex,
                 age=age,
             )
+        )
+        latest_headlines_by_geography_code: dict[str, CoreHeadline] = {
+            core_headline.geography.geography_code: core_headline
+            for core_headline in latest_headlines.select_related("geography")
+        }
+
+        return {
+            geography_code: latest_headlines_by_geography_code.get(geography_code)
             for geography_code in geography_codes
         }
 
@@ -725,3 +852,28 @@ class CoreHeadlineManager(models.Manager):
         return self.get_queryset().find_latest_released_embargo_for_metrics(
             metrics=metrics
         )
+
+    def find_latest_refresh_date_and_released_embargo_for_metrics(
+        self, *, metrics: Iterable[str]
+    ) -> tuple[datetime.datetime | None, datetime.datetime | None]:
+        """Finds the latest `refresh_date` and the latest released `embargo` for the associated `metrics`
+
+        Notes:
+            Between them, these 2 timestamps change
+            whenever new `CoreHeadline` records are ingested for the `metrics`
+            and whenever previously ingested records come out of embargo.
+
+        Args:
+            metrics: Iterable of metric names
+                to search the latest `refresh_date`
+                and `embargo` timestamps against.
+
+        Returns:
+            Tuple of the latest `refresh_date`
+            and the latest `embargo` which has been released.
+            Either of which will be None if no data could be found.
+
+        """
+        return self.get_queryset().find_latest_refresh_date_and_released_embargo_for_metrics(
+            metrics=metrics
+        )
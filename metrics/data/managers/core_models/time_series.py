@@ -10,6 +10,7 @@ from collections.abc import Iterable
 from typing import Self
 
 from django.db import models
+from django.db.models.functions.window import Rank
 from django.db.models.query_utils import Q
 
 from common.auth.permissions import PermissionSetsType, check_chart_permissions_by_name
@@ -17,14 +18,46 @@ from common.virtual_clock import get_embargo_time
 from metrics.api.permissions.fluent_permissions import (
     is_public_data_only_enforced,
 )
+from metrics.data.managers.time_series_current_view import (
+    build_live_time_series_filter,
+)
 from metrics.data.models import RBACPermission
 
 ALLOWABLE_METRIC_VALUE_RANGE_TYPE = tuple[str | float | int, str | float | int]
 
+# The fields which together identify an individual series of a metric.
+# Each key is the name of the argument for the series
+# and each value is the corresponding lookup on the model
+SERIES_FIELD_LOOKUPS: dict[str, str] = {
+    "geography": "geography__name",
+    "geography_type": "geography__geography_type__name",
+    "stratum": "stratum__name",
+    "sex": "sex",
+    "age": "age__name",
+}
+SERIES_RESULT_TYPE = tuple[list[dict], datetime.date | None]
+LATEST_VALUE_RESULT_TYPE = dict[str, str | datetime.date | float]
+
+# The fields which together identify the records which supersede each other.
+# These are used to build the entries of the `CoreTimeSeriesCurrentView`
+CURRENT_VIEW_PARTITION_FIELDS: tuple[str, ...] = (
+    "metric_id",
+    "geography_id",
+    "stratum_id",
+    "age_id",
+    "sex",
+    "date",
+    "is_public",
+)
+
 
 class CoreTimeSeriesQuerySet(models.QuerySet):
     """Custom queryset which can be used by the `CoreTimeSeriesManager`"""
 
+    @property
+    def partition_fields(self) -> list[str]:
+        return ["date"]
+
     @staticmethod
     def _ascending_order(
         *, queryset: models.QuerySet, field_name: str
@@ -175,6 +208,7 @@ class CoreTimeSeriesQuerySet(models.QuerySet):
         sub_theme: str = "",
         metric_value_ranges: list[tuple[str | float | int]] | None = None,
         permission_sets: PermissionSetsType | None = None,
+        use_current_view: bool = False,
     ) -> models.QuerySet:
         """Filters for a N-item list of dicts by the given params if `fields_to_export` is used.
 
@@ -226,6 +260,10 @@ class CoreTimeSeriesQuerySet(models.QuerySet):
                 between 0 -> 80 AND 90 -> 100,
                 this can be provided as `[(0, 80), (90, 100)]`.
             permission_sets: The JWT permissions extracted from the Cognito token.
+            use_current_view: Boolean switch to read the latest records
+                from the `CoreTimeSeriesCurrentView`.
+                If False, the latest records are ranked as part of the query.
+                Defaults to False.
 
         Returns:
             QuerySet: An ordered queryset from lowest -> highest
@@ -253,25 +291,31 @@ class CoreTimeSeriesQuerySet(models.QuerySet):
             age=age,
         )
 
-        if permission_sets and check_chart_permissions_by_name(
-            permission_sets=permission_sets,
-            theme_name=theme,
-            sub_theme_name=sub_theme,
-            topic_name=topic,
-            metric_name=metric,
-            geography_type=geography_type,
-            geography_name=geography,
-        ):
-            # Keep both the public and non-public data
-            pass
-        else:
+        # Keep both the public and non-public data if permitted
+        includes_non_public: bool = bool(
+            permission_sets
+            and check_chart_permissions_by_name(
+                permission_sets=permission_sets,
+                theme_name=theme,
+                sub_theme_name=sub_theme,
+                topic_name=topic,
+                metric_name=metric,
+                geography_type=geography_type,
+                geography_name=geography,
+            )
+        )
+        if not includes_non_public:
             queryset = queryset.filter(is_public=True)
 
         queryset = self._exclude_data_under_embargo(queryset=queryset)
         queryset = self._filter_for_metric_value_ranges(
             queryset=queryset, metric_value_ranges=metric_value_ranges
         )
-        queryset = self.filter_for_latest_refresh_date_records(queryset=queryset)
+        queryset = self.filter_for_latest_refresh_date_records(
+            queryset=queryset,
+            use_current_view=use_current_view,
+            includes_non_public=includes_non_public,
+        )
         queryset = self._ascending_order(
             queryset=queryset,
             field_name=field_to_order_by,
@@ -285,6 +329,268 @@ class CoreTimeSeriesQuerySet(models.QuerySet):
 
         return self._annotate_latest_date_on_queryset(queryset=queryset)
 
+    def query_for_data_for_series(
+        self,
+        *,
+        topic: str,
+        metric: str,
+        date_from: datetime.date,
+        series: list[dict[str, str]],
+        date_to: datetime.date | None = None,
+        fields_to_export: list[str | None],
+        field_to_order_by: str = "date",
+        theme: str = "",
+        sub_theme: str = "",
+        metric_value_ranges: list[tuple[str | float | int]] | None = None,
+        permission_sets: PermissionSetsType | None = None,
+        use_current_view: bool = False,
+    ) -> list[SERIES_RESULT_TYPE]:
+        """Fetches the data for multiple series of the same metric in 1 query, which is then partitioned in memory
+
+        Notes:
+            Each series must provide all of the
+            `geography`, `geography_type`, `stratum`, `sex` and `age` fields.
+            The results for each series match those returned
+            by `query_for_data()` for the same arguments.
+            The latest refresh date records are ranked
+            within each date of each series,
+            and the permissions are checked for each series individually.
+
+        Args:
+            topic: The name of the disease being queried.
+                E.g. `COVID-19`
+            metric: The name of the metric being queried.
+                E.g. `COVID-19_deaths_ONSByDay`
+            date_from: The datetime object to begin the query from.
+            series: List of dicts, each of which holds the
+                `geography`, `geography_type`, `stratum`, `sex` and `age`
+                of an individual series.
+                E.g. `[{"geography": "England", "geography_type": "Nation", ...}]`
+            date_to: The datetime object to end the query at.
+            fields_to_export: List of fields to be exported for each record.
+                E.g. `["date", "metric_value"]`
+            field_to_order_by: The name of the field to order
+                the records of each series in ascending order by.
+                Defaults to `date`.
+            theme: The name of the theme being queried.
+                This is only used to determine permissions for
+                the non-public portion of the requested dataset.
+            sub_theme: The name of the sub theme being queried.
+                This is only used to determine permissions for
+                the non-public portion of the requested dataset.
+            metric_value_ranges: List of tuples whereby each
+                tuple represents a permissible metric value range.
+            permission_sets: The JWT permissions extracted from the Cognito token.
+            use_current_view: Boolean switch to read the latest records
+                from the `CoreTimeSeriesCurrentView`.
+                If any of the `series` include non-public records,
+                then the live records are also ranked against each other.
+                If False, the latest records are ranked as part of the query.
+                Defaults to False.
+
+        Returns:
+            List of tuples in the same order as the given `series`.
+            Each tuple contains the list of exported records for that series
+            along with the latest date of those records,
+            which will be None if no records were found.
+
+        """
+        series_filter = Q()
+        includes_non_public = False
+        for individual_series in series:
+            series_lookups = {
+                lookup: individual_series[field]
+                for field, lookup in SERIES_FIELD_LOOKUPS.items()
+            }
+            if not (
+                permission_sets
+                and check_chart_permissions_by_name(
+                    permission_sets=permission_sets,
+                    theme_name=theme,
+                    sub_theme_name=sub_theme,
+                    topic_name=topic,
+                    metric_name=metric,
+                    geography_type=individual_series["geography_type"],
+                    geography_name=individual_series["geography"],
+                )
+            ):
+                series_lookups["is_public"] = True
+            else:
+                includes_non_public = True
+
+            series_filter |= Q(**series_lookups)
+
+        queryset = self.filter(
+            series_filter,
+            metric__topic__name=topic,
+            metric__name=metric,
+            date__gte=date_from,
+            date__lte=date_to,
+        )
+        queryset = self._exclude_data_under_embargo(queryset=queryset)
+        queryset = self._filter_for_metric_value_ranges(
+            queryset=queryset, metric_value_ranges=metric_value_ranges
+        )
+        if use_current_view:
+            queryset = self._filter_for_current_view_records(queryset=queryset)
+        if not use_current_view or includes_non_public:
+            queryset = self._partition_and_rank_data(
+                queryset=queryset,
+                partition_fields=[
+                    *self.partition_fields,
+                    *SERIES_FIELD_LOOKUPS.values(),
+                ],
+            ).filter(refresh_ranking=1)
+        queryset = self._ascending_order(
+            queryset=queryset, field_name=field_to_order_by
+        )
+
+        fields_to_export = [field for field in fields_to_export if field is not None]
+        fields_to_fetch = list(
+            dict.fromkeys([*fields_to_export, "date", *SERIES_FIELD_LOOKUPS.values()])
+        )
+
+        records_by_series: dict[tuple[str, ...], list[dict]] = {
+            self._build_series_key(individual_series=individual_series): []
+            for individual_series in series
+        }
+        latest_dates_by_series: dict[tuple[str, ...], datetime.date] = {}
+
+        for record in queryset.values(*fields_to_fetch):
+            series_key = tuple(
+                record[lookup] for lookup in SERIES_FIELD_LOOKUPS.values()
+            )
+            records_by_series[series_key].append(
+                {field: record[field] for field in fields_to_export}
+            )
+            latest_date: datetime.date | None = latest_dates_by_series.get(series_key)
+            if latest_date is None or record["date"] > latest_date:
+                latest_dates_by_series[series_key] = record["date"]
+
+        return [
+            (
+                records_by_series[series_key],
+                latest_dates_by_series.get(series_key),
+            )
+            for series_key in (
+                self._build_series_key(individual_series=individual_series)
+                for individual_series in series
+            )
+        ]
+
+    @staticmethod
+    def _build_series_key(*, individual_series: dict[str, str]) -> tuple[str, ...]:
+        return tuple(individual_series[field] for field in SERIES_FIELD_LOOKUPS)
+
+    def query_for_latest_values_by_geography(
+        self,
+        *,
+        topic: str,
+        metric: str,
+        geographies: Iterable[str],
+        date_from: datetime.date,
+        date_to: datetime.date | None = None,
+        geography_type: str | None = None,
+        stratum: str | None = None,
+        sex: str | None = None,
+        age: str | None = None,
+        use_current_view: bool = False,
+    ) -> dict[str, LATEST_VALUE_RESULT_TYPE]:
+        """Fetches the latest record for each of the given `geographies` in 1 query
+
+        Notes:
+            The record returned for each geography matches
+            the first record returned by `query_for_data()`
+            when ordered by `-date` for that individual geography.
+            The latest refresh date records are ranked
+            within each date of each geography,
+            and the latest date is ranked within each geography.
+            Both rankings are resolved by the database
+            as part of the same query.
+
+            Only public data is returned.
+
+        Args:
+            topic: The name of the disease being queried.
+                E.g. `COVID-19`
+            metric: The name of the metric being queried.
+                E.g. `COVID-19_deaths_ONSByDay`
+            geographies: The names of the geographies to fetch the latest records for.
+                E.g. `["Hackney", "Leeds"]`
+            date_from: The datetime object to begin the query from.
+            date_to: The datetime object to end the query at.
+            geography_type: The name of the type of geography to apply additional filtering.
+                E.g. `Upper Tier Local Authority`
+            stratum: The value of the stratum to apply additional filtering to.
+                E.g. `default`
+            sex: The gender to apply additional filtering to.
+                E.g. `F`, would be used to capture Females.
+            age: The age range to apply additional filtering to.
+                E.g. `0_4` would be used to capture the age of 0-4 years old
+            use_current_view: Boolean switch to read the latest records
+                from the `CoreTimeSeriesCurrentView`.
+                If False, the latest records are ranked as part of the query.
+                Defaults to False.
+
+        Returns:
+            Dict keyed by the name of each geography which has a live record.
+            Each value is a dict of the `geography_code`, `date` and `metric_value`
+            of the latest record for that geography.
+            Geographies without any records are omitted.
+
+        """
+        queryset = self.filter(
+            metric__topic__name=topic,
+            metric__name=metric,
+            geography__name__in=list(geographies),
+            date__gte=date_from,
+            date__lte=date_to,
+            is_public=True,
+        )
+        queryset = self._filter_for_any_optional_fields(
+            queryset=queryset,
+            geography_name=None,
+            geography_type_name=geography_type,
+            stratum_name=stratum,
+            sex=sex,
+            age=age,
+        )
+        queryset = self._exclude_data_under_embargo(queryset=queryset)
+        if use_current_view:
+            queryset = self._filter_for_current_view_records(queryset=queryset)
+            ranking_filters = {"date_ranking": 1}
+        else:
+            queryset = self._partition_and_rank_data(
+                queryset=queryset,
+                partition_fields=[*self.partition_fields, "geography__name"],
+            )
+            ranking_filters = {"refresh_ranking": 1, "date_ranking": 1}
+
+        # The set of dates for each geography is unaffected by the refresh ranking.
+        # So the latest date can be ranked over the same window of records
+        queryset = queryset.annotate(
+            date_ranking=models.Window(
+                expression=Rank(),
+                partition_by=["geography__name"],
+                order_by=models.F("date").desc(),
+            )
+        ).filter(**ranking_filters)
+
+        latest_values_by_geography: dict[str, LATEST_VALUE_RESULT_TYPE] = {}
+        for record in queryset.values(
+            "geography__name", "geography__geography_code", "date", "metric_value"
+        ):
+            latest_values_by_geography.setdefault(
+                record["geography__name"],
+                {
+                    "geography_code": record["geography__geography_code"],
+                    "date": record["date"],
+                    "metric_value": record["metric_value"],
+                },
+            )
+
+        return latest_values_by_geography
+
     def query_for_superseded_data(
         self,
         *,
@@ -333,7 +639,14 @@ class CoreTimeSeriesQuerySet(models.QuerySet):
             is_public=is_public,
         )
         queryset = self._exclude_data_under_embargo(queryset=queryset)
-        return self.filter_for_outdated_refresh_date_records(queryset=queryset)
+        queryset = self.filter_for_outdated_refresh_date_records(queryset=queryset)
+
+        # Note that we cannot call `delete()` on the above queryset.
+        # This is because it uses the `WINDOW` function.
+        # Which is not allowed with a `DELETE` statement.
+        # So we need to filter by IDs first.
+        superseded_record_ids = queryset.values_list("id", flat=True)
+        return self.filter(id__in=superseded_record_ids)
 
     def filter_for_outdated_refresh_date_records(self, *, queryset: Self) -> Self:
         """Filters the given `queryset` for the stale records in each individual date
@@ -351,6 +664,10 @@ class CoreTimeSeriesQuerySet(models.QuerySet):
                 | 1st round  | 1st round  | 1st round  |   <- expected results
                 | 2nd round  |      -     | 2nd round  |
 
+            This will partition the `queryset`
+            and returns records which do not have
+            the latest `refresh_date` from each window
+
         Args:
             queryset: The queryset to filter against
 
@@ -359,15 +676,19 @@ class CoreTimeSeriesQuerySet(models.QuerySet):
             only the stale records for each date
 
         """
-        latest_record_ids: list[int] = self._get_ids_of_latest_records(
-            queryset=queryset
+        # Filter the queryset to get records with a ranking of greater than 1.
+        # This will return the records with outdated `refresh_dates` within each partition
+        queryset = self._partition_and_rank_data(
+            queryset=queryset, partition_fields=self.partition_fields
         )
-        return queryset.exclude(pk__in=latest_record_ids)
+        return queryset.filter(refresh_ranking__gt=1)
 
     def filter_for_latest_refresh_date_records(
         self,
         *,
         queryset: models.QuerySet,
+        use_current_view: bool = False,
+        includes_non_public: bool = False,
     ) -> models.QuerySet:
         """Filters the given `queryset` to ensure the latest record is returned for each individual date
 
@@ -387,46 +708,77 @@ class CoreTimeSeriesQuerySet(models.QuerySet):
             so that we don't simply return the latest round
             in its entirety but rather the overall result
             which return the most recent record
-            for the individual dates
+            for the individual dates.
+
+            This will partition the `queryset`
+            and returns records with the latest `refresh_date`
+            from each window.
+            As such the selection is resolved by the database
+            as part of the same query as the rest of the `queryset`.
+
+            If `use_current_view` is True, then the ranking is skipped.
+            Instead, the records are joined onto the `CoreTimeSeriesCurrentView`,
+            which the ingestion keeps up to date with the latest records.
+            Note that the current view ranks the records within each
+            (metric, geography, stratum, age, sex, date, is_public).
+            And any other filters on the `queryset` are applied
+            to the latest records, rather than ahead of the ranking.
+            So if the `queryset` `includes_non_public` records,
+            then the live public and non-public records
+            are also ranked against each other.
 
         Args:
             queryset: The queryset to filter against
+            use_current_view: Boolean switch to read the latest records
+                from the `CoreTimeSeriesCurrentView`.
+                Defaults to False.
+            includes_non_public: Boolean to indicate whether
+                the `queryset` holds non-public records
+                alongside the public records.
+                Only used if `use_current_view` is True.
+                Defaults to False.
 
         Returns:
             A new filtered queryset containing
             only the latest records for each date
 
         """
-        latest_record_ids: list[int] = self._get_ids_of_latest_records(
-            queryset=queryset
+        if use_current_view:
+            queryset = self._filter_for_current_view_records(queryset=queryset)
+            if not includes_non_public:
+                return queryset
+
+        # Filter the queryset to get records with a ranking of 1.
+        # This will return the records with the latest `refresh_date` within each partition
+        queryset = self._partition_and_rank_data(
+            queryset=queryset, partition_fields=self.partition_fields
         )
-        return queryset.filter(pk__in=latest_record_ids)
+        return queryset.filter(refresh_ranking=1)
+
+    @staticmethod
+    def _filter_for_current_view_records(
+        *, queryset: models.QuerySet
+    ) -> models.QuerySet:
+        current_time = get_embargo_time()
+        return queryset.filter(build_live_time_series_filter(current_time=current_time))
 
     @classmethod
-    def _get_ids_of_latest_records(cls, queryset: Self) -> list[int]:
-        # Build a queryset labelled with the latest `refresh_date` for each `date`
-        latest_refresh_dates_associated_with_dates: CoreTimeSeriesQuerySet = (
-            queryset.values("date").annotate(latest_refresh=models.Max("refresh_date"))
+    def _partition_and_rank_data(
+        cls, *, queryset: Self, partition_fields: list[str]
+    ) -> Self:
+        # Use the window function to annotate
+        # the rank of each record within its partition.
+        # Records without a `refresh_date` are ranked last,
+        # so they are only considered live when no other record exists for that date
+        window = models.Window(
+            expression=Rank(),
+            partition_by=partition_fields,
+            order_by=models.F("refresh_date").desc(nulls_last=True),
         )
 
-        # Store the latest records for each day so that they can be mapped easily
-        # Note that this currently incurs execution of an additional db query
-        # The alternative was to possibly use `DISTINCT ON` instead
-        # but that is specific to the postgresql backend and would
-        # mean we would no longer be agnostic to the underlying database engine.
-        # Given the level of caching in the system, the performance penalty incurred
-        # here is not noticeable.
-        latest_records_map: dict[datetime.date, datetime.date] = {
-            record["date"]: record["latest_refresh"]
-            for record in latest_refresh_dates_associated_with_dates
-        }
-
-        # Filter the IDs for the records in memory to get the latest ones partitioned by each date
-        return [
-            record.id
-            for record in queryset
-            if record.refresh_date == latest_records_map.get(record.date)
-        ]
+        # Annotate each record with a calculated ranking.
+        # Whereby the `refresh_ranking` is determined by the latest `refresh_date`
+        return queryset.annotate(refresh_ranking=window)
 
     @staticmethod
     def _annotate_latest_date_on_queryset(
@@ -530,6 +882,36 @@ class CoreTimeSeriesQuerySet(models.QuerySet):
         except self.model.DoesNotExist:
             return None
 
+    def find_latest_refresh_date_and_released_embargo_for_metrics(
+        self, *, metrics: Iterable[str]
+    ) -> tuple[datetime.datetime | None, datetime.datetime | None]:
+        """Finds the latest `refresh_date` and the latest released `embargo` for the associated `metrics`
+
+        Args:
+            metrics: Iterable of metric names
+                to search the latest `refresh_date`
+                and `embargo` timestamps against.
+
+        Returns:
+            Tuple of the latest `refresh_date`
+            and the latest `embargo` which has been released.
+            Either of which will be None if no data could be found.
+
+        """
+        current_time = get_embargo_time()
+        aggregation: dict[str, datetime.datetime | None] = self.filter(
+            metric__name__in=metrics
+        ).aggregate(
+            latest_refresh_date=models.Max("refresh_date"),
+            latest_released_embargo=models.Max(
+                "embargo", filter=models.Q(embargo__lte=current_time)
+            ),
+        )
+        return (
+            aggregation["latest_refresh_date"],
+            aggregation["latest_released_embargo"],
+        )
+
 
 class CoreTimeSeriesManager(models.Manager):
     """Custom model manager class for the `TimeSeries` model."""
@@ -553,6 +935,7 @@ class CoreTimeSeriesManager(models.Manager):
         metric_value_ranges: list[str | float | int] | None = None,
         rbac_permissions: Iterable[RBACPermission] | None = None,
         permission_sets: PermissionSetsType | None = None,
+        use_current_view: bool = False,
     ) -> CoreTimeSeriesQuerySet:
         """Filters for a 2-item object by the given params. Slices all values older than the `date_from`.
 
@@ -600,6 +983,9 @@ class CoreTimeSeriesManager(models.Manager):
                 between 0 -> 80 AND 90 -> 100,
                 this can be provided as `[(0, 80), (90, 100)]`.
             permission_sets: The JWT permissions extracted from the Cognito token.
+            use_current_view: Boolean switch to read the latest records
+                from the `CoreTimeSeriesCurrentView`.
+                Defaults to False.
 
         Notes:
             If we have the following input `queryset`:
@@ -645,6 +1031,131 @@ class CoreTimeSeriesManager(models.Manager):
             age=age,
             metric_value_ranges=metric_value_ranges,
             permission_sets=permission_sets,
+            use_current_view=use_current_view,
+        )
+
+    def query_for_data_for_series(
+        self,
+        *,
+        topic: str,
+        metric: str,
+        date_from: datetime.date,
+        series: list[dict[str, str]],
+        date_to: datetime.date | None = None,
+        fields_to_export: list[str | None],
+        field_to_order_by: str = "date",
+        theme: str = "",
+        sub_theme: str = "",
+        metric_value_ranges: list[tuple[str | float | int]] | None = None,
+        permission_sets: PermissionSetsType | None = None,
+        use_current_view: bool = False,
+    ) -> list[SERIES_RESULT_TYPE]:
+        """Fetches the data for multiple series of the same metric in 1 query, which is then partitioned in memory
+
+        Notes:
+            This is the batched equivalent of calling `query_for_data()`
+            for each of the given `series`.
+            See `CoreTimeSeriesQuerySet.query_for_data_for_series()`
+
+        Args:
+            topic: The name of the disease being queried.
+                E.g. `COVID-19`
+            metric: The name of the metric being queried.
+                E.g. `COVID-19_deaths_ONSByDay`
+            date_from: The datetime object to begin the query from.
+            series: List of dicts, each of which holds the
+                `geography`, `geography_type`, `stratum`, `sex` and `age`
+                of an individual series.
+            date_to: The datetime object to end the query at.
+            fields_to_export: List of fields to be exported for each record.
+            field_to_order_by: The name of the field to order
+                the records of each series in ascending order by.
+                Defaults to `date`.
+            theme: The name of the theme being queried.
+            sub_theme: The name of the sub theme being queried.
+            metric_value_ranges: List of tuples whereby each
+                tuple represents a permissible metric value range.
+            permission_sets: The JWT permissions extracted from the Cognito token.
+            use_current_view: Boolean switch to read the latest records
+                from the `CoreTimeSeriesCurrentView`.
+                Defaults to False.
+
+        Returns:
+            List of tuples in the same order as the given `series`.
+            Each tuple contains the list of exported records for that series
+            along with the latest date of those records
+
+        """
+        return self.get_queryset().query_for_data_for_series(
+            topic=topic,
+            metric=metric,
+            date_from=date_from,
+            series=series,
+            date_to=date_to,
+            fields_to_export=fields_to_export,
+            field_to_order_by=field_to_order_by,
+            theme=theme,
+            sub_theme=sub_theme,
+            metric_value_ranges=metric_value_ranges,
+            permission_sets=permission_sets,
+            use_current_view=use_current_view,
+        )
+
+    def query_for_latest_values_by_geography(
+        self,
+        *,
+        topic: str,
+        metric: str,
+        geographies: Iterable[str],
+        date_from: datetime.date,
+        date_to: datetime.date | None = None,
+        geography_type: str | None = None,
+        stratum: str | None = None,
+        sex: str | None = None,
+        age: str | None = None,
+        use_current_view: bool = False,
+    ) -> dict[str, LATEST_VALUE_RESULT_TYPE]:
+        """Fetches the latest record for each of the given `geographies` in 1 query
+
+        Notes:
+            This is the batched equivalent of taking the first record
+            from `query_for_data()` ordered by `-date`
+            for each of the given `geographies`.
+            See `CoreTimeSeriesQuerySet.query_for_latest_values_by_geography()`
+
+        Args:
+            topic: The name of the disease being queried.
+                E.g. `COVID-19`
+            metric: The name of the metric being queried.
+                E.g. `COVID-19_deaths_ONSByDay`
+            geographies: The names of the geographies to fetch the latest records for.
+            date_from: The datetime object to begin the query from.
+            date_to: The datetime object to end the query at.
+            geography_type: The name of the type of geography to apply additional filtering.
+            stratum: The value of the stratum to apply additional filtering to.
+            sex: The gender to apply additional filtering to.
+            age: The age range to apply additional filtering to.
+            use_current_view: Boolean switch to read the latest records
+                from the `CoreTimeSeriesCurrentView`.
+                Defaults to False.
+
+        Returns:
+            Dict keyed by the name of each geography which has a live record.
+            Each value is a dict of the `geography_code`, `date` and `metric_value`
+            of the latest record for that geography
+
+        """
+        return self.get_queryset().query_for_latest_values_by_geography(
+            topic=topic,
+            metric=metric,
+            geographies=geographies,
+            date_from=date_from,
+            date_to=date_to,
+            geography_type=geography_type,
+            stratum=stratum,
+            sex=sex,
+            age=age,
+            use_current_view=use_current_view,
         )
 
     def query_for_superseded_data(
@@ -786,6 +1297,63 @@ class CoreTimeSeriesManager(models.Manager):
         )
         superseded_records.delete()
 
+    def refresh_current_view(
+        self,
+        *,
+        metric: str,
+        geography: str,
+        geography_type: str,
+        geography_code: str,
+        stratum: str,
+        sex: str,
+        age: str,
+    ) -> None:
+        """Rebuilds the `CoreTimeSeriesCurrentView` entries for the records of the given series
+
+        Notes:
+            Both the public and non-public records of the series are refreshed.
+            This should be called after any stale records have been deleted
+            and the new records have been written,
+            within the same transaction.
+
+        Args:
+            metric: The name of the metric being queried.
+                E.g. `COVID-19_deaths_ONSByDay`
+            geography: The name of the geography to apply additional filtering to.
+                E.g. `England`
+            geography_type: The name of the type of geography to apply additional filtering.
+                E.g. `Nation`
+            geography_code: Code associated with the geography being queried.
+                E.g. "E45000010"
+            stratum: The value of the stratum to apply additional filtering to.
+                E.g. `default`, which would be used to capture all strata.
+            sex: The gender to apply additional filtering to.
+                E.g. `F`, would be used to capture Females.
+                Note that options are `M`, `F`, or `ALL`.
+            age: The age range to apply additional filtering to.
+                E.g. `0_4` would be used to capture the age of 0-4 years old
+
+        Returns:
+            None
+
+        """
+        time_series = self.filter(
+            metric__name=metric,
+            geography__name=geography,
+            geography__geography_code=geography_code,
+            geography__geography_type__name=geography_type,
+            stratum__name=stratum,
+            age__name=age,
+            sex=sex,
+        )
+        current_view_model = self.model.current_view_entry.related.related_model
+        current_view_model.objects.refresh_entries(
+            time_series=time_series,
+            partition_fields=CURRENT_VIEW_PARTITION_FIELDS,
+            # Records without a `refresh_date` are ranked last when reading the data
+            null_refresh_date_is_latest=False,
+        )
+
     def find_latest_released_embargo_for_metrics(
         self, metrics: set[str]
     ) -> datetime.datetime:
@@ -804,3 +1372,28 @@ class CoreTimeSeriesManager(models.Manager):
         return self.get_queryset().find_latest_released_embargo_for_metrics(
             metrics=metrics
         )
+
+    def find_latest_refresh_date_and_released_embargo_for_metrics(
+        self, *, metrics: Iterable[str]
+    ) -> tuple[datetime.datetime | None, datetime.datetime | None]:
+        """Finds the latest `refresh_date` and the latest released `embargo` for the associated `metrics`
+
+        Notes:
+            Between them, these 2 timestamps change
+            whenever new `CoreTimeSeries` records are ingested for the `metrics`
+            and whenever previously ingested records come out of embargo.
+
+        Args:
+            metrics: Iterable of metric names
+                to search the latest `refresh_date`
+                and `embargo` timestamps against.
+
+        Returns:
+            Tuple of the latest `refresh_date`
+            and the latest `embargo` which has been released.
+            Either of which will be None if no data could be found.
+
+        """
+        return self.get_queryset().find_latest_refresh_date_and_released_embargo_for_metrics(
+            metrics=metrics
+        )
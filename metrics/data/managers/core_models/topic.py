@@ -50,18 +50,19 @@ class TopicQuerySet(models.QuerySet):
             A tuple of (theme_id, sub_theme_id, topic_id) if found,
             or (None, None, None) if not found.
         """
-        record = self.filter(
-            sub_theme__theme__name=theme_name,
-            sub_theme__name=sub_theme_name,
-            name=topic_name,
-        ).first()
+        record = (
+            self.filter(
+                sub_theme__theme__name=theme_name,
+                sub_theme__name=sub_theme_name,
+                name=topic_name,
+            )
+            .values_list("sub_theme__theme_id", "sub_theme_id", "id")
+            .first()
+        )
 
         if record:
-            return (
-                int(record.sub_theme.theme_id),
-                int(record.sub_theme_id),
-                int(record.id),
-            )
+            theme_id, sub_theme_id, topic_id = record
+            return int(theme_id), int(sub_theme_id), int(topic_id)
 
         return (
             None,
@@ -0,0 +1,195 @@
+"""
+This file contains the custom Manager class shared by the
+`CoreTimeSeriesCurrentView` and `APITimeSeriesCurrentView` models.
+
+Each current view holds 1 entry for every time series record
+which is live at some point in time, along with the window in which it is live.
+So that the latest records can be read without ranking them on every request.
+"""
+
+import datetime
+import itertools
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from django.db import models
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+class TimeSeriesRecord(NamedTuple):
+    id: int
+    refresh_date: datetime.datetime | None
+    embargo: datetime.datetime | None
+
+
+class CurrentViewEntry(NamedTuple):
+    time_series_id: int
+    released_at: datetime.datetime | None
+    superseded_at: datetime.datetime | None
+
+
+def build_live_time_series_filter(*, current_time: datetime.datetime) -> models.Q:
+    """Builds the filter for time series records which are live at the given `current_time`
+
+    Notes:
+        This is to be applied to a queryset of the time series model
+        which is the target of the current view model.
+        So the lookups are made through the `current_view_entry` relation.
+
+    Args:
+        current_time: The time at which the records should be live
+
+    Returns:
+        A `Q` object which filters for the live time series records
+
+    """
+    return (
+        models.Q(current_view_entry__isnull=False)
+        & (
+            models.Q(current_view_entry__released_at__lte=current_time)
+            | models.Q(current_view_entry__released_at=None)
+        )
+        & (
+            models.Q(current_view_entry__superseded_at__gt=current_time)
+            | models.Q(current_view_entry__superseded_at=None)
+        )
+    )
+
+
+def build_current_view_entries(
+    *, records: Iterable[TimeSeriesRecord], null_refresh_date_is_latest: bool
+) -> Iterator[CurrentViewEntry]:
+    """Builds the current view entries for the `records` of a single partition
+
+    Notes:
+        At any given time, the live records of a partition are those
+        with the latest `refresh_date` out of the records which have been released.
+        A record with an `embargo` of None is always released.
+
+        So each record is live from its own `embargo`,
+        until the earliest `embargo` of any record with a later `refresh_date`.
+        Records which are superseded before they are released
+        are never live and are not given an entry.
+
+    Args:
+        records: The time series records of a single partition
+        null_refresh_date_is_latest: Switch to rank records
+            without a `refresh_date` ahead of all other records.
+            If False, they are ranked behind all other records instead.
+
+    Returns:
+        An iterator of `CurrentViewEntry` objects
+        for the records which are live at some point in time
+
+    """
+
+    def refresh_date_ranking(record: TimeSeriesRecord) -> tuple:
+        # Records are only compared by `refresh_date`
+        # when both of them have a `refresh_date`
+        has_refresh_date: bool = record.refresh_date is not None
+        if null_refresh_date_is_latest:
+            return not has_refresh_date, record.refresh_date
+        return has_refresh_date, record.refresh_date
+
+    ordered_records = sorted(records, key=refresh_date_ranking, reverse=True)
+
+    # None represents a record which has not been superseded
+    superseded_at: datetime.datetime | None = None
+    for _, grouped_records in itertools.groupby(
+        ordered_records, key=refresh_date_ranking
+    ):
+        round_of_records = list(grouped_records)
+
+        for record in round_of_records:
+            released_at: datetime.datetime | None = record.embargo
+            if (
+                superseded_at is None
+                or released_at is None
+                or released_at < superseded_at
+            ):
+                yield CurrentViewEntry(
+                    time_series_id=record.id,
+                    released_at=released_at,
+                    superseded_at=superseded_at,
+                )
+
+        embargoes = [record.embargo for record in round_of_records]
+        if None in embargoes:
+            # This round has always been released,
+            # so none of the older records will ever be live
+            return
+
+        earliest_embargo: datetime.datetime = min(embargoes)
+        if superseded_at is None or earliest_embargo < superseded_at:
+            superseded_at = earliest_embargo
+
+
+class TimeSeriesCurrentViewManager(models.Manager):
+    """Custom model manager class for the `CoreTimeSeriesCurrentView` and `APITimeSeriesCurrentView` models."""
+
+    def refresh_entries(
+        self,
+        *,
+        time_series: models.QuerySet,
+        partition_fields: Iterable[str],
+        null_refresh_date_is_latest: bool,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Replaces the entries for the given `time_series` records
+
+        Notes:
+            The existing entries for the `time_series` are deleted
+            and rebuilt from the records in each partition.
+            As such, the `time_series` must hold every record
+            of each of the partitions it touches.
+
+            This should be called within the same transaction
+            as the writes to the `time_series` records.
+            So that readers never see a partially refreshed slice.
+
+        Args:
+            time_series: The queryset of time series records
+                to refresh the entries for
+            partition_fields: The fields of the time series model
+                which identify the partitions in which records supersede each other.
+                E.g. `["metric_id", ..., "date", "is_public"]`
+            null_refresh_date_is_latest: Switch to rank records
+                without a `refresh_date` ahead of all other records.
+                If False, they are ranked behind all other records instead.
+            batch_size: Controls the number of entries created
+                in a single write query to the database.
+                Defaults to `DEFAULT_BATCH_SIZE`.
+
+        Returns:
+            None
+
+        """
+        partition_fields = list(partition_fields)
+        rows = (
+            time_series.order_by(*partition_fields)
+            .values_list(*partition_fields, "id", "refresh_date", "embargo")
+            .iterator(chunk_size=batch_size)
+        )
+        number_of_partition_fields: int = len(partition_fields)
+
+        entries: Iterator[CurrentViewEntry] = itertools.chain.from_iterable(
+            build_current_view_entries(
+                records=(
+                    TimeSeriesRecord(*row[number_of_partition_fields:])
+                    for row in partition_rows
+                ),
+                null_refresh_date_is_latest=null_refresh_date_is_latest,
+            )
+            for _, partition_rows in itertools.groupby(
+                rows, key=lambda row: row[:number_of_partition_fields]
+            )
+        )
+
+        self.filter(time_series_id__in=time_series.values("id")).delete()
+
+        for batch in itertools.batched(entries, batch_size):
+            self.bulk_create(
+                objs=[self.model(**entry._asdict()) for entry in batch],
+                batch_size=batch_size,
+            )
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.17 on 2026-10-17 00:14
+
+import logging
+
+from django.db import migrations, models
+from django.db.backends.postgresql.schema import DatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+DIMENSION_FIELDS = (
+    "theme",
+    "sub_theme",
+    "topic",
+    "geography_type",
+    "geography",
+    "metric",
+    "is_public",
+)
+
+logger = logging.getLogger(__name__)
+
+
+def forwards_migration(apps: StateApps, schema_editor: DatabaseSchemaEditor) -> None:
+    APITimeSeries = apps.get_model("data", "APITimeSeries")
+    APITimeSeriesDimension = apps.get_model("data", "APITimeSeriesDimension")
+
+    dimensions = APITimeSeries.objects.values(*DIMENSION_FIELDS).distinct()
+    APITimeSeriesDimension.objects.bulk_create(
+        objs=[APITimeSeriesDimension(**dimension) for dimension in dimensions],
+        ignore_conflicts=True,
+    )
+    logger.info("Populated `APITimeSeriesDimension` from the `APITimeSeries` records")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data", "0043_alter_apitimeseries_metric_value_rename_second_category"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="APITimeSeriesDimension",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("theme", models.CharField(max_length=50)),
+                ("sub_theme", models.CharField(max_length=50)),
+                ("topic", models.CharField(max_length=50)),
+                ("geography_type", models.CharField(max_length=50)),
+                ("geography", models.CharField(max_length=100)),
+                ("metric", models.CharField(max_length=100)),
+                ("is_public", models.BooleanField(default=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "theme",
+                            "sub_theme",
+                            "topic",
+                            "geography_type",
+                            "geography",
+                            "metric",
+                            "is_public",
+                        ),
+                        name="The `APITimeSeriesDimension` record should be unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            code=forwards_migration,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
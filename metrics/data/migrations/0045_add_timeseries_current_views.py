@@ -0,0 +1,173 @@
+# Generated by Django 5.2.17 on 2026-10-17 00:41
+
+import logging
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.backends.postgresql.schema import DatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+CORE_TIME_SERIES_PARTITION_FIELDS = (
+    "metric",
+    "geography",
+    "stratum",
+    "age",
+    "sex",
+    "date",
+    "is_public",
+)
+API_TIME_SERIES_PARTITION_FIELDS = (
+    "theme",
+    "sub_theme",
+    "topic",
+    "metric",
+    "geography",
+    "geography_type",
+    "geography_code",
+    "stratum",
+    "age",
+    "sex",
+    "date",
+    "is_public",
+)
+
+# Each record is live from its own `embargo`,
+# until the earliest `embargo` of any record with a later `refresh_date`
+# within the same partition.
+# Records which are superseded before they are released are never live.
+# A later record without an `embargo` has always been released,
+# so it supersedes the record from the outset.
+POPULATE_CURRENT_VIEW_SQL = """
+INSERT INTO {current_view_table} (time_series_id, released_at, superseded_at)
+SELECT id, embargo, superseded_at
+FROM (
+    SELECT
+        id,
+        embargo,
+        MIN(embargo) OVER later_records AS superseded_at,
+        COUNT(*) OVER later_records - COUNT(embargo) OVER later_records
+            AS number_of_later_records_without_embargo
+    FROM {time_series_table}
+    WINDOW later_records AS (
+        PARTITION BY {partition_columns}
+        ORDER BY refresh_date DESC NULLS {null_refresh_date_position}
+        RANGE BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW EXCLUDE GROUP
+    )
+) AS ranked_records
+WHERE number_of_later_records_without_embargo = 0
+AND (superseded_at IS NULL OR embargo IS NULL OR embargo < superseded_at)
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def _populate_current_view(
+    *,
+    schema_editor: DatabaseSchemaEditor,
+    time_series_model: type[models.Model],
+    current_view_model: type[models.Model],
+    partition_fields: tuple[str, ...],
+    null_refresh_date_is_latest: bool,
+) -> None:
+    partition_columns: str = ", ".join(
+        schema_editor.quote_name(time_series_model._meta.get_field(field).column)
+        for field in partition_fields
+    )
+    schema_editor.execute(
+        POPULATE_CURRENT_VIEW_SQL.format(
+            current_view_table=schema_editor.quote_name(
+                current_view_model._meta.db_table
+            ),
+            time_series_table=schema_editor.quote_name(
+                time_series_model._meta.db_table
+            ),
+            partition_columns=partition_columns,
+            null_refresh_date_position=(
+                "FIRST" if null_refresh_date_is_latest else "LAST"
+            ),
+        )
+    )
+
+
+def forwards_migration(apps: StateApps, schema_editor: DatabaseSchemaEditor) -> None:
+    _populate_current_view(
+        schema_editor=schema_editor,
+        time_series_model=apps.get_model("data", "CoreTimeSeries"),
+        current_view_model=apps.get_model("data", "CoreTimeSeriesCurrentView"),
+        partition_fields=CORE_TIME_SERIES_PARTITION_FIELDS,
+        null_refresh_date_is_latest=False,
+    )
+    logger.info(
+        "Populated `CoreTimeSeriesCurrentView` from the `CoreTimeSeries` records"
+    )
+
+    _populate_current_view(
+        schema_editor=schema_editor,
+        time_series_model=apps.get_model("data", "APITimeSeries"),
+        current_view_model=apps.get_model("data", "APITimeSeriesCurrentView"),
+        partition_fields=API_TIME_SERIES_PARTITION_FIELDS,
+        null_refresh_date_is_latest=True,
+    )
+    logger.info("Populated `APITimeSeriesCurrentView` from the `APITimeSeries` records")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("data", "0044_add_apitimeseriesdimension"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="APITimeSeriesCurrentView",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("released_at", models.DateTimeField(null=True)),
+                ("superseded_at", models.DateTimeField(null=True)),
+                (
+                    "time_series",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="current_view_entry",
+                        to="data.apitimeseries",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="CoreTimeSeriesCurrentView",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("released_at", models.DateTimeField(null=True)),
+                ("superseded_at", models.DateTimeField(null=True)),
+                (
+                    "time_series",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="current_view_entry",
+                        to="data.coretimeseries",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(
+            code=forwards_migration,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -2,6 +2,12 @@ from django.db import models
 from django.db.models import Q
 
 from metrics.data.managers.api_models.time_series import APITimeSeriesManager
+from metrics.data.managers.api_models.time_series_dimension import (
+    APITimeSeriesDimensionManager,
+)
+from metrics.data.managers.time_series_current_view import (
+    TimeSeriesCurrentViewManager,
+)
 from metrics.data.models.constants import (
     CHAR_COLUMN_MAX_CONSTRAINT,
     GEOGRAPHY_CODE_MAX_CHAR_CONSTRAINT,
@@ -92,3 +98,82 @@ class APITimeSeries(models.Model):
             f"stratum '{self.stratum}', "
             f"value: {self.metric_value}"
         )
+
+
+class APITimeSeriesDimension(models.Model):
+    """Catalogue of the distinct hierarchies held in the `APITimeSeries` table
+
+    Notes:
+        This holds 1 row per distinct combination of
+        (theme, sub_theme, topic, geography_type, geography, metric, is_public).
+        Rows are added by the ingestion as `APITimeSeries` records are created.
+        So that the public API can navigate the hierarchy
+        without scanning the `APITimeSeries` table for distinct values.
+
+    """
+
+    theme = models.CharField(max_length=CHAR_COLUMN_MAX_CONSTRAINT)
+    sub_theme = models.CharField(max_length=CHAR_COLUMN_MAX_CONSTRAINT)
+    topic = models.CharField(max_length=CHAR_COLUMN_MAX_CONSTRAINT)
+    geography_type = models.CharField(max_length=CHAR_COLUMN_MAX_CONSTRAINT)
+    geography = models.CharField(max_length=LARGE_CHAR_COLUMN_MAX_CONSTRAINT)
+    metric = models.CharField(max_length=LARGE_CHAR_COLUMN_MAX_CONSTRAINT)
+
+    is_public = models.BooleanField(default=True, null=False)
+
+    objects = APITimeSeriesDimensionManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=(
+                    "theme",
+                    "sub_theme",
+                    "topic",
+                    "geography_type",
+                    "geography",
+                    "metric",
+                    "is_public",
+                ),
+                name="The `APITimeSeriesDimension` record should be unique",
+            )
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.__class__.__name__} for "
+            f"{self.theme} / {self.sub_theme} / {self.topic} / "
+            f"{self.geography_type} / {self.geography} / {self.metric}"
+        )
+
+
+class APITimeSeriesCurrentView(models.Model):
+    """Current view of the `APITimeSeries` records which are live at some point in time
+
+    Notes:
+        This holds 1 entry per `APITimeSeries` record which is,
+        was or will be the latest record for its
+        (metric, geography, stratum, age, sex, date, is_public).
+        The record is live from `released_at` until `superseded_at`.
+        Where None represents an open-ended window.
+
+        The entries are refreshed by the ingestion
+        for each series as its records are written.
+
+    """
+
+    time_series = models.OneToOneField(
+        to=APITimeSeries,
+        on_delete=models.CASCADE,
+        related_name="current_view_entry",
+    )
+    released_at = models.DateTimeField(null=True)
+    superseded_at = models.DateTimeField(null=True)
+
+    objects = TimeSeriesCurrentViewManager()
+
+    def __str__(self):
+        return (
+            f"{self.__class__.__name__} for `APITimeSeries` {self.time_series_id}, "
+            f"live from {self.released_at} until {self.superseded_at}"
+        )
@@ -10,4 +10,4 @@ from .supporting import (
     Theme,
     Topic,
 )
-from .timeseries import CoreTimeSeries
+from .timeseries import CoreTimeSeries, CoreTimeSeriesCurrentView
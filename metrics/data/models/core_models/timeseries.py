@@ -3,6 +3,9 @@ from django.db.models import Q
 
 from metrics.data.enums import TimePeriod
 from metrics.data.managers.core_models.time_series import CoreTimeSeriesManager
+from metrics.data.managers.time_series_current_view import (
+    TimeSeriesCurrentViewManager,
+)
 from metrics.data.models.constants import (
     METRIC_FREQUENCY_MAX_CHAR_CONSTRAINT,
     METRIC_VALUE_DECIMAL_PLACES,
@@ -89,3 +92,35 @@ class CoreTimeSeries(models.Model):
 
     def __str__(self):
         return f"Core Timeseries Data for {self.date}, metric '{self.metric.name}', value: {self.metric_value}"
+
+
+class CoreTimeSeriesCurrentView(models.Model):
+    """Current view of the `CoreTimeSeries` records which are live at some point in time
+
+    Notes:
+        This holds 1 entry per `CoreTimeSeries` record which is,
+        was or will be the latest record for its
+        (metric, geography, stratum, age, sex, date, is_public).
+        The record is live from `released_at` until `superseded_at`.
+        Where None represents an open-ended window.
+
+        The entries are refreshed by the ingestion
+        for each series as its records are written.
+
+    """
+
+    time_series = models.OneToOneField(
+        to=CoreTimeSeries,
+        on_delete=models.CASCADE,
+        related_name="current_view_entry",
+    )
+    released_at = models.DateTimeField(null=True)
+    superseded_at = models.DateTimeField(null=True)
+
+    objects = TimeSeriesCurrentViewManager()
+
+    def __str__(self):
+        return (
+            f"{self.__class__.__name__} for `CoreTimeSeries` {self.time_series_id}, "
+            f"live from {self.released_at} until {self.superseded_at}"
+        )
@@ -0,0 +1,326 @@
+import datetime
+import hashlib
+import io
+import json
+import logging
+import shutil
+import tempfile
+import zipfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import BinaryIO, Self
+
+from django.utils import timezone
+
+from caching.private_api.handlers import get_all_downloads
+from metrics.domain.bulk_downloads.member_index import (
+    DATA_VERSION_RESOLVER_TYPE,
+    DownloadMemberIndex,
+)
+from metrics.domain.bulk_downloads.storage import (
+    BulkDownloadsStorage,
+    get_bulk_downloads_storage,
+)
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FILE_FORMATS = ("csv", "json")
+DOWNLOADS_GETTER_TYPE = Callable[..., list[dict]]
+
+
+def build_archive_name(*, file_format: str) -> str:
+    return f"bulk_downloads_{file_format}.zip"
+
+
+def build_manifest_name(*, file_format: str) -> str:
+    return f"bulk_downloads_{file_format}_manifest.json"
+
+
+@dataclass(frozen=True)
+class ArchiveManifest:
+    """Describes a precomputed bulk downloads archive
+
+    Attributes:
+        file_format: The format of the downloads in the archive. E.g. "csv"
+        content_hash: The sha256 hex digest of the paths and contents
+            of all the members of the archive
+        last_modified: When the contents of the archive last changed
+        members: Mapping of the fingerprint of each download
+            to the position of its member within the archive.
+            This is used to reuse the unchanged members
+            when the archive is next rebuilt
+
+    """
+
+    file_format: str
+    content_hash: str
+    last_modified: datetime.datetime
+    members: dict[str, int]
+
+    def to_json(self) -> bytes:
+        return json.dumps(
+            {
+                "file_format": self.file_format,
+                "content_hash": self.content_hash,
+                "last_modified": self.last_modified.isoformat(),
+                "members": self.members,
+            }
+        ).encode()
+
+    @classmethod
+    def from_json(cls, data: bytes) -> Self:
+        manifest = json.loads(data)
+        return cls(
+            file_format=manifest["file_format"],
+            content_hash=manifest["content_hash"],
+            last_modified=datetime.datetime.fromisoformat(manifest["last_modified"]),
+            members=manifest["members"],
+        )
+
+
+@dataclass(frozen=True)
+class BulkDownloadsArchive:
+    """A precomputed bulk downloads archive which has been opened for reading
+
+    Attributes:
+        manifest: The `ArchiveManifest` describing the archive
+        file: The binary file-like object of the archive,
+            which should be closed by the caller
+
+    """
+
+    manifest: ArchiveManifest
+    file: BinaryIO
+
+
+def load_manifest(
+    *, storage: BulkDownloadsStorage, file_format: str
+) -> ArchiveManifest | None:
+    """Loads the manifest of the stored archive for the given `file_format`
+
+    Args:
+        storage: The `BulkDownloadsStorage` in which the archive is held
+        file_format: The format of the downloads in the archive
+
+    Returns:
+        The `ArchiveManifest` or None if no archive has been built yet
+
+    """
+    manifest_name: str = build_manifest_name(file_format=file_format)
+    data: bytes | None = storage.load(name=manifest_name)
+    if data is None:
+        return None
+
+    try:
+        return ArchiveManifest.from_json(data)
+    except (ValueError, KeyError):
+        logger.warning(
+            "Discarding invalid bulk downloads manifest for `%s`", file_format
+        )
+        return None
+
+
+def open_bulk_downloads_archive(
+    *, storage: BulkDownloadsStorage, file_format: str
+) -> BulkDownloadsArchive | None:
+    """Opens the stored archive for the given `file_format` for reading
+
+    Args:
+        storage: The `BulkDownloadsStorage` in which the archive is held
+        file_format: The format of the downloads in the archive
+
+    Returns:
+        The opened `BulkDownloadsArchive`
+        or None if no archive has been built yet
+
+    """
+    manifest: ArchiveManifest | None = load_manifest(
+        storage=storage, file_format=file_format
+    )
+    if manifest is None:
+        return None
+
+    archive_name: str = build_archive_name(file_format=file_format)
+    file: BinaryIO | None = storage.open(name=archive_name)
+    if file is None:
+        return None
+
+    return BulkDownloadsArchive(manifest=manifest, file=file)
+
+
+def _open_previous_archive(
+    *,
+    storage: BulkDownloadsStorage,
+    file_format: str,
+    local_copy: BinaryIO,
+) -> zipfile.ZipFile | None:
+    # The previous archive is copied to the local disk first,
+    # since the members are read by random access
+    archive_name: str = build_archive_name(file_format=file_format)
+    file: BinaryIO | None = storage.open(name=archive_name)
+    if file is None:
+        return None
+
+    try:
+        shutil.copyfileobj(file, local_copy)
+    finally:
+        file.close()
+
+    try:
+        return zipfile.ZipFile(local_copy)
+    except zipfile.BadZipFile:
+        logger.warning(
+            "Unable to read previous bulk downloads archive for `%s`", file_format
+        )
+        return None
+
+
+def _write_downloads_to_archive(
+    *, downloads: list[dict], file: BinaryIO
+) -> tuple[dict[str, int], str]:
+    members: dict[str, int] = {}
+    content_hash = hashlib.sha256()
+
+    with zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED) as zipf:
+        for download_group in downloads:
+            for download in download_group["downloads"]:
+                path = f"{download_group['directory_name']}/{download['name']}"
+                content: bytes = download["content"]
+
+                fingerprint: str | None = download.get("fingerprint")
+                if fingerprint is not None:
+                    members[fingerprint] = len(zipf.infolist())
+
+                zipf.writestr(path, content)
+                content_hash.update(path.encode())
+                content_hash.update(hashlib.sha256(content).digest())
+
+    return members, content_hash.hexdigest()
+
+
+def build_bulk_downloads_archive(
+    *,
+    storage: BulkDownloadsStorage,
+    file_format: str,
+    data_version_resolver: DATA_VERSION_RESOLVER_TYPE,
+    downloads_getter: DOWNLOADS_GETTER_TYPE = get_all_downloads,
+) -> ArchiveManifest:
+    """Builds the bulk downloads archive for the given `file_format` and saves it in the `storage`
+
+    Notes:
+        The archive is built on the local disk rather than in memory.
+        Downloads whose request payload and underlying data
+        have not changed since the previous archive was built
+        are copied over from the previous archive,
+        instead of being requested from the downloads endpoints again.
+
+        If the contents of the archive have not changed at all
+        and the previous archive could still be read,
+        then the stored archive is left untouched.
+
+    Args:
+        storage: The `BulkDownloadsStorage` in which to save the archive
+        file_format: The format of the downloads. Either "csv" or "json"
+        data_version_resolver: Callable which returns the version
+            of the data for the given metric names.
+            Used to tell which downloads have changed
+            since the previous archive was built
+        downloads_getter: Callable used to gather all the downloads.
+            Defaults to `get_all_downloads()`
+
+    Returns:
+        The `ArchiveManifest` of the stored archive
+
+    """
+    previous_manifest: ArchiveManifest | None = load_manifest(
+        storage=storage, file_format=file_format
+    )
+
+    with (
+        tempfile.TemporaryFile() as previous_archive_file,
+        tempfile.TemporaryFile() as archive_file,
+    ):
+        previous_archive: zipfile.ZipFile | None = None
+        if previous_manifest is not None:
+            previous_archive = _open_previous_archive(
+                storage=storage,
+                file_format=file_format,
+                local_copy=previous_archive_file,
+            )
+
+        download_member_index = DownloadMemberIndex(
+            data_version_resolver=data_version_resolver,
+            previous_archive=previous_archive,
+            previous_members=previous_manifest.members if previous_archive else None,
+        )
+        downloads: list[dict] = downloads_getter(
+            file_format=file_format, download_member_index=download_member_index
+        )
+        logger.info(
+            "Reused %s and fetched %s downloads for the `%s` bulk downloads archive",
+            download_member_index.reused_count,
+            download_member_index.fetched_count,
+            file_format,
+        )
+
+        members, content_hash = _write_downloads_to_archive(
+            downloads=downloads, file=archive_file
+        )
+
+        if (
+            previous_archive is not None
+            and previous_manifest.content_hash == content_hash
+        ):
+            logger.info("The `%s` bulk downloads archive is unchanged", file_format)
+            return previous_manifest
+
+        archive_file.seek(0)
+        storage.save(
+            name=build_archive_name(file_format=file_format), file=archive_file
+        )
+
+    manifest = ArchiveManifest(
+        file_format=file_format,
+        content_hash=content_hash,
+        last_modified=timezone.now(),
+        members=members,
+    )
+    storage.save(
+        name=build_manifest_name(file_format=file_format),
+        file=io.BytesIO(manifest.to_json()),
+    )
+    logger.info("Saved the `%s` bulk downloads archive", file_format)
+    return manifest
+
+
+def rebuild_bulk_downloads_archives(
+    *,
+    data_version_resolver: DATA_VERSION_RESOLVER_TYPE,
+    storage: BulkDownloadsStorage | None = None,
+) -> list[ArchiveManifest]:
+    """Rebuilds the bulk downloads archives for each of the supported file formats
+
+    Args:
+        data_version_resolver: Callable which returns the version
+            of the data for the given metric names
+        storage: The `BulkDownloadsStorage` in which to save the archives.
+            Defaults to the storage configured by `BULK_DOWNLOADS_STORAGE_BACKEND`
+
+    Returns:
+        List of the `ArchiveManifest` for each of the stored archives.
+        This will be empty if precomputed bulk downloads archives have been disabled
+
+    """
+    storage = storage or get_bulk_downloads_storage()
+    if storage is None:
+        logger.info("Precomputed bulk downloads archives are disabled")
+        return []
+
+    return [
+        build_bulk_downloads_archive(
+            storage=storage,
+            file_format=file_format,
+            data_version_resolver=data_version_resolver,
+        )
+        for file_format in SUPPORTED_FILE_FORMATS
+    ]
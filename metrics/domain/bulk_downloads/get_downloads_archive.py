@@ -1,7 +1,18 @@
 import datetime
+import logging
+from collections.abc import Iterator
 
-from caching.private_api.handlers import get_all_downloads
-from metrics.domain.exports.zip import write_data_to_zip
+from caching.private_api.handlers import get_all_downloads, iterate_all_downloads
+from metrics.domain.bulk_downloads.archive import (
+    BulkDownloadsArchive,
+    build_bulk_downloads_archive,
+    open_bulk_downloads_archive,
+)
+from metrics.domain.bulk_downloads.member_index import DATA_VERSION_RESOLVER_TYPE
+from metrics.domain.bulk_downloads.storage import BulkDownloadsStorage
+from metrics.domain.exports.zip import stream_data_to_zip, write_data_to_zip
+
+logger = logging.getLogger(__name__)
 
 
 def generate_zip_filename() -> str:
@@ -29,3 +40,62 @@ def get_bulk_downloads_archive(*, file_format: str) -> dict[str, zip]:
         "zip_file_name": zip_file_name,
         "zip_file_data": zip_file_data,
     }
+
+
+def stream_bulk_downloads_archive(*, file_format: str) -> Iterator[bytes]:
+    """Lazily collects all current downloads and yields the packaged zip file in chunks.
+
+    Notes:
+        The downloads are collected 1 page at a time
+        and compressed as soon as each page has been collected.
+        So the first chunk of the zip file is yielded
+        before the remaining pages have been collected,
+        and the zip file is never held in memory in full.
+
+    Args:
+        file_format: The format of the downloads. Either "csv" or "json"
+
+    Returns:
+        An iterator of the chunks of the zip file of the compressed download data.
+    """
+    downloads = iterate_all_downloads(file_format=file_format)
+    return stream_data_to_zip(downloads=downloads)
+
+
+def get_precomputed_bulk_downloads_archive(
+    *,
+    file_format: str,
+    storage: BulkDownloadsStorage,
+    data_version_resolver: DATA_VERSION_RESOLVER_TYPE,
+) -> BulkDownloadsArchive:
+    """Opens the precomputed bulk downloads archive, building it first if it has not been built yet
+
+    Notes:
+        The archives are normally built ahead of time
+        after each refresh of the default cache.
+        So the archive is only built here on the very first request
+        when the application has been freshly deployed.
+
+    Args:
+        file_format: The format of the downloads. Either "csv" or "json"
+        storage: The `BulkDownloadsStorage` in which the archive is held
+        data_version_resolver: Callable which returns the version
+            of the data for the given metric names
+
+    Returns:
+        The opened `BulkDownloadsArchive`
+
+    """
+    archive: BulkDownloadsArchive | None = open_bulk_downloads_archive(
+        storage=storage, file_format=file_format
+    )
+    if archive is not None:
+        return archive
+
+    logger.info("No `%s` bulk downloads archive found, building it now", file_format)
+    build_bulk_downloads_archive(
+        storage=storage,
+        file_format=file_format,
+        data_version_resolver=data_version_resolver,
+    )
+    return open_bulk_downloads_archive(storage=storage, file_format=file_format)
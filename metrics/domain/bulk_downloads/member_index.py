@@ -0,0 +1,114 @@
+import hashlib
+import json
+import logging
+import zipfile
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+DATA_VERSION_RESOLVER_TYPE = Callable[[frozenset[str]], str]
+
+
+def extract_metric_names(*, request_data: dict | list) -> frozenset[str]:
+    """Extracts the names of all the metrics referenced anywhere in the given `request_data`
+
+    Args:
+        request_data: The payload for one of the downloads endpoints
+
+    Returns:
+        The distinct names of the metrics in the payload
+
+    """
+    metric_names: set[str] = set()
+    values = request_data.values() if isinstance(request_data, dict) else request_data
+
+    if isinstance(request_data, dict) and isinstance(request_data.get("metric"), str):
+        metric_names.add(request_data["metric"])
+
+    for value in values:
+        if isinstance(value, dict | list):
+            metric_names |= extract_metric_names(request_data=value)
+
+    return frozenset(metric_names)
+
+
+class DownloadMemberIndex:
+    """Tracks the downloads held in a previous bulk downloads archive so that unchanged downloads can be reused
+
+    Notes:
+        Each download is identified by a fingerprint of its request payload
+        along with the version of the data for the metrics it references.
+        The version of the data is provided by the `data_version_resolver`,
+        which is given the names of the metrics referenced by the download.
+        If the fingerprint of a download matches one from the previous archive,
+        then the content is read back from the previous archive
+        instead of being calculated again by the downloads endpoint.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        data_version_resolver: DATA_VERSION_RESOLVER_TYPE,
+        previous_archive: zipfile.ZipFile | None = None,
+        previous_members: dict[str, int] | None = None,
+    ):
+        self._previous_archive = previous_archive
+        self._previous_members = previous_members or {}
+        self._data_version_resolver = data_version_resolver
+        self._data_versions: dict[frozenset[str], str] = {}
+
+        self.reused_count = 0
+        self.fetched_count = 0
+
+    def build_fingerprint(self, *, request_data: dict) -> str:
+        """Builds the fingerprint for the download with the given `request_data`
+
+        Args:
+            request_data: The payload for one of the downloads endpoints
+
+        Returns:
+            The sha256 hex digest which identifies the download
+
+        """
+        metric_names: frozenset[str] = extract_metric_names(request_data=request_data)
+        data_version: str | None = self._data_versions.get(metric_names)
+        if data_version is None:
+            data_version = self._data_version_resolver(metric_names)
+            self._data_versions[metric_names] = data_version
+
+        serialized_request_data: str = json.dumps(
+            request_data, sort_keys=True, default=str
+        )
+        return hashlib.sha256(
+            f"{serialized_request_data}|{data_version}".encode()
+        ).hexdigest()
+
+    def get_previous_content(self, *, fingerprint: str) -> bytes | None:
+        """Returns the content of the download with the given `fingerprint` from the previous archive
+
+        Args:
+            fingerprint: The fingerprint of the download
+
+        Returns:
+            The content of the download or None
+            if the download was not in the previous archive
+
+        """
+        member_position: int | None = self._previous_members.get(fingerprint)
+        if self._previous_archive is None or member_position is None:
+            self.fetched_count += 1
+            return None
+
+        try:
+            member: zipfile.ZipInfo = self._previous_archive.infolist()[member_position]
+            content: bytes = self._previous_archive.read(member)
+        except (IndexError, zipfile.BadZipFile):
+            logger.warning(
+                "Unable to reuse download `%s` from previous archive", fingerprint
+            )
+            self.fetched_count += 1
+            return None
+
+        self.reused_count += 1
+        return content
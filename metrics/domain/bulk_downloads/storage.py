@@ -0,0 +1,164 @@
+import logging
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+import boto3
+import botocore.client
+
+import config
+
+logger = logging.getLogger(__name__)
+
+LOCAL_STORAGE_BACKEND = "local"
+S3_STORAGE_BACKEND = "s3"
+
+
+class BulkDownloadsStorage(ABC):
+    """Interface for where the precomputed bulk downloads archives are stored"""
+
+    @abstractmethod
+    def save(self, *, name: str, file: BinaryIO) -> None:
+        """Stores the contents of the given `file` under the given `name`
+
+        Notes:
+            Any existing item with the same `name` is replaced
+            only once the new contents have been written in full.
+            So readers will never see a partially written item.
+
+        Args:
+            name: The name to store the item under
+            file: The binary file object to read the contents from
+
+        Returns:
+            None
+
+        """
+
+    @abstractmethod
+    def open(self, *, name: str) -> BinaryIO | None:
+        """Opens the item stored under the given `name` for reading
+
+        Args:
+            name: The name of the item
+
+        Returns:
+            A binary file-like object which should be closed by the caller.
+            Or None if no item is stored under the given `name`
+
+        """
+
+    def load(self, *, name: str) -> bytes | None:
+        """Reads the item stored under the given `name` in full
+
+        Args:
+            name: The name of the item
+
+        Returns:
+            The contents of the item or None
+            if no item is stored under the given `name`
+
+        """
+        file: BinaryIO | None = self.open(name=name)
+        if file is None:
+            return None
+
+        try:
+            return file.read()
+        finally:
+            file.close()
+
+
+class LocalFileSystemStorage(BulkDownloadsStorage):
+    """Stores the bulk downloads archives in a directory on the local disk"""
+
+    def __init__(self, *, directory: str = config.BULK_DOWNLOADS_LOCAL_DIRECTORY):
+        self._directory = directory
+
+    def _build_path(self, *, name: str) -> str:
+        return os.path.join(self._directory, name)
+
+    def save(self, *, name: str, file: BinaryIO) -> None:
+        os.makedirs(self._directory, exist_ok=True)
+
+        # The new contents are written to a temporary file alongside the item
+        # and then moved over the item in 1 atomic operation
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                shutil.copyfileobj(file, temporary_file)
+            os.replace(temporary_path, self._build_path(name=name))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def open(self, *, name: str) -> BinaryIO | None:
+        try:
+            return open(self._build_path(name=name), "rb")  # noqa: SIM115
+        except FileNotFoundError:
+            return None
+
+
+class S3Storage(BulkDownloadsStorage):
+    """Stores the bulk downloads archives in an s3 bucket"""
+
+    def __init__(
+        self,
+        *,
+        client: botocore.client.BaseClient | None = None,
+        bucket_name: str | None = config.BULK_DOWNLOADS_BUCKET_NAME,
+        folder: str = "bulk_downloads/",
+    ):
+        self._client = client or self._create_client()
+        self._bucket_name = bucket_name
+        self._folder = folder
+
+    @classmethod
+    def _create_client(cls) -> botocore.client.BaseClient:
+        if config.AWS_PROFILE_NAME:
+            boto3.setup_default_session(profile_name=config.AWS_PROFILE_NAME)
+        return boto3.client("s3")
+
+    def _build_key(self, *, name: str) -> str:
+        return f"{self._folder}{name}"
+
+    def save(self, *, name: str, file: BinaryIO) -> None:
+        # s3 only makes an object visible once the upload has completed in full
+        self._client.upload_fileobj(
+            Fileobj=file, Bucket=self._bucket_name, Key=self._build_key(name=name)
+        )
+
+    def open(self, *, name: str) -> BinaryIO | None:
+        try:
+            response = self._client.get_object(
+                Bucket=self._bucket_name, Key=self._build_key(name=name)
+            )
+        except self._client.exceptions.NoSuchKey:
+            return None
+
+        return response["Body"]
+
+
+def get_bulk_downloads_storage() -> BulkDownloadsStorage | None:
+    """Returns the storage for the bulk downloads archives as configured by `BULK_DOWNLOADS_STORAGE_BACKEND`
+
+    Returns:
+        The `BulkDownloadsStorage` for the configured backend.
+        Or None if precomputed bulk downloads archives have been disabled,
+        in which case the archives are built on each request
+
+    """
+    backend: str = config.BULK_DOWNLOADS_STORAGE_BACKEND.lower()
+
+    if backend == LOCAL_STORAGE_BACKEND:
+        return LocalFileSystemStorage()
+
+    if backend == S3_STORAGE_BACKEND:
+        return S3Storage()
+
+    if backend:
+        logger.warning("Unknown bulk downloads storage backend `%s`", backend)
+
+    return None
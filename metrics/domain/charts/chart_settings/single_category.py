@@ -10,6 +10,12 @@ from metrics.domain.charts.utils import (
     return_formatted_min_y_axis_value,
 )
 from metrics.domain.models import PlotGenerationData
+from metrics.domain.models.plot_columns import (
+    find_minimum_and_maximum,
+    is_date_values,
+    to_date,
+    to_decimal,
+)
 from metrics.domain.models.plots import ChartGenerationPayload
 
 logger = logging.getLogger(__name__)
@@ -31,7 +37,7 @@ class SingleCategoryChartSettings(ChartSettings):
 
     @property
     def is_date_type_x_axis(self) -> bool:
-        return isinstance(self.plots_data[0].x_axis_values[0], datetime.date)
+        return is_date_values(values=self.plots_data[0].x_axis_values)
 
     def _get_x_axis_config(self) -> dict[str, str | bool | DICT_OF_STR_ONLY]:
         tick_font = self._get_tick_font_config()
@@ -125,17 +131,28 @@ class SingleCategoryChartSettings(ChartSettings):
             highest value in the `y_axis_values` list then the max value of
             `y_axis_values` is used as the highest number in the y-axis range.
 
+            The extremes of each plot are found first,
+            so that only those need to be compared across the plots.
+
         Returns:
             A list containing two values the minimum y-axis value
             and the maximum y-axis value
         """
-        y_axis_range = [
-            item for row in self.plots_data for item in row.y_axis_values
+        extremes = [
+            find_minimum_and_maximum(values=row.y_axis_values)
+            for row in self.plots_data
         ] + [
-            item
+            find_minimum_and_maximum(
+                values=row.additional_values.get("lower_confidence", []),
+                exclude_zeros=True,
+            )
             for row in self.plots_data
-            for item in row.additional_values.get("lower_confidence", [])
-            if item
+        ]
+        y_axis_range = [
+            to_decimal(value=value)
+            for extreme in extremes
+            if extreme is not None
+            for value in extreme
         ]
 
         if self.y_axis_minimum_value < min(y_axis_range):
@@ -182,8 +199,8 @@ class SingleCategoryChartSettings(ChartSettings):
         possible_maximums = []
 
         for plot_data in self.plots_data:
-            possible_minimums.append(plot_data.x_axis_values[0])
-            possible_maximums.append(plot_data.x_axis_values[-1])
+            possible_minimums.append(to_date(value=plot_data.x_axis_values[0]))
+            possible_maximums.append(to_date(value=plot_data.x_axis_values[-1]))
 
         return min(possible_minimums), max(possible_maximums)
 
@@ -338,17 +355,16 @@ class SingleCategoryChartSettings(ChartSettings):
             dictionary of parameters for charts settings parameters
         """
         plot_data = self.plots_data[0]
+        first_date: datetime.date = to_date(value=plot_data.x_axis_values[0])
+        last_date: datetime.date = to_date(value=plot_data.x_axis_values[-1])
 
         y_axis_params = self._build_line_single_simplified_y_axis_value_params()
 
         return {
-            "x_axis_tick_values": [
-                plot_data.x_axis_values[0],
-                plot_data.x_axis_values[-1],
-            ],
+            "x_axis_tick_values": [first_date, last_date],
             "x_axis_tick_text": [
-                plot_data.x_axis_values[0].strftime("%b, %Y"),
-                plot_data.x_axis_values[-1].strftime("%b, %Y"),
+                first_date.strftime("%b, %Y"),
+                last_date.strftime("%b, %Y"),
             ],
             "y_axis_tick_values": y_axis_params["y_axis_tick_values"],
             "y_axis_tick_text": y_axis_params["y_axis_tick_text"],
@@ -3,6 +3,7 @@ import plotly.graph_objects as go
 from metrics.domain.charts import colour_scheme
 from metrics.domain.charts.serialization import convert_graph_object_to_dict
 from metrics.domain.models import PlotGenerationData
+from metrics.domain.models.plot_columns import to_list
 from metrics.domain.models.plots import ChartGenerationPayload
 
 
@@ -32,8 +33,8 @@ def create_bar_plot(
     legend: str = plot_data.parameters.label
 
     bar = go.Bar(
-        x=plot_data.x_axis_values,
-        y=plot_data.y_axis_values,
+        x=to_list(values=plot_data.x_axis_values),
+        y=to_list(values=plot_data.y_axis_values),
         error_y=get_error_bars(plot_data, chart_generation_payload),
         marker={
             "color": bar_colour,
@@ -69,9 +70,13 @@ def get_error_bars(
     if not chart_generation_payload.confidence_intervals:
         return None
 
-    upper_confidence = plot_data.additional_values.get("upper_confidence", [])
+    upper_confidence = to_list(
+        values=plot_data.additional_values.get("upper_confidence", [])
+    )
 
-    lower_confidence = plot_data.additional_values.get("lower_confidence", [])
+    lower_confidence = to_list(
+        values=plot_data.additional_values.get("lower_confidence", [])
+    )
 
     if len(upper_confidence) == 0 or len(lower_confidence) == 0:
         return None
@@ -88,18 +93,15 @@ def get_error_bars(
 
     # We may get some plots with confidence and some without so handle those
     # gracefully
+    y_axis_values = to_list(values=plot_data.y_axis_values)
     upper_values = [
         (confidence if confidence is not None else metric) - metric
-        for confidence, metric in zip(
-            upper_confidence, plot_data.y_axis_values, strict=True
-        )
+        for confidence, metric in zip(upper_confidence, y_axis_values, strict=True)
     ]
 
     lower_values = [
         metric - (confidence if confidence is not None else metric)
-        for confidence, metric in zip(
-            lower_confidence, plot_data.y_axis_values, strict=True
-        )
+        for confidence, metric in zip(lower_confidence, y_axis_values, strict=True)
     ]
 
     return {
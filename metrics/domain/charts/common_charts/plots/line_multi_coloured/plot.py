@@ -6,6 +6,7 @@ from metrics.domain.charts.common_charts.plots.line_multi_coloured.properties im
 )
 from metrics.domain.charts.serialization import convert_graph_object_to_dict
 from metrics.domain.models import PlotGenerationData
+from metrics.domain.models.plot_columns import to_list
 
 
 def create_line_plot(*, plot_data: PlotGenerationData) -> dict:
@@ -30,8 +31,8 @@ def create_line_plot(*, plot_data: PlotGenerationData) -> dict:
     legend = plot_data.parameters.label
 
     scatter = plotly.graph_objects.Scatter(
-        x=plot_data.x_axis_values,
-        y=plot_data.y_axis_values,
+        x=to_list(values=plot_data.x_axis_values),
+        y=to_list(values=plot_data.y_axis_values),
         mode=mode,
         line={
             "width": 2,
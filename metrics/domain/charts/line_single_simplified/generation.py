@@ -7,6 +7,7 @@ from metrics.domain.charts.chart_settings.single_category import (
     SingleCategoryChartSettings,
 )
 from metrics.domain.charts.colour_scheme import RGBAChartLineColours
+from metrics.domain.models.plot_columns import to_list
 from metrics.domain.models.plots import ChartGenerationPayload
 
 
@@ -37,8 +38,8 @@ def create_simplified_line_chart(
     line_shape = "spline" if chart_plot.parameters.use_smooth_lines else "linear"
 
     line_plot: dict = _create_line_plot(
-        x_axis_values=chart_plot.x_axis_values,
-        y_axis_values=chart_plot.y_axis_values,
+        x_axis_values=to_list(values=chart_plot.x_axis_values),
+        y_axis_values=to_list(values=chart_plot.y_axis_values),
         line_shape=line_shape,
         colour=selected_colour.stringified,
     )
@@ -6,6 +6,7 @@ import plotly
 from plotly.graph_objs import Scatter
 
 from metrics.domain.models import PlotGenerationData
+from metrics.domain.models.plot_columns import to_date
 from metrics.domain.models.plots import (
     NoReportingDelayPeriodFoundError,
     ReportingDelayNotProvidedToPlotsError,
@@ -37,7 +38,9 @@ def _get_first_x_value_at_start_of_reporting_delay_period(
             NoReportingDelayPeriodFoundError, ReportingDelayNotProvidedToPlotsError
         ):
             reporting_delay_start_date_list.append(
-                plot.x_axis_values[plot.start_of_reporting_delay_period_index],
+                to_date(
+                    value=plot.x_axis_values[plot.start_of_reporting_delay_period_index]
+                ),
             )
 
     if not reporting_delay_start_date_list:
@@ -57,7 +60,7 @@ def get_x_value_at_start_of_reporting_delay_period(
     chart_plots_data: list[PlotGenerationData],
 ) -> date:
     values = [
-        plot.x_axis_values[plot.start_of_reporting_delay_period_index]
+        to_date(value=plot.x_axis_values[plot.start_of_reporting_delay_period_index])
         for plot in chart_plots_data
     ]
 
@@ -4,6 +4,7 @@ import plotly.graph_objects as go
 
 from metrics.domain.charts.chart_settings.dual_category import DualCategoryChartSettings
 from metrics.domain.charts.reporting_delay_period import add_reporting_delay_period
+from metrics.domain.models.plot_columns import to_list
 from metrics.domain.models.plots import ChartGenerationPayload
 
 
@@ -32,8 +33,8 @@ def generate_stacked_bar(
     secondary_category = chart_generation_payload.secondary_category
     for plot in chart_generation_payload.plots:
         group = getattr(plot.parameters, secondary_category)
-        grouped[group]["x_axis_values"].extend(plot.x_axis_values)
-        grouped[group]["y_axis_values"].extend(plot.y_axis_values)
+        grouped[group]["x_axis_values"].extend(to_list(values=plot.x_axis_values))
+        grouped[group]["y_axis_values"].extend(to_list(values=plot.y_axis_values))
         grouped[group]["label"] = plot.parameters.label
 
     for label, data in grouped.items():
@@ -7,6 +7,7 @@ from metrics.domain.charts import colour_scheme
 from metrics.domain.charts.chart_settings.subplot_chart_settings import (
     SubplotChartSettings,
 )
+from metrics.domain.models.plot_columns import to_list
 from metrics.domain.models.subplot_plots import (
     SubplotChartGenerationPayload,
     SubplotGenerationData,
@@ -73,8 +74,8 @@ def generate_chart_figure(
         for data in plot_data.subplot_data:
             figure.add_trace(
                 go.Bar(
-                    x=data.x_axis_values,
-                    y=data.y_axis_values,
+                    x=to_list(values=data.x_axis_values),
+                    y=to_list(values=data.y_axis_values),
                     name=getattr(
                         data.parameters,
                         data.parameters.x_axis,
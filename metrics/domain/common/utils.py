@@ -127,6 +127,16 @@ class ChartTypes(Enum):
         return [chart_type.value for chart_type in cls]
 
 
+class ChartEncodings(Enum):
+    uri = "uri"
+    base64 = "base64"
+    raw = "raw"
+
+    @classmethod
+    def choices(cls) -> tuple[tuple[str, str], ...]:
+        return tuple((encoding.value, encoding.value) for encoding in cls)
+
+
 class ChartAxisFields(Enum):
     stratum = "stratum__name"
     age = "age__name"
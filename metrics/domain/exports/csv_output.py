@@ -1,6 +1,8 @@
 import csv
 import io
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+
+DEFAULT_STREAMING_ROWS_PER_CHUNK = 1000
 
 FIELDS = {
     "theme": "metric__topic__sub_theme__theme__name",
@@ -91,3 +93,72 @@ def _write_headline_to_csv_file(
     writer.writerows(rows)
 
     return file
+
+
+class EchoBuffer:
+    """Pseudo-buffer which hands back each value written to it instead of holding onto it
+
+    Notes:
+        This allows a `csv.writer` to be used to format rows
+        which are then yielded on, rather than being accumulated in memory.
+
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def join_lines_into_chunks(
+    *, lines: Iterable[str], lines_per_chunk: int = DEFAULT_STREAMING_ROWS_PER_CHUNK
+) -> Iterator[str]:
+    """Joins the given `lines` into larger chunks so that fewer, larger writes are made
+
+    Args:
+        lines: The formatted lines to be joined
+        lines_per_chunk: The number of lines to join into each chunk
+
+    Yields:
+        Chunks of the joined `lines`
+
+    """
+    chunk: list[str] = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= lines_per_chunk:
+            yield "".join(chunk)
+            chunk.clear()
+
+    if chunk:
+        yield "".join(chunk)
+
+
+def stream_data_to_csv(
+    *,
+    rows: Iterable,
+    headers: list[str] | None = None,
+    rows_per_chunk: int = DEFAULT_STREAMING_ROWS_PER_CHUNK,
+) -> Iterator[str]:
+    """Formats the given `rows` as csv, yielding the output as each chunk of `rows` is consumed
+
+    Notes:
+        This is the streaming equivalent of `write_data_to_csv()`.
+        Only 1 chunk of formatted rows is held in memory at any one time.
+
+    Args:
+        rows: Iterable of records, each of which is a sequence of values.
+            Typically, a lazily evaluated iterator over a queryset
+        headers: The header row of the csv.
+            Defaults to the keys of `FIELDS`
+        rows_per_chunk: The number of rows to be yielded in each chunk
+
+    Yields:
+        Chunks of the csv output, starting with the header row
+
+    """
+    headers = headers or FIELDS.keys()
+    writer = csv.writer(EchoBuffer())
+
+    yield writer.writerow(headers)
+    yield from join_lines_into_chunks(
+        lines=(writer.writerow(row) for row in rows), lines_per_chunk=rows_per_chunk
+    )
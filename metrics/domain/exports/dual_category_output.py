@@ -1,5 +1,13 @@
 import csv
 import io
+import itertools
+from collections.abc import Iterable, Iterator
+
+from metrics.domain.exports.csv_output import (
+    DEFAULT_STREAMING_ROWS_PER_CHUNK,
+    EchoBuffer,
+    join_lines_into_chunks,
+)
 
 PIVOT_VALUE_FIELDS = ["metric_value"]
 
@@ -105,6 +113,38 @@ def pivot_dual_category_download_rows(
     return list(grouped.values())
 
 
+def iterate_pivoted_dual_category_download_rows(
+    *,
+    rows: Iterable[dict],
+    x_axis: str,
+    secondary_category: str,
+) -> Iterator[dict]:
+    """Lazily collapse consecutive segment rows which share the same primary axis value into one row.
+
+    Notes:
+        This is the streaming equivalent of `pivot_dual_category_download_rows()`.
+        Only the rows for the current primary axis value are held in memory.
+        As such, the given `rows` must already be ordered
+        so that all rows sharing a primary axis value are adjacent.
+        E.g. timeseries rows ordered by `date` for an `x_axis` of `date`.
+
+    Args:
+        rows: Serialized download rows with one record per plot query,
+            ordered by the `x_axis`.
+        x_axis: Field used to group rows, e.g. `age` or `date`.
+        secondary_category: Field whose values become column/key names, e.g. `sex`.
+
+    Yields:
+        Collapsed rows with segment values as keys mapped to `metric_value`.
+    """
+    for _, grouped_rows in itertools.groupby(rows, key=lambda row: str(row[x_axis])):
+        yield from pivot_dual_category_download_rows(
+            rows=grouped_rows,
+            x_axis=x_axis,
+            secondary_category=secondary_category,
+        )
+
+
 def build_dual_category_csv_headers(
     *,
     is_headline: bool,
@@ -156,3 +196,28 @@ def write_dual_category_data_to_csv(
     writer.writeheader()
     writer.writerows(rows)
     return file
+
+
+def stream_dual_category_data_to_csv(
+    *,
+    rows: Iterable[dict],
+    headers: list[str],
+    rows_per_chunk: int = DEFAULT_STREAMING_ROWS_PER_CHUNK,
+) -> Iterator[str]:
+    """Format pivoted dual-category download rows as CSV, yielding the output in chunks.
+
+    Args:
+        rows: Pivoted download rows to serialize.
+            Typically, from `iterate_pivoted_dual_category_download_rows()`.
+        headers: Column headers for the CSV output.
+        rows_per_chunk: The number of rows to be yielded in each chunk.
+
+    Yields:
+        Chunks of the CSV output, starting with the header row.
+    """
+    writer = csv.DictWriter(EchoBuffer(), fieldnames=headers, extrasaction="ignore")
+
+    yield writer.writeheader()
+    yield from join_lines_into_chunks(
+        lines=(writer.writerow(row) for row in rows), lines_per_chunk=rows_per_chunk
+    )
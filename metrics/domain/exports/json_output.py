@@ -0,0 +1,68 @@
+import json
+from collections.abc import Iterable, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from metrics.domain.exports.csv_output import (
+    DEFAULT_STREAMING_ROWS_PER_CHUNK,
+    join_lines_into_chunks,
+)
+
+
+def _encode_items(
+    *, items: Iterable, encoder: json.JSONEncoder, separator: str
+) -> Iterator[str]:
+    yield "["
+
+    for index, item in enumerate(items):
+        if index:
+            yield separator
+
+        if isinstance(item, Iterator):
+            # Nested iterators are encoded lazily as arrays in their own right
+            yield from _encode_items(items=item, encoder=encoder, separator=separator)
+        else:
+            yield encoder.encode(item)
+
+    yield "]"
+
+
+def stream_json_array(
+    *,
+    items: Iterable,
+    encoder_class: type[json.JSONEncoder] = DjangoJSONEncoder,
+    items_per_chunk: int = DEFAULT_STREAMING_ROWS_PER_CHUNK,
+) -> Iterator[str]:
+    """Encodes the given `items` as a JSON array, yielding the output as each chunk of `items` is consumed
+
+    Notes:
+        The whole array is never held in memory.
+        Each item is encoded on its own as it is pulled from `items`
+        and the encoded items are joined into chunks before being yielded.
+
+        Any item which is itself an iterator, such as a generator,
+        is encoded lazily as a nested JSON array.
+        Lists, dicts and any other values are encoded in 1 go
+        with the given `encoder_class`.
+
+    Args:
+        items: The items to be encoded as the elements of the array.
+            Typically, a lazily evaluated iterator
+            over the serialized records of a queryset
+        encoder_class: The `JSONEncoder` used to encode each item.
+            Defaults to the `DjangoJSONEncoder`,
+            which can encode dates and decimals
+        items_per_chunk: The number of encoded items to be yielded in each chunk
+
+    Yields:
+        Chunks of the encoded JSON array
+
+    """
+    encoder = encoder_class(separators=(",", ":"), ensure_ascii=False)
+    encoded_parts: Iterator[str] = _encode_items(
+        items=items, encoder=encoder, separator=","
+    )
+    # Each item is followed by a separator, so double the parts are joined per chunk
+    return join_lines_into_chunks(
+        lines=encoded_parts, lines_per_chunk=items_per_chunk * 2
+    )
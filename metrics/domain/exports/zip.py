@@ -1,10 +1,46 @@
 import io
 import logging
 import zipfile
+from collections.abc import Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
 
+class ZipStreamBuffer(io.RawIOBase):
+    """Write-only, unseekable buffer which holds the bytes written by a `ZipFile` until they are drained
+
+    Notes:
+        Since this buffer cannot be seeked, the `ZipFile` writes
+        each member with a trailing data descriptor
+        instead of going back to patch the local file header.
+        This means the bytes of the archive can be sent on
+        as soon as each member has been written.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Returns all the bytes written since the last drain and empties the buffer
+
+        Returns:
+            The bytes which have been written to the buffer since the last drain
+
+        """
+        chunk: bytes = b"".join(self._chunks)
+        self._chunks.clear()
+        return chunk
+
+
 def write_directory_to_write_stream(
     *,
     directory_name: str,
@@ -28,23 +64,31 @@ def write_directory_to_write_stream(
         logger.exception("Failed to create directory directory_name and its files.")
 
 
-def write_data_to_zip(
+def stream_data_to_zip(
     *,
-    downloads: list[dict[str, str]],
-) -> bytes:
-    """Compress data into a zipfile
+    downloads: Iterable[dict[str, str]],
+) -> Iterator[bytes]:
+    """Compress data into a zipfile, yielding the compressed bytes as the zipfile is written
+
+    Notes:
+        Each group of downloads is compressed and yielded
+        as soon as it has been pulled from the given `downloads`.
+        So if `downloads` is a lazy iterable, then the first bytes
+        can be sent on before the remaining downloads have been gathered.
+        Only the compressed bytes for the current group of downloads
+        are held in memory at any one time.
 
     Args:
-        downloads: A list of dictionaries containing
+        downloads: An iterable of dictionaries containing
             a directory name, filename and content of the data
             to be written to a zip file.
 
-    Returns:
-        A zipfile containing downloads
+    Yields:
+        Chunks of the zipfile containing downloads
     """
-    in_memory_zip = io.BytesIO()
+    buffer = ZipStreamBuffer()
 
-    with zipfile.ZipFile(in_memory_zip, "w", zipfile.ZIP_DEFLATED) as zipf:
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
         try:
             for download in downloads:
                 write_directory_to_write_stream(
@@ -52,7 +96,33 @@ def write_data_to_zip(
                     download_group=download["downloads"],
                     zipf=zipf,
                 )
+                if chunk := buffer.drain():
+                    yield chunk
         except KeyError:
             logger.exception("Failed to write bulk downloads to zip write stream.")
 
-    return in_memory_zip.getvalue()
+    # The central directory is written when the zipfile is closed
+    if chunk := buffer.drain():
+        yield chunk
+
+
+def write_data_to_zip(
+    *,
+    downloads: list[dict[str, str]],
+) -> bytes:
+    """Compress data into a zipfile
+
+    Notes:
+        This holds the entire zipfile in memory.
+        Prefer `stream_data_to_zip()` when the zipfile
+        can be sent on in chunks.
+
+    Args:
+        downloads: A list of dictionaries containing
+            a directory name, filename and content of the data
+            to be written to a zip file.
+
+    Returns:
+        A zipfile containing downloads
+    """
+    return b"".join(stream_data_to_zip(downloads=downloads))
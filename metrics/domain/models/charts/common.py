@@ -19,3 +19,4 @@ class ChartBaseRequestParams(BaseRequestParams):
     confidence_colour: str | None = ""
     is_public: bool | None = True
     data_classification: str | None = None
+    chart_encoding: Literal["uri", "base64", "raw"] = "uri"
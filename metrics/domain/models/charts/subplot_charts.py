@@ -36,6 +36,7 @@ class SubplotChartRequestParameters(BaseModel):
     request: Request | None = None
     is_public: bool | None = True
     data_classification: str | None = None
+    chart_encoding: Literal["uri", "base64", "raw"] = "uri"
 
     subplots: list[Subplots]
 
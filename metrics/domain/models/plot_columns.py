@@ -0,0 +1,296 @@
+"""Columnar representation of the records fetched for an individual plot.
+
+The records for a plot are held as 1 numpy array per exported field,
+instead of as lists of `date`, `Decimal` and `bool` objects.
+So that the domain libraries can find the extremes, the reporting delay period
+and the sections of long timeseries with vectorised operations.
+
+Dates are held as `datetime64[D]`, numeric values as `float64`
+with `NaN` in place of missing values, and flags as boolean masks.
+The numeric fields of the core models hold at most 11 digits
+to 4 decimal places. So `float64` holds these values exactly
+once they are rounded back to `DECIMAL_PLACES`.
+
+Values are only converted back to Python objects at the boundaries
+where they leave the domain, e.g. when they are handed to plotly
+or written out as strings for the tables endpoints.
+"""
+
+import datetime
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from decimal import Decimal
+from operator import itemgetter
+from typing import Any, Self
+
+import numpy as np
+
+DATE_FIELDS: frozenset[str] = frozenset({"date"})
+NUMERIC_FIELDS: frozenset[str] = frozenset(
+    {"metric_value", "upper_confidence", "lower_confidence"}
+)
+BOOLEAN_FIELDS: frozenset[str] = frozenset({"in_reporting_delay_period"})
+
+# Matches the `decimal_places` of the numeric fields on the core models
+DECIMAL_PLACES = 4
+
+PLOT_VALUES_TYPE = Sequence[Any] | np.ndarray
+
+
+def _build_column(*, field: str, values: Sequence[Any]) -> np.ndarray:
+    if field in DATE_FIELDS:
+        column = np.array(values, dtype="datetime64[D]")
+    elif field in NUMERIC_FIELDS:
+        # `None` values are cast to `NaN`
+        column = np.array(values, dtype=np.float64)
+    elif field in BOOLEAN_FIELDS:
+        column = np.array(values, dtype=np.bool_)
+    else:
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+
+    # The columns can be shared between requests, e.g. for each width of a chart
+    column.flags.writeable = False
+    return column
+
+
+class PlotColumns(Mapping[str, np.ndarray]):
+    """Holds the records fetched for an individual plot as 1 numpy array per field
+
+    Notes:
+        This can be used in place of the dict of lists
+        which was previously built for each plot.
+        i.e. `plot_columns["metric_value"]` returns the array of metric values.
+
+    """
+
+    def __init__(self, *, columns: dict[str, np.ndarray]):
+        self._columns = columns
+
+    @classmethod
+    def from_values_list(
+        cls, *, fields: Sequence[str], rows: Iterable[Sequence[Any]]
+    ) -> Self:
+        """Builds the columns from the given `rows` of values
+
+        Args:
+            fields: The names of the fields for each value in the `rows`
+            rows: Iterable of tuples of values,
+                in the same order as the `fields`.
+                E.g. the rows of a `values_list()` queryset
+
+        Returns:
+            `PlotColumns` holding 1 array for each of the `fields`.
+            If there are no `rows`, then no columns are held.
+
+        """
+        values_by_field: list[tuple[Any, ...]] = list(zip(*rows, strict=True))
+        if not values_by_field:
+            return cls(columns={})
+
+        return cls(
+            columns={
+                field: _build_column(field=field, values=values)
+                for field, values in zip(fields, values_by_field, strict=True)
+            }
+        )
+
+    @classmethod
+    def from_records(cls, *, records: Iterable[dict[str, Any]]) -> Self:
+        """Builds the columns from the given `records`
+
+        Args:
+            records: Iterable of dicts of values keyed by the name of the field.
+                E.g. the rows of a `values()` queryset
+
+        Returns:
+            `PlotColumns` holding 1 array for each of the fields.
+            If there are no `records`, then no columns are held.
+
+        """
+        records = list(records)
+        if not records:
+            return cls(columns={})
+
+        fields: list[str] = list(records[0])
+        rows = (
+            ((record[fields[0]],) for record in records)
+            if len(fields) == 1
+            else map(itemgetter(*fields), records)
+        )
+
+        return cls.from_values_list(fields=fields, rows=rows)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self._columns[field]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @property
+    def number_of_rows(self) -> int:
+        return len(next(iter(self._columns.values()), ()))
+
+
+def to_list(values: PLOT_VALUES_TYPE) -> list[Any]:
+    """Returns the given `values` as a list of Python objects
+
+    Notes:
+        Dates are returned as `date` objects
+        and missing numeric values are returned as None.
+        This should be used where the values leave the domain,
+        e.g. when they are handed to plotly.
+
+    Args:
+        values: A column of a `PlotColumns` or a list of values
+
+    Returns:
+        List of the values.
+        Values which are not held in an array are returned as they are
+
+    """
+    if not isinstance(values, np.ndarray):
+        return values
+
+    if values.dtype == np.float64:
+        missing: np.ndarray = np.isnan(values)
+        if missing.any():
+            return np.where(missing, None, values).tolist()
+
+    return values.tolist()
+
+
+def to_decimal(value: Any) -> Any:
+    """Returns the given numeric `value` from a column as a `Decimal`
+
+    Notes:
+        The value is rounded to `DECIMAL_PLACES`,
+        so that it matches the value stored in the database.
+        Values which were not read from a column are returned as they are.
+
+    """
+    if isinstance(value, np.floating):
+        if np.isnan(value):
+            return None
+        return Decimal(f"{value:.{DECIMAL_PLACES}f}")
+
+    return value
+
+
+def to_decimals(values: PLOT_VALUES_TYPE) -> list[Decimal | None]:
+    """Returns the given numeric `values` as a list of `Decimal` objects
+
+    Notes:
+        This should be used where the exact value is written out,
+        e.g. for the tables endpoints.
+
+    Args:
+        values: A numeric column of a `PlotColumns` or a list of values
+
+    Returns:
+        List of `Decimal` objects, with None for missing values.
+        Values which are not held in an array are returned as they are
+
+    """
+    if not isinstance(values, np.ndarray):
+        return values
+
+    return [to_decimal(value=value) for value in values]
+
+
+def to_date(value: Any) -> Any:
+    """Returns the given `value` from a date column as a `date` object
+
+    Notes:
+        Values which were not read from a column are returned as they are.
+
+    """
+    if isinstance(value, np.datetime64):
+        return value.astype(datetime.date)
+
+    return value
+
+
+def has_values(values: PLOT_VALUES_TYPE | None) -> bool:
+    """Checks whether any `values` have been provided
+
+    Args:
+        values: A column of a `PlotColumns` or a list of values
+
+    Returns:
+        True if there is at least 1 value, False otherwise
+
+    """
+    return values is not None and len(values) > 0
+
+
+def is_date_values(values: PLOT_VALUES_TYPE) -> bool:
+    """Checks whether the given `values` are dates
+
+    Args:
+        values: A column of a `PlotColumns` or a list of values
+
+    Returns:
+        True if the values are dates, False otherwise
+
+    """
+    if isinstance(values, np.ndarray):
+        return np.issubdtype(values.dtype, np.datetime64)
+
+    return isinstance(values[0], datetime.date)
+
+
+def find_first_true_index(values: PLOT_VALUES_TYPE) -> int | None:
+    """Finds the index of the first `True` value within the given `values`
+
+    Args:
+        values: A boolean column of a `PlotColumns` or a list of values
+
+    Returns:
+        The index of the first `True` value.
+        Or None if there are no `True` values
+
+    """
+    mask = np.asarray(values)
+    if mask.dtype != np.bool_:
+        mask = np.fromiter((value is True for value in values), dtype=np.bool_)
+
+    if not mask.size:
+        return None
+
+    index = int(mask.argmax())
+    return index if mask[index] else None
+
+
+def find_minimum_and_maximum(
+    values: PLOT_VALUES_TYPE, *, exclude_zeros: bool = False
+) -> tuple[Any, Any] | None:
+    """Finds the lowest and highest of the given `values`, ignoring missing values
+
+    Args:
+        values: A numeric column of a `PlotColumns` or a list of values
+        exclude_zeros: Switch to also ignore values of zero.
+            Defaults to False
+
+    Returns:
+        Tuple of the lowest and highest values.
+        Or None if there are no values to compare
+
+    """
+    if isinstance(values, np.ndarray):
+        mask: np.ndarray = ~np.isnan(values)
+        if exclude_zeros:
+            mask &= values != 0
+        present_values: np.ndarray = values[mask]
+        if not present_values.size:
+            return None
+        return present_values.min(), present_values.max()
+
+    present_values = [
+        value for value in values if value is not None and (value or not exclude_zeros)
+    ]
+    if not present_values:
+        return None
+    return min(present_values), max(present_values)
@@ -1,5 +1,5 @@
 import datetime
-from collections.abc import Iterable
+from collections.abc import Mapping
 from decimal import Decimal
 from typing import Self
 
@@ -14,6 +14,7 @@ from metrics.domain.common.utils import (
     extract_metric_group_from_metric,
 )
 from metrics.domain.models.charts.common import ChartBaseRequestParams
+from metrics.domain.models.plot_columns import find_first_true_index
 
 
 class PlotParameters(BaseModel):
@@ -39,7 +40,7 @@ class PlotParameters(BaseModel):
     override_y_axis_choice_to_none: bool = False
     use_smooth_lines: bool = True
     use_markers: bool = False
-    metric_value_ranges: Iterable[tuple[Decimal, Decimal]] | None = None
+    metric_value_ranges: list[tuple[Decimal, Decimal]] | None = None
     theme: str = ""
     sub_theme: str = ""
 
@@ -165,7 +166,10 @@ class PlotGenerationData(BaseModel):
 
     @classmethod
     def create_from_parameters(
-        cls, parameters: PlotParameters, aggregated_results: dict, latest_date: str
+        cls,
+        parameters: PlotParameters,
+        aggregated_results: Mapping[str, Any],
+        latest_date: str,
     ) -> Self:
         keys_to_exclude = [parameters.x_axis_value, parameters.y_axis_value]
         additional_values = {
@@ -210,12 +214,11 @@ class PlotGenerationData(BaseModel):
         except (KeyError, TypeError) as error:
             raise ReportingDelayNotProvidedToPlotsError from error
 
-        for index, in_reporting_delay_period in enumerate(
-            reporting_delay_period_values
-        ):
-            if in_reporting_delay_period is True:
-                return index
-        raise NoReportingDelayPeriodFoundError
+        index: int | None = find_first_true_index(values=reporting_delay_period_values)
+        if index is None:
+            raise NoReportingDelayPeriodFoundError
+
+        return index
 
 
 class ChartGenerationPayload(BaseModel):
@@ -13,6 +13,12 @@ from metrics.domain.charts.reporting_delay_period import (
 )
 from metrics.domain.common.utils import ChartTypes
 from metrics.domain.models import PlotGenerationData, PlotParameters
+from metrics.domain.models.plot_columns import (
+    has_values,
+    is_date_values,
+    to_date,
+    to_decimal,
+)
 from metrics.domain.models.plots import (
     NoReportingDelayPeriodFoundError,
     ReportingDelayNotProvidedToPlotsError,
@@ -38,7 +44,8 @@ class PlotsText:
         return [
             plot_data
             for plot_data in plots_data
-            if plot_data.x_axis_values and plot_data.y_axis_values
+            if has_values(values=plot_data.x_axis_values)
+            and has_values(values=plot_data.y_axis_values)
         ]
 
     def construct_text(self) -> str:
@@ -201,9 +208,8 @@ class PlotsText:
     @classmethod
     def _describe_singular_metric_value(cls, plot_data: PlotGenerationData) -> str:
         if len(plot_data.y_axis_values) == 1:
-            return (
-                f"This plot has a value of '{plot_data.y_axis_values[0].normalize()}'. "
-            )
+            metric_value: Decimal = to_decimal(value=plot_data.y_axis_values[0])
+            return f"This plot has a value of '{metric_value.normalize()}'. "
         return ""
 
     @classmethod
@@ -222,7 +228,7 @@ class PlotsText:
         """
         return (
             f"This plot shows `{plot_data.x_axis_values[0]}` along the X-axis. "
-            f"And `{plot_data.y_axis_values[0]}` along the Y-axis. "
+            f"And `{to_decimal(value=plot_data.y_axis_values[0])}` along the Y-axis. "
         )
 
     def _describe_date_based_plot_data(
@@ -417,7 +423,7 @@ class PlotsText:
 
     @classmethod
     def _stringify_date(cls, *, date_obj: datetime.date) -> str:
-        return date_obj.strftime(format=READABLE_DATE_FORMAT)
+        return to_date(value=date_obj).strftime(format=READABLE_DATE_FORMAT)
 
     @classmethod
     def _stringify_metric_value(cls, metric_value: Decimal) -> float:
@@ -430,7 +436,7 @@ class PlotsText:
     def _plot_is_date_based_timeseries_data(
         cls, *, plot_data: PlotGenerationData
     ) -> bool:
-        return type(plot_data.x_axis_values[0]) is datetime.date
+        return is_date_values(values=plot_data.x_axis_values)
 
     @classmethod
     def _plot_is_simplified_chart(cls, *, plot_parameters: PlotParameters) -> bool:
@@ -1,12 +1,21 @@
 import datetime
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from decimal import Decimal
+from typing import Any
 
 from metrics.domain.common.utils import (
     ChartAxisFields,
     DataSourceFileType,
     extract_metric_group_from_metric,
 )
+from metrics.domain.models.plot_columns import to_decimals, to_list
+from metrics.domain.tables.merging import (
+    MISSING_POSITION,
+    MergedXAxisValues,
+    merge_x_axis_values,
+)
 
 IN_REPORTING_DELAY_PERIOD = "in_reporting_delay_period"
 UPPER_CONFIDENCE = "upper_confidence"
@@ -17,6 +26,24 @@ IN_REPORTING_DELAY_PERIOD_LOOKUP_TYPE = dict[datetime.date, bool]
 CONFIDENCE_LOOKUP_TYPE = dict[datetime.date, Decimal | None]
 
 DEFAULT_PLOT_LABEL = "Plot"
+COMBINED_PLOT_VALUES_TYPE = dict[str, str | bool]
+
+
+@dataclass
+class _TabularPlotColumns:
+    # The values of a plot, aligned to its x-axis values
+    label: str
+    x_axis_values: Any
+    values: list[Any]
+    in_reporting_delay_period_values: list[bool]
+    upper_confidence_values: list[Decimal | None]
+    lower_confidence_values: list[Decimal | None]
+
+
+def _pad(*, values: Iterable[Any], length: int, fill_value: Any) -> list[Any]:
+    padded_values = list(values)[:length]
+    padded_values.extend([fill_value] * (length - len(padded_values)))
+    return padded_values
 
 
 class TabularData:
@@ -42,14 +69,25 @@ class TabularData:
             A list of dictionaries showing the plot data in a tabular format
 
         """
-        # Merge all the plots together by x-axis
-        self.combine_all_plots()
+        return list(self.iterate_tabular_plots())
 
-        # Order plots in chronological order for date-based tables
-        self._cast_combined_plots_in_order()
+    def iterate_tabular_plots(self) -> Iterator[dict[str, str | list[dict]]]:
+        """Lazily creates the tabular output for the given plots
 
-        # Create output in required format
-        return self.create_multi_plot_output()
+        Notes:
+            The plots are merged along the x-axis in 1 pass,
+            and date-based tables are ordered from the most recent date.
+            Each row is only built as it is consumed,
+            so the combined plots are never held in full.
+
+        Returns:
+            A generator of dictionaries showing the plot data
+            in a tabular format, 1 for each row of the table
+
+        """
+        return self._create_multi_plot_rows(
+            combined_plots=self._iterate_combined_plots()
+        )
 
     def add_plot_data_to_combined_plots(
         self,
@@ -84,28 +122,49 @@ class TabularData:
         lower_confidence_lookup = lower_confidence_lookup or {}
 
         for key, value in plot_data.items():
-            result = {plot_label: str(value)}
-            in_reporting_delay_period_value = self._fetch_reporting_delay_period(
-                in_reporting_delay_period_lookup=in_reporting_delay_period_lookup,
-                key=key,
+            result: COMBINED_PLOT_VALUES_TYPE = self._build_combined_plot_values(
+                plot_label=plot_label,
+                value=value,
+                in_reporting_delay_period=self._fetch_reporting_delay_period(
+                    in_reporting_delay_period_lookup=in_reporting_delay_period_lookup,
+                    key=key,
+                ),
+                upper_confidence=self._fetch_confidence_value(
+                    confidence_lookup=upper_confidence_lookup,
+                    key=key,
+                ),
+                lower_confidence=self._fetch_confidence_value(
+                    confidence_lookup=lower_confidence_lookup,
+                    key=key,
+                ),
             )
-            result[IN_REPORTING_DELAY_PERIOD] = in_reporting_delay_period_value
+            self.combined_plots[str(key)].update(result)
 
-            upper_confidence_value = self._fetch_confidence_value(
-                confidence_lookup=upper_confidence_lookup,
-                key=key,
-            )
-            if upper_confidence_value is not None:
-                result[UPPER_CONFIDENCE] = str(upper_confidence_value)
+    def _build_combined_plot_values(
+        self,
+        *,
+        plot_label: str,
+        value: Any,
+        in_reporting_delay_period: bool,
+        upper_confidence: Decimal | None,
+        lower_confidence: Decimal | None,
+    ) -> COMBINED_PLOT_VALUES_TYPE:
+        result: COMBINED_PLOT_VALUES_TYPE = {plot_label: str(value)}
+        result[self._get_in_reporting_delay_period_key(plot_label=plot_label)] = (
+            in_reporting_delay_period
+        )
 
-            lower_confidence_value = self._fetch_confidence_value(
-                confidence_lookup=lower_confidence_lookup,
-                key=key,
-            )
-            if lower_confidence_value is not None:
-                result[LOWER_CONFIDENCE] = str(lower_confidence_value)
+        if upper_confidence is not None:
+            result[UPPER_CONFIDENCE] = str(upper_confidence)
 
-            self.combined_plots[str(key)].update(result)
+        if lower_confidence is not None:
+            result[LOWER_CONFIDENCE] = str(lower_confidence)
+
+        return result
+
+    @classmethod
+    def _get_in_reporting_delay_period_key(cls, *, plot_label: str) -> str:
+        return IN_REPORTING_DELAY_PERIOD
 
     @classmethod
     def _fetch_reporting_delay_period(
@@ -146,82 +205,106 @@ class TabularData:
             None
 
         """
-        for index, plot in enumerate(self.plots, 1):
-            plot_label: str = plot.parameters.label or f"{DEFAULT_PLOT_LABEL}{index}"
-            self.plot_labels.append(plot_label)
+        self.combined_plots.update(self._iterate_combined_plots())
 
-            plot_data: PLOT_DATA_LOOKUP_TYPE = self._build_plot_data_for_axes_values(
-                plot=plot
-            )
-            in_reporting_delay_period_lookup: IN_REPORTING_DELAY_PERIOD_LOOKUP_TYPE = (
-                self._build_plot_data_for_in_reporting_delay_period_values(plot=plot)
-            )
-            upper_confidence_lookup: CONFIDENCE_LOOKUP_TYPE = (
-                self._build_plot_data_for_confidence_values(
-                    plot=plot, confidence_field=UPPER_CONFIDENCE
-                )
-            )
-            lower_confidence_lookup: CONFIDENCE_LOOKUP_TYPE = (
-                self._build_plot_data_for_confidence_values(
-                    plot=plot, confidence_field=LOWER_CONFIDENCE
+    def _iterate_combined_plots(
+        self,
+    ) -> Iterator[tuple[str, COMBINED_PLOT_VALUES_TYPE]]:
+        """Lazily merges the individual plots along the x-axis
+
+        Notes:
+            The x-axis values of all the plots are outer joined in 1 pass
+            and sorted once. See `merge_x_axis_values()` for more information.
+            The values for each row are then only gathered from each plot
+            as the row is consumed.
+
+        Returns:
+            A generator of the stringified x-axis value for each row
+            and the combined values of each plot for that row
+
+        """
+        plot_columns: list[_TabularPlotColumns] = [
+            self._build_plot_columns(index=index, plot=plot)
+            for index, plot in enumerate(self.plots, 1)
+        ]
+        self.plot_labels = [columns.label for columns in plot_columns]
+
+        merged_x_axis_values: MergedXAxisValues = merge_x_axis_values(
+            x_axis_values_per_plot=[columns.x_axis_values for columns in plot_columns],
+            sort_descending=self._is_date_based,
+        )
+
+        for key, positions in zip(
+            merged_x_axis_values.keys,
+            merged_x_axis_values.positions.T.tolist(),
+            strict=True,
+        ):
+            combined_plot_values: COMBINED_PLOT_VALUES_TYPE = {}
+
+            for columns, position in zip(plot_columns, positions, strict=True):
+                if position == MISSING_POSITION:
+                    continue
+
+                combined_plot_values.update(
+                    self._build_combined_plot_values(
+                        plot_label=columns.label,
+                        value=columns.values[position],
+                        in_reporting_delay_period=(
+                            columns.in_reporting_delay_period_values[position]
+                        ),
+                        upper_confidence=columns.upper_confidence_values[position],
+                        lower_confidence=columns.lower_confidence_values[position],
+                    )
                 )
-            )
 
-            self.add_plot_data_to_combined_plots(
-                plot_data=plot_data,
-                plot_label=plot_label,
-                in_reporting_delay_period_lookup=in_reporting_delay_period_lookup,
-                upper_confidence_lookup=upper_confidence_lookup,
-                lower_confidence_lookup=lower_confidence_lookup,
-            )
+            yield key, combined_plot_values
 
     @property
     def _is_date_based(self) -> bool:
         return self.plots[0].parameters.x_axis == ChartAxisFields.date.name
 
     @classmethod
-    def _build_plot_data_for_axes_values(
-        cls, *, plot: "PlotGenerationData"
-    ) -> PLOT_DATA_LOOKUP_TYPE:
-        return dict(zip(plot.x_axis_values, plot.y_axis_values, strict=False))
-
-    @classmethod
-    def _build_plot_data_for_in_reporting_delay_period_values(
-        cls, *, plot: "PlotGenerationData"
-    ) -> IN_REPORTING_DELAY_PERIOD_LOOKUP_TYPE:
-        try:
-            in_report_delay_period_values = plot.additional_values[
-                IN_REPORTING_DELAY_PERIOD
-            ]
-        except (KeyError, TypeError):
-            in_report_delay_period_values = [
-                False for _ in range(len(plot.x_axis_values))
-            ]
-
-        return dict(
-            zip(plot.x_axis_values, in_report_delay_period_values, strict=False)
+    def _build_plot_columns(
+        cls, *, index: int, plot: "PlotGenerationData"
+    ) -> _TabularPlotColumns:
+        # Values beyond the end of the shorter axis are dropped
+        number_of_values: int = min(len(plot.x_axis_values), len(plot.y_axis_values))
+
+        return _TabularPlotColumns(
+            label=plot.parameters.label or f"{DEFAULT_PLOT_LABEL}{index}",
+            x_axis_values=plot.x_axis_values[:number_of_values],
+            values=to_decimals(values=plot.y_axis_values[:number_of_values]),
+            in_reporting_delay_period_values=_pad(
+                values=to_list(
+                    values=cls._get_additional_values(
+                        plot=plot, field=IN_REPORTING_DELAY_PERIOD
+                    )
+                ),
+                length=number_of_values,
+                fill_value=False,
+            ),
+            upper_confidence_values=_pad(
+                values=to_decimals(
+                    values=cls._get_additional_values(plot=plot, field=UPPER_CONFIDENCE)
+                ),
+                length=number_of_values,
+                fill_value=None,
+            ),
+            lower_confidence_values=_pad(
+                values=to_decimals(
+                    values=cls._get_additional_values(plot=plot, field=LOWER_CONFIDENCE)
+                ),
+                length=number_of_values,
+                fill_value=None,
+            ),
         )
 
     @classmethod
-    def _build_plot_data_for_confidence_values(
-        cls, *, plot: "PlotGenerationData", confidence_field: str
-    ) -> CONFIDENCE_LOOKUP_TYPE:
-        """Builds a lookup dictionary for confidence interval values
-
-        Args:
-            plot: The plot data containing confidence intervals
-            confidence_field: The field name for the confidence interval
-                (either "upper_confidence" or "lower_confidence")
-
-        Returns:
-            A dictionary mapping x-axis values to confidence interval values
-        """
+    def _get_additional_values(cls, *, plot: "PlotGenerationData", field: str) -> Any:
         try:
-            confidence_values = plot.additional_values[confidence_field]
+            return plot.additional_values[field]
         except (KeyError, TypeError):
-            confidence_values = [None for _ in range(len(plot.x_axis_values))]
-
-        return dict(zip(plot.x_axis_values, confidence_values, strict=False))
+            return []
 
     def create_multi_plot_output(self) -> list[dict[str, str] | list[dict]]:
         """Creates the tabular output for the given plots
@@ -233,18 +316,19 @@ class TabularData:
         Returns:
             A list of dictionaries showing the plots in tabular format
         """
-        tabular_data = []
+        return list(
+            self._create_multi_plot_rows(combined_plots=self.combined_plots.items())
+        )
 
-        for left_column, plot_values in self.combined_plots.items():
-            tabular_data.append(
-                self.create_multi_plot_row(
-                    left_column=left_column,
-                    plot_values=plot_values,
-                )
+    def _create_multi_plot_rows(
+        self, *, combined_plots: Iterable[tuple[str, COMBINED_PLOT_VALUES_TYPE]]
+    ) -> Iterator[dict[str, str | list[dict]]]:
+        for left_column, plot_values in combined_plots:
+            yield self.create_multi_plot_row(
+                left_column=left_column,
+                plot_values=plot_values,
             )
 
-        return tabular_data
-
     def create_multi_plot_row(
         self, left_column: str, plot_values: dict[str, str]
     ) -> dict[str, str | list[dict]]:
@@ -356,63 +440,16 @@ class DualCategoryTabularData(TabularData):
             "values": self.create_timeseries_plot_values(plot_values=plot_values),
         }
 
-    def add_plot_data_to_combined_plots(
-        self,
-        *,
-        plot_data: PLOT_DATA_LOOKUP_TYPE,
-        plot_label: str,
-        in_reporting_delay_period_lookup: (
-            IN_REPORTING_DELAY_PERIOD_LOOKUP_TYPE | None
-        ) = None,
-        upper_confidence_lookup: CONFIDENCE_LOOKUP_TYPE | None = None,
-        lower_confidence_lookup: CONFIDENCE_LOOKUP_TYPE | None = None,
-    ):
-        """Add the values to the combined plots dictionary
+    @classmethod
+    def _get_in_reporting_delay_period_key(cls, *, plot_label: str) -> str:
+        """Returns the key for the reporting delay period of the given plot
 
         Notes:
-            For Dual-category tabular data, we won't have upper and lower confidence intervals
-            as these are not supported for this type of data.
+            For Dual-category tabular data, each segment of a row
+            tracks its own reporting delay period.
 
-        Args:
-            plot_data: The raw plot data that is not by date
-            plot_label: The label for this plot
-            in_reporting_delay_period_lookup: The lookups for
-                the reporting delay period associated with
-                each data point in the `plot_data`
-            upper_confidence_lookup: The lookups for upper confidence
-                intervals associated with each data point
-            lower_confidence_lookup: The lookups for lower confidence
-                intervals associated with each data point
         """
-
-        in_reporting_delay_period_lookup = in_reporting_delay_period_lookup or {}
-        upper_confidence_lookup = upper_confidence_lookup or {}
-        lower_confidence_lookup = lower_confidence_lookup or {}
-
-        for key, value in plot_data.items():
-            result = {plot_label: str(value)}
-            result[f"{plot_label}__{IN_REPORTING_DELAY_PERIOD}"] = (
-                self._fetch_reporting_delay_period(
-                    in_reporting_delay_period_lookup=in_reporting_delay_period_lookup,
-                    key=key,
-                )
-            )
-
-            upper_confidence_value = self._fetch_confidence_value(
-                confidence_lookup=upper_confidence_lookup,
-                key=key,
-            )
-            if upper_confidence_value is not None:
-                result[UPPER_CONFIDENCE] = str(upper_confidence_value)
-
-            lower_confidence_value = self._fetch_confidence_value(
-                confidence_lookup=lower_confidence_lookup,
-                key=key,
-            )
-            if lower_confidence_value is not None:
-                result[LOWER_CONFIDENCE] = str(lower_confidence_value)
-
-            self.combined_plots[str(key)].update(result)
+        return f"{plot_label}__{IN_REPORTING_DELAY_PERIOD}"
 
     def create_timeseries_plot_values(self, plot_values: dict[str, str]) -> list[dict]:
         """Creates an array of values for times series tabular data row
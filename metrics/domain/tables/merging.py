@@ -0,0 +1,97 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from metrics.domain.models.plot_columns import PLOT_VALUES_TYPE, is_date_values, to_list
+
+MISSING_POSITION = -1
+
+
+@dataclass
+class MergedXAxisValues:
+    """Holds the outer join of the x-axis values of a group of plots
+
+    Notes:
+        `keys` holds the stringified x-axis value for each row of the table.
+        `positions` holds 1 row per plot and 1 column per key.
+        Each item is the index of the value within that plot
+        which belongs to the key, or -1 if the plot has no value for it.
+
+    """
+
+    keys: list[str]
+    positions: np.ndarray
+
+
+def _build_keys(*, x_axis_values: PLOT_VALUES_TYPE) -> np.ndarray:
+    if not len(x_axis_values):
+        return np.array([], dtype="datetime64[D]")
+
+    if is_date_values(values=x_axis_values):
+        return np.asarray(x_axis_values, dtype="datetime64[D]")
+
+    return np.array([str(value) for value in to_list(values=x_axis_values)], dtype=str)
+
+
+def merge_x_axis_values(
+    *, x_axis_values_per_plot: Sequence[PLOT_VALUES_TYPE], sort_descending: bool
+) -> MergedXAxisValues:
+    """Outer joins the given plots on their x-axis values in 1 pass
+
+    Notes:
+        The x-axis values of every plot are concatenated
+        and the distinct keys are found with a single sort.
+        Keys are compared by their string representation,
+        which for dates is the ISO format and therefore chronological.
+
+        If a plot holds the same key more than once,
+        then the last value for that key is used.
+
+    Args:
+        x_axis_values_per_plot: The x-axis values of each plot,
+            either as a list or a column of a `PlotColumns`
+        sort_descending: Switch to order the keys from highest to lowest.
+            If False, the keys are kept in the order they are first seen
+            across the plots
+
+    Returns:
+        `MergedXAxisValues` holding the keys for each row of the table
+        and the position of the value for each plot within each row
+
+    """
+    keys_per_plot: list[np.ndarray] = [
+        _build_keys(x_axis_values=x_axis_values)
+        for x_axis_values in x_axis_values_per_plot
+    ]
+    if not all(np.issubdtype(keys.dtype, np.datetime64) for keys in keys_per_plot):
+        keys_per_plot = [keys.astype(str) for keys in keys_per_plot]
+
+    all_keys: np.ndarray = (
+        np.concatenate(keys_per_plot) if keys_per_plot else np.array([], dtype=str)
+    )
+    unique_keys, first_indices, inverse = np.unique(
+        all_keys, return_index=True, return_inverse=True
+    )
+
+    if sort_descending:
+        order: np.ndarray = np.arange(len(unique_keys))[::-1]
+    else:
+        order = np.argsort(first_indices, kind="stable")
+
+    row_of_unique_key = np.empty_like(order)
+    row_of_unique_key[order] = np.arange(len(order))
+    row_of_each_key: np.ndarray = row_of_unique_key[inverse.reshape(-1)]
+
+    positions = np.full(
+        (len(keys_per_plot), len(unique_keys)), MISSING_POSITION, dtype=np.intp
+    )
+    start = 0
+    for plot_index, keys in enumerate(keys_per_plot):
+        end: int = start + len(keys)
+        positions[plot_index, row_of_each_key[start:end]] = np.arange(len(keys))
+        start = end
+
+    return MergedXAxisValues(
+        keys=unique_keys[order].astype(str).tolist(), positions=positions
+    )
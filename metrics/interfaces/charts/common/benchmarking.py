@@ -0,0 +1,375 @@
+import datetime
+import functools
+import logging
+import math
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from timeit import default_timer
+
+import plotly.graph_objects as go
+
+from metrics.domain.charts import common_charts, subplots
+from metrics.domain.charts.stacked_bar.generation import generate_stacked_bar
+from metrics.domain.common.utils import ChartEncodings
+from metrics.domain.models import (
+    ChartGenerationPayload,
+    PlotGenerationData,
+    PlotParameters,
+    SubplotChartGenerationPayload,
+    SubplotGenerationData,
+)
+from metrics.interfaces.charts.common.rendering import ChartRendererPool, render_figure
+from metrics.interfaces.charts.common.svg import (
+    SVGOptimizers,
+    encode_svg,
+    optimize_svg,
+)
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_CHART_WIDTH = 930
+BENCHMARK_CHART_HEIGHT = 220
+BENCHMARK_NUMBER_OF_DAYS = 365
+BENCHMARK_REPORTING_DELAY_IN_DAYS = 14
+# Long enough that renders never fall back to plotly's own renderer
+BENCHMARK_ACQUIRE_TIMEOUT_SECONDS = 600
+BENCHMARK_GEOGRAPHIES = (
+    "Darlington",
+    "Hartlepool",
+    "Middlesbrough",
+    "Redcar and Cleveland",
+    "Stockton-on-Tees",
+)
+
+
+@dataclass
+class ChartRenderingBenchmarkResult:
+    pool_size: int
+    renders: int
+    p50_latency_seconds: float
+    p95_latency_seconds: float
+    throughput_per_second: float
+
+
+@dataclass
+class SVGOptimizationBenchmarkResult:
+    optimizer: str
+    rendered_bytes: int
+    optimized_bytes: int
+    uri_encoded_bytes: int
+    base64_encoded_bytes: int
+    cpu_seconds_per_chart: float
+
+
+def _build_timeseries_plot_data(
+    *, chart_type: str, line_colour: str, phase: float, **parameters
+) -> PlotGenerationData:
+    start_date = datetime.date(year=2024, month=1, day=1)
+    x_axis_values = [
+        start_date + datetime.timedelta(days=index)
+        for index in range(BENCHMARK_NUMBER_OF_DAYS)
+    ]
+    y_axis_values = [
+        round(1000 + 800 * math.sin(index / 30 + phase), 2)
+        for index in range(BENCHMARK_NUMBER_OF_DAYS)
+    ]
+    in_reporting_delay_period = [
+        index >= BENCHMARK_NUMBER_OF_DAYS - BENCHMARK_REPORTING_DELAY_IN_DAYS
+        for index in range(BENCHMARK_NUMBER_OF_DAYS)
+    ]
+
+    return PlotGenerationData(
+        parameters=PlotParameters(
+            chart_type=chart_type,
+            topic="COVID-19",
+            metric="COVID-19_cases_casesByDay",
+            x_axis="date",
+            y_axis="metric",
+            line_colour=line_colour,
+            line_type="SOLID",
+            **parameters,
+        ),
+        x_axis_values=x_axis_values,
+        y_axis_values=y_axis_values,
+        additional_values={"in_reporting_delay_period": in_reporting_delay_period},
+    )
+
+
+def _build_chart_generation_payload(
+    *, plots: list[PlotGenerationData], secondary_category: str = ""
+) -> ChartGenerationPayload:
+    return ChartGenerationPayload(
+        plots=plots,
+        chart_width=BENCHMARK_CHART_WIDTH,
+        chart_height=BENCHMARK_CHART_HEIGHT,
+        x_axis_title="Date",
+        y_axis_title="Cases",
+        secondary_category=secondary_category,
+    )
+
+
+def _build_subplot_chart_generation_payload() -> SubplotChartGenerationPayload:
+    subplot_data = [
+        SubplotGenerationData(
+            subplot_title=subplot_title,
+            subplot_data=[
+                PlotGenerationData(
+                    parameters=PlotParameters(
+                        chart_type="bar",
+                        topic="MMR1",
+                        metric="MMR1_coverage_coverageByYear",
+                        geography=geography,
+                        x_axis="geography",
+                        y_axis="metric",
+                        line_colour="COLOUR_1_DARK_BLUE",
+                    ),
+                    x_axis_values=[geography],
+                    y_axis_values=[90 + (index + subplot_index) % 8],
+                )
+                for index, geography in enumerate(BENCHMARK_GEOGRAPHIES)
+            ],
+        )
+        for subplot_index, subplot_title in enumerate(
+            ("6-in-1", "MMR1", "MMR2", "Hib/MenC")
+        )
+    ]
+
+    return SubplotChartGenerationPayload(
+        subplot_data=subplot_data,
+        chart_width=BENCHMARK_CHART_WIDTH,
+        chart_height=BENCHMARK_CHART_HEIGHT,
+        x_axis_title="Geography",
+        y_axis_title="Coverage",
+        target_threshold=95,
+        target_threshold_label="Target 95%",
+    )
+
+
+def build_benchmark_chart_corpus() -> dict[str, go.Figure]:
+    """Builds the fixed corpus of charts which is rendered by the benchmark
+
+    Notes:
+        The figures are drawn with synthetic data by the same functions
+        which draw the charts for the charts endpoints.
+        So the rendering cost is representative of real requests,
+        without needing any data in the database.
+
+    Returns:
+        Dict of the name of each chart
+        and the corresponding plotly `Figure`
+
+    """
+    single_category_line = common_charts.generate_chart_figure(
+        chart_generation_payload=_build_chart_generation_payload(
+            plots=[
+                _build_timeseries_plot_data(
+                    chart_type="line_multi_coloured",
+                    line_colour="COLOUR_1_DARK_BLUE",
+                    phase=0,
+                ),
+                _build_timeseries_plot_data(
+                    chart_type="line_multi_coloured",
+                    line_colour="COLOUR_2_TURQUOISE",
+                    phase=1,
+                ),
+            ]
+        )
+    )
+    single_category_bar_with_line = common_charts.generate_chart_figure(
+        chart_generation_payload=_build_chart_generation_payload(
+            plots=[
+                _build_timeseries_plot_data(
+                    chart_type="bar", line_colour="COLOUR_1_DARK_BLUE", phase=0
+                ),
+                _build_timeseries_plot_data(
+                    chart_type="line_multi_coloured",
+                    line_colour="COLOUR_3_DARK_PINK",
+                    phase=0.5,
+                ),
+            ]
+        )
+    )
+    dual_category_stacked_bar = generate_stacked_bar(
+        chart_generation_payload=_build_chart_generation_payload(
+            plots=[
+                _build_timeseries_plot_data(
+                    chart_type="bar",
+                    line_colour="COLOUR_1_DARK_BLUE",
+                    phase=index,
+                    age=age,
+                    label=age,
+                )
+                for index, age in enumerate(("00-04", "05-14", "15-44", "45-64"))
+            ],
+            secondary_category="age",
+        )
+    )
+    subplot = subplots.generate_chart_figure(
+        chart_generation_payload=_build_subplot_chart_generation_payload()
+    )
+
+    return {
+        "single_category_line": single_category_line,
+        "single_category_bar_with_line": single_category_bar_with_line,
+        "dual_category_stacked_bar": dual_category_stacked_bar,
+        "subplot": subplot,
+    }
+
+
+def _calculate_percentile(*, values: list[float], percentile: int) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percentile - 1]
+
+
+def _time_render(
+    figure: go.Figure, *, chart_renderer_pool: ChartRendererPool, file_format: str
+) -> float:
+    start: float = default_timer()
+    chart_renderer_pool.render(figure=figure, file_format=file_format)
+    return default_timer() - start
+
+
+def benchmark_chart_renderer_pool(
+    *,
+    pool_sizes: list[int],
+    concurrency: int,
+    renders_per_chart: int = 10,
+    file_format: str = "svg",
+) -> list[ChartRenderingBenchmarkResult]:
+    """Renders the benchmark corpus of charts concurrently through pools of each size
+
+    Notes:
+        A pool size of 0 renders every chart with plotly's own renderer,
+        which provides the baseline for the pooled renderers.
+
+        Each pool is warmed up and renders each chart once before timing starts.
+        The queue of each pool is sized to hold all the concurrent renders
+        and renders wait for as long as needed for a free renderer.
+        So the pool never falls back to plotly's own renderer
+        and the results only reflect the pooled renderers.
+
+    Args:
+        pool_sizes: The sizes of the pools to benchmark
+        concurrency: The number of threads rendering charts at once.
+            This should reflect the number of threads per worker process
+        renders_per_chart: The number of times each chart
+            in the corpus is rendered for each pool size.
+            Defaults to 10
+        file_format: The format of the images to render.
+            Defaults to "svg"
+
+    Returns:
+        List of `ChartRenderingBenchmarkResult` for each pool size.
+        Each result holds the median and 95th percentile latency
+        of a single render and the number of renders completed per second
+
+    """
+    corpus: dict[str, go.Figure] = build_benchmark_chart_corpus()
+    figures: list[go.Figure] = list(corpus.values()) * renders_per_chart
+    results: list[ChartRenderingBenchmarkResult] = []
+
+    for pool_size in pool_sizes:
+        chart_renderer_pool = ChartRendererPool(
+            size=pool_size,
+            max_queue_size=concurrency,
+            acquire_timeout_seconds=BENCHMARK_ACQUIRE_TIMEOUT_SECONDS,
+        )
+
+        render = functools.partial(
+            _time_render,
+            chart_renderer_pool=chart_renderer_pool,
+            file_format=file_format,
+        )
+
+        try:
+            chart_renderer_pool.warm_up()
+            for figure in corpus.values():
+                render(figure=figure)
+
+            start: float = default_timer()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                latencies: list[float] = list(executor.map(render, figures))
+            duration: float = default_timer() - start
+        finally:
+            chart_renderer_pool.shutdown()
+
+        result = ChartRenderingBenchmarkResult(
+            pool_size=pool_size,
+            renders=len(latencies),
+            p50_latency_seconds=round(
+                _calculate_percentile(values=latencies, percentile=50), 4
+            ),
+            p95_latency_seconds=round(
+                _calculate_percentile(values=latencies, percentile=95), 4
+            ),
+            throughput_per_second=round(len(latencies) / duration, 2),
+        )
+        logger.info("Benchmarked chart rendering: %s", result)
+        results.append(result)
+
+    return results
+
+
+def benchmark_svg_optimizers(
+    *, optimizers: list[str] | None = None, repeats: int = 10
+) -> list[SVGOptimizationBenchmarkResult]:
+    """Optimizes the SVGs of the benchmark corpus of charts with each optimizer
+
+    Notes:
+        Each chart in the corpus is rendered to an SVG once up front.
+        So the results only reflect the cost of optimizing the SVGs.
+
+        The sizes are the totals across all the charts in the corpus.
+        The encoded sizes show what is returned by the encoded charts endpoints
+        for the "uri" and "base64" chart encodings.
+
+    Args:
+        optimizers: The names of the optimizers to benchmark.
+            Defaults to all the available optimizers
+        repeats: The number of times each SVG is optimized
+            by each optimizer. Defaults to 10
+
+    Returns:
+        List of `SVGOptimizationBenchmarkResult` for each optimizer.
+        Each result holds the total size of the SVGs
+        before and after being optimized and encoded
+        and the CPU time taken to optimize a single chart
+
+    """
+    optimizers = optimizers or [optimizer.value for optimizer in SVGOptimizers]
+    svg_images: list[bytes] = [
+        render_figure(figure=figure, file_format="svg")
+        for figure in build_benchmark_chart_corpus().values()
+    ]
+    results: list[SVGOptimizationBenchmarkResult] = []
+
+    for optimizer in optimizers:
+        start: float = time.process_time()
+        for _ in range(repeats):
+            optimized_svgs: list[str] = [
+                optimize_svg(svg_image=svg_image, optimizer=optimizer)
+                for svg_image in svg_images
+            ]
+        cpu_seconds: float = time.process_time() - start
+
+        result = SVGOptimizationBenchmarkResult(
+            optimizer=optimizer,
+            rendered_bytes=sum(len(svg_image) for svg_image in svg_images),
+            optimized_bytes=sum(len(svg.encode("utf-8")) for svg in optimized_svgs),
+            uri_encoded_bytes=sum(
+                len(encode_svg(svg=svg, chart_encoding=ChartEncodings.uri.value))
+                for svg in optimized_svgs
+            ),
+            base64_encoded_bytes=sum(
+                len(encode_svg(svg=svg, chart_encoding=ChartEncodings.base64.value))
+                for svg in optimized_svgs
+            ),
+            cpu_seconds_per_chart=round(cpu_seconds / (repeats * len(svg_images)), 5),
+        )
+        logger.info("Benchmarked SVG optimization: %s", result)
+        results.append(result)
+
+    return results
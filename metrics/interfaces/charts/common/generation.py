@@ -1,12 +1,11 @@
 import datetime
-import io
-import urllib
 from dataclasses import asdict, dataclass
 
 import plotly
-from scour import scour
 
 from metrics.interfaces.charts.common.chart_output import ChartOutput
+from metrics.interfaces.charts.common.rendering import render_figure
+from metrics.interfaces.charts.common.svg import encode_svg, optimize_svg
 
 
 @dataclass
@@ -56,20 +55,26 @@ def generate_encoded_chart(
     return ChartResult(
         last_updated=charts_interface.last_updated,
         chart=_encode_figure(
-            figure=chart_output.figure, file_format=chart_request_params.file_format
+            figure=chart_output.figure,
+            file_format=chart_request_params.file_format,
+            chart_encoding=chart_request_params.chart_encoding,
         ),
         alt_text=chart_output.description,
         figure=chart_output.interactive_chart_figure_output,
     )
 
 
-def _encode_figure(*, figure: plotly.graph_objects.Figure, file_format: str) -> str:
-    """URI Encode the supplied chart figure
+def _encode_figure(
+    *, figure: plotly.graph_objects.Figure, file_format: str, chart_encoding: str
+) -> str:
+    """Encode the supplied chart figure
 
     Args:
         figure: The plotly `Figure` object a chart figure
         file_format: The format to which the file
             should be converted into
+        chart_encoding: The encoding to apply to the figure.
+            Either "uri", "base64" or "raw"
 
     Returns:
         An encoded string representation of the figure
@@ -79,7 +84,7 @@ def _encode_figure(*, figure: plotly.graph_objects.Figure, file_format: str) ->
         raise ValueError
 
     optimized_svg: str = _create_optimized_svg(figure=figure, file_format=file_format)
-    return urllib.parse.quote_plus(optimized_svg)
+    return encode_svg(svg=optimized_svg, chart_encoding=chart_encoding)
 
 
 def _create_optimized_svg(
@@ -96,8 +101,8 @@ def _create_optimized_svg(
         The figure as an image and optimized for size if required
 
     """
-    svg_image: bytes = figure.to_image(format=file_format, validate=False)
-    return scour.scourString(in_string=svg_image)
+    svg_image: bytes = render_figure(figure=figure, file_format=file_format)
+    return optimize_svg(svg_image=svg_image)
 
 
 def generate_chart_as_file(
@@ -148,13 +153,4 @@ def _write_figure(*, figure: plotly.graph_objects.Figure, file_format: str) -> b
         The image in memory
 
     """
-    file = io.BytesIO()
-
-    figure.write_image(
-        file=file,
-        format=file_format,
-        validate=False,
-    )
-
-    file.seek(0)
-    return file.getvalue()
+    return render_figure(figure=figure, file_format=file_format)
@@ -0,0 +1,306 @@
+"""Renders plotly figures to static images from a warm pool of headless renderers.
+
+By default, plotly renders every static image through a single kaleido process,
+which is shared by the whole worker process and guarded by a lock.
+So concurrent chart requests handled by the threads of a worker
+are serialised on that one renderer.
+
+The `ChartRendererPool` keeps a number of kaleido processes warm,
+so that concurrent requests can be rendered in parallel
+without paying the startup cost of the renderer each time.
+When the pool is saturated or a renderer fails,
+the chart is rendered by plotly's own renderer instead.
+"""
+
+import logging
+import os
+import queue
+import subprocess
+import threading
+from collections.abc import Callable
+
+import plotly
+import plotly.graph_objects as go
+from kaleido.scopes.plotly import PlotlyScope
+
+import config
+
+logger = logging.getLogger(__name__)
+
+RENDERER_SHUTDOWN_TIMEOUT_SECONDS = 2.0
+
+PLOTLY_JS_PATH: str = os.path.join(
+    os.path.dirname(os.path.abspath(plotly.__file__)),
+    "package_data",
+    "plotly.min.js",
+)
+
+
+class ChartRenderer:
+    """Wraps a dedicated kaleido process for rendering figures to static images
+
+    Notes:
+        Each renderer is pinned to the version of plotly.js
+        which is bundled with the installed version of plotly,
+        in the same way as plotly's own renderer.
+        MathJax is not loaded, since none of the charts use LaTeX.
+
+    """
+
+    def __init__(self, *, scope=None):
+        self._scope = scope or self._create_scope()
+
+    @classmethod
+    def _create_scope(cls) -> PlotlyScope:
+        return PlotlyScope(plotlyjs=PLOTLY_JS_PATH, mathjax=False)
+
+    def warm_up(self) -> None:
+        """Starts the underlying kaleido process by rendering an empty figure"""
+        self._scope.transform({"data": [], "layout": {}}, format="svg")
+
+    def is_healthy(self) -> bool:
+        """Checks whether the underlying kaleido process is still running
+
+        Returns:
+            True if the process is running or has not been started yet.
+            False if the process has exited.
+
+        """
+        process: subprocess.Popen | None = self._get_process()
+        return process is None or process.poll() is None
+
+    def _get_process(self) -> subprocess.Popen | None:
+        return getattr(self._scope, "_proc", None)
+
+    def render(
+        self, *, figure: go.Figure, file_format: str, timeout_seconds: float
+    ) -> bytes:
+        """Renders the `figure` as a static image in the given `file_format`
+
+        Notes:
+            If the render does not complete within `timeout_seconds`,
+            the kaleido process is killed.
+            This causes the render to fail with an error
+            and leaves the renderer unhealthy,
+            so that it is replaced by the `ChartRendererPool`.
+
+        Args:
+            figure: The plotly `Figure` object to be rendered
+            file_format: The format of the image.
+                E.g. "svg" or "png"
+            timeout_seconds: The number of seconds
+                after which the render is abandoned
+
+        Returns:
+            The rendered image
+
+        """
+        watchdog = threading.Timer(interval=timeout_seconds, function=self._kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            return self._scope.transform(figure.to_dict(), format=file_format)
+        finally:
+            watchdog.cancel()
+
+    def _kill(self) -> None:
+        process: subprocess.Popen | None = self._get_process()
+        if process is not None:
+            logger.warning("Chart renderer timed out and has been killed")
+            process.kill()
+
+    def shutdown(self) -> None:
+        """Shuts down the underlying kaleido process
+
+        Notes:
+            The process is asked to exit by closing its input.
+            If it has not exited within `RENDERER_SHUTDOWN_TIMEOUT_SECONDS`,
+            then it is killed.
+
+        Returns:
+            None
+
+        """
+        process: subprocess.Popen | None = self._get_process()
+        if process is None or process.poll() is not None:
+            return
+
+        process.stdin.close()
+        try:
+            process.wait(timeout=RENDERER_SHUTDOWN_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+class ChartRendererPool:
+    """Holds a bounded pool of warm `ChartRenderer` processes shared across requests
+
+    Notes:
+        Up to `size` charts are rendered concurrently by the pool.
+        A further `max_queue_size` requests can wait for a renderer
+        for up to `acquire_timeout_seconds`.
+        Any requests beyond that, or which time out whilst waiting,
+        fall back to plotly's own renderer.
+
+        Each renderer is health checked before it is used.
+        Renderers which have exited or which fail a render
+        are discarded and replaced with a new renderer on demand.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int | None = None,
+        max_queue_size: int | None = None,
+        acquire_timeout_seconds: float | None = None,
+        render_timeout_seconds: float | None = None,
+        renderer_factory: Callable[[], ChartRenderer] = ChartRenderer,
+    ):
+        self.size: int = config.CHART_RENDERER_POOL_SIZE if size is None else size
+        self._max_queue_size: int = (
+            config.CHART_RENDERER_POOL_MAX_QUEUE_SIZE
+            if max_queue_size is None
+            else max_queue_size
+        )
+        self._acquire_timeout_seconds: float = (
+            config.CHART_RENDERER_POOL_ACQUIRE_TIMEOUT_SECONDS
+            if acquire_timeout_seconds is None
+            else acquire_timeout_seconds
+        )
+        self._render_timeout_seconds: float = (
+            config.CHART_RENDERER_TIMEOUT_SECONDS
+            if render_timeout_seconds is None
+            else render_timeout_seconds
+        )
+        self._renderer_factory = renderer_factory
+
+        self._admissions = threading.BoundedSemaphore(
+            max(self.size + self._max_queue_size, 1)
+        )
+        self._slots = threading.BoundedSemaphore(max(self.size, 1))
+        self._idle_renderers: queue.LifoQueue[ChartRenderer] = queue.LifoQueue()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.size > 0
+
+    def warm_up(self) -> None:
+        """Starts all the renderers of the pool ahead of the first request"""
+        if not self.is_enabled:
+            return
+
+        for _ in range(self.size - self._idle_renderers.qsize()):
+            renderer: ChartRenderer = self._renderer_factory()
+            renderer.warm_up()
+            self._idle_renderers.put(renderer)
+
+    def shutdown(self) -> None:
+        """Shuts down all the idle renderers of the pool"""
+        while True:
+            try:
+                renderer: ChartRenderer = self._idle_renderers.get_nowait()
+            except queue.Empty:
+                return
+            self._shutdown_renderer(renderer=renderer)
+
+    def render(self, *, figure: go.Figure, file_format: str) -> bytes:
+        """Renders the `figure` as a static image in the given `file_format`
+
+        Notes:
+            The figure is rendered by plotly's own renderer instead if:
+                - The pool is disabled
+                - The pool and its queue are full
+                - No renderer became free within the acquire timeout
+                - The renderer from the pool failed to render the figure
+
+        Args:
+            figure: The plotly `Figure` object to be rendered
+            file_format: The format of the image.
+                E.g. "svg" or "png"
+
+        Returns:
+            The rendered image
+
+        """
+        if not self.is_enabled:
+            return self._render_in_process(figure=figure, file_format=file_format)
+
+        if not self._admissions.acquire(blocking=False):
+            logger.info("Chart renderer pool is saturated, rendering in process")
+            return self._render_in_process(figure=figure, file_format=file_format)
+
+        try:
+            if not self._slots.acquire(timeout=self._acquire_timeout_seconds):
+                logger.info("Timed out waiting for a chart renderer from the pool")
+                return self._render_in_process(figure=figure, file_format=file_format)
+
+            try:
+                return self._render_with_pooled_renderer(
+                    figure=figure, file_format=file_format
+                )
+            finally:
+                self._slots.release()
+        finally:
+            self._admissions.release()
+
+    def _render_with_pooled_renderer(
+        self, *, figure: go.Figure, file_format: str
+    ) -> bytes:
+        renderer: ChartRenderer = self._checkout_renderer()
+
+        try:
+            image: bytes = renderer.render(
+                figure=figure,
+                file_format=file_format,
+                timeout_seconds=self._render_timeout_seconds,
+            )
+        except Exception:
+            logger.exception("Chart renderer failed, rendering in process instead")
+            self._shutdown_renderer(renderer=renderer)
+            return self._render_in_process(figure=figure, file_format=file_format)
+
+        self._idle_renderers.put(renderer)
+        return image
+
+    def _checkout_renderer(self) -> ChartRenderer:
+        while True:
+            try:
+                renderer: ChartRenderer = self._idle_renderers.get_nowait()
+            except queue.Empty:
+                return self._renderer_factory()
+
+            if renderer.is_healthy():
+                return renderer
+
+            logger.warning("Discarding unhealthy chart renderer from the pool")
+            self._shutdown_renderer(renderer=renderer)
+
+    @classmethod
+    def _shutdown_renderer(cls, *, renderer: ChartRenderer) -> None:
+        try:
+            renderer.shutdown()
+        except Exception:
+            logger.exception("Failed to shut down chart renderer")
+
+    @classmethod
+    def _render_in_process(cls, *, figure: go.Figure, file_format: str) -> bytes:
+        return figure.to_image(format=file_format, validate=False)
+
+
+chart_renderer_pool = ChartRendererPool()
+
+
+def render_figure(*, figure: go.Figure, file_format: str) -> bytes:
+    """Renders the `figure` as a static image via the process-wide `chart_renderer_pool`
+
+    Args:
+        figure: The plotly `Figure` object to be rendered
+        file_format: The format of the image.
+            E.g. "svg" or "png"
+
+    Returns:
+        The rendered image
+
+    """
+    return chart_renderer_pool.render(figure=figure, file_format=file_format)
@@ -0,0 +1,100 @@
+"""Shares the data behind a chart across the requests for each of its widths.
+
+Each chart is requested once for every width at which it can be displayed.
+The data for the plots of a chart does not depend on its width,
+only the layout of the figure does.
+
+Within a `share_chart_data_across_widths()` block, the plots data built
+for the first of these requests is held and reused by the subsequent requests.
+So the underlying queries and aggregations are only made once per chart,
+whilst the figure and image are still drawn at each width
+and held in separate cache entries.
+"""
+
+import contextvars
+import json
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from metrics.domain.models.charts.common import ChartBaseRequestParams
+
+# The fields of the request which only affect the layout of the figure
+WIDTH_DEPENDENT_FIELDS: set[str] = {"chart_width", "chart_height"}
+
+_shared_chart_data_ctx: contextvars.ContextVar[dict[str, Any] | None] = (
+    contextvars.ContextVar("_shared_chart_data_ctx", default=None)
+)
+
+
+@contextmanager
+def share_chart_data_across_widths() -> Iterator[None]:
+    """Shares the plots data built for charts within this block between widths
+
+    Notes:
+        The shared data is discarded when the block is exited.
+        So this should wrap the requests for the widths of a single chart.
+
+    """
+    token: contextvars.Token = _shared_chart_data_ctx.set({})
+    try:
+        yield
+    finally:
+        _shared_chart_data_ctx.reset(token)
+
+
+def build_shared_chart_data_key(*, chart_request_params: ChartBaseRequestParams) -> str:
+    """Builds the key which identifies the data of the chart regardless of its width
+
+    Args:
+        chart_request_params: The request params model for the chart
+
+    Returns:
+        A string which is the same for requests
+        which only differ by the size of the chart
+
+    """
+    params: dict[str, Any] = chart_request_params.model_dump(
+        exclude={"request", *WIDTH_DEPENDENT_FIELDS}
+    )
+    return json.dumps(
+        [
+            type(chart_request_params).__name__,
+            params,
+            chart_request_params.permission_sets,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def get_or_build_shared_chart_data(
+    *, chart_request_params: ChartBaseRequestParams, build: Callable[[], Any]
+) -> Any:
+    """Returns the shared data for the chart, calling `build` if it is not held yet
+
+    Notes:
+        Outside a `share_chart_data_across_widths()` block,
+        `build` is always called and nothing is held.
+
+        If `build` raises an error, nothing is held.
+        So the error will be raised again for the next width.
+
+    Args:
+        chart_request_params: The request params model for the chart
+        build: Callable which builds the data for the chart
+
+    Returns:
+        The data for the chart
+
+    """
+    shared_chart_data: dict[str, Any] | None = _shared_chart_data_ctx.get()
+    if shared_chart_data is None:
+        return build()
+
+    key: str = build_shared_chart_data_key(chart_request_params=chart_request_params)
+    try:
+        return shared_chart_data[key]
+    except KeyError:
+        shared_chart_data[key] = build()
+        return shared_chart_data[key]
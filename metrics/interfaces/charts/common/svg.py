@@ -0,0 +1,213 @@
+"""Post-processes the SVG images exported for charts before they are returned.
+
+The SVGs exported by plotly carry a lot of markup which is only used
+by plotly.js when the chart is interactive.
+Such as the class names and `data-*` attributes of each element
+and the many empty groups which make up the layers of the chart.
+The coordinates of each element are also written out
+with more precision than can be seen at the sizes the charts are drawn at.
+
+`minify_svg()` strips these out in a single pass over the tags of the document,
+without building a DOM of the document like scour does.
+Scour can still be opted into by setting `CHART_SVG_OPTIMIZER` to `scour`.
+"""
+
+import base64
+import re
+import urllib.parse
+from collections.abc import Callable
+from enum import Enum
+
+from scour import scour
+
+import config
+from metrics.domain.common.utils import ChartEncodings
+
+# Attributes which hold numbers that can be rounded
+# without any visible difference to the chart
+NUMERIC_ATTRIBUTES: set[str] = {
+    "d",
+    "transform",
+    "points",
+    "x",
+    "y",
+    "x1",
+    "x2",
+    "y1",
+    "y2",
+    "dx",
+    "dy",
+    "cx",
+    "cy",
+    "r",
+    "rx",
+    "ry",
+    "width",
+    "height",
+}
+# Attributes which are only used by plotly.js for interactive charts
+STRIPPED_ATTRIBUTES: set[str] = {"class", "pointer-events"}
+
+_TAG_PATTERN = re.compile(r"<([A-Za-z][\w:.-]*)((?:\s+[\w:.-]+=\"[^\"]*\")*)\s*(/?)>")
+_ATTRIBUTE_PATTERN = re.compile(r"\s+([\w:.-]+)=\"([^\"]*)\"")
+_DECIMAL_PATTERN = re.compile(r"-?\d*\.\d+(?:[eE][-+]?\d+)?")
+_RGB_PATTERN = re.compile(r"rgb\(\s*(\d{1,3}),\s*(\d{1,3}),\s*(\d{1,3})\s*\)")
+_STYLE_SEPARATOR_PATTERN = re.compile(r"\s*([:;,])\s*")
+_COMMENT_PATTERN = re.compile(r"<!--.*?-->", flags=re.DOTALL)
+_FORMATTING_WHITESPACE_PATTERN = re.compile(r">\s*\n\s*<")
+_EMPTY_GROUP_PATTERN = re.compile(r"<g>\s*</g>|<g/>")
+_TRAILING_ENTITY_PATTERN = re.compile(r"&#?\w+;$")
+
+
+class SVGOptimizers(Enum):
+    minify = "minify"
+    scour = "scour"
+
+
+def _round_decimal(match: re.Match, decimal_places: int) -> str:
+    rounded: str = f"{float(match.group()):.{decimal_places}f}"
+    if "." in rounded:
+        rounded = rounded.rstrip("0").rstrip(".")
+    return "0" if rounded == "-0" else rounded
+
+
+def _shorten_rgb(match: re.Match) -> str:
+    red, green, blue = (min(int(channel), 255) for channel in match.groups())
+    hex_colour: str = f"{red:02x}{green:02x}{blue:02x}"
+    if all(hex_colour[index] == hex_colour[index + 1] for index in (0, 2, 4)):
+        hex_colour = hex_colour[::2]
+    return f"#{hex_colour}"
+
+
+def _minify_style(style: str) -> str:
+    style = _RGB_PATTERN.sub(_shorten_rgb, style)
+    style = _STYLE_SEPARATOR_PATTERN.sub(r"\1", style).strip()
+    if style.endswith(";") and not _TRAILING_ENTITY_PATTERN.search(style):
+        style = style[:-1]
+    return style
+
+
+def _build_tag_minifier(decimal_places: int) -> Callable[[re.Match], str]:
+    def round_decimals(value: str) -> str:
+        return _DECIMAL_PATTERN.sub(
+            lambda match: _round_decimal(match, decimal_places), value
+        )
+
+    def minify_tag(match: re.Match) -> str:
+        tag_name, attributes, self_closing = match.groups()
+        minified_attributes: list[str] = []
+
+        for name, value in _ATTRIBUTE_PATTERN.findall(attributes):
+            if name in STRIPPED_ATTRIBUTES or name.startswith("data-"):
+                continue
+            if name == "style":
+                minified_value = _minify_style(value)
+            elif name in NUMERIC_ATTRIBUTES:
+                minified_value = round_decimals(value)
+            elif name in {"fill", "stroke"}:
+                minified_value = _RGB_PATTERN.sub(_shorten_rgb, value)
+            else:
+                minified_value = value
+
+            if not minified_value and name == "style":
+                continue
+            minified_attributes.append(f' {name}="{minified_value}"')
+
+        return f"<{tag_name}{''.join(minified_attributes)}{self_closing}>"
+
+    return minify_tag
+
+
+def minify_svg(*, svg_image: bytes | str, decimal_places: int | None = None) -> str:
+    """Minifies the given plotly `svg_image` without changing how it is drawn
+
+    Notes:
+        The following changes are made to the document:
+            - Decimal numbers in coordinates and sizes are rounded
+              to `decimal_places`
+            - Class names, `data-*` attributes and empty styles are removed
+            - Style declarations are collapsed
+              and `rgb()` colours are shortened to hex codes
+            - Groups which are left empty are removed
+            - Comments and formatting whitespace between tags are removed
+
+        Text content is left as is, so the labels of the chart are unchanged.
+
+    Args:
+        svg_image: The SVG exported for the chart
+        decimal_places: The number of decimal places to round numbers to.
+            Defaults to the `CHART_SVG_DECIMAL_PLACES` config value
+
+    Returns:
+        The minified SVG
+
+    """
+    if isinstance(svg_image, bytes):
+        svg_image = svg_image.decode("utf-8")
+    if decimal_places is None:
+        decimal_places = config.CHART_SVG_DECIMAL_PLACES
+
+    svg: str = _COMMENT_PATTERN.sub("", svg_image)
+    svg = _FORMATTING_WHITESPACE_PATTERN.sub("><", svg)
+    svg = _TAG_PATTERN.sub(_build_tag_minifier(decimal_places=decimal_places), svg)
+
+    # Removing an empty group can leave its parent group empty
+    previous_length: int = -1
+    while len(svg) != previous_length:
+        previous_length = len(svg)
+        svg = _EMPTY_GROUP_PATTERN.sub("", svg)
+
+    if "xlink:" not in svg.replace("xmlns:xlink", ""):
+        svg = svg.replace(' xmlns:xlink="http://www.w3.org/1999/xlink"', "", 1)
+
+    return svg.strip()
+
+
+def optimize_svg(*, svg_image: bytes, optimizer: str | None = None) -> str:
+    """Optimizes the size of the given `svg_image` with the selected optimizer
+
+    Args:
+        svg_image: The SVG exported for the chart
+        optimizer: The name of the optimizer to use,
+            either "minify" or "scour".
+            Defaults to the `CHART_SVG_OPTIMIZER` config value
+
+    Returns:
+        The optimized SVG
+
+    """
+    optimizer = optimizer or config.CHART_SVG_OPTIMIZER
+
+    if optimizer == SVGOptimizers.scour.value:
+        return scour.scourString(in_string=svg_image)
+
+    return minify_svg(svg_image=svg_image)
+
+
+def encode_svg(*, svg: str, chart_encoding: str = ChartEncodings.uri.value) -> str:
+    """Encodes the given `svg` so that it can be returned in a JSON response
+
+    Notes:
+        The "uri" encoding is the default for backwards compatibility.
+        But it inflates the size of the SVG,
+        since most of the characters in the markup are escaped.
+        The "base64" encoding grows the SVG by a fixed third
+        and "raw" returns the SVG markup as is.
+
+    Args:
+        svg: The SVG markup of the chart
+        chart_encoding: The encoding to apply,
+            either "uri", "base64" or "raw".
+            Defaults to "uri"
+
+    Returns:
+        The encoded SVG
+
+    """
+    if chart_encoding == ChartEncodings.raw.value:
+        return svg
+
+    if chart_encoding == ChartEncodings.base64.value:
+        return base64.b64encode(svg.encode("utf-8")).decode("ascii")
+
+    return urllib.parse.quote_plus(svg)
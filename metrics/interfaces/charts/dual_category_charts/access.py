@@ -16,6 +16,9 @@ from metrics.domain.models.plots import (
 )
 from metrics.domain.models.plots_text import PlotsText
 from metrics.interfaces.charts.common.chart_output import ChartOutput
+from metrics.interfaces.charts.common.shared_data import (
+    get_or_build_shared_chart_data,
+)
 from metrics.interfaces.plots.access import PlotsInterface
 from metrics.utils.type_hints import CORE_MODEL_MANAGER_TYPE
 
@@ -79,6 +82,10 @@ class DualCategoryChartsInterface:
             that chart plot is skipped and
             an enriched model will not be provided.
 
+            Within a `share_chart_data_across_widths()` block,
+            the plots data is shared with requests for the same chart
+            at other widths, instead of being queried again.
+
         Returns:
             A list of `PlotData` models for each of the requested chart plots.
 
@@ -87,7 +94,10 @@ class DualCategoryChartsInterface:
                 returned any data from the underlying queries
 
         """
-        plots_data: list[PlotGenerationData] = self.plots_interface.build_plots_data()
+        plots_data: list[PlotGenerationData] = get_or_build_shared_chart_data(
+            chart_request_params=self.chart_request_params,
+            build=self.plots_interface.build_plots_data,
+        )
         self._set_latest_date_from_plots_data(plots_data=plots_data)
 
         return plots_data
@@ -1,10 +1,7 @@
-import io
-import urllib.parse
 from datetime import datetime
 
 import plotly.graph_objects as go
 from django.db.models import Manager
-from scour import scour
 
 from metrics.data.models.core_models import CoreHeadline, CoreTimeSeries
 from metrics.domain.charts import (
@@ -23,6 +20,11 @@ from metrics.domain.models import (
 from metrics.domain.models.plots_text import PlotsText
 from metrics.interfaces.charts.common.chart_output import ChartOutput
 from metrics.interfaces.charts.common.exceptions import InvalidFileFormatError
+from metrics.interfaces.charts.common.rendering import render_figure
+from metrics.interfaces.charts.common.shared_data import (
+    get_or_build_shared_chart_data,
+)
+from metrics.interfaces.charts.common.svg import encode_svg, optimize_svg
 from metrics.interfaces.plots.access import PlotsInterface
 from metrics.utils.type_hints import CORE_MODEL_MANAGER_TYPE
 
@@ -265,6 +267,10 @@ class ChartsInterface:
             that chart plot is skipped and
             an enriched model will not be provided.
 
+            Within a `share_chart_data_across_widths()` block,
+            the plots data is shared with requests for the same chart
+            at other widths, instead of being queried again.
+
         Returns:
             A list of `PlotData` models for each of the requested chart plots.
 
@@ -273,7 +279,10 @@ class ChartsInterface:
                 returned any data from the underlying queries
 
         """
-        plots_data: list[PlotGenerationData] = self.plots_interface.build_plots_data()
+        plots_data: list[PlotGenerationData] = get_or_build_shared_chart_data(
+            chart_request_params=self.chart_request_params,
+            build=self.plots_interface.build_plots_data,
+        )
         self._set_latest_date_from_plots_data(plots_data=plots_data)
 
         return plots_data
@@ -339,14 +348,14 @@ class ChartsInterface:
         Returns:
             A figure as an image and optimized for size if required
         """
-        svg_image = figure.to_image(
-            format=self.chart_request_params.file_format, validate=False
+        svg_image: bytes = render_figure(
+            figure=figure, file_format=self.chart_request_params.file_format
         )
-        return scour.scourString(in_string=svg_image)
+        return optimize_svg(svg_image=svg_image)
 
     def encode_figure(self, *, figure: go.Figure) -> str:
         """
-        URI Encode the supplied chart figure
+        Encode the supplied chart figure with the requested `chart_encoding`
 
         Args:
             figure: The figure object or a dictionary representing a figure
@@ -360,7 +369,10 @@ class ChartsInterface:
 
         optimized_svg: str = self.create_optimized_svg(figure=figure)
 
-        encoded_chart: str = urllib.parse.quote_plus(optimized_svg)
+        encoded_chart: str = encode_svg(
+            svg=optimized_svg,
+            chart_encoding=self.chart_request_params.chart_encoding,
+        )
 
         return encoded_chart
 
@@ -375,17 +387,10 @@ class ChartsInterface:
             The image in memory
 
         """
-        file = io.BytesIO()
-
-        figure.write_image(
-            file=file,
-            format=self.chart_request_params.file_format,
-            validate=False,
+        return render_figure(
+            figure=figure, file_format=self.chart_request_params.file_format
         )
 
-        file.seek(0)
-        return file.getvalue()
-
     def get_encoded_chart(self, *, chart_output: ChartOutput) -> dict[str, str | dict]:
         """Creates a dict containing a timestamp for the last data point + encoded string for the chart figure.
 
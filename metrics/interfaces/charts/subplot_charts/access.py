@@ -1,5 +1,4 @@
 import datetime
-import io
 
 import plotly.graph_objects as go
 from django.db.models.manager import Manager
@@ -7,7 +6,10 @@ from django.db.models.manager import Manager
 from metrics.data.models.core_models import CoreTimeSeries
 from metrics.domain.charts.subplots import generate_chart_figure
 from metrics.domain.models import SubplotChartGenerationPayload, SubplotGenerationData
-from metrics.domain.models.charts.subplot_charts import SubplotChartRequestParameters
+from metrics.domain.models.charts.subplot_charts import (
+    SubplotChartRequestParameters,
+    Subplots,
+)
 from metrics.domain.models.plots_text import PlotsText
 from metrics.interfaces.charts.common.chart_output import ChartOutput
 from metrics.interfaces.charts.common.generation import (
@@ -15,12 +17,14 @@ from metrics.interfaces.charts.common.generation import (
     generate_chart_as_file,
     generate_encoded_chart,
 )
+from metrics.interfaces.charts.common.rendering import render_figure
 from metrics.interfaces.plots.access import (
     DataNotFoundForAnyPlotError,
     InvalidPlotParametersError,
     PlotGenerationData,
     PlotsInterface,
 )
+from metrics.interfaces.plots.batching import BatchedPlotsQuery
 
 DEFAULT_SUBPLOT_CHART_TYPE = "bar"
 
@@ -54,6 +58,7 @@ class SubplotChartsInterface:
         subplots_data: list[dict[str, PlotGenerationData | str]] = []
         latest_dates: list[datetime.date] = []
 
+        plots_interfaces: list[tuple[Subplots, PlotsInterface]] = []
         for subplot in self.chart_request_params.subplots:
             try:
                 plots_interface = PlotsInterface(chart_request_params=subplot)
@@ -62,6 +67,22 @@ class SubplotChartsInterface:
                 # then move onto the next plot
                 continue
 
+            plots_interfaces.append((subplot, plots_interface))
+
+        # The plots across all the subplots are registered with 1 shared query
+        # so that those which only differ by their geography, stratum, age or sex
+        # can be fetched together instead of 1 query per plot
+        batched_plots_query = BatchedPlotsQuery(
+            permission_sets=(
+                plots_interfaces[0][0].permission_sets if plots_interfaces else None
+            )
+        )
+        for _, plots_interface in plots_interfaces:
+            plots_interface.add_plots_to_batched_query(
+                batched_plots_query=batched_plots_query
+            )
+
+        for subplot, plots_interface in plots_interfaces:
             try:
                 subplot_data: list[PlotGenerationData] = (
                     plots_interface.build_plots_data()
@@ -181,17 +202,10 @@ class SubplotChartsInterface:
             The image in memory
 
         """
-        file = io.BytesIO()
-
-        figure.write_image(
-            file=file,
-            format=self.chart_request_params.file_format,
-            validate=False,
+        return render_figure(
+            figure=figure, file_format=self.chart_request_params.file_format
         )
 
-        file.seek(0)
-        return file.getvalue()
-
     @classmethod
     def build_chart_description(cls, *, plots_data: list[PlotGenerationData]) -> str:
         """Creates a description to summarize the contents of the chart.
@@ -0,0 +1,47 @@
+from collections.abc import Iterable
+
+from metrics.data.managers.core_models.headline import CoreHeadlineManager
+from metrics.data.managers.core_models.time_series import CoreTimeSeriesManager
+from metrics.data.models.core_models import CoreHeadline, CoreTimeSeries
+
+DEFAULT_CORE_TIME_SERIES_MANAGER = CoreTimeSeries.objects
+DEFAULT_CORE_HEADLINE_MANAGER = CoreHeadline.objects
+
+
+def get_data_version_for_metrics(
+    metric_names: Iterable[str],
+    *,
+    core_time_series_manager: CoreTimeSeriesManager = DEFAULT_CORE_TIME_SERIES_MANAGER,
+    core_headline_manager: CoreHeadlineManager = DEFAULT_CORE_HEADLINE_MANAGER,
+) -> str:
+    """Returns a token which changes whenever the released data for the given `metric_names` changes
+
+    Notes:
+        The token is made up of the latest `refresh_date`
+        and the latest embargo which has been lifted,
+        across both the timeseries and headline records for the metrics.
+        So the token changes when new data is ingested
+        and when previously ingested data comes out of embargo.
+
+    Args:
+        metric_names: The names of the metrics to get the token for
+        core_time_series_manager: The model manager for the `CoreTimeSeries` model.
+            Defaults to the concrete `CoreTimeSeriesManager`
+            via `CoreTimeSeries.objects`
+        core_headline_manager: The model manager for the `CoreHeadline` model.
+            Defaults to the concrete `CoreHeadlineManager`
+            via `CoreHeadline.objects`
+
+    Returns:
+        The data version token for the metrics
+
+    """
+    data_version: list[str] = []
+
+    for core_model_manager in (core_time_series_manager, core_headline_manager):
+        timestamps = core_model_manager.find_latest_refresh_date_and_released_embargo_for_metrics(
+            metrics=metric_names
+        )
+        data_version.extend(str(timestamp) for timestamp in timestamps)
+
+    return "|".join(data_version)
@@ -0,0 +1,69 @@
+from collections.abc import Iterator
+
+import config
+from metrics.data.managers.core_models.headline import CoreHeadlineQuerySet
+from metrics.data.managers.core_models.time_series import CoreTimeSeriesQuerySet
+from metrics.domain.common.utils import DataSourceFileType
+
+
+def should_stream_download(
+    *,
+    queryset: CoreTimeSeriesQuerySet | CoreHeadlineQuerySet,
+    metric_group: str,
+    threshold: int | None = None,
+) -> bool:
+    """Checks whether the download for the given `queryset` is large enough to be streamed
+
+    Notes:
+        Only timeseries downloads are streamed.
+        Headline downloads hold at most 1 record per plot,
+        so they are always small enough to be built in full.
+
+        The size of the download is checked with an `EXISTS` query
+        for a record beyond the `threshold`, rather than with a full `COUNT`.
+        So the database can stop scanning as soon as the `threshold` is passed.
+
+    Args:
+        queryset: The queryset of the records for the download
+        metric_group: The metric group of the download.
+            E.g. "timeseries" or "headline"
+        threshold: The number of records above which the download is streamed.
+            Defaults to `DOWNLOADS_STREAMING_THRESHOLD_IN_ROWS`
+
+    Returns:
+        True if the download should be streamed, False otherwise
+
+    """
+    if not DataSourceFileType[metric_group].is_timeseries:
+        return False
+
+    if threshold is None:
+        threshold = config.DOWNLOADS_STREAMING_THRESHOLD_IN_ROWS
+
+    return queryset[threshold:].exists()
+
+
+def iterate_queryset_in_chunks(
+    *,
+    queryset: CoreTimeSeriesQuerySet | CoreHeadlineQuerySet,
+    chunk_size: int | None = None,
+) -> Iterator:
+    """Lazily iterates over the records of the given `queryset`, fetching them in chunks
+
+    Notes:
+        On PostgreSQL this uses a server-side cursor,
+        so only `chunk_size` records are held in memory at any one time.
+        The queryset is not cached,
+        so the records can only be iterated over once.
+
+    Args:
+        queryset: The queryset to be iterated over
+        chunk_size: The number of records to fetch from the database at a time.
+            Defaults to `DOWNLOADS_STREAMING_CHUNK_SIZE`
+
+    Returns:
+        An iterator over the records of the `queryset`
+
+    """
+    chunk_size = chunk_size or config.DOWNLOADS_STREAMING_CHUNK_SIZE
+    return queryset.iterator(chunk_size=chunk_size)
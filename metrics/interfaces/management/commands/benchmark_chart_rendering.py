@@ -0,0 +1,46 @@
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+
+from metrics.interfaces.charts.common.benchmarking import (
+    ChartRenderingBenchmarkResult,
+    benchmark_chart_renderer_pool,
+)
+
+
+class Command(BaseCommand):
+    def handle(self, *args, **options) -> None:
+        results: list[ChartRenderingBenchmarkResult] = benchmark_chart_renderer_pool(
+            pool_sizes=options["pool_sizes"],
+            concurrency=options["concurrency"],
+            renders_per_chart=options["renders_per_chart"],
+        )
+        for result in results:
+            self.stdout.write(
+                f"pool_size={result.pool_size}: "
+                f"p50={result.p50_latency_seconds}s "
+                f"p95={result.p95_latency_seconds}s "
+                f"throughput={result.throughput_per_second} renders/s "
+                f"({result.renders} renders)"
+            )
+
+    @classmethod
+    def add_arguments(cls, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--pool_sizes",
+            type=int,
+            nargs="+",
+            default=[0, 1, 2, 3],
+            required=False,
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=3,
+            required=False,
+        )
+        parser.add_argument(
+            "--renders_per_chart",
+            type=int,
+            default=10,
+            required=False,
+        )
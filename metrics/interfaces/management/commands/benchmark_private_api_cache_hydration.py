@@ -0,0 +1,30 @@
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+
+from caching.private_api.handlers import benchmark_reserved_cache_refresh
+from caching.private_api.write_buffer import DEFAULT_CACHE_WRITE_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    def handle(self, *args, **options) -> None:
+        durations: dict[str, float] = benchmark_reserved_cache_refresh(
+            cache_write_batch_size=options["batch_size"],
+            refresh_count=options["refresh_count"],
+        )
+        for mode, duration in durations.items():
+            self.stdout.write(f"{mode}: {duration} seconds")
+
+    @classmethod
+    def add_arguments(cls, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            default=DEFAULT_CACHE_WRITE_BATCH_SIZE,
+            required=False,
+        )
+        parser.add_argument(
+            "--refresh_count",
+            type=int,
+            default=1,
+            required=False,
+        )
@@ -0,0 +1,40 @@
+from django.core.management import CommandParser
+from django.core.management.base import BaseCommand
+
+from metrics.interfaces.charts.common.benchmarking import (
+    SVGOptimizationBenchmarkResult,
+    benchmark_svg_optimizers,
+)
+
+
+class Command(BaseCommand):
+    def handle(self, *args, **options) -> None:
+        results: list[SVGOptimizationBenchmarkResult] = benchmark_svg_optimizers(
+            optimizers=options["optimizers"],
+            repeats=options["repeats"],
+        )
+        for result in results:
+            self.stdout.write(
+                f"optimizer={result.optimizer}: "
+                f"rendered={result.rendered_bytes}B "
+                f"optimized={result.optimized_bytes}B "
+                f"uri_encoded={result.uri_encoded_bytes}B "
+                f"base64_encoded={result.base64_encoded_bytes}B "
+                f"cpu={result.cpu_seconds_per_chart}s per chart"
+            )
+
+    @classmethod
+    def add_arguments(cls, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--optimizers",
+            type=str,
+            nargs="+",
+            default=None,
+            required=False,
+        )
+        parser.add_argument(
+            "--repeats",
+            type=int,
+            default=10,
+            required=False,
+        )
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from metrics.domain.bulk_downloads.archive import rebuild_bulk_downloads_archives
+from metrics.interfaces.downloads.bulk_downloads import get_data_version_for_metrics
+
+
+class Command(BaseCommand):
+    @classmethod
+    def handle(cls, *args, **options) -> None:
+        rebuild_bulk_downloads_archives(
+            data_version_resolver=get_data_version_for_metrics
+        )
@@ -1,9 +1,16 @@
 from django.core.management.base import BaseCommand
 
 from caching.private_api.handlers import refresh_default_cache
+from metrics.domain.bulk_downloads.archive import rebuild_bulk_downloads_archives
+from metrics.interfaces.downloads.bulk_downloads import get_data_version_for_metrics
 
 
 class Command(BaseCommand):
     @classmethod
     def handle(cls, *args, **options) -> None:
         refresh_default_cache()
+        # The bulk downloads archives are rebuilt once per refresh of the cache
+        # so that they are in step with the content being served
+        rebuild_bulk_downloads_archives(
+            data_version_resolver=get_data_version_for_metrics
+        )
@@ -8,7 +8,11 @@ class Command(BaseCommand):
     @classmethod
     def handle(cls, *args, **options):
         multiprocessing_enabled: bool = options.get("multiprocessing_enabled", True)
-        upload_truncated_test_data(multiprocessing_enabled=multiprocessing_enabled)
+        batch_ingestion_enabled: bool = options.get("batch_ingestion_enabled", False)
+        upload_truncated_test_data(
+            multiprocessing_enabled=multiprocessing_enabled,
+            batch_ingestion_enabled=batch_ingestion_enabled,
+        )
 
     @classmethod
     def add_arguments(cls, parser: CommandParser) -> None:
@@ -17,3 +21,8 @@ class Command(BaseCommand):
             type=bool,
             required=False,
         )
+        parser.add_argument(
+            "--batch_ingestion_enabled",
+            type=bool,
+            required=False,
+        )
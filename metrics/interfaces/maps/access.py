@@ -7,6 +7,7 @@ from metrics.data.in_memory_models.geography_relationships.handlers import (
     OPTIONAL_UPSTREAM_RELATIONSHIPS,
     get_upstream_relationships_for_geography,
 )
+from metrics.data.managers.core_models.time_series import LATEST_VALUE_RESULT_TYPE
 from metrics.data.models.core_models import CoreTimeSeries, Geography
 from metrics.domain.models.map import MapMainParameters, MapsParameters
 
@@ -78,36 +79,57 @@ class MapsInterface:
             then the result will be returned with None
             in place for the requisite fields.
 
+            The latest values for the main metric are fetched
+            for all geographies within a single query.
+            Similarly, each accompanying point is fetched
+            within a single query across all of its related geographies.
+            The results are then assembled in memory.
+
         Returns:
             Tuple of (list of enriched `MapGeographyResult`, and a set of associated dates)
 
         """
         self._ensure_geographies_are_populated_for_main_parameters()
+        geographies: list[str] = list(self.maps_parameters.parameters.geographies)
+
+        geography_codes: dict[str, str] = (
+            self._get_geography_codes_for_main_parameters()
+        )
+        main_results: dict[str, LATEST_VALUE_RESULT_TYPE] = (
+            self._query_for_main_data_geographies(geographies=geographies)
+        )
+        accompanying_points_by_geography: dict[str, list[AccompanyingPointResult]] = (
+            self._process_accompanying_points(
+                geographies=[
+                    geography for geography in geographies if geography in main_results
+                ],
+                geography_codes=geography_codes,
+            )
+        )
 
         results: list[MapGeographyResult] = []
         associated_dates: set[datetime.date] = set()
 
-        for geography in self.maps_parameters.parameters.geographies:
-            main_result = self._query_for_main_data_geography(geography=geography)
+        for geography in geographies:
+            main_result = main_results.get(geography)
 
             if main_result is None:
                 null_result_for_geography: MapGeographyResult = (
-                    self._create_null_geography_result(geography=geography)
+                    self._create_null_geography_result(
+                        geography=geography, geography_codes=geography_codes
+                    )
                 )
                 results.append(null_result_for_geography)
                 continue
 
-            associated_dates.add(main_result.date)
+            associated_dates.add(main_result["date"])
 
-            accompanying_points: list[AccompanyingPointResult] = (
-                self._process_accompanying_points(geography=geography)
-            )
             result_for_geography = MapGeographyResult(
-                geography_code=main_result.geography.geography_code,
+                geography_code=main_result["geography_code"],
                 geography_type=self.maps_parameters.parameters.geography_type,
                 geography=geography,
-                metric_value=main_result.metric_value,
-                accompanying_points=accompanying_points,
+                metric_value=main_result["metric_value"],
+                accompanying_points=accompanying_points_by_geography[geography],
             )
 
             results.append(result_for_geography)
@@ -122,14 +144,35 @@ class MapsInterface:
                 )
             )
 
+    def _get_geography_codes_for_main_parameters(self) -> dict[str, str]:
+        """Gets the geography codes for all geographies of the main geography type in 1 query
+
+        Returns:
+            Dict of geography names to their geography codes.
+            E.g. `{"Hackney": "E09000012", "Leeds": "E08000035"}`
+
+        """
+        geographies = self.geography_manager.get_geographies_by_geography_type(
+            geography_type_name=self.maps_parameters.parameters.geography_type,
+        )
+        return {
+            geography["name"]: geography["geography_code"] for geography in geographies
+        }
+
     def _get_related_geography_for_accompanying_point(
-        self, *, accompanying_point, main_geography: str
+        self,
+        *,
+        accompanying_point,
+        main_geography: str,
+        geography_codes: dict[str, str],
     ) -> str | None:
         """Gets the related geography for the accompanying point if required.
 
         Args:
             accompanying_point: The accompanying point configuration
             main_geography: The main geography being processed
+            geography_codes: Dict of the names of the geographies
+                of the main geography type to their geography codes
 
         Returns:
             The related geography name for the given accompanying point.
@@ -163,19 +206,30 @@ class MapsInterface:
         # i.e. we are asking for the related geography in the other
         # geography type
         return self._fetch_related_geography_by_type(
-            geography=main_geography,
+            geography_code=geography_codes.get(main_geography),
             main_geography_type=main_geography_type,
             target_geography_type=selected_geography_type,
         )
 
+    @classmethod
     def _fetch_related_geography_by_type(
-        self, *, geography: str, main_geography_type: str, target_geography_type: str
+        cls,
+        *,
+        geography_code: str | None,
+        main_geography_type: str,
+        target_geography_type: str,
     ) -> str:
         """
         Fetch related geography for the specified geography type.
 
+        Notes:
+            The related geography is resolved
+            from the in-memory geography relationships,
+            so no queries are made to the database.
+
         Args:
-            geography: Source geography name
+            geography_code: Code of the source geography.
+                None if the source geography could not be found
             main_geography_type: Type of the main geography
             target_geography_type: Target geography type to find
 
@@ -188,15 +242,8 @@ class MapsInterface:
                 for the accompanying point
 
         """
-        try:
-            geography_code: str = (
-                self.geography_manager.get_geography_code_for_geography(
-                    geography=geography,
-                    geography_type=main_geography_type,
-                )
-            )
-        except Geography.DoesNotExist as error:
-            raise GeographyNotFoundForAccompanyingPointError from error
+        if geography_code is None:
+            raise GeographyNotFoundForAccompanyingPointError
 
         upstream_relationships: OPTIONAL_UPSTREAM_RELATIONSHIPS = (
             get_upstream_relationships_for_geography(
@@ -217,143 +264,173 @@ class MapsInterface:
 
         return related_geography["name"]
 
-    def _create_null_geography_result(self, *, geography: str) -> MapGeographyResult:
+    def _create_null_geography_result(
+        self, *, geography: str, geography_codes: dict[str, str]
+    ) -> MapGeographyResult:
         """Creates a `MapGeographyResult` object for the given geography to act as the null case for that data point.
 
         Args:
             geography: The name of the geography being processed
+            geography_codes: Dict of the names of the geographies
+                of the main geography type to their geography codes
 
         Returns:
             A `MapsGeographyResult` object with None
             in place for the requisite fields
 
         """
-        try:
-            geography_code = self.geography_manager.get_geography_code_for_geography(
-                geography=geography,
-                geography_type=self.maps_parameters.parameters.geography_type,
-            )
-        except Geography.DoesNotExist:
-            geography_code = ""
-
         return MapGeographyResult(
             geography_type=self.maps_parameters.parameters.geography_type,
             geography=geography,
-            geography_code=geography_code,
+            geography_code=geography_codes.get(geography, ""),
             metric_value=None,
             accompanying_points=None,
         )
 
     def _process_accompanying_points(
-        self, *, geography: str
-    ) -> list[AccompanyingPointResult]:
-        """Process all accompanying points for a given geography.
+        self, *, geographies: list[str], geography_codes: dict[str, str]
+    ) -> dict[str, list[AccompanyingPointResult]]:
+        """Process all accompanying points for the given geographies.
 
         Notes:
             If an accompanying point cannot be handled
-            for the geography, it will be skipped.
+            for a geography, it will be skipped for that geography.
 
         Args:
-            geography: The name of the geography being processed
+            geographies: The names of the geographies being processed
+            geography_codes: Dict of the names of the geographies
+                of the main geography type to their geography codes
 
         Returns:
-            List of processed accompanying point results
+            Dict of each geography name to its
+            list of processed accompanying point results
 
         """
-        results: list[AccompanyingPointResult] = []
+        results: dict[str, list[AccompanyingPointResult]] = {
+            geography: [] for geography in geographies
+        }
 
         for accompanying_point in self.maps_parameters.accompanying_points:
-            accompanying_point_result: AccompanyingPointResult | None = (
+            accompanying_point_results: dict[str, AccompanyingPointResult] = (
                 self._process_accompanying_point(
                     accompanying_point=accompanying_point,
-                    geography=geography,
+                    geographies=geographies,
+                    geography_codes=geography_codes,
                 )
             )
 
-            if accompanying_point_result:
-                results.append(accompanying_point_result)
+            for geography, result in accompanying_point_results.items():
+                results[geography].append(result)
 
         return results
 
     def _process_accompanying_point(
-        self, *, accompanying_point, geography: str
-    ) -> AccompanyingPointResult | None:
-        """Build the resul for a given accompanying_point / geography combination.
+        self,
+        *,
+        accompanying_point,
+        geographies: list[str],
+        geography_codes: dict[str, str],
+    ) -> dict[str, AccompanyingPointResult]:
+        """Build the results for a given accompanying_point across all the geographies.
 
         Notes:
             If the selected geography cannot be found,
             either as an explicit selection or via
-            relationships then None will be returned.
+            relationships then that geography will be omitted.
 
             If an accompanying point cannot be handled
             for the geography, None will be returned
             for the `metric_value` field
 
         Args:
-            geography: The name of the geography being processed
+            accompanying_point: The accompanying point configuration
+            geographies: The names of the geographies being processed
+            geography_codes: Dict of the names of the geographies
+                of the main geography type to their geography codes
 
         Returns:
-            An individual `AccompanyingPointResult` object
+            Dict of each geography name to an individual
+            `AccompanyingPointResult` object
             containing the associated labels and the `metric_value`
 
         """
-        params = accompanying_point.parameters
-
-        try:
-            selected_geography: str = (
-                self._get_related_geography_for_accompanying_point(
-                    accompanying_point=accompanying_point,
-                    main_geography=geography,
+        selected_geographies: dict[str, str | None] = {}
+
+        for geography in geographies:
+            try:
+                selected_geographies[geography] = (
+                    self._get_related_geography_for_accompanying_point(
+                        accompanying_point=accompanying_point,
+                        main_geography=geography,
+                        geography_codes=geography_codes,
+                    )
                 )
+            except GeographyNotFoundForAccompanyingPointError:
+                continue
+
+        accompanying_point_records: dict[str, LATEST_VALUE_RESULT_TYPE] = (
+            self._query_for_accompanying_point_geographies(
+                accompanying_point=accompanying_point,
+                geographies={
+                    selected_geography
+                    for selected_geography in selected_geographies.values()
+                    if selected_geography
+                },
+            )
+        )
+
+        return {
+            geography: AccompanyingPointResult(
+                label_prefix=accompanying_point.label_prefix,
+                label_suffix=accompanying_point.label_suffix,
+                metric_value=accompanying_point_records.get(selected_geography, {}).get(
+                    "metric_value"
+                ),
             )
-        except GeographyNotFoundForAccompanyingPointError:
-            return None
+            for geography, selected_geography in selected_geographies.items()
+        }
+
+    def _query_for_accompanying_point_geographies(
+        self, *, accompanying_point, geographies: set[str]
+    ) -> dict[str, LATEST_VALUE_RESULT_TYPE]:
+        if not geographies:
+            return {}
+
+        params = accompanying_point.parameters
 
-        accompanying_point_record = self.core_time_series_manager.query_for_data(
-            theme=params.theme,
-            sub_theme=params.sub_theme,
+        return self.core_time_series_manager.query_for_latest_values_by_geography(
             topic=params.topic,
             metric=params.metric,
-            geography=selected_geography,
+            geographies=geographies,
             geography_type=params.geography_type,
             stratum=params.stratum,
             sex=params.sex,
             age=params.age,
             date_from=self.maps_parameters.date_from,
             date_to=self.maps_parameters.date_to,
-            field_to_order_by="-date",
-            rbac_permissions=self.maps_parameters.rbac_permissions,
-        ).first()
-
-        try:
-            metric_value = accompanying_point_record.metric_value
-        except AttributeError:
-            metric_value = None
-
-        return AccompanyingPointResult(
-            label_prefix=accompanying_point.label_prefix,
-            label_suffix=accompanying_point.label_suffix,
-            metric_value=metric_value,
+            use_current_view=True,
         )
 
-    def _query_for_main_data_geography(self, *, geography: str):
+    def _query_for_main_data_geographies(
+        self, *, geographies: list[str]
+    ) -> dict[str, LATEST_VALUE_RESULT_TYPE]:
+        if not geographies:
+            return {}
+
         params: MapMainParameters = self.maps_parameters.parameters
 
-        return self.core_time_series_manager.query_for_data(
-            theme=params.theme,
-            sub_theme=params.sub_theme,
+        return self.core_time_series_manager.query_for_latest_values_by_geography(
             topic=params.topic,
             metric=params.metric,
-            geography=geography,
+            geographies=geographies,
             geography_type=params.geography_type,
             stratum=params.stratum,
             sex=params.sex,
             age=params.age,
             date_from=self.maps_parameters.date_from,
             date_to=self.maps_parameters.date_to,
-            field_to_order_by="-date",
-            rbac_permissions=self.maps_parameters.rbac_permissions,
-        ).first()
+            use_current_view=True,
+        )
 
 
 def get_maps_output(*, maps_parameters: MapsParameters) -> MapOutput:
@@ -1,7 +1,5 @@
-import datetime
 import logging
-from collections import defaultdict
-from decimal import Decimal
+from collections.abc import Iterable
 from typing import Any
 
 from django.db.models import Manager, QuerySet
@@ -15,7 +13,9 @@ from metrics.domain.models import (
     PlotGenerationData,
     PlotParameters,
 )
+from metrics.domain.models.plot_columns import PlotColumns
 from metrics.domain.models.plots import CompletePlotData
+from metrics.interfaces.plots.batching import BatchedPlotsQuery
 from metrics.interfaces.plots.validation import (
     DatesNotInChronologicalOrderError,
     MetricDoesNotSupportTopicError,
@@ -69,6 +69,7 @@ class PlotsInterface:
         self.chart_request_params = chart_request_params
         self.core_model_manager = core_model_manager
         self.topic_model_manager = topic_model_manager
+        self._batched_plots_query: BatchedPlotsQuery | None = None
         self.validate_plot_parameters()
 
     def validate_plot_parameters(self) -> None:
@@ -124,7 +125,25 @@ class PlotsInterface:
                         ]>`
                 b) The latest refresh date associated with the resulting data
         """
+        if self._batched_plots_query is not None:
+            batched_result = self._batched_plots_query.get_result(
+                plot_parameters=plot_parameters
+            )
+            if batched_result is not None:
+                records, latest_date = batched_result
+                return QuerySetResult(queryset=records, latest_date=latest_date)
+
+        return self._get_queryset_result_from_core_model_manager(
+            plot_parameters=plot_parameters
+        )
+
+    def _get_queryset_result_from_core_model_manager(
+        self, *, plot_parameters: PlotParameters
+    ) -> QuerySetResult:
         plot_params: dict[str, str] = plot_parameters.to_dict_for_query()
+        if plot_parameters.is_timeseries_data:
+            # The latest records are read from the `CoreTimeSeriesCurrentView`
+            plot_params["use_current_view"] = True
 
         queryset = self.get_queryset_from_core_model_manager(plot_params=plot_params)
 
@@ -153,6 +172,15 @@ class PlotsInterface:
             plot_params["theme"] = topic.sub_theme.theme.name
             plot_params["sub_theme"] = topic.sub_theme.name
 
+        self._add_confidence_interval_fields(plot_params=plot_params)
+
+        return self.core_model_manager.query_for_data(
+            **plot_params,
+            rbac_permissions=self.chart_request_params.rbac_permissions,  # old permissions (remove)
+            permission_sets=self.chart_request_params.permission_sets,  # new permissions
+        )
+
+    def _add_confidence_interval_fields(self, *, plot_params: dict) -> None:
         # Sometimes this is a Subplots request which doesn't support confidence intervals
         confidence_intervals = getattr(
             self.chart_request_params, "confidence_intervals", False
@@ -161,11 +189,48 @@ class PlotsInterface:
             plot_params["fields_to_export"].append("upper_confidence")
             plot_params["fields_to_export"].append("lower_confidence")
 
-        return self.core_model_manager.query_for_data(
-            **plot_params,
-            rbac_permissions=self.chart_request_params.rbac_permissions,  # old permissions (remove)
-            permission_sets=self.chart_request_params.permission_sets,  # new permissions
+    def _apply_chart_level_choices(self, *, plot_parameters: PlotParameters) -> None:
+        # Set each plot with the selected chart-level x and y-axis choices
+        plot_parameters.x_axis = self.chart_request_params.x_axis
+        plot_parameters.y_axis = self.chart_request_params.y_axis
+
+        confidence_colour = getattr(
+            self.chart_request_params, "confidence_colour", None
         )
+        if confidence_colour:
+            plot_parameters.confidence_colour = (
+                self.chart_request_params.confidence_colour
+            )
+
+    def add_plots_to_batched_query(
+        self, *, batched_plots_query: BatchedPlotsQuery
+    ) -> None:
+        """Registers each of the requested plots with the given `batched_plots_query`
+
+        Notes:
+            The `batched_plots_query` can be shared between
+            multiple `PlotsInterface` objects, e.g. for each subplot of a chart.
+            So that plots which only differ by their geography,
+            stratum, age or sex are fetched in 1 query
+            regardless of which interface they belong to.
+
+        Args:
+            batched_plots_query: The `BatchedPlotsQuery`
+                which will fetch the data for the plots
+
+        Returns:
+            None
+
+        """
+        self._batched_plots_query = batched_plots_query
+
+        for plot_parameters in self.chart_request_params.plots:
+            self._apply_chart_level_choices(plot_parameters=plot_parameters)
+            plot_params: dict = plot_parameters.to_dict_for_query()
+            self._add_confidence_interval_fields(plot_params=plot_params)
+            batched_plots_query.add_plot(
+                plot_parameters=plot_parameters, plot_params=plot_params
+            )
 
     def build_plot_data_from_parameters_with_complete_queryset(
         self, *, plot_parameters: PlotParameters
@@ -177,6 +242,11 @@ class PlotsInterface:
             pydantic model which also holds the corresponding params.
             These models can then be passed into the domain libraries.
 
+            The full queryset is always fetched directly
+            from the `core_model_manager`.
+            Results from the `BatchedPlotsQuery` are not used here,
+            since they only hold the values needed to draw each plot.
+
         Returns:
             An individual `CompletePlotData` model
             for the requested `plot_parameters`.
@@ -186,8 +256,10 @@ class PlotsInterface:
                 can be found for a particular plot.
 
         """
-        queryset_result: QuerySetResult = self.get_queryset_result_for_plot_parameters(
-            plot_parameters=plot_parameters,
+        queryset_result: QuerySetResult = (
+            self._get_queryset_result_from_core_model_manager(
+                plot_parameters=plot_parameters,
+            )
         )
 
         if not queryset_result.queryset.exists():
@@ -218,17 +290,7 @@ class PlotsInterface:
                 for a particular plot.
 
         """
-        # Set each plot with the selected chart-level x and y-axis choices
-        plot_parameters.x_axis = self.chart_request_params.x_axis
-        plot_parameters.y_axis = self.chart_request_params.y_axis
-
-        confidence_colour = getattr(
-            self.chart_request_params, "confidence_colour", None
-        )
-        if confidence_colour:
-            plot_parameters.confidence_colour = (
-                self.chart_request_params.confidence_colour
-            )
+        self._apply_chart_level_choices(plot_parameters=plot_parameters)
 
         queryset_result: QuerySetResult = self.get_queryset_result_for_plot_parameters(
             plot_parameters=plot_parameters,
@@ -294,6 +356,11 @@ class PlotsInterface:
             If no data is returned for a particular plot,
             that plot is skipped and no enriched model is provided.
 
+            Timeseries plots which share the same metric, topic and date range
+            but differ by their geography, stratum, age or sex
+            are fetched together in 1 query.
+            See `BatchedPlotsQuery` for more information.
+
         Returns:
             List[PlotData]: A list of `PlotData` models for
                 each of the requested plots.
@@ -303,6 +370,15 @@ class PlotsInterface:
                 returned any data from the underlying queries
 
         """
+        if self._batched_plots_query is None:
+            self.add_plots_to_batched_query(
+                batched_plots_query=BatchedPlotsQuery(
+                    core_model_manager=self.core_model_manager,
+                    topic_model_manager=self.topic_model_manager,
+                    permission_sets=self.chart_request_params.permission_sets,
+                )
+            )
+
         plots_data: list[PlotGenerationData] = []
 
         for plot_parameters in self.chart_request_params.plots:
@@ -324,7 +400,7 @@ class PlotsInterface:
 
 def get_aggregated_results(
     *, plot_parameters: PlotParameters, queryset: QuerySet
-) -> dict[str, list[datetime.date | Decimal | bool | str]]:
+) -> PlotColumns:
     """Gets the aggregated results for a given `queryset` based on the `plot_parameters`
 
     Args:
@@ -339,12 +415,12 @@ def get_aggregated_results(
                     ]>`
 
     Returns:
-        Dict containing the field names valued by the list of results.
+        `PlotColumns` containing the field names valued by the array of results.
         E.g.
         >>> {
-                "date": [(datetime.date(2022, 10, 10), ...],
-                "metric_value: [Decimal('0.8'), ...],
-                "in_reporting_delay_period": [False, ...]
+                "date": array(['2022-10-10', ...], dtype='datetime64[D]'),
+                "metric_value: array([0.8, ...]),
+                "in_reporting_delay_period": array([False, ...])
             }
 
     """
@@ -374,7 +450,7 @@ def convert_type(*, s: str) -> int | str:
     return int(s) if s.isdigit() else s.lower()
 
 
-def aggregate_results_by_age(*, queryset: QuerySet) -> dict[str, list[str | Decimal]]:
+def aggregate_results_by_age(*, queryset: QuerySet) -> PlotColumns:
     """Age values are cast to human-readable strings and aggregated
 
     Args:
@@ -383,7 +459,7 @@ def aggregate_results_by_age(*, queryset: QuerySet) -> dict[str, list[str | Deci
             E.g. {"age__name": "15_44", "metric_value": "Decimal('0.7')}
 
     Returns:
-        A properly sorted and displayable version broken into two separate lists
+        A properly sorted and displayable version broken into two separate arrays
 
     """
     for exported_result in queryset:
@@ -397,25 +473,19 @@ def _build_age_display_name(*, value: str) -> str:
     return value.replace("-", " - ")
 
 
-def aggregate_results(*, values) -> dict[str, list[datetime.date | Decimal | bool]]:
-    """Aggregates the `values` as a dict of nested lists
+def aggregate_results(*, values: Iterable[dict[str, Any]]) -> PlotColumns:
+    """Aggregates the `values` as a `PlotColumns` of 1 array per field
 
     Args:
         `values`: The list of things to zip
 
     Returns:
-        An aggregated dict of nested lists
+        An aggregated `PlotColumns` of arrays
         >>> {
-                "date": [(datetime.date(2022, 10, 10), ...],
-                "metric_value: [Decimal('0.8'), ...],
-                "in_reporting_delay_period": [False, ...]
+                "date": array(['2022-10-10', ...], dtype='datetime64[D]'),
+                "metric_value: array([0.8, ...]),
+                "in_reporting_delay_period": array([False, ...])
         }
 
     """
-    aggregated_results = defaultdict(list)
-
-    for row in values:
-        for key, value in row.items():
-            aggregated_results[key].append(value)
-
-    return dict(aggregated_results)
+    return PlotColumns.from_records(records=values)
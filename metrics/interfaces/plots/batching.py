@@ -0,0 +1,192 @@
+import logging
+from collections import defaultdict
+from typing import Any
+
+from django.db.models import Manager
+
+from common.auth.permissions import PermissionSetsType
+from metrics.api.settings import auth
+from metrics.data.managers.core_models.time_series import (
+    SERIES_FIELD_LOOKUPS,
+    SERIES_RESULT_TYPE,
+    CoreTimeSeriesManager,
+)
+from metrics.data.models.core_models import CoreTimeSeries, Topic
+from metrics.domain.models import PlotParameters
+from metrics.utils.type_hints import CORE_MODEL_MANAGER_TYPE
+
+DEFAULT_CORE_TIME_SERIES_MANAGER = CoreTimeSeries.objects
+DEFAULT_TOPIC_MANAGER = Topic.objects
+
+# The smallest number of plots in a group
+# for which it is worth fetching the data in 1 query
+MINIMUM_BATCH_SIZE = 2
+
+logger = logging.getLogger(__name__)
+
+BATCH_KEY_TYPE = tuple[Any, ...]
+
+
+class BatchedPlotsQuery:
+    """Fetches the timeseries data for groups of similar plots in 1 query per group
+
+    Notes:
+        Plots are grouped when they share the same
+        `topic`, `metric`, date range, exported fields and metric value ranges
+        but differ in any of their `geography`, `geography_type`,
+        `stratum`, `sex` or `age`.
+        Each group is fetched lazily in 1 query
+        the first time a result is asked for,
+        and the records are then partitioned in memory for each plot.
+
+        Plots which cannot be batched, e.g. headline plots,
+        plots with unspecified optional fields or plots in a group of 1,
+        are left to be queried individually.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        core_model_manager: CORE_MODEL_MANAGER_TYPE = DEFAULT_CORE_TIME_SERIES_MANAGER,
+        topic_model_manager: Manager = DEFAULT_TOPIC_MANAGER,
+        permission_sets: PermissionSetsType | None = None,
+    ):
+        self.core_model_manager = core_model_manager
+        self.topic_model_manager = topic_model_manager
+        self.permission_sets = permission_sets
+
+        self._groups: defaultdict[BATCH_KEY_TYPE, list[tuple[int, dict]]] = defaultdict(
+            list
+        )
+        self._results: dict[int, SERIES_RESULT_TYPE] = {}
+        self._has_executed = False
+
+    @property
+    def is_supported(self) -> bool:
+        return isinstance(self.core_model_manager, CoreTimeSeriesManager)
+
+    @staticmethod
+    def _build_batch_key(*, plot_params: dict[str, Any]) -> BATCH_KEY_TYPE | None:
+        if "date_from" not in plot_params:
+            # Only timeseries plots can be batched
+            return None
+
+        if not all(plot_params[field] for field in SERIES_FIELD_LOOKUPS):
+            # Without each of the fields the plot cannot be
+            # told apart from the other plots in the same query
+            return None
+
+        metric_value_ranges = tuple(
+            tuple(metric_value_range)
+            for metric_value_range in plot_params["metric_value_ranges"]
+        )
+        return (
+            plot_params["topic"],
+            plot_params["metric"],
+            plot_params["date_from"],
+            plot_params["date_to"],
+            tuple(plot_params["fields_to_export"]),
+            plot_params["field_to_order_by"],
+            metric_value_ranges,
+        )
+
+    def add_plot(
+        self, *, plot_parameters: PlotParameters, plot_params: dict[str, Any]
+    ) -> None:
+        """Registers the plot so that its data can be fetched along with any similar plots
+
+        Args:
+            plot_parameters: The `PlotParameters` model for the plot
+            plot_params: The dict of params which would be used
+                to query for the data of this individual plot
+
+        Returns:
+            None
+
+        """
+        if self._has_executed:
+            return
+
+        batch_key: BATCH_KEY_TYPE | None = self._build_batch_key(
+            plot_params=plot_params
+        )
+        if batch_key is None:
+            return
+
+        self._groups[batch_key].append((id(plot_parameters), plot_params))
+
+    def get_result(
+        self, *, plot_parameters: PlotParameters
+    ) -> SERIES_RESULT_TYPE | None:
+        """Returns the records and latest date fetched for the given `plot_parameters`
+
+        Notes:
+            The queries for all the registered groups
+            are executed on the first call to this method.
+
+        Args:
+            plot_parameters: The `PlotParameters` model for the plot
+
+        Returns:
+            Tuple of the list of records for the plot
+            along with the latest date of those records.
+            Or None if the plot was not fetched as part of a batch,
+            in which case it should be queried individually.
+
+        """
+        if not self._has_executed:
+            self._execute()
+
+        return self._results.get(id(plot_parameters))
+
+    def _execute(self) -> None:
+        self._has_executed = True
+        if not self.is_supported:
+            return
+
+        for plots_in_group in self._groups.values():
+            if len(plots_in_group) < MINIMUM_BATCH_SIZE:
+                continue
+
+            self._execute_group(plots_in_group=plots_in_group)
+
+    def _execute_group(self, *, plots_in_group: list[tuple[int, dict]]) -> None:
+        group_params: dict[str, Any] = plots_in_group[0][1]
+        series: list[dict[str, str]] = [
+            {field: plot_params[field] for field in SERIES_FIELD_LOOKUPS}
+            for _, plot_params in plots_in_group
+        ]
+
+        theme = ""
+        sub_theme = ""
+        if auth.AUTH_ENABLED:
+            # Needed for the downstream permissions check
+            topic = self.topic_model_manager.get_by_name(name=group_params["topic"])
+            theme = topic.sub_theme.theme.name
+            sub_theme = topic.sub_theme.name
+
+        results: list[SERIES_RESULT_TYPE] = (
+            self.core_model_manager.query_for_data_for_series(
+                topic=group_params["topic"],
+                metric=group_params["metric"],
+                date_from=group_params["date_from"],
+                date_to=group_params["date_to"],
+                series=series,
+                fields_to_export=group_params["fields_to_export"],
+                field_to_order_by=group_params["field_to_order_by"],
+                theme=theme,
+                sub_theme=sub_theme,
+                metric_value_ranges=group_params["metric_value_ranges"],
+                permission_sets=self.permission_sets,
+                use_current_view=True,
+            )
+        )
+        logger.debug(
+            "Fetched data for %s plots of `%s` in 1 query",
+            len(plots_in_group),
+            group_params["metric"],
+        )
+
+        for (plot_id, _), result in zip(plots_in_group, results, strict=True):
+            self._results[plot_id] = result
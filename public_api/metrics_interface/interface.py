@@ -1,5 +1,5 @@
 from metrics.api.settings.auth import AUTH_ENABLED
-from metrics.data.models.api_models import APITimeSeries
+from metrics.data.models.api_models import APITimeSeries, APITimeSeriesDimension
 
 
 class MetricsPublicAPIInterface:
@@ -7,6 +7,10 @@ class MetricsPublicAPIInterface:
     def get_api_timeseries_model(cls) -> APITimeSeries:
         return APITimeSeries
 
+    @classmethod
+    def get_api_timeseries_dimension_model(cls) -> APITimeSeriesDimension:
+        return APITimeSeriesDimension
+
     @classmethod
     def is_auth_enabled(cls) -> bool:
         return AUTH_ENABLED
@@ -0,0 +1,302 @@
+"""
+This file contains the pagination shared by the `APITimeSeries` list views
+of each version of the public API.
+
+Pages can be requested either by page number or by an opaque cursor.
+The cursor is keyed on the `date` and `id` of the records.
+So that deep pages are fetched without an `OFFSET` over the entire slice.
+"""
+
+import base64
+import binascii
+import datetime
+from dataclasses import dataclass
+from urllib import parse
+
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+PAGE_NUMBER_MODE = "page"
+CURSOR_MODE = "cursor"
+
+PAGINATION_QUERY_PARAM = "pagination"
+CURSOR_QUERY_PARAM = "cursor"
+SKIP_COUNT_QUERY_PARAM = "skip_count"
+
+INVALID_CURSOR_ERROR_MESSAGE = "Invalid cursor"
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position of a record within the slice, ordered by `date` then `id`
+
+    Notes:
+        If `reverse` is True, then the page is made up
+        of the records which come before this position.
+        Otherwise, the page is made up of the records which come after it.
+
+    """
+
+    date: datetime.date
+    id: int
+    reverse: bool = False
+
+
+def encode_cursor(*, cursor: Cursor) -> str:
+    """Encodes the given `cursor` into an opaque token which can be placed in a URL
+
+    Args:
+        cursor: The `Cursor` to be encoded
+
+    Returns:
+        The URL-safe token representing the `cursor`
+
+    """
+    querystring = parse.urlencode(
+        {"d": cursor.date.isoformat(), "i": cursor.id, "r": int(cursor.reverse)}
+    )
+    return base64.urlsafe_b64encode(querystring.encode("ascii")).decode("ascii")
+
+
+def decode_cursor(*, encoded_cursor: str) -> Cursor:
+    """Decodes the given `encoded_cursor` token back into a `Cursor`
+
+    Args:
+        encoded_cursor: The token which was created by `encode_cursor()`
+
+    Returns:
+        The decoded `Cursor`
+
+    Raises:
+        `NotFound`: If the `encoded_cursor` is not a valid token
+
+    """
+    try:
+        querystring: str = base64.urlsafe_b64decode(
+            encoded_cursor.encode("ascii")
+        ).decode("ascii")
+        tokens: dict[str, list[str]] = parse.parse_qs(querystring, strict_parsing=True)
+        return Cursor(
+            date=datetime.date.fromisoformat(tokens["d"][0]),
+            id=int(tokens["i"][0]),
+            reverse=bool(int(tokens["r"][0])),
+        )
+    except (binascii.Error, KeyError, UnicodeError, ValueError) as error:
+        raise NotFound(INVALID_CURSOR_ERROR_MESSAGE) from error
+
+
+class APITimeSeriesKeysetPagination(pagination.PageNumberPagination):
+    """Paginates an `APITimeSeries` slice by page number or by cursor
+
+    Notes:
+        The mode is chosen with the `pagination` query parameter.
+        Otherwise, the presence of a `cursor` or `page` query parameter
+        decides the mode, falling back to the `default_mode`.
+
+        In page number mode, the given queryset must already be
+        restricted to the latest records for each date.
+
+        In cursor mode, the given queryset must not be restricted yet.
+        The latest records are read from the `APITimeSeriesCurrentView`
+        and only for the range of dates which can hold the requested page,
+        rather than for the entire slice.
+        The `COUNT` of the slice can also be skipped
+        with the `skip_count` query parameter.
+
+    """
+
+    default_mode: str = PAGE_NUMBER_MODE
+
+    def uses_cursor(self, *, request: Request) -> bool:
+        """Checks whether the given `request` is to be paginated by cursor
+
+        Args:
+            request: The inbound request
+
+        Returns:
+            True if the `request` is to be paginated by cursor,
+            False if it is to be paginated by page number
+
+        """
+        query_params = request.query_params
+        mode: str | None = query_params.get(PAGINATION_QUERY_PARAM)
+
+        if mode not in (PAGE_NUMBER_MODE, CURSOR_MODE):
+            if CURSOR_QUERY_PARAM in query_params:
+                mode = CURSOR_MODE
+            elif self.page_query_param in query_params:
+                mode = PAGE_NUMBER_MODE
+            else:
+                mode = self.default_mode
+
+        return mode == CURSOR_MODE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode: bool = self.uses_cursor(request=request)
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request=request)
+        self.base_url: str = request.build_absolute_uri()
+
+        encoded_cursor: str | None = request.query_params.get(CURSOR_QUERY_PARAM)
+        self.cursor: Cursor | None = (
+            decode_cursor(encoded_cursor=encoded_cursor) if encoded_cursor else None
+        )
+        reverse: bool = self.cursor is not None and self.cursor.reverse
+
+        self.count: int | None = None
+        if not self._skips_count(request=request):
+            self.count = queryset.filter_for_latest_refresh_date_records(
+                queryset=queryset, use_current_view=True
+            ).count()
+
+        page_queryset = self._restrict_to_dates_of_page(
+            queryset=queryset, reverse=reverse
+        )
+        page_queryset = queryset.filter_for_latest_refresh_date_records(
+            queryset=page_queryset, use_current_view=True
+        )
+        ordering = ("-date", "-id") if reverse else ("date", "id")
+        records = self._take_records_after_cursor(
+            records=page_queryset.order_by(*ordering), reverse=reverse
+        )
+
+        self.has_more_records: bool = len(records) > self.page_size
+        self.page: list = records[: self.page_size]
+        if reverse:
+            self.page.reverse()
+
+        return self.page
+
+    @staticmethod
+    def _skips_count(*, request: Request) -> bool:
+        skip_count: str = request.query_params.get(SKIP_COUNT_QUERY_PARAM, "")
+        return skip_count.lower() in ("true", "1")
+
+    def _restrict_to_dates_of_page(self, *, queryset, reverse: bool):
+        if self.cursor is not None:
+            if reverse:
+                queryset = queryset.filter(date__lte=self.cursor.date)
+            else:
+                queryset = queryset.filter(date__gte=self.cursor.date)
+
+        dates = (
+            queryset.order_by("-date" if reverse else "date")
+            .values_list("date", flat=True)
+            .distinct()
+        )
+        # Every date holds at least 1 latest record.
+        # But the records on the date of the cursor may have all been returned already.
+        # So the page and the record which signals the next page
+        # are held within the first `page_size` + 2 dates.
+        boundary_dates = list(dates[self.page_size + 1 : self.page_size + 2])
+        if not boundary_dates:
+            return queryset
+
+        if reverse:
+            return queryset.filter(date__gte=boundary_dates[0])
+        return queryset.filter(date__lte=boundary_dates[0])
+
+    def _take_records_after_cursor(self, *, records, reverse: bool) -> list:
+        # The records on the date of the cursor cannot be excluded in the query.
+        # As they are needed to rank the other records on that date.
+        page = []
+        for record in records:
+            if self._is_at_or_before_cursor(record=record, reverse=reverse):
+                continue
+
+            page.append(record)
+            if len(page) > self.page_size:
+                break
+
+        return page
+
+    def _is_at_or_before_cursor(self, *, record, reverse: bool) -> bool:
+        if self.cursor is None or record.date != self.cursor.date:
+            return False
+
+        if reverse:
+            return record.id >= self.cursor.id
+        return record.id <= self.cursor.id
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self) -> str | None:
+        if not self.cursor_mode:
+            return super().get_next_link()
+
+        reverse: bool = self.cursor is not None and self.cursor.reverse
+        has_next_page: bool = reverse or self.has_more_records
+        if not has_next_page or not self.page:
+            return None
+
+        return self._build_link(record=self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.cursor_mode:
+            return super().get_previous_link()
+
+        reverse: bool = self.cursor is not None and self.cursor.reverse
+        has_previous_page: bool = (
+            self.has_more_records if reverse else bool(self.cursor)
+        )
+        if not has_previous_page or not self.page:
+            return None
+
+        return self._build_link(record=self.page[0], reverse=True)
+
+    def _build_link(self, *, record, reverse: bool) -> str:
+        cursor = Cursor(date=record.date, id=record.id, reverse=reverse)
+        return replace_query_param(
+            url=self.base_url,
+            key=CURSOR_QUERY_PARAM,
+            val=encode_cursor(cursor=cursor),
+        )
+
+    def get_paginated_response_schema(self, schema):
+        paginated_response_schema = super().get_paginated_response_schema(schema)
+        paginated_response_schema["properties"]["count"]["nullable"] = True
+        return paginated_response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": PAGINATION_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Whether to paginate by `page` number or by `cursor`.",
+                "schema": {"type": "string", "enum": [PAGE_NUMBER_MODE, CURSOR_MODE]},
+            },
+            {
+                "name": CURSOR_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": SKIP_COUNT_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Whether to skip counting the results "
+                "when paginating by cursor.",
+                "schema": {"type": "boolean"},
+            },
+        ]
@@ -31,10 +31,14 @@ class APITimeSeriesRequestSerializer(Serializer):
             raise NotImplementedError(NO_LOOKUP_FIELD_ERROR_MESSAGE) from error
 
     @property
-    def api_time_series_manager(self) -> "APITimeSeriesManager":
-        api_time_series_model = MetricsPublicAPIInterface.get_api_timeseries_model()
+    def api_time_series_manager(self) -> "APITimeSeriesDimensionManager":
+        # The hierarchy is read from the catalogue of dimensions
+        # rather than from distinct scans over the `APITimeSeries` table
+        api_time_series_dimension_model = (
+            MetricsPublicAPIInterface.get_api_timeseries_dimension_model()
+        )
         return self.context.get(
-            "api_time_series_manager", api_time_series_model.objects
+            "api_time_series_manager", api_time_series_dimension_model.objects
         )
 
     def get_kwargs_from_request(self) -> dict[str, str]:
@@ -1,8 +1,9 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
-from rest_framework import pagination, viewsets
+from rest_framework import viewsets
 
 from public_api.metrics_interface.interface import MetricsPublicAPIInterface
+from public_api.pagination import CURSOR_MODE, APITimeSeriesKeysetPagination
 from public_api.version_02.serializers.timeseries_serializers import (
     APITimeSeriesListSerializerv2,
 )
@@ -12,7 +13,8 @@ DEFAULT_API_TIMESERIES_RESPONSE_PAGE_SIZE: int = 5
 MAXIMUM_API_TIMESERIES_RESPONSE_PAGE_SIZE: int = 365
 
 
-class APITimeSeriesPaginationv2(pagination.PageNumberPagination):
+class APITimeSeriesPaginationv2(APITimeSeriesKeysetPagination):
+    default_mode = CURSOR_MODE
     page_size = DEFAULT_API_TIMESERIES_RESPONSE_PAGE_SIZE
     max_page_size = MAXIMUM_API_TIMESERIES_RESPONSE_PAGE_SIZE
     page_size_query_param = "page_size"
@@ -25,11 +27,18 @@ class APITimeSeriesViewSetV2(viewsets.ReadOnlyModelViewSet):
 
     There are a set of mandatory URL parameters and optional query parameters:
 
-    Note that by default, results are paginated by a page size of 5
+    Note that by default, results are paginated by cursor with a page size of 5
 
     This page size can be changed using the *page_size* parameter.
     The maximum supported page size is **365**.
 
+    The *next* and *previous* links hold an opaque *cursor* parameter,
+    which keeps deep pages as fast as the first page.
+    The *count* can be skipped by setting the *skip_count* parameter to **true**.
+
+    Results can instead be paginated by page number, by providing the *page* parameter
+    or by setting the *pagination* parameter to **page**.
+
     ---
 
     Whereby the mandatory URL parameters are as follows in order from first to last:
@@ -100,4 +109,9 @@ class APITimeSeriesViewSetV2(viewsets.ReadOnlyModelViewSet):
             geography=self.kwargs["geography"],
             metric=self.kwargs["metric"],
             restrict_to_public=True,  # because we are not allowing non-public data through the public API
+            # In cursor mode, the records are only ranked within the dates of the page
+            restrict_to_latest_refresh_dates=not self.paginator.uses_cursor(
+                request=self.request
+            ),
+            use_current_view=True,
         )
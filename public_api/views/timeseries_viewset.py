@@ -1,8 +1,9 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
-from rest_framework import pagination, viewsets
+from rest_framework import viewsets
 
 from public_api.metrics_interface.interface import MetricsPublicAPIInterface
+from public_api.pagination import PAGE_NUMBER_MODE, APITimeSeriesKeysetPagination
 from public_api.serializers.timeseries_serializers import APITimeSeriesListSerializer
 from public_api.views.base import PUBLIC_API_TAG
 
@@ -10,7 +11,8 @@ DEFAULT_API_TIMESERIES_RESPONSE_PAGE_SIZE: int = 5
 MAXIMUM_API_TIMESERIES_RESPONSE_PAGE_SIZE: int = 365
 
 
-class APITimeSeriesPagination(pagination.PageNumberPagination):
+class APITimeSeriesPagination(APITimeSeriesKeysetPagination):
+    default_mode = PAGE_NUMBER_MODE
     page_size = DEFAULT_API_TIMESERIES_RESPONSE_PAGE_SIZE
     max_page_size = MAXIMUM_API_TIMESERIES_RESPONSE_PAGE_SIZE
     page_size_query_param = "page_size"
@@ -28,6 +30,13 @@ class APITimeSeriesViewSet(viewsets.ReadOnlyModelViewSet):
     This page size can be changed using the *page_size* parameter.
     The maximum supported page size is **365**.
 
+    Results can instead be paginated by cursor,
+    by setting the *pagination* parameter to **cursor**.
+    The *next* and *previous* links then hold an opaque *cursor* parameter,
+    which keeps deep pages as fast as the first page.
+    When paginating by cursor, the *count* can be skipped
+    by setting the *skip_count* parameter to **true**.
+
     ---
 
     Whereby the mandatory URL parameters are as follows in order from first to last:
@@ -98,4 +107,9 @@ class APITimeSeriesViewSet(viewsets.ReadOnlyModelViewSet):
             geography=self.kwargs["geography"],
             metric=self.kwargs["metric"],
             restrict_to_public=True,  # because we are not allowing non-public data through the public API
+            # In cursor mode, the records are only ranked within the dates of the page
+            restrict_to_latest_refresh_dates=not self.paginator.uses_cursor(
+                request=self.request
+            ),
+            use_current_view=True,
         )
@@ -8,6 +8,8 @@ from wagtail.models import Page
 from wagtail.models.i18n import Locale
 
 from caching.private_api.management import CacheManagement
+from common.auth.permissions import clear_permission_checks_memo
+from common.auth.resource_ids import invalidate_resource_ids
 from cms.home.models.home_page import UKHSARootPage
 from metrics.domain.models import (
     PlotGenerationData,
@@ -31,6 +33,15 @@ from validation.is_public import NON_PUBLIC_DATA_PREFIX
 DATA_PAYLOAD_HINT = dict[str, str | datetime.date]
 
 
+@pytest.fixture(autouse=True)
+def clear_permissions_caches():
+    invalidate_resource_ids()
+    clear_permission_checks_memo()
+    yield
+    invalidate_resource_ids()
+    clear_permission_checks_memo()
+
+
 @pytest.fixture
 def test_filename() -> str:
     return "test.json"
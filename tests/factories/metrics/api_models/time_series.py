@@ -44,7 +44,7 @@ class APITimeSeriesFactory(factory.django.DjangoModelFactory):
             datetime_obj=embargo
         )
 
-        return cls.create(
+        api_time_series = cls.create(
             metric_value=metric_value,
             metric_frequency=metric_frequency,
             metric=metric_name,
@@ -66,6 +66,20 @@ class APITimeSeriesFactory(factory.django.DjangoModelFactory):
             is_public=is_public,
             **kwargs
         )
+        # The ingestion refreshes the current view of each series it writes to
+        APITimeSeries.objects.refresh_current_view(
+            theme=theme_name,
+            sub_theme=sub_theme_name,
+            topic=topic_name,
+            metric=metric_name,
+            geography=geography_name,
+            geography_type=geography_type_name,
+            geography_code=geography_code,
+            stratum=stratum_name,
+            sex=sex,
+            age=age_name,
+        )
+        return api_time_series
 
     @classmethod
     def _make_datetime_timezone_aware(
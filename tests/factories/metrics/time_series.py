@@ -70,7 +70,7 @@ class CoreTimeSeriesFactory(factory.django.DjangoModelFactory):
             datetime_obj=refresh_date
         )
 
-        return cls.create(
+        core_time_series = cls.create(
             metric=metric,
             metric_frequency="D",
             geography=geography,
@@ -87,6 +87,17 @@ class CoreTimeSeriesFactory(factory.django.DjangoModelFactory):
             is_public=is_public,
             **kwargs
         )
+        # The ingestion refreshes the current view of each series it writes to
+        CoreTimeSeries.objects.refresh_current_view(
+            metric=metric_name,
+            geography=geography_name,
+            geography_type=geography_type_name,
+            geography_code=geography_code,
+            stratum=stratum_name,
+            sex=sex,
+            age=age_name,
+        )
+        return core_time_series
 
     @classmethod
     def _make_datetime_timezone_aware(
@@ -1,6 +1,7 @@
 import datetime
 
 from metrics.data.managers.core_models.headline import CoreHeadlineManager
+from tests.fakes.models.metrics.headline import FakeCoreHeadline
 from tests.fakes.models.metrics.rbac_models.rbac_permission import FakeRBACPermission
 
 
@@ -69,3 +70,29 @@ class FakeCoreHeadlineManager(CoreHeadlineManager):
             return filtered_headlines[0]
         except IndexError:
             return None
+
+    def get_latest_headlines_for_geography_codes(
+        self,
+        *,
+        topic: str,
+        metric: str,
+        geography_codes: list[str],
+        geography: str = "",
+        geography_type: str = "",
+        stratum: str = "",
+        sex: str = "",
+        age: str = "",
+    ) -> dict[str, FakeCoreHeadline | None]:
+        return {
+            geography_code: self.get_latest_headline(
+                topic=topic,
+                metric=metric,
+                geography=geography,
+                geography_type=geography_type,
+                geography_code=geography_code,
+                stratum=stratum,
+                sex=sex,
+                age=age,
+            )
+            for geography_code in geography_codes
+        }
@@ -109,6 +109,36 @@ class FakeCoreTimeSeriesManager(CoreTimeSeriesManager):
         )
         return queryset
 
+    def query_for_data_for_series(
+        self,
+        topic: str,
+        metric: str,
+        date_from: datetime.date,
+        series: list[dict[str, str]],
+        fields_to_export: list[str | None],
+        date_to: datetime.date | None = None,
+        field_to_order_by: str = "date",
+        permission_sets: dict | None = None,
+        metric_value_ranges: list[tuple] | None = None,
+        **kwargs,
+    ) -> list[tuple[list[dict], datetime.date | None]]:
+        results = []
+        for individual_series in series:
+            queryset = self.query_for_data(
+                topic=topic,
+                metric=metric,
+                date_from=date_from,
+                date_to=date_to,
+                fields_to_export=[x for x in fields_to_export if x is not None],
+                field_to_order_by=field_to_order_by,
+                permission_sets=permission_sets,
+                metric_value_ranges=metric_value_ranges,
+                **individual_series,
+            )
+            results.append((list(queryset), queryset.latest_date or None))
+
+        return results
+
     @classmethod
     def _export_record(cls, time_series, fields_to_export) -> dict[str, Any]:
         exported_record = {}
@@ -2,10 +2,14 @@ import datetime
 import pytest
 from django.utils import timezone
 
+from metrics.data.managers.core_models.time_series import (
+    CURRENT_VIEW_PARTITION_FIELDS,
+)
 from metrics.data.models.core_models import (
     Age,
     CoreHeadline,
     CoreTimeSeries,
+    CoreTimeSeriesCurrentView,
     Metric,
     MetricGroup,
     Topic,
@@ -89,7 +93,7 @@ def core_timeseries_example() -> list[CoreTimeSeries]:
     age = Age.objects.create(name="all")
     year = 2023
     month = 1
-    return [
+    core_timeseries = [
         CoreTimeSeries.objects.create(
             metric_value=123,
             metric=metric,
@@ -103,6 +107,13 @@ def core_timeseries_example() -> list[CoreTimeSeries]:
         )
         for i in range(2)
     ]
+    # The ingestion refreshes the current view of each series it writes to
+    CoreTimeSeriesCurrentView.objects.refresh_entries(
+        time_series=CoreTimeSeries.objects.filter(metric=metric),
+        partition_fields=CURRENT_VIEW_PARTITION_FIELDS,
+        null_refresh_date_is_latest=False,
+    )
+    return core_timeseries
 
 
 @pytest.fixture
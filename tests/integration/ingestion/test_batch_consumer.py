@@ -0,0 +1,311 @@
+import copy
+
+import pytest
+
+from ingestion.batch_consumer import BatchConsumer
+from ingestion.consumer import Consumer
+from ingestion.operations.supporting_models_cache import (
+    SupportingModelResolutionError,
+    SupportingModelsCache,
+)
+from ingestion.utils.type_hints import INCOMING_DATA_TYPE
+from metrics.data.models.api_models import (
+    APITimeSeries,
+    APITimeSeriesCurrentView,
+    APITimeSeriesDimension,
+)
+from metrics.data.models.core_models import (
+    CoreHeadline,
+    CoreTimeSeries,
+    CoreTimeSeriesCurrentView,
+    Geography,
+    Metric,
+    Theme,
+    Topic,
+)
+
+
+def _build_dto(*, source_data: INCOMING_DATA_TYPE, filename: str):
+    return Consumer(source_data=source_data, filename=filename).dto
+
+
+def _build_regional_time_series_data(
+    *, example_time_series_data: INCOMING_DATA_TYPE, number_of_regions: int
+) -> list[INCOMING_DATA_TYPE]:
+    regional_data = []
+    for index in range(number_of_regions):
+        source_data = copy.deepcopy(example_time_series_data)
+        source_data["geography_type"] = "Region"
+        source_data["geography"] = f"Region {index}"
+        source_data["geography_code"] = f"E1200000{index}"
+        regional_data.append(source_data)
+
+    return regional_data
+
+
+class TestBatchConsumer:
+    @pytest.mark.django_db
+    def test_ingests_headline_and_time_series_data(
+        self,
+        example_headline_data: INCOMING_DATA_TYPE,
+        example_time_series_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given a headline DTO and a time series DTO
+        When `process()` is called from an instance of `BatchConsumer`
+        Then the `CoreHeadline`, `CoreTimeSeries`
+            and `APITimeSeries` records are created
+        And the dimensions of the `APITimeSeries` records are catalogued
+        And the supporting models are shared between the records
+        """
+        # Given
+        dtos = [
+            _build_dto(source_data=example_headline_data, filename=test_filename),
+            _build_dto(source_data=example_time_series_data, filename=test_filename),
+        ]
+        batch_consumer = BatchConsumer(
+            dtos=dtos, supporting_models_cache=SupportingModelsCache()
+        )
+
+        # When
+        timings = batch_consumer.process()
+
+        # Then
+        assert CoreHeadline.objects.count() == len(example_headline_data["data"])
+        assert CoreTimeSeries.objects.count() == len(
+            example_time_series_data["time_series"]
+        )
+        assert APITimeSeries.objects.count() == len(
+            example_time_series_data["time_series"]
+        )
+        assert APITimeSeriesDimension.objects.count() == 1
+
+        assert Theme.objects.count() == 1
+        assert Topic.objects.count() == 2
+        assert Geography.objects.count() == 1
+        assert {
+            record.geography_id
+            for record in (*CoreHeadline.objects.all(), *CoreTimeSeries.objects.all())
+        } == {Geography.objects.get().id}
+
+        assert timings.number_of_dtos == 2
+        assert timings.number_of_batches == 1
+
+    @pytest.mark.django_db
+    def test_resolves_supporting_models_with_one_write_and_read_per_table(
+        self,
+        example_time_series_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+        django_assert_max_num_queries,
+    ):
+        """
+        Given a number of time series DTOs for different geographies
+        And a warmed `SupportingModelsCache`
+        When `resolve()` is called from the `SupportingModelsCache`
+        Then the supporting models are created
+            with at most 1 write and 1 read per supporting table
+        And subsequent calls are resolved without hitting the database
+        """
+        # Given
+        dtos = [
+            _build_dto(source_data=source_data, filename=test_filename)
+            for source_data in _build_regional_time_series_data(
+                example_time_series_data=example_time_series_data,
+                number_of_regions=9,
+            )
+        ]
+        supporting_models_cache = SupportingModelsCache()
+        supporting_models_cache.warm()
+        number_of_supporting_tables = 9
+
+        # When
+        with django_assert_max_num_queries(num=number_of_supporting_tables * 2):
+            supporting_models_lookups = supporting_models_cache.resolve(dtos=dtos)
+
+        # Then
+        assert Geography.objects.count() == 9
+        assert {lookup.geography_id for lookup in supporting_models_lookups} == set(
+            Geography.objects.values_list("id", flat=True)
+        )
+        assert {lookup.metric_id for lookup in supporting_models_lookups} == {
+            Metric.objects.get().id
+        }
+
+        with django_assert_max_num_queries(num=0):
+            assert supporting_models_cache.resolve(dtos=dtos) == (
+                supporting_models_lookups
+            )
+
+    @pytest.mark.django_db
+    def test_clears_stale_records_and_writes_in_multiple_batches(
+        self,
+        example_time_series_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given time series DTOs which supersede previously ingested records
+        When `process()` is called from an instance of `BatchConsumer`
+            with a `files_per_batch` smaller than the number of DTOs
+        Then the records are written across multiple batches
+        And the stale records are removed ahead of the next ingestion
+        And the current views only hold the records from the latest ingestion
+        """
+        # Given
+        regional_data = _build_regional_time_series_data(
+            example_time_series_data=example_time_series_data, number_of_regions=3
+        )
+        original_dtos = [
+            _build_dto(source_data=source_data, filename=test_filename)
+            for source_data in regional_data
+        ]
+        supporting_models_cache = SupportingModelsCache()
+        BatchConsumer(
+            dtos=original_dtos, supporting_models_cache=supporting_models_cache
+        ).process()
+
+        for refresh_date in ("2023-11-27", "2023-12-04"):
+            updated_dtos = []
+            for source_data in regional_data:
+                updated_source_data = copy.deepcopy(source_data)
+                updated_source_data["refresh_date"] = refresh_date
+                for time_series_data in updated_source_data["time_series"]:
+                    time_series_data["metric_value"] += 1
+                updated_dtos.append(
+                    _build_dto(source_data=updated_source_data, filename=test_filename)
+                )
+                regional_data[regional_data.index(source_data)] = updated_source_data
+
+            # When
+            timings = BatchConsumer(
+                dtos=updated_dtos,
+                files_per_batch=2,
+                supporting_models_cache=supporting_models_cache,
+            ).process()
+
+        # Then
+        assert timings.number_of_batches == 2
+        # Only the stale records from the original ingestion have been removed.
+        # The records superseded by the latest ingestion will be removed next time
+        number_of_points = len(example_time_series_data["time_series"])
+        assert CoreTimeSeries.objects.count() == 3 * number_of_points * 2
+        assert APITimeSeries.objects.count() == 3 * number_of_points * 2
+
+        for current_view_model in (CoreTimeSeriesCurrentView, APITimeSeriesCurrentView):
+            assert current_view_model.objects.count() == 3 * number_of_points
+            assert {
+                str(refresh_date.date())
+                for refresh_date in current_view_model.objects.values_list(
+                    "time_series__refresh_date", flat=True
+                )
+            } == {"2023-12-04"}
+
+    @pytest.mark.django_db
+    def test_dtos_for_the_same_series_in_one_batch_supersede_each_other_in_order(
+        self,
+        example_time_series_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given 3 rounds of time series data with increasing refresh dates
+            and updated metric values for each of 2 separate series
+        When the rounds for the 1st series are ingested 1 at a time by a `Consumer`
+        And the rounds for the 2nd series are all given
+            to 1 batch of a `BatchConsumer`
+        Then the records left for both series are the same
+        And the current views hold the same records for both series
+        """
+        # Given
+        sequential_series_data, batched_series_data = _build_regional_time_series_data(
+            example_time_series_data=example_time_series_data, number_of_regions=2
+        )
+        rounds_of_sequential_series_data = []
+        rounds_of_batched_series_data = []
+        for index, refresh_date in enumerate(
+            ("2023-11-20", "2023-11-27", "2023-12-04")
+        ):
+            for series_data, rounds in (
+                (sequential_series_data, rounds_of_sequential_series_data),
+                (batched_series_data, rounds_of_batched_series_data),
+            ):
+                source_data = copy.deepcopy(series_data)
+                source_data["refresh_date"] = refresh_date
+                for time_series_data in source_data["time_series"]:
+                    time_series_data["metric_value"] += index
+                rounds.append(source_data)
+
+        # When
+        for source_data in rounds_of_sequential_series_data:
+            Consumer(
+                source_data=source_data, filename=test_filename
+            ).process_core_and_api_timeseries()
+
+        timings = BatchConsumer(
+            dtos=[
+                _build_dto(source_data=source_data, filename=test_filename)
+                for source_data in rounds_of_batched_series_data
+            ],
+            supporting_models_cache=SupportingModelsCache(),
+        ).process()
+
+        # Then
+        assert timings.number_of_batches == 1
+
+        for model, field_prefix, geography_lookup in (
+            (CoreTimeSeries, "", "geography__name"),
+            (APITimeSeries, "", "geography"),
+            (CoreTimeSeriesCurrentView, "time_series__", "geography__name"),
+            (APITimeSeriesCurrentView, "time_series__", "geography"),
+        ):
+            records_by_geography = {
+                geography: sorted(
+                    model.objects.filter(
+                        **{f"{field_prefix}{geography_lookup}": geography}
+                    ).values_list(
+                        f"{field_prefix}refresh_date",
+                        f"{field_prefix}date",
+                        f"{field_prefix}metric_value",
+                    )
+                )
+                for geography in (
+                    sequential_series_data["geography"],
+                    batched_series_data["geography"],
+                )
+            }
+            assert (
+                records_by_geography[batched_series_data["geography"]]
+                == records_by_geography[sequential_series_data["geography"]]
+            )
+
+    @pytest.mark.django_db
+    def test_raises_error_when_supporting_model_conflicts_with_existing_record(
+        self,
+        example_time_series_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given an existing `Geography` record
+        And a DTO for the same geography name & type but a different code
+        When `resolve()` is called from the `SupportingModelsCache`
+        Then a `SupportingModelResolutionError` is raised
+        """
+        # Given
+        BatchConsumer(
+            dtos=[
+                _build_dto(source_data=example_time_series_data, filename=test_filename)
+            ],
+            supporting_models_cache=SupportingModelsCache(),
+        ).process()
+
+        # The code is validated against the geography when the DTO is built,
+        # so the conflicting code is forced onto an already validated DTO
+        dto = _build_dto(
+            source_data=example_time_series_data, filename=test_filename
+        ).model_copy(update={"geography_code": "E92000002"})
+
+        supporting_models_cache = SupportingModelsCache()
+        supporting_models_cache.warm()
+
+        # When / Then
+        with pytest.raises(SupportingModelResolutionError):
+            supporting_models_cache.resolve(dtos=[dto])
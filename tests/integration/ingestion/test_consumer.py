@@ -6,6 +6,7 @@ import pytest
 from ingestion.consumer import Consumer
 from ingestion.utils.type_hints import INCOMING_DATA_TYPE
 from metrics.data.enums import TimePeriod
+from metrics.data.models.api_models import APITimeSeries
 from metrics.data.models.core_models import (
     Age,
     CoreHeadline,
@@ -236,6 +237,75 @@ class TestConsumer:
         assert str(core_timeseries.month) == month
         assert str(core_timeseries.epiweek) == str(timeseries_specific_data["epiweek"])
 
+    @pytest.mark.django_db
+    def test_process_core_and_api_timeseries_refreshes_current_views(
+        self, example_time_series_data: INCOMING_DATA_TYPE, test_filename: str
+    ):
+        """
+        Given time series data which has already been ingested
+        And an update to that data with a later `refresh_date`
+        When `process_core_and_api_timeseries()` is called
+            from an instance of `Consumer` for the update
+        Then the current views only hold the updated records
+        And reading via the current views returns the same records
+            as ranking the latest records as part of the query
+        """
+        # Given
+        Consumer(
+            source_data=example_time_series_data, filename=test_filename
+        ).process_core_and_api_timeseries()
+        updated_source_data = copy.deepcopy(example_time_series_data)
+        updated_source_data["refresh_date"] = "2023-11-27"
+        for time_series_data in updated_source_data["time_series"]:
+            time_series_data["metric_value"] += 1
+
+        consumer = Consumer(source_data=updated_source_data, filename=test_filename)
+
+        # When
+        consumer.process_core_and_api_timeseries()
+
+        # Then
+        number_of_points = len(example_time_series_data["time_series"])
+        assert CoreTimeSeries.objects.count() == number_of_points * 2
+        assert APITimeSeries.objects.count() == number_of_points * 2
+
+        query_params = {
+            "fields_to_export": ["date", "metric_value"],
+            "topic": updated_source_data["topic"],
+            "metric": updated_source_data["metric"],
+            "date_from": "2022-01-01",
+            "date_to": "2022-12-31",
+        }
+        core_time_series = CoreTimeSeries.objects.query_for_data(
+            **query_params, use_current_view=True
+        )
+        assert list(core_time_series) == list(
+            CoreTimeSeries.objects.query_for_data(**query_params)
+        )
+        assert [float(record["metric_value"]) for record in core_time_series] == [
+            time_series_data["metric_value"]
+            for time_series_data in updated_source_data["time_series"]
+        ]
+
+        list_view_params = {
+            "theme": updated_source_data["parent_theme"],
+            "sub_theme": updated_source_data["child_theme"],
+            "topic": updated_source_data["topic"],
+            "geography_type": updated_source_data["geography_type"],
+            "geography": updated_source_data["geography"],
+            "metric": updated_source_data["metric"],
+            "restrict_to_public": True,
+        }
+        api_time_series = APITimeSeries.objects.get_queryset().filter_for_list_view(
+            **list_view_params, use_current_view=True
+        )
+        assert set(api_time_series) == set(
+            APITimeSeries.objects.get_queryset().filter_for_list_view(
+                **list_view_params
+            )
+        )
+        assert api_time_series.count() == number_of_points
+
     @pytest.mark.django_db
     def test_can_ingest_duplicated_data_with_force_write_flag(self, test_filename: str):
         """
@@ -0,0 +1,190 @@
+import copy
+import datetime
+import io
+import json
+
+import pytest
+
+from ingestion.operations.payload_stream import PayloadStreamReader
+from ingestion.stream_consumer import StreamConsumer
+from ingestion.utils.type_hints import INCOMING_DATA_TYPE
+from metrics.data.models.api_models import APITimeSeries, APITimeSeriesCurrentView
+from metrics.data.models.core_models import (
+    CoreHeadline,
+    CoreTimeSeries,
+    CoreTimeSeriesCurrentView,
+    Metric,
+)
+from validation.data_transfer_models.base import MissingFieldError
+
+
+def _build_reader(*, source_data: INCOMING_DATA_TYPE) -> PayloadStreamReader:
+    return PayloadStreamReader(stream=io.StringIO(json.dumps(source_data)))
+
+
+def _build_long_time_series_data(
+    *, example_time_series_data: INCOMING_DATA_TYPE, number_of_points: int
+) -> INCOMING_DATA_TYPE:
+    source_data = copy.deepcopy(example_time_series_data)
+    template_point = source_data["time_series"][0]
+    start_date = datetime.date(year=2022, month=1, day=1)
+
+    source_data["time_series"] = [
+        {
+            **template_point,
+            "date": str(start_date + datetime.timedelta(days=index)),
+            "metric_value": index,
+        }
+        for index in range(number_of_points)
+    ]
+    return source_data
+
+
+class TestStreamConsumer:
+    @pytest.mark.django_db
+    def test_ingests_time_series_in_chunks(
+        self,
+        example_time_series_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given a time series payload with more items than the `items_per_chunk`
+        When `process()` is called from an instance of `StreamConsumer`
+        Then a `CoreTimeSeries` and an `APITimeSeries` record
+            is created for each item
+        And the supporting models are only created once
+        And each of the records is held in the current views
+        """
+        # Given
+        number_of_points = 25
+        source_data = _build_long_time_series_data(
+            example_time_series_data=example_time_series_data,
+            number_of_points=number_of_points,
+        )
+        stream_consumer = StreamConsumer(
+            reader=_build_reader(source_data=source_data),
+            filename=test_filename,
+            items_per_chunk=10,
+        )
+
+        # When
+        stream_consumer.process()
+
+        # Then
+        assert CoreTimeSeries.objects.count() == number_of_points
+        assert APITimeSeries.objects.count() == number_of_points
+        assert Metric.objects.count() == 1
+        assert sorted(
+            CoreTimeSeries.objects.values_list("metric_value", flat=True)
+        ) == list(range(number_of_points))
+        assert CoreTimeSeriesCurrentView.objects.count() == number_of_points
+        assert APITimeSeriesCurrentView.objects.count() == number_of_points
+
+    @pytest.mark.django_db
+    def test_ingests_headline_data(
+        self,
+        example_headline_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given a headline payload
+        When `process()` is called from an instance of `StreamConsumer`
+        Then a `CoreHeadline` record is created for each item
+        """
+        # Given
+        stream_consumer = StreamConsumer(
+            reader=_build_reader(source_data=example_headline_data),
+            filename=test_filename,
+        )
+
+        # When
+        stream_consumer.process()
+
+        # Then
+        assert CoreHeadline.objects.count() == len(example_headline_data["data"])
+
+    @pytest.mark.django_db
+    def test_rejects_reporting_delay_period_which_is_not_trailing_across_chunks(
+        self,
+        example_time_series_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given a time series payload where the 1st chunk
+            ends within the reporting delay period
+        And the 2nd chunk starts outside of the reporting delay period
+        When `process()` is called from an instance of `StreamConsumer`
+        Then a `ValueError` is raised
+        And none of the payload is written to the database
+        """
+        # Given
+        source_data = _build_long_time_series_data(
+            example_time_series_data=example_time_series_data, number_of_points=20
+        )
+        source_data["time_series"][9]["in_reporting_delay_period"] = True
+        stream_consumer = StreamConsumer(
+            reader=_build_reader(source_data=source_data),
+            filename=test_filename,
+            items_per_chunk=10,
+        )
+
+        # When / Then
+        with pytest.raises(ValueError):
+            stream_consumer.process()
+
+        assert not CoreTimeSeries.objects.exists()
+        assert not APITimeSeries.objects.exists()
+
+    @pytest.mark.django_db
+    def test_accepts_trailing_reporting_delay_period_spanning_chunks(
+        self,
+        example_time_series_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given a time series payload whose trailing reporting delay period
+            spans multiple chunks
+        When `process()` is called from an instance of `StreamConsumer`
+        Then all the records are created
+        """
+        # Given
+        source_data = _build_long_time_series_data(
+            example_time_series_data=example_time_series_data, number_of_points=20
+        )
+        for time_series in source_data["time_series"][5:]:
+            time_series["in_reporting_delay_period"] = True
+        stream_consumer = StreamConsumer(
+            reader=_build_reader(source_data=source_data),
+            filename=test_filename,
+            items_per_chunk=10,
+        )
+
+        # When
+        stream_consumer.process()
+
+        # Then
+        assert (
+            CoreTimeSeries.objects.filter(in_reporting_delay_period=True).count() == 15
+        )
+
+    @pytest.mark.django_db
+    def test_raises_error_for_missing_time_series(
+        self,
+        example_time_series_data: INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given a time series payload without a "time_series" field
+        When `process()` is called from an instance of `StreamConsumer`
+        Then a `MissingFieldError` is raised
+        """
+        # Given
+        source_data = copy.deepcopy(example_time_series_data)
+        source_data.pop("time_series")
+        stream_consumer = StreamConsumer(
+            reader=_build_reader(source_data=source_data), filename=test_filename
+        )
+
+        # When / Then
+        with pytest.raises(MissingFieldError):
+            stream_consumer.process()
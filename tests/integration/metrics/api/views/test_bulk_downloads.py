@@ -1,10 +1,18 @@
 import datetime
+import io
+import zipfile
 from http import HTTPStatus
+from pathlib import Path
+from unittest import mock
 
 import pytest
 from rest_framework.response import Response
 from rest_framework.test import APIClient
 
+from metrics.domain.bulk_downloads.storage import LocalFileSystemStorage
+
+MODULE_PATH = "metrics.api.views.downloads.bulk_downloads"
+
 
 class TestBulkDownloadsView:
     def test_get_bulk_downloads_returns_bad_request(
@@ -47,3 +55,63 @@ class TestBulkDownloadsView:
             response.headers["Content-disposition"]
             == f"attachment; filename=ukhsa_data_dashboard_downloads_{fake_date}.zip"
         )
+
+    @pytest.mark.django_db
+    @mock.patch(f"{MODULE_PATH}.get_bulk_downloads_storage", return_value=None)
+    def test_streams_zip_file_when_precomputed_archives_are_disabled(
+        self, mocked_get_bulk_downloads_storage: mock.MagicMock
+    ):
+        """
+        Given precomputed bulk downloads archives have been disabled
+        When the `GET /api/bulkdownloads/v1` endpoint is hit
+        Then the zip file is streamed back in the response
+        And no `ETag` header is returned
+
+        Patches:
+            `mocked_get_bulk_downloads_storage`: To disable
+                the precomputed archives
+        """
+        # Given
+        client = APIClient()
+        path = "/api/bulkdownloads/v1?file_format=csv"
+
+        # When
+        response: Response = client.get(path=path)
+
+        # Then
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming
+        assert "ETag" not in response.headers
+        assert zipfile.is_zipfile(io.BytesIO(b"".join(response.streaming_content)))
+
+    @pytest.mark.django_db
+    def test_conditional_request_for_unchanged_archive_returns_not_modified(
+        self, tmp_path: Path
+    ):
+        """
+        Given a precomputed bulk downloads archive
+        And a request which supplies the `ETag` of that archive
+        When the `GET /api/bulkdownloads/v1` endpoint is hit
+        Then a 304 Not Modified response is received
+
+        Patches:
+            `mocked_get_bulk_downloads_storage`: To store the archive
+                in a temporary directory
+        """
+        # Given
+        client = APIClient()
+        path = "/api/bulkdownloads/v1?file_format=csv"
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+
+        with mock.patch(
+            f"{MODULE_PATH}.get_bulk_downloads_storage", return_value=storage
+        ):
+            first_response = client.get(path=path)
+            etag: str = first_response.headers["ETag"]
+
+            # When
+            response: Response = client.get(path=path, HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        assert first_response.status_code == HTTPStatus.OK
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
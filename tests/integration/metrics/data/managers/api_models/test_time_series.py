@@ -355,6 +355,50 @@ class TestAPITimeSeriesQuerySet:
             for expected_current_record in expected_current_records
         )
 
+    @pytest.mark.django_db
+    def test_filter_for_list_view_can_defer_latest_refresh_date_filter(self):
+        """
+        Given a number of `APITimeSeries` records with multiple refresh dates
+        When `filter_for_list_view()` is called
+            from an instance of `APITimeSeriesQueryset`
+            with `restrict_to_latest_refresh_dates` set to False
+        Then the superseded records are also returned
+        And the latest records can be filtered for afterwards
+        """
+        # Given
+        metric = "influenza_healthcare_ICUHDUadmissionRateByWeek"
+        expected_current_records: list[APITimeSeries] = (
+            self._create_api_timeseries_with_mixed_age_date_refresh_dates(
+                metric=metric,
+                first_date="2024-01-01",
+                second_date="2024-01-02",
+            )
+        )
+
+        # When
+        retrieved_records = APITimeSeries.objects.get_queryset().filter_for_list_view(
+            theme=expected_current_records[0].theme,
+            sub_theme=expected_current_records[0].sub_theme,
+            topic=expected_current_records[0].topic,
+            geography_type=expected_current_records[0].geography_type,
+            geography=expected_current_records[0].geography,
+            metric=metric,
+            restrict_to_public=True,
+            restrict_to_latest_refresh_dates=False,
+        )
+
+        # Then
+        assert retrieved_records.count() == APITimeSeries.objects.count()
+
+        latest_records = retrieved_records.filter_for_latest_refresh_date_records(
+            queryset=retrieved_records.filter(date="2024-01-01")
+        )
+        assert set(latest_records) == {
+            record
+            for record in expected_current_records
+            if str(record.date) == "2024-01-01"
+        }
+
     @staticmethod
     def _create_api_timeseries_with_mixed_age_date_refresh_dates(
         metric: str, first_date: str, second_date: str
@@ -577,3 +621,69 @@ class TestAPITimeSeriesManager:
 
         # --- Checks for 5th round ---
         assert fifth_embargoed_round_for_first_date in retrieved_records
+
+    @pytest.mark.django_db
+    def test_refresh_current_view_matches_latest_records_for_list_view(
+        self, timestamp_2_months_from_now: datetime.datetime
+    ):
+        """
+        Given `APITimeSeries` records which have been refreshed across 3 rounds
+        And the latest round is under embargo
+        When `refresh_current_view()` is called
+            from an instance of the `APITimeSeriesManager`
+        Then `filter_for_list_view()` with `use_current_view` set to True
+            returns the same records as when ranking
+            the latest records as part of the query
+        """
+        # Given
+        dates = FAKE_DATES
+        for metric_value, refresh_date, embargo, dates_of_round in (
+            (1, "2023-08-10", "2023-08-10", dates),
+            (2, "2023-08-11", "2023-08-11", dates[1:]),
+            (3, "2023-08-12", timestamp_2_months_from_now, dates[:2]),
+        ):
+            for date in dates_of_round:
+                APITimeSeriesFactory.create_record(
+                    metric_value=metric_value,
+                    date=date,
+                    refresh_date=refresh_date,
+                    embargo=embargo,
+                )
+
+        # When
+        APITimeSeries.objects.refresh_current_view(
+            theme="infectious_disease",
+            sub_theme="respiratory",
+            topic="COVID-19",
+            metric="COVID-19_cases_casesByDay",
+            geography="England",
+            geography_type="Nation",
+            geography_code="E92000001",
+            stratum="default",
+            sex="all",
+            age="all",
+        )
+
+        # Then
+        list_view_params = {
+            "theme": "infectious_disease",
+            "sub_theme": "respiratory",
+            "topic": "COVID-19",
+            "geography_type": "Nation",
+            "geography": "England",
+            "metric": "COVID-19_cases_casesByDay",
+            "restrict_to_public": True,
+        }
+        retrieved_records = APITimeSeries.objects.get_queryset().filter_for_list_view(
+            **list_view_params, use_current_view=True
+        )
+        assert set(retrieved_records) == set(
+            APITimeSeries.objects.get_queryset().filter_for_list_view(
+                **list_view_params
+            )
+        )
+        assert sorted(retrieved_records.values_list("date", "metric_value")) == [
+            (datetime.date(2023, 1, 1), 1.0),
+            (datetime.date(2023, 1, 2), 2.0),
+            (datetime.date(2023, 1, 3), 2.0),
+        ]
@@ -0,0 +1,104 @@
+import pytest
+
+from metrics.data.models.api_models import APITimeSeries, APITimeSeriesDimension
+from tests.factories.metrics.api_models.time_series import APITimeSeriesFactory
+
+
+class TestAPITimeSeriesDimensionManager:
+    @pytest.mark.django_db
+    def test_record_dimensions_adds_each_distinct_dimension_once(self):
+        """
+        Given a number of `APITimeSeries` records across 2 geographies
+        And a dimension which has already been recorded
+        When `record_dimensions()` is called
+            from the `APITimeSeriesDimensionManager`
+        Then 1 `APITimeSeriesDimension` record is held per distinct dimension
+        """
+        # Given
+        api_time_series = [
+            APITimeSeriesFactory.create_record(date=date, geography_name=geography)
+            for date in ("2023-01-01", "2023-01-02")
+            for geography in ("England", "London")
+        ]
+        APITimeSeriesDimension.objects.record_dimensions(
+            api_time_series=api_time_series[:1]
+        )
+
+        # When
+        APITimeSeriesDimension.objects.record_dimensions(
+            api_time_series=api_time_series
+        )
+
+        # Then
+        assert APITimeSeriesDimension.objects.count() == 2
+        assert set(
+            APITimeSeriesDimension.objects.values_list("geography", flat=True)
+        ) == {"England", "London"}
+
+    @pytest.mark.django_db
+    def test_record_dimensions_does_not_query_without_records(
+        self, django_assert_num_queries
+    ):
+        """
+        Given no `APITimeSeries` records
+        When `record_dimensions()` is called
+            from the `APITimeSeriesDimensionManager`
+        Then no queries are executed
+        And no `APITimeSeriesDimension` records are held
+        """
+        # Given
+        api_time_series = []
+
+        # When
+        with django_assert_num_queries(num=0):
+            APITimeSeriesDimension.objects.record_dimensions(
+                api_time_series=api_time_series
+            )
+
+        # Then
+        assert not APITimeSeriesDimension.objects.exists()
+
+    @pytest.mark.django_db
+    def test_get_distinct_column_values_with_filters_matches_api_time_series(self):
+        """
+        Given a number of public and non-public `APITimeSeries` records
+        And their dimensions have been recorded
+        When `get_distinct_column_values_with_filters()` is called
+            from the `APITimeSeriesDimensionManager`
+        Then the same values are returned as from the `APITimeSeriesManager`
+        """
+        # Given
+        api_time_series = [
+            APITimeSeriesFactory.create_record(
+                topic_name=topic_name, is_public=is_public
+            )
+            for topic_name, is_public in (
+                ("COVID-19", True),
+                ("Influenza", True),
+                ("RSV", False),
+            )
+        ]
+        APITimeSeriesDimension.objects.record_dimensions(
+            api_time_series=api_time_series
+        )
+
+        for restrict_to_public in (True, False):
+            # When
+            topics = (
+                APITimeSeriesDimension.objects.get_distinct_column_values_with_filters(
+                    lookup_field="topic",
+                    restrict_to_public=restrict_to_public,
+                    theme="infectious_disease",
+                    sub_theme="respiratory",
+                )
+            )
+
+            # Then
+            assert set(topics) == set(
+                APITimeSeries.objects.get_distinct_column_values_with_filters(
+                    lookup_field="topic",
+                    restrict_to_public=restrict_to_public,
+                    theme="infectious_disease",
+                    sub_theme="respiratory",
+                )
+            )
@@ -186,3 +186,32 @@ class TestGeographyManager:
 
         # Then
         assert geography_code == liverpool_combined_authority.geography_code
+
+    @pytest.mark.django_db
+    def test_get_geography_code_for_geography(self):
+        """
+        Given some Geography records that share a name across geography types
+        When get_geography_code_for_geography() is called
+            with a specific geography_type
+        Then the matching geography_code is returned
+        """
+
+        # Given
+        GeographyFactory.create_with_geography_type(
+            name="Liverpool",
+            geography_code="E08000012",
+            geography_type="Lower Tier Local Authority",
+        )
+        liverpool_combined_authority = GeographyFactory.create_with_geography_type(
+            name="Liverpool",
+            geography_code="E47000004",
+            geography_type="Combined Authority",
+        )
+
+        # When
+        geography_code = Geography.objects.get_geography_code_for_geography(
+            geography="Liverpool", geography_type="Combined Authority"
+        )
+
+        # Then
+        assert geography_code == liverpool_combined_authority.geography_code
@@ -528,6 +528,72 @@ class TestCoreHeadlineManager:
         # Then
         assert extracted_embargo is None
 
+    @pytest.mark.django_db
+    def test_find_latest_refresh_date_and_released_embargo_for_metrics(self):
+        """
+        Given a number of `CoreHeadline` records
+            for different metrics
+        And a record for 1 of those metrics which is still under embargo
+        When `find_latest_refresh_date_and_released_embargo_for_metrics()`
+            is called from an instance of the `CoreHeadlineManager`
+        Then the latest `refresh_date` across the metrics is returned
+        And the latest `embargo` which has been released is returned
+        """
+        # Given
+        covid_metric = "COVID-19_headline_7DayAdmissions"
+        other_covid_metric = "COVID-19_headline_7DayOccupiedBeds"
+
+        latest_refresh_date = datetime.datetime(2024, 3, 3, tzinfo=datetime.UTC)
+        latest_released_embargo = datetime.datetime(2024, 2, 2, tzinfo=datetime.UTC)
+        unreleased_embargo = get_date_n_months_ago_from_timestamp(
+            datetime_stamp=timezone.now(), number_of_months=-1
+        )
+
+        CoreHeadlineFactory.create_record(
+            metric=covid_metric,
+            refresh_date=datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC),
+            embargo=latest_released_embargo,
+        )
+        CoreHeadlineFactory.create_record(
+            metric=other_covid_metric,
+            refresh_date=latest_refresh_date,
+            embargo=unreleased_embargo,
+        )
+        CoreHeadlineFactory.create_record(
+            metric="adenovirus_headline_positivityLatest",
+            refresh_date=datetime.datetime(2024, 4, 4, tzinfo=datetime.UTC),
+            embargo=datetime.datetime(2024, 3, 3, tzinfo=datetime.UTC),
+        )
+
+        # When
+        extracted_timestamps = CoreHeadline.objects.find_latest_refresh_date_and_released_embargo_for_metrics(
+            metrics=[covid_metric, other_covid_metric]
+        )
+
+        # Then
+        assert extracted_timestamps == (latest_refresh_date, latest_released_embargo)
+
+    @pytest.mark.django_db
+    def test_find_latest_refresh_date_and_released_embargo_for_metrics_returns_none_when_no_data_found(
+        self,
+    ):
+        """
+        Given no existing `CoreHeadline` records
+        When `find_latest_refresh_date_and_released_embargo_for_metrics()`
+            is called from an instance of the `CoreHeadlineManager`
+        Then None is returned for both timestamps
+        """
+        # Given
+        covid_metric = "COVID-19_headline_7DayAdmissions"
+
+        # When
+        extracted_timestamps = CoreHeadline.objects.find_latest_refresh_date_and_released_embargo_for_metrics(
+            metrics=[covid_metric]
+        )
+
+        # Then
+        assert extracted_timestamps == (None, None)
+
     @pytest.mark.django_db
     @mock.patch(
         "metrics.api.permissions.fluent_permissions.auth.ENFORCE_PUBLIC_DATA_ONLY",
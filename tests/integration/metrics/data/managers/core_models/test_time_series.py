@@ -10,6 +10,7 @@ from metrics.data.models.core_models import CoreTimeSeries
 from tests.factories.metrics.time_series import CoreTimeSeriesFactory
 
 FAKE_DATES = ("2023-01-01", "2023-01-02", "2023-01-03")
+MODULE_PATH = "metrics.data.managers.core_models.time_series"
 
 
 class TestCoreTimeSeriesQuerySet:
@@ -344,6 +345,48 @@ class TestCoreTimeSeriesQuerySet:
 
 
 class TestCoreTimeSeriesManager:
+    @pytest.mark.django_db
+    def test_find_latest_refresh_date_and_released_embargo_for_metrics(self):
+        """
+        Given a number of `CoreTimeSeries` records
+            for different metrics
+        And a record for 1 of those metrics which is still under embargo
+        When `find_latest_refresh_date_and_released_embargo_for_metrics()`
+            is called from an instance of the `CoreTimeSeriesManager`
+        Then the latest `refresh_date` across the metrics is returned
+        And the latest `embargo` which has been released is returned
+        """
+        # Given
+        cases_metric = "COVID-19_cases_casesByDay"
+        deaths_metric = "COVID-19_deaths_ONSByDay"
+
+        latest_refresh_date = datetime.datetime(2024, 3, 3, tzinfo=datetime.UTC)
+        latest_released_embargo = datetime.datetime(2024, 2, 2, tzinfo=datetime.UTC)
+
+        CoreTimeSeriesFactory.create_record(
+            metric_name=cases_metric,
+            refresh_date=datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC),
+            embargo=latest_released_embargo,
+        )
+        CoreTimeSeriesFactory.create_record(
+            metric_name=deaths_metric,
+            refresh_date=latest_refresh_date,
+            embargo=timezone.now() + datetime.timedelta(days=30),
+        )
+        CoreTimeSeriesFactory.create_record(
+            metric_name="COVID-19_testing_PCRcountByDay",
+            refresh_date=datetime.datetime(2024, 4, 4, tzinfo=datetime.UTC),
+            embargo=datetime.datetime(2024, 3, 3, tzinfo=datetime.UTC),
+        )
+
+        # When
+        extracted_timestamps = CoreTimeSeries.objects.find_latest_refresh_date_and_released_embargo_for_metrics(
+            metrics=[cases_metric, deaths_metric]
+        )
+
+        # Then
+        assert extracted_timestamps == (latest_refresh_date, latest_released_embargo)
+
     @pytest.mark.django_db
     def test_query_for_data_returns_latest_records_for_multiple_versions(
         self,
@@ -684,3 +727,424 @@ class TestCoreTimeSeriesManager:
         assert second_in_range_record in core_time_series_queryset
         assert third_in_range_record in core_time_series_queryset
         assert out_of_range_record not in core_time_series_queryset
+
+    @pytest.mark.django_db
+    def test_query_for_data_resolves_latest_records_within_a_single_query(
+        self, django_assert_num_queries
+    ):
+        """
+        Given a multi-year daily `CoreTimeSeries` dataset
+            which has been refreshed across several rounds
+        When `query_for_data()` is called
+            from an instance of the `CoreTimeSeriesManager`
+        Then the latest record for each date is returned
+        And the selection is resolved without additional round trips
+            to the database
+
+        Notes:
+            This guards the number of queries only.
+            It does not measure latency, which depends on
+            the database backend the tests are run against.
+        """
+        # Given
+        template_record = CoreTimeSeriesFactory.create_record(
+            date="2021-01-01", refresh_date="2021-01-01"
+        )
+        start_date = datetime.date(year=2021, month=1, day=1)
+        number_of_dates = 3 * 365
+        refresh_rounds = [
+            timezone.make_aware(datetime.datetime(year=2024, month=1, day=day))
+            for day in (1, 2, 3)
+        ]
+        records = []
+        for day_offset in range(number_of_dates):
+            date = start_date + datetime.timedelta(days=day_offset)
+            # Later rounds only revise the more recent portion of the timeseries
+            for round_index, refresh_date in enumerate(refresh_rounds):
+                if day_offset < round_index * 365:
+                    continue
+                records.append(
+                    CoreTimeSeries(
+                        metric=template_record.metric,
+                        metric_frequency="D",
+                        geography=template_record.geography,
+                        stratum=template_record.stratum,
+                        age=template_record.age,
+                        sex=template_record.sex,
+                        year=date.year,
+                        epiweek=1,
+                        date=date,
+                        metric_value=round_index,
+                        refresh_date=refresh_date,
+                        force_write=True,
+                    )
+                )
+        CoreTimeSeries.objects.bulk_create(records, batch_size=1000)
+        topic_name: str = template_record.metric.topic.name
+        metric_name: str = template_record.metric.name
+
+        # When
+        # The `latest_date` aggregation is the only query
+        # which is executed when the queryset is built
+        with django_assert_num_queries(num=1):
+            retrieved_records = CoreTimeSeries.objects.query_for_data(
+                fields_to_export=["date", "metric_value"],
+                topic=topic_name,
+                metric=metric_name,
+                date_from=start_date,
+                date_to=start_date + datetime.timedelta(days=number_of_dates),
+            )
+
+        # Then
+        # Evaluating the queryset requires exactly 1 more query
+        with django_assert_num_queries(num=1):
+            retrieved_records = list(retrieved_records)
+
+        assert len(retrieved_records) == number_of_dates
+        assert [record["metric_value"] for record in retrieved_records] == (
+            [0] * 365 + [1] * 365 + [2] * 365
+        )
+
+    @pytest.mark.django_db
+    def test_query_for_data_for_series_matches_individual_queries(
+        self, django_assert_num_queries
+    ):
+        """
+        Given `CoreTimeSeries` records for 2 geographies of the same metric
+            which have been refreshed across several rounds
+        When `query_for_data_for_series()` is called
+            from an instance of the `CoreTimeSeriesManager`
+        Then the records for each series are fetched within a single query
+        And they match the records returned by `query_for_data()`
+            for each individual series
+        """
+        # Given
+        dates = FAKE_DATES
+        geography_codes = {"England": "E92000001", "Wales": "W92000004"}
+        geography_names = tuple(geography_codes)
+        for geography_name, geography_code in geography_codes.items():
+            for refresh_date in ("2023-08-10", "2023-08-11"):
+                for date in dates:
+                    CoreTimeSeriesFactory.create_record(
+                        metric_value=len(geography_name) + int(refresh_date[-1]),
+                        geography_name=geography_name,
+                        geography_type_name="Nation",
+                        geography_code=geography_code,
+                        date=date,
+                        refresh_date=refresh_date,
+                    )
+        series = [
+            {
+                "geography": geography_name,
+                "geography_type": "Nation",
+                "stratum": "default",
+                "sex": "all",
+                "age": "all",
+            }
+            for geography_name in geography_names
+        ]
+        query_params = {
+            "fields_to_export": ["date", "metric_value"],
+            "topic": "COVID-19",
+            "metric": "COVID-19_cases_casesByDay",
+            "date_from": dates[0],
+            "date_to": dates[-1],
+        }
+
+        # When
+        with django_assert_num_queries(num=1):
+            results = CoreTimeSeries.objects.query_for_data_for_series(
+                series=series, **query_params
+            )
+
+        # Then
+        assert len(results) == len(series)
+        for individual_series, (records, latest_date) in zip(series, results):
+            expected_queryset = CoreTimeSeries.objects.query_for_data(
+                **query_params, **individual_series
+            )
+            assert records == list(expected_queryset)
+            assert latest_date == expected_queryset.latest_date
+
+    @pytest.mark.django_db
+    def test_query_for_latest_values_by_geography_matches_individual_queries(
+        self, django_assert_num_queries
+    ):
+        """
+        Given `CoreTimeSeries` records for 2 geographies of the same metric
+            which have been refreshed across several rounds
+        When `query_for_latest_values_by_geography()` is called
+            from an instance of the `CoreTimeSeriesManager`
+        Then the latest record for each geography is fetched within a single query
+        And they match the first records returned by `query_for_data()`
+            when ordered by `-date` for each individual geography
+        And geographies without any records are omitted
+        """
+        # Given
+        dates = FAKE_DATES
+        geography_codes = {"England": "E92000001", "Wales": "W92000004"}
+        for geography_name, geography_code in geography_codes.items():
+            for refresh_date in ("2023-08-10", "2023-08-11"):
+                for date in dates[: len(geography_name) - 4]:
+                    CoreTimeSeriesFactory.create_record(
+                        metric_value=len(geography_name) + int(refresh_date[-1]),
+                        geography_name=geography_name,
+                        geography_type_name="Nation",
+                        geography_code=geography_code,
+                        date=date,
+                        refresh_date=refresh_date,
+                    )
+        query_params = {
+            "topic": "COVID-19",
+            "metric": "COVID-19_cases_casesByDay",
+            "date_from": dates[0],
+            "date_to": dates[-1],
+            "geography_type": "Nation",
+            "stratum": "default",
+            "sex": "all",
+            "age": "all",
+        }
+
+        # When
+        with django_assert_num_queries(num=1):
+            latest_values = CoreTimeSeries.objects.query_for_latest_values_by_geography(
+                geographies=[*geography_codes, "Scotland"], **query_params
+            )
+
+        # Then
+        assert set(latest_values) == set(geography_codes)
+        for geography_name, geography_code in geography_codes.items():
+            expected_record = CoreTimeSeries.objects.query_for_data(
+                **query_params, geography=geography_name, field_to_order_by="-date"
+            ).first()
+            assert latest_values[geography_name] == {
+                "geography_code": geography_code,
+                "date": expected_record.date,
+                "metric_value": expected_record.metric_value,
+            }
+
+    @pytest.mark.django_db
+    def test_query_for_data_with_current_view_matches_ranked_records_over_time(
+        self,
+    ):
+        """
+        Given `CoreTimeSeries` records which have been refreshed across 3 rounds
+        And the latest round is under embargo
+        And the current view has been refreshed for the series
+        When `query_for_data()` is called
+            from an instance of the `CoreTimeSeriesManager`
+            with `use_current_view` set to True
+            both before and after the embargo is lifted
+        Then the records match those returned
+            when ranking the latest records as part of the query
+
+        Patches:
+            `mocked_get_embargo_time`: To move the current time
+                past the embargo without refreshing the current view again
+        """
+        # Given
+        dates = FAKE_DATES
+        current_time = timezone.now()
+        embargo_point_in_time = current_time + datetime.timedelta(days=7)
+        for metric_value, refresh_date, embargo, dates_of_round in (
+            (1, "2023-08-10", current_time - datetime.timedelta(days=7), dates),
+            (2, "2023-08-11", current_time - datetime.timedelta(days=1), dates[1:]),
+            (3, "2023-08-12", embargo_point_in_time, dates[:2]),
+        ):
+            for date in dates_of_round:
+                CoreTimeSeriesFactory.create_record(
+                    metric_value=metric_value,
+                    date=date,
+                    refresh_date=refresh_date,
+                    embargo=embargo,
+                )
+        CoreTimeSeries.objects.refresh_current_view(
+            metric="COVID-19_cases_casesByDay",
+            geography="England",
+            geography_type="Nation",
+            geography_code="E92000001",
+            stratum="default",
+            sex="all",
+            age="all",
+        )
+        query_params = {
+            "fields_to_export": ["date", "metric_value"],
+            "topic": "COVID-19",
+            "metric": "COVID-19_cases_casesByDay",
+            "date_from": dates[0],
+            "date_to": dates[-1],
+        }
+
+        for point_in_time, expected_metric_values in (
+            (current_time, [1, 2, 2]),
+            (embargo_point_in_time, [3, 3, 2]),
+        ):
+            with mock.patch(
+                f"{MODULE_PATH}.get_embargo_time", return_value=point_in_time
+            ):
+                # When
+                retrieved_records = CoreTimeSeries.objects.query_for_data(
+                    **query_params, use_current_view=True
+                )
+
+                # Then
+                assert list(retrieved_records) == list(
+                    CoreTimeSeries.objects.query_for_data(**query_params)
+                )
+                assert [
+                    record["metric_value"] for record in retrieved_records
+                ] == expected_metric_values
+
+    @pytest.mark.django_db
+    def test_batched_queries_with_current_view_match_ranked_records(self):
+        """
+        Given `CoreTimeSeries` records for 2 geographies of the same metric
+            which have been refreshed across several rounds
+        And the current view has been refreshed for each series
+        When `query_for_data_for_series()` and `query_for_latest_values_by_geography()`
+            are called from an instance of the `CoreTimeSeriesManager`
+            with `use_current_view` set to True
+        Then the results match those returned
+            when ranking the latest records as part of the query
+        """
+        # Given
+        dates = FAKE_DATES
+        geography_codes = {"England": "E92000001", "Wales": "W92000004"}
+        for geography_name, geography_code in geography_codes.items():
+            for refresh_date in ("2023-08-10", "2023-08-11"):
+                for date in dates[: len(geography_name) - 4]:
+                    CoreTimeSeriesFactory.create_record(
+                        metric_value=len(geography_name) + int(refresh_date[-1]),
+                        geography_name=geography_name,
+                        geography_type_name="Nation",
+                        geography_code=geography_code,
+                        date=date,
+                        refresh_date=refresh_date,
+                    )
+            CoreTimeSeries.objects.refresh_current_view(
+                metric="COVID-19_cases_casesByDay",
+                geography=geography_name,
+                geography_type="Nation",
+                geography_code=geography_code,
+                stratum="default",
+                sex="all",
+                age="all",
+            )
+        series_params = {
+            "geography_type": "Nation",
+            "stratum": "default",
+            "sex": "all",
+            "age": "all",
+        }
+        query_params = {
+            "topic": "COVID-19",
+            "metric": "COVID-19_cases_casesByDay",
+            "date_from": dates[0],
+            "date_to": dates[-1],
+        }
+        series = [
+            {"geography": geography_name, **series_params}
+            for geography_name in geography_codes
+        ]
+
+        # When
+        series_results = CoreTimeSeries.objects.query_for_data_for_series(
+            series=series,
+            fields_to_export=["date", "metric_value"],
+            use_current_view=True,
+            **query_params,
+        )
+        latest_values = CoreTimeSeries.objects.query_for_latest_values_by_geography(
+            geographies=geography_codes,
+            use_current_view=True,
+            **query_params,
+            **series_params,
+        )
+
+        # Then
+        assert series_results == CoreTimeSeries.objects.query_for_data_for_series(
+            series=series, fields_to_export=["date", "metric_value"], **query_params
+        )
+        assert latest_values == (
+            CoreTimeSeries.objects.query_for_latest_values_by_geography(
+                geographies=geography_codes, **query_params, **series_params
+            )
+        )
+
+    @pytest.mark.django_db
+    def test_queries_with_current_view_rank_public_and_non_public_records_together(
+        self,
+    ):
+        """
+        Given public and non-public `CoreTimeSeries` records for the same dates
+            which have been refreshed at different times
+        And the current view has been refreshed for the series
+        When `query_for_data()` and `query_for_data_for_series()` are called
+            from an instance of the `CoreTimeSeriesManager`
+            with global permission sets
+            and with `use_current_view` set to True
+        Then only the latest record is returned for each date
+        And the results match those returned
+            when ranking the latest records as part of the query
+        """
+        # Given
+        dates = FAKE_DATES
+        for metric_value, refresh_date, is_public in (
+            (1, "2023-08-10", True),
+            (2, "2023-08-11", False),
+            (3, "2023-08-12", True),
+        ):
+            for date in dates[metric_value - 1 :]:
+                CoreTimeSeriesFactory.create_record(
+                    metric_value=metric_value,
+                    date=date,
+                    refresh_date=refresh_date,
+                    is_public=is_public,
+                )
+        CoreTimeSeries.objects.refresh_current_view(
+            metric="COVID-19_cases_casesByDay",
+            geography="England",
+            geography_type="Nation",
+            geography_code="E92000001",
+            stratum="default",
+            sex="all",
+            age="all",
+        )
+        permission_sets = {
+            "permission_sets": [],
+            "summary": {"has_global_access": True},
+        }
+        query_params = {
+            "fields_to_export": ["date", "metric_value"],
+            "topic": "COVID-19",
+            "metric": "COVID-19_cases_casesByDay",
+            "date_from": dates[0],
+            "date_to": dates[-1],
+            "permission_sets": permission_sets,
+        }
+        series = [
+            {
+                "geography": "England",
+                "geography_type": "Nation",
+                "stratum": "default",
+                "sex": "all",
+                "age": "all",
+            }
+        ]
+
+        # When
+        retrieved_records = CoreTimeSeries.objects.query_for_data(
+            **query_params, use_current_view=True
+        )
+        series_results = CoreTimeSeries.objects.query_for_data_for_series(
+            series=series, **query_params, use_current_view=True
+        )
+
+        # Then
+        assert [record["metric_value"] for record in retrieved_records] == [1, 2, 3]
+        assert list(retrieved_records) == list(
+            CoreTimeSeries.objects.query_for_data(**query_params)
+        )
+        assert series_results == CoreTimeSeries.objects.query_for_data_for_series(
+            series=series, **query_params
+        )
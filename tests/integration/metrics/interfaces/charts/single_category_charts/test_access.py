@@ -44,14 +44,44 @@ class TestChartsInterface:
         # Then
         assert isinstance(encoded_figure, str)
 
+    def test_create_optimized_svg_minifies_svg_by_default(
+        self, fake_chart_request_params: ChartRequestParams
+    ):
+        """
+        Given a Plotly Figure
+        When `create_optimized_svg()` is called from an instance of the `ChartsInterface`
+        And the format is svg
+        Then the markup which is only used by interactive charts is stripped
+        """
+        # Given
+        fake_chart_request_params.file_format = "svg"
+        fake_chart_request_params.plots[0].chart_type = (
+            ChartTypes.line_multi_coloured.value
+        )
+        charts_interface = ChartsInterface(
+            chart_request_params=fake_chart_request_params,
+        )
+
+        figure = plotly.graph_objs.Figure()
+
+        # When
+        figure_image: str = charts_interface.create_optimized_svg(figure=figure)
+
+        # Then
+        assert figure_image.startswith("<svg")
+        assert figure_image.endswith("</svg>")
+        assert "class=" not in figure_image
+
+    @mock.patch("config.CHART_SVG_OPTIMIZER", "scour")
     @mock.patch("scour.scour.scourString")
-    def test_scour_is_called(
+    def test_scour_is_called_when_selected(
         self,
         mocked_scourstring: mock.MagicMock,
         fake_chart_request_params: ChartRequestParams,
     ):
         """
         Given a Plotly Figure
+        And the `CHART_SVG_OPTIMIZER` config value is set to "scour"
         When `create_optimized_svg()` is called from an instance of the `ChartsInterface`
         And the format is svg
         Then `scour.scourString` from the scour library is called
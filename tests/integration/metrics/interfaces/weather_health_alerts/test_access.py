@@ -1,12 +1,18 @@
-import pytest
+import datetime
 
+import pytest
+from django.utils import timezone
 
+from metrics.data.in_memory_models.geography_relationships.region_geography_codes import (
+    REGION_LOOKUP,
+)
 from metrics.interfaces.weather_health_alerts.access import (
     WeatherHealthAlertsInterface,
     WEATHER_HEALTH_ALERT_DETAILED_DATA,
     get_summary_data_for_alerts,
 )
 
+from tests.factories.metrics.headline import CoreHeadlineFactory
 from tests.fakes.factories.metrics.headline_factory import FakeCoreHeadlineFactory
 from tests.fakes.managers.headline_manager import FakeCoreHeadlineManager
 
@@ -63,3 +69,51 @@ class TestAccessGetSummaryDataForAlerts:
 
         # then
         assert len(summary_data) == len(expected_output)
+
+    @pytest.mark.django_db
+    def test_summary_data_for_all_regions_is_built_within_a_single_query(
+        self, django_assert_num_queries
+    ):
+        """
+        Given a live alert for each region
+            which has superseded a previous alert
+        When the `get_summary_data_for_alerts()` method is called
+            for all the regions on the heat alert map
+        Then the summary data is built within a single query
+        And the latest alert is used for each region
+        """
+        # Given
+        topic = "Heat-alert"
+        metric = "heat-alert_headline_matrixNumber"
+        current_time = timezone.now()
+        for geography_name, geography_code in REGION_LOOKUP.items():
+            for metric_value, refresh_date in (
+                (11, current_time - datetime.timedelta(days=2)),
+                (12, current_time - datetime.timedelta(days=1)),
+            ):
+                CoreHeadlineFactory.create_record(
+                    metric_value=metric_value,
+                    topic=topic,
+                    metric=metric,
+                    geography=geography_name,
+                    geography_type="Government Office Region",
+                    geography_code=geography_code,
+                    refresh_date=refresh_date,
+                    period_start=current_time - datetime.timedelta(days=1),
+                    period_end=current_time + datetime.timedelta(days=7),
+                    embargo=None,
+                )
+        geography_data = [
+            (geography_code, geography_name)
+            for geography_name, geography_code in REGION_LOOKUP.items()
+        ]
+
+        # When
+        with django_assert_num_queries(num=1):
+            summary_data = get_summary_data_for_alerts(
+                geography_data=geography_data, topic=topic, metric=metric
+            )
+
+        # Then
+        assert len(summary_data) == len(geography_data)
+        assert {alert["status"] for alert in summary_data} == {"Amber"}
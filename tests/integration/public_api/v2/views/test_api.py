@@ -6,7 +6,11 @@ import pytest
 from requests.models import Response
 from rest_framework.test import RequestsClient
 
-from metrics.data.models.api_models import APITimeSeries
+from metrics.data.models.api_models import APITimeSeries, APITimeSeriesDimension
+
+
+def _sort_key(result: dict) -> tuple[str, str]:
+    return result["date"], result["stratum"]
 
 
 class TestPublicAPINestedLinkViewsV2:
@@ -27,7 +31,7 @@ class TestPublicAPINestedLinkViewsV2:
         **kwargs,
     ) -> APITimeSeries:
         day = kwargs.pop("day", 1)
-        return APITimeSeries.objects.create(
+        api_time_series = APITimeSeries.objects.create(
             metric_value=123,
             epiweek=1,
             year=2023,
@@ -35,6 +39,24 @@ class TestPublicAPINestedLinkViewsV2:
             is_public=True,
             **kwargs,
         )
+        # The ingestion adds the dimensions of each record to the catalogue
+        APITimeSeriesDimension.objects.record_dimensions(
+            api_time_series=[api_time_series]
+        )
+        # and refreshes the current view of each series it writes to
+        APITimeSeries.objects.refresh_current_view(
+            theme=api_time_series.theme,
+            sub_theme=api_time_series.sub_theme,
+            topic=api_time_series.topic,
+            metric=api_time_series.metric,
+            geography=api_time_series.geography,
+            geography_type=api_time_series.geography_type,
+            geography_code=api_time_series.geography_code,
+            stratum=api_time_series.stratum,
+            sex=api_time_series.sex,
+            age=api_time_series.age,
+        )
+        return api_time_series
 
     @staticmethod
     def _build_expected_response_fields(
@@ -266,7 +288,8 @@ class TestPublicAPINestedLinkViewsV2:
         assert response_data["count"] == expected_matching_time_series_count
 
         # Check that API returns a link to the next page of the paginated data
-        assert response_data["next"] == f"{target_url}?page=2"
+        # which by default is keyed on an opaque cursor
+        assert response_data["next"].startswith(f"{target_url}?cursor=")
         assert response_data["previous"] is None
 
         # Check that by default, the page size is returned as 5
@@ -380,6 +403,83 @@ class TestPublicAPINestedLinkViewsV2:
             assert result["sex"] == sex != other_sex
             assert result["age"] == age != other_age
 
+    @pytest.mark.django_db
+    def test_cursor_pages_match_page_number_pages(self):
+        """
+        Given a number of `APITimeSeries` records across 2 strata
+        And a number of those records which have been superseded
+        When each page is requested by following the `next` cursor links
+        Then the same records are returned as when paginating by page number
+        And the `previous` cursor link returns the records before the page
+        """
+        # Given
+        client = RequestsClient()
+        hierarchy = {
+            "theme": "infectious_disease",
+            "sub_theme": "respiratory",
+            "topic": "COVID-19",
+            "geography_type": "Nation",
+            "geography": "England",
+            "metric": "COVID-19_deaths_ONSByDay",
+        }
+        for day in range(1, 8):
+            for stratum in ("default", "other"):
+                for refresh_day in (1, 2):
+                    self._setup_api_time_series(
+                        **hierarchy,
+                        stratum=stratum,
+                        day=day,
+                        month=refresh_day,
+                        refresh_date=datetime.datetime(
+                            2023, 2, refresh_day, tzinfo=datetime.UTC
+                        ),
+                    )
+
+        target_url = (
+            f"{self.api_base_path}"
+            f"themes/{hierarchy['theme']}/"
+            f"sub_themes/{hierarchy['sub_theme']}/"
+            f"topics/{hierarchy['topic']}/"
+            f"geography_types/{hierarchy['geography_type']}/"
+            f"geographies/{hierarchy['geography']}/"
+            f"metrics/{hierarchy['metric']}"
+        )
+        page_number_response_data: dict = client.get(
+            target_url, params={"page_size": 365, "pagination": "page"}
+        ).json()
+
+        # When
+        cursor_pages: list[dict] = []
+        url: str | None = target_url
+        while url:
+            cursor_pages.append(client.get(url, params={"skip_count": "true"}).json())
+            url = cursor_pages[-1]["next"]
+
+        # Then
+        cursor_results: list[dict] = [
+            result for page in cursor_pages for result in page["results"]
+        ]
+        # Records on the same date are only ordered by `id` when paginating by cursor
+        assert sorted(cursor_results, key=_sort_key) == sorted(
+            page_number_response_data["results"], key=_sort_key
+        )
+        assert [result["date"] for result in cursor_results] == sorted(
+            result["date"] for result in cursor_results
+        )
+        assert len(cursor_results) == 14
+        # Check that only the latest record is returned for each date
+        assert {result["month"] for result in cursor_results} == {2}
+        assert all(page["count"] is None for page in cursor_pages)
+
+        previous_page: dict = client.get(cursor_pages[1]["previous"]).json()
+        assert previous_page["results"] == cursor_pages[0]["results"]
+        # The dates before the final page span more than a page of 2 records
+        smaller_previous_page: dict = client.get(
+            cursor_pages[-1]["previous"], params={"page_size": 2}
+        ).json()
+        assert smaller_previous_page["results"] == cursor_pages[-2]["results"][-2:]
+        assert client.get(target_url).json()["count"] == 14
+
     @pytest.mark.django_db
     def test_root_view(self):
         """
@@ -6,7 +6,7 @@ import pytest
 from requests.models import Response
 from rest_framework.test import RequestsClient
 
-from metrics.data.models.api_models import APITimeSeries
+from metrics.data.models.api_models import APITimeSeries, APITimeSeriesDimension
 
 
 class TestPublicAPINestedLinkViews:
@@ -27,13 +27,31 @@ class TestPublicAPINestedLinkViews:
         **kwargs,
     ) -> APITimeSeries:
         day = kwargs.pop("day", 1)
-        return APITimeSeries.objects.create(
+        api_time_series = APITimeSeries.objects.create(
             metric_value=123,
             epiweek=1,
             year=2023,
             date=datetime.date(year=2023, month=1, day=day),
             **kwargs,
         )
+        # The ingestion adds the dimensions of each record to the catalogue
+        APITimeSeriesDimension.objects.record_dimensions(
+            api_time_series=[api_time_series]
+        )
+        # and refreshes the current view of each series it writes to
+        APITimeSeries.objects.refresh_current_view(
+            theme=api_time_series.theme,
+            sub_theme=api_time_series.sub_theme,
+            topic=api_time_series.topic,
+            metric=api_time_series.metric,
+            geography=api_time_series.geography,
+            geography_type=api_time_series.geography_type,
+            geography_code=api_time_series.geography_code,
+            stratum=api_time_series.stratum,
+            sex=api_time_series.sex,
+            age=api_time_series.age,
+        )
+        return api_time_series
 
     @staticmethod
     def _build_expected_response_fields(
@@ -379,6 +397,54 @@ class TestPublicAPINestedLinkViews:
             assert result["sex"] == sex != other_sex
             assert result["age"] == age != other_age
 
+    @pytest.mark.django_db
+    def test_can_opt_into_cursor_pagination(self):
+        """
+        Given a number of `APITimeSeries` records
+        When the final public API endpoint is hit
+            with the `pagination` query parameter set to `cursor`
+        Then the response holds a `next` link keyed on a cursor
+        And following that link returns the remaining records
+        """
+        # Given
+        client = RequestsClient()
+        hierarchy = {
+            "theme": "infectious_disease",
+            "sub_theme": "respiratory",
+            "topic": "COVID-19",
+            "geography_type": "Nation",
+            "geography": "England",
+            "metric": "COVID-19_deaths_ONSByDay",
+        }
+        for day in range(1, 8):
+            self._setup_api_time_series(**hierarchy, day=day)
+
+        target_url = (
+            f"{self.api_base_path}"
+            f"themes/{hierarchy['theme']}/"
+            f"sub_themes/{hierarchy['sub_theme']}/"
+            f"topics/{hierarchy['topic']}/"
+            f"geography_types/{hierarchy['geography_type']}/"
+            f"geographies/{hierarchy['geography']}/"
+            f"metrics/{hierarchy['metric']}"
+        )
+
+        # When
+        response: Response = client.get(target_url, params={"pagination": "cursor"})
+
+        # Then
+        response_data: dict = response.json()
+        assert response_data["count"] == 7
+        assert "cursor=" in response_data["next"]
+        assert len(response_data["results"]) == 5
+
+        next_response_data: dict = client.get(response_data["next"]).json()
+        assert [result["date"] for result in next_response_data["results"]] == [
+            "2023-01-06",
+            "2023-01-07",
+        ]
+        assert next_response_data["next"] is None
+
     @pytest.mark.django_db
     def test_root_view(self):
         """
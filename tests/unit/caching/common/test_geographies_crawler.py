@@ -57,7 +57,8 @@ class TestGeographiesAPICrawler:
                 "geographies": [{"name": x} for x in fake_geography_names],
             }
         ]
-        fake_response = mock.Mock(data=fake_response_data)
+        fake_response = mock.Mock()
+        fake_response.json.return_value = fake_response_data
 
         spy_internal_api_client = mock.Mock()
         spy_internal_api_client.hit_geographies_list_endpoint.return_value = (
@@ -55,7 +55,11 @@ class TestAreaSelectorOrchestrator:
 
         # Then
         expected_calls = [
-            mock.call(page=mocked_page, geography_combinations=geography_combinations)
+            mock.call(
+                page=mocked_page,
+                geography_combinations=geography_combinations,
+                cache_generation=None,
+            )
             for mocked_page in mocked_pages
         ]
         spy_parallel_process_all_geography_combinations_for_page.assert_has_calls(
@@ -95,7 +99,8 @@ class TestAreaSelectorOrchestrator:
 
         # Then
         zipped_args = [
-            (geography_data, page_id) for geography_data in geography_data_combinations
+            (geography_data, page_id, None)
+            for geography_data in geography_data_combinations
         ]
         spy_call_with_star_map_multiprocessing.assert_called_once_with(
             func=AreaSelectorOrchestrator.process_geography_page_combination,
@@ -146,3 +151,41 @@ class TestAreaSelectorOrchestrator:
         spy_private_api_crawler.process_all_sections_in_page(
             page=page_model, geography_data=geography_data
         )
+
+    @mock.patch.object(TopicPage, "objects")
+    @mock.patch.object(PrivateAPICrawler, "create_crawler_for_default_cache")
+    def test_process_geography_page_combination_passes_cache_generation_to_crawler(
+        self,
+        spy_create_crawler_for_default_cache: mock.MagicMock,
+        mocked_topic_page_manager: mock.MagicMock,
+    ):
+        """
+        Given an ID of a `Page`, an enriched `GeographyData` model
+            and the generation of the default cache being hydrated
+        When `process_geography_page_combination()` is called
+            from the `AreaSelectorOrchestrator` class
+        Then the `PrivateAPICrawler` is created for that generation
+
+        Patches:
+            `spy_create_crawler_for_default_cache`: For the main assertion
+            `mocked_topic_page_manager`: To remove the side effect
+                of having to retrieve the `TopicPage` from the database
+
+        """
+        # Given
+        geography_data = GeographyData(
+            name="Croydon", geography_type="Lower Tier Local Authority"
+        )
+        fake_cache_generation = "gen123abc"
+
+        # When
+        AreaSelectorOrchestrator.process_geography_page_combination(
+            geography_data=geography_data,
+            page_id=1,
+            cache_generation=fake_cache_generation,
+        )
+
+        # Then
+        spy_create_crawler_for_default_cache.assert_called_once_with(
+            cache_generation=fake_cache_generation
+        )
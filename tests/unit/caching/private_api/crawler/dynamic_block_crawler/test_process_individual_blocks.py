@@ -5,6 +5,7 @@ import pytest
 from caching.private_api.crawler.dynamic_block_crawler import DynamicContentBlockCrawler
 from caching.private_api.crawler.request_payload_builder import RequestPayloadBuilder
 from cms.dynamic_content.global_filter_deconstruction import GlobalFilterCMSBlockParser
+from metrics.interfaces.charts.common.shared_data import _shared_chart_data_ctx
 
 
 class TestDynamicContentBlockCrawlerProcessBlocks:
@@ -284,6 +285,41 @@ class TestCrawlerProcessIndividualBlocks:
             calls=expected_calls, any_order=True
         )
 
+    def test_process_chart_block_shares_chart_data_across_both_widths(
+        self,
+        example_chart_block: dict[str, str | list[dict]],
+        dynamic_content_block_crawler_with_mocked_internal_api_client: DynamicContentBlockCrawler,
+    ):
+        """
+        Given a chart block
+        When `process_chart_block()` is called
+            from an instance of `DynamicContentBlockCrawler`
+        Then the requests for both chart widths are made
+            within the same `share_chart_data_across_widths()` block
+        And the shared chart data is discarded afterwards
+        """
+        # Given
+        spy_internal_api_client: mock.Mock = (
+            dynamic_content_block_crawler_with_mocked_internal_api_client._internal_api_client
+        )
+        shared_chart_data_during_requests = []
+        spy_internal_api_client.hit_charts_endpoint.side_effect = (
+            lambda data: shared_chart_data_during_requests.append(
+                _shared_chart_data_ctx.get()
+            )
+        )
+
+        # When
+        dynamic_content_block_crawler_with_mocked_internal_api_client.process_chart_block(
+            chart_block=example_chart_block,
+        )
+
+        # Then
+        first_request_data, second_request_data = shared_chart_data_during_requests
+        assert first_request_data is not None
+        assert first_request_data is second_request_data
+        assert _shared_chart_data_ctx.get() is None
+
     def test_process_download_for_chart_block_delegates_calls_successfully(
         self,
         example_chart_block: dict[str, str | list[dict]],
@@ -16,6 +16,25 @@ class TestPrivateAPICrawlerCreate:
 
         # Then
         assert not crawler._internal_api_client.reserved_namespace
+        assert crawler._internal_api_client.cache_generation is None
+
+    def test_create_crawler_for_default_cache_with_cache_generation(self):
+        """
+        Given the generation of the default cache being hydrated
+        When the `create_crawler_for_default_cache`
+            class method is called from the `PrivateAPICrawler` class
+        Then the `InternalAPIClient` is set to write to that generation
+        """
+        # Given
+        fake_cache_generation = "gen123abc"
+
+        # When
+        crawler = PrivateAPICrawler.create_crawler_for_default_cache(
+            cache_generation=fake_cache_generation
+        )
+
+        # Then
+        assert crawler._internal_api_client.cache_generation == fake_cache_generation
 
     def test_create_crawler_for_reserved_cache(self):
         """
@@ -65,9 +65,100 @@ class TestPrivateAPICrawlerGetAllDownloads:
             mock.call(chart_block=chart_card["value"], file_format="csv")
             for chart_card in faked_two_row_columns
         ]
-        spy_process_download_for_chart_block.assert_has_calls(expected_calls)
+        spy_process_download_for_chart_block.assert_has_calls(
+            expected_calls, any_order=True
+        )
         assert len(downloads) == len(faked_two_row_columns)
 
+    @mock.patch.object(DynamicContentBlockCrawler, "process_download_for_chart_block")
+    @mock.patch.object(
+        DynamicContentBlockCrawler, "build_download_request_data_for_chart_block"
+    )
+    def test_get_download_for_chart_block_reuses_previous_content(
+        self,
+        mocked_build_download_request_data_for_chart_block: mock.MagicMock,
+        spy_process_download_for_chart_block: mock.MagicMock,
+    ):
+        """
+        Given a `PrivateAPICrawler` with a `DownloadMemberIndex`
+        And the download has not changed since the previous archive
+        When `get_download_for_chart_block()` is called
+        Then the content is taken from the previous archive
+        And no request is made to the downloads endpoint
+
+        Patches:
+            `mocked_build_download_request_data_for_chart_block`:
+                To remove the side effect of building the request payload
+            `spy_process_download_for_chart_block`: For the main assertion
+        """
+        # Given
+        mocked_download_member_index = mock.Mock()
+        mocked_download_member_index.get_previous_content.return_value = b"a,b"
+        private_api_crawler = PrivateAPICrawler(
+            internal_api_client=mock.MagicMock(),
+            download_member_index=mocked_download_member_index,
+        )
+        mocked_chart_block = mock.Mock()
+
+        # When
+        download = private_api_crawler.get_download_for_chart_block(
+            chart_block=mocked_chart_block, filename="cases.csv", file_format="csv"
+        )
+
+        # Then
+        spy_process_download_for_chart_block.assert_not_called()
+        mocked_download_member_index.build_fingerprint.assert_called_once_with(
+            request_data=mocked_build_download_request_data_for_chart_block.return_value
+        )
+        assert download == {
+            "name": "cases.csv",
+            "content": b"a,b",
+            "fingerprint": mocked_download_member_index.build_fingerprint.return_value,
+        }
+
+    @mock.patch.object(DynamicContentBlockCrawler, "process_download_for_chart_block")
+    @mock.patch.object(
+        DynamicContentBlockCrawler, "build_download_request_data_for_chart_block"
+    )
+    def test_get_download_for_chart_block_fetches_changed_content(
+        self,
+        mocked_build_download_request_data_for_chart_block: mock.MagicMock,
+        spy_process_download_for_chart_block: mock.MagicMock,
+    ):
+        """
+        Given a `PrivateAPICrawler` with a `DownloadMemberIndex`
+        And the download has changed since the previous archive
+        When `get_download_for_chart_block()` is called
+        Then the content is requested from the downloads endpoint
+
+        Patches:
+            `mocked_build_download_request_data_for_chart_block`:
+                To remove the side effect of building the request payload
+            `spy_process_download_for_chart_block`: For the main assertion
+        """
+        # Given
+        mocked_download_member_index = mock.Mock()
+        mocked_download_member_index.get_previous_content.return_value = None
+        private_api_crawler = PrivateAPICrawler(
+            internal_api_client=mock.MagicMock(),
+            download_member_index=mocked_download_member_index,
+        )
+        mocked_chart_block = mock.Mock()
+
+        # When
+        download = private_api_crawler.get_download_for_chart_block(
+            chart_block=mocked_chart_block, filename="cases.csv", file_format="csv"
+        )
+
+        # Then
+        spy_process_download_for_chart_block.assert_called_once_with(
+            chart_block=mocked_chart_block, file_format="csv"
+        )
+        assert (
+            download["content"]
+            == spy_process_download_for_chart_block.return_value.getvalue.return_value
+        )
+
     @mock.patch.object(PrivateAPICrawler, "get_downloads_from_chart_row_columns")
     def test_get_downloads_from_chart_cards_delegates_calls_correctly(
         self,
@@ -181,3 +272,40 @@ class TestPrivateAPICrawlerGetAllDownloads:
         # Then
         expected_log = f"Page {fake_pages[0]} does not contain chart data"
         assert expected_log in caplog.text
+
+    @mock.patch.object(PrivateAPICrawler, "get_downloads_from_page_sections")
+    def test_iterate_all_downloads_processes_pages_lazily(
+        self,
+        spy_get_downloads_from_page_sections: mock.MagicMock,
+        private_api_crawler_with_mocked_internal_api_client: PrivateAPICrawler,
+    ):
+        """
+        Given a list of pages
+        When the first item is taken from `iterate_all_downloads()`
+        Then only the first page has been processed for downloads
+
+        Patches:
+            `spy_get_downloads_from_page_sections`: For the main assertion
+        """
+        # Given
+        fake_pages = [
+            FakeTopicPageFactory._build_page(page_name="covid_19"),
+            FakeTopicPageFactory._build_page(page_name="influenza"),
+        ]
+
+        # When
+        downloads = (
+            private_api_crawler_with_mocked_internal_api_client.iterate_all_downloads(
+                pages=fake_pages, file_format="csv"
+            )
+        )
+        first_page_downloads = next(downloads)
+
+        # Then
+        spy_get_downloads_from_page_sections.assert_called_once_with(
+            sections=fake_pages[0].body.raw_data, file_format="csv"
+        )
+        assert (
+            first_page_downloads["downloads"]
+            == spy_get_downloads_from_page_sections.return_value
+        )
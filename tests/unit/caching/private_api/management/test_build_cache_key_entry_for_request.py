@@ -147,6 +147,34 @@ class TestCacheManagementBuildCacheKeyEntryForRequest:
         # Then
         assert cache_key == f"{RESERVED_NAMESPACE_KEY_PREFIX}-some-key"
 
+    @mock.patch.object(CacheManagement, "_build_standalone_key_for_request")
+    def test_build_cache_entry_key_for_cache_generation(
+        self,
+        mocked_build_standalone_key_for_request: mock.MagicMock,
+        cache_management_with_in_memory_cache: CacheManagement,
+    ):
+        """
+        Given a mocked POST request and a cache generation
+        When `build_cache_entry_key_for_request()` is called
+            from an instance of `CacheManagement`
+        Then cache key is returned with the cache generation prefix
+        """
+        # Given
+        mocked_build_standalone_key_for_request.return_value = "some-key"
+        mocked_request = mock.Mock(method="POST")
+
+        # When
+        cache_key: str = (
+            cache_management_with_in_memory_cache.build_cache_entry_key_for_request(
+                request=mocked_request,
+                is_reserved_namespace=False,
+                cache_generation="gen123abc",
+            )
+        )
+
+        # Then
+        assert cache_key == "gen123abc-some-key"
+
     @pytest.mark.parametrize(
         "invalid_http_method",
         (
@@ -1,6 +1,8 @@
+import gzip
 from unittest import mock
 
 import pytest
+from django.http import HttpResponse
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
@@ -9,6 +11,8 @@ from caching.private_api.management import (
     CacheMissError,
 )
 
+MODULE_PATH = "caching.private_api.management"
+
 
 class TestCacheManagementCRUDOperations:
     def test_retrieve_item_from_cache_delegates_call_to_client(self):
@@ -80,15 +84,19 @@ class TestCacheManagementCRUDOperations:
 
     # Tests for saving items via the cache client
 
+    @mock.patch.object(CacheManagement, "_build_cached_response")
     @mock.patch.object(CacheManagement, "_render_response")
     def test_save_item_in_cache_delegates_call_to_client(
-        self, spy_render_response: mock.MagicMock
+        self,
+        spy_render_response: mock.MagicMock,
+        spy_build_cached_response: mock.MagicMock,
     ):
         """
         Given a cache entry key and a response
         When `save_item_in_cache()` is called
             from an instance of `CacheManagement`
         Then the call is delegated to the `put()` method on the underlying client
+        And the rendered response is saved as a `CachedResponse`
         """
         # Given
         mocked_cache_client = mock.Mock()
@@ -104,11 +112,14 @@ class TestCacheManagementCRUDOperations:
         # Then
         assert saved_response == spy_render_response.return_value
         spy_render_response.assert_called_once_with(response=mocked_response)
+        spy_build_cached_response.assert_called_once_with(
+            response=spy_render_response.return_value
+        )
 
         expected_calls = [
             mock.call(
                 cache_entry_key=fake_cache_entry_key,
-                value=spy_render_response.return_value,
+                value=spy_build_cached_response.return_value,
                 timeout=123,
             )
         ]
@@ -124,12 +135,12 @@ class TestCacheManagementCRUDOperations:
         Then the call is delegated to the `put()` method on the underlying client
         """
         # Given
-        mocked_response = mock.Mock(headers={"Content-Type": "application/json"})
+        fake_response = Response(data={"value": 123})
         fake_cache_entry_key = "abc123"
 
         # When
         cache_management_with_in_memory_cache.save_item_in_cache(
-            cache_entry_key=fake_cache_entry_key, item=mocked_response, timeout=None
+            cache_entry_key=fake_cache_entry_key, item=fake_response, timeout=None
         )
 
         # Then
@@ -213,12 +224,12 @@ class TestCacheManagementCRUDOperations:
             by calling `retrieve_response_from_cache()`
         """
         # Given
-        mocked_item = mock.Mock(headers={"Content-Type": "application/json"})
+        fake_item = Response(data={"value": 123})
         fake_cache_entry_key = "abc"
 
         # When
         cache_management_with_in_memory_cache.save_item_in_cache(
-            cache_entry_key=fake_cache_entry_key, item=mocked_item, timeout=None
+            cache_entry_key=fake_cache_entry_key, item=fake_item, timeout=None
         )
 
         # Then
@@ -227,7 +238,87 @@ class TestCacheManagementCRUDOperations:
                 cache_entry_key=fake_cache_entry_key
             )
         )
-        assert retrieved_response == mocked_item
+        assert retrieved_response.status_code == fake_item.status_code
+        assert retrieved_response["Content-Type"] == "application/json"
+        assert retrieved_response.content == fake_item.content
+
+    @mock.patch(f"{MODULE_PATH}.config")
+    def test_save_and_retrieve_compressed_item_for_client_which_accepts_gzip(
+        self,
+        mocked_config: mock.MagicMock,
+        cache_management_with_in_memory_cache: CacheManagement,
+    ):
+        """
+        Given a response which is larger than the compression threshold
+        When the response is saved via `save_item_in_cache()`
+        And then retrieved via `retrieve_item_from_cache()`
+            for a client which accepts gzip
+        Then the compressed body is returned as it is
+        And the `Content-Encoding` header is set to "gzip"
+
+        Patches:
+            `mocked_config`: To set the compression threshold
+        """
+        # Given
+        mocked_config.PRIVATE_API_CACHE_COMPRESSION_THRESHOLD_IN_BYTES = 10
+        fake_item = HttpResponse(content=b"a" * 100, content_type="text/csv")
+        fake_cache_entry_key = "abc"
+        cache_management_with_in_memory_cache.save_item_in_cache(
+            cache_entry_key=fake_cache_entry_key, item=fake_item, timeout=None
+        )
+
+        # When
+        retrieved_response = (
+            cache_management_with_in_memory_cache.retrieve_item_from_cache(
+                cache_entry_key=fake_cache_entry_key, accepts_gzip=True
+            )
+        )
+
+        # Then
+        assert retrieved_response["Content-Encoding"] == "gzip"
+        assert retrieved_response["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(retrieved_response.content) == fake_item.content
+
+    @mock.patch(f"{MODULE_PATH}.config")
+    def test_save_and_retrieve_compressed_item_for_client_which_does_not_accept_gzip(
+        self,
+        mocked_config: mock.MagicMock,
+        cache_management_with_in_memory_cache: CacheManagement,
+    ):
+        """
+        Given a response which is larger than the compression threshold
+        When the response is saved via `save_item_in_cache()`
+        And then retrieved via `retrieve_item_from_cache()`
+            for a client which does not accept gzip
+        Then the decompressed body is returned
+        And the `Content-Encoding` header is not set
+
+        Patches:
+            `mocked_config`: To set the compression threshold
+        """
+        # Given
+        mocked_config.PRIVATE_API_CACHE_COMPRESSION_THRESHOLD_IN_BYTES = 10
+        fake_item = HttpResponse(content=b"a" * 100, content_type="text/csv")
+        fake_item["Content-Disposition"] = 'attachment; filename="abc.csv"'
+        fake_cache_entry_key = "abc"
+        cache_management_with_in_memory_cache.save_item_in_cache(
+            cache_entry_key=fake_cache_entry_key, item=fake_item, timeout=None
+        )
+
+        # When
+        retrieved_response = (
+            cache_management_with_in_memory_cache.retrieve_item_from_cache(
+                cache_entry_key=fake_cache_entry_key, accepts_gzip=False
+            )
+        )
+
+        # Then
+        assert not retrieved_response.has_header("Content-Encoding")
+        assert retrieved_response.content == fake_item.content
+        assert (
+            retrieved_response["Content-Disposition"]
+            == fake_item["Content-Disposition"]
+        )
 
     def test_clear(self):
         """
@@ -248,3 +339,130 @@ class TestCacheManagementCRUDOperations:
 
         # Then
         spy_client.clear.assert_called_once()
+
+
+class TestCacheManagementLeases:
+    def test_lease_can_only_be_acquired_once(
+        self, cache_management_with_in_memory_cache: CacheManagement
+    ):
+        """
+        Given a cache entry key
+        When `acquire_lease()` is called twice
+            from an instance of `CacheManagement`
+        Then a token is only returned for the 1st call
+        """
+        # Given
+        fake_cache_entry_key = "abc"
+
+        # When
+        first_token = cache_management_with_in_memory_cache.acquire_lease(
+            cache_entry_key=fake_cache_entry_key, timeout=30
+        )
+        second_token = cache_management_with_in_memory_cache.acquire_lease(
+            cache_entry_key=fake_cache_entry_key, timeout=30
+        )
+
+        # Then
+        assert first_token is not None
+        assert second_token is None
+        assert cache_management_with_in_memory_cache.is_lease_held(
+            cache_entry_key=fake_cache_entry_key
+        )
+
+    def test_release_lease_only_releases_lease_for_matching_token(
+        self, cache_management_with_in_memory_cache: CacheManagement
+    ):
+        """
+        Given a lease which has been acquired
+        When `release_lease()` is called with a different token
+            and then with the acquired token
+        Then the lease is only released by the acquired token
+        """
+        # Given
+        fake_cache_entry_key = "abc"
+        token = cache_management_with_in_memory_cache.acquire_lease(
+            cache_entry_key=fake_cache_entry_key, timeout=30
+        )
+
+        # When / Then
+        cache_management_with_in_memory_cache.release_lease(
+            cache_entry_key=fake_cache_entry_key, token="not-the-token"
+        )
+        assert cache_management_with_in_memory_cache.is_lease_held(
+            cache_entry_key=fake_cache_entry_key
+        )
+
+        cache_management_with_in_memory_cache.release_lease(
+            cache_entry_key=fake_cache_entry_key, token=token
+        )
+        assert not cache_management_with_in_memory_cache.is_lease_held(
+            cache_entry_key=fake_cache_entry_key
+        )
+
+    def test_save_item_and_stale_copy_in_cache(
+        self, cache_management_with_in_memory_cache: CacheManagement
+    ):
+        """
+        Given an item saved via `save_item_and_stale_copy_in_cache()`
+        When `retrieve_item_from_cache()` and `retrieve_stale_item_from_cache()`
+            are called from an instance of `CacheManagement`
+        Then the item and the stale copy are both returned
+        And the returned `CachedResponse` holds the content of the item
+        """
+        # Given
+        fake_item = HttpResponse(content=b"abc", content_type="text/csv")
+        fake_cache_entry_key = "abc"
+
+        # When
+        cached_response = (
+            cache_management_with_in_memory_cache.save_item_and_stale_copy_in_cache(
+                cache_entry_key=fake_cache_entry_key,
+                item=fake_item,
+                timeout=None,
+                stale_timeout=None,
+            )
+        )
+
+        # Then
+        assert cached_response.decompress_body() == fake_item.content
+        for retrieve_function in (
+            cache_management_with_in_memory_cache.retrieve_item_from_cache,
+            cache_management_with_in_memory_cache.retrieve_stale_item_from_cache,
+        ):
+            retrieved_item = retrieve_function(cache_entry_key=fake_cache_entry_key)
+            assert retrieved_item.content == fake_item.content
+
+    def test_stale_copy_is_shared_between_generations(
+        self, cache_management_with_in_memory_cache: CacheManagement
+    ):
+        """
+        Given an item saved via `save_item_and_stale_copy_in_cache()`
+            with a key for a previous generation of the default cache
+        When `retrieve_stale_item_from_cache()` is called
+            with the key for the same request in a new generation
+        Then the stale copy is returned
+        And the item itself is not returned for the new generation
+        """
+        # Given
+        fake_item = HttpResponse(content=b"abc", content_type="text/csv")
+        cache_management_with_in_memory_cache.save_item_and_stale_copy_in_cache(
+            cache_entry_key="gen111111111111-abc",
+            item=fake_item,
+            timeout=None,
+            stale_timeout=None,
+        )
+        new_generation_cache_entry_key = "gen222222222222-abc"
+
+        # When
+        retrieved_item = (
+            cache_management_with_in_memory_cache.retrieve_stale_item_from_cache(
+                cache_entry_key=new_generation_cache_entry_key
+            )
+        )
+
+        # Then
+        assert retrieved_item.content == fake_item.content
+        with pytest.raises(CacheMissError):
+            cache_management_with_in_memory_cache.retrieve_item_from_cache(
+                cache_entry_key=new_generation_cache_entry_key
+            )
@@ -0,0 +1,295 @@
+from unittest import mock
+
+import pytest
+from django.http import HttpResponse
+
+from caching.internal_api_client import CACHE_GENERATION_HEADER_KEY
+from caching.private_api.client import InMemoryCacheClient
+from caching.private_api.generations import CacheGenerationState
+from caching.private_api.management import ACTIVE_GENERATION_KEY, CacheManagement
+
+MODULE_PATH = "caching.private_api.management"
+
+
+class TestCacheManagementGenerations:
+    def test_get_active_generation_returns_none_when_never_activated(
+        self, cache_management_with_in_memory_cache: CacheManagement
+    ):
+        """
+        Given a cache in which a generation has never been activated
+        When `get_active_generation()` is called
+            from an instance of `CacheManagement`
+        Then None is returned
+        """
+        # Given / When
+        active_generation = (
+            cache_management_with_in_memory_cache.get_active_generation()
+        )
+
+        # Then
+        assert active_generation is None
+
+    def test_started_generation_is_only_served_once_activated(
+        self, cache_management_with_in_memory_cache: CacheManagement
+    ):
+        """
+        Given a previously activated generation
+        When `start_new_generation()` is called
+            and then `activate_generation()` is called for the new generation
+        Then the previous generation remains active until the new one is activated
+        """
+        # Given
+        previous_generation: str = (
+            cache_management_with_in_memory_cache.start_new_generation()
+        )
+        cache_management_with_in_memory_cache.activate_generation(
+            cache_generation=previous_generation
+        )
+
+        # When
+        new_generation: str = (
+            cache_management_with_in_memory_cache.start_new_generation()
+        )
+
+        # Then
+        assert new_generation != previous_generation
+        assert (
+            cache_management_with_in_memory_cache.get_active_generation()
+            == previous_generation
+        )
+
+        cache_management_with_in_memory_cache.activate_generation(
+            cache_generation=new_generation
+        )
+        assert (
+            cache_management_with_in_memory_cache.get_active_generation()
+            == new_generation
+        )
+
+    def test_start_new_generation_clears_entries_saved_before_first_generation(
+        self, cache_management_with_in_memory_cache: CacheManagement
+    ):
+        """
+        Given an item saved without a generation
+            before any generation has been activated
+        When `start_new_generation()` is called
+            from an instance of `CacheManagement`
+        Then the item is cleared from the cache
+        """
+        # Given
+        fake_item = HttpResponse(content=b"abc", content_type="text/csv")
+        cache_management_with_in_memory_cache.save_item_in_cache(
+            cache_entry_key="abc", item=fake_item, timeout=None
+        )
+
+        # When
+        cache_management_with_in_memory_cache.start_new_generation()
+
+        # Then
+        assert (
+            cache_management_with_in_memory_cache._client.get(cache_entry_key="abc")
+            is None
+        )
+
+    def test_start_new_generation_does_not_clear_cache_once_generation_is_active(
+        self, cache_management_with_in_memory_cache: CacheManagement
+    ):
+        """
+        Given a previously activated generation
+        And an item saved in that generation
+        When `start_new_generation()` is called
+            from an instance of `CacheManagement`
+        Then the cache is not cleared
+        And the item of the active generation is kept
+        """
+        # Given
+        active_generation: str = (
+            cache_management_with_in_memory_cache.start_new_generation()
+        )
+        cache_management_with_in_memory_cache.activate_generation(
+            cache_generation=active_generation
+        )
+        fake_cache_entry_key = f"{active_generation}-abc"
+        fake_item = HttpResponse(content=b"abc", content_type="text/csv")
+        cache_management_with_in_memory_cache.save_item_in_cache(
+            cache_entry_key=fake_cache_entry_key, item=fake_item, timeout=None
+        )
+
+        # When
+        with mock.patch.object(
+            cache_management_with_in_memory_cache, "clear"
+        ) as spy_clear:
+            cache_management_with_in_memory_cache.start_new_generation()
+
+        # Then
+        spy_clear.assert_not_called()
+        assert (
+            cache_management_with_in_memory_cache._client.get(
+                cache_entry_key=fake_cache_entry_key
+            )
+            is not None
+        )
+
+    def test_get_generation_for_request_honours_header_for_pending_generation(
+        self, cache_management_with_in_memory_cache: CacheManagement
+    ):
+        """
+        Given a pending generation
+        And a request which carries the pending generation in its headers
+        When `get_generation_for_request()` is called
+            from an instance of `CacheManagement`
+        Then the pending generation is returned
+        """
+        # Given
+        pending_generation: str = (
+            cache_management_with_in_memory_cache.start_new_generation()
+        )
+        mocked_request = mock.Mock(
+            headers={CACHE_GENERATION_HEADER_KEY: pending_generation}
+        )
+
+        # When
+        cache_generation = (
+            cache_management_with_in_memory_cache.get_generation_for_request(
+                request=mocked_request
+            )
+        )
+
+        # Then
+        assert cache_generation == pending_generation
+
+    @pytest.mark.parametrize("headers", [{}, {CACHE_GENERATION_HEADER_KEY: "gen999"}])
+    def test_get_generation_for_request_falls_back_to_active_generation(
+        self,
+        headers: dict[str, str],
+        cache_management_with_in_memory_cache: CacheManagement,
+    ):
+        """
+        Given an active generation
+        And a request which does not carry the pending generation in its headers
+        When `get_generation_for_request()` is called
+            from an instance of `CacheManagement`
+        Then the active generation is returned
+        """
+        # Given
+        active_generation: str = (
+            cache_management_with_in_memory_cache.start_new_generation()
+        )
+        cache_management_with_in_memory_cache.activate_generation(
+            cache_generation=active_generation
+        )
+        cache_management_with_in_memory_cache.start_new_generation()
+        mocked_request = mock.Mock(headers=headers)
+
+        # When
+        cache_generation = (
+            cache_management_with_in_memory_cache.get_generation_for_request(
+                request=mocked_request
+            )
+        )
+
+        # Then
+        assert cache_generation == active_generation
+
+    def test_save_item_in_cache_records_key_for_generation_key(self):
+        """
+        Given a cache entry key which belongs to a generation
+        When `save_item_in_cache()` is called with a `timeout` of None
+        Then the item is saved without a timeout
+        And the key is recorded in a slot for its generation
+            within the same write
+        """
+        # Given
+        spy_client = mock.Mock()
+        spy_client.incr.return_value = 100
+        cache_management = CacheManagement(in_memory=True, client=spy_client)
+        fake_item = HttpResponse(content=b"abc", content_type="text/csv")
+        fake_cache_entry_key = "gen123abc-abc"
+
+        # When
+        cache_management.save_item_in_cache(
+            cache_entry_key=fake_cache_entry_key, item=fake_item, timeout=None
+        )
+
+        # Then
+        spy_client.put.assert_not_called()
+        spy_client.set_many.assert_called_once_with(
+            entries={
+                fake_cache_entry_key: mock.ANY,
+                "keys-of-gen123abc-1": fake_cache_entry_key,
+            },
+            timeout=None,
+        )
+
+    def test_activate_generation_expires_entries_of_previous_generation(self):
+        """
+        Given items saved in an active generation and in a pending generation
+        When `activate_generation()` is called for the pending generation
+        Then the items of the previous generation
+            are given the generation timeout
+        And the items of the new generation are left without a timeout
+        """
+        # Given
+        in_memory_cache_client = InMemoryCacheClient()
+        cache_management = CacheManagement(
+            in_memory=True, client=in_memory_cache_client
+        )
+        fake_item = HttpResponse(content=b"abc", content_type="text/csv")
+
+        previous_generation: str = cache_management.start_new_generation()
+        cache_management.activate_generation(cache_generation=previous_generation)
+        previous_generation_keys = [f"{previous_generation}-{i}" for i in range(3)]
+        for cache_entry_key in previous_generation_keys:
+            cache_management.save_item_in_cache(
+                cache_entry_key=cache_entry_key, item=fake_item, timeout=None
+            )
+
+        new_generation: str = cache_management.start_new_generation()
+        cache_management.save_item_in_cache(
+            cache_entry_key=f"{new_generation}-0", item=fake_item, timeout=None
+        )
+
+        # When
+        with (
+            mock.patch.object(
+                in_memory_cache_client, "touch", wraps=in_memory_cache_client.touch
+            ) as spy_touch,
+            mock.patch(f"{MODULE_PATH}.config") as mocked_config,
+        ):
+            mocked_config.CACHE_GENERATION_TIMEOUT_SECONDS = 123
+            cache_management.activate_generation(cache_generation=new_generation)
+
+        # Then
+        touched_keys = {
+            call.kwargs["cache_entry_key"]
+            for call in spy_touch.call_args_list
+            if call.kwargs["timeout"] == 123
+        }
+        assert set(previous_generation_keys) <= touched_keys
+        assert f"{new_generation}-0" not in touched_keys
+        assert cache_management.get_active_generation() == new_generation
+
+    def test_get_active_generation_is_held_in_process(self):
+        """
+        Given a `CacheManagement` with a `CacheGenerationState`
+            which holds onto the active generation pointer
+        When `get_active_generation()` is called a number of times
+        Then the pointer is only read from the cache once
+        """
+        # Given
+        spy_client = mock.Mock()
+        spy_client.get.return_value = "gen123"
+        cache_management = CacheManagement(
+            in_memory=True,
+            client=spy_client,
+            generation_state=CacheGenerationState(pointer_timeout=60),
+        )
+
+        # When
+        active_generations = [
+            cache_management.get_active_generation() for _ in range(3)
+        ]
+
+        # Then
+        assert active_generations == ["gen123"] * 3
+        spy_client.get.assert_called_once_with(cache_entry_key=ACTIVE_GENERATION_KEY)
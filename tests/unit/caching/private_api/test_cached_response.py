@@ -0,0 +1,135 @@
+import gzip
+from unittest import mock
+
+import pytest
+from django.http import HttpResponse
+
+from caching.private_api.cached_response import (
+    CachedResponse,
+    build_cached_response,
+    build_http_response,
+    request_accepts_gzip,
+)
+
+
+class TestBuildCachedResponse:
+    def test_does_not_compress_body_below_threshold(self):
+        """
+        Given a response which is smaller than the compression threshold
+        When `build_cached_response()` is called
+        Then the body is held as it is
+        """
+        # Given
+        fake_response = HttpResponse(content=b"abc", content_type="text/csv")
+
+        # When
+        cached_response: CachedResponse = build_cached_response(
+            response=fake_response, compression_threshold_in_bytes=1024
+        )
+
+        # Then
+        assert cached_response.body == b"abc"
+        assert cached_response.content_encoding is None
+        assert cached_response.content_type == "text/csv"
+        assert cached_response.status_code == fake_response.status_code
+
+    def test_compresses_body_at_threshold(self):
+        """
+        Given a response which is at the compression threshold
+        When `build_cached_response()` is called
+        Then the body is gzip compressed
+        """
+        # Given
+        fake_content = b"a" * 100
+        fake_response = HttpResponse(content=fake_content, content_type="text/csv")
+
+        # When
+        cached_response: CachedResponse = build_cached_response(
+            response=fake_response, compression_threshold_in_bytes=100
+        )
+
+        # Then
+        assert cached_response.content_encoding == "gzip"
+        assert gzip.decompress(cached_response.body) == fake_content
+
+    def test_only_keeps_selected_headers(self):
+        """
+        Given a response with a `Content-Disposition` and an arbitrary header
+        When `build_cached_response()` is called
+        Then only the `Content-Disposition` header is kept
+        """
+        # Given
+        fake_response = HttpResponse(content=b"abc", content_type="text/csv")
+        fake_response["Content-Disposition"] = 'attachment; filename="abc.csv"'
+        fake_response["X-Arbitrary-Header"] = "abc"
+
+        # When
+        cached_response: CachedResponse = build_cached_response(
+            response=fake_response, compression_threshold_in_bytes=1024
+        )
+
+        # Then
+        assert cached_response.headers == (
+            ("Content-Disposition", 'attachment; filename="abc.csv"'),
+        )
+
+
+class TestBuildHttpResponse:
+    def test_uncompressed_body_is_served_as_it_is(self):
+        """
+        Given a `CachedResponse` which is not compressed
+        When `build_http_response()` is called for a client which accepts gzip
+        Then the body is served without a `Content-Encoding` header
+        """
+        # Given
+        cached_response = CachedResponse(
+            status_code=200,
+            content_type="application/json",
+            headers=(),
+            body=b"{}",
+        )
+
+        # When
+        response: HttpResponse = build_http_response(
+            cached_response=cached_response, accepts_gzip=True
+        )
+
+        # Then
+        assert response.content == b"{}"
+        assert response["Content-Type"] == "application/json"
+        assert not response.has_header("Content-Encoding")
+        assert not response.has_header("Vary")
+
+
+class TestRequestAcceptsGzip:
+    @pytest.mark.parametrize(
+        "accept_encoding, expected_result",
+        (
+            ["gzip", True],
+            ["gzip, deflate, br", True],
+            ["br;q=1.0, GZIP;q=0.5", True],
+            ["*", True],
+            ["gzip;q=0", False],
+            ["*, gzip;q=0", False],
+            ["br", False],
+            ["", False],
+            ["gzip;q=abc", False],
+            ["gzip;q=abc, *", True],
+        ),
+    )
+    def test_returns_correct_result_for_accept_encoding_header(
+        self, accept_encoding: str, expected_result: bool
+    ):
+        """
+        Given a request with an `Accept-Encoding` header
+        When `request_accepts_gzip()` is called
+        Then the correct result is returned
+        """
+        # Given
+        mocked_request = mock.Mock(headers={"Accept-Encoding": accept_encoding})
+
+        # When
+        accepts_gzip: bool = request_accepts_gzip(request=mocked_request)
+
+        # Then
+        assert accepts_gzip is expected_result
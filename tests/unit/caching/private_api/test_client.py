@@ -1,6 +1,7 @@
 from unittest import mock
 
 from caching.private_api.client import CacheClient, InMemoryCacheClient
+from caching.private_api.local_cache import LocalCache
 
 MODULE_PATH = "caching.private_api.client"
 
@@ -88,6 +89,52 @@ class TestCacheClientForDefaultCache:
 
 
 class TestCacheClientForReservedCache:
+    @mock.patch(f"{MODULE_PATH}.caches")
+    def test_incr_creates_counter_and_delegates_call_for_default_cache(
+        self, mocked_caches: mock.MagicMock
+    ):
+        """
+        Given a cache entry key for the default cache
+        When `incr()` is called from an instance of the `CacheClient`
+        Then the counter is added without a timeout if it does not already exist
+        And the increment is delegated to the underlying default cache
+        """
+        # Given
+        spy_default_cache = mock.Mock()
+        caches = {"default": spy_default_cache, "reserved": mock.Mock()}
+        mocked_caches.__getitem__.side_effect = caches.__getitem__
+        cache_client = CacheClient()
+
+        # When
+        counter: int = cache_client.incr(cache_entry_key="abc", delta=100)
+
+        # Then
+        spy_default_cache.add.assert_called_once_with(key="abc", value=0, timeout=None)
+        spy_default_cache.incr.assert_called_once_with(key="abc", delta=100)
+        assert counter == spy_default_cache.incr.return_value
+
+    @mock.patch(f"{MODULE_PATH}.caches")
+    def test_touch_delegates_call_for_default_cache(
+        self, mocked_caches: mock.MagicMock
+    ):
+        """
+        Given a cache entry key for the default cache
+        When `touch()` is called from an instance of the `CacheClient`
+        Then the call is delegated to the underlying default cache
+        """
+        # Given
+        spy_default_cache = mock.Mock()
+        caches = {"default": spy_default_cache, "reserved": mock.Mock()}
+        mocked_caches.__getitem__.side_effect = caches.__getitem__
+        cache_client = CacheClient()
+
+        # When
+        is_touched: bool = cache_client.touch(cache_entry_key="abc", timeout=123)
+
+        # Then
+        spy_default_cache.touch.assert_called_once_with(key="abc", timeout=123)
+        assert is_touched == spy_default_cache.touch.return_value
+
     @mock.patch(f"{MODULE_PATH}.caches")
     def test_get_delegates_call_for_reserved_cache(self, mocked_caches: mock.MagicMock):
         """
@@ -144,6 +191,36 @@ class TestCacheClientForReservedCache:
             key=fake_cache_entry_key, value=mocked_value, timeout=timeout
         )
 
+    @mock.patch(f"{MODULE_PATH}.caches")
+    def test_add_delegates_call_for_reserved_cache(self, mocked_caches: mock.MagicMock):
+        """
+        Given a cache entry key for the reserved cache
+        When `add()` is called from an instance of the `CacheClient`
+        Then the call is delegated
+            to the underlying reserved cache
+        """
+        # Given
+        spy_default_cache = mock.Mock()
+        spy_reserved_cache = mock.Mock()
+        caches = {"default": spy_default_cache, "reserved": spy_reserved_cache}
+        mocked_caches.__getitem__.side_effect = caches.__getitem__
+
+        fake_cache_entry_key = "ns2-abc-lease"
+        mocked_value = mock.Mock()
+        cache_client = CacheClient()
+
+        # When
+        is_added: bool = cache_client.add(
+            cache_entry_key=fake_cache_entry_key, value=mocked_value, timeout=30
+        )
+
+        # Then
+        spy_default_cache.add.assert_not_called()
+        spy_reserved_cache.add.assert_called_once_with(
+            key=fake_cache_entry_key, value=mocked_value, timeout=30
+        )
+        assert is_added == spy_reserved_cache.add.return_value
+
     @mock.patch(f"{MODULE_PATH}.caches")
     def test_clear_for_reserved_cache(self, mocked_caches: mock.MagicMock):
         """
@@ -169,6 +246,207 @@ class TestCacheClientForReservedCache:
         spy_reserved_cache.clear.assert_called_once()
 
 
+class TestCacheClientBatchOperations:
+    @mock.patch(f"{MODULE_PATH}.caches")
+    def test_set_many_splits_entries_between_default_and_reserved_caches(
+        self, mocked_caches: mock.MagicMock
+    ):
+        """
+        Given entries for both the default and the reserved cache
+        When `set_many()` is called from an instance of the `CacheClient`
+        Then each cache is written to with 1 call
+            containing only the entries for that cache
+
+        Patches:
+            `mocked_caches`: To spy on the underlying caches
+        """
+        # Given
+        spy_default_cache = mock.Mock()
+        spy_reserved_cache = mock.Mock()
+        caches = {"default": spy_default_cache, "reserved": spy_reserved_cache}
+        mocked_caches.__getitem__.side_effect = caches.__getitem__
+        entries = {"abc": 1, "ns2-def": 2, "ghi": 3}
+        cache_client = CacheClient()
+
+        # When
+        cache_client.set_many(entries=entries, timeout=123)
+
+        # Then
+        spy_default_cache.set_many.assert_called_once_with(
+            data={"abc": 1, "ghi": 3}, timeout=123
+        )
+        spy_reserved_cache.set_many.assert_called_once_with(
+            data={"ns2-def": 2}, timeout=123
+        )
+
+    @mock.patch(f"{MODULE_PATH}.caches")
+    def test_get_many_merges_entries_from_default_and_reserved_caches(
+        self, mocked_caches: mock.MagicMock
+    ):
+        """
+        Given keys for both the default and the reserved cache
+        When `get_many()` is called from an instance of the `CacheClient`
+        Then each cache is read from with 1 call
+        And the entries from both caches are returned together
+
+        Patches:
+            `mocked_caches`: To spy on the underlying caches
+        """
+        # Given
+        spy_default_cache = mock.Mock()
+        spy_default_cache.get_many.return_value = {"abc": 1}
+        spy_reserved_cache = mock.Mock()
+        spy_reserved_cache.get_many.return_value = {"ns2-def": 2}
+        caches = {"default": spy_default_cache, "reserved": spy_reserved_cache}
+        mocked_caches.__getitem__.side_effect = caches.__getitem__
+        cache_client = CacheClient()
+
+        # When
+        retrieved_entries = cache_client.get_many(
+            cache_entry_keys=["abc", "ns2-def", "ghi"]
+        )
+
+        # Then
+        spy_default_cache.get_many.assert_called_once_with(keys=["abc", "ghi"])
+        spy_reserved_cache.get_many.assert_called_once_with(keys=["ns2-def"])
+        assert retrieved_entries == {"abc": 1, "ns2-def": 2}
+
+
+class TestCacheClientWithLocalCache:
+    @mock.patch(f"{MODULE_PATH}.get_local_cache")
+    @mock.patch(f"{MODULE_PATH}.caches")
+    def test_get_returns_value_from_local_cache_without_hitting_shared_cache(
+        self, mocked_caches: mock.MagicMock, mocked_get_local_cache: mock.MagicMock
+    ):
+        """
+        Given a local cache which contains the entry
+        When `get()` is called from an instance of the `CacheClient`
+            with `use_local_cache` set to True
+        Then the value is returned from the local cache
+        And the entry is not fetched from the shared cache
+
+        Patches:
+            `mocked_caches`: To spy on the shared cache
+            `mocked_get_local_cache`: To provide the local cache
+        """
+        # Given
+        spy_default_cache = mock.Mock()
+        mocked_caches.__getitem__.return_value = spy_default_cache
+        local_cache = LocalCache(
+            max_size_in_bytes=1024, timeout=60, generation_check_interval=60
+        )
+        local_cache.sync_generation(generation=None)
+        local_cache.put(cache_entry_key="abc", value="value")
+        mocked_get_local_cache.return_value = local_cache
+        cache_client = CacheClient()
+
+        # When
+        returned_entry = cache_client.get(cache_entry_key="abc", use_local_cache=True)
+
+        # Then
+        assert returned_entry == "value"
+        spy_default_cache.get.assert_not_called()
+
+    @mock.patch(f"{MODULE_PATH}.get_local_cache")
+    @mock.patch(f"{MODULE_PATH}.caches")
+    def test_get_copies_value_from_shared_cache_into_local_cache(
+        self, mocked_caches: mock.MagicMock, mocked_get_local_cache: mock.MagicMock
+    ):
+        """
+        Given an empty local cache
+        When `get()` is called from an instance of the `CacheClient`
+            with `use_local_cache` set to True
+        Then the value is fetched from the shared cache
+        And the value is copied into the local cache
+
+        Patches:
+            `mocked_caches`: To provide the shared cache
+            `mocked_get_local_cache`: To provide the local cache
+        """
+        # Given
+        shared_cache = {"local-cache-generation": "abc123", "abc": "value"}
+        mocked_default_cache = mock.Mock()
+        mocked_default_cache.get.side_effect = lambda key, default: shared_cache.get(
+            key, default
+        )
+        mocked_caches.__getitem__.return_value = mocked_default_cache
+        local_cache = LocalCache(
+            max_size_in_bytes=1024, timeout=60, generation_check_interval=60
+        )
+        mocked_get_local_cache.return_value = local_cache
+        cache_client = CacheClient()
+
+        # When
+        returned_entry = cache_client.get(cache_entry_key="abc", use_local_cache=True)
+
+        # Then
+        assert returned_entry == "value"
+        assert local_cache.get(cache_entry_key="abc") == "value"
+
+    @mock.patch(f"{MODULE_PATH}.get_local_cache")
+    @mock.patch(f"{MODULE_PATH}.caches")
+    def test_clear_writes_new_local_cache_generation(
+        self, mocked_caches: mock.MagicMock, mocked_get_local_cache: mock.MagicMock
+    ):
+        """
+        Given a `CacheClient` for the default cache
+        When `clear()` is called from the client
+        Then a new local cache generation token is written to the shared cache
+        And the local cache of this process is cleared
+
+        Patches:
+            `mocked_caches`: To spy on the shared cache
+            `mocked_get_local_cache`: To spy on the local cache
+        """
+        # Given
+        spy_default_cache = mock.Mock()
+        mocked_caches.__getitem__.return_value = spy_default_cache
+        spy_local_cache = mock.Mock()
+        mocked_get_local_cache.return_value = spy_local_cache
+        cache_client = CacheClient(is_reserved_namespace=False)
+
+        # When
+        cache_client.clear()
+
+        # Then
+        spy_default_cache.set.assert_called_once_with(
+            key="local-cache-generation", value=mock.ANY, timeout=None
+        )
+        spy_local_cache.clear.assert_called_once()
+
+    @mock.patch(f"{MODULE_PATH}.get_local_cache")
+    @mock.patch(f"{MODULE_PATH}.caches")
+    def test_delete_removes_entry_from_local_cache(
+        self, mocked_caches: mock.MagicMock, mocked_get_local_cache: mock.MagicMock
+    ):
+        """
+        Given a `CacheClient` for the default cache
+        When `delete()` is called from the client
+        Then the entry is deleted from the shared cache
+        And the entry is deleted from the local cache of this process
+
+        Patches:
+            `mocked_caches`: To spy on the shared cache
+            `mocked_get_local_cache`: To spy on the local cache
+        """
+        # Given
+        spy_default_cache = mock.Mock()
+        mocked_caches.__getitem__.return_value = spy_default_cache
+        spy_local_cache = mock.Mock()
+        mocked_get_local_cache.return_value = spy_local_cache
+        cache_client = CacheClient(is_reserved_namespace=False)
+        fake_cache_entry_key = "abc123"
+
+        # When
+        cache_client.delete(cache_entry_key=fake_cache_entry_key)
+
+        # Then
+        spy_default_cache.delete.assert_called_once_with(key=fake_cache_entry_key)
+        spy_local_cache.delete.assert_called_once_with(
+            cache_entry_key=fake_cache_entry_key
+        )
+
+
 class TestInMemoryCacheClient:
     def test_put_stores_given_value(self):
         """
@@ -249,3 +527,80 @@ class TestInMemoryCacheClient:
 
         # Then
         assert not in_memory_cache_client._cache
+
+    def test_add_only_stores_value_for_new_key(self):
+        """
+        Given an entry which already exists in the cache
+        When `add()` is called from an instance of the `InMemoryCacheClient`
+            for the same key and for a new key
+        Then the existing entry is left in place
+        And the new entry is added
+        """
+        # Given
+        existing_value = mock.Mock()
+        in_memory_cache_client = InMemoryCacheClient()
+        in_memory_cache_client._cache = {"abc": existing_value}
+
+        # When
+        is_existing_key_added: bool = in_memory_cache_client.add(
+            cache_entry_key="abc", value=mock.Mock()
+        )
+        is_new_key_added: bool = in_memory_cache_client.add(
+            cache_entry_key="def", value=mock.Mock()
+        )
+
+        # Then
+        assert not is_existing_key_added
+        assert is_new_key_added
+        assert in_memory_cache_client._cache["abc"] == existing_value
+        assert "def" in in_memory_cache_client._cache
+
+    def test_delete_removes_given_key(self):
+        """
+        Given an entry which already exists in the cache
+        When `delete()` is called from an instance of the `InMemoryCacheClient`
+        Then the entry is removed from the cache
+        """
+        # Given
+        in_memory_cache_client = InMemoryCacheClient()
+        in_memory_cache_client._cache = {"abc": mock.Mock()}
+
+        # When
+        in_memory_cache_client.delete(cache_entry_key="abc")
+
+        # Then
+        assert not in_memory_cache_client._cache
+
+    def test_get_many_returns_values_previously_added_via_set_many(self):
+        """
+        Given entries which have been added via the `set_many()` method
+        When `get_many()` is called from an instance of the `InMemoryCacheClient`
+        Then only the entries for the keys which were found are returned
+        """
+        # Given
+        in_memory_cache_client = InMemoryCacheClient()
+        in_memory_cache_client.set_many(entries={"abc": 1, "def": 2}, timeout=None)
+
+        # When
+        retrieved_entries = in_memory_cache_client.get_many(
+            cache_entry_keys=["abc", "xyz"]
+        )
+
+        # Then
+        assert retrieved_entries == {"abc": 1}
+
+    def test_incr_starts_counter_from_zero(self):
+        """
+        Given no existing counter
+        When `incr()` is called twice from an instance of the `InMemoryCacheClient`
+        Then the counter is incremented from 0
+        """
+        # Given
+        in_memory_cache_client = InMemoryCacheClient()
+
+        # When
+        in_memory_cache_client.incr(cache_entry_key="abc", delta=2)
+        counter: int = in_memory_cache_client.incr(cache_entry_key="abc", delta=3)
+
+        # Then
+        assert counter == 5
@@ -0,0 +1,129 @@
+from caching.private_api.cached_response import CachedResponse
+from caching.private_api.coalescing import (
+    InFlightCalculations,
+    RequestCoalescing,
+    RequestCoalescingMetrics,
+)
+
+
+class TestRequestCoalescingMetrics:
+    def test_record_increments_count_for_outcome(self):
+        """
+        Given an instance of `RequestCoalescingMetrics`
+        When `record()` is called for a number of outcomes
+        Then the counts returned by `snapshot()` reflect each outcome
+        """
+        # Given
+        request_coalescing_metrics = RequestCoalescingMetrics()
+
+        # When
+        request_coalescing_metrics.record(outcome="waited", cache_entry_key="abc")
+        request_coalescing_metrics.record(outcome="waited", cache_entry_key="abc")
+        request_coalescing_metrics.record(outcome="coalesced", cache_entry_key="abc")
+
+        # Then
+        snapshot: dict[str, int] = request_coalescing_metrics.snapshot()
+        assert snapshot["waited"] == 2
+        assert snapshot["coalesced"] == 1
+        assert snapshot["calculated"] == 0
+
+    def test_reset_sets_counts_back_to_zero(self):
+        """
+        Given an instance of `RequestCoalescingMetrics` with recorded outcomes
+        When `reset()` is called
+        Then all the counts are set back to 0
+        """
+        # Given
+        request_coalescing_metrics = RequestCoalescingMetrics()
+        request_coalescing_metrics.record(outcome="calculated", cache_entry_key="abc")
+
+        # When
+        request_coalescing_metrics.reset()
+
+        # Then
+        assert not any(request_coalescing_metrics.snapshot().values())
+
+
+class TestRequestCoalescing:
+    def test_bounded_wait_timeout_is_capped_at_lease_timeout(self):
+        """
+        Given a `RequestCoalescing` config with a `wait_timeout`
+            which is longer than the `lease_timeout`
+        When the `bounded_wait_timeout` property is called
+        Then the `lease_timeout` is returned
+        """
+        # Given
+        request_coalescing = RequestCoalescing(lease_timeout=10, wait_timeout=60)
+
+        # When
+        bounded_wait_timeout: float = request_coalescing.bounded_wait_timeout
+
+        # Then
+        assert bounded_wait_timeout == 10
+
+
+class TestInFlightCalculations:
+    def test_join_only_starts_1_calculation_per_cache_entry_key(self):
+        """
+        Given an instance of `InFlightCalculations`
+        When `join()` is called twice for the same cache entry key
+        Then only the 1st call starts the calculation
+        And both calls are given the same `InFlightCalculation`
+        """
+        # Given
+        in_flight_calculations = InFlightCalculations()
+
+        # When
+        first_calculation, first_is_calculating_thread = in_flight_calculations.join(
+            cache_entry_key="abc"
+        )
+        second_calculation, second_is_calculating_thread = in_flight_calculations.join(
+            cache_entry_key="abc"
+        )
+
+        # Then
+        assert first_is_calculating_thread
+        assert not second_is_calculating_thread
+        assert first_calculation is second_calculation
+
+    def test_finish_hands_response_to_waiters_and_ends_calculation(self):
+        """
+        Given an `InFlightCalculation` which has been joined
+        When `finish()` is called with a `CachedResponse`
+        Then the `CachedResponse` is returned to the waiters
+        And the next call to `join()` starts a new calculation
+        """
+        # Given
+        in_flight_calculations = InFlightCalculations()
+        in_flight_calculation, _ = in_flight_calculations.join(cache_entry_key="abc")
+        cached_response = CachedResponse(
+            status_code=200, content_type="text/csv", headers=(), body=b"abc"
+        )
+
+        # When
+        in_flight_calculations.finish(
+            cache_entry_key="abc", cached_response=cached_response
+        )
+
+        # Then
+        assert in_flight_calculation.is_finished
+        assert in_flight_calculation.wait(timeout=0) == cached_response
+        _, is_calculating_thread = in_flight_calculations.join(cache_entry_key="abc")
+        assert is_calculating_thread
+
+    def test_wait_returns_none_when_calculation_has_not_finished(self):
+        """
+        Given an `InFlightCalculation` which has not finished
+        When `wait()` is called with a `timeout` of 0
+        Then None is returned
+        """
+        # Given
+        in_flight_calculations = InFlightCalculations()
+        in_flight_calculation, _ = in_flight_calculations.join(cache_entry_key="abc")
+
+        # When
+        cached_response = in_flight_calculation.wait(timeout=0)
+
+        # Then
+        assert cached_response is None
+        assert not in_flight_calculation.is_finished
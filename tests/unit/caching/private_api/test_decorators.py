@@ -1,16 +1,29 @@
+import threading
 from unittest import mock
 
 from caching.internal_api_client import (
     CACHE_FORCE_REFRESH_HEADER_KEY,
     CACHE_RESERVED_NAMESPACE_HEADER_KEY,
 )
+from caching.private_api.cached_response import CachedResponse
+from caching.private_api.client import InMemoryCacheClient
+from caching.private_api.coalescing import (
+    IN_FLIGHT_CALCULATIONS,
+    REQUEST_COALESCING_METRICS,
+    InFlightCalculation,
+    RequestCoalescing,
+)
 from caching.private_api.decorators import (
     _calculate_response_and_save_in_cache,
+    _calculate_response_and_save_with_stale_copy,
     _calculate_response_from_view,
+    _coalesce_response_calculation,
     _retrieve_response_from_cache_or_calculate,
+    _wait_for_in_flight_calculation,
     cache_response,
 )
-from caching.private_api.management import CacheMissError
+from caching.private_api.management import CacheManagement, CacheMissError
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework.response import Response
 
 MODULE_PATH = "caching.private_api.decorators"
@@ -365,6 +378,663 @@ class TestCalculateResponseAndSaveInCache:
         spy_cache_management.save_item_in_cache.assert_not_called()
         assert response == spy_calculate_response_from_view.return_value
 
+    @mock.patch(f"{MODULE_PATH}._calculate_response_from_view")
+    def test_does_not_save_streaming_response(
+        self, mocked_calculate_response_from_view: mock.MagicMock
+    ):
+        """
+        Given a view which returns a `StreamingHttpResponse`
+        When `_calculate_response_and_save_in_cache()` is called
+        Then the response is returned without being saved in the cache
+
+        Patches:
+            `mocked_calculate_response_from_view`: To return a streaming response
+        """
+        # Given
+        streaming_response = StreamingHttpResponse(iter(["a,b\n", "1,2\n"]))
+        mocked_calculate_response_from_view.return_value = streaming_response
+        spy_cache_management = mock.Mock()
+
+        # When
+        response = _calculate_response_and_save_in_cache(
+            mock.Mock(),
+            123,
+            spy_cache_management,
+            "abc",
+            mock.Mock(),
+        )
+
+        # Then
+        spy_cache_management.save_item_in_cache.assert_not_called()
+        assert response is streaming_response
+
+
+class TestRetrieveResponseFromCacheOrCalculateWithRequestCoalescing:
+    @mock.patch(f"{MODULE_PATH}._coalesce_response_calculation")
+    def test_delegates_cache_miss_to_coalesce_response_calculation(
+        self, spy_coalesce_response_calculation: mock.MagicMock
+    ):
+        """
+        Given a mocked request which will miss the cache
+        And a `RequestCoalescing` config
+        When `_retrieve_response_from_cache_or_calculate()` is called
+        Then the call is delegated to `_coalesce_response_calculation()`
+
+        Patches:
+            `spy_coalesce_response_calculation`: For the main assertion
+        """
+        # Given
+        mocked_request = mock.MagicMock(method="POST")
+        mocked_view_function = mock.Mock()
+        mocked_cache_management = mock.Mock()
+        mocked_cache_management.retrieve_item_from_cache.side_effect = [CacheMissError]
+        mocked_args = [mock.Mock(), mocked_request]
+        request_coalescing = RequestCoalescing()
+
+        # When
+        retrieved_response = _retrieve_response_from_cache_or_calculate(
+            mocked_view_function,  # view_function
+            None,  # timeout
+            False,  # is_reserved_namespace
+            True,  # is_public
+            None,  # request_caching_disabled
+            *mocked_args,
+            request_coalescing=request_coalescing,
+            cache_management=mocked_cache_management,
+        )
+
+        # Then
+        spy_coalesce_response_calculation.assert_called_once_with(
+            mocked_view_function,
+            None,  # timeout
+            mocked_cache_management,
+            mocked_cache_management.build_cache_entry_key_for_request.return_value,
+            request_coalescing,
+            *mocked_args,
+            accepts_gzip=False,
+        )
+        assert retrieved_response == spy_coalesce_response_calculation.return_value
+
+    def test_retrieves_item_for_client_which_accepts_gzip(self):
+        """
+        Given a mocked request with an `Accept-Encoding` header which allows gzip
+        When `_retrieve_response_from_cache_or_calculate()` is called
+        Then the item is retrieved from the cache with `accepts_gzip` set to True
+        """
+        # Given
+        mocked_request = mock.MagicMock(
+            method="POST", headers={"Accept-Encoding": "gzip, deflate, br"}
+        )
+        spy_cache_management = mock.Mock()
+
+        # When
+        retrieved_response = _retrieve_response_from_cache_or_calculate(
+            mock.Mock(),  # view_function
+            None,  # timeout
+            False,  # is_reserved_namespace
+            True,  # is_public
+            None,  # request_caching_disabled
+            mock.Mock(),
+            mocked_request,
+            cache_management=spy_cache_management,
+        )
+
+        # Then
+        spy_cache_management.retrieve_item_from_cache.assert_called_once_with(
+            cache_entry_key=spy_cache_management.build_cache_entry_key_for_request.return_value,
+            accepts_gzip=True,
+        )
+        assert (
+            retrieved_response
+            == spy_cache_management.retrieve_item_from_cache.return_value
+        )
+
+    @mock.patch(f"{MODULE_PATH}._coalesce_response_calculation")
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_in_cache")
+    def test_does_not_coalesce_when_timeout_is_zero(
+        self,
+        spy_calculate_response_and_save_in_cache: mock.MagicMock,
+        spy_coalesce_response_calculation: mock.MagicMock,
+    ):
+        """
+        Given a mocked request which will miss the cache
+        And a `RequestCoalescing` config
+        When `_retrieve_response_from_cache_or_calculate()` is called
+            with a `timeout` of 0
+        Then the response is calculated without being coalesced
+
+        Patches:
+            `spy_calculate_response_and_save_in_cache`: For the main assertion
+            `spy_coalesce_response_calculation`: To check
+                the response is not coalesced
+        """
+        # Given
+        mocked_request = mock.MagicMock(method="POST")
+        mocked_cache_management = mock.Mock()
+        mocked_cache_management.retrieve_item_from_cache.side_effect = [CacheMissError]
+
+        # When
+        _retrieve_response_from_cache_or_calculate(
+            mock.Mock(),  # view_function
+            0,  # timeout
+            False,  # is_reserved_namespace
+            True,  # is_public
+            None,  # request_caching_disabled
+            mock.Mock(),
+            mocked_request,
+            request_coalescing=RequestCoalescing(),
+            cache_management=mocked_cache_management,
+        )
+
+        # Then
+        spy_calculate_response_and_save_in_cache.assert_called_once()
+        spy_coalesce_response_calculation.assert_not_called()
+
+
+class TestCoalesceResponseCalculation:
+    @staticmethod
+    def _build_cache_management() -> CacheManagement:
+        return CacheManagement(in_memory=True, client=InMemoryCacheClient())
+
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_with_stale_copy")
+    def test_calculates_response_and_releases_lease_when_lease_is_acquired(
+        self, spy_calculate_response_and_save_with_stale_copy: mock.MagicMock
+    ):
+        """
+        Given no other worker holds the lease for the cache entry key
+        When `_coalesce_response_calculation()` is called
+        Then the response is calculated
+        And the lease is released afterwards
+        And the calculation is no longer in flight within this process
+
+        Patches:
+            `spy_calculate_response_and_save_with_stale_copy`: For the main assertion
+        """
+        # Given
+        cache_management = self._build_cache_management()
+        fake_cache_entry_key = "abc"
+        mocked_response = mock.Mock()
+        spy_calculate_response_and_save_with_stale_copy.return_value = (
+            mocked_response,
+            mock.Mock(),
+        )
+
+        # When
+        response = _coalesce_response_calculation(
+            mock.Mock(),  # view_function
+            123,  # timeout
+            cache_management,
+            fake_cache_entry_key,
+            RequestCoalescing(),
+        )
+
+        # Then
+        assert response == mocked_response
+        assert not cache_management.is_lease_held(cache_entry_key=fake_cache_entry_key)
+        _, is_calculating_thread = IN_FLIGHT_CALCULATIONS.join(
+            cache_entry_key=fake_cache_entry_key
+        )
+        assert is_calculating_thread
+        IN_FLIGHT_CALCULATIONS.finish(
+            cache_entry_key=fake_cache_entry_key, cached_response=None
+        )
+
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_with_stale_copy")
+    def test_serves_stale_copy_from_previous_generation_when_lease_is_held_elsewhere(
+        self, spy_calculate_response_and_save_with_stale_copy: mock.MagicMock
+    ):
+        """
+        Given another worker holds the lease for the cache entry key
+        And a stale copy of the response was saved by a previous generation
+        When `_coalesce_response_calculation()` is called
+        Then the stale copy is returned
+        And the response is not calculated
+
+        Patches:
+            `spy_calculate_response_and_save_with_stale_copy`: To check
+                the response is not calculated
+        """
+        # Given
+        cache_management = self._build_cache_management()
+        fake_cache_entry_key = "gen222222222222-abc"
+        stale_response = HttpResponse(content=b"stale", content_type="text/csv")
+        cache_management.acquire_lease(cache_entry_key=fake_cache_entry_key, timeout=30)
+        cache_management.save_item_and_stale_copy_in_cache(
+            cache_entry_key="gen111111111111-abc",
+            item=stale_response,
+            timeout=None,
+            stale_timeout=None,
+        )
+
+        # When
+        response = _coalesce_response_calculation(
+            mock.Mock(),  # view_function
+            None,  # timeout
+            cache_management,
+            fake_cache_entry_key,
+            RequestCoalescing(),
+        )
+
+        # Then
+        assert response.content == stale_response.content
+        spy_calculate_response_and_save_with_stale_copy.assert_not_called()
+
+    @mock.patch(f"{MODULE_PATH}.time.sleep")
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_with_stale_copy")
+    def test_waits_for_response_calculated_elsewhere(
+        self,
+        spy_calculate_response_and_save_with_stale_copy: mock.MagicMock,
+        mocked_sleep: mock.MagicMock,
+    ):
+        """
+        Given another worker holds the lease for the cache entry key
+        And no stale copy of the response exists
+        When `_coalesce_response_calculation()` is called
+        And the other worker saves the response whilst this worker waits
+        Then the response saved by the other worker is returned
+        And the response is not calculated
+
+        Patches:
+            `spy_calculate_response_and_save_with_stale_copy`: To check
+                the response is not calculated
+            `mocked_sleep`: To simulate the other worker
+                saving the response whilst this worker waits
+        """
+        # Given
+        cache_management = self._build_cache_management()
+        fake_cache_entry_key = "abc"
+        mocked_response = mock.Mock()
+        cache_management.acquire_lease(cache_entry_key=fake_cache_entry_key, timeout=30)
+        mocked_sleep.side_effect = lambda _: cache_management._client.put(
+            cache_entry_key=fake_cache_entry_key, value=mocked_response
+        )
+
+        # When
+        response = _coalesce_response_calculation(
+            mock.Mock(),  # view_function
+            123,  # timeout
+            cache_management,
+            fake_cache_entry_key,
+            RequestCoalescing(),
+        )
+
+        # Then
+        assert response == mocked_response
+        spy_calculate_response_and_save_with_stale_copy.assert_not_called()
+
+    @mock.patch(f"{MODULE_PATH}.time.sleep")
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_with_stale_copy")
+    def test_calculates_response_when_lease_is_released_without_response(
+        self,
+        spy_calculate_response_and_save_with_stale_copy: mock.MagicMock,
+        mocked_sleep: mock.MagicMock,
+    ):
+        """
+        Given another worker holds the lease for the cache entry key
+        When `_coalesce_response_calculation()` is called
+        And the other worker releases the lease without saving the response
+        Then the response is calculated by this worker
+
+        Patches:
+            `spy_calculate_response_and_save_with_stale_copy`: For the main assertion
+            `mocked_sleep`: To simulate the other worker
+                releasing the lease whilst this worker waits
+        """
+        # Given
+        cache_management = self._build_cache_management()
+        fake_cache_entry_key = "abc"
+        mocked_response = mock.Mock()
+        spy_calculate_response_and_save_with_stale_copy.return_value = (
+            mocked_response,
+            None,
+        )
+        lease_token: str = cache_management.acquire_lease(
+            cache_entry_key=fake_cache_entry_key, timeout=30
+        )
+        mocked_sleep.side_effect = lambda _: cache_management.release_lease(
+            cache_entry_key=fake_cache_entry_key, token=lease_token
+        )
+
+        # When
+        response = _coalesce_response_calculation(
+            mock.Mock(),  # view_function
+            123,  # timeout
+            cache_management,
+            fake_cache_entry_key,
+            RequestCoalescing(),
+        )
+
+        # Then
+        assert response == mocked_response
+        mocked_sleep.assert_called_once()
+
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_in_cache")
+    def test_hands_response_to_thread_waiting_within_the_same_process(
+        self, spy_calculate_response_and_save_in_cache: mock.MagicMock
+    ):
+        """
+        Given another thread of this process is calculating the response
+        And no stale copy of the response exists
+        When `_coalesce_response_calculation()` is called
+        And the other thread finishes the calculation
+        Then the response calculated by the other thread is returned
+        And the cache is not polled for the response
+
+        Patches:
+            `spy_calculate_response_and_save_in_cache`: To check
+                the response is not calculated
+        """
+        # Given
+        spy_cache_management = mock.Mock()
+        spy_cache_management.retrieve_stale_item_from_cache.side_effect = CacheMissError
+        fake_cache_entry_key = "abc"
+        cached_response = CachedResponse(
+            status_code=200, content_type="text/csv", headers=(), body=b"abc"
+        )
+        IN_FLIGHT_CALCULATIONS.join(cache_entry_key=fake_cache_entry_key)
+        other_thread = threading.Timer(
+            interval=0.05,
+            function=lambda: IN_FLIGHT_CALCULATIONS.finish(
+                cache_entry_key=fake_cache_entry_key, cached_response=cached_response
+            ),
+        )
+
+        # When
+        other_thread.start()
+        response = _coalesce_response_calculation(
+            mock.Mock(),  # view_function
+            None,  # timeout
+            spy_cache_management,
+            fake_cache_entry_key,
+            RequestCoalescing(),
+        )
+        other_thread.join()
+
+        # Then
+        assert response.content == cached_response.body
+        spy_cache_management.retrieve_item_from_cache.assert_not_called()
+        spy_cache_management.acquire_lease.assert_not_called()
+        spy_calculate_response_and_save_in_cache.assert_not_called()
+
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_in_cache")
+    def test_calculates_response_when_wait_for_thread_within_the_same_process_times_out(
+        self, spy_calculate_response_and_save_in_cache: mock.MagicMock
+    ):
+        """
+        Given another thread of this process is calculating the response
+        And no stale copy of the response exists
+        When `_coalesce_response_calculation()` is called
+        And the other thread does not finish within the `wait_timeout`
+        Then the response is calculated by this thread
+
+        Patches:
+            `spy_calculate_response_and_save_in_cache`: For the main assertion
+        """
+        # Given
+        spy_cache_management = mock.Mock()
+        spy_cache_management.retrieve_stale_item_from_cache.side_effect = CacheMissError
+        fake_cache_entry_key = "abc"
+        IN_FLIGHT_CALCULATIONS.join(cache_entry_key=fake_cache_entry_key)
+
+        # When
+        try:
+            response = _coalesce_response_calculation(
+                mock.Mock(),  # view_function
+                None,  # timeout
+                spy_cache_management,
+                fake_cache_entry_key,
+                RequestCoalescing(wait_timeout=0),
+            )
+        finally:
+            IN_FLIGHT_CALCULATIONS.finish(
+                cache_entry_key=fake_cache_entry_key, cached_response=None
+            )
+
+        # Then
+        assert response == spy_calculate_response_and_save_in_cache.return_value
+
+    @mock.patch(f"{MODULE_PATH}.time.sleep")
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_with_stale_copy")
+    def test_keeps_waiting_whilst_lease_is_held_elsewhere(
+        self,
+        spy_calculate_response_and_save_with_stale_copy: mock.MagicMock,
+        mocked_sleep: mock.MagicMock,
+    ):
+        """
+        Given another worker holds the lease for the cache entry key
+        When `_coalesce_response_calculation()` is called
+        And the other worker only saves the response
+            after this worker has polled the cache once
+        Then this worker keeps waiting
+        And the response saved by the other worker is returned
+
+        Patches:
+            `spy_calculate_response_and_save_with_stale_copy`: To check
+                the response is not calculated
+            `mocked_sleep`: To simulate the other worker
+                saving the response on the 2nd poll
+        """
+        # Given
+        cache_management = self._build_cache_management()
+        fake_cache_entry_key = "abc"
+        mocked_response = mock.Mock()
+        cache_management.acquire_lease(cache_entry_key=fake_cache_entry_key, timeout=30)
+        poll_actions = iter(
+            [
+                lambda: None,
+                lambda: cache_management._client.put(
+                    cache_entry_key=fake_cache_entry_key, value=mocked_response
+                ),
+            ]
+        )
+        mocked_sleep.side_effect = lambda _: next(poll_actions)()
+
+        # When
+        response = _coalesce_response_calculation(
+            mock.Mock(),  # view_function
+            123,  # timeout
+            cache_management,
+            fake_cache_entry_key,
+            RequestCoalescing(serve_stale=False),
+        )
+
+        # Then
+        assert response == mocked_response
+        assert mocked_sleep.call_count == 2
+        spy_calculate_response_and_save_with_stale_copy.assert_not_called()
+
+
+class TestWaitForInFlightCalculation:
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_in_cache")
+    def test_serves_stale_copy_whilst_calculation_is_in_flight(
+        self, spy_calculate_response_and_save_in_cache: mock.MagicMock
+    ):
+        """
+        Given another thread of this process is calculating the response
+        And a stale copy of the response exists
+        When `_wait_for_in_flight_calculation()` is called
+        Then the stale copy is returned without waiting
+
+        Patches:
+            `spy_calculate_response_and_save_in_cache`: To check
+                the response is not calculated
+        """
+        # Given
+        spy_cache_management = mock.Mock()
+        in_flight_calculation = InFlightCalculation()
+
+        # When
+        response = _wait_for_in_flight_calculation(
+            mock.Mock(),  # view_function
+            None,  # timeout
+            spy_cache_management,
+            "abc",
+            RequestCoalescing(),
+            in_flight_calculation,
+        )
+
+        # Then
+        assert (
+            response == spy_cache_management.retrieve_stale_item_from_cache.return_value
+        )
+        assert not in_flight_calculation.is_finished
+        spy_calculate_response_and_save_in_cache.assert_not_called()
+
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_in_cache")
+    def test_reads_response_from_cache_when_calculation_finished_without_handing_it_over(
+        self, spy_calculate_response_and_save_in_cache: mock.MagicMock
+    ):
+        """
+        Given a calculation in this process which finished
+            without handing over its response
+        And the response has been saved in the cache
+        When `_wait_for_in_flight_calculation()` is called
+        Then the response is read back from the cache
+        And the outcome is recorded as "coalesced"
+
+        Patches:
+            `spy_calculate_response_and_save_in_cache`: To check
+                the response is not calculated
+        """
+        # Given
+        spy_cache_management = mock.Mock()
+        spy_cache_management.retrieve_stale_item_from_cache.side_effect = CacheMissError
+        in_flight_calculation = InFlightCalculation()
+        in_flight_calculation.finish(cached_response=None)
+        coalesced_count: int = REQUEST_COALESCING_METRICS.snapshot()["coalesced"]
+
+        # When
+        response = _wait_for_in_flight_calculation(
+            mock.Mock(),  # view_function
+            None,  # timeout
+            spy_cache_management,
+            "abc",
+            RequestCoalescing(),
+            in_flight_calculation,
+            accepts_gzip=True,
+        )
+
+        # Then
+        assert response == spy_cache_management.retrieve_item_from_cache.return_value
+        spy_cache_management.retrieve_item_from_cache.assert_called_once_with(
+            cache_entry_key="abc", accepts_gzip=True
+        )
+        assert REQUEST_COALESCING_METRICS.snapshot()["coalesced"] == coalesced_count + 1
+        spy_calculate_response_and_save_in_cache.assert_not_called()
+
+    @mock.patch(f"{MODULE_PATH}._calculate_response_and_save_in_cache")
+    def test_calculates_response_when_calculation_finished_without_saving_it(
+        self, spy_calculate_response_and_save_in_cache: mock.MagicMock
+    ):
+        """
+        Given a calculation in this process which finished
+            without handing over or saving its response
+        When `_wait_for_in_flight_calculation()` is called
+        Then the response is calculated by this thread
+        And the outcome is recorded as "wait_timed_out"
+
+        Patches:
+            `spy_calculate_response_and_save_in_cache`: For the main assertion
+        """
+        # Given
+        spy_cache_management = mock.Mock()
+        spy_cache_management.retrieve_stale_item_from_cache.side_effect = CacheMissError
+        spy_cache_management.retrieve_item_from_cache.side_effect = CacheMissError
+        in_flight_calculation = InFlightCalculation()
+        in_flight_calculation.finish(cached_response=None)
+        metrics_before: dict[str, int] = REQUEST_COALESCING_METRICS.snapshot()
+
+        # When
+        response = _wait_for_in_flight_calculation(
+            mock.Mock(),  # view_function
+            None,  # timeout
+            spy_cache_management,
+            "abc",
+            RequestCoalescing(),
+            in_flight_calculation,
+        )
+
+        # Then
+        assert response == spy_calculate_response_and_save_in_cache.return_value
+        metrics_after: dict[str, int] = REQUEST_COALESCING_METRICS.snapshot()
+        assert metrics_after["coalesced"] == metrics_before["coalesced"]
+        assert metrics_after["wait_timed_out"] == metrics_before["wait_timed_out"] + 1
+
+
+class TestCalculateResponseAndSaveWithStaleCopy:
+    @mock.patch(f"{MODULE_PATH}._calculate_response_from_view")
+    def test_saves_stale_copy_for_indefinite_timeout(
+        self, spy_calculate_response_from_view: mock.MagicMock
+    ):
+        """
+        Given a `RequestCoalescing` config with a `stale_timeout`
+        When `_calculate_response_and_save_with_stale_copy()` is called
+            with a `timeout` of None
+        Then the response and a stale copy of it are saved in the cache
+        And the saved `CachedResponse` is returned alongside the response
+
+        Patches:
+            `spy_calculate_response_from_view`: To isolate
+                the expected response which has been calculated
+        """
+        # Given
+        spy_cache_management = mock.Mock()
+        request_coalescing = RequestCoalescing(stale_timeout=456)
+
+        # When
+        response, cached_response = _calculate_response_and_save_with_stale_copy(
+            mock.Mock(),  # view_function
+            None,  # timeout
+            spy_cache_management,
+            "abc",  # cache entry key
+            request_coalescing,
+        )
+
+        # Then
+        spy_cache_management.save_item_and_stale_copy_in_cache.assert_called_once_with(
+            cache_entry_key="abc",
+            item=spy_calculate_response_from_view.return_value,
+            timeout=None,
+            stale_timeout=456,
+        )
+        assert response == spy_calculate_response_from_view.return_value
+        assert (
+            cached_response
+            == spy_cache_management.save_item_and_stale_copy_in_cache.return_value
+        )
+
+    @mock.patch(f"{MODULE_PATH}._calculate_response_from_view")
+    def test_does_not_save_streaming_response(
+        self, mocked_calculate_response_from_view: mock.MagicMock
+    ):
+        """
+        Given a view which returns a `StreamingHttpResponse`
+        When `_calculate_response_and_save_with_stale_copy()` is called
+        Then the response is returned without being saved in the cache
+        And there is no `CachedResponse` to be handed to other threads
+
+        Patches:
+            `mocked_calculate_response_from_view`: To return a streaming response
+        """
+        # Given
+        streaming_response = StreamingHttpResponse(iter(["a,b\n", "1,2\n"]))
+        mocked_calculate_response_from_view.return_value = streaming_response
+        spy_cache_management = mock.Mock()
+
+        # When
+        response, cached_response = _calculate_response_and_save_with_stale_copy(
+            mock.Mock(),  # view_function
+            None,  # timeout
+            spy_cache_management,
+            "abc",  # cache entry key
+            RequestCoalescing(),
+        )
+
+        # Then
+        spy_cache_management.save_item_and_stale_copy_in_cache.assert_not_called()
+        assert response is streaming_response
+        assert cached_response is None
+
 
 class TestIsPublicBehaviourInCalculateResponseFromView:
     """
@@ -0,0 +1,104 @@
+from unittest import mock
+
+from caching.private_api.client import InMemoryCacheClient
+from caching.private_api.generations import (
+    CacheGenerationState,
+    build_generation_key_count_key,
+)
+
+MODULE_PATH = "caching.private_api.generations"
+
+
+class TestCacheGenerationState:
+    def test_get_active_generation_only_fetches_once_within_pointer_timeout(self):
+        """
+        Given a `CacheGenerationState` with a `pointer_timeout`
+        When `get_active_generation()` is called twice within the `pointer_timeout`
+        Then the active generation is only fetched once
+        """
+        # Given
+        cache_generation_state = CacheGenerationState(pointer_timeout=60)
+        spy_fetch = mock.Mock(return_value="gen123")
+
+        # When
+        active_generations = [
+            cache_generation_state.get_active_generation(fetch=spy_fetch)
+            for _ in range(2)
+        ]
+
+        # Then
+        assert active_generations == ["gen123", "gen123"]
+        spy_fetch.assert_called_once()
+
+    @mock.patch(f"{MODULE_PATH}.time.monotonic")
+    def test_get_active_generation_fetches_again_once_pointer_has_expired(
+        self, mocked_monotonic: mock.MagicMock
+    ):
+        """
+        Given a `CacheGenerationState` with a `pointer_timeout` of 5 seconds
+        When `get_active_generation()` is called again after 5 seconds
+        Then the active generation is fetched again
+
+        Patches:
+            `mocked_monotonic`: To simulate the passing of time
+        """
+        # Given
+        cache_generation_state = CacheGenerationState(pointer_timeout=5)
+        spy_fetch = mock.Mock(side_effect=["gen123", "gen456"])
+        mocked_monotonic.return_value = 100
+        cache_generation_state.get_active_generation(fetch=spy_fetch)
+
+        # When
+        mocked_monotonic.return_value = 105
+        active_generation = cache_generation_state.get_active_generation(
+            fetch=spy_fetch
+        )
+
+        # Then
+        assert active_generation == "gen456"
+        assert spy_fetch.call_count == 2
+
+    def test_set_active_generation_is_served_without_fetching(self):
+        """
+        Given a `CacheGenerationState` which has already fetched the active generation
+        When `set_active_generation()` is called with a new generation
+        Then the new generation is returned by `get_active_generation()`
+            without fetching it again
+        """
+        # Given
+        cache_generation_state = CacheGenerationState(pointer_timeout=60)
+        spy_fetch = mock.Mock(return_value="gen123")
+        cache_generation_state.get_active_generation(fetch=spy_fetch)
+
+        # When
+        cache_generation_state.set_active_generation(cache_generation="gen456")
+
+        # Then
+        assert cache_generation_state.get_active_generation(fetch=spy_fetch) == "gen456"
+        spy_fetch.assert_called_once()
+
+    def test_reserve_slot_reserves_slots_in_blocks(self):
+        """
+        Given a `CacheGenerationState` which reserves 2 slots at a time
+        When `reserve_slot()` is called 3 times for the same generation
+        Then consecutive slots are returned
+        And the shared counter is only incremented once per block
+        """
+        # Given
+        cache_generation_state = CacheGenerationState(
+            pointer_timeout=0, slots_per_reservation=2
+        )
+        in_memory_cache_client = InMemoryCacheClient()
+        count_key: str = build_generation_key_count_key(cache_generation="gen123")
+
+        # When
+        slots = [
+            cache_generation_state.reserve_slot(
+                client=in_memory_cache_client, cache_generation="gen123"
+            )
+            for _ in range(3)
+        ]
+
+        # Then
+        assert slots == [1, 2, 3]
+        assert in_memory_cache_client.get(cache_entry_key=count_key) == 4
@@ -1,12 +1,15 @@
+import os
 from unittest import mock
 
 from _pytest.logging import LogCaptureFixture
 
 from caching.private_api.crawler import PrivateAPICrawler
 from caching.private_api.handlers import (
+    benchmark_reserved_cache_refresh,
     crawl_all_pages,
     refresh_default_cache,
     get_all_downloads,
+    iterate_all_downloads,
     refresh_reserved_cache,
 )
 from caching.private_api.management import (
@@ -164,47 +167,61 @@ class TestRefreshDefaultCache:
     @mock.patch.object(PrivateAPICrawler, "create_crawler_for_default_cache")
     @mock.patch(f"{MODULE_PATH}.crawl_all_pages")
     @mock.patch(f"{MODULE_PATH}.AreaSelectorOrchestrator")
-    @mock.patch.object(CacheManagement, "clear")
-    def test_clears_keys_prior_to_crawler(
+    def test_hydrates_new_generation_before_activating_it(
         self,
-        spy_cache_management_clear: mock.MagicMock,
         spy_area_selector_orchestrator_class: mock.MagicMock,
         spy_crawl_all_pages: mock.MagicMock,
-        mocked_create_crawler_for_default_cache: mock.MagicMock,
+        spy_create_crawler_for_default_cache: mock.MagicMock,
     ):
         """
-        Given no input
+        Given a mocked `CacheManagement` object
         When `refresh_default_cache()` is called
-        Then `clear()` is called from a `CacheManagement` object
-            before the call is made to `crawl_all_pages()`
+        Then a new cache generation is started
+        And the crawler is pointed at the new cache generation
+        And the new cache generation is only activated
+            after the call is made to `crawl_all_pages()`
+        And the cache is not cleared
+
+        Patches:
+            `spy_area_selector_orchestrator_class`: To check
+                the new cache generation is passed to the orchestrator
+            `spy_crawl_all_pages`: To check the order of calls
+            `spy_create_crawler_for_default_cache`: To check
+                the new cache generation is passed to the crawler
         """
         # Given
+        spy_cache_management = mock.Mock()
         spy_manager = mock.Mock()
-        spy_manager.attach_mock(
-            spy_cache_management_clear,
-            "cache_management_clear",
-        )
+        spy_manager.attach_mock(spy_cache_management, "cache_management")
         spy_manager.attach_mock(spy_crawl_all_pages, "crawl_all_pages")
+        expected_cache_generation = (
+            spy_cache_management.start_new_generation.return_value
+        )
 
         # When
-        refresh_default_cache()
+        refresh_default_cache(cache_management=spy_cache_management)
 
         # Then
-        # `clear()` should only have been called once from the CacheManagement object
-        spy_cache_management_clear.assert_called_once()
+        spy_create_crawler_for_default_cache.assert_called_once_with(
+            cache_generation=expected_cache_generation
+        )
+        spy_area_selector_orchestrator_class.assert_called_once_with(
+            geographies_api_crawler=spy_create_crawler_for_default_cache.return_value.geography_api_crawler,
+            cache_generation=expected_cache_generation,
+        )
 
-        # The cache should flushed before crawling the pages
         expected_calls = [
-            mock.call.cache_management_clear(),
+            mock.call.cache_management.start_new_generation(),
             mock.call.crawl_all_pages(
-                private_api_crawler=mocked_create_crawler_for_default_cache.return_value,
+                private_api_crawler=spy_create_crawler_for_default_cache.return_value,
                 area_selector_orchestrator=spy_area_selector_orchestrator_class.return_value,
             ),
+            mock.call.cache_management.activate_generation(
+                cache_generation=expected_cache_generation
+            ),
         ]
         spy_manager.assert_has_calls(calls=expected_calls, any_order=False)
-
-        # `crawl_all_pages()` should only have been called once
-        spy_crawl_all_pages.assert_called_once()
+        spy_cache_management.clear.assert_not_called()
 
 
 class TestRefreshReservedCache:
@@ -294,6 +311,64 @@ class TestRefreshReservedCache:
         spy_crawl_all_pages.assert_called_once()
 
 
+class TestBenchmarkReservedCacheRefresh:
+    @mock.patch.dict(os.environ, {})
+    @mock.patch(f"{MODULE_PATH}.refresh_reserved_cache")
+    def test_refreshes_cache_with_unbuffered_and_then_batched_writes(
+        self, spy_refresh_reserved_cache: mock.MagicMock
+    ):
+        """
+        Given a cache write batch size
+        When `benchmark_reserved_cache_refresh()` is called
+        Then the reserved cache is refreshed with unbuffered writes
+            and then with batched writes
+        And the duration is returned for each mode
+        And the batch size env variable is restored afterwards
+
+        Patches:
+            `spy_refresh_reserved_cache`: For the main assertion
+        """
+        # Given
+        os.environ.pop("PRIVATE_API_CACHE_WRITE_BATCH_SIZE", None)
+        batch_sizes_used: list[str] = []
+        spy_refresh_reserved_cache.side_effect = lambda: batch_sizes_used.append(
+            os.environ["PRIVATE_API_CACHE_WRITE_BATCH_SIZE"]
+        )
+
+        # When
+        durations = benchmark_reserved_cache_refresh(
+            cache_write_batch_size=50, refresh_count=2
+        )
+
+        # Then
+        assert batch_sizes_used == ["1", "1", "50", "50"]
+        assert list(durations) == ["unbuffered", "batched"]
+        assert "PRIVATE_API_CACHE_WRITE_BATCH_SIZE" not in os.environ
+
+    @mock.patch.dict(os.environ, {"PRIVATE_API_CACHE_WRITE_BATCH_SIZE": "25"})
+    @mock.patch(f"{MODULE_PATH}.refresh_reserved_cache")
+    def test_restores_previous_cache_write_batch_size(
+        self, mocked_refresh_reserved_cache: mock.MagicMock
+    ):
+        """
+        Given a cache write batch size env variable which has already been set
+        When `benchmark_reserved_cache_refresh()` is called
+        Then the previous batch size is restored afterwards
+
+        Patches:
+            `mocked_refresh_reserved_cache`: To remove the side effect
+                of refreshing the reserved cache
+        """
+        # Given
+        previous_batch_size = os.environ["PRIVATE_API_CACHE_WRITE_BATCH_SIZE"]
+
+        # When
+        benchmark_reserved_cache_refresh(cache_write_batch_size=50, refresh_count=1)
+
+        # Then
+        assert os.environ["PRIVATE_API_CACHE_WRITE_BATCH_SIZE"] == previous_batch_size
+
+
 class TestGetAllDownloads:
     @mock.patch(f"{MODULE_PATH}.collect_all_pages")
     @mock.patch.object(PrivateAPICrawler, "create_crawler_for_default_cache")
@@ -372,3 +447,60 @@ class TestGetAllDownloads:
         crawler.get_all_downloads.assert_called_once_with(
             pages=collected_pages, file_format="csv"
         )
+
+
+class TestIterateAllDownloads:
+    @mock.patch(f"{MODULE_PATH}.collect_all_pages")
+    @mock.patch.object(PrivateAPICrawler, "create_crawler_for_default_cache")
+    def test_delegates_calls_correctly(
+        self,
+        spy_create_crawler_for_default_cache: mock.MagicMock,
+        spy_collect_all_pages: mock.MagicMock,
+    ):
+        """
+        Given a mocked `Crawler` object
+        When `iterate_all_downloads()` is consumed
+        Then the downloads are taken from
+            the `iterate_all_downloads()` method on the crawler
+
+        Patches:
+            `spy_create_crawler_for_default_cache`: For the main assertion
+            `spy_collect_all_pages`: To check the pages passed to the crawler
+        """
+        # Given
+        crawler = spy_create_crawler_for_default_cache.return_value
+        crawler.iterate_all_downloads.return_value = iter(
+            [mock.sentinel.first_page, mock.sentinel.second_page]
+        )
+
+        # When
+        downloads = list(iterate_all_downloads(file_format="json"))
+
+        # Then
+        crawler.iterate_all_downloads.assert_called_once_with(
+            pages=spy_collect_all_pages.return_value, file_format="json"
+        )
+        assert downloads == [mock.sentinel.first_page, mock.sentinel.second_page]
+
+    @mock.patch(f"{MODULE_PATH}.collect_all_pages")
+    @mock.patch.object(PrivateAPICrawler, "create_crawler_for_default_cache")
+    def test_pages_are_not_collected_until_consumed(
+        self,
+        spy_create_crawler_for_default_cache: mock.MagicMock,
+        spy_collect_all_pages: mock.MagicMock,
+    ):
+        """
+        Given a mocked `Crawler` object
+        When `iterate_all_downloads()` is called but not consumed
+        Then no pages are collected
+
+        Patches:
+            `spy_create_crawler_for_default_cache`: To remove the side effect
+                of creating a crawler
+            `spy_collect_all_pages`: For the main assertion
+        """
+        # Given / When
+        iterate_all_downloads()
+
+        # Then
+        spy_collect_all_pages.assert_not_called()
@@ -0,0 +1,281 @@
+from unittest import mock
+
+from caching.private_api.local_cache import (
+    CacheTierMetrics,
+    LocalCache,
+    get_local_cache,
+)
+
+MODULE_PATH = "caching.private_api.local_cache"
+
+
+def _build_local_cache(
+    *,
+    max_size_in_bytes: int = 1024,
+    timeout: float = 60,
+    generation_check_interval: float = 5,
+) -> LocalCache:
+    return LocalCache(
+        max_size_in_bytes=max_size_in_bytes,
+        timeout=timeout,
+        generation_check_interval=generation_check_interval,
+    )
+
+
+class TestLocalCache:
+    def test_get_returns_copy_of_value_previously_added_via_put(self):
+        """
+        Given a value which has been added via the `put()` method
+        When `get()` is called from an instance of `LocalCache`
+        Then an equal copy of the value is returned
+        """
+        # Given
+        value = {"a": [1, 2, 3]}
+        local_cache = _build_local_cache()
+        local_cache.put(cache_entry_key="abc", value=value)
+
+        # When
+        retrieved_value = local_cache.get(cache_entry_key="abc")
+
+        # Then
+        assert retrieved_value == value
+        assert retrieved_value is not value
+
+    def test_get_returns_none_for_expired_entry(self):
+        """
+        Given a value which has been added via the `put()` method
+        When `get()` is called from an instance of `LocalCache`
+            after the timeout has elapsed
+        Then None is returned
+        And the entry is removed
+
+        Patches:
+            `mocked_monotonic`: To simulate the timeout elapsing
+        """
+        # Given
+        local_cache = _build_local_cache(timeout=10)
+
+        with mock.patch(f"{MODULE_PATH}.time.monotonic") as mocked_monotonic:
+            mocked_monotonic.return_value = 100
+            local_cache.put(cache_entry_key="abc", value="value")
+
+            # When
+            mocked_monotonic.return_value = 110
+            retrieved_value = local_cache.get(cache_entry_key="abc")
+
+        # Then
+        assert retrieved_value is None
+        assert len(local_cache) == 0
+        assert local_cache.size_in_bytes == 0
+
+    def test_put_evicts_least_recently_used_entries_to_stay_within_size_budget(self):
+        """
+        Given a `LocalCache` with a size budget for only 2 entries
+        And 2 entries of which the 1st has been read most recently
+        When `put()` is called for a 3rd entry
+        Then the least recently used entry is evicted
+        """
+        # Given
+        value = "x" * 100
+        local_cache = _build_local_cache(max_size_in_bytes=250)
+        local_cache.put(cache_entry_key="first", value=value)
+        local_cache.put(cache_entry_key="second", value=value)
+        local_cache.get(cache_entry_key="first")
+
+        # When
+        local_cache.put(cache_entry_key="third", value=value)
+
+        # Then
+        assert local_cache.get(cache_entry_key="second") is None
+        assert local_cache.get(cache_entry_key="first") == value
+        assert local_cache.get(cache_entry_key="third") == value
+        assert local_cache.size_in_bytes <= local_cache.max_size_in_bytes
+
+    def test_put_skips_value_larger_than_size_budget(self):
+        """
+        Given a value which is larger than the size budget on its own
+        When `put()` is called from an instance of `LocalCache`
+        Then the value is not stored
+        """
+        # Given
+        local_cache = _build_local_cache(max_size_in_bytes=10)
+
+        # When
+        local_cache.put(cache_entry_key="abc", value="x" * 100)
+
+        # Then
+        assert local_cache.get(cache_entry_key="abc") is None
+        assert local_cache.size_in_bytes == 0
+
+    def test_put_skips_value_which_cannot_be_pickled(self):
+        """
+        Given a value which cannot be pickled
+        When `put()` is called from an instance of `LocalCache`
+        Then the value is not stored
+        """
+        # Given
+        local_cache = _build_local_cache()
+
+        # When
+        local_cache.put(cache_entry_key="abc", value=lambda: None)
+
+        # Then
+        assert len(local_cache) == 0
+        assert local_cache.get(cache_entry_key="abc") is None
+
+    def test_delete_removes_entry_and_its_size(self):
+        """
+        Given 2 entries which have been added via the `put()` method
+        When `delete()` is called from an instance of `LocalCache` for 1 of them
+        Then only that entry is removed
+        And its size no longer counts towards the size budget
+        """
+        # Given
+        local_cache = _build_local_cache()
+        local_cache.put(cache_entry_key="abc", value="a" * 10)
+        local_cache.put(cache_entry_key="def", value="d" * 10)
+        size_of_both_entries: int = local_cache.size_in_bytes
+
+        # When
+        local_cache.delete(cache_entry_key="abc")
+
+        # Then
+        assert local_cache.get(cache_entry_key="abc") is None
+        assert local_cache.get(cache_entry_key="def") == "d" * 10
+        assert local_cache.size_in_bytes == size_of_both_entries / 2
+
+    def test_sync_generation_clears_entries_when_generation_changes(self):
+        """
+        Given a `LocalCache` which has been synced to a generation
+        And which contains an entry
+        When `sync_generation()` is called with a different generation
+        Then the entry is dropped
+        """
+        # Given
+        local_cache = _build_local_cache()
+        local_cache.sync_generation(generation="abc")
+        local_cache.put(cache_entry_key="abc", value="value")
+
+        # When
+        local_cache.sync_generation(generation="def")
+
+        # Then
+        assert local_cache.get(cache_entry_key="abc") is None
+
+    def test_sync_generation_keeps_entries_for_same_generation(self):
+        """
+        Given a `LocalCache` which has been synced to a generation
+        And which contains an entry
+        When `sync_generation()` is called with the same generation
+        Then the entry is kept
+        And the next generation check is not due until the interval has elapsed
+        """
+        # Given
+        local_cache = _build_local_cache(generation_check_interval=60)
+        local_cache.sync_generation(generation="abc")
+        local_cache.put(cache_entry_key="abc", value="value")
+
+        # When
+        local_cache.sync_generation(generation="abc")
+
+        # Then
+        assert local_cache.get(cache_entry_key="abc") == "value"
+        assert not local_cache.is_generation_check_due()
+
+
+class TestCacheTierMetrics:
+    def test_record_increments_count_for_tier(self):
+        """
+        Given an instance of `CacheTierMetrics`
+        When `record()` is called for hits and misses on each tier
+        Then the counts returned by `snapshot()` reflect each outcome
+        """
+        # Given
+        cache_tier_metrics = CacheTierMetrics()
+
+        # When
+        cache_tier_metrics.record(tier="local", is_hit=True)
+        cache_tier_metrics.record(tier="local", is_hit=False)
+        cache_tier_metrics.record(tier="remote", is_hit=True)
+
+        # Then
+        assert cache_tier_metrics.snapshot() == {
+            "local_hits": 1,
+            "local_misses": 1,
+            "remote_hits": 1,
+            "remote_misses": 0,
+        }
+
+    def test_reset_sets_counts_back_to_zero(self):
+        """
+        Given an instance of `CacheTierMetrics` with recorded outcomes
+        When `reset()` is called
+        Then the counts returned by `snapshot()` are all 0
+        """
+        # Given
+        cache_tier_metrics = CacheTierMetrics()
+        cache_tier_metrics.record(tier="local", is_hit=True)
+        cache_tier_metrics.record(tier="remote", is_hit=False)
+
+        # When
+        cache_tier_metrics.reset()
+
+        # Then
+        assert set(cache_tier_metrics.snapshot().values()) == {0}
+
+
+class TestGetLocalCache:
+    @mock.patch(f"{MODULE_PATH}.config")
+    def test_returns_none_when_local_cache_is_not_enabled(
+        self, mocked_config: mock.MagicMock
+    ):
+        """
+        Given `PRIVATE_API_LOCAL_CACHE_ENABLED` is not set
+        When `get_local_cache()` is called
+        Then None is returned
+
+        Patches:
+            `mocked_config`: To disable the local cache
+        """
+        # Given
+        mocked_config.PRIVATE_API_LOCAL_CACHE_ENABLED = False
+
+        # When
+        local_cache = get_local_cache(cache_name="default")
+
+        # Then
+        assert local_cache is None
+
+    @mock.patch.dict(f"{MODULE_PATH}._local_caches", clear=True)
+    @mock.patch(f"{MODULE_PATH}.config")
+    def test_returns_shared_local_cache_for_each_cache_name_when_enabled(
+        self, mocked_config: mock.MagicMock
+    ):
+        """
+        Given `PRIVATE_API_LOCAL_CACHE_ENABLED` is set
+        When `get_local_cache()` is called
+            multiple times for each cache name
+        Then the same `LocalCache` is returned for the same cache name
+        And a separate `LocalCache` is returned for each cache name
+        And each `LocalCache` is built from the config
+
+        Patches:
+            `mocked_config`: To enable and configure the local cache
+        """
+        # Given
+        mocked_config.PRIVATE_API_LOCAL_CACHE_ENABLED = True
+        mocked_config.PRIVATE_API_LOCAL_CACHE_MAX_SIZE_IN_BYTES = 2048
+        mocked_config.PRIVATE_API_LOCAL_CACHE_TIMEOUT_SECONDS = 3
+        mocked_config.PRIVATE_API_LOCAL_CACHE_GENERATION_CHECK_SECONDS = 4
+
+        # When
+        default_local_cache = get_local_cache(cache_name="default")
+        default_local_cache_again = get_local_cache(cache_name="default")
+        reserved_local_cache = get_local_cache(cache_name="reserved")
+
+        # Then
+        assert default_local_cache is default_local_cache_again
+        assert reserved_local_cache is not default_local_cache
+        assert default_local_cache.max_size_in_bytes == 2048
+        assert default_local_cache.timeout == 3
+        assert default_local_cache.generation_check_interval == 4
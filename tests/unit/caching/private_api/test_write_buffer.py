@@ -0,0 +1,103 @@
+from unittest import mock
+
+from django.http import HttpResponse
+
+from caching.private_api.client import InMemoryCacheClient
+from caching.private_api.management import CacheManagement
+from caching.private_api.write_buffer import (
+    CacheWriteBuffer,
+    buffer_cache_writes,
+    get_active_cache_write_buffer,
+)
+
+
+class TestCacheWriteBuffer:
+    def test_flushes_entries_once_batch_size_is_reached(self):
+        """
+        Given a `CacheWriteBuffer` with a `batch_size` of 2
+        When `put()` is called for 3 entries
+        Then the first 2 entries are written with 1 call to `set_many()`
+        And the 3rd entry is held until the next flush
+        """
+        # Given
+        spy_client = mock.Mock()
+        cache_write_buffer = CacheWriteBuffer(client=spy_client, batch_size=2)
+
+        # When
+        cache_write_buffer.put(cache_entry_key="abc", value=1, timeout=None)
+        cache_write_buffer.put(cache_entry_key="def", value=2, timeout=None)
+        cache_write_buffer.put(cache_entry_key="ghi", value=3, timeout=None)
+
+        # Then
+        spy_client.set_many.assert_called_once_with(
+            entries={"abc": 1, "def": 2}, timeout=None
+        )
+        assert len(cache_write_buffer) == 1
+
+    def test_flush_writes_entries_for_each_timeout_separately(self):
+        """
+        Given a `CacheWriteBuffer` which holds entries with different timeouts
+        When `flush()` is called
+        Then 1 call is made to `set_many()` for each timeout
+        And the buffer is emptied
+        """
+        # Given
+        spy_client = mock.Mock()
+        cache_write_buffer = CacheWriteBuffer(client=spy_client, batch_size=10)
+        cache_write_buffer.put(cache_entry_key="abc", value=1, timeout=None)
+        cache_write_buffer.put(cache_entry_key="abc-stale", value=1, timeout=123)
+
+        # When
+        cache_write_buffer.flush()
+
+        # Then
+        expected_calls = [
+            mock.call(entries={"abc": 1}, timeout=None),
+            mock.call(entries={"abc-stale": 1}, timeout=123),
+        ]
+        assert spy_client.set_many.mock_calls == expected_calls
+        assert len(cache_write_buffer) == 0
+
+
+class TestBufferCacheWrites:
+    def test_items_saved_within_context_are_flushed_on_exit(self):
+        """
+        Given an in-memory cache client
+        When `save_item_in_cache()` is called
+            from within the `buffer_cache_writes()` context
+        Then the item is not written to the cache until the context is exited
+        """
+        # Given
+        in_memory_cache_client = InMemoryCacheClient()
+        cache_management = CacheManagement(
+            in_memory=True, client=in_memory_cache_client
+        )
+        fake_response = HttpResponse(content=b"abc", content_type="text/csv")
+
+        # When
+        with buffer_cache_writes(batch_size=10, client=in_memory_cache_client):
+            cache_management.save_item_in_cache(
+                cache_entry_key="abc", item=fake_response, timeout=None
+            )
+            assert "abc" not in in_memory_cache_client._cache
+
+        # Then
+        assert "abc" in in_memory_cache_client._cache
+        assert get_active_cache_write_buffer() is None
+
+    def test_does_not_buffer_writes_for_batch_size_of_1(self):
+        """
+        Given a `batch_size` of 1
+        When the `buffer_cache_writes()` context is entered
+        Then no `CacheWriteBuffer` is made active
+        """
+        # Given
+        batch_size = 1
+
+        # When
+        with buffer_cache_writes(
+            batch_size=batch_size, client=mock.Mock()
+        ) as cache_write_buffer:
+            # Then
+            assert cache_write_buffer is None
+            assert get_active_cache_write_buffer() is None
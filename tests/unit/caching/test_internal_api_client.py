@@ -6,6 +6,7 @@ from rest_framework.test import APIClient
 from caching.internal_api_client import (
     PAGE_TYPES_WITH_NO_ADDITIONAL_QUERY_PARAMS,
     InternalAPIClient,
+    CACHE_GENERATION_HEADER_KEY,
     CACHE_RESERVED_NAMESPACE_HEADER_KEY,
 )
 
@@ -126,6 +127,26 @@ class TestInternalAPIClient:
         }
         assert headers == expected_headers
 
+    def test_build_headers_includes_cache_generation(self):
+        """
+        Given a provided `cache_generation` value
+        When `_build_headers()` is called
+            from an instance of `InternalAPIClient`
+        Then the cache generation is included in the headers
+        """
+        # Given
+        fake_cache_generation = "gen123abc"
+        internal_api_client = InternalAPIClient(
+            client=mock.Mock(),
+            cache_generation=fake_cache_generation,
+        )
+
+        # When
+        headers: dict = internal_api_client._build_headers()
+
+        # Then
+        assert headers[CACHE_GENERATION_HEADER_KEY] == fake_cache_generation
+
     # Query parameters construction tests
 
     @pytest.mark.parametrize(
@@ -4,9 +4,12 @@ from unittest.mock import patch
 import pytest
 
 from common.auth.permissions import (
+    CompiledPermissionSets,
     check_chart_permissions,
     check_chart_permissions_by_name,
     check_page_permissions,
+    clear_permission_checks_memo,
+    get_compiled_permission_sets,
     PermissionSetsType,
     PermissionRowType,
 )
@@ -257,6 +260,78 @@ class TestCheckPermissionsByName:
         with self._patch_lookups():
             assert self._check_permissions_by_name(permission_sets)
 
+    @patch("common.auth.permissions.check_chart_permissions", return_value=True)
+    def test_repeated_checks_are_served_from_the_memo(
+        self, spy_check_chart_permissions
+    ):
+        """
+        Given a set of permissions
+        When the same chart is checked twice for those permissions
+        Then the permissions are only evaluated once
+
+        Patches:
+            `spy_check_chart_permissions`: For the main assertion
+        """
+        # Given
+        permission_sets = self._build_permission_sets([self._permissions_by_id()])
+
+        # When
+        with self._patch_lookups():
+            first_result = self._check_permissions_by_name(permission_sets)
+            second_result = self._check_permissions_by_name(permission_sets)
+
+        # Then
+        spy_check_chart_permissions.assert_called_once()
+        assert first_result is second_result is True
+
+    @patch("common.auth.permissions.check_chart_permissions", return_value=True)
+    def test_memo_is_not_shared_between_permission_sets(
+        self, spy_check_chart_permissions
+    ):
+        """
+        Given 2 different sets of permissions
+        When the same chart is checked for each set of permissions
+        Then the permissions are evaluated for each set
+
+        Patches:
+            `spy_check_chart_permissions`: For the main assertion
+        """
+        # Given
+        permission_sets = self._build_permission_sets([self._permissions_by_id()])
+        other_permission_sets = self._build_permission_sets([])
+
+        # When
+        with self._patch_lookups():
+            self._check_permissions_by_name(permission_sets)
+            self._check_permissions_by_name(other_permission_sets)
+
+        # Then
+        assert spy_check_chart_permissions.call_count == 2
+
+    @patch("common.auth.permissions.check_chart_permissions", return_value=True)
+    def test_memo_is_cleared_by_clear_permission_checks_memo(
+        self, spy_check_chart_permissions
+    ):
+        """
+        Given a chart which has already been checked for a set of permissions
+        When `clear_permission_checks_memo()` is called
+        Then the permissions are evaluated again on the next check
+
+        Patches:
+            `spy_check_chart_permissions`: For the main assertion
+        """
+        # Given
+        permission_sets = self._build_permission_sets([self._permissions_by_id()])
+
+        # When
+        with self._patch_lookups():
+            self._check_permissions_by_name(permission_sets)
+            clear_permission_checks_memo()
+            self._check_permissions_by_name(permission_sets)
+
+        # Then
+        assert spy_check_chart_permissions.call_count == 2
+
 
 class TestCheckPermissions:
     @pytest.mark.parametrize(
@@ -1161,3 +1236,170 @@ class TestCheckPagePermissions:
             sub_theme_id=sub_theme_id,
             topic_id=topic_id,
         )
+
+
+class TestCompiledPermissionSets:
+    @staticmethod
+    def _build_permission_row(**ids: str) -> dict:
+        return {field_name: {"id": value} for field_name, value in ids.items()}
+
+    def test_rows_after_a_malformed_row_are_not_indexed(self):
+        """
+        Given a list of permission rows with a malformed row
+            before a row which would grant access
+        When `has_chart_access()` is called
+        Then False is returned
+        """
+        # Given
+        permission_sets = [
+            {"theme": {"id": "-1"}},
+            self._build_permission_row(
+                theme="-1",
+                sub_theme="-1",
+                topic="-1",
+                metric="-1",
+                geography_type="-1",
+                geography="-1",
+            ),
+        ]
+        compiled_permission_sets = CompiledPermissionSets(
+            permission_sets=permission_sets
+        )
+
+        # When
+        has_chart_access: bool = compiled_permission_sets.has_chart_access(
+            theme_id="1",
+            sub_theme_id="2",
+            topic_id="3",
+            metric_id="4",
+            geography_type="5",
+            geography_id="6",
+        )
+
+        # Then
+        assert not has_chart_access
+        # The malformed row still has the theme required for pages
+        assert compiled_permission_sets.has_page_access(
+            theme_id="1", sub_theme_id="2", topic_id="3"
+        )
+
+    def test_each_hierarchy_is_matched_independently_within_a_row(self):
+        """
+        Given 2 permission rows which each grant part of the access to a chart
+        When `has_chart_access()` is called for the chart
+        Then False is returned
+        Because a single row must grant access to every part of the chart
+        """
+        # Given
+        permission_sets = [
+            self._build_permission_row(
+                theme="1",
+                sub_theme="-1",
+                topic="-1",
+                metric="99",
+                geography_type="-1",
+                geography="-1",
+            ),
+            self._build_permission_row(
+                theme="99",
+                sub_theme="-1",
+                topic="-1",
+                metric="4",
+                geography_type="5",
+                geography="-1",
+            ),
+        ]
+        compiled_permission_sets = CompiledPermissionSets(
+            permission_sets=permission_sets
+        )
+
+        # When
+        has_chart_access: bool = compiled_permission_sets.has_chart_access(
+            theme_id=1,
+            sub_theme_id=2,
+            topic_id=3,
+            metric_id=4,
+            geography_type=5,
+            geography_id="E92000001",
+        )
+
+        # Then
+        assert not has_chart_access
+
+    @patch(
+        "common.auth.permissions.CompiledPermissionSets",
+        wraps=CompiledPermissionSets,
+    )
+    def test_permission_sets_are_compiled_once_for_repeated_checks(
+        self, spy_compiled_permission_sets
+    ):
+        """
+        Given a list of permission rows
+        When `check_chart_permissions()` and `check_page_permissions()`
+            are called several times for the same list
+        Then the permission rows are only compiled once
+
+        Patches:
+            `spy_compiled_permission_sets`: For the main assertion
+        """
+        # Given
+        permission_sets = [
+            self._build_permission_row(
+                theme="1",
+                sub_theme="2",
+                topic="-1",
+                metric="-1",
+                geography_type="5",
+                geography="-1",
+            )
+        ]
+
+        # When
+        for topic_id in ("3", "4"):
+            assert check_chart_permissions(
+                permission_sets=permission_sets,
+                theme_id="1",
+                sub_theme_id="2",
+                topic_id=topic_id,
+                metric_id="4",
+                geography_type="5",
+                geography_id="E92000001",
+            )
+            assert check_page_permissions(
+                permission_sets=permission_sets,
+                theme_id="1",
+                sub_theme_id="2",
+                topic_id=topic_id,
+            )
+
+        # Then
+        spy_compiled_permission_sets.assert_called_once_with(
+            permission_sets=permission_sets
+        )
+
+    def test_get_compiled_permission_sets_recompiles_for_other_permission_sets(self):
+        """
+        Given 2 different lists of permission rows
+        When `get_compiled_permission_sets()` is called for each list
+        Then a separate `CompiledPermissionSets` is returned for each list
+        """
+        # Given
+        permission_sets = [self._build_permission_row(theme="-1")]
+        other_permission_sets = [self._build_permission_row(theme="1", sub_theme="-1")]
+
+        # When
+        compiled_permission_sets = get_compiled_permission_sets(
+            permission_sets=permission_sets
+        )
+        other_compiled_permission_sets = get_compiled_permission_sets(
+            permission_sets=other_permission_sets
+        )
+
+        # Then
+        assert compiled_permission_sets is not other_compiled_permission_sets
+        assert other_compiled_permission_sets.has_page_access(
+            theme_id="1", sub_theme_id="2", topic_id="3"
+        )
+        assert not other_compiled_permission_sets.has_page_access(
+            theme_id="2", sub_theme_id="2", topic_id="3"
+        )
@@ -0,0 +1,241 @@
+from unittest import mock
+
+from common.auth.resource_ids import (
+    ChartResourceIds,
+    ResourceIdResolver,
+    invalidate_resource_ids_on_change,
+)
+
+MODULE_PATH = "common.auth.resource_ids"
+
+FAKE_CHART_RESOURCE_NAMES = {
+    "theme_name": "infectious_disease",
+    "sub_theme_name": "respiratory",
+    "topic_name": "COVID-19",
+    "metric_name": "COVID-19_deaths_ONSByDay",
+    "geography_type": "Nation",
+    "geography_name": "England",
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _build_mocked_metrics_api_interface() -> mock.Mock:
+    mocked_metrics_api_interface = mock.Mock()
+    topic_manager = mocked_metrics_api_interface.get_topic_manager.return_value
+    topic_manager.get_id_by_name.return_value = (1, 2, 3)
+    metric_manager = mocked_metrics_api_interface.get_metric_manager.return_value
+    metric_manager.get_id_by_name.return_value = 4
+    geography_type_manager = (
+        mocked_metrics_api_interface.get_geography_type_manager.return_value
+    )
+    geography_type_manager.get_id_by_name.return_value = 5
+    geography_manager = mocked_metrics_api_interface.get_geography_manager.return_value
+    geography_manager.get_code_by_name.return_value = "E92000001"
+    return mocked_metrics_api_interface
+
+
+class TestResourceIdResolver:
+    def test_resolves_ids_for_each_resource(self):
+        """
+        Given a `ResourceIdResolver`
+        When `resolve_chart_resource_ids()` is called
+        Then the IDs returned by each of the managers are returned
+        """
+        # Given
+        resource_id_resolver = ResourceIdResolver(
+            metrics_api_interface=_build_mocked_metrics_api_interface()
+        )
+
+        # When
+        chart_resource_ids = resource_id_resolver.resolve_chart_resource_ids(
+            **FAKE_CHART_RESOURCE_NAMES
+        )
+
+        # Then
+        assert chart_resource_ids == ChartResourceIds(
+            theme_id=1,
+            sub_theme_id=2,
+            topic_id=3,
+            metric_id=4,
+            geography_type_id=5,
+            geography_id="E92000001",
+        )
+
+    def test_repeated_lookups_are_served_from_the_cache(self):
+        """
+        Given a `ResourceIdResolver`
+        When `resolve_chart_resource_ids()` is called twice for the same resources
+        Then each of the managers is only queried once
+        """
+        # Given
+        spy_metrics_api_interface = _build_mocked_metrics_api_interface()
+        resource_id_resolver = ResourceIdResolver(
+            metrics_api_interface=spy_metrics_api_interface
+        )
+
+        # When
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+
+        # Then
+        topic_manager = spy_metrics_api_interface.get_topic_manager.return_value
+        topic_manager.get_id_by_name.assert_called_once()
+        metric_manager = spy_metrics_api_interface.get_metric_manager.return_value
+        metric_manager.get_id_by_name.assert_called_once()
+        geography_manager = spy_metrics_api_interface.get_geography_manager.return_value
+        geography_manager.get_code_by_name.assert_called_once()
+
+    def test_unresolved_lookups_are_not_cached(self):
+        """
+        Given a `ResourceIdResolver`
+        And a metric which cannot be found
+        When `resolve_chart_resource_ids()` is called twice
+        Then the metric is looked up each time
+        """
+        # Given
+        spy_metrics_api_interface = _build_mocked_metrics_api_interface()
+        metric_manager = spy_metrics_api_interface.get_metric_manager.return_value
+        metric_manager.get_id_by_name.return_value = None
+        resource_id_resolver = ResourceIdResolver(
+            metrics_api_interface=spy_metrics_api_interface
+        )
+
+        # When
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+        chart_resource_ids = resource_id_resolver.resolve_chart_resource_ids(
+            **FAKE_CHART_RESOURCE_NAMES
+        )
+
+        # Then
+        assert metric_manager.get_id_by_name.call_count == 2
+        assert chart_resource_ids.metric_id is None
+
+    def test_invalidate_clears_the_cache(self):
+        """
+        Given a `ResourceIdResolver` which has already resolved a set of resources
+        When `invalidate()` is called
+        Then the resources are looked up again on the next call
+        And the generation of the cache is incremented
+        """
+        # Given
+        spy_metrics_api_interface = _build_mocked_metrics_api_interface()
+        resource_id_resolver = ResourceIdResolver(
+            metrics_api_interface=spy_metrics_api_interface
+        )
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+        initial_generation: int = resource_id_resolver.generation
+
+        # When
+        resource_id_resolver.invalidate()
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+
+        # Then
+        metric_manager = spy_metrics_api_interface.get_metric_manager.return_value
+        assert metric_manager.get_id_by_name.call_count == 2
+        assert resource_id_resolver.generation == initial_generation + 1
+
+    def test_entries_expire_after_timeout(self):
+        """
+        Given a `ResourceIdResolver` with a timeout of 10 seconds
+        When `resolve_chart_resource_ids()` is called again after 10 seconds
+        Then the resources are looked up again
+        """
+        # Given
+        fake_clock = FakeClock()
+        spy_metrics_api_interface = _build_mocked_metrics_api_interface()
+        resource_id_resolver = ResourceIdResolver(
+            timeout_seconds=10,
+            metrics_api_interface=spy_metrics_api_interface,
+            clock=fake_clock,
+        )
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+
+        # When
+        fake_clock.now = 9
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+        fake_clock.now = 10
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+
+        # Then
+        metric_manager = spy_metrics_api_interface.get_metric_manager.return_value
+        assert metric_manager.get_id_by_name.call_count == 2
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """
+        Given a `ResourceIdResolver` with a `max_size` of 4
+        When a 5th entry is added to the cache
+        Then the least recently used entry is evicted
+        """
+        # Given
+        spy_metrics_api_interface = _build_mocked_metrics_api_interface()
+        resource_id_resolver = ResourceIdResolver(
+            max_size=4, metrics_api_interface=spy_metrics_api_interface
+        )
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+
+        # When
+        resource_id_resolver.resolve_chart_resource_ids(
+            **{**FAKE_CHART_RESOURCE_NAMES, "geography_name": "Wales"}
+        )
+        resource_id_resolver.resolve_chart_resource_ids(**FAKE_CHART_RESOURCE_NAMES)
+
+        # Then
+        # The geography of "England" was the least recently used entry
+        # when the geography of "Wales" was added
+        geography_manager = spy_metrics_api_interface.get_geography_manager.return_value
+        assert geography_manager.get_code_by_name.call_count == 3
+        topic_manager = spy_metrics_api_interface.get_topic_manager.return_value
+        topic_manager.get_id_by_name.assert_called_once()
+
+
+class TestInvalidateResourceIdsOnChange:
+    @mock.patch(f"{MODULE_PATH}.invalidate_resource_ids")
+    def test_invalidates_cache_for_resource_models(
+        self, spy_invalidate_resource_ids: mock.MagicMock
+    ):
+        """
+        Given a sender which is one of the `RESOURCE_ID_MODELS`
+        When `invalidate_resource_ids_on_change()` is called
+        Then the cache of resource IDs is invalidated
+
+        Patches:
+            `spy_invalidate_resource_ids`: For the main assertion
+        """
+        # Given
+        mocked_sender = mock.Mock()
+        mocked_sender.__name__ = "Metric"
+
+        # When
+        invalidate_resource_ids_on_change(sender=mocked_sender)
+
+        # Then
+        spy_invalidate_resource_ids.assert_called_once()
+
+    @mock.patch(f"{MODULE_PATH}.invalidate_resource_ids")
+    def test_ignores_unrelated_models(
+        self, spy_invalidate_resource_ids: mock.MagicMock
+    ):
+        """
+        Given a sender which is not one of the `RESOURCE_ID_MODELS`
+        When `invalidate_resource_ids_on_change()` is called
+        Then the cache of resource IDs is not invalidated
+
+        Patches:
+            `spy_invalidate_resource_ids`: For the main assertion
+        """
+        # Given
+        mocked_sender = mock.Mock()
+        mocked_sender.__name__ = "CoreTimeSeries"
+
+        # When
+        invalidate_resource_ids_on_change(sender=mocked_sender)
+
+        # Then
+        spy_invalidate_resource_ids.assert_not_called()
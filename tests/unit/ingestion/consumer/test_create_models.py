@@ -89,6 +89,7 @@ class TestConsumerCreateModelMethods:
         When `create_api_time_series()` is called from the object
         Then the `create_records()` function is called
             with the correct args
+        And the dimensions of the records are added to the catalogue
 
         Patches:
             `spy_build_api_time_series`: To check the
@@ -97,8 +98,12 @@ class TestConsumerCreateModelMethods:
             `spy_create_records`: For the main assertion
         """
         # Given
+        spy_api_timeseries_dimension_manager = mock.Mock()
         consumer = Consumer(
-            source_data=mock.Mock(), filename=test_filename, dto=mock.Mock()
+            source_data=mock.Mock(),
+            filename=test_filename,
+            dto=mock.Mock(),
+            api_timeseries_dimension_manager=spy_api_timeseries_dimension_manager,
         )
 
         # When
@@ -110,6 +115,9 @@ class TestConsumerCreateModelMethods:
             model_manager=consumer.api_timeseries_manager,
             model_instances=spy_build_api_time_series.return_value,
         )
+        spy_api_timeseries_dimension_manager.record_dimensions.assert_called_once_with(
+            api_time_series=spy_build_api_time_series.return_value
+        )
 
     @mock.patch.object(Consumer, "create_api_time_series")
     @mock.patch.object(Consumer, "create_core_time_series")
@@ -2,6 +2,8 @@ from unittest import mock
 
 from ingestion.consumer import Consumer
 
+MODULE_PATH = "ingestion.consumer"
+
 
 class TestConsumerProcessModels:
     @mock.patch.object(Consumer, "create_core_headlines")
@@ -36,12 +38,16 @@ class TestConsumerProcessModels:
         ]
         spy_manager.assert_has_calls(calls=expected_calls, any_order=False)
 
+    @mock.patch(f"{MODULE_PATH}.transaction")
+    @mock.patch.object(Consumer, "refresh_current_timeseries")
     @mock.patch.object(Consumer, "create_core_and_api_timeseries")
     @mock.patch.object(Consumer, "clear_stale_timeseries")
     def test_process_timeseries(
         self,
         spy_clear_stale_timeseries: mock.MagicMock,
         spy_create_core_and_api_timeseries: mock.MagicMock,
+        spy_refresh_current_timeseries: mock.MagicMock,
+        spy_transaction: mock.MagicMock,
         example_headline_data,
         test_filename: str,
     ):
@@ -51,15 +57,25 @@ class TestConsumerProcessModels:
             from an instance of the `Consumer`
         Then the `clear_stale_timeseries()` method is called first
         And then the `create_core_and_api_timeseries()` method is called after
+        And then the `refresh_current_timeseries()` method is called last
+        And all 3 calls are made within 1 transaction
+
+        Patches:
+            `spy_transaction`: To check the calls are made
+                within the atomic block, without a database
         """
         # Given
         spy_manager = mock.Mock()
+        spy_manager.attach_mock(spy_transaction.atomic, "spy_atomic")
         spy_manager.attach_mock(
             spy_clear_stale_timeseries, "spy_clear_stale_timeseries"
         )
         spy_manager.attach_mock(
             spy_create_core_and_api_timeseries, "spy_create_core_and_api_timeseries"
         )
+        spy_manager.attach_mock(
+            spy_refresh_current_timeseries, "spy_refresh_current_timeseries"
+        )
         consumer = Consumer(source_data=example_headline_data, filename=test_filename)
 
         # When
@@ -67,7 +83,11 @@ class TestConsumerProcessModels:
 
         # Then
         expected_calls = [
-            mock.call.spy_clear_stale_timeseries,
-            mock.call.spy_create_core_and_api_timeseries,
+            mock.call.spy_atomic(),
+            mock.call.spy_atomic().__enter__(),
+            mock.call.spy_clear_stale_timeseries(),
+            mock.call.spy_create_core_and_api_timeseries(),
+            mock.call.spy_refresh_current_timeseries(),
+            mock.call.spy_atomic().__exit__(None, None, None),
         ]
         spy_manager.assert_has_calls(calls=expected_calls, any_order=False)
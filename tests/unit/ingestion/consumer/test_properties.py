@@ -71,3 +71,26 @@ class TestConsumerProperties:
 
         # Then
         assert not is_headline_data
+
+    def test_is_headline_data_falls_back_to_dto_when_source_data_not_provided(
+        self,
+        example_headline_data: type_hints.INCOMING_DATA_TYPE,
+        test_filename: str,
+    ):
+        """
+        Given a `HeadlineDTO` but no source data
+        When `is_headline_data` is called
+            from an instance of the `Consumer`
+        Then True is returned
+        """
+        # Given
+        headline_dto = Consumer(
+            source_data=example_headline_data, filename=test_filename
+        ).dto
+        consumer = Consumer(dto=headline_dto, filename=test_filename)
+
+        # When
+        is_headline_data: bool = consumer.is_headline_data
+
+        # Then
+        assert is_headline_data
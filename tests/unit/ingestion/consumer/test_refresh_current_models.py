@@ -0,0 +1,55 @@
+from unittest import mock
+
+from ingestion.consumer import Consumer
+from metrics.data.managers.api_models.time_series import APITimeSeriesManager
+from metrics.data.managers.core_models.time_series import CoreTimeSeriesManager
+
+
+class TestConsumerRefreshCurrentModels:
+    def test_refresh_current_timeseries(
+        self, example_time_series_data: dict, test_filename: str
+    ):
+        """
+        Given incoming timeseries data
+        When `refresh_current_timeseries()` is called
+            from an instance of the `Consumer`
+        Then the call is delegated to the
+            `CoreTimeSeriesManager` with the correct args
+        And a similar call is made to the `APITimeSeriesManager`
+        """
+        # Given
+        spy_core_timeseries_manager = mock.Mock(spec_set=CoreTimeSeriesManager)
+        spy_api_timeseries_manager = mock.Mock(spec_set=APITimeSeriesManager)
+        consumer = Consumer(
+            source_data=example_time_series_data,
+            filename=test_filename,
+            core_timeseries_manager=spy_core_timeseries_manager,
+            api_timeseries_manager=spy_api_timeseries_manager,
+        )
+
+        # When
+        consumer.refresh_current_timeseries()
+
+        # Then
+        expected_core_timeseries_params = {
+            "metric": example_time_series_data["metric"],
+            "geography": example_time_series_data["geography"],
+            "geography_type": example_time_series_data["geography_type"],
+            "geography_code": example_time_series_data["geography_code"],
+            "stratum": example_time_series_data["stratum"],
+            "sex": example_time_series_data["sex"],
+            "age": example_time_series_data["age"],
+        }
+        spy_core_timeseries_manager.refresh_current_view.assert_called_once_with(
+            **expected_core_timeseries_params
+        )
+
+        expected_api_timeseries_params = {
+            "theme": example_time_series_data["parent_theme"],
+            "sub_theme": example_time_series_data["child_theme"],
+            "topic": example_time_series_data["topic"],
+            **expected_core_timeseries_params,
+        }
+        spy_api_timeseries_manager.refresh_current_view.assert_called_once_with(
+            **expected_api_timeseries_params
+        )
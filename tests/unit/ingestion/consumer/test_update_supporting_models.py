@@ -2,7 +2,7 @@ from unittest import mock
 
 import pytest
 
-from ingestion.consumer import Consumer
+from ingestion.consumer import Consumer, SupportingModelsLookup
 
 
 @pytest.fixture()
@@ -255,3 +255,37 @@ class TestConsumerUpdateSupportingModels:
             == spy_get_or_create_stratum.return_value.id
         )
         assert supporting_models_lookup.age_id == spy_get_or_create_age.return_value.id
+
+    @mock.patch.object(Consumer, "_get_or_create_theme")
+    def test_returns_provided_supporting_models_lookup(
+        self,
+        spy_get_or_create_theme: mock.MagicMock,
+        test_filename: str,
+    ):
+        """
+        Given an instance of the `Consumer`
+            which was provided with a `SupportingModelsLookup`
+        When `update_supporting_models()` is called
+        Then the provided `SupportingModelsLookup` is returned
+        And no supporting models are fetched or created
+
+        Patches:
+            `spy_get_or_create_theme`: To check
+                the database is not hit
+        """
+        # Given
+        supporting_models_lookup = SupportingModelsLookup(
+            metric_id=1, geography_id=2, stratum_id=3, age_id=4
+        )
+        consumer = Consumer(
+            dto=mock.Mock(),
+            filename=test_filename,
+            supporting_models_lookup=supporting_models_lookup,
+        )
+
+        # When
+        returned_supporting_models_lookup = consumer.update_supporting_models()
+
+        # Then
+        assert returned_supporting_models_lookup is supporting_models_lookup
+        spy_get_or_create_theme.assert_not_called()
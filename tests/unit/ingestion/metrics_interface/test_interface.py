@@ -1,11 +1,16 @@
 from ingestion.metrics_interface import interface
 from metrics.data.enums import TimePeriod
 from metrics.domain.common.utils import DataSourceFileType
-from metrics.data.models.api_models import APITimeSeries
+from metrics.data.models.api_models import (
+    APITimeSeries,
+    APITimeSeriesCurrentView,
+    APITimeSeriesDimension,
+)
 from metrics.data.models.core_models import (
     Age,
     CoreHeadline,
     CoreTimeSeries,
+    CoreTimeSeriesCurrentView,
     Geography,
     GeographyType,
     Metric,
@@ -228,6 +233,59 @@ class TestMetricsAPIInterface:
         # Then
         assert api_time_series is APITimeSeries
 
+    def test_get_api_timeseries_dimension_manager(self):
+        """
+        Given an instance of the `MetricsAPIInterface`
+        When `get_api_timeseries_dimension_manager()` is called from that object
+        Then the concrete `APITimeSeriesDimensionManager` is returned
+        """
+        # Given
+        metrics_api_interface = interface.MetricsAPIInterface()
+
+        # When
+        api_timeseries_dimension_manager = (
+            metrics_api_interface.get_api_timeseries_dimension_manager()
+        )
+
+        # Then
+        assert api_timeseries_dimension_manager is APITimeSeriesDimension.objects
+
+    def test_get_core_timeseries_current_view_manager(self):
+        """
+        Given an instance of the `MetricsAPIInterface`
+        When `get_core_timeseries_current_view_manager()` is called from that object
+        Then the concrete `TimeSeriesCurrentViewManager`
+            of the `CoreTimeSeriesCurrentView` is returned
+        """
+        # Given
+        metrics_api_interface = interface.MetricsAPIInterface()
+
+        # When
+        core_timeseries_current_view_manager = (
+            metrics_api_interface.get_core_timeseries_current_view_manager()
+        )
+
+        # Then
+        assert core_timeseries_current_view_manager is CoreTimeSeriesCurrentView.objects
+
+    def test_get_api_timeseries_current_view_manager(self):
+        """
+        Given an instance of the `MetricsAPIInterface`
+        When `get_api_timeseries_current_view_manager()` is called from that object
+        Then the concrete `TimeSeriesCurrentViewManager`
+            of the `APITimeSeriesCurrentView` is returned
+        """
+        # Given
+        metrics_api_interface = interface.MetricsAPIInterface()
+
+        # When
+        api_timeseries_current_view_manager = (
+            metrics_api_interface.get_api_timeseries_current_view_manager()
+        )
+
+        # Then
+        assert api_timeseries_current_view_manager is APITimeSeriesCurrentView.objects
+
     def test_get_time_period_enum(self):
         """
         Given an instance of the `MetricsAPIInterface`
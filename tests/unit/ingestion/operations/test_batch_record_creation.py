@@ -1,6 +1,18 @@
+import datetime
+import decimal
 from unittest import mock
 
-from ingestion.operations.batch_record_creation import create_records
+import pytest
+
+from ingestion.operations.batch_record_creation import (
+    DEFAULT_BATCH_SIZE,
+    _serialize_row,
+    _serialize_value,
+    copy_records,
+    create_records,
+)
+
+MODULE_PATH = "ingestion.operations.batch_record_creation"
 
 
 class TestCreateRecords:
@@ -29,3 +41,191 @@ class TestCreateRecords:
             ignore_conflicts=True,
             batch_size=batch_size,
         )
+
+    @mock.patch(f"{MODULE_PATH}.copy_records")
+    @mock.patch(f"{MODULE_PATH}.connections")
+    def test_delegates_to_copy_records_for_postgresql_when_enabled(
+        self, mocked_connections: mock.MagicMock, spy_copy_records: mock.MagicMock
+    ):
+        """
+        Given a model manager associated with a PostgreSQL database
+        When `create_records()` is called with `copy_writes_enabled=True`
+        Then the call is delegated to `copy_records()`
+        And `bulk_create()` is not called on the model manager
+        """
+        # Given
+        mocked_model_instances = [mock.Mock()] * 3
+        spy_model_manager = mock.Mock()
+        mocked_connections.__getitem__.return_value.vendor = "postgresql"
+
+        # When
+        create_records(
+            model_instances=mocked_model_instances,
+            model_manager=spy_model_manager,
+            copy_writes_enabled=True,
+        )
+
+        # Then
+        spy_copy_records.assert_called_once_with(
+            model_instances=mocked_model_instances,
+            model_manager=spy_model_manager,
+        )
+        spy_model_manager.bulk_create.assert_not_called()
+
+    @mock.patch(f"{MODULE_PATH}.copy_records")
+    @mock.patch(f"{MODULE_PATH}.connections")
+    def test_falls_back_to_bulk_create_for_other_database_backends(
+        self, mocked_connections: mock.MagicMock, spy_copy_records: mock.MagicMock
+    ):
+        """
+        Given a model manager associated with a sqlite database
+        When `create_records()` is called with `copy_writes_enabled=True`
+        Then the call is delegated to the `bulk_create()` method on the model manager
+        And `copy_records()` is not called
+        """
+        # Given
+        mocked_model_instances = [mock.Mock()] * 3
+        spy_model_manager = mock.Mock()
+        mocked_connections.__getitem__.return_value.vendor = "sqlite"
+
+        # When
+        create_records(
+            model_instances=mocked_model_instances,
+            model_manager=spy_model_manager,
+            copy_writes_enabled=True,
+        )
+
+        # Then
+        spy_model_manager.bulk_create.assert_called_once_with(
+            objs=mocked_model_instances,
+            ignore_conflicts=True,
+            batch_size=DEFAULT_BATCH_SIZE,
+        )
+        spy_copy_records.assert_not_called()
+
+
+class TestCopyRecords:
+    @mock.patch(f"{MODULE_PATH}.transaction")
+    @mock.patch(f"{MODULE_PATH}._serialize_row")
+    @mock.patch(f"{MODULE_PATH}.connections")
+    def test_streams_rows_into_staging_table_and_merges_into_target_table(
+        self,
+        mocked_connections: mock.MagicMock,
+        mocked_serialize_row: mock.MagicMock,
+        mocked_transaction: mock.MagicMock,
+    ):
+        """
+        Given 5 model instances and a `chunk_size` of 2
+        When `copy_records()` is called
+        Then the rows are copied into a staging table in 3 chunks
+        And the staging table is merged into the target table
+            whilst ignoring any conflicting rows
+        """
+        # Given
+        mocked_model_instances = [mock.Mock()] * 5
+        mocked_serialize_row.return_value = "row\n"
+        spy_cursor = mock.MagicMock()
+        mocked_connection = mocked_connections.__getitem__.return_value
+        mocked_connection.ops.quote_name.side_effect = lambda name: f'"{name}"'
+        mocked_connection.cursor.return_value.__enter__.return_value = spy_cursor
+        fake_model_manager = mock.Mock()
+        fake_model_manager.model._meta.db_table = "example_table"
+        fake_model_manager.model._meta.concrete_fields = [
+            mock.Mock(primary_key=True, column="id"),
+            mock.Mock(primary_key=False, column="metric_value"),
+            mock.Mock(primary_key=False, column="date"),
+        ]
+
+        # When
+        copy_records(
+            model_instances=mocked_model_instances,
+            model_manager=fake_model_manager,
+            chunk_size=2,
+        )
+
+        # Then
+        copied_chunks = [
+            call.args[1].getvalue() for call in spy_cursor.copy_expert.call_args_list
+        ]
+        assert copied_chunks == ["row\nrow\n", "row\nrow\n", "row\n"]
+        assert spy_cursor.copy_expert.call_args.args[0] == (
+            'COPY "example_table_staging" ("metric_value", "date") FROM STDIN'
+        )
+
+        executed_statements = [
+            call.args[0] for call in spy_cursor.execute.call_args_list
+        ]
+        assert executed_statements == [
+            'CREATE TEMPORARY TABLE "example_table_staging" ON COMMIT DROP AS '
+            'SELECT "metric_value", "date" FROM "example_table" WITH NO DATA',
+            'INSERT INTO "example_table" ("metric_value", "date") '
+            'SELECT "metric_value", "date" FROM "example_table_staging" '
+            "ON CONFLICT DO NOTHING",
+            'DROP TABLE "example_table_staging"',
+        ]
+        mocked_transaction.atomic.assert_called_once_with(using=fake_model_manager.db)
+
+
+class TestSerializeRow:
+    def test_returns_tab_separated_database_ready_values(self):
+        """
+        Given a model instance and the fields to be serialized
+        When `_serialize_row()` is called
+        Then the database-ready value of each field is returned
+            as a tab separated line in the `COPY` text format
+        """
+        # Given
+        fake_model_instance = mock.Mock(
+            metric_value=decimal.Decimal("1.2500"), embargo=None
+        )
+        mocked_connection = mock.Mock()
+        fields = []
+        for attname in ("metric_value", "embargo"):
+            fake_field = mock.Mock(attname=attname)
+            fake_field.get_db_prep_save.side_effect = lambda value, connection: value
+            fields.append(fake_field)
+
+        # When
+        serialized_row: str = _serialize_row(
+            model_instance=fake_model_instance,
+            fields=fields,
+            connection=mocked_connection,
+        )
+
+        # Then
+        assert serialized_row == "1.2500\t\\N\n"
+        fields[0].get_db_prep_save.assert_called_once_with(
+            decimal.Decimal("1.2500"), connection=mocked_connection
+        )
+
+
+class TestSerializeValue:
+    @pytest.mark.parametrize(
+        "value, expected_serialized_value",
+        (
+            [None, r"\N"],
+            [True, "t"],
+            [False, "f"],
+            [datetime.date(year=2024, month=1, day=31), "2024-01-31"],
+            [
+                datetime.datetime(year=2024, month=1, day=31, hour=9, minute=30),
+                "2024-01-31T09:30:00",
+            ],
+            [decimal.Decimal("1.2500"), "1.2500"],
+            [123, "123"],
+            ["tab\tnew\nline\r\\", r"tab\tnew\nline\r\\"],
+        ),
+    )
+    def test_returns_value_in_copy_text_format(
+        self, value, expected_serialized_value: str
+    ):
+        """
+        Given a database-ready value
+        When `_serialize_value()` is called
+        Then the value is returned in the PostgreSQL `COPY` text format
+        """
+        # Given / When
+        serialized_value: str = _serialize_value(value=value)
+
+        # Then
+        assert serialized_value == expected_serialized_value
@@ -6,8 +6,8 @@ import pytest
 
 from ingestion.operations.lambda_entrypoint import (
     decode_base64,
-    deserialize_json,
     extract_contents_from_record,
+    extract_data_from_record,
     handler,
 )
 
@@ -67,40 +67,59 @@ class TestDecodeBase64:
         assert decoded == fake_string
 
 
-class TestDeserializeJSONT:
-    def test_returns_correct_dict(self):
+class TestExtractContentsFromMessage:
+    def test_returns_correct_value(self):
         """
-        Given a dict serialized as a JSON string
-        When `deserialize_json()` is called
-        Then the raw deserialized dict is returned
+        Given a serialized Kinesis message containing a key and data
+        When `extract_contents_from_message()` is called
+        Then the correct key is returned
+        And a reader for the data is returned
         """
         # Given
-        fake_expected_dict = {"a": 1, "b": 2}
-        input_serialized_json = json.dumps(fake_expected_dict)
+        fake_object_key = "in/abc.json"
+        fake_time_series = [{"metric_value": 1}, {"metric_value": 2}]
+        fake_data = {
+            "metric": "COVID-19_cases_countRollingMean",
+            "time_series": fake_time_series,
+        }
+        serialized_record = _create_fake_serialized_record(
+            filename=fake_object_key, data=fake_data
+        )
 
         # When
-        deserialized_json = deserialize_json(serialized=input_serialized_json)
+        extracted_key, extracted_reader = extract_contents_from_record(
+            record=serialized_record
+        )
 
         # Then
-        assert deserialized_json == fake_expected_dict
+        assert extracted_key == fake_object_key
+        assert extracted_reader.read_header() == {
+            "metric": "COVID-19_cases_countRollingMean"
+        }
+        assert (
+            list(extracted_reader.iterate_items(key="time_series")) == fake_time_series
+        )
 
 
-class TestExtractContentsFromMessage:
+class TestExtractDataFromRecord:
     def test_returns_correct_value(self):
         """
         Given a serialized Kinesis message containing a key and data
-        When `extract_contents_from_message()` is called
-        Then the correct key and data are returned
+        When `extract_data_from_record()` is called
+        Then the correct key and deserialized data are returned
         """
         # Given
         fake_object_key = "in/abc.json"
-        fake_data = {"metric": "COVID-19_cases_countRollingMean"}
+        fake_data = {
+            "metric": "COVID-19_cases_countRollingMean",
+            "time_series": [{"metric_value": 1}, {"metric_value": 2}],
+        }
         serialized_record = _create_fake_serialized_record(
             filename=fake_object_key, data=fake_data
         )
 
         # When
-        extracted_key, extracted_data = extract_contents_from_record(
+        extracted_key, extracted_data = extract_data_from_record(
             record=serialized_record
         )
 
@@ -125,7 +144,7 @@ class TestHandler:
 
         Patches:
             `spy_extract_contents_from_record`: To check
-                the filename key and data are extracted
+                the filename key and data reader are extracted
                 from the inbound record
             `spy_ingest_data_and_post_process`: For the
                 main assertion
@@ -136,8 +155,8 @@ class TestHandler:
         fake_event = {"Records": mocked_records}
 
         mocked_filename = mock.Mock()
-        mocked_data = mock.Mock()
-        spy_extract_contents_from_record.return_value = mocked_filename, mocked_data
+        mocked_reader = mock.Mock()
+        spy_extract_contents_from_record.return_value = mocked_filename, mocked_reader
 
         # When
         handler(event=fake_event, context=mock.Mock())
@@ -148,8 +167,52 @@ class TestHandler:
         )
         spy_ingest_data_and_post_process.assert_has_calls(
             calls=[
-                mock.call(data=mocked_data, key=mocked_filename)
+                mock.call(reader=mocked_reader, key=mocked_filename)
                 for fake_record in mocked_records
             ],
             any_order=True,
         )
+
+    @mock.patch(f"{MODULE_PATH}.config.INGESTION_BATCH_MODE_ENABLED", True)
+    @mock.patch(f"{MODULE_PATH}.extract_data_from_record")
+    @mock.patch(f"{MODULE_PATH}.ingest_data_and_post_process")
+    @mock.patch(f"{MODULE_PATH}.ingest_batch_of_data_and_post_process")
+    def test_delegates_all_records_to_batch_ingestion_when_enabled(
+        self,
+        spy_ingest_batch_of_data_and_post_process: mock.MagicMock,
+        spy_ingest_data_and_post_process: mock.MagicMock,
+        spy_extract_data_from_record: mock.MagicMock,
+    ):
+        """
+        Given an event containing a list of records
+        And `INGESTION_BATCH_MODE_ENABLED` is set
+        When the lambda `handler()` is called
+        Then the data is extracted from each record
+        And all the records are ingested together in bulk
+
+        Patches:
+            `spy_ingest_batch_of_data_and_post_process`: For the
+                main assertion
+            `spy_ingest_data_and_post_process`: To check
+                the records are not ingested 1 at a time
+            `spy_extract_data_from_record`: To check
+                the data is extracted from each inbound record
+
+        """
+        # Given
+        mocked_records = [mock.Mock(), mock.Mock()]
+        fake_event = {"Records": mocked_records}
+        fake_items = [("in/abc.json", {"index": 0}), ("in/def.json", {"index": 1})]
+        spy_extract_data_from_record.side_effect = fake_items
+
+        # When
+        handler(event=fake_event, context=mock.Mock())
+
+        # Then
+        spy_extract_data_from_record.assert_has_calls(
+            calls=[mock.call(record=mocked_record) for mocked_record in mocked_records]
+        )
+        spy_ingest_batch_of_data_and_post_process.assert_called_once_with(
+            items=fake_items
+        )
+        spy_ingest_data_and_post_process.assert_not_called()
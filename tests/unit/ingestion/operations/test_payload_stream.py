@@ -0,0 +1,227 @@
+import io
+import json
+
+import pytest
+
+from ingestion.operations.payload_stream import (
+    MalformedPayloadError,
+    PayloadStreamReader,
+)
+from validation.data_transfer_models.base import MissingFieldError
+
+FAKE_TIME_SERIES = [
+    {"epiweek": 1, "date": "2024-01-01", "metric_value": 123.45},
+    {"epiweek": 2, "date": "2024-01-08", "metric_value": None},
+    {"epiweek": 3, "date": "2024-01-15", "metric_value": 6789},
+]
+FAKE_PAYLOAD = {
+    "metric": "COVID-19_cases_casesByDay",
+    "age": "all",
+    "time_series": FAKE_TIME_SERIES,
+    "refresh_date": "2024-01-16",
+}
+
+
+class TestPayloadStreamReader:
+    @pytest.mark.parametrize("read_size", [1, 7, 4096])
+    def test_read_header_returns_fields_either_side_of_the_items(self, read_size: int):
+        """
+        Given a payload with fields before and after the "time_series" array
+        When `read_header()` is called from an instance of `PayloadStreamReader`
+        Then all the top-level fields are returned without the items
+        And the "time_series" key is recorded as a streamed array
+        """
+        # Given
+        stream = io.StringIO(json.dumps(FAKE_PAYLOAD, indent=2))
+        payload_stream_reader = PayloadStreamReader(stream=stream, read_size=read_size)
+
+        # When
+        header = payload_stream_reader.read_header()
+
+        # Then
+        assert header == {
+            "metric": "COVID-19_cases_casesByDay",
+            "age": "all",
+            "refresh_date": "2024-01-16",
+        }
+        assert payload_stream_reader.streamed_array_keys == {"time_series"}
+
+    @pytest.mark.parametrize("read_size", [1, 7, 4096])
+    def test_iterate_items_yields_each_item(self, read_size: int):
+        """
+        Given a payload containing a "time_series" array
+        When `iterate_items()` is called from an instance of `PayloadStreamReader`
+        Then each item of the array is yielded in order
+        """
+        # Given
+        stream = io.StringIO(json.dumps(FAKE_PAYLOAD))
+        payload_stream_reader = PayloadStreamReader(stream=stream, read_size=read_size)
+
+        # When
+        items = payload_stream_reader.iterate_items(key="time_series")
+
+        # Then
+        assert list(items) == FAKE_TIME_SERIES
+
+    @pytest.mark.parametrize("read_size", [1, 2, 3, 4, 5])
+    @pytest.mark.parametrize("number", [1.75, -2e3, 1e5, 10, 0.5])
+    def test_read_header_returns_numbers_which_span_read_boundaries(
+        self, read_size: int, number: int | float
+    ):
+        """
+        Given a payload with a top-level number
+        And a `read_size` which splits the number across reads
+        When `read_header()` is called from an instance of `PayloadStreamReader`
+        Then the number is returned in full
+        """
+        # Given
+        raw_payload = (
+            f'{{"a": "x", "b": {json.dumps(number)}, "time_series": [{{"v": 1}}]}}'
+        )
+        stream = io.StringIO(raw_payload)
+        payload_stream_reader = PayloadStreamReader(stream=stream, read_size=read_size)
+
+        # When
+        header = payload_stream_reader.read_header()
+
+        # Then
+        assert header == {"a": "x", "b": number}
+
+    @pytest.mark.parametrize("read_size", [1, 3])
+    def test_read_header_returns_number_at_the_end_of_the_payload(self, read_size: int):
+        """
+        Given a payload which ends with a top-level number
+        And a `read_size` which splits the number across reads
+        When `read_header()` is called from an instance of `PayloadStreamReader`
+        Then the number is returned in full
+        """
+        # Given
+        stream = io.StringIO('{"time_series": [], "b": 12.5e-1}')
+        payload_stream_reader = PayloadStreamReader(stream=stream, read_size=read_size)
+
+        # When
+        header = payload_stream_reader.read_header()
+
+        # Then
+        assert header == {"b": 1.25}
+
+    def test_read_header_keeps_items_which_are_not_an_array(self):
+        """
+        Given a payload with a "time_series" value of None
+        When `read_header()` is called from an instance of `PayloadStreamReader`
+        Then the "time_series" value is returned as part of the header
+        And no keys are recorded as streamed arrays
+        """
+        # Given
+        stream = io.StringIO(json.dumps({**FAKE_PAYLOAD, "time_series": None}))
+        payload_stream_reader = PayloadStreamReader(stream=stream)
+
+        # When
+        header = payload_stream_reader.read_header()
+
+        # Then
+        assert header["time_series"] is None
+        assert payload_stream_reader.streamed_array_keys == set()
+
+    def test_reads_payload_nested_under_payload_key(self):
+        """
+        Given a message with the payload nested under the "data" key
+        When `read_value()`, `read_header()` and `iterate_items()` are called
+            from an instance of `PayloadStreamReader` with a `payload_key` of "data"
+        Then the top-level value and the nested payload are read correctly
+        """
+        # Given
+        message = {"name": "in/abc.json", "data": FAKE_PAYLOAD}
+        stream = io.StringIO(json.dumps(message))
+        payload_stream_reader = PayloadStreamReader(stream=stream, payload_key="data")
+
+        # When
+        name = payload_stream_reader.read_value(key="name")
+        header = payload_stream_reader.read_header()
+        items = list(payload_stream_reader.iterate_items(key="time_series"))
+
+        # Then
+        assert name == "in/abc.json"
+        assert header["refresh_date"] == FAKE_PAYLOAD["refresh_date"]
+        assert items == FAKE_TIME_SERIES
+
+    @pytest.mark.parametrize("read_size", [1, 4096])
+    def test_read_header_skips_nested_objects_before_payload_key(self, read_size: int):
+        """
+        Given a message with an object and an empty object
+            before the payload under the "data" key
+        When `read_header()` is called from an instance of `PayloadStreamReader`
+            with a `payload_key` of "data"
+        Then the preceding objects are skipped
+        And the nested payload is read correctly
+        """
+        # Given
+        message = {
+            "meta": {"source": {"name": "abc", "tags": ["x", "y"]}, "count": 2},
+            "empty": {},
+            "data": {"metric": "COVID-19_cases_casesByDay", "time_series": []},
+        }
+        stream = io.StringIO(json.dumps(message))
+        payload_stream_reader = PayloadStreamReader(
+            stream=stream, payload_key="data", read_size=read_size
+        )
+
+        # When
+        header = payload_stream_reader.read_header()
+
+        # Then
+        assert header == {"metric": "COVID-19_cases_casesByDay"}
+        assert payload_stream_reader.streamed_array_keys == {"time_series"}
+
+    def test_read_value_raises_error_for_missing_key(self):
+        """
+        Given a message which does not contain the given `key`
+        When `read_value()` is called from an instance of `PayloadStreamReader`
+        Then a `MissingFieldError` is raised
+        """
+        # Given
+        stream = io.StringIO(json.dumps({"data": FAKE_PAYLOAD}))
+        payload_stream_reader = PayloadStreamReader(stream=stream)
+
+        # When / Then
+        with pytest.raises(MissingFieldError):
+            payload_stream_reader.read_value(key="name")
+
+    def test_raises_error_for_missing_payload_key(self):
+        """
+        Given a message which does not contain the `payload_key`
+        When `read_header()` is called from an instance of `PayloadStreamReader`
+        Then a `MissingFieldError` is raised
+        """
+        # Given
+        stream = io.StringIO(json.dumps({"name": "in/abc.json"}))
+        payload_stream_reader = PayloadStreamReader(stream=stream, payload_key="data")
+
+        # When / Then
+        with pytest.raises(MissingFieldError):
+            payload_stream_reader.read_header()
+
+    @pytest.mark.parametrize(
+        "malformed_payload",
+        [
+            '{"metric": "abc", "time_series": [{"metric_value": 1}',
+            '{"metric": "abc" "age": "all"}',
+            '["metric", "abc"]',
+            "",
+            '{"metric": tru',
+            '{1: "abc"}',
+        ],
+    )
+    def test_raises_error_for_malformed_payload(self, malformed_payload: str):
+        """
+        Given a payload which is not valid JSON
+        When `read_header()` is called from an instance of `PayloadStreamReader`
+        Then a `MalformedPayloadError` is raised
+        """
+        # Given
+        stream = io.StringIO(malformed_payload)
+        payload_stream_reader = PayloadStreamReader(stream=stream)
+
+        # When / Then
+        with pytest.raises(MalformedPayloadError):
+            payload_stream_reader.read_header()
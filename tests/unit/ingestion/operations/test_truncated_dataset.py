@@ -9,11 +9,12 @@ from ingestion.operations.truncated_dataset import (
     collect_all_metric_model_managers,
     upload_truncated_test_data,
 )
-from metrics.data.models.api_models import APITimeSeries
+from metrics.data.models.api_models import APITimeSeries, APITimeSeriesCurrentView
 from metrics.data.models.core_models import (
     Age,
     CoreHeadline,
     CoreTimeSeries,
+    CoreTimeSeriesCurrentView,
     Geography,
     GeographyType,
     Metric,
@@ -54,7 +55,9 @@ class TestCollectAllMetricModelManagers:
         # Then
         assert CoreHeadline.objects in metric_models
         assert CoreTimeSeries.objects in metric_models
+        assert CoreTimeSeriesCurrentView.objects in metric_models
         assert APITimeSeries.objects in metric_models
+        assert APITimeSeriesCurrentView.objects in metric_models
         assert Theme.objects in metric_models
         assert SubTheme.objects in metric_models
         assert Topic.objects in metric_models
@@ -253,3 +256,37 @@ class TestUploadTruncatedTestData:
         assert spy_upload_data_as_file.call_count == len(test_source_data_file_paths)
         for filepath in test_source_data_file_paths:
             spy_upload_data_as_file.assert_any_call(filepath=filepath)
+
+    @mock.patch(f"{MODULE_PATH}._upload_data_as_files_in_batches")
+    @mock.patch(f"{MODULE_PATH}.clear_metrics_tables")
+    @mock.patch(f"{MODULE_PATH}.run_with_multiple_processes")
+    def test_uploads_files_in_batches_when_batch_ingestion_enabled(
+        self,
+        spy_run_with_multiple_processes: mock.MagicMock,
+        mocked_clear_metrics_tables: mock.MagicMock,
+        spy_upload_data_as_files_in_batches: mock.MagicMock,
+    ):
+        """
+        Given `batch_ingestion_enabled=True`
+        When `upload_truncated_test_data()` is called
+        Then `_upload_data_as_files_in_batches()` is called with all the source files
+            without delegating to `run_with_multiple_processes`
+
+        Patches:
+            `spy_run_with_multiple_processes`: To check
+                multiple processes are not spawned
+            `mocked_clear_metrics_tables`: To remove the side effect
+                of clearing records and having to hit the database
+            `spy_upload_data_as_files_in_batches`: For the main assertion
+        """
+        # Given
+        test_source_data_file_paths = _gather_test_data_source_file_paths()
+
+        # When
+        upload_truncated_test_data(batch_ingestion_enabled=True)
+
+        # Then
+        spy_upload_data_as_files_in_batches.assert_called_once_with(
+            filepaths=test_source_data_file_paths
+        )
+        spy_run_with_multiple_processes.assert_not_called()
@@ -3,9 +3,13 @@ from unittest import mock
 
 import pytest
 
-from ingestion.file_ingestion import FileIngestionFailedError
+from ingestion.file_ingestion import (
+    BatchFileIngestionFailedError,
+    FileIngestionFailedError,
+)
 from ingestion.operations.upload import (
     _upload_file_and_remove_local_copy,
+    ingest_batch_of_data_and_post_process,
     ingest_data_and_post_process,
 )
 
@@ -14,58 +18,64 @@ FAKE_FILENAME = "abc.json"
 
 
 class TestIngestDataAndPostProcess:
-    @mock.patch(f"{MODULE_PATH}.upload_data")
-    def test_delegates_call_to_upload_data(self, spy_upload_data: mock.MagicMock):
+    @mock.patch(f"{MODULE_PATH}.upload_data_stream")
+    def test_delegates_call_to_upload_data_stream(
+        self, spy_upload_data_stream: mock.MagicMock
+    ):
         """
-        Given a mocked `AWSClient` object and a fake item key & data
+        Given a mocked `AWSClient` object and a fake item key & reader
         When `ingest_data_and_post_process()` is called
-        Then `upload_data()` is called
+        Then `upload_data_stream()` is called
 
         Patches:
-            `spy_upload_data`: For the main assertion of
-                checking the data is passed to this function call
+            `spy_upload_data_stream`: For the main assertion of
+                checking the reader is passed to this function call
 
         """
         # Given
         spy_client = mock.MagicMock()
         fake_key = FAKE_FILENAME
-        fake_data = mock.Mock()
+        fake_reader = mock.Mock()
 
         # When
-        ingest_data_and_post_process(data=fake_data, key=fake_key, client=spy_client)
+        ingest_data_and_post_process(
+            reader=fake_reader, key=fake_key, client=spy_client
+        )
 
         # Then
-        spy_upload_data.assert_called_once_with(data=fake_data, key=fake_key)
+        spy_upload_data_stream.assert_called_once_with(reader=fake_reader, key=fake_key)
 
-    @mock.patch(f"{MODULE_PATH}.upload_data")
+    @mock.patch(f"{MODULE_PATH}.upload_data_stream")
     def test_delegates_call_to_move_file_to_processed_folder_for_successful_upload(
-        self, mocked_upload_data: mock.MagicMock
+        self, mocked_upload_data_stream: mock.MagicMock
     ):
         """
-        Given a mocked `AWSClient` object and a fake item key & data
+        Given a mocked `AWSClient` object and a fake item key & reader
         When `ingest_data_and_post_process()` is called
-        Then `upload_data()` is called
+        Then `upload_data_stream()` is called
 
         Patches:
-            `mocked_upload_data`: To remove the side effects
+            `mocked_upload_data_stream`: To remove the side effects
                 of having to ingest the file
 
         """
         # Given
         spy_client = mock.MagicMock()
         fake_key = FAKE_FILENAME
-        fake_data = mock.Mock()
+        fake_reader = mock.Mock()
 
         # When
-        ingest_data_and_post_process(data=fake_data, key=fake_key, client=spy_client)
+        ingest_data_and_post_process(
+            reader=fake_reader, key=fake_key, client=spy_client
+        )
 
         # Then
         spy_client.move_file_to_processed_folder.assert_called_once_with(key=fake_key)
         spy_client.move_file_to_failed_folder.assert_not_called()
 
-    @mock.patch(f"{MODULE_PATH}.upload_data")
+    @mock.patch(f"{MODULE_PATH}.upload_data_stream")
     def test_delegates_call_to_move_file_to_failed_folder_if_error_is_raised(
-        self, mocked_upload_data: mock.MagicMock
+        self, mocked_upload_data_stream: mock.MagicMock
     ):
         """
         Given a mocked `AWSClient` object and a fake item key
@@ -74,24 +84,89 @@ class TestIngestDataAndPostProcess:
         Then `move_file_to_failed_folder()` is called from the client
 
         Patches:
-            `mocked_upload_data`: To simulate
+            `mocked_upload_data_stream`: To simulate
                 the file upload failing
 
         """
         # Given
         spy_client = mock.MagicMock()
         fake_key = FAKE_FILENAME
-        fake_data = mock.Mock()
-        mocked_upload_data.side_effect = [FileIngestionFailedError(file_name=fake_key)]
+        fake_reader = mock.Mock()
+        mocked_upload_data_stream.side_effect = [
+            FileIngestionFailedError(file_name=fake_key)
+        ]
 
         # When
-        ingest_data_and_post_process(data=fake_data, key=fake_key, client=spy_client)
+        ingest_data_and_post_process(
+            reader=fake_reader, key=fake_key, client=spy_client
+        )
 
         # Then
         spy_client.move_file_to_failed_folder.assert_called_once_with(key=fake_key)
         spy_client.move_file_to_processed_folder.assert_not_called()
 
 
+class TestIngestBatchOfDataAndPostProcess:
+    @mock.patch(f"{MODULE_PATH}.upload_batch_of_data")
+    def test_moves_all_files_to_processed_folder_for_successful_upload(
+        self, spy_upload_batch_of_data: mock.MagicMock
+    ):
+        """
+        Given a mocked `AWSClient` object and 2 fake items
+        When `ingest_batch_of_data_and_post_process()` is called
+        Then `upload_batch_of_data()` is called with the items
+        And each file is moved to the processed folder
+
+        Patches:
+            `spy_upload_batch_of_data`: For the main assertion
+
+        """
+        # Given
+        spy_client = mock.MagicMock()
+        items = [("in/abc.json", {"index": 0}), ("in/def.json", {"index": 1})]
+
+        # When
+        ingest_batch_of_data_and_post_process(items=items, client=spy_client)
+
+        # Then
+        spy_upload_batch_of_data.assert_called_once_with(items=items)
+        spy_client.move_file_to_processed_folder.assert_has_calls(
+            calls=[mock.call(key="in/abc.json"), mock.call(key="in/def.json")]
+        )
+        spy_client.move_file_to_failed_folder.assert_not_called()
+
+    @mock.patch(f"{MODULE_PATH}.upload_batch_of_data")
+    def test_moves_failed_files_to_failed_folder(
+        self, mocked_upload_batch_of_data: mock.MagicMock
+    ):
+        """
+        Given a mocked `AWSClient` object and 2 fake items
+        And `upload_batch_of_data()` which fails 1 of the files
+        When `ingest_batch_of_data_and_post_process()` is called
+        Then the failed file is moved to the failed folder
+        And the other file is moved to the processed folder
+
+        Patches:
+            `mocked_upload_batch_of_data`: To simulate the failed file
+
+        """
+        # Given
+        spy_client = mock.MagicMock()
+        items = [("in/abc.json", {"index": 0}), ("in/def.json", {"index": 1})]
+        mocked_upload_batch_of_data.side_effect = BatchFileIngestionFailedError(
+            file_names=["in/def.json"]
+        )
+
+        # When
+        ingest_batch_of_data_and_post_process(items=items, client=spy_client)
+
+        # Then
+        spy_client.move_file_to_processed_folder.assert_called_once_with(
+            key="in/abc.json"
+        )
+        spy_client.move_file_to_failed_folder.assert_called_once_with(key="in/def.json")
+
+
 class TestUploadFileAndRemoveLocalCopy:
     @mock.patch(f"{MODULE_PATH}.os.remove")
     @mock.patch(f"{MODULE_PATH}._upload_data_as_file")
@@ -6,10 +6,16 @@ from _pytest.logging import LogCaptureFixture
 
 from ingestion.consumer import Consumer
 from ingestion.file_ingestion import (
+    BatchFileIngestionFailedError,
     FileIngestionFailedError,
     _upload_data_as_file,
+    _upload_data_as_files_in_batches,
+    batch_data_ingester,
     data_ingester,
+    stream_data_ingester,
+    upload_batch_of_data,
     upload_data,
+    upload_data_stream,
 )
 from ingestion.utils import type_hints
 from ingestion.metrics_interface.interface import DataSourceFileType
@@ -158,35 +164,364 @@ class TestUploadData:
             assert f"Failed upload of {mocked_key} due to {error}" in caplog.text
 
 
+class TestUploadDataStream:
+    @mock.patch(f"{MODULE_PATH}.stream_data_ingester")
+    def test_delegates_call_to_stream_data_ingester(
+        self,
+        spy_stream_data_ingester: mock.MagicMock,
+        caplog: LogCaptureFixture,
+        test_filename: str,
+    ):
+        """
+        Given a mocked reader and a file key
+        When `upload_data_stream()` is called
+        Then the call is delegated to `stream_data_ingester()`
+        And the correct logs are made
+
+        Patches:
+            `spy_stream_data_ingester`: For the main assertion
+
+        """
+        # Given
+        mocked_key = f"in/{test_filename}"
+        mocked_reader = mock.Mock()
+
+        # When
+        upload_data_stream(key=mocked_key, reader=mocked_reader)
+
+        # Then
+        spy_stream_data_ingester.assert_called_once_with(
+            reader=mocked_reader, filename=test_filename
+        )
+        assert f"Uploading {mocked_key}" in caplog.text
+        assert f"Completed ingestion of {mocked_key}" in caplog.text
+
+    @mock.patch(f"{MODULE_PATH}.stream_data_ingester")
+    def test_raises_error_with_correct_log_statement(
+        self,
+        mocked_stream_data_ingester: mock.MagicMock,
+        caplog: LogCaptureFixture,
+        test_filename: str,
+    ):
+        """
+        Given a mocked reader and a file key
+        And the ingestion of the stream raises an error
+        When `upload_data_stream()` is called
+        Then a `FileIngestionFailedError` is raised
+        And the correct logs are made
+
+        Patches:
+            `mocked_stream_data_ingester`: To simulate an error
+                being thrown during the data ingestion
+
+        """
+        # Given
+        mocked_key = f"in/{test_filename}"
+        error = Exception("fake error")
+        mocked_stream_data_ingester.side_effect = [error]
+
+        # When / Then
+        with pytest.raises(FileIngestionFailedError):
+            upload_data_stream(key=mocked_key, reader=mock.Mock())
+
+        assert f"Failed upload of {mocked_key} due to {error}" in caplog.text
+
+
 class TestUploadDataAsFile:
-    @mock.patch(f"{MODULE_PATH}.upload_data")
-    @mock.patch(f"{MODULE_PATH}.json.load")
+    @mock.patch(f"{MODULE_PATH}.upload_data_stream")
+    @mock.patch(f"{MODULE_PATH}.PayloadStreamReader")
     @mock.patch("builtins.open", new_callable=mock.mock_open)
-    def test_opens_file_and_delegates_to_upload_data(
+    def test_opens_file_and_delegates_to_upload_data_stream(
         self,
         mocked_open: mock.MagicMock,
-        mocked_json_load: mock.MagicMock,
-        spy_upload_data: mock.MagicMock,
+        spy_payload_stream_reader_class: mock.MagicMock,
+        spy_upload_data_stream: mock.MagicMock,
     ):
         """
         Given a fake file path
         When `_upload_data_as_file()` is called
-        Then the file is opened and parsed as JSON
-        And the parsed data is passed to `upload_data()` function
+        Then the file is opened and wrapped in a `PayloadStreamReader`
+        And the reader is passed to the `upload_data_stream()` function
 
         Patches:
             `mocked_open`: To prevent the side effects of having
                 to open a real file from the local filesystem
-            `mocked_json_load`: To mock the JSON parsing
-            `spy_upload_data`: For the main assertion
+            `spy_payload_stream_reader_class`: To check
+                the opened file is read as a stream
+            `spy_upload_data_stream`: For the main assertion
         """
         # Given
         fake_path = Path("abc.json")
-        expected_data = {"test": "data"}
-        mocked_json_load.return_value = expected_data
 
         # When
         _upload_data_as_file(filepath=fake_path)
 
         # Then
-        spy_upload_data.assert_called_once_with(key=fake_path.name, data=expected_data)
+        spy_payload_stream_reader_class.assert_called_once_with(
+            stream=mocked_open.return_value
+        )
+        spy_upload_data_stream.assert_called_once_with(
+            key=fake_path.name, reader=spy_payload_stream_reader_class.return_value
+        )
+
+
+class TestStreamDataIngester:
+    @mock.patch(f"{MODULE_PATH}.StreamConsumer")
+    def test_delegates_call_to_stream_consumer(
+        self, spy_stream_consumer_class: mock.MagicMock, test_filename: str
+    ):
+        """
+        Given a mocked reader and a filename
+        When `stream_data_ingester()` is called
+        Then the call is delegated to the `process()` method
+            on an instance of `StreamConsumer`
+
+        Patches:
+            `spy_stream_consumer_class`: For the main assertion
+        """
+        # Given
+        mocked_reader = mock.Mock()
+
+        # When
+        stream_data_ingester(reader=mocked_reader, filename=test_filename)
+
+        # Then
+        spy_stream_consumer_class.assert_called_once_with(
+            reader=mocked_reader, filename=test_filename
+        )
+        spy_stream_consumer_class.return_value.process.assert_called_once()
+
+
+class TestBatchDataIngester:
+    @mock.patch(f"{MODULE_PATH}.BatchConsumer")
+    def test_delegates_valid_dtos_to_batch_consumer(
+        self,
+        spy_batch_consumer_class: mock.MagicMock,
+        example_headline_data: type_hints.INCOMING_DATA_TYPE,
+        example_time_series_data: type_hints.INCOMING_DATA_TYPE,
+    ):
+        """
+        Given 2 valid items
+        When `batch_data_ingester()` is called
+        Then the DTOs of the items are passed to a `BatchConsumer`
+        And the timings from the `BatchConsumer` are returned
+
+        Patches:
+            `spy_batch_consumer_class`: For the main assertion
+        """
+        # Given
+        items = [
+            ("headline.json", example_headline_data),
+            ("time_series.json", example_time_series_data),
+        ]
+
+        # When
+        timings = batch_data_ingester(items=items)
+
+        # Then
+        passed_dtos = spy_batch_consumer_class.call_args.kwargs["dtos"]
+        assert [dto.metric for dto in passed_dtos] == [
+            example_headline_data["metric"],
+            example_time_series_data["metric"],
+        ]
+        assert timings == spy_batch_consumer_class.return_value.process.return_value
+
+    @mock.patch(f"{MODULE_PATH}.BatchConsumer")
+    def test_ingests_valid_items_before_raising_error_for_invalid_items(
+        self,
+        spy_batch_consumer_class: mock.MagicMock,
+        example_headline_data: type_hints.INCOMING_DATA_TYPE,
+        example_time_series_data: type_hints.INCOMING_DATA_TYPE,
+        caplog: LogCaptureFixture,
+    ):
+        """
+        Given 2 valid items and 1 item which is missing a required field
+        When `batch_data_ingester()` is called
+        Then the DTOs of the valid items are passed to a `BatchConsumer`
+        And a `BatchFileIngestionFailedError` is raised for the invalid item
+
+        Patches:
+            `spy_batch_consumer_class`: For the main assertion
+        """
+        # Given
+        invalid_data = {"metric_group": "cases"}
+        items = [
+            ("headline.json", example_headline_data),
+            ("invalid.json", invalid_data),
+            ("time_series.json", example_time_series_data),
+        ]
+
+        # When
+        with pytest.raises(BatchFileIngestionFailedError) as error:
+            batch_data_ingester(items=items)
+
+        # Then
+        spy_batch_consumer_class.return_value.process.assert_called_once()
+        passed_dtos = spy_batch_consumer_class.call_args.kwargs["dtos"]
+        assert [dto.metric for dto in passed_dtos] == [
+            example_headline_data["metric"],
+            example_time_series_data["metric"],
+        ]
+        assert error.value.file_names == ["invalid.json"]
+        assert "Failed validation of invalid.json" in caplog.text
+
+
+class TestUploadBatchOfData:
+    @mock.patch(f"{MODULE_PATH}.batch_data_ingester")
+    def test_delegates_call_to_batch_data_ingester_with_filenames(
+        self, spy_batch_data_ingester: mock.MagicMock
+    ):
+        """
+        Given 2 items with keys which include folder names
+        When `upload_batch_of_data()` is called
+        Then `batch_data_ingester()` is called
+            with the filenames of the keys and the data
+
+        Patches:
+            `spy_batch_data_ingester`: For the main assertion
+        """
+        # Given
+        items = [("in/2026/04/abc.json", {"index": 0}), ("in/def.json", {"index": 1})]
+        consumed_items = []
+        spy_batch_data_ingester.side_effect = lambda items: consumed_items.extend(items)
+
+        # When
+        upload_batch_of_data(items=items)
+
+        # Then
+        assert consumed_items == [
+            ("abc.json", {"index": 0}),
+            ("def.json", {"index": 1}),
+        ]
+
+    @mock.patch(f"{MODULE_PATH}.batch_data_ingester")
+    def test_raises_error_with_keys_of_failed_files(
+        self, mocked_batch_data_ingester: mock.MagicMock
+    ):
+        """
+        Given `batch_data_ingester()` which fails 1 of the files
+        When `upload_batch_of_data()` is called
+        Then a `BatchFileIngestionFailedError` is raised
+            with the key of the failed file
+
+        Patches:
+            `mocked_batch_data_ingester`: To simulate the failed file
+        """
+        # Given
+        items = [("in/abc.json", {"index": 0}), ("in/def.json", {"index": 1})]
+        mocked_batch_data_ingester.side_effect = BatchFileIngestionFailedError(
+            file_names=["def.json"]
+        )
+
+        # When
+        with pytest.raises(BatchFileIngestionFailedError) as error:
+            upload_batch_of_data(items=items)
+
+        # Then
+        assert error.value.file_names == ["in/def.json"]
+
+    @mock.patch(f"{MODULE_PATH}.batch_data_ingester")
+    def test_raises_error_with_keys_of_all_files_if_batch_cannot_be_written(
+        self,
+        mocked_batch_data_ingester: mock.MagicMock,
+        caplog: LogCaptureFixture,
+    ):
+        """
+        Given `batch_data_ingester()` which raises an unexpected error
+        When `upload_batch_of_data()` is called
+        Then a `BatchFileIngestionFailedError` is raised
+            with the keys of all the files
+        And the error is logged
+
+        Patches:
+            `mocked_batch_data_ingester`: To simulate the unexpected error
+        """
+        # Given
+        items = [("in/abc.json", {"index": 0}), ("in/def.json", {"index": 1})]
+        mocked_batch_data_ingester.side_effect = ValueError("database is down")
+
+        # When
+        with pytest.raises(BatchFileIngestionFailedError) as error:
+            upload_batch_of_data(items=items)
+
+        # Then
+        assert error.value.file_names == ["in/abc.json", "in/def.json"]
+        assert "Failed upload of batch due to database is down" in caplog.text
+
+
+class TestUploadDataAsFilesInBatches:
+    @mock.patch(f"{MODULE_PATH}.batch_data_ingester")
+    def test_reads_files_and_delegates_in_batches(
+        self,
+        spy_batch_data_ingester: mock.MagicMock,
+        tmp_path: Path,
+    ):
+        """
+        Given 3 JSON files
+        When `_upload_data_as_files_in_batches()` is called
+            with a `files_per_batch` of 2
+        Then `batch_data_ingester()` is called twice
+            with the parsed contents of each file
+
+        Patches:
+            `spy_batch_data_ingester`: For the main assertion
+        """
+        # Given
+        filepaths = []
+        for index in range(3):
+            filepath = tmp_path / f"{index}.json"
+            filepath.write_text(f'{{"index": {index}}}', encoding="utf-8")
+            filepaths.append(filepath)
+
+        consumed_items = []
+        spy_batch_data_ingester.side_effect = lambda items: consumed_items.append(
+            list(items)
+        )
+
+        # When
+        _upload_data_as_files_in_batches(filepaths=filepaths, files_per_batch=2)
+
+        # Then
+        assert consumed_items == [
+            [("0.json", {"index": 0}), ("1.json", {"index": 1})],
+            [("2.json", {"index": 2})],
+        ]
+
+    @mock.patch(f"{MODULE_PATH}.batch_data_ingester")
+    def test_continues_onto_next_batch_and_raises_error_for_all_failed_files(
+        self,
+        spy_batch_data_ingester: mock.MagicMock,
+        tmp_path: Path,
+    ):
+        """
+        Given 4 JSON files
+        And `batch_data_ingester()` which fails 1 file in each batch
+        When `_upload_data_as_files_in_batches()` is called
+            with a `files_per_batch` of 2
+        Then both batches are uploaded
+        And a `BatchFileIngestionFailedError` is raised
+            for the failed files from both batches
+
+        Patches:
+            `spy_batch_data_ingester`: To simulate the failed files
+        """
+        # Given
+        filepaths = []
+        for index in range(4):
+            filepath = tmp_path / f"{index}.json"
+            filepath.write_text(f'{{"index": {index}}}', encoding="utf-8")
+            filepaths.append(filepath)
+
+        def fail_first_file_in_batch(items):
+            filenames = [filename for filename, _ in items]
+            raise BatchFileIngestionFailedError(file_names=filenames[:1])
+
+        spy_batch_data_ingester.side_effect = fail_first_file_in_batch
+
+        # When
+        with pytest.raises(BatchFileIngestionFailedError) as error:
+            _upload_data_as_files_in_batches(filepaths=filepaths, files_per_batch=2)
+
+        # Then
+        assert spy_batch_data_ingester.call_count == 2
+        assert error.value.file_names == ["0.json", "2.json"]
@@ -0,0 +1,79 @@
+from unittest import mock
+
+from ingestion.stream_consumer import StreamConsumer
+
+MODULE_PATH = "ingestion.stream_consumer"
+
+
+class TestStreamConsumerBuildDTOs:
+    @mock.patch(f"{MODULE_PATH}.build_time_series_dto_from_source")
+    def test_builds_single_dto_from_header_when_items_were_not_streamed(
+        self, spy_build_time_series_dto_from_source: mock.MagicMock
+    ):
+        """
+        Given a reader which did not find a streamed "time_series" array
+        When `_build_dtos()` is called from an instance of `StreamConsumer`
+        Then a single DTO is built from the header alone
+        And the items are not read from the reader
+
+        Patches:
+            `spy_build_time_series_dto_from_source`: For the main assertion
+        """
+        # Given
+        spy_reader = mock.Mock(streamed_array_keys=set())
+        fake_header = {"metric": "COVID-19_cases_casesByDay", "time_series": None}
+        stream_consumer = StreamConsumer(reader=spy_reader, filename="abc.json")
+
+        # When
+        dtos = list(
+            stream_consumer._build_dtos(header=fake_header, is_headline_data=False)
+        )
+
+        # Then
+        assert dtos == [spy_build_time_series_dto_from_source.return_value]
+        spy_build_time_series_dto_from_source.assert_called_once_with(
+            source_data=fake_header, filename="abc.json"
+        )
+        spy_reader.iterate_items.assert_not_called()
+
+
+class TestStreamConsumerValidateInReportingDelayPeriodAcrossChunks:
+    def test_returns_none_for_empty_first_chunk(self):
+        """
+        Given a DTO for a chunk without any items
+        And no previous chunks
+        When `_validate_in_reporting_delay_period_across_chunks()` is called
+        Then None is returned
+        """
+        # Given
+        fake_dto = mock.Mock(time_series=[])
+
+        # When
+        last_in_reporting_delay_period = (
+            StreamConsumer._validate_in_reporting_delay_period_across_chunks(
+                dto=fake_dto, last_in_reporting_delay_period=None
+            )
+        )
+
+        # Then
+        assert last_in_reporting_delay_period is None
+
+    def test_carries_previous_value_over_an_empty_chunk(self):
+        """
+        Given a DTO for a chunk without any items
+        And a previous chunk which ended with a True value
+        When `_validate_in_reporting_delay_period_across_chunks()` is called
+        Then True is returned
+        """
+        # Given
+        fake_dto = mock.Mock(time_series=[])
+
+        # When
+        last_in_reporting_delay_period = (
+            StreamConsumer._validate_in_reporting_delay_period_across_chunks(
+                dto=fake_dto, last_in_reporting_delay_period=True
+            )
+        )
+
+        # Then
+        assert last_in_reporting_delay_period is True
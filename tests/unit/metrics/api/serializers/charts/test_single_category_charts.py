@@ -730,6 +730,67 @@ class TestEncodedChartsRequestSerializer:
         with pytest.raises(ValidationError):
             serializer.is_valid(raise_exception=True)
 
+    @pytest.mark.parametrize("chart_encoding", ["uri", "base64", "raw"])
+    def test_chart_encoding_is_passed_into_model(self, chart_encoding: str):
+        """
+        Given a valid `chart_encoding` passed
+            to an `EncodedChartsRequestSerializer` object
+        When `to_models()` is called from the serializer
+        Then the `chart_encoding` is set on the returned model
+        """
+        # Given
+        valid_data_payload = {
+            "file_format": "svg",
+            "plots": [],
+            "chart_encoding": chart_encoding,
+        }
+        serializer = EncodedChartsRequestSerializer(data=valid_data_payload)
+
+        # When
+        is_serializer_valid: bool = serializer.is_valid()
+        serialized_model_data: ChartRequestParams = serializer.to_models(request=None)
+
+        # Then
+        assert is_serializer_valid
+        assert serialized_model_data.chart_encoding == chart_encoding
+
+    def test_chart_encoding_defaults_to_uri(self):
+        """
+        Given no `chart_encoding` passed
+            to an `EncodedChartsRequestSerializer` object
+        When `to_models()` is called from the serializer
+        Then the `chart_encoding` on the returned model is "uri"
+        """
+        # Given
+        valid_data_payload = {"file_format": "svg", "plots": []}
+        serializer = EncodedChartsRequestSerializer(data=valid_data_payload)
+
+        # When
+        serializer.is_valid()
+        serialized_model_data: ChartRequestParams = serializer.to_models(request=None)
+
+        # Then
+        assert serialized_model_data.chart_encoding == "uri"
+
+    def test_invalid_chart_encoding(self):
+        """
+        Given an invalid `chart_encoding` passed
+            to an `EncodedChartsRequestSerializer` object
+        When `is_valid(raise_exception=True)` is called from the serializer
+        Then a `ValidationError` is raised
+        """
+        # Given
+        invalid_data_payload = {
+            "file_format": "svg",
+            "plots": [],
+            "chart_encoding": "gzip",
+        }
+        serializer = EncodedChartsRequestSerializer(data=invalid_data_payload)
+
+        # When / Then
+        with pytest.raises(ValidationError):
+            serializer.is_valid(raise_exception=True)
+
 
 class TestEncodedChartResponseSerializer:
     @property
@@ -39,3 +39,16 @@ class TestAppMode:
         # Then
         expected_values = {"PRIVATE_API"}
         assert set(app_modes_dependent_on_cache) == expected_values
+
+    def test_dependent_on_chart_rendering(self):
+        """
+        Given the `AppMode` Enum class
+        When the `dependent_on_chart_rendering()` method is called
+        Then the correct values are returned
+        """
+        # Given / When
+        app_modes_dependent_on_chart_rendering = AppMode.dependent_on_chart_rendering()
+
+        # Then
+        expected_values = {"PRIVATE_API"}
+        assert set(app_modes_dependent_on_chart_rendering) == expected_values
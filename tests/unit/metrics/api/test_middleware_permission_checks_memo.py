@@ -0,0 +1,58 @@
+from unittest import mock
+
+import pytest
+
+from metrics.api.middleware.permissions import PermissionChecksMemoMiddleware
+
+MODULE_PATH = "metrics.api.middleware.permissions"
+
+
+class TestPermissionChecksMemoMiddleware:
+    @mock.patch(f"{MODULE_PATH}.clear_permission_checks_memo")
+    def test_clears_memo_before_and_after_request(
+        self, spy_clear_permission_checks_memo: mock.MagicMock
+    ):
+        """
+        Given a `PermissionChecksMemoMiddleware`
+        When a request is dispatched
+        Then the memo of permission checks is cleared
+            before and after the request is handled
+        And the response is returned
+
+        Patches:
+            `spy_clear_permission_checks_memo`: For the main assertion
+        """
+        # Given
+        get_response = mock.Mock(return_value={"ok": True})
+        middleware = PermissionChecksMemoMiddleware(get_response=get_response)
+
+        # When
+        response = middleware(mock.MagicMock())
+
+        # Then
+        assert spy_clear_permission_checks_memo.call_count == 2
+        assert response == {"ok": True}
+
+    @mock.patch(f"{MODULE_PATH}.clear_permission_checks_memo")
+    def test_clears_memo_when_request_raises_error(
+        self, spy_clear_permission_checks_memo: mock.MagicMock
+    ):
+        """
+        Given a `PermissionChecksMemoMiddleware`
+        And a request which raises an error
+        When the request is dispatched
+        Then the memo of permission checks is still cleared afterwards
+
+        Patches:
+            `spy_clear_permission_checks_memo`: For the main assertion
+        """
+        # Given
+        get_response = mock.Mock(side_effect=ValueError)
+        middleware = PermissionChecksMemoMiddleware(get_response=get_response)
+
+        # When
+        with pytest.raises(ValueError):
+            middleware(mock.MagicMock())
+
+        # Then
+        assert spy_clear_permission_checks_memo.call_count == 2
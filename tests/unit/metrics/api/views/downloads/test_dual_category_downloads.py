@@ -1,8 +1,10 @@
 import inspect
+import json
 from http import HTTPStatus
 from unittest import mock
 
 import pytest
+from django.http import StreamingHttpResponse
 from rest_framework.response import Response
 
 from metrics.api.views.downloads.dual_category_downloads import (
@@ -252,3 +254,176 @@ class TestDualCategoryDownloadsView:
         )
         mocked_write_csv.assert_called_once()
         assert response is csv_file
+
+    @pytest.mark.parametrize(
+        "x_axis, expected_order_by_field",
+        (
+            ["age", "age__name"],
+            ["sex", "sex"],
+        ),
+    )
+    @mock.patch(f"{MODULE_PATH}.iterate_pivoted_dual_category_download_rows")
+    @mock.patch.object(DualCategoryDownloadsView, "_iterate_serialized_records")
+    def test_iterate_pivoted_queryset_data_groups_records_by_primary_axis_value(
+        self,
+        mocked_iterate_serialized_records: mock.MagicMock,
+        spy_iterate_pivoted_rows: mock.MagicMock,
+        x_axis: str,
+        expected_order_by_field: str,
+        dual_category_download_request_params: DualCategoryDownloadRequestParams,
+    ):
+        """
+        Given a dual-category download request with an `x_axis` other than "date"
+        When `_iterate_pivoted_queryset_data()` is called on `DualCategoryDownloadsView`
+        Then the queryset is re-ordered by the `x_axis` field
+        And the records of the re-ordered queryset are lazily pivoted
+
+        Patches:
+            `mocked_iterate_serialized_records`: To return fake records
+            `spy_iterate_pivoted_rows`: For the main assertion
+        """
+        # Given
+        spy_queryset = mock.MagicMock()
+        chart_plot_models = dual_category_download_request_params.model_copy(
+            update={"x_axis": x_axis, "secondary_category": "stratum"}
+        )
+        view = DualCategoryDownloadsView()
+
+        # When
+        pivoted_rows = view._iterate_pivoted_queryset_data(
+            queryset=spy_queryset, chart_plot_models=chart_plot_models
+        )
+
+        # Then
+        spy_queryset.order_by.assert_called_once_with(expected_order_by_field, "-date")
+        mocked_iterate_serialized_records.assert_called_once_with(
+            queryset=spy_queryset.order_by.return_value,
+            metric_group=chart_plot_models.metric_group,
+        )
+        spy_iterate_pivoted_rows.assert_called_once_with(
+            rows=mocked_iterate_serialized_records.return_value,
+            x_axis=x_axis,
+            secondary_category="stratum",
+        )
+        assert pivoted_rows == spy_iterate_pivoted_rows.return_value
+
+    @mock.patch(f"{MODULE_PATH}.iterate_pivoted_dual_category_download_rows")
+    @mock.patch.object(DualCategoryDownloadsView, "_iterate_serialized_records")
+    def test_iterate_pivoted_queryset_data_keeps_date_ordering(
+        self,
+        spy_iterate_serialized_records: mock.MagicMock,
+        mocked_iterate_pivoted_rows: mock.MagicMock,
+        dual_category_download_request_params: DualCategoryDownloadRequestParams,
+    ):
+        """
+        Given a dual-category download request with an `x_axis` of "date"
+        When `_iterate_pivoted_queryset_data()` is called on `DualCategoryDownloadsView`
+        Then the queryset is not re-ordered
+
+        Patches:
+            `spy_iterate_serialized_records`: For the main assertion
+            `mocked_iterate_pivoted_rows`: To remove the side effect
+                of pivoting the records
+        """
+        # Given
+        spy_queryset = mock.MagicMock()
+        chart_plot_models = dual_category_download_request_params.model_copy(
+            update={"x_axis": "date"}
+        )
+        view = DualCategoryDownloadsView()
+
+        # When
+        view._iterate_pivoted_queryset_data(
+            queryset=spy_queryset, chart_plot_models=chart_plot_models
+        )
+
+        # Then
+        spy_queryset.order_by.assert_not_called()
+        spy_iterate_serialized_records.assert_called_once_with(
+            queryset=spy_queryset,
+            metric_group=chart_plot_models.metric_group,
+        )
+
+    @mock.patch.object(DualCategoryDownloadsView, "_pivot_queryset_data")
+    @mock.patch.object(DualCategoryDownloadsView, "_iterate_pivoted_queryset_data")
+    @mock.patch(f"{MODULE_PATH}.should_stream_download", return_value=True)
+    def test_handle_json_streams_large_download(
+        self,
+        mocked_should_stream_download: mock.MagicMock,
+        mocked_iterate_pivoted_queryset_data: mock.MagicMock,
+        spy_pivot_queryset_data: mock.MagicMock,
+        dual_category_download_request_params: DualCategoryDownloadRequestParams,
+    ):
+        """
+        Given a dual-category download which is large enough to be streamed
+        When `_handle_json()` is called on `DualCategoryDownloadsView`
+        Then a `StreamingHttpResponse` is returned
+            which streams the lazily pivoted rows as a JSON array
+        And the rows are not pivoted in full
+
+        Patches:
+            `mocked_should_stream_download`: To treat the download as large
+            `mocked_iterate_pivoted_queryset_data`: To return fake pivoted rows
+            `spy_pivot_queryset_data`: To check the rows are not pivoted in full
+        """
+        # Given
+        fake_pivoted_rows = [{"age": "00-01", "f": 1.0}, {"age": "01-04", "f": 2.0}]
+        mocked_iterate_pivoted_queryset_data.return_value = iter(fake_pivoted_rows)
+        view = DualCategoryDownloadsView()
+
+        # When
+        response = view._handle_json(
+            queryset=mock.MagicMock(),
+            chart_plot_models=dual_category_download_request_params,
+        )
+
+        # Then
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Type"] == "application/json"
+        assert "dual_category_download.json" in response["Content-Disposition"]
+        streamed_content: bytes = b"".join(response.streaming_content)
+        assert json.loads(streamed_content) == fake_pivoted_rows
+        spy_pivot_queryset_data.assert_not_called()
+
+    @mock.patch.object(DualCategoryDownloadsView, "_pivot_queryset_data")
+    @mock.patch.object(DualCategoryDownloadsView, "_iterate_pivoted_queryset_data")
+    @mock.patch(f"{MODULE_PATH}.should_stream_download", return_value=True)
+    def test_handle_csv_streams_large_download(
+        self,
+        mocked_should_stream_download: mock.MagicMock,
+        mocked_iterate_pivoted_queryset_data: mock.MagicMock,
+        spy_pivot_queryset_data: mock.MagicMock,
+        dual_category_download_request_params: DualCategoryDownloadRequestParams,
+    ):
+        """
+        Given a dual-category download which is large enough to be streamed
+        When `_handle_csv()` is called on `DualCategoryDownloadsView`
+        Then a `StreamingHttpResponse` is returned
+            which streams the lazily pivoted rows as csv
+        And the rows are not pivoted in full
+
+        Patches:
+            `mocked_should_stream_download`: To treat the download as large
+            `mocked_iterate_pivoted_queryset_data`: To return fake pivoted rows
+            `spy_pivot_queryset_data`: To check the rows are not pivoted in full
+        """
+        # Given
+        mocked_iterate_pivoted_queryset_data.return_value = iter(
+            [{"age": "00-01", "f": 1.0, "m": 2.0}]
+        )
+        view = DualCategoryDownloadsView()
+
+        # When
+        response = view._handle_csv(
+            queryset=mock.MagicMock(),
+            chart_plot_models=dual_category_download_request_params,
+        )
+
+        # Then
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Type"] == "text/csv"
+        assert "dual_category_download.csv" in response["Content-Disposition"]
+        streamed_lines: list[bytes] = b"".join(response.streaming_content).splitlines()
+        assert len(streamed_lines) == 2
+        assert b"00-01" in streamed_lines[1]
+        spy_pivot_queryset_data.assert_not_called()
@@ -1,9 +1,13 @@
+import json
 from unittest import mock
 
 import pytest
+from django.http import StreamingHttpResponse
 
 from metrics.api.views.downloads import SingleCategoryDownloadsView
 
+MODULE_PATH = "metrics.api.views.downloads.single_category_downloads"
+
 
 class TestDownloadsView:
     def test_get_serializer_raises_error(self):
@@ -22,3 +26,73 @@ class TestDownloadsView:
                 queryset=mock.MagicMock(),
                 metric_group=invalid_metric_group,
             )
+
+    @mock.patch(f"{MODULE_PATH}.iterate_queryset_in_chunks")
+    @mock.patch(f"{MODULE_PATH}.should_stream_download", return_value=True)
+    def test_handle_csv_streams_large_download(
+        self,
+        mocked_should_stream_download: mock.MagicMock,
+        mocked_iterate_queryset_in_chunks: mock.MagicMock,
+    ):
+        """
+        Given a timeseries download which is large enough to be streamed
+        When the `_handle_csv()` method is called
+        Then a `StreamingHttpResponse` is returned
+            which streams the records as csv
+
+        Patches:
+            `mocked_should_stream_download`: To treat the download as large
+            `mocked_iterate_queryset_in_chunks`: To return fake records
+        """
+        # Given
+        mocked_iterate_queryset_in_chunks.return_value = iter([("a", 1), ("b", 2)])
+        downloads_view = SingleCategoryDownloadsView()
+
+        # When
+        response = downloads_view._handle_csv(
+            queryset=mock.MagicMock(), metric_group="timeseries"
+        )
+
+        # Then
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Type"] == "text/csv"
+        streamed_content: bytes = b"".join(response.streaming_content)
+        assert streamed_content.splitlines()[1:] == [b"a,1", b"b,2"]
+
+    @mock.patch(f"{MODULE_PATH}.iterate_queryset_in_chunks")
+    @mock.patch(f"{MODULE_PATH}.should_stream_download", return_value=True)
+    def test_handle_json_streams_large_download(
+        self,
+        mocked_should_stream_download: mock.MagicMock,
+        mocked_iterate_queryset_in_chunks: mock.MagicMock,
+    ):
+        """
+        Given a timeseries download which is large enough to be streamed
+        When the `_handle_json()` method is called
+        Then a `StreamingHttpResponse` is returned
+            which streams the serialized records as a JSON array
+
+        Patches:
+            `mocked_should_stream_download`: To treat the download as large
+            `mocked_iterate_queryset_in_chunks`: To return fake records
+        """
+        # Given
+        mocked_iterate_queryset_in_chunks.return_value = iter(["a", "b"])
+        downloads_view = SingleCategoryDownloadsView()
+
+        # When
+        with mock.patch.object(
+            SingleCategoryDownloadsView, "_get_serializer_class"
+        ) as mocked_get_serializer_class:
+            mocked_serializer = mocked_get_serializer_class.return_value
+            mocked_serializer.child.to_representation.side_effect = lambda record: {
+                "record": record
+            }
+            response = downloads_view._handle_json(
+                queryset=mock.MagicMock(), metric_group="timeseries"
+            )
+            streamed_content: bytes = b"".join(response.streaming_content)
+
+        # Then
+        assert isinstance(response, StreamingHttpResponse)
+        assert json.loads(streamed_content) == [{"record": "a"}, {"record": "b"}]
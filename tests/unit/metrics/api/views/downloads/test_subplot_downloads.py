@@ -0,0 +1,205 @@
+import json
+from unittest import mock
+
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework.response import Response
+
+from metrics.api.views.downloads.subplot_downloads.api_view import (
+    SubplotDownloadsView,
+)
+from metrics.interfaces.plots.access import DataNotFoundForAnyPlotError
+
+MODULE_PATH = "metrics.api.views.downloads.subplot_downloads.api_view"
+SINGLE_CATEGORY_DOWNLOADS_MODULE_PATH = (
+    "metrics.api.views.downloads.single_category_downloads"
+)
+
+
+def _build_fake_chart_request_params(*, metric_group: str) -> mock.Mock:
+    fake_chart_request_params = mock.Mock()
+    fake_chart_request_params.metric_group = metric_group
+    return fake_chart_request_params
+
+
+class TestSubplotDownloadsViewHandleJson:
+    @mock.patch.object(SubplotDownloadsView, "_get_serializer_class")
+    @mock.patch(f"{SINGLE_CATEGORY_DOWNLOADS_MODULE_PATH}.iterate_queryset_in_chunks")
+    @mock.patch(f"{MODULE_PATH}.should_stream_download")
+    @mock.patch(f"{MODULE_PATH}.access")
+    def test_streams_all_subplots_when_any_subplot_is_large(
+        self,
+        mocked_access: mock.MagicMock,
+        mocked_should_stream_download: mock.MagicMock,
+        mocked_iterate_queryset_in_chunks: mock.MagicMock,
+        mocked_get_serializer_class: mock.MagicMock,
+    ):
+        """
+        Given 2 subplots, only the second of which is large enough to be streamed
+        And a third subplot for which no data could be found
+        When `_handle_json()` is called from the `SubplotDownloadsView`
+        Then a `StreamingHttpResponse` is returned
+            which streams each subplot with data as a nested JSON array
+
+        Patches:
+            `mocked_access`: To return a fake queryset for each subplot
+            `mocked_should_stream_download`: To treat the 2nd subplot as large
+            `mocked_iterate_queryset_in_chunks`: To return the fake records
+            `mocked_get_serializer_class`: To serialize the fake records
+        """
+        # Given
+        mocked_access.get_downloads_data.side_effect = [
+            ["a"],
+            ["b", "c"],
+            DataNotFoundForAnyPlotError(),
+        ]
+        mocked_should_stream_download.side_effect = [False, True]
+        mocked_iterate_queryset_in_chunks.side_effect = lambda queryset: iter(queryset)
+        mocked_serializer = mocked_get_serializer_class.return_value
+        mocked_serializer.child.to_representation.side_effect = lambda record: {
+            "record": record
+        }
+        charts_request_param_models = [
+            _build_fake_chart_request_params(metric_group="timeseries")
+            for _ in range(3)
+        ]
+        subplot_downloads_view = SubplotDownloadsView()
+
+        # When
+        response = subplot_downloads_view._handle_json(
+            charts_request_param_models=charts_request_param_models
+        )
+        streamed_content: bytes = b"".join(response.streaming_content)
+
+        # Then
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Type"] == "application/json"
+        assert "chart_download.json" in response["Content-Disposition"]
+        assert json.loads(streamed_content) == [
+            [{"record": "a"}],
+            [{"record": "b"}, {"record": "c"}],
+        ]
+
+    @mock.patch.object(SubplotDownloadsView, "_get_serializer_class")
+    @mock.patch(f"{MODULE_PATH}.should_stream_download", return_value=False)
+    @mock.patch(f"{MODULE_PATH}.access")
+    def test_returns_serialized_subplots_when_no_subplot_is_large(
+        self,
+        mocked_access: mock.MagicMock,
+        mocked_should_stream_download: mock.MagicMock,
+        mocked_get_serializer_class: mock.MagicMock,
+    ):
+        """
+        Given 2 subplots, neither of which are large enough to be streamed
+        When `_handle_json()` is called from the `SubplotDownloadsView`
+        Then a `Response` is returned
+            with the serialized data of each subplot
+
+        Patches:
+            `mocked_access`: To return a fake queryset for each subplot
+            `mocked_should_stream_download`: To treat the subplots as small
+            `mocked_get_serializer_class`: To serialize the fake querysets
+        """
+        # Given
+        mocked_access.get_downloads_data.side_effect = [["a"], ["b"]]
+        mocked_get_serializer_class.side_effect = lambda queryset, metric_group: (
+            mock.Mock(data=[{"record": record} for record in queryset])
+        )
+        charts_request_param_models = [
+            _build_fake_chart_request_params(metric_group="timeseries")
+            for _ in range(2)
+        ]
+        subplot_downloads_view = SubplotDownloadsView()
+
+        # When
+        response = subplot_downloads_view._handle_json(
+            charts_request_param_models=charts_request_param_models
+        )
+
+        # Then
+        assert isinstance(response, Response)
+        assert response.data == [[{"record": "a"}], [{"record": "b"}]]
+        assert "chart_download.json" in response["Content-Disposition"]
+
+
+class TestSubplotDownloadsViewHandleCsv:
+    @mock.patch(f"{MODULE_PATH}.iterate_queryset_in_chunks")
+    @mock.patch(f"{MODULE_PATH}.should_stream_download", return_value=True)
+    @mock.patch(f"{MODULE_PATH}.access")
+    def test_streams_large_download(
+        self,
+        mocked_access: mock.MagicMock,
+        mocked_should_stream_download: mock.MagicMock,
+        mocked_iterate_queryset_in_chunks: mock.MagicMock,
+    ):
+        """
+        Given a subplots download which is large enough to be streamed
+        When `_handle_csv()` is called from the `SubplotDownloadsView`
+        Then a `StreamingHttpResponse` is returned
+            which streams the records as csv
+
+        Patches:
+            `mocked_access`: To return a fake merged queryset
+            `mocked_should_stream_download`: To treat the download as large
+            `mocked_iterate_queryset_in_chunks`: To return fake records
+        """
+        # Given
+        mocked_iterate_queryset_in_chunks.return_value = iter([("a", 1), ("b", 2)])
+        charts_request_param_models = [
+            _build_fake_chart_request_params(metric_group="timeseries")
+        ]
+        subplot_downloads_view = SubplotDownloadsView()
+
+        # When
+        response = subplot_downloads_view._handle_csv(
+            charts_request_param_models=charts_request_param_models
+        )
+
+        # Then
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Type"] == "text/csv"
+        assert "charts-download.csv" in response["Content-Disposition"]
+        streamed_content: bytes = b"".join(response.streaming_content)
+        assert streamed_content.splitlines()[1:] == [b"a,1", b"b,2"]
+        mocked_iterate_queryset_in_chunks.assert_called_once_with(
+            queryset=mocked_access.get_subplot_downloads_data.return_value
+        )
+
+    @mock.patch.object(SubplotDownloadsView, "_write_headline_to_csv")
+    @mock.patch(f"{MODULE_PATH}.should_stream_download", return_value=False)
+    @mock.patch(f"{MODULE_PATH}.access")
+    def test_writes_small_download_in_full(
+        self,
+        mocked_access: mock.MagicMock,
+        mocked_should_stream_download: mock.MagicMock,
+        spy_write_headline_to_csv: mock.MagicMock,
+    ):
+        """
+        Given a subplots download which is not large enough to be streamed
+        When `_handle_csv()` is called from the `SubplotDownloadsView`
+        Then the records are written in full to an `HttpResponse`
+
+        Patches:
+            `mocked_access`: To return a fake merged queryset
+            `mocked_should_stream_download`: To treat the download as small
+            `spy_write_headline_to_csv`: For the main assertion
+        """
+        # Given
+        charts_request_param_models = [
+            _build_fake_chart_request_params(metric_group="timeseries")
+        ]
+        subplot_downloads_view = SubplotDownloadsView()
+
+        # When
+        response = subplot_downloads_view._handle_csv(
+            charts_request_param_models=charts_request_param_models
+        )
+
+        # Then
+        assert isinstance(response, HttpResponse)
+        assert not response.streaming
+        spy_write_headline_to_csv.assert_called_once_with(
+            metric_group="timeseries",
+            queryset=mocked_access.get_subplot_downloads_data.return_value,
+            response=response,
+            headers=None,
+        )
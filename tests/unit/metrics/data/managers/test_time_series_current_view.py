@@ -0,0 +1,167 @@
+import datetime
+
+import pytest
+
+from metrics.data.managers.time_series_current_view import (
+    CurrentViewEntry,
+    TimeSeriesRecord,
+    build_current_view_entries,
+)
+
+FIRST_REFRESH_DATE = datetime.datetime(2023, 8, 10, tzinfo=datetime.UTC)
+SECOND_REFRESH_DATE = datetime.datetime(2023, 8, 11, tzinfo=datetime.UTC)
+THIRD_REFRESH_DATE = datetime.datetime(2023, 8, 12, tzinfo=datetime.UTC)
+EARLY_EMBARGO = datetime.datetime(2023, 9, 1, tzinfo=datetime.UTC)
+LATE_EMBARGO = datetime.datetime(2023, 9, 8, tzinfo=datetime.UTC)
+
+
+class TestBuildCurrentViewEntries:
+    def test_latest_released_record_supersedes_older_records(self):
+        """
+        Given records from 2 rounds without any embargo
+        When `build_current_view_entries()` is called
+        Then only the record from the latest round is given an entry
+        And that entry is live indefinitely
+        """
+        # Given
+        records = [
+            TimeSeriesRecord(id=1, refresh_date=FIRST_REFRESH_DATE, embargo=None),
+            TimeSeriesRecord(id=2, refresh_date=SECOND_REFRESH_DATE, embargo=None),
+        ]
+
+        # When
+        entries = list(
+            build_current_view_entries(
+                records=records, null_refresh_date_is_latest=False
+            )
+        )
+
+        # Then
+        assert entries == [
+            CurrentViewEntry(time_series_id=2, released_at=None, superseded_at=None)
+        ]
+
+    def test_older_records_are_live_until_newer_records_are_released(self):
+        """
+        Given records from 3 rounds
+        And the latest 2 rounds are under embargo
+        When `build_current_view_entries()` is called
+        Then each record is live from its own embargo
+            until the earliest embargo of the newer rounds
+        """
+        # Given
+        records = [
+            TimeSeriesRecord(id=1, refresh_date=FIRST_REFRESH_DATE, embargo=None),
+            TimeSeriesRecord(
+                id=2, refresh_date=SECOND_REFRESH_DATE, embargo=EARLY_EMBARGO
+            ),
+            TimeSeriesRecord(
+                id=3, refresh_date=THIRD_REFRESH_DATE, embargo=LATE_EMBARGO
+            ),
+        ]
+
+        # When
+        entries = list(
+            build_current_view_entries(
+                records=records, null_refresh_date_is_latest=False
+            )
+        )
+
+        # Then
+        assert entries == [
+            CurrentViewEntry(
+                time_series_id=3, released_at=LATE_EMBARGO, superseded_at=None
+            ),
+            CurrentViewEntry(
+                time_series_id=2,
+                released_at=EARLY_EMBARGO,
+                superseded_at=LATE_EMBARGO,
+            ),
+            CurrentViewEntry(
+                time_series_id=1, released_at=None, superseded_at=EARLY_EMBARGO
+            ),
+        ]
+
+    def test_record_superseded_before_release_is_omitted(self):
+        """
+        Given an older record which is released after a newer record
+        When `build_current_view_entries()` is called
+        Then the older record is not given an entry
+        """
+        # Given
+        records = [
+            TimeSeriesRecord(
+                id=1, refresh_date=FIRST_REFRESH_DATE, embargo=LATE_EMBARGO
+            ),
+            TimeSeriesRecord(
+                id=2, refresh_date=SECOND_REFRESH_DATE, embargo=EARLY_EMBARGO
+            ),
+        ]
+
+        # When
+        entries = list(
+            build_current_view_entries(
+                records=records, null_refresh_date_is_latest=False
+            )
+        )
+
+        # Then
+        assert entries == [
+            CurrentViewEntry(
+                time_series_id=2, released_at=EARLY_EMBARGO, superseded_at=None
+            )
+        ]
+
+    def test_records_with_the_same_refresh_date_are_all_live(self):
+        """
+        Given 2 records with the same latest `refresh_date`
+        When `build_current_view_entries()` is called
+        Then both records are given an entry
+        """
+        # Given
+        records = [
+            TimeSeriesRecord(id=1, refresh_date=SECOND_REFRESH_DATE, embargo=None),
+            TimeSeriesRecord(id=2, refresh_date=SECOND_REFRESH_DATE, embargo=None),
+            TimeSeriesRecord(id=3, refresh_date=FIRST_REFRESH_DATE, embargo=None),
+        ]
+
+        # When
+        entries = list(
+            build_current_view_entries(
+                records=records, null_refresh_date_is_latest=False
+            )
+        )
+
+        # Then
+        assert {entry.time_series_id for entry in entries} == {1, 2}
+
+    @pytest.mark.parametrize(
+        "null_refresh_date_is_latest, expected_time_series_id",
+        ([True, 1], [False, 2]),
+    )
+    def test_records_without_refresh_date_are_ranked_by_switch(
+        self, null_refresh_date_is_latest: bool, expected_time_series_id: int
+    ):
+        """
+        Given a record without a `refresh_date`
+        And a record with a `refresh_date`
+        When `build_current_view_entries()` is called
+        Then the record without a `refresh_date` is ranked
+            according to the `null_refresh_date_is_latest` switch
+        """
+        # Given
+        records = [
+            TimeSeriesRecord(id=1, refresh_date=None, embargo=None),
+            TimeSeriesRecord(id=2, refresh_date=FIRST_REFRESH_DATE, embargo=None),
+        ]
+
+        # When
+        entries = list(
+            build_current_view_entries(
+                records=records,
+                null_refresh_date_is_latest=null_refresh_date_is_latest,
+            )
+        )
+
+        # Then
+        assert [entry.time_series_id for entry in entries] == [expected_time_series_id]
@@ -0,0 +1,329 @@
+import io
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from metrics.domain.bulk_downloads.archive import (
+    ArchiveManifest,
+    build_bulk_downloads_archive,
+    build_archive_name,
+    build_manifest_name,
+    open_bulk_downloads_archive,
+    rebuild_bulk_downloads_archives,
+)
+from metrics.domain.bulk_downloads.member_index import DownloadMemberIndex
+from metrics.domain.bulk_downloads.storage import LocalFileSystemStorage
+
+MODULE_PATH = "metrics.domain.bulk_downloads.archive"
+
+
+class FakeDownloadsGetter:
+    """Returns downloads for a fixed set of charts, reusing previous content if possible"""
+
+    def __init__(self, charts: dict[str, bytes]):
+        self.charts = charts
+        self.fetched_charts: list[str] = []
+
+    def __call__(
+        self, *, file_format: str, download_member_index: DownloadMemberIndex
+    ) -> list[dict]:
+        downloads = []
+        for name, content in self.charts.items():
+            fingerprint = f"{name}-{content.decode()}"
+            previous_content = download_member_index.get_previous_content(
+                fingerprint=fingerprint
+            )
+            if previous_content is None:
+                self.fetched_charts.append(name)
+                previous_content = content
+
+            downloads.append(
+                {"name": name, "content": previous_content, "fingerprint": fingerprint}
+            )
+
+        return [{"directory_name": "landing_page", "downloads": downloads}]
+
+
+class TestBuildBulkDownloadsArchive:
+    def test_builds_and_stores_archive(self, tmp_path: Path):
+        """
+        Given no previously built archive
+        When `build_bulk_downloads_archive()` is called
+        Then the archive is stored with each of the downloads
+        And the stored manifest describes the archive
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+        fake_downloads_getter = FakeDownloadsGetter(
+            charts={"cases.csv": b"1", "deaths.csv": b"2"}
+        )
+
+        # When
+        manifest: ArchiveManifest = build_bulk_downloads_archive(
+            storage=storage,
+            file_format="csv",
+            data_version_resolver=mock.Mock(),
+            downloads_getter=fake_downloads_getter,
+        )
+
+        # Then
+        archive = open_bulk_downloads_archive(storage=storage, file_format="csv")
+        assert archive.manifest == manifest
+        with zipfile.ZipFile(io.BytesIO(archive.file.read())) as zipf:
+            assert zipf.read("landing_page/cases.csv") == b"1"
+            assert zipf.read("landing_page/deaths.csv") == b"2"
+        archive.file.close()
+
+        assert manifest.members == {"cases.csv-1": 0, "deaths.csv-2": 1}
+        assert fake_downloads_getter.fetched_charts == ["cases.csv", "deaths.csv"]
+
+    def test_only_fetches_changed_downloads_on_rebuild(self, tmp_path: Path):
+        """
+        Given a previously built archive
+        And a subsequent change to the data for only 1 of the charts
+        When `build_bulk_downloads_archive()` is called again
+        Then only the changed download is fetched
+        And the new archive holds the content for both charts
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+        build_bulk_downloads_archive(
+            storage=storage,
+            file_format="csv",
+            data_version_resolver=mock.Mock(),
+            downloads_getter=FakeDownloadsGetter(
+                charts={"cases.csv": b"1", "deaths.csv": b"2"}
+            ),
+        )
+        fake_downloads_getter = FakeDownloadsGetter(
+            charts={"cases.csv": b"1", "deaths.csv": b"3"}
+        )
+
+        # When
+        manifest: ArchiveManifest = build_bulk_downloads_archive(
+            storage=storage,
+            file_format="csv",
+            data_version_resolver=mock.Mock(),
+            downloads_getter=fake_downloads_getter,
+        )
+
+        # Then
+        assert fake_downloads_getter.fetched_charts == ["deaths.csv"]
+        archive = open_bulk_downloads_archive(storage=storage, file_format="csv")
+        with zipfile.ZipFile(io.BytesIO(archive.file.read())) as zipf:
+            assert zipf.read("landing_page/cases.csv") == b"1"
+            assert zipf.read("landing_page/deaths.csv") == b"3"
+        archive.file.close()
+        assert archive.manifest == manifest
+
+    def test_unchanged_archive_is_not_stored_again(self, tmp_path: Path):
+        """
+        Given a previously built archive
+        When `build_bulk_downloads_archive()` is called
+            without any changes to the downloads
+        Then the previous manifest is returned
+        And nothing is saved to the storage
+
+        Patches:
+            `spy_save`: For the main assertion
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+        charts = {"cases.csv": b"1"}
+        previous_manifest = build_bulk_downloads_archive(
+            storage=storage,
+            file_format="csv",
+            data_version_resolver=mock.Mock(),
+            downloads_getter=FakeDownloadsGetter(charts=charts),
+        )
+
+        # When
+        with mock.patch.object(storage, "save") as spy_save:
+            manifest = build_bulk_downloads_archive(
+                storage=storage,
+                file_format="csv",
+                data_version_resolver=mock.Mock(),
+                downloads_getter=FakeDownloadsGetter(charts=charts),
+            )
+
+        # Then
+        assert manifest == previous_manifest
+        spy_save.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "previous_archive_content",
+        (
+            None,
+            b"not a zip file",
+        ),
+    )
+    def test_fetches_all_downloads_when_previous_archive_is_unusable(
+        self, previous_archive_content: bytes | None, tmp_path: Path
+    ):
+        """
+        Given a previously built archive
+        And the stored archive has since gone missing or been corrupted
+        When `build_bulk_downloads_archive()` is called again
+        Then all the downloads are fetched
+        And the new archive is stored
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+        charts = {"cases.csv": b"1", "deaths.csv": b"2"}
+        build_bulk_downloads_archive(
+            storage=storage,
+            file_format="csv",
+            data_version_resolver=mock.Mock(),
+            downloads_getter=FakeDownloadsGetter(charts=charts),
+        )
+        archive_path: Path = tmp_path / build_archive_name(file_format="csv")
+        if previous_archive_content is None:
+            archive_path.unlink()
+        else:
+            archive_path.write_bytes(previous_archive_content)
+        fake_downloads_getter = FakeDownloadsGetter(charts=charts)
+
+        # When
+        build_bulk_downloads_archive(
+            storage=storage,
+            file_format="csv",
+            data_version_resolver=mock.Mock(),
+            downloads_getter=fake_downloads_getter,
+        )
+
+        # Then
+        assert fake_downloads_getter.fetched_charts == ["cases.csv", "deaths.csv"]
+        archive = open_bulk_downloads_archive(storage=storage, file_format="csv")
+        with zipfile.ZipFile(io.BytesIO(archive.file.read())) as zipf:
+            assert zipf.read("landing_page/cases.csv") == b"1"
+        archive.file.close()
+
+
+class TestOpenBulkDownloadsArchive:
+    def test_returns_none_when_archive_has_not_been_built(self, tmp_path: Path):
+        """
+        Given no previously built archive
+        When `open_bulk_downloads_archive()` is called
+        Then None is returned
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+
+        # When
+        archive = open_bulk_downloads_archive(storage=storage, file_format="csv")
+
+        # Then
+        assert archive is None
+
+    def test_returns_none_when_manifest_is_invalid(
+        self, tmp_path: Path, caplog: LogCaptureFixture
+    ):
+        """
+        Given a stored manifest which cannot be parsed
+        When `open_bulk_downloads_archive()` is called
+        Then None is returned
+        And a warning is logged
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+        storage.save(
+            name=build_manifest_name(file_format="csv"),
+            file=io.BytesIO(b'{"file_format": "csv"}'),
+        )
+
+        # When
+        archive = open_bulk_downloads_archive(storage=storage, file_format="csv")
+
+        # Then
+        assert archive is None
+        assert "Discarding invalid bulk downloads manifest for `csv`" in caplog.text
+
+    def test_returns_none_when_archive_is_missing_for_manifest(self, tmp_path: Path):
+        """
+        Given a stored manifest
+        And no corresponding stored archive
+        When `open_bulk_downloads_archive()` is called
+        Then None is returned
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+        build_bulk_downloads_archive(
+            storage=storage,
+            file_format="csv",
+            data_version_resolver=mock.Mock(),
+            downloads_getter=FakeDownloadsGetter(charts={"cases.csv": b"1"}),
+        )
+        (tmp_path / build_archive_name(file_format="csv")).unlink()
+
+        # When
+        archive = open_bulk_downloads_archive(storage=storage, file_format="csv")
+
+        # Then
+        assert archive is None
+
+
+class TestRebuildBulkDownloadsArchives:
+    @mock.patch(f"{MODULE_PATH}.build_bulk_downloads_archive")
+    def test_builds_archive_for_each_file_format(
+        self, spy_build_bulk_downloads_archive: mock.MagicMock
+    ):
+        """
+        Given a storage for the archives
+        When `rebuild_bulk_downloads_archives()` is called
+        Then an archive is built for both csv and json
+
+        Patches:
+            `spy_build_bulk_downloads_archive`: For the main assertion
+        """
+        # Given
+        mocked_storage = mock.Mock()
+        fake_data_version_resolver = mock.Mock()
+
+        # When
+        manifests = rebuild_bulk_downloads_archives(
+            storage=mocked_storage, data_version_resolver=fake_data_version_resolver
+        )
+
+        # Then
+        spy_build_bulk_downloads_archive.assert_has_calls(
+            calls=[
+                mock.call(
+                    storage=mocked_storage,
+                    file_format="csv",
+                    data_version_resolver=fake_data_version_resolver,
+                ),
+                mock.call(
+                    storage=mocked_storage,
+                    file_format="json",
+                    data_version_resolver=fake_data_version_resolver,
+                ),
+            ],
+            any_order=False,
+        )
+        assert manifests == [spy_build_bulk_downloads_archive.return_value] * 2
+
+    @mock.patch(f"{MODULE_PATH}.get_bulk_downloads_storage", return_value=None)
+    @mock.patch(f"{MODULE_PATH}.build_bulk_downloads_archive")
+    def test_does_nothing_when_disabled(
+        self,
+        spy_build_bulk_downloads_archive: mock.MagicMock,
+        mocked_get_bulk_downloads_storage: mock.MagicMock,
+    ):
+        """
+        Given precomputed bulk downloads archives have been disabled
+        When `rebuild_bulk_downloads_archives()` is called
+        Then no archives are built
+
+        Patches:
+            `spy_build_bulk_downloads_archive`: For the main assertion
+            `mocked_get_bulk_downloads_storage`: To disable the storage
+        """
+        # Given / When
+        manifests = rebuild_bulk_downloads_archives(data_version_resolver=mock.Mock())
+
+        # Then
+        assert manifests == []
+        spy_build_bulk_downloads_archive.assert_not_called()
@@ -3,6 +3,7 @@ from unittest import mock
 
 from metrics.domain.bulk_downloads.get_downloads_archive import (
     get_bulk_downloads_archive,
+    stream_bulk_downloads_archive,
 )
 
 MODULE_PATH = "metrics.domain.bulk_downloads.get_downloads_archive"
@@ -78,3 +79,35 @@ class TestGetBulkDownloadsArchive:
         # Then
         expected_zip_file_data = spy_write_data_to_zip.return_value
         assert expected_zip_file_data == expected_zip_file["zip_file_data"]
+
+
+class TestStreamBulkDownloadsArchive:
+    @mock.patch(f"{MODULE_PATH}.iterate_all_downloads")
+    @mock.patch(f"{MODULE_PATH}.stream_data_to_zip")
+    def test_delegates_calls_correctly(
+        self,
+        spy_stream_data_to_zip: mock.MagicMock,
+        spy_iterate_all_downloads: mock.MagicMock,
+    ):
+        """
+        Given a fake file_format
+        When `stream_bulk_downloads_archive()` is called
+        Then the lazily collected downloads are passed to `stream_data_to_zip()`
+
+        Patches:
+            `spy_stream_data_to_zip`: For the main assertion
+            `spy_iterate_all_downloads`: To check the downloads
+                passed to `stream_data_to_zip()`
+        """
+        # Given
+        fake_file_format = "json"
+
+        # When
+        zip_file_stream = stream_bulk_downloads_archive(file_format=fake_file_format)
+
+        # Then
+        spy_iterate_all_downloads.assert_called_once_with(file_format=fake_file_format)
+        spy_stream_data_to_zip.assert_called_once_with(
+            downloads=spy_iterate_all_downloads.return_value
+        )
+        assert zip_file_stream == spy_stream_data_to_zip.return_value
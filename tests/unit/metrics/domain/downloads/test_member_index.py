@@ -0,0 +1,171 @@
+import io
+import zipfile
+from unittest import mock
+
+from metrics.domain.bulk_downloads.member_index import (
+    DownloadMemberIndex,
+    extract_metric_names,
+)
+
+
+class TestExtractMetricNames:
+    def test_extracts_metrics_from_nested_payload(self):
+        """
+        Given a downloads payload which references metrics
+            within its plots and its static fields
+        When `extract_metric_names()` is called
+        Then the distinct metric names are returned
+        """
+        # Given
+        request_data = {
+            "plots": [
+                {"metric": "COVID-19_cases_casesByDay", "topic": "COVID-19"},
+                {"metric": "COVID-19_deaths_ONSByDay", "topic": "COVID-19"},
+                {"metric": "COVID-19_cases_casesByDay", "topic": "COVID-19"},
+            ],
+            "static_fields": {"metric": "COVID-19_testing_PCRcountByDay"},
+            "file_format": "csv",
+        }
+
+        # When
+        metric_names = extract_metric_names(request_data=request_data)
+
+        # Then
+        assert metric_names == {
+            "COVID-19_cases_casesByDay",
+            "COVID-19_deaths_ONSByDay",
+            "COVID-19_testing_PCRcountByDay",
+        }
+
+
+class TestDownloadMemberIndex:
+    @staticmethod
+    def _build_previous_archive(contents: list[bytes]) -> zipfile.ZipFile:
+        file = io.BytesIO()
+        with zipfile.ZipFile(file, "w") as zipf:
+            for index, content in enumerate(contents):
+                zipf.writestr(f"page/chart_{index}.csv", content)
+        return zipfile.ZipFile(file)
+
+    def test_fingerprint_changes_with_data_version(self):
+        """
+        Given the same downloads payload
+        When `build_fingerprint()` is called
+            before and after the data version has changed
+        Then the fingerprints are different
+        """
+        # Given
+        request_data = {"plots": [{"metric": "COVID-19_cases_casesByDay"}]}
+        first_index = DownloadMemberIndex(data_version_resolver=lambda _: "v1")
+        second_index = DownloadMemberIndex(data_version_resolver=lambda _: "v2")
+
+        # When
+        first_fingerprint = first_index.build_fingerprint(request_data=request_data)
+        second_fingerprint = second_index.build_fingerprint(request_data=request_data)
+
+        # Then
+        assert first_fingerprint != second_fingerprint
+        assert first_fingerprint == first_index.build_fingerprint(
+            request_data=request_data
+        )
+
+    def test_data_version_is_resolved_once_per_set_of_metrics(self):
+        """
+        Given 2 downloads payloads which reference the same metric
+        When `build_fingerprint()` is called for each payload
+        Then the data version is only resolved once
+        """
+        # Given
+        spy_data_version_resolver = mock.Mock(return_value="v1")
+        download_member_index = DownloadMemberIndex(
+            data_version_resolver=spy_data_version_resolver
+        )
+
+        # When
+        for file_format in ("csv", "json"):
+            download_member_index.build_fingerprint(
+                request_data={
+                    "plots": [{"metric": "COVID-19_cases_casesByDay"}],
+                    "file_format": file_format,
+                }
+            )
+
+        # Then
+        spy_data_version_resolver.assert_called_once_with(
+            frozenset({"COVID-19_cases_casesByDay"})
+        )
+
+    def test_get_previous_content_reads_member_from_previous_archive(self):
+        """
+        Given a previous archive which holds a download with a known fingerprint
+        When `get_previous_content()` is called for that fingerprint
+        Then the content is read from the previous archive
+        And the download is counted as reused
+        """
+        # Given
+        previous_archive = self._build_previous_archive(contents=[b"a,b", b"c,d"])
+        download_member_index = DownloadMemberIndex(
+            data_version_resolver=mock.Mock(),
+            previous_archive=previous_archive,
+            previous_members={"fake-fingerprint": 1},
+        )
+
+        # When
+        content = download_member_index.get_previous_content(
+            fingerprint="fake-fingerprint"
+        )
+
+        # Then
+        assert content == b"c,d"
+        assert download_member_index.reused_count == 1
+        assert download_member_index.fetched_count == 0
+
+    def test_get_previous_content_returns_none_for_unknown_fingerprint(self):
+        """
+        Given a previous archive
+        When `get_previous_content()` is called for an unknown fingerprint
+        Then None is returned
+        And the download is counted as fetched
+        """
+        # Given
+        previous_archive = self._build_previous_archive(contents=[b"a,b"])
+        download_member_index = DownloadMemberIndex(
+            data_version_resolver=mock.Mock(),
+            previous_archive=previous_archive,
+            previous_members={"fake-fingerprint": 0},
+        )
+
+        # When
+        content = download_member_index.get_previous_content(
+            fingerprint="changed-fingerprint"
+        )
+
+        # Then
+        assert content is None
+        assert download_member_index.fetched_count == 1
+
+    def test_get_previous_content_returns_none_for_missing_member(self):
+        """
+        Given a previous archive
+        And a known fingerprint whose member position is not in that archive
+        When `get_previous_content()` is called for that fingerprint
+        Then None is returned
+        And the download is counted as fetched
+        """
+        # Given
+        previous_archive = self._build_previous_archive(contents=[b"a,b"])
+        download_member_index = DownloadMemberIndex(
+            data_version_resolver=mock.Mock(),
+            previous_archive=previous_archive,
+            previous_members={"fake-fingerprint": 3},
+        )
+
+        # When
+        content = download_member_index.get_previous_content(
+            fingerprint="fake-fingerprint"
+        )
+
+        # Then
+        assert content is None
+        assert download_member_index.reused_count == 0
+        assert download_member_index.fetched_count == 1
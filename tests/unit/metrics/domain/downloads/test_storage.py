@@ -0,0 +1,274 @@
+import io
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from _pytest.logging import LogCaptureFixture
+
+from metrics.domain.bulk_downloads.storage import (
+    LocalFileSystemStorage,
+    S3Storage,
+    get_bulk_downloads_storage,
+)
+
+MODULE_PATH = "metrics.domain.bulk_downloads.storage"
+
+
+class TestLocalFileSystemStorage:
+    def test_saved_item_can_be_opened(self, tmp_path: Path):
+        """
+        Given an instance of the `LocalFileSystemStorage`
+        When `save()` is called for an item
+        Then the item can be read back with `load()`
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path / "bulk_downloads"))
+        fake_content = b"abc" * 100
+
+        # When
+        storage.save(name="fake_archive.zip", file=io.BytesIO(fake_content))
+
+        # Then
+        assert storage.load(name="fake_archive.zip") == fake_content
+
+    def test_save_replaces_existing_item(self, tmp_path: Path):
+        """
+        Given an item which has already been saved
+        When `save()` is called again for the same item
+        Then the new contents replace the existing contents
+        And no temporary files are left behind
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+        storage.save(name="fake_archive.zip", file=io.BytesIO(b"old"))
+
+        # When
+        storage.save(name="fake_archive.zip", file=io.BytesIO(b"new"))
+
+        # Then
+        assert storage.load(name="fake_archive.zip") == b"new"
+        assert [path.name for path in tmp_path.iterdir()] == ["fake_archive.zip"]
+
+    def test_open_returns_none_for_missing_item(self, tmp_path: Path):
+        """
+        Given an instance of the `LocalFileSystemStorage` with no items
+        When `open()` is called
+        Then None is returned
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+
+        # When
+        opened_file = storage.open(name="fake_archive.zip")
+
+        # Then
+        assert opened_file is None
+
+    def test_save_removes_temporary_file_when_write_fails(self, tmp_path: Path):
+        """
+        Given an existing item in the `LocalFileSystemStorage`
+        And a file which fails part way through being read
+        When `save()` is called
+        Then the error is raised
+        And the existing item is left untouched
+        And no temporary file is left behind in the directory
+        """
+        # Given
+        storage = LocalFileSystemStorage(directory=str(tmp_path))
+        storage.save(name="fake_archive.zip", file=io.BytesIO(b"abc"))
+        mocked_file = mock.Mock()
+        mocked_file.read.side_effect = OSError
+
+        # When / Then
+        with pytest.raises(OSError):
+            storage.save(name="fake_archive.zip", file=mocked_file)
+
+        assert storage.load(name="fake_archive.zip") == b"abc"
+        assert [path.name for path in tmp_path.iterdir()] == ["fake_archive.zip"]
+
+
+class TestS3Storage:
+    def test_save_uploads_file_to_bucket(self):
+        """
+        Given an instance of the `S3Storage`
+        When `save()` is called
+        Then the file is uploaded to the bucket within the folder
+        """
+        # Given
+        spy_client = mock.Mock()
+        storage = S3Storage(client=spy_client, bucket_name="fake-bucket")
+        fake_file = io.BytesIO(b"abc")
+
+        # When
+        storage.save(name="fake_archive.zip", file=fake_file)
+
+        # Then
+        spy_client.upload_fileobj.assert_called_once_with(
+            Fileobj=fake_file,
+            Bucket="fake-bucket",
+            Key="bulk_downloads/fake_archive.zip",
+        )
+
+    def test_open_returns_body_of_object(self):
+        """
+        Given an instance of the `S3Storage`
+        When `open()` is called
+        Then the body of the object is returned
+        """
+        # Given
+        spy_client = mock.MagicMock()
+        storage = S3Storage(client=spy_client, bucket_name="fake-bucket")
+
+        # When
+        opened_file = storage.open(name="fake_archive.zip")
+
+        # Then
+        spy_client.get_object.assert_called_once_with(
+            Bucket="fake-bucket", Key="bulk_downloads/fake_archive.zip"
+        )
+        assert opened_file == spy_client.get_object.return_value["Body"]
+
+    def test_open_returns_none_for_missing_object(self):
+        """
+        Given an instance of the `S3Storage`
+        And an object which does not exist in the bucket
+        When `open()` is called
+        Then None is returned
+        """
+        # Given
+        mocked_client = mock.Mock()
+        mocked_client.exceptions.NoSuchKey = KeyError
+        mocked_client.get_object.side_effect = KeyError
+        storage = S3Storage(client=mocked_client, bucket_name="fake-bucket")
+
+        # When
+        opened_file = storage.open(name="fake_archive.zip")
+
+        # Then
+        assert opened_file is None
+
+    @mock.patch(f"{MODULE_PATH}.boto3")
+    @mock.patch(f"{MODULE_PATH}.config.AWS_PROFILE_NAME", "fake-profile")
+    def test_creates_client_with_configured_aws_profile(
+        self, spy_boto3: mock.MagicMock
+    ):
+        """
+        Given the `AWS_PROFILE_NAME` is set
+        When an `S3Storage` is created without a client
+        Then a boto3 s3 client is created for the configured profile
+
+        Patches:
+            `spy_boto3`: For the main assertion
+            `AWS_PROFILE_NAME`: To set the profile
+        """
+        # Given / When
+        storage = S3Storage(bucket_name="fake-bucket")
+
+        # Then
+        spy_boto3.setup_default_session.assert_called_once_with(
+            profile_name="fake-profile"
+        )
+        spy_boto3.client.assert_called_once_with("s3")
+        assert storage._client == spy_boto3.client.return_value
+
+    @mock.patch(f"{MODULE_PATH}.boto3")
+    @mock.patch(f"{MODULE_PATH}.config.AWS_PROFILE_NAME", None)
+    def test_creates_client_with_default_session(self, spy_boto3: mock.MagicMock):
+        """
+        Given the `AWS_PROFILE_NAME` is not set
+        When an `S3Storage` is created without a client
+        Then a boto3 s3 client is created from the default session
+
+        Patches:
+            `spy_boto3`: For the main assertion
+            `AWS_PROFILE_NAME`: To unset the profile
+        """
+        # Given / When
+        S3Storage(bucket_name="fake-bucket")
+
+        # Then
+        spy_boto3.setup_default_session.assert_not_called()
+        spy_boto3.client.assert_called_once_with("s3")
+
+
+class TestGetBulkDownloadsStorage:
+    @pytest.mark.parametrize(
+        "backend, expected_storage_class",
+        (
+            ["local", LocalFileSystemStorage],
+            ["LOCAL", LocalFileSystemStorage],
+        ),
+    )
+    def test_returns_storage_for_configured_backend(
+        self, backend: str, expected_storage_class: type
+    ):
+        """
+        Given the `BULK_DOWNLOADS_STORAGE_BACKEND` is set
+        When `get_bulk_downloads_storage()` is called
+        Then the storage for the configured backend is returned
+
+        Patches:
+            `BULK_DOWNLOADS_STORAGE_BACKEND`: To set the backend
+        """
+        # Given
+        with mock.patch(
+            f"{MODULE_PATH}.config.BULK_DOWNLOADS_STORAGE_BACKEND", backend
+        ):
+            # When
+            storage = get_bulk_downloads_storage()
+
+        # Then
+        assert isinstance(storage, expected_storage_class)
+
+    @mock.patch.object(S3Storage, "_create_client")
+    @mock.patch(f"{MODULE_PATH}.config.BULK_DOWNLOADS_STORAGE_BACKEND", "s3")
+    def test_returns_s3_storage(self, mocked_create_client: mock.MagicMock):
+        """
+        Given the `BULK_DOWNLOADS_STORAGE_BACKEND` is set to "s3"
+        When `get_bulk_downloads_storage()` is called
+        Then an `S3Storage` is returned
+
+        Patches:
+            `BULK_DOWNLOADS_STORAGE_BACKEND`: To set the backend
+            `mocked_create_client`: To remove the side effect
+                of creating a boto3 client
+        """
+        # Given / When
+        storage = get_bulk_downloads_storage()
+
+        # Then
+        assert isinstance(storage, S3Storage)
+
+    @mock.patch(f"{MODULE_PATH}.config.BULK_DOWNLOADS_STORAGE_BACKEND", "")
+    def test_returns_none_when_disabled(self):
+        """
+        Given the `BULK_DOWNLOADS_STORAGE_BACKEND` is set to an empty string
+        When `get_bulk_downloads_storage()` is called
+        Then None is returned
+
+        Patches:
+            `BULK_DOWNLOADS_STORAGE_BACKEND`: To disable precomputed archives
+        """
+        # Given / When
+        storage = get_bulk_downloads_storage()
+
+        # Then
+        assert storage is None
+
+    @mock.patch(f"{MODULE_PATH}.config.BULK_DOWNLOADS_STORAGE_BACKEND", "redis")
+    def test_returns_none_for_unknown_backend(self, caplog: LogCaptureFixture):
+        """
+        Given the `BULK_DOWNLOADS_STORAGE_BACKEND` is set to an unknown backend
+        When `get_bulk_downloads_storage()` is called
+        Then None is returned
+        And a warning is logged
+
+        Patches:
+            `BULK_DOWNLOADS_STORAGE_BACKEND`: To set an unknown backend
+        """
+        # Given / When
+        storage = get_bulk_downloads_storage()
+
+        # Then
+        assert storage is None
+        assert "Unknown bulk downloads storage backend `redis`" in caplog.text
@@ -1,7 +1,12 @@
 import datetime
 import io
 
-from metrics.domain.exports.csv_output import FIELDS, write_data_to_csv
+from metrics.domain.exports.csv_output import (
+    FIELDS,
+    join_lines_into_chunks,
+    stream_data_to_csv,
+    write_data_to_csv,
+)
 from tests.fakes.factories.metrics.core_time_series_factory import (
     FakeCoreTimeSeriesFactory,
 )
@@ -91,3 +96,68 @@ class TestWriteDataToCSV:
         ]
         assert csv_header == self.expected_csv_header
         assert csv_body == expected_csv_body
+
+
+class TestStreamDataToCSV:
+    def test_output_matches_write_data_to_csv(self):
+        """
+        Given an iterable of rows
+        When `stream_data_to_csv()` is consumed
+        Then the output matches that of `write_data_to_csv()`
+        """
+        # Given
+        rows = [
+            ("infectious_disease", "respiratory", "COVID-19", "2023-03-08", 2364),
+            ("infectious_disease", "respiratory", "COVID-19", "2023-03-07", 2318),
+        ]
+        headers = ["theme", "sub_theme", "topic", "date", "metric_value"]
+        expected_file = write_data_to_csv(
+            file=io.StringIO(), core_time_series_queryset=rows, headers=headers
+        )
+
+        # When
+        streamed_output = "".join(stream_data_to_csv(rows=iter(rows), headers=headers))
+
+        # Then
+        assert streamed_output == expected_file.getvalue()
+
+    def test_yields_header_before_consuming_rows(self):
+        """
+        Given a lazy iterable of rows
+        When the first chunk is taken from `stream_data_to_csv()`
+        Then the header row is returned
+        And no rows have been consumed
+        """
+        # Given
+        consumed_rows: list[tuple] = []
+
+        def fake_rows_generator():
+            for row in [("a", 1), ("b", 2)]:
+                consumed_rows.append(row)
+                yield row
+
+        # When
+        first_chunk: str = next(
+            stream_data_to_csv(rows=fake_rows_generator(), headers=["name", "value"])
+        )
+
+        # Then
+        assert first_chunk == "name,value\r\n"
+        assert consumed_rows == []
+
+
+class TestJoinLinesIntoChunks:
+    def test_joins_lines_into_chunks_of_given_size(self):
+        """
+        Given 5 lines
+        When `join_lines_into_chunks()` is called with 2 lines per chunk
+        Then 3 chunks are yielded, the last holding the remaining line
+        """
+        # Given
+        lines = ["a", "b", "c", "d", "e"]
+
+        # When
+        chunks = list(join_lines_into_chunks(lines=lines, lines_per_chunk=2))
+
+        # Then
+        assert chunks == ["ab", "cd", "e"]
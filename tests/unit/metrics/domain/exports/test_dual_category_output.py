@@ -4,7 +4,9 @@ import pytest
 
 from metrics.domain.exports.dual_category_output import (
     build_dual_category_csv_headers,
+    iterate_pivoted_dual_category_download_rows,
     pivot_dual_category_download_rows,
+    stream_dual_category_data_to_csv,
     write_dual_category_data_to_csv,
 )
 
@@ -96,3 +98,64 @@ class TestDualCategoryCsvOutput:
         assert "lead_headline_ratesByAgeSex" in data_row
         assert "default" in data_row
         assert "00-01,12.3,11.8" in data_row
+
+
+class TestIteratePivotedDualCategoryDownloadRows:
+    def test_matches_pivot_for_rows_ordered_by_x_axis(self):
+        """
+        Given timeseries rows ordered by date
+        When `iterate_pivoted_dual_category_download_rows()` is consumed
+        Then the output matches that of `pivot_dual_category_download_rows()`
+        """
+        # Given
+        rows = [
+            {"metric": "abc", "date": "2024-01-08", "sex": "f", "metric_value": 3},
+            {"metric": "abc", "date": "2024-01-08", "sex": "m", "metric_value": 4},
+            {"metric": "abc", "date": "2024-01-01", "sex": "f", "metric_value": 1},
+            {"metric": "abc", "date": "2024-01-01", "sex": "m", "metric_value": 2},
+        ]
+        expected_rows = pivot_dual_category_download_rows(
+            rows=rows, x_axis="date", secondary_category="sex"
+        )
+
+        # When
+        pivoted_rows = list(
+            iterate_pivoted_dual_category_download_rows(
+                rows=iter(rows), x_axis="date", secondary_category="sex"
+            )
+        )
+
+        # Then
+        assert pivoted_rows == expected_rows
+        assert pivoted_rows[0] == {
+            "date": "2024-01-08",
+            "metric": "abc",
+            "f": 3,
+            "m": 4,
+        }
+
+
+class TestStreamDualCategoryDataToCsv:
+    def test_output_matches_write_dual_category_data_to_csv(self):
+        """
+        Given pivoted download rows and CSV headers
+        When `stream_dual_category_data_to_csv()` is consumed
+        Then the output matches that of `write_dual_category_data_to_csv()`
+        """
+        # Given
+        rows = [
+            {"metric": "abc", "date": "2024-01-08", "f": 3, "m": 4},
+            {"metric": "abc", "date": "2024-01-01", "f": 1, "m": 2},
+        ]
+        headers = ["metric", "date", "f", "m"]
+        expected_output = write_dual_category_data_to_csv(
+            file=io.StringIO(), rows=rows, headers=headers
+        )
+
+        # When
+        streamed_output = "".join(
+            stream_dual_category_data_to_csv(rows=iter(rows), headers=headers)
+        )
+
+        # Then
+        assert streamed_output == expected_output.getvalue()
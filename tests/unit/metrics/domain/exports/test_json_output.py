@@ -0,0 +1,86 @@
+import datetime
+import decimal
+import json
+
+from metrics.domain.exports.json_output import stream_json_array
+
+
+class TestStreamJSONArray:
+    def test_output_is_valid_json_array(self):
+        """
+        Given an iterable of records
+        When `stream_json_array()` is consumed
+        Then the output decodes to the same records
+        """
+        # Given
+        records = [
+            {"date": "2023-03-08", "metric_value": 2364},
+            {"date": "2023-03-07", "metric_value": 2318},
+            {"date": "2023-03-06", "metric_value": 2001},
+        ]
+
+        # When
+        streamed_output = "".join(
+            stream_json_array(items=iter(records), items_per_chunk=2)
+        )
+
+        # Then
+        assert json.loads(streamed_output) == records
+
+    def test_empty_iterable_is_encoded_as_empty_array(self):
+        """
+        Given an empty iterable
+        When `stream_json_array()` is consumed
+        Then an empty JSON array is returned
+        """
+        # Given
+        records = iter([])
+
+        # When
+        streamed_output = "".join(stream_json_array(items=records))
+
+        # Then
+        assert streamed_output == "[]"
+
+    def test_nested_iterators_are_encoded_as_nested_arrays(self):
+        """
+        Given an iterator of iterators of records
+        When `stream_json_array()` is consumed
+        Then the output decodes to an array of arrays of the records
+        """
+        # Given
+        subplots = (
+            iter([{"geography": geography, "metric_value": value}])
+            for geography, value in (("England", 95), ("Darlington", 91))
+        )
+
+        # When
+        streamed_output = "".join(stream_json_array(items=subplots))
+
+        # Then
+        assert json.loads(streamed_output) == [
+            [{"geography": "England", "metric_value": 95}],
+            [{"geography": "Darlington", "metric_value": 91}],
+        ]
+
+    def test_dates_and_decimals_are_encoded(self):
+        """
+        Given a record which contains a date and a decimal
+        When `stream_json_array()` is consumed with the default encoder
+        Then the date and decimal are encoded as strings
+        """
+        # Given
+        records = [
+            {
+                "date": datetime.date(year=2023, month=3, day=8),
+                "metric_value": decimal.Decimal("1.5"),
+            }
+        ]
+
+        # When
+        streamed_output = "".join(stream_json_array(items=records))
+
+        # Then
+        assert json.loads(streamed_output) == [
+            {"date": "2023-03-08", "metric_value": "1.5"}
+        ]
@@ -1,8 +1,12 @@
+import io
+import zipfile
 from unittest import mock
 
 from _pytest.logging import LogCaptureFixture
 
 from metrics.domain.exports.zip import (
+    ZipStreamBuffer,
+    stream_data_to_zip,
     write_data_to_zip,
     write_directory_to_write_stream,
 )
@@ -177,3 +181,100 @@ class TestWriteDataToZip:
         # Then
         expected_log = "Failed to write bulk downloads to zip write stream."
         assert expected_log in caplog.text
+
+
+class TestStreamDataToZip:
+    def test_yields_chunks_of_valid_zip_file(self):
+        """
+        Given a valid list of downloads is provided
+        When the `stream_data_to_zip()` function is consumed
+        Then the chunks combine to a valid zip file
+            containing all of the downloads
+        """
+        # Given
+        fake_downloads = [
+            {
+                "directory_name": "group_one",
+                "downloads": [{"name": "chart_one.csv", "content": b"a,b\n1,2"}],
+            },
+            {
+                "directory_name": "group_two",
+                "downloads": [{"name": "chart_two.csv", "content": b"c,d\n3,4"}],
+            },
+        ]
+
+        # When
+        chunks = list(stream_data_to_zip(downloads=fake_downloads))
+
+        # Then
+        # 1 chunk for each group of downloads and 1 for the central directory
+        assert len(chunks) == 3
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zipf:
+            assert zipf.read("group_one/chart_one.csv") == b"a,b\n1,2"
+            assert zipf.read("group_two/chart_two.csv") == b"c,d\n3,4"
+
+    def test_yields_first_chunk_before_remaining_downloads_are_gathered(self):
+        """
+        Given a lazy iterable of downloads
+        When the first chunk is taken from `stream_data_to_zip()`
+        Then only the first group of downloads has been gathered
+        """
+        # Given
+        gathered_groups: list[str] = []
+
+        def fake_downloads_generator():
+            for directory_name in ("group_one", "group_two"):
+                gathered_groups.append(directory_name)
+                yield {
+                    "directory_name": directory_name,
+                    "downloads": [{"name": "chart.csv", "content": b"a,b"}],
+                }
+
+        # When
+        first_chunk: bytes = next(
+            stream_data_to_zip(downloads=fake_downloads_generator())
+        )
+
+        # Then
+        assert first_chunk
+        assert gathered_groups == ["group_one"]
+
+
+class TestZipStreamBuffer:
+    def test_is_writable_but_not_seekable(self):
+        """
+        Given an instance of the `ZipStreamBuffer`
+        When `writable()` and `seekable()` are called
+        Then the buffer reports that it can be written to
+        And that it cannot be seeked
+        """
+        # Given
+        zip_stream_buffer = ZipStreamBuffer()
+
+        # When
+        is_writable: bool = zip_stream_buffer.writable()
+        is_seekable: bool = zip_stream_buffer.seekable()
+
+        # Then
+        assert is_writable
+        assert not is_seekable
+
+    def test_drain_returns_written_bytes_and_empties_buffer(self):
+        """
+        Given an instance of the `ZipStreamBuffer` which has been written to
+        When `drain()` is called twice
+        Then all the written bytes are returned by the first call
+        And nothing is returned by the second call
+        """
+        # Given
+        zip_stream_buffer = ZipStreamBuffer()
+        zip_stream_buffer.write(b"abc")
+        zip_stream_buffer.write(b"def")
+
+        # When
+        first_chunk: bytes = zip_stream_buffer.drain()
+        second_chunk: bytes = zip_stream_buffer.drain()
+
+        # Then
+        assert first_chunk == b"abcdef"
+        assert second_chunk == b""
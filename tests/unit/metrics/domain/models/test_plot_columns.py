@@ -0,0 +1,294 @@
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from metrics.domain.models.plot_columns import (
+    PlotColumns,
+    find_first_true_index,
+    find_minimum_and_maximum,
+    has_values,
+    is_date_values,
+    to_date,
+    to_decimals,
+    to_list,
+)
+
+
+class TestPlotColumns:
+    def test_from_records_builds_typed_column_for_each_field(self):
+        """
+        Given a list of records with date, numeric, boolean and string values
+        When `from_records()` is called from the `PlotColumns` class
+        Then 1 array is held for each field
+        And each array is of the dtype for that field
+        """
+        # Given
+        records = [
+            {
+                "date": datetime.date(2024, 1, 1),
+                "metric_value": Decimal("1.2345"),
+                "in_reporting_delay_period": False,
+                "geography__name": "England",
+            },
+            {
+                "date": datetime.date(2024, 1, 2),
+                "metric_value": Decimal("6.789"),
+                "in_reporting_delay_period": True,
+                "geography__name": "Wales",
+            },
+        ]
+
+        # When
+        plot_columns = PlotColumns.from_records(records=records)
+
+        # Then
+        assert list(plot_columns) == [
+            "date",
+            "metric_value",
+            "in_reporting_delay_period",
+            "geography__name",
+        ]
+        assert plot_columns.number_of_rows == 2
+        assert plot_columns["date"].dtype == np.dtype("datetime64[D]")
+        assert plot_columns["metric_value"].dtype == np.float64
+        assert plot_columns["in_reporting_delay_period"].dtype == np.bool_
+        assert to_list(values=plot_columns["geography__name"]) == [
+            "England",
+            "Wales",
+        ]
+
+    def test_from_records_returns_empty_columns_when_no_records_are_provided(self):
+        """
+        Given no records
+        When `from_records()` is called from the `PlotColumns` class
+        Then no columns are held
+        And the returned object is falsy
+        """
+        # Given
+        records = []
+
+        # When
+        plot_columns = PlotColumns.from_records(records=records)
+
+        # Then
+        assert not plot_columns
+        assert plot_columns.number_of_rows == 0
+
+    def test_from_values_list_returns_empty_columns_when_no_rows_are_provided(self):
+        """
+        Given no rows of values
+        When `from_values_list()` is called from the `PlotColumns` class
+        Then no columns are held
+        And the returned object is falsy
+        """
+        # Given
+        fields = ["date", "metric_value"]
+        rows = []
+
+        # When
+        plot_columns = PlotColumns.from_values_list(fields=fields, rows=rows)
+
+        # Then
+        assert not plot_columns
+        assert plot_columns.number_of_rows == 0
+
+    def test_from_records_handles_a_single_field(self):
+        """
+        Given records which only hold a single field
+        When `from_records()` is called from the `PlotColumns` class
+        Then the column is built with every value
+        """
+        # Given
+        records = [{"metric_value": Decimal("1")}, {"metric_value": Decimal("2")}]
+
+        # When
+        plot_columns = PlotColumns.from_records(records=records)
+
+        # Then
+        assert to_list(values=plot_columns["metric_value"]) == [1, 2]
+
+    def test_columns_are_read_only(self):
+        """
+        Given a `PlotColumns` object
+        When a value within one of its columns is changed
+        Then a `ValueError` is raised
+        """
+        # Given
+        plot_columns = PlotColumns.from_records(
+            records=[{"metric_value": Decimal("1")}]
+        )
+
+        # When / Then
+        with pytest.raises(ValueError):
+            plot_columns["metric_value"][0] = 2
+
+
+class TestConversions:
+    def test_to_list_returns_missing_numeric_values_as_none(self):
+        """
+        Given a numeric column with a missing value
+        When `to_list()` is called
+        Then the missing value is returned as None
+        """
+        # Given
+        values = np.array([Decimal("1.5"), None], dtype=np.float64)
+
+        # When
+        converted_values = to_list(values=values)
+
+        # Then
+        assert converted_values == [1.5, None]
+
+    def test_to_list_returns_dates_as_date_objects(self):
+        """
+        Given a date column
+        When `to_list()` is called
+        Then `date` objects are returned
+        """
+        # Given
+        dates = [datetime.date(2024, 1, 1), datetime.date(2024, 2, 29)]
+        values = np.array(dates, dtype="datetime64[D]")
+
+        # When
+        converted_values = to_list(values=values)
+
+        # Then
+        assert converted_values == dates
+
+    def test_to_decimals_returns_values_to_the_stored_decimal_places(self):
+        """
+        Given a numeric column built from `Decimal` values with 4 decimal places
+        When `to_decimals()` is called
+        Then the original `Decimal` values are returned
+        And missing values are returned as None
+        """
+        # Given
+        decimals = [Decimal("12345678.1234"), Decimal("0.0001"), None]
+        values = np.array(decimals, dtype=np.float64)
+
+        # When
+        converted_values = to_decimals(values=values)
+
+        # Then
+        assert converted_values == decimals
+
+    def test_to_date_returns_date_object(self):
+        """
+        Given a `datetime64` value
+        When `to_date()` is called
+        Then a `date` object is returned
+        """
+        # Given
+        value = np.datetime64("2024-01-03")
+
+        # When
+        converted_value = to_date(value=value)
+
+        # Then
+        assert converted_value == datetime.date(2024, 1, 3)
+
+    @pytest.mark.parametrize(
+        "values",
+        (
+            [datetime.date(2024, 1, 1)],
+            np.array([datetime.date(2024, 1, 1)], dtype="datetime64[D]"),
+        ),
+    )
+    def test_is_date_values_returns_true_for_dates(self, values):
+        """
+        Given a list or a column of dates
+        When `is_date_values()` is called
+        Then True is returned
+        """
+        # Given / When / Then
+        assert is_date_values(values=values)
+
+    @pytest.mark.parametrize("values", (None, [], np.array([])))
+    def test_has_values_returns_false_for_no_values(self, values):
+        """
+        Given no values
+        When `has_values()` is called
+        Then False is returned
+        """
+        # Given / When / Then
+        assert not has_values(values=values)
+
+
+class TestFindFirstTrueIndex:
+    @pytest.mark.parametrize(
+        "values, expected_index",
+        (
+            [np.array([False, False, True, True]), 2],
+            [[False, True, True], 1],
+            [np.array([False, False]), None],
+            [[], None],
+            [[1, 1], None],
+        ),
+    )
+    def test_returns_correct_index(self, values, expected_index: int | None):
+        """
+        Given a list or a column of booleans
+        When `find_first_true_index()` is called
+        Then the index of the first `True` value is returned
+        """
+        # Given / When
+        index = find_first_true_index(values=values)
+
+        # Then
+        assert index == expected_index
+
+
+class TestFindMinimumAndMaximum:
+    def test_ignores_missing_values(self):
+        """
+        Given a numeric column with a missing value
+        When `find_minimum_and_maximum()` is called
+        Then the missing value is ignored
+        """
+        # Given
+        values = np.array([3, None, 1, 2], dtype=np.float64)
+
+        # When
+        minimum, maximum = find_minimum_and_maximum(values=values)
+
+        # Then
+        assert minimum == 1
+        assert maximum == 3
+
+    @pytest.mark.parametrize(
+        "values",
+        (
+            np.array([0, 4, None, 2], dtype=np.float64),
+            [Decimal(0), Decimal(4), None, Decimal(2)],
+        ),
+    )
+    def test_can_exclude_zeros(self, values):
+        """
+        Given a list or a column of values containing zeros
+        When `find_minimum_and_maximum()` is called
+            with `exclude_zeros` set to True
+        Then the zeros are ignored
+        """
+        # Given / When
+        minimum, maximum = find_minimum_and_maximum(values=values, exclude_zeros=True)
+
+        # Then
+        assert minimum == 2
+        assert maximum == 4
+
+    def test_returns_none_when_there_are_no_values(self):
+        """
+        Given a column of only missing values
+        When `find_minimum_and_maximum()` is called
+        Then None is returned
+        """
+        # Given
+        values = np.array([None], dtype=np.float64)
+
+        # When
+        extremes = find_minimum_and_maximum(values=values)
+
+        # Then
+        assert extremes is None
@@ -190,6 +190,24 @@ class TestPlotParameters:
         # `chart_type`, `label`, `line_colour`, and `line_type` are omitted
         assert dict_used_for_query == expected_dict_used_for_query
 
+    def test_metric_value_ranges_can_be_read_more_than_once(self):
+        """
+        Given a `PlotParameters` model with `metric_value_ranges`
+        When `to_dict_for_query()` is called twice
+        Then the `metric_value_ranges` are returned for each call
+        """
+        # Given
+        plot_parameters = PlotParameters(
+            **self.mandatory_parameters, metric_value_ranges=[(1, 2), (5, 10)]
+        )
+
+        # When
+        dicts_used_for_query = [plot_parameters.to_dict_for_query() for _ in range(2)]
+
+        # Then
+        for dict_used_for_query in dicts_used_for_query:
+            assert dict_used_for_query["metric_value_ranges"] == [(1, 2), (5, 10)]
+
     def test_properties_return_correct_field_values(self):
         """
         Given a `PlotParameters` instance
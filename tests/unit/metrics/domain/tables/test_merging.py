@@ -0,0 +1,81 @@
+import datetime
+
+import numpy as np
+
+from metrics.domain.tables.merging import MergedXAxisValues, merge_x_axis_values
+
+
+class TestMergeXAxisValues:
+    def test_outer_joins_dates_from_most_recent(self):
+        """
+        Given 2 plots with overlapping dates
+        When `merge_x_axis_values()` is called
+            with `sort_descending` set to True
+        Then each distinct date is returned once, from the most recent
+        And the position of each plot's value is returned for each date
+        """
+        # Given
+        first_plot_x_axis_values = [
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 1, 2),
+        ]
+        second_plot_x_axis_values = np.array(
+            [datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)],
+            dtype="datetime64[D]",
+        )
+
+        # When
+        merged_x_axis_values: MergedXAxisValues = merge_x_axis_values(
+            x_axis_values_per_plot=[
+                first_plot_x_axis_values,
+                second_plot_x_axis_values,
+            ],
+            sort_descending=True,
+        )
+
+        # Then
+        assert merged_x_axis_values.keys == ["2024-01-03", "2024-01-02", "2024-01-01"]
+        assert merged_x_axis_values.positions.tolist() == [[-1, 1, 0], [1, 0, -1]]
+
+    def test_keeps_keys_in_the_order_they_are_first_seen(self):
+        """
+        Given 2 plots with overlapping string values along the x-axis
+        When `merge_x_axis_values()` is called
+            with `sort_descending` set to False
+        Then the keys are returned in the order they are first seen
+        """
+        # Given
+        first_plot_x_axis_values = ["Wales", "England"]
+        second_plot_x_axis_values = ["Scotland", "Wales"]
+
+        # When
+        merged_x_axis_values: MergedXAxisValues = merge_x_axis_values(
+            x_axis_values_per_plot=[
+                first_plot_x_axis_values,
+                second_plot_x_axis_values,
+            ],
+            sort_descending=False,
+        )
+
+        # Then
+        assert merged_x_axis_values.keys == ["Wales", "England", "Scotland"]
+        assert merged_x_axis_values.positions.tolist() == [[0, 1, -1], [1, -1, 0]]
+
+    def test_handles_plots_without_values(self):
+        """
+        Given a plot with no x-axis values alongside a plot of strings
+        When `merge_x_axis_values()` is called
+        Then the plot without values has no position in any row
+        """
+        # Given
+        x_axis_values_per_plot = [[], ["00 - 04"]]
+
+        # When
+        merged_x_axis_values: MergedXAxisValues = merge_x_axis_values(
+            x_axis_values_per_plot=x_axis_values_per_plot,
+            sort_descending=False,
+        )
+
+        # Then
+        assert merged_x_axis_values.keys == ["00 - 04"]
+        assert merged_x_axis_values.positions.tolist() == [[-1], [0]]
@@ -5,6 +5,7 @@ from typing import Any
 import pytest
 
 from metrics.domain.models import PlotGenerationData, PlotParameters
+from metrics.domain.models.plot_columns import PlotColumns
 from metrics.domain.tables.generation import (
     LOWER_CONFIDENCE,
     TabularData,
@@ -522,6 +523,91 @@ class TestCombineAllPlots:
             "in_reporting_delay_period": False,
         }
 
+    def test_plots_held_in_columns(self, valid_plot_parameters: PlotParameters):
+        """
+        Given 2 `PlotGenerationData` models holding their data in `PlotColumns`
+        When `iterate_tabular_plots()` is called from an instance of `TabularData`
+        Then the rows are generated from the most recent date
+        And the values are written to the stored decimal places
+        And the confidence intervals are included where available
+        """
+        # Given
+        valid_plot_parameters.x_axis = ChartAxisFields.date.name
+        first_plot_columns = PlotColumns.from_records(
+            records=[
+                {
+                    "date": datetime.date(2023, 1, 1),
+                    "metric_value": Decimal("1.5000"),
+                    "in_reporting_delay_period": False,
+                    "upper_confidence": Decimal("2.0000"),
+                    "lower_confidence": None,
+                },
+                {
+                    "date": datetime.date(2023, 1, 2),
+                    "metric_value": Decimal("2.5000"),
+                    "in_reporting_delay_period": True,
+                    "upper_confidence": None,
+                    "lower_confidence": None,
+                },
+            ]
+        )
+        second_plot_columns = PlotColumns.from_records(
+            records=[
+                {
+                    "date": datetime.date(2023, 1, 1),
+                    "metric_value": Decimal("10.0000"),
+                    "in_reporting_delay_period": False,
+                },
+            ]
+        )
+        plots = [
+            PlotGenerationData.create_from_parameters(
+                parameters=valid_plot_parameters,
+                aggregated_results=plot_columns,
+                latest_date="2023-01-02",
+            )
+            for plot_columns in (first_plot_columns, second_plot_columns)
+        ]
+        tabular_data = TabularData(plots=plots)
+
+        # When
+        tabular_plots = tabular_data.iterate_tabular_plots()
+
+        # Then
+        assert next(tabular_plots) == {
+            "reference": "2023-01-02",
+            "values": [
+                {
+                    "label": "Plot1",
+                    "value": "2.5000",
+                    "in_reporting_delay_period": True,
+                },
+                {
+                    "label": "Plot2",
+                    "value": None,
+                    "in_reporting_delay_period": True,
+                },
+            ],
+        }
+        assert next(tabular_plots) == {
+            "reference": "2023-01-01",
+            "values": [
+                {
+                    "label": "Plot1",
+                    "value": "1.5000",
+                    "in_reporting_delay_period": False,
+                    UPPER_CONFIDENCE: "2.0000",
+                },
+                {
+                    "label": "Plot2",
+                    "value": "10.0000",
+                    "in_reporting_delay_period": False,
+                    UPPER_CONFIDENCE: "2.0000",
+                },
+            ],
+        }
+        assert next(tabular_plots, None) is None
+
 
 class TestCreateMultiPlotOutput:
     def test_2_plots(self, valid_plot_parameters: PlotParameters):
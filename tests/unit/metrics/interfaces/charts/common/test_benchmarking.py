@@ -0,0 +1,240 @@
+from unittest import mock
+
+import plotly.graph_objects as go
+import pytest
+
+from metrics.interfaces.charts.common.benchmarking import (
+    BENCHMARK_ACQUIRE_TIMEOUT_SECONDS,
+    ChartRenderingBenchmarkResult,
+    SVGOptimizationBenchmarkResult,
+    benchmark_chart_renderer_pool,
+    benchmark_svg_optimizers,
+    build_benchmark_chart_corpus,
+)
+
+MODULE_PATH = "metrics.interfaces.charts.common.benchmarking"
+
+FAKE_SVG_IMAGE = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+    b'<g class="layer"><rect x="1.23456" y="2.34567" width="10" height="10" '
+    b'style="fill: rgb(255, 0, 0);"/></g></svg>'
+)
+
+
+class TestBuildBenchmarkChartCorpus:
+    def test_returns_a_figure_for_each_type_of_chart(self):
+        """
+        Given no data in the database
+        When `build_benchmark_chart_corpus()` is called
+        Then a plotly `Figure` is returned for each type of chart
+        And each figure has been drawn with the synthetic data
+        """
+        # Given / When
+        corpus: dict[str, go.Figure] = build_benchmark_chart_corpus()
+
+        # Then
+        assert list(corpus) == [
+            "single_category_line",
+            "single_category_bar_with_line",
+            "dual_category_stacked_bar",
+            "subplot",
+        ]
+        for figure in corpus.values():
+            assert isinstance(figure, go.Figure)
+            assert figure.data
+
+
+class TestBenchmarkChartRendererPool:
+    @mock.patch(f"{MODULE_PATH}.build_benchmark_chart_corpus")
+    @mock.patch(f"{MODULE_PATH}.ChartRendererPool")
+    def test_returns_result_for_each_pool_size(
+        self,
+        spy_chart_renderer_pool_class: mock.MagicMock,
+        mocked_build_benchmark_chart_corpus: mock.MagicMock,
+    ):
+        """
+        Given a corpus of 2 charts
+        When `benchmark_chart_renderer_pool()` is called
+            with 2 pool sizes and 3 renders per chart
+        Then a `ChartRenderingBenchmarkResult` is returned for each pool size
+        And each pool is warmed up and shut down
+        And each chart is rendered once before the timed renders
+
+        Patches:
+            `spy_chart_renderer_pool_class`: For the main assertions
+                and to avoid starting any renderer processes
+            `mocked_build_benchmark_chart_corpus`: To return a small
+                corpus of fake figures
+        """
+        # Given
+        fake_figures = [mock.Mock(), mock.Mock()]
+        mocked_build_benchmark_chart_corpus.return_value = {
+            "chart_a": fake_figures[0],
+            "chart_b": fake_figures[1],
+        }
+        spy_chart_renderer_pool = spy_chart_renderer_pool_class.return_value
+
+        # When
+        results: list[ChartRenderingBenchmarkResult] = benchmark_chart_renderer_pool(
+            pool_sizes=[0, 2], concurrency=3, renders_per_chart=3
+        )
+
+        # Then
+        assert [result.pool_size for result in results] == [0, 2]
+        assert all(result.renders == 6 for result in results)
+        assert all(
+            result.p50_latency_seconds <= result.p95_latency_seconds
+            for result in results
+        )
+        spy_chart_renderer_pool_class.assert_has_calls(
+            [
+                mock.call(
+                    size=pool_size,
+                    max_queue_size=3,
+                    acquire_timeout_seconds=BENCHMARK_ACQUIRE_TIMEOUT_SECONDS,
+                )
+                for pool_size in (0, 2)
+            ],
+            any_order=True,
+        )
+        assert spy_chart_renderer_pool.warm_up.call_count == 2
+        assert spy_chart_renderer_pool.shutdown.call_count == 2
+        # 2 warm up renders and 6 timed renders for each of the 2 pool sizes
+        assert spy_chart_renderer_pool.render.call_count == 16
+        spy_chart_renderer_pool.render.assert_any_call(
+            figure=fake_figures[0], file_format="svg"
+        )
+
+    @mock.patch(f"{MODULE_PATH}.build_benchmark_chart_corpus")
+    @mock.patch(f"{MODULE_PATH}.ChartRendererPool")
+    def test_single_render_is_used_for_each_percentile(
+        self,
+        mocked_chart_renderer_pool_class: mock.MagicMock,
+        mocked_build_benchmark_chart_corpus: mock.MagicMock,
+    ):
+        """
+        Given a corpus of 1 chart
+        When `benchmark_chart_renderer_pool()` is called
+            with 1 render per chart
+        Then the latency of the single render
+            is returned as both the p50 and p95 latency
+
+        Patches:
+            `mocked_chart_renderer_pool_class`: To avoid starting
+                any renderer processes
+            `mocked_build_benchmark_chart_corpus`: To return a corpus
+                of 1 fake figure
+        """
+        # Given
+        mocked_build_benchmark_chart_corpus.return_value = {"chart_a": mock.Mock()}
+
+        # When
+        results: list[ChartRenderingBenchmarkResult] = benchmark_chart_renderer_pool(
+            pool_sizes=[1], concurrency=1, renders_per_chart=1
+        )
+
+        # Then
+        result = results[0]
+        assert result.renders == 1
+        assert result.p50_latency_seconds == result.p95_latency_seconds
+
+    @mock.patch(f"{MODULE_PATH}.build_benchmark_chart_corpus")
+    @mock.patch(f"{MODULE_PATH}.ChartRendererPool")
+    def test_pool_is_shut_down_when_a_render_fails(
+        self,
+        spy_chart_renderer_pool_class: mock.MagicMock,
+        mocked_build_benchmark_chart_corpus: mock.MagicMock,
+    ):
+        """
+        Given a `ChartRendererPool` which fails to render a chart
+        When `benchmark_chart_renderer_pool()` is called
+        Then the error is raised
+        And the pool is still shut down
+
+        Patches:
+            `spy_chart_renderer_pool_class`: To fail each render
+                and for the main assertion
+            `mocked_build_benchmark_chart_corpus`: To return a corpus
+                of 1 fake figure
+        """
+        # Given
+        mocked_build_benchmark_chart_corpus.return_value = {"chart_a": mock.Mock()}
+        spy_chart_renderer_pool = spy_chart_renderer_pool_class.return_value
+        spy_chart_renderer_pool.render.side_effect = ValueError
+
+        # When / Then
+        with pytest.raises(ValueError):
+            benchmark_chart_renderer_pool(pool_sizes=[1], concurrency=1)
+
+        spy_chart_renderer_pool.shutdown.assert_called_once()
+
+
+class TestBenchmarkSVGOptimizers:
+    @mock.patch(f"{MODULE_PATH}.render_figure", return_value=FAKE_SVG_IMAGE)
+    @mock.patch(f"{MODULE_PATH}.build_benchmark_chart_corpus")
+    def test_returns_result_for_each_optimizer(
+        self,
+        mocked_build_benchmark_chart_corpus: mock.MagicMock,
+        spy_render_figure: mock.MagicMock,
+    ):
+        """
+        Given a corpus of 2 charts
+        When `benchmark_svg_optimizers()` is called without any optimizers
+        Then a `SVGOptimizationBenchmarkResult` is returned
+            for each of the available optimizers
+        And each chart is only rendered once
+
+        Patches:
+            `mocked_build_benchmark_chart_corpus`: To return a small
+                corpus of fake figures
+            `spy_render_figure`: To return a fake SVG
+                and for the main assertion
+        """
+        # Given
+        mocked_build_benchmark_chart_corpus.return_value = {
+            "chart_a": mock.Mock(),
+            "chart_b": mock.Mock(),
+        }
+
+        # When
+        results: list[SVGOptimizationBenchmarkResult] = benchmark_svg_optimizers(
+            repeats=2
+        )
+
+        # Then
+        assert [result.optimizer for result in results] == ["minify", "scour"]
+        assert spy_render_figure.call_count == 2
+        for result in results:
+            assert result.rendered_bytes == 2 * len(FAKE_SVG_IMAGE)
+            assert result.optimized_bytes > 0
+            assert result.uri_encoded_bytes > 0
+            assert result.base64_encoded_bytes > 0
+
+    @mock.patch(f"{MODULE_PATH}.render_figure", return_value=FAKE_SVG_IMAGE)
+    @mock.patch(f"{MODULE_PATH}.build_benchmark_chart_corpus")
+    def test_only_benchmarks_given_optimizers(
+        self,
+        mocked_build_benchmark_chart_corpus: mock.MagicMock,
+        mocked_render_figure: mock.MagicMock,
+    ):
+        """
+        Given a corpus of 1 chart
+        When `benchmark_svg_optimizers()` is called with the "minify" optimizer
+        Then only 1 `SVGOptimizationBenchmarkResult` is returned
+            for the "minify" optimizer
+
+        Patches:
+            `mocked_build_benchmark_chart_corpus`: To return a corpus
+                of 1 fake figure
+            `mocked_render_figure`: To return a fake SVG
+        """
+        # Given
+        mocked_build_benchmark_chart_corpus.return_value = {"chart_a": mock.Mock()}
+
+        # When
+        results: list[SVGOptimizationBenchmarkResult] = benchmark_svg_optimizers(
+            optimizers=["minify"], repeats=1
+        )
+
+        # Then
+        assert [result.optimizer for result in results] == ["minify"]
@@ -26,7 +26,7 @@ class TestGenerateEncodedChart:
 
         """
         # Given
-        spy_chart_request_params = mock.Mock(file_format="svg")
+        spy_chart_request_params = mock.Mock(file_format="svg", chart_encoding="uri")
         spy_interface_class = mock.Mock()
         mocked_create_optimized_svg.return_value = "abc"
 
@@ -68,40 +68,43 @@ class TestEncodeFigure:
 
         # When / Then
         with pytest.raises(ValueError):
-            generation._encode_figure(figure=mocked_figure, file_format=file_format)
+            generation._encode_figure(
+                figure=mocked_figure, file_format=file_format, chart_encoding="uri"
+            )
 
-    @mock.patch(f"{MODULE_PATH}.urllib.parse.quote_plus")
+    @mock.patch(f"{MODULE_PATH}.encode_svg")
     @mock.patch(f"{MODULE_PATH}._create_optimized_svg")
     def test_calls_are_delegated_successfully_to_render_optimised_svg(
         self,
         spy_create_optimized_svg: mock.MagicMock,
-        spy_urllib_quote_plus: mock.MagicMock,
+        spy_encode_svg: mock.MagicMock,
     ):
         """
         Given a mocked plotly figure and `file_format` of svg
         When `_encode_figure()` is called
         Then the call is delegated to
             `_create_optimized_svg`
-            and then to `quote_plus()` from `urllib`
+            and then to `encode_svg()` with the requested `chart_encoding`
         """
         # Given
         file_format = "svg"
+        chart_encoding = "base64"
         mocked_figure = mock.Mock()
         spy_create_optimized_svg.return_value = "abc"
 
         # When
         encoded_figure = generation._encode_figure(
-            figure=mocked_figure, file_format=file_format
+            figure=mocked_figure, file_format=file_format, chart_encoding=chart_encoding
         )
 
         # Then
         spy_create_optimized_svg.assert_called_once_with(
             figure=mocked_figure, file_format=file_format
         )
-        spy_urllib_quote_plus.assert_called_once_with(
-            spy_create_optimized_svg.return_value
+        spy_encode_svg.assert_called_once_with(
+            svg=spy_create_optimized_svg.return_value, chart_encoding=chart_encoding
         )
-        assert encoded_figure == spy_urllib_quote_plus.return_value
+        assert encoded_figure == spy_encode_svg.return_value
 
 
 class TestGenerateChartAsFile:
@@ -174,39 +177,52 @@ class TestChartResult:
 
 
 class TestCreateOptimizedSVG:
-    @mock.patch(f"{MODULE_PATH}.scour.scourString")
-    def test_delegates_calls_successfully(self, spy_scour_string: mock.Mock):
+    @mock.patch(f"{MODULE_PATH}.optimize_svg")
+    @mock.patch(f"{MODULE_PATH}.render_figure")
+    def test_delegates_calls_successfully(
+        self, spy_render_figure: mock.MagicMock, spy_optimize_svg: mock.MagicMock
+    ):
         """
         Given a mocked plotly figure and `file_format` of svg
         When `_create_optimized_svg()` is called
-        Then the figure is created
-            and passed to the `scourString()` call
+        Then the figure is rendered
+            and passed to the `optimize_svg()` call
+
+        Patches:
+            `spy_render_figure`: For the main assertion
+                and to remove the side effect of rendering the figure
+            `spy_optimize_svg`: For the main assertion
         """
         # Given
-        spy_figure = mock.Mock()
+        mocked_figure = mock.Mock()
         file_format = "svg"
 
         # When
         optimized_svg: str = generation._create_optimized_svg(
-            figure=spy_figure, file_format=file_format
+            figure=mocked_figure, file_format=file_format
         )
 
         # Then
-        spy_figure.to_image.assert_called_once_with(format=file_format, validate=False)
-        svg_image = spy_figure.to_image.return_value
-        spy_scour_string.assert_called_once_with(in_string=svg_image)
+        spy_render_figure.assert_called_once_with(
+            figure=mocked_figure, file_format=file_format
+        )
+        svg_image = spy_render_figure.return_value
+        spy_optimize_svg.assert_called_once_with(svg_image=svg_image)
 
-        assert optimized_svg == spy_scour_string.return_value
+        assert optimized_svg == spy_optimize_svg.return_value
 
 
 class TestWriteFigure:
-    @mock.patch(f"{MODULE_PATH}.io.BytesIO")
-    def test_creates_image(self, spy_bytes_io_class: mock.MagicMock):
+    @mock.patch(f"{MODULE_PATH}.render_figure")
+    def test_creates_image(self, spy_render_figure: mock.MagicMock):
         """
         Given a mocked plotly figure and `file_format` of png
         When `_write_figure()` is called
-        Then `write_image()` is called from the figure object
-        And returned in a bytes IO stream
+        Then the figure is rendered via `render_figure()`
+
+        Patches:
+            `spy_render_figure`: For the main assertion
+                and to remove the side effect of rendering the figure
         """
         # Given
         mocked_figure = mock.Mock()
@@ -218,11 +234,7 @@ class TestWriteFigure:
         )
 
         # Then
-        mocked_figure.write_image.assert_called_once_with(
-            file=spy_bytes_io_class.return_value,
-            format=file_format,
-            validate=False,
+        spy_render_figure.assert_called_once_with(
+            figure=mocked_figure, file_format=file_format
         )
-        bytes_io = spy_bytes_io_class.return_value
-        bytes_io.seek.assert_called_once_with(0)
-        assert written_figure == bytes_io.getvalue.return_value
+        assert written_figure == spy_render_figure.return_value
@@ -0,0 +1,442 @@
+import subprocess
+import threading
+from unittest import mock
+
+from _pytest.logging import LogCaptureFixture
+
+from metrics.interfaces.charts.common.rendering import (
+    PLOTLY_JS_PATH,
+    ChartRenderer,
+    ChartRendererPool,
+)
+
+MODULE_PATH = "metrics.interfaces.charts.common.rendering"
+
+
+def _build_chart_renderer_pool(**kwargs) -> tuple[ChartRendererPool, mock.Mock]:
+    spy_renderer_factory = mock.Mock(side_effect=lambda: mock.Mock(spec=ChartRenderer))
+    chart_renderer_pool = ChartRendererPool(
+        size=kwargs.pop("size", 2),
+        max_queue_size=kwargs.pop("max_queue_size", 2),
+        acquire_timeout_seconds=kwargs.pop("acquire_timeout_seconds", 1),
+        render_timeout_seconds=kwargs.pop("render_timeout_seconds", 5),
+        renderer_factory=spy_renderer_factory,
+    )
+    return chart_renderer_pool, spy_renderer_factory
+
+
+class TestChartRendererPool:
+    def test_renders_figure_with_pooled_renderer(self):
+        """
+        Given an enabled `ChartRendererPool`
+        When `render()` is called
+        Then the figure is rendered by a renderer from the pool
+        """
+        # Given
+        chart_renderer_pool, spy_renderer_factory = _build_chart_renderer_pool()
+        mocked_figure = mock.Mock()
+
+        # When
+        image: bytes = chart_renderer_pool.render(
+            figure=mocked_figure, file_format="svg"
+        )
+
+        # Then
+        spy_renderer_factory.assert_called_once()
+        renderer = chart_renderer_pool._idle_renderers.get_nowait()
+        renderer.render.assert_called_once_with(
+            figure=mocked_figure, file_format="svg", timeout_seconds=5
+        )
+        assert image == renderer.render.return_value
+        mocked_figure.to_image.assert_not_called()
+
+    def test_renderers_are_reused_across_renders(self):
+        """
+        Given an enabled `ChartRendererPool`
+        When `render()` is called several times in sequence
+        Then only 1 renderer is created
+        """
+        # Given
+        chart_renderer_pool, spy_renderer_factory = _build_chart_renderer_pool()
+
+        # When
+        for _ in range(3):
+            chart_renderer_pool.render(figure=mock.Mock(), file_format="svg")
+
+        # Then
+        spy_renderer_factory.assert_called_once()
+
+    def test_unhealthy_renderers_are_replaced(self):
+        """
+        Given an idle renderer in the pool which has exited
+        When `render()` is called
+        Then the unhealthy renderer is shut down
+        And a new renderer is created to render the figure
+        """
+        # Given
+        chart_renderer_pool, spy_renderer_factory = _build_chart_renderer_pool()
+        unhealthy_renderer = mock.Mock(spec=ChartRenderer)
+        unhealthy_renderer.is_healthy.return_value = False
+        chart_renderer_pool._idle_renderers.put(unhealthy_renderer)
+
+        # When
+        chart_renderer_pool.render(figure=mock.Mock(), file_format="svg")
+
+        # Then
+        unhealthy_renderer.shutdown.assert_called_once()
+        unhealthy_renderer.render.assert_not_called()
+        spy_renderer_factory.assert_called_once()
+
+    def test_failed_renderer_is_discarded_and_falls_back(self):
+        """
+        Given a renderer which fails to render the figure
+        When `render()` is called
+        Then the renderer is shut down and not returned to the pool
+        And the figure is rendered by plotly's own renderer instead
+        """
+        # Given
+        chart_renderer_pool, _ = _build_chart_renderer_pool()
+        failing_renderer = mock.Mock(spec=ChartRenderer)
+        failing_renderer.is_healthy.return_value = True
+        failing_renderer.render.side_effect = ValueError
+        chart_renderer_pool._idle_renderers.put(failing_renderer)
+        spy_figure = mock.Mock()
+
+        # When
+        image: bytes = chart_renderer_pool.render(figure=spy_figure, file_format="svg")
+
+        # Then
+        failing_renderer.shutdown.assert_called_once()
+        assert chart_renderer_pool._idle_renderers.empty()
+        spy_figure.to_image.assert_called_once_with(format="svg", validate=False)
+        assert image == spy_figure.to_image.return_value
+
+    def test_falls_back_when_pool_is_disabled(self):
+        """
+        Given a `ChartRendererPool` with a size of 0
+        When `render()` is called
+        Then the figure is rendered by plotly's own renderer
+        And no renderers are created
+        """
+        # Given
+        chart_renderer_pool, spy_renderer_factory = _build_chart_renderer_pool(size=0)
+        spy_figure = mock.Mock()
+
+        # When
+        image: bytes = chart_renderer_pool.render(figure=spy_figure, file_format="png")
+
+        # Then
+        spy_renderer_factory.assert_not_called()
+        spy_figure.to_image.assert_called_once_with(format="png", validate=False)
+        assert image == spy_figure.to_image.return_value
+
+    def test_falls_back_when_pool_is_saturated(self):
+        """
+        Given a `ChartRendererPool` whose renderers and queue are all in use
+        When `render()` is called
+        Then the figure is rendered by plotly's own renderer straight away
+        """
+        # Given
+        chart_renderer_pool, spy_renderer_factory = _build_chart_renderer_pool(
+            size=1, max_queue_size=0
+        )
+        render_started = threading.Event()
+        release_render = threading.Event()
+
+        def blocking_render(**kwargs) -> bytes:
+            render_started.set()
+            release_render.wait(timeout=5)
+            return b"<svg></svg>"
+
+        blocked_renderer = mock.Mock(spec=ChartRenderer)
+        blocked_renderer.is_healthy.return_value = True
+        blocked_renderer.render.side_effect = blocking_render
+        chart_renderer_pool._idle_renderers.put(blocked_renderer)
+
+        busy_thread = threading.Thread(
+            target=chart_renderer_pool.render,
+            kwargs={"figure": mock.Mock(), "file_format": "svg"},
+        )
+        busy_thread.start()
+        render_started.wait(timeout=5)
+        spy_figure = mock.Mock()
+
+        # When
+        try:
+            image: bytes = chart_renderer_pool.render(
+                figure=spy_figure, file_format="svg"
+            )
+        finally:
+            release_render.set()
+            busy_thread.join(timeout=5)
+
+        # Then
+        spy_figure.to_image.assert_called_once_with(format="svg", validate=False)
+        assert image == spy_figure.to_image.return_value
+        spy_renderer_factory.assert_not_called()
+
+    def test_falls_back_when_acquire_times_out(self):
+        """
+        Given a `ChartRendererPool` whose renderers are all in use
+        When `render()` is called
+        And no renderer becomes free within the acquire timeout
+        Then the figure is rendered by plotly's own renderer
+        """
+        # Given
+        chart_renderer_pool, _ = _build_chart_renderer_pool(
+            size=1, max_queue_size=1, acquire_timeout_seconds=0.01
+        )
+        chart_renderer_pool._slots.acquire()
+        spy_figure = mock.Mock()
+
+        # When
+        try:
+            image: bytes = chart_renderer_pool.render(
+                figure=spy_figure, file_format="svg"
+            )
+        finally:
+            chart_renderer_pool._slots.release()
+
+        # Then
+        spy_figure.to_image.assert_called_once_with(format="svg", validate=False)
+        assert image == spy_figure.to_image.return_value
+
+    def test_warm_up_starts_each_renderer(self):
+        """
+        Given a `ChartRendererPool` with a size of 2
+        When `warm_up()` is called
+        Then 2 renderers are created and warmed up
+        And they are held as idle renderers in the pool
+        """
+        # Given
+        chart_renderer_pool, spy_renderer_factory = _build_chart_renderer_pool(size=2)
+
+        # When
+        chart_renderer_pool.warm_up()
+
+        # Then
+        assert spy_renderer_factory.call_count == 2
+        assert chart_renderer_pool._idle_renderers.qsize() == 2
+
+    def test_warm_up_does_nothing_when_pool_is_disabled(self):
+        """
+        Given a `ChartRendererPool` with a size of 0
+        When `warm_up()` is called
+        Then no renderers are created
+        """
+        # Given
+        chart_renderer_pool, spy_renderer_factory = _build_chart_renderer_pool(size=0)
+
+        # When
+        chart_renderer_pool.warm_up()
+
+        # Then
+        spy_renderer_factory.assert_not_called()
+        assert chart_renderer_pool._idle_renderers.empty()
+
+    def test_shutdown_shuts_down_idle_renderers(self):
+        """
+        Given a `ChartRendererPool` which has been warmed up
+        When `shutdown()` is called
+        Then each of the idle renderers is shut down
+        """
+        # Given
+        chart_renderer_pool, _ = _build_chart_renderer_pool(size=2)
+        chart_renderer_pool.warm_up()
+        idle_renderers = list(chart_renderer_pool._idle_renderers.queue)
+
+        # When
+        chart_renderer_pool.shutdown()
+
+        # Then
+        for idle_renderer in idle_renderers:
+            idle_renderer.shutdown.assert_called_once()
+        assert chart_renderer_pool._idle_renderers.empty()
+
+    def test_shutdown_continues_when_a_renderer_fails_to_shut_down(
+        self, caplog: LogCaptureFixture
+    ):
+        """
+        Given a `ChartRendererPool` which has been warmed up
+        And an idle renderer which fails to shut down
+        When `shutdown()` is called
+        Then the failure is logged
+        And the remaining idle renderers are still shut down
+        """
+        # Given
+        chart_renderer_pool, _ = _build_chart_renderer_pool(size=2)
+        chart_renderer_pool.warm_up()
+        idle_renderers = list(chart_renderer_pool._idle_renderers.queue)
+        idle_renderers[0].shutdown.side_effect = OSError
+
+        # When
+        chart_renderer_pool.shutdown()
+
+        # Then
+        assert "Failed to shut down chart renderer" in caplog.text
+        idle_renderers[1].shutdown.assert_called_once()
+        assert chart_renderer_pool._idle_renderers.empty()
+
+
+class TestChartRenderer:
+    @mock.patch(f"{MODULE_PATH}.PlotlyScope")
+    def test_creates_scope_pinned_to_bundled_plotly_js(
+        self, spy_plotly_scope: mock.MagicMock
+    ):
+        """
+        Given no kaleido scope
+        When a `ChartRenderer` is created
+        Then a kaleido scope is created
+            with the plotly.js bundled with plotly
+            and without MathJax
+
+        Patches:
+            `spy_plotly_scope`: For the main assertion
+                and to avoid creating a real kaleido scope
+        """
+        # Given / When
+        chart_renderer = ChartRenderer()
+
+        # Then
+        spy_plotly_scope.assert_called_once_with(plotlyjs=PLOTLY_JS_PATH, mathjax=False)
+        assert chart_renderer._scope == spy_plotly_scope.return_value
+
+    def test_warm_up_renders_an_empty_figure(self):
+        """
+        Given a `ChartRenderer`
+        When `warm_up()` is called
+        Then an empty figure is transformed by the kaleido scope
+        """
+        # Given
+        spy_scope = mock.Mock()
+        chart_renderer = ChartRenderer(scope=spy_scope)
+
+        # When
+        chart_renderer.warm_up()
+
+        # Then
+        spy_scope.transform.assert_called_once_with(
+            {"data": [], "layout": {}}, format="svg"
+        )
+
+    def test_render_transforms_figure(self):
+        """
+        Given a `ChartRenderer`
+        When `render()` is called
+        Then the figure is transformed by the kaleido scope
+        """
+        # Given
+        spy_scope = mock.Mock()
+        chart_renderer = ChartRenderer(scope=spy_scope)
+        mocked_figure = mock.Mock()
+
+        # When
+        image: bytes = chart_renderer.render(
+            figure=mocked_figure, file_format="svg", timeout_seconds=5
+        )
+
+        # Then
+        spy_scope.transform.assert_called_once_with(
+            mocked_figure.to_dict.return_value, format="svg"
+        )
+        assert image == spy_scope.transform.return_value
+
+    def test_render_kills_process_after_timeout(self):
+        """
+        Given a `ChartRenderer` whose kaleido process does not respond
+        When `render()` is called
+        Then the kaleido process is killed after the timeout
+        """
+        # Given
+        killed = threading.Event()
+        mocked_scope = mock.Mock()
+        mocked_scope._proc.kill.side_effect = killed.set
+        mocked_scope.transform.side_effect = lambda *args, **kwargs: killed.wait(
+            timeout=5
+        )
+        chart_renderer = ChartRenderer(scope=mocked_scope)
+
+        # When
+        chart_renderer.render(
+            figure=mock.Mock(), file_format="svg", timeout_seconds=0.01
+        )
+
+        # Then
+        mocked_scope._proc.kill.assert_called_once()
+
+    def test_is_healthy_checks_process_is_running(self):
+        """
+        Given a `ChartRenderer` whose kaleido process has exited
+        When `is_healthy()` is called
+        Then False is returned
+        """
+        # Given
+        mocked_scope = mock.Mock()
+        mocked_scope._proc.poll.return_value = 1
+        chart_renderer = ChartRenderer(scope=mocked_scope)
+
+        # When
+        is_healthy: bool = chart_renderer.is_healthy()
+
+        # Then
+        assert not is_healthy
+
+    def test_shutdown_closes_input_of_running_process(self):
+        """
+        Given a `ChartRenderer` whose kaleido process is running
+        When `shutdown()` is called
+        Then the input of the process is closed
+        And the process is waited on
+        """
+        # Given
+        spy_scope = mock.Mock()
+        spy_scope._proc.poll.return_value = None
+        chart_renderer = ChartRenderer(scope=spy_scope)
+
+        # When
+        chart_renderer.shutdown()
+
+        # Then
+        spy_scope._proc.stdin.close.assert_called_once()
+        spy_scope._proc.wait.assert_called_once()
+        spy_scope._proc.kill.assert_not_called()
+
+    def test_shutdown_kills_process_which_does_not_exit(self):
+        """
+        Given a `ChartRenderer` whose kaleido process does not exit
+            once its input has been closed
+        When `shutdown()` is called
+        Then the process is killed
+        """
+        # Given
+        mocked_scope = mock.Mock()
+        mocked_scope._proc.poll.return_value = None
+        mocked_scope._proc.wait.side_effect = subprocess.TimeoutExpired(
+            cmd="kaleido", timeout=2
+        )
+        chart_renderer = ChartRenderer(scope=mocked_scope)
+
+        # When
+        chart_renderer.shutdown()
+
+        # Then
+        mocked_scope._proc.kill.assert_called_once()
+
+    def test_shutdown_does_nothing_when_process_has_exited(self):
+        """
+        Given a `ChartRenderer` whose kaleido process has already exited
+        When `shutdown()` is called
+        Then the process is left untouched
+        """
+        # Given
+        spy_scope = mock.Mock()
+        spy_scope._proc.poll.return_value = 0
+        chart_renderer = ChartRenderer(scope=spy_scope)
+
+        # When
+        chart_renderer.shutdown()
+
+        # Then
+        spy_scope._proc.stdin.close.assert_not_called()
+        spy_scope._proc.wait.assert_not_called()
+        spy_scope._proc.kill.assert_not_called()
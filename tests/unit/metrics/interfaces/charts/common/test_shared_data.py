@@ -0,0 +1,174 @@
+from unittest import mock
+
+import pytest
+
+from metrics.domain.models import ChartRequestParams, PlotParameters
+from metrics.interfaces.charts.common.shared_data import (
+    build_shared_chart_data_key,
+    get_or_build_shared_chart_data,
+    share_chart_data_across_widths,
+)
+
+
+def _build_chart_request_params(
+    *, chart_width: int = 1100, chart_height: int = 260, metric: str = ""
+) -> ChartRequestParams:
+    return ChartRequestParams(
+        plots=[
+            PlotParameters(
+                chart_type="line_multi_coloured",
+                topic="COVID-19",
+                metric=metric or "COVID-19_cases_casesByDay",
+                x_axis="date",
+                y_axis="metric",
+            )
+        ],
+        file_format="svg",
+        chart_width=chart_width,
+        chart_height=chart_height,
+        x_axis="date",
+        y_axis="metric",
+    )
+
+
+class TestBuildSharedChartDataKey:
+    def test_key_is_the_same_for_different_chart_sizes(self):
+        """
+        Given 2 `ChartRequestParams` models which only differ by their size
+        When `build_shared_chart_data_key()` is called for each
+        Then the same key is returned
+        """
+        # Given
+        double_width_chart_request_params = _build_chart_request_params(
+            chart_width=1100, chart_height=260
+        )
+        single_width_chart_request_params = _build_chart_request_params(
+            chart_width=515, chart_height=300
+        )
+
+        # When
+        double_width_key = build_shared_chart_data_key(
+            chart_request_params=double_width_chart_request_params
+        )
+        single_width_key = build_shared_chart_data_key(
+            chart_request_params=single_width_chart_request_params
+        )
+
+        # Then
+        assert double_width_key == single_width_key
+
+    def test_key_is_different_for_different_plots(self):
+        """
+        Given 2 `ChartRequestParams` models which differ by the metric of their plot
+        When `build_shared_chart_data_key()` is called for each
+        Then different keys are returned
+        """
+        # Given
+        cases_chart_request_params = _build_chart_request_params(
+            metric="COVID-19_cases_casesByDay"
+        )
+        deaths_chart_request_params = _build_chart_request_params(
+            metric="COVID-19_deaths_ONSByDay"
+        )
+
+        # When
+        cases_key = build_shared_chart_data_key(
+            chart_request_params=cases_chart_request_params
+        )
+        deaths_key = build_shared_chart_data_key(
+            chart_request_params=deaths_chart_request_params
+        )
+
+        # Then
+        assert cases_key != deaths_key
+
+
+class TestGetOrBuildSharedChartData:
+    def test_builds_each_time_outside_of_shared_block(self):
+        """
+        Given no active `share_chart_data_across_widths()` block
+        When `get_or_build_shared_chart_data()` is called twice
+        Then the data is built for each call
+        """
+        # Given
+        spy_build = mock.Mock()
+        chart_request_params = _build_chart_request_params()
+
+        # When
+        for _ in range(2):
+            get_or_build_shared_chart_data(
+                chart_request_params=chart_request_params, build=spy_build
+            )
+
+        # Then
+        assert spy_build.call_count == 2
+
+    def test_builds_once_for_each_width_within_shared_block(self):
+        """
+        Given an active `share_chart_data_across_widths()` block
+        When `get_or_build_shared_chart_data()` is called
+            for 2 requests which only differ by their chart width
+        Then the data is only built once
+        And the same data is returned for both widths
+        """
+        # Given
+        spy_build = mock.Mock()
+
+        # When
+        with share_chart_data_across_widths():
+            shared_data = [
+                get_or_build_shared_chart_data(
+                    chart_request_params=_build_chart_request_params(
+                        chart_width=chart_width
+                    ),
+                    build=spy_build,
+                )
+                for chart_width in (1100, 515)
+            ]
+
+        # Then
+        spy_build.assert_called_once()
+        assert shared_data == [spy_build.return_value] * 2
+
+    def test_shared_data_is_discarded_when_block_is_exited(self):
+        """
+        Given data which was built within a `share_chart_data_across_widths()` block
+        When `get_or_build_shared_chart_data()` is called
+            within a subsequent block
+        Then the data is built again
+        """
+        # Given
+        spy_build = mock.Mock()
+        chart_request_params = _build_chart_request_params()
+
+        # When
+        for _ in range(2):
+            with share_chart_data_across_widths():
+                get_or_build_shared_chart_data(
+                    chart_request_params=chart_request_params, build=spy_build
+                )
+
+        # Then
+        assert spy_build.call_count == 2
+
+    def test_errors_are_not_shared(self):
+        """
+        Given a `build` callable which raises an error
+        When `get_or_build_shared_chart_data()` is called twice
+            within a `share_chart_data_across_widths()` block
+        Then the data is built for each call
+        """
+        # Given
+        spy_build = mock.Mock(side_effect=ValueError)
+        chart_request_params = _build_chart_request_params()
+
+        # When
+        with share_chart_data_across_widths():
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    get_or_build_shared_chart_data(
+                        chart_request_params=chart_request_params, build=spy_build
+                    )
+
+        # Then
+        assert spy_build.call_count == 2
@@ -0,0 +1,200 @@
+import base64
+import urllib.parse
+from unittest import mock
+
+import pytest
+
+from metrics.interfaces.charts.common.svg import (
+    encode_svg,
+    minify_svg,
+    optimize_svg,
+)
+
+MODULE_PATH = "metrics.interfaces.charts.common.svg"
+
+FAKE_PLOTLY_SVG = (
+    '<svg class="main-svg" xmlns="http://www.w3.org/2000/svg" '
+    'xmlns:xlink="http://www.w3.org/1999/xlink" width="515" height="260" style="">'
+    '<rect x="0" y="0" width="515" height="260" '
+    'style="fill: rgb(255, 255, 255); fill-opacity: 1;"/>'
+    '<g class="layer-below"><g class="imagelayer"/><g class="shapelayer"/></g>\n'
+    '<g class="cartesianlayer">'
+    '<path class="js-line" d="M54.123456,291.33L108.06,-0.0001" '
+    'style="stroke: rgb(18, 52, 86); stroke-width: 2px;"/>'
+    '<text x="10.26" data-unformatted="Jan 2024" '
+    'style="font-family: &quot;Open Sans&quot;">Value 1.23456</text>'
+    "</g><!-- comment --></svg>"
+)
+
+
+class TestMinifySVG:
+    def test_strips_markup_only_used_by_interactive_charts(self):
+        """
+        Given an SVG exported by plotly
+        When `minify_svg()` is called
+        Then the class names, `data-*` attributes, empty styles,
+            empty groups and comments are removed
+        """
+        # Given
+        svg_image = FAKE_PLOTLY_SVG.encode("utf-8")
+
+        # When
+        minified_svg: str = minify_svg(svg_image=svg_image, decimal_places=1)
+
+        # Then
+        assert "class=" not in minified_svg
+        assert "data-unformatted" not in minified_svg
+        assert 'style=""' not in minified_svg
+        assert "<g/>" not in minified_svg
+        assert "layer-below" not in minified_svg
+        assert "comment" not in minified_svg
+        assert "\n" not in minified_svg
+        assert "xmlns:xlink" not in minified_svg
+
+    def test_rounds_coordinates_but_not_text(self):
+        """
+        Given an SVG exported by plotly
+        When `minify_svg()` is called with 1 decimal place
+        Then the numbers in coordinates are rounded to 1 decimal place
+        And the text content of the SVG is left as is
+        """
+        # Given
+        svg_image = FAKE_PLOTLY_SVG
+
+        # When
+        minified_svg: str = minify_svg(svg_image=svg_image, decimal_places=1)
+
+        # Then
+        assert 'd="M54.1,291.3L108.1,0"' in minified_svg
+        assert 'x="10.3"' in minified_svg
+        assert ">Value 1.23456</text>" in minified_svg
+
+    def test_collapses_styles(self):
+        """
+        Given an SVG exported by plotly
+        When `minify_svg()` is called
+        Then the style declarations are collapsed
+        And `rgb()` colours are shortened to hex codes
+        And escaped entities at the end of styles are left intact
+        """
+        # Given
+        svg_image = FAKE_PLOTLY_SVG
+
+        # When
+        minified_svg: str = minify_svg(svg_image=svg_image, decimal_places=1)
+
+        # Then
+        assert 'style="fill:#fff;fill-opacity:1"' in minified_svg
+        assert 'style="stroke:#123456;stroke-width:2px"' in minified_svg
+        assert 'style="font-family:&quot;Open Sans&quot;"' in minified_svg
+
+    def test_shortens_colours_in_fill_and_stroke_attributes(self):
+        """
+        Given an SVG with `rgb()` colours in its `fill` and `stroke` attributes
+        When `minify_svg()` is called
+        Then the colours are shortened to hex codes
+        And out of range channels are capped at 255
+        """
+        # Given
+        svg_image = (
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            '<path d="M0,0" fill="rgb(0, 51, 102)" stroke="rgb(300, 0, 0)"/>'
+            "</svg>"
+        )
+
+        # When
+        minified_svg: str = minify_svg(svg_image=svg_image, decimal_places=1)
+
+        # Then
+        assert 'fill="#036"' in minified_svg
+        assert 'stroke="#f00"' in minified_svg
+
+    @mock.patch(f"{MODULE_PATH}.config.CHART_SVG_DECIMAL_PLACES", 0)
+    def test_rounds_to_configured_decimal_places_by_default(self):
+        """
+        Given an SVG exported by plotly
+        And the `CHART_SVG_DECIMAL_PLACES` is set to 0
+        When `minify_svg()` is called without `decimal_places`
+        Then the numbers in coordinates are rounded to whole numbers
+
+        Patches:
+            `CHART_SVG_DECIMAL_PLACES`: To set the default decimal places
+        """
+        # Given
+        svg_image = FAKE_PLOTLY_SVG
+
+        # When
+        minified_svg: str = minify_svg(svg_image=svg_image)
+
+        # Then
+        assert 'd="M54,291L108,0"' in minified_svg
+        assert 'x="10"' in minified_svg
+
+
+class TestOptimizeSVG:
+    @mock.patch(f"{MODULE_PATH}.minify_svg")
+    def test_delegates_to_minify_svg_by_default(self, spy_minify_svg: mock.MagicMock):
+        """
+        Given an SVG image
+        When `optimize_svg()` is called with the "minify" optimizer
+        Then the call is delegated to `minify_svg()`
+
+        Patches:
+            `spy_minify_svg`: For the main assertion
+        """
+        # Given
+        svg_image = b"<svg/>"
+
+        # When
+        optimized_svg: str = optimize_svg(svg_image=svg_image, optimizer="minify")
+
+        # Then
+        spy_minify_svg.assert_called_once_with(svg_image=svg_image)
+        assert optimized_svg == spy_minify_svg.return_value
+
+    @mock.patch(f"{MODULE_PATH}.scour.scourString")
+    def test_delegates_to_scour_when_selected(self, spy_scour_string: mock.MagicMock):
+        """
+        Given an SVG image
+        When `optimize_svg()` is called with the "scour" optimizer
+        Then the call is delegated to `scourString()`
+
+        Patches:
+            `spy_scour_string`: For the main assertion
+        """
+        # Given
+        svg_image = b"<svg/>"
+
+        # When
+        optimized_svg: str = optimize_svg(svg_image=svg_image, optimizer="scour")
+
+        # Then
+        spy_scour_string.assert_called_once_with(in_string=svg_image)
+        assert optimized_svg == spy_scour_string.return_value
+
+
+class TestEncodeSVG:
+    @pytest.mark.parametrize(
+        "chart_encoding, expected_encoded_svg",
+        (
+            ["uri", urllib.parse.quote_plus(FAKE_PLOTLY_SVG)],
+            ["base64", base64.b64encode(FAKE_PLOTLY_SVG.encode("utf-8")).decode()],
+            ["raw", FAKE_PLOTLY_SVG],
+        ),
+    )
+    def test_applies_chart_encoding(
+        self, chart_encoding: str, expected_encoded_svg: str
+    ):
+        """
+        Given an SVG
+        When `encode_svg()` is called with a `chart_encoding`
+        Then the SVG is encoded accordingly
+        """
+        # Given
+        svg = FAKE_PLOTLY_SVG
+
+        # When
+        encoded_svg: str = encode_svg(svg=svg, chart_encoding=chart_encoding)
+
+        # Then
+        assert encoded_svg == expected_encoded_svg
@@ -22,6 +22,9 @@ from metrics.interfaces.charts.single_category_charts.access import (
 )
 from metrics.interfaces.charts.common.exceptions import InvalidFileFormatError
 from metrics.interfaces.charts.common.chart_output import ChartOutput
+from metrics.interfaces.charts.common.shared_data import (
+    share_chart_data_across_widths,
+)
 from metrics.interfaces.plots.access import InvalidPlotParametersError
 from tests.fakes.factories.metrics.core_time_series_factory import (
     FakeCoreTimeSeriesFactory,
@@ -359,6 +362,54 @@ class TestChartsInterface:
         # Check that the latest_date is set on the `ChartsInterface`
         spy_set_latest_date_from_plots_data.assert_called_once()
 
+    @mock.patch.object(ChartsInterface, "_set_latest_date_from_plots_data")
+    def test_build_chart_plots_data_shares_plots_data_across_widths(
+        self,
+        mocked_set_latest_date_from_plots_data: mock.MagicMock,
+        fake_chart_plot_parameters: PlotParameters,
+    ):
+        """
+        Given 2 `ChartRequestParams` models which only differ by their chart width
+        When `_build_chart_plots_data()` is called for each
+            within a `share_chart_data_across_widths()` block
+        Then the `build_plots_data()` method on the `PlotsInterface`
+            is only called for the first chart width
+
+        Patches:
+            `mocked_set_latest_date_from_plots_data`: To remove the side effect
+                of extracting the latest date from the mocked plots data
+        """
+        # Given
+        spy_plots_interface = mock.MagicMock()
+        charts_interfaces = [
+            ChartsInterface(
+                chart_request_params=ChartRequestParams(
+                    plots=[fake_chart_plot_parameters],
+                    file_format="svg",
+                    chart_width=chart_width,
+                    chart_height=260,
+                    x_axis="date",
+                    y_axis="metric",
+                ),
+                plots_interface=spy_plots_interface,
+            )
+            for chart_width in (1100, 515)
+        ]
+
+        # When
+        with share_chart_data_across_widths():
+            plots_data_for_each_width = [
+                charts_interface._build_chart_plots_data()
+                for charts_interface in charts_interfaces
+            ]
+
+        # Then
+        spy_plots_interface.build_plots_data.assert_called_once()
+        assert (
+            plots_data_for_each_width
+            == [spy_plots_interface.build_plots_data.return_value] * 2
+        )
+
     def test_set_latest_date_from_plots_data_fails_silently_when_latest_date_not_provided(
         self, fake_chart_plot_parameters
     ):
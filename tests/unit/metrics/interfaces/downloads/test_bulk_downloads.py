@@ -0,0 +1,127 @@
+import datetime
+from unittest import mock
+
+from metrics.data.managers.core_models.headline import CoreHeadlineManager
+from metrics.data.managers.core_models.time_series import CoreTimeSeriesManager
+from metrics.interfaces.downloads.bulk_downloads import get_data_version_for_metrics
+
+
+class TestGetDataVersionForMetrics:
+    @staticmethod
+    def _build_mocked_core_model_manager(
+        *,
+        spec: type,
+        latest_refresh_date: datetime.datetime | None,
+        latest_released_embargo: datetime.datetime | None,
+    ) -> mock.Mock:
+        mocked_core_model_manager = mock.Mock(spec=spec)
+        mocked_core_model_manager.find_latest_refresh_date_and_released_embargo_for_metrics.return_value = (
+            latest_refresh_date,
+            latest_released_embargo,
+        )
+        return mocked_core_model_manager
+
+    def test_delegates_calls_to_each_core_model_manager(self):
+        """
+        Given a number of metric names
+        When `get_data_version_for_metrics()` is called
+        Then each of the core model managers
+            is queried for the same metric names
+        """
+        # Given
+        metric_names = frozenset(
+            {"COVID-19_cases_casesByDay", "COVID-19_headline_7DayAdmissions"}
+        )
+        spy_core_time_series_manager = self._build_mocked_core_model_manager(
+            spec=CoreTimeSeriesManager,
+            latest_refresh_date=None,
+            latest_released_embargo=None,
+        )
+        spy_core_headline_manager = self._build_mocked_core_model_manager(
+            spec=CoreHeadlineManager,
+            latest_refresh_date=None,
+            latest_released_embargo=None,
+        )
+
+        # When
+        get_data_version_for_metrics(
+            metric_names,
+            core_time_series_manager=spy_core_time_series_manager,
+            core_headline_manager=spy_core_headline_manager,
+        )
+
+        # Then
+        spy_core_time_series_manager.find_latest_refresh_date_and_released_embargo_for_metrics.assert_called_once_with(
+            metrics=metric_names
+        )
+        spy_core_headline_manager.find_latest_refresh_date_and_released_embargo_for_metrics.assert_called_once_with(
+            metrics=metric_names
+        )
+
+    def test_returns_token_built_from_timestamps_of_each_core_model(self):
+        """
+        Given core model managers which return
+            the latest `refresh_date` and released `embargo`
+        When `get_data_version_for_metrics()` is called
+        Then the token holds the timestamps for the timeseries
+            followed by the timestamps for the headlines
+        """
+        # Given
+        latest_refresh_date = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+        latest_released_embargo = datetime.datetime(2024, 1, 2, tzinfo=datetime.UTC)
+        mocked_core_time_series_manager = self._build_mocked_core_model_manager(
+            spec=CoreTimeSeriesManager,
+            latest_refresh_date=latest_refresh_date,
+            latest_released_embargo=latest_released_embargo,
+        )
+        mocked_core_headline_manager = self._build_mocked_core_model_manager(
+            spec=CoreHeadlineManager,
+            latest_refresh_date=None,
+            latest_released_embargo=None,
+        )
+
+        # When
+        data_version: str = get_data_version_for_metrics(
+            frozenset({"COVID-19_cases_casesByDay"}),
+            core_time_series_manager=mocked_core_time_series_manager,
+            core_headline_manager=mocked_core_headline_manager,
+        )
+
+        # Then
+        assert data_version == (
+            f"{latest_refresh_date}|{latest_released_embargo}|None|None"
+        )
+
+    def test_token_changes_when_an_embargo_is_lifted(self):
+        """
+        Given a core model manager which returns a later released `embargo`
+            on its second call, with the same `refresh_date`
+        When `get_data_version_for_metrics()` is called twice
+        Then the 2 tokens are different
+        """
+        # Given
+        latest_refresh_date = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+        mocked_core_time_series_manager = mock.Mock(spec=CoreTimeSeriesManager)
+        mocked_core_time_series_manager.find_latest_refresh_date_and_released_embargo_for_metrics.side_effect = [
+            (latest_refresh_date, datetime.datetime(2024, 1, 2, tzinfo=datetime.UTC)),
+            (latest_refresh_date, datetime.datetime(2024, 1, 3, tzinfo=datetime.UTC)),
+        ]
+        mocked_core_headline_manager = self._build_mocked_core_model_manager(
+            spec=CoreHeadlineManager,
+            latest_refresh_date=None,
+            latest_released_embargo=None,
+        )
+        metric_names = frozenset({"COVID-19_cases_casesByDay"})
+
+        # When
+        data_versions = [
+            get_data_version_for_metrics(
+                metric_names,
+                core_time_series_manager=mocked_core_time_series_manager,
+                core_headline_manager=mocked_core_headline_manager,
+            )
+            for _ in range(2)
+        ]
+
+        # Then
+        assert data_versions[0] != data_versions[1]
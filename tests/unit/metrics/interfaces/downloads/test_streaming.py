@@ -0,0 +1,94 @@
+from unittest import mock
+
+from metrics.interfaces.downloads.streaming import (
+    iterate_queryset_in_chunks,
+    should_stream_download,
+)
+
+MODULE_PATH = "metrics.interfaces.downloads.streaming"
+
+
+class TestShouldStreamDownload:
+    def test_returns_false_for_headline_data(self):
+        """
+        Given a queryset of headline data
+        When `should_stream_download()` is called
+        Then False is returned
+        And the database is not queried
+        """
+        # Given
+        spy_queryset = mock.MagicMock()
+
+        # When
+        should_stream: bool = should_stream_download(
+            queryset=spy_queryset, metric_group="headline"
+        )
+
+        # Then
+        assert not should_stream
+        spy_queryset.__getitem__.assert_not_called()
+
+    def test_checks_for_record_beyond_threshold(self):
+        """
+        Given a queryset of timeseries data
+        When `should_stream_download()` is called
+        Then the queryset is checked for a record beyond the threshold
+        """
+        # Given
+        spy_queryset = mock.MagicMock()
+        fake_threshold = 500
+
+        # When
+        should_stream: bool = should_stream_download(
+            queryset=spy_queryset,
+            metric_group="cases",
+            threshold=fake_threshold,
+        )
+
+        # Then
+        spy_queryset.__getitem__.assert_called_once_with(slice(fake_threshold, None))
+        sliced_queryset = spy_queryset.__getitem__.return_value
+        sliced_queryset.exists.assert_called_once()
+        assert should_stream == sliced_queryset.exists.return_value
+
+    @mock.patch(f"{MODULE_PATH}.config.DOWNLOADS_STREAMING_THRESHOLD_IN_ROWS", 123)
+    def test_threshold_defaults_to_config(self):
+        """
+        Given a queryset of timeseries data
+        When `should_stream_download()` is called without a threshold
+        Then the `DOWNLOADS_STREAMING_THRESHOLD_IN_ROWS` is used
+
+        Patches:
+            `DOWNLOADS_STREAMING_THRESHOLD_IN_ROWS`: To set the threshold
+        """
+        # Given
+        spy_queryset = mock.MagicMock()
+
+        # When
+        should_stream_download(queryset=spy_queryset, metric_group="cases")
+
+        # Then
+        spy_queryset.__getitem__.assert_called_once_with(slice(123, None))
+
+
+class TestIterateQuerysetInChunks:
+    @mock.patch(f"{MODULE_PATH}.config.DOWNLOADS_STREAMING_CHUNK_SIZE", 250)
+    def test_iterates_queryset_with_configured_chunk_size(self):
+        """
+        Given a queryset
+        When `iterate_queryset_in_chunks()` is called
+        Then the records are iterated over
+            in chunks of the `DOWNLOADS_STREAMING_CHUNK_SIZE`
+
+        Patches:
+            `DOWNLOADS_STREAMING_CHUNK_SIZE`: To set the chunk size
+        """
+        # Given
+        spy_queryset = mock.MagicMock()
+
+        # When
+        records = iterate_queryset_in_chunks(queryset=spy_queryset)
+
+        # Then
+        spy_queryset.iterator.assert_called_once_with(chunk_size=250)
+        assert records == spy_queryset.iterator.return_value
@@ -0,0 +1,43 @@
+from unittest import mock
+
+from django.core.management import call_command
+
+from metrics.interfaces.charts.common.benchmarking import (
+    ChartRenderingBenchmarkResult,
+)
+
+MODULE_PATH = "metrics.interfaces.management.commands.benchmark_chart_rendering"
+
+
+class TestBenchmarkChartRenderingCommand:
+    @mock.patch(f"{MODULE_PATH}.benchmark_chart_renderer_pool")
+    def test_delegates_call_successfully(
+        self, spy_benchmark_chart_renderer_pool: mock.MagicMock
+    ):
+        """
+        Given an instance of the app
+        When a call is made to the custom management command
+            `benchmark_chart_rendering`
+        Then the call is delegated to the `benchmark_chart_renderer_pool()` function
+
+        Patches:
+            `spy_benchmark_chart_renderer_pool`: For the main assertion
+        """
+        # Given
+        spy_benchmark_chart_renderer_pool.return_value = [
+            ChartRenderingBenchmarkResult(
+                pool_size=2,
+                renders=40,
+                p50_latency_seconds=0.1,
+                p95_latency_seconds=0.2,
+                throughput_per_second=20.0,
+            )
+        ]
+
+        # When
+        call_command("benchmark_chart_rendering", pool_sizes=[0, 2], concurrency=3)
+
+        # Then
+        spy_benchmark_chart_renderer_pool.assert_called_once_with(
+            pool_sizes=[0, 2], concurrency=3, renders_per_chart=10
+        )
@@ -0,0 +1,36 @@
+from unittest import mock
+
+from django.core.management import call_command
+
+MODULE_PATH = (
+    "metrics.interfaces.management.commands.benchmark_private_api_cache_hydration"
+)
+
+
+class TestBenchmarkPrivateAPICacheHydrationCommand:
+    @mock.patch(f"{MODULE_PATH}.benchmark_reserved_cache_refresh")
+    def test_delegates_call_successfully(
+        self, spy_benchmark_reserved_cache_refresh: mock.MagicMock
+    ):
+        """
+        Given an instance of the app
+        When a call is made to the custom management command
+            `benchmark_private_api_cache_hydration`
+        Then the call is delegated to the `benchmark_reserved_cache_refresh()` function
+
+        Patches:
+            `spy_benchmark_reserved_cache_refresh`: For the main assertion
+        """
+        # Given
+        spy_benchmark_reserved_cache_refresh.return_value = {
+            "unbuffered": 2.0,
+            "batched": 1.0,
+        }
+
+        # When
+        call_command("benchmark_private_api_cache_hydration", batch_size=50)
+
+        # Then
+        spy_benchmark_reserved_cache_refresh.assert_called_once_with(
+            cache_write_batch_size=50, refresh_count=1
+        )
@@ -0,0 +1,44 @@
+from unittest import mock
+
+from django.core.management import call_command
+
+from metrics.interfaces.charts.common.benchmarking import (
+    SVGOptimizationBenchmarkResult,
+)
+
+MODULE_PATH = "metrics.interfaces.management.commands.benchmark_svg_optimization"
+
+
+class TestBenchmarkSVGOptimizationCommand:
+    @mock.patch(f"{MODULE_PATH}.benchmark_svg_optimizers")
+    def test_delegates_call_successfully(
+        self, spy_benchmark_svg_optimizers: mock.MagicMock
+    ):
+        """
+        Given an instance of the app
+        When a call is made to the custom management command
+            `benchmark_svg_optimization`
+        Then the call is delegated to the `benchmark_svg_optimizers()` function
+
+        Patches:
+            `spy_benchmark_svg_optimizers`: For the main assertion
+        """
+        # Given
+        spy_benchmark_svg_optimizers.return_value = [
+            SVGOptimizationBenchmarkResult(
+                optimizer="minify",
+                rendered_bytes=100,
+                optimized_bytes=60,
+                uri_encoded_bytes=90,
+                base64_encoded_bytes=80,
+                cpu_seconds_per_chart=0.001,
+            )
+        ]
+
+        # When
+        call_command("benchmark_svg_optimization", optimizers=["minify", "scour"])
+
+        # Then
+        spy_benchmark_svg_optimizers.assert_called_once_with(
+            optimizers=["minify", "scour"], repeats=10
+        )
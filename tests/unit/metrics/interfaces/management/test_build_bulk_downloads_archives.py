@@ -0,0 +1,30 @@
+from unittest import mock
+
+from django.core.management import call_command
+
+from metrics.interfaces.downloads.bulk_downloads import get_data_version_for_metrics
+
+MODULE_PATH = "metrics.interfaces.management.commands.build_bulk_downloads_archives"
+
+
+class TestBuildBulkDownloadsArchivesCommand:
+    @mock.patch(f"{MODULE_PATH}.rebuild_bulk_downloads_archives")
+    def test_delegates_call_successfully(
+        self, spy_rebuild_bulk_downloads_archives: mock.MagicMock
+    ):
+        """
+        Given an instance of the app
+        When a call is made to the custom management command `build_bulk_downloads_archives`
+        Then the call is delegated to the `rebuild_bulk_downloads_archives()` function
+            with the data versions resolved from the database
+
+        Patches:
+            `spy_rebuild_bulk_downloads_archives`: For the main assertion
+        """
+        # Given / When
+        call_command("build_bulk_downloads_archives")
+
+        # Then
+        spy_rebuild_bulk_downloads_archives.assert_called_once_with(
+            data_version_resolver=get_data_version_for_metrics
+        )
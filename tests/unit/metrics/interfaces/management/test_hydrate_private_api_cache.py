@@ -2,13 +2,18 @@ from unittest import mock
 
 from django.core.management import call_command
 
+from metrics.interfaces.downloads.bulk_downloads import get_data_version_for_metrics
+
 MODULE_PATH = "metrics.interfaces.management.commands.hydrate_private_api_cache"
 
 
 class TestHydratePrivateAPICommand:
+    @mock.patch(f"{MODULE_PATH}.rebuild_bulk_downloads_archives")
     @mock.patch(f"{MODULE_PATH}.refresh_default_cache")
     def test_delegates_call_successfully(
-        self, spy_refresh_default_cache: mock.MagicMock
+        self,
+        spy_refresh_default_cache: mock.MagicMock,
+        mocked_rebuild_bulk_downloads_archives: mock.MagicMock,
     ):
         """
         Given an instance of the app
@@ -17,9 +22,46 @@ class TestHydratePrivateAPICommand:
 
         Patches:
             `spy_refresh_default_cache`: For the main assertion
+            `mocked_rebuild_bulk_downloads_archives`: To remove
+                the side effect of crawling for the bulk downloads
         """
         # Given / When
         call_command("hydrate_private_api_cache")
 
         # Then
         spy_refresh_default_cache.assert_called_once()
+
+    @mock.patch(f"{MODULE_PATH}.rebuild_bulk_downloads_archives")
+    @mock.patch(f"{MODULE_PATH}.refresh_default_cache")
+    def test_rebuilds_bulk_downloads_archives_after_refreshing_cache(
+        self,
+        spy_refresh_default_cache: mock.MagicMock,
+        spy_rebuild_bulk_downloads_archives: mock.MagicMock,
+    ):
+        """
+        Given an instance of the app
+        When a call is made to the custom management command `hydrate_private_api_cache`
+        Then the bulk downloads archives are rebuilt
+            after the default cache has been refreshed
+
+        Patches:
+            `spy_refresh_default_cache`: To check the order of the calls
+            `spy_rebuild_bulk_downloads_archives`: For the main assertion
+        """
+        # Given
+        spy_manager = mock.Mock()
+        spy_manager.attach_mock(spy_refresh_default_cache, "refresh_default_cache")
+        spy_manager.attach_mock(
+            spy_rebuild_bulk_downloads_archives, "rebuild_bulk_downloads_archives"
+        )
+
+        # When
+        call_command("hydrate_private_api_cache")
+
+        # Then
+        assert spy_manager.mock_calls == [
+            mock.call.refresh_default_cache(),
+            mock.call.rebuild_bulk_downloads_archives(
+                data_version_resolver=get_data_version_for_metrics
+            ),
+        ]
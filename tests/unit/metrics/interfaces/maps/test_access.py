@@ -1,8 +1,8 @@
+import datetime
 from unittest import mock
 
 import pytest
 
-from metrics.data.models.core_models import Geography
 from metrics.domain.models.map import (
     MapAccompanyingPoint,
     MapAccompanyingPointOptionalParameters,
@@ -10,6 +10,7 @@ from metrics.domain.models.map import (
     MapMainParameters,
 )
 from metrics.interfaces.maps.access import (
+    AccompanyingPointResult,
     MapsInterface,
     GeographyNotFoundForAccompanyingPointError,
     MapGeographyResult,
@@ -68,6 +69,7 @@ class TestMapsInterface:
             maps_interface._get_related_geography_for_accompanying_point(
                 accompanying_point=accompanying_point,
                 main_geography=main_geography,
+                geography_codes={},
             )
         )
 
@@ -126,6 +128,7 @@ class TestMapsInterface:
             maps_interface._get_related_geography_for_accompanying_point(
                 accompanying_point=accompanying_point,
                 main_geography=main_geography,
+                geography_codes={},
             )
         )
 
@@ -134,28 +137,21 @@ class TestMapsInterface:
 
     def test_fetch_related_geography_by_type_raises_error(self):
         """
-        Given a payload for a geography which cannot be found
+        Given a geography which cannot be found
+            and therefore has no geography code
         When `_fetch_related_geography_by_type()` is called
             from an instance of the `MapsInterface`
         Then a `GeographyNotFoundForAccompanyingPointError` is raised
         """
         # Given
-        geography = "Leeds"
         main_geography_type = "Upper Tier Local Authority"
         target_geography_type = "Government Office Region"
-        mocked_geography_manager = mock.Mock()
-        mocked_geography_manager.get_geography_code_for_geography.side_effect = [
-            Geography.DoesNotExist
-        ]
-        maps_interface = MapsInterface(
-            maps_parameters=mock.Mock(),
-            geography_manager=mocked_geography_manager,
-        )
+        maps_interface = MapsInterface(maps_parameters=mock.Mock())
 
         # When / Then
         with pytest.raises(GeographyNotFoundForAccompanyingPointError):
             maps_interface._fetch_related_geography_by_type(
-                geography=geography,
+                geography_code=None,
                 main_geography_type=main_geography_type,
                 target_geography_type=target_geography_type,
             )
@@ -171,26 +167,45 @@ class TestMapsInterface:
         Then a `GeographyNotFoundForAccompanyingPointError` is raised
         """
         # Given
-        geography = "Leeds"
         main_geography_type = "Upper Tier Local Authority"
         target_geography_type = "UKHSA Super-Region"
-        mocked_geography_manager = mock.Mock()
-        mocked_geography_manager.get_geography_code_for_geography.return_value = (
-            "E08000035"
-        )
-        maps_interface = MapsInterface(
-            maps_parameters=mock.Mock(),
-            geography_manager=mocked_geography_manager,
-        )
+        maps_interface = MapsInterface(maps_parameters=mock.Mock())
 
         # When / Then
         with pytest.raises(GeographyNotFoundForAccompanyingPointError):
             maps_interface._fetch_related_geography_by_type(
-                geography=geography,
+                geography_code="E08000035",
                 main_geography_type=main_geography_type,
                 target_geography_type=target_geography_type,
             )
 
+    def test_fetch_related_geography_by_type_returns_related_geography(self):
+        """
+        Given the geography code for `Leeds`
+        When `_fetch_related_geography_by_type()` is called
+            from an instance of the `MapsInterface`
+            for the `Region` geography type
+        Then the related region is returned
+        And no queries are made for the geography
+        """
+        # Given
+        spy_geography_manager = mock.Mock()
+        maps_interface = MapsInterface(
+            maps_parameters=mock.Mock(),
+            geography_manager=spy_geography_manager,
+        )
+
+        # When
+        related_geography: str = maps_interface._fetch_related_geography_by_type(
+            geography_code="E08000035",
+            main_geography_type="Upper Tier Local Authority",
+            target_geography_type="Region",
+        )
+
+        # Then
+        assert related_geography == "Yorkshire and The Humber"
+        assert not spy_geography_manager.method_calls
+
     def test_create_null_geography_result(self):
         """
         Given a geography which cannot be found
@@ -201,18 +216,13 @@ class TestMapsInterface:
         """
         # Given
         geography = "Invalid geography"
-        mocked_geography_manager = mock.Mock()
-        mocked_geography_manager.get_geography_code_for_geography.side_effect = [
-            Geography.DoesNotExist
-        ]
-        maps_interface = MapsInterface(
-            maps_parameters=mock.Mock(),
-            geography_manager=mocked_geography_manager,
-        )
+        maps_interface = MapsInterface(maps_parameters=mock.Mock())
 
         # When
         map_geography_result: MapGeographyResult = (
-            maps_interface._create_null_geography_result(geography=geography)
+            maps_interface._create_null_geography_result(
+                geography=geography, geography_codes={"Leeds": "E08000035"}
+            )
         )
 
         # Then
@@ -226,14 +236,15 @@ class TestMapsInterface:
         assert map_geography_result.accompanying_points is None
 
     @mock.patch.object(MapsInterface, "_get_related_geography_for_accompanying_point")
-    def test_process_accompanying_point_returns_none_when_geography_not_found(
+    def test_process_accompanying_point_omits_geography_when_not_found(
         self, mocked_get_related_geography_for_accompanying_point: mock.Mock
     ):
         """
         Given a geography which cannot be found
         When `_process_accompanying_point() is called
             from an instance of the `MapsInterface`
-        Then None is returned
+        Then the geography is omitted from the returned results
+        And no query is made for the accompanying point
         """
         # Given
         mocked_get_related_geography_for_accompanying_point.side_effect = [
@@ -241,16 +252,179 @@ class TestMapsInterface:
         ]
         geography = "Invalid geography"
         mocked_accompanying_point = mock.Mock()
-        maps_interface = MapsInterface(maps_parameters=mock.Mock())
+        spy_core_time_series_manager = mock.Mock()
+        maps_interface = MapsInterface(
+            maps_parameters=mock.Mock(),
+            core_time_series_manager=spy_core_time_series_manager,
+        )
 
         # When
-        accompanying_point = maps_interface._process_accompanying_point(
-            accompanying_point=mocked_accompanying_point, geography=geography
+        accompanying_point_results = maps_interface._process_accompanying_point(
+            accompanying_point=mocked_accompanying_point,
+            geographies=[geography],
+            geography_codes={},
         )
 
         # Then
         mocked_get_related_geography_for_accompanying_point.assert_called_once_with(
             accompanying_point=mocked_accompanying_point,
             main_geography=geography,
+            geography_codes={},
+        )
+        assert accompanying_point_results == {}
+        spy_core_time_series_manager.query_for_latest_values_by_geography.assert_not_called()
+
+    def test_query_for_main_data_geographies_returns_empty_dict_without_querying(
+        self,
+    ):
+        """
+        Given no geographies to query for
+        When `_query_for_main_data_geographies() is called
+            from an instance of the `MapsInterface`
+        Then an empty dict is returned
+        And no query is made for the main data
+        """
+        # Given
+        spy_core_time_series_manager = mock.Mock()
+        maps_interface = MapsInterface(
+            maps_parameters=mock.Mock(),
+            core_time_series_manager=spy_core_time_series_manager,
+        )
+
+        # When
+        main_data_results = maps_interface._query_for_main_data_geographies(
+            geographies=[]
+        )
+
+        # Then
+        assert main_data_results == {}
+        spy_core_time_series_manager.query_for_latest_values_by_geography.assert_not_called()
+
+    def test_build_maps_data_makes_one_query_for_each_metric(self):
+        """
+        Given a `MapsParameters` model for 3 geographies
+            with an accompanying point for the related region
+        When `build_maps_data()` is called
+            from an instance of the `MapsInterface`
+        Then the main metric is queried once for all geographies
+        And the accompanying point is queried once for all related regions
+        And the results are assembled for each geography
+        """
+        # Given
+        utla = "Upper Tier Local Authority"
+        accompanying_point = MapAccompanyingPoint(
+            label_prefix="Region:",
+            label_suffix="",
+            parameters=MapAccompanyingPointOptionalParameters(
+                theme="infectious_disease",
+                sub_theme="respiratory",
+                topic="COVID-19",
+                metric="COVID-19_cases_countRollingMean",
+                age="all",
+                sex="all",
+                stratum="default",
+                geography_type="Region",
+                geography=None,
+            ),
+        )
+        maps_parameters = MapsParameters(
+            date_from="2020-01-01",
+            date_to="2020-12-31",
+            parameters=MapMainParameters(
+                theme="infectious_disease",
+                sub_theme="respiratory",
+                topic="COVID-19",
+                metric="COVID-19_cases_countRollingMean",
+                stratum="default",
+                age="all",
+                sex="all",
+                geography_type=utla,
+                geographies=["Hackney", "Leeds", "Invalid geography"],
+            ),
+            accompanying_points=[accompanying_point],
+        )
+        mocked_geography_manager = mock.Mock()
+        mocked_geography_manager.get_geographies_by_geography_type.return_value = [
+            {"name": "Hackney", "geography_code": "E09000012"},
+            {"name": "Leeds", "geography_code": "E08000035"},
+        ]
+        date_stamp = datetime.date(year=2020, month=1, day=1)
+        spy_core_time_series_manager = mock.Mock()
+        spy_core_time_series_manager.query_for_latest_values_by_geography.side_effect = [
+            {
+                "Hackney": {
+                    "geography_code": "E09000012",
+                    "date": date_stamp,
+                    "metric_value": 3,
+                },
+                "Leeds": {
+                    "geography_code": "E08000035",
+                    "date": date_stamp,
+                    "metric_value": 9,
+                },
+            },
+            {
+                "London": {
+                    "geography_code": "E12000007",
+                    "date": date_stamp,
+                    "metric_value": 7,
+                },
+            },
+        ]
+        maps_interface = MapsInterface(
+            maps_parameters=maps_parameters,
+            core_time_series_manager=spy_core_time_series_manager,
+            geography_manager=mocked_geography_manager,
+        )
+
+        # When
+        results, associated_dates = maps_interface.build_maps_data()
+
+        # Then
+        query_calls = (
+            spy_core_time_series_manager.query_for_latest_values_by_geography.call_args_list
         )
-        assert accompanying_point is None
+        assert len(query_calls) == 2
+        assert query_calls[0].kwargs["geographies"] == [
+            "Hackney",
+            "Leeds",
+            "Invalid geography",
+        ]
+        assert query_calls[1].kwargs["geographies"] == {
+            "London",
+            "Yorkshire and The Humber",
+        }
+        mocked_geography_manager.get_geography_code_for_geography.assert_not_called()
+
+        assert associated_dates == {date_stamp}
+        assert results == [
+            MapGeographyResult(
+                geography_code="E09000012",
+                geography_type=utla,
+                geography="Hackney",
+                metric_value=3,
+                accompanying_points=[
+                    AccompanyingPointResult(
+                        label_prefix="Region:", label_suffix="", metric_value=7
+                    )
+                ],
+            ),
+            MapGeographyResult(
+                geography_code="E08000035",
+                geography_type=utla,
+                geography="Leeds",
+                metric_value=9,
+                accompanying_points=[
+                    AccompanyingPointResult(
+                        label_prefix="Region:", label_suffix="", metric_value=None
+                    )
+                ],
+            ),
+            MapGeographyResult(
+                geography_code="",
+                geography_type=utla,
+                geography="Invalid geography",
+                metric_value=None,
+                accompanying_points=None,
+            ),
+        ]
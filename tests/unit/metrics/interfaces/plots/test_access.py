@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 
+from metrics.data.managers.core_models.time_series import CoreTimeSeriesManager
 from metrics.domain.models import (
     PlotGenerationData,
     PlotParameters,
@@ -11,6 +12,7 @@ from metrics.domain.models import (
 )
 from metrics.domain.models.plots import CompletePlotData
 from metrics.domain.common.utils import ChartAxisFields
+from metrics.domain.models.plot_columns import PlotColumns, to_list
 from metrics.interfaces.plots.access import (
     DataNotFoundForAnyPlotError,
     DataNotFoundForPlotError,
@@ -141,18 +143,20 @@ class TestPlotsInterface:
 
         # Check that the `PlotData` model was enriched
         # for the plot parameters which requested timeseries data that existed
-        expected_plots_data_for_valid_params = PlotGenerationData(
-            parameters=valid_plot_parameters,
-            x_axis_values=[x.date for x in fake_core_time_series_records],
-            y_axis_values=[x.metric_value for x in fake_core_time_series_records],
-            additional_values={
-                "in_reporting_delay_period": [
-                    x.in_reporting_delay_period for x in fake_core_time_series_records
-                ]
-            },
-            latest_date=str(max(x.date for x in fake_core_time_series_records)),
-        )
-        assert plots_data == [expected_plots_data_for_valid_params]
+        plot_data: PlotGenerationData = plots_data[0]
+        assert plot_data.parameters == valid_plot_parameters
+        assert to_list(values=plot_data.x_axis_values) == [
+            x.date for x in fake_core_time_series_records
+        ]
+        assert to_list(values=plot_data.y_axis_values) == [
+            x.metric_value for x in fake_core_time_series_records
+        ]
+        assert to_list(
+            values=plot_data.additional_values["in_reporting_delay_period"]
+        ) == [x.in_reporting_delay_period for x in fake_core_time_series_records]
+        assert plot_data.latest_date == str(
+            max(x.date for x in fake_core_time_series_records)
+        )
 
     def test_build_plots_data_raises_error_when_all_plots_return_no_data(
         self, fake_chart_request_params: ChartRequestParams
@@ -175,6 +179,73 @@ class TestPlotsInterface:
         with pytest.raises(DataNotFoundForAnyPlotError):
             plots_interface.build_plots_data()
 
+    def test_build_plots_data_fetches_plots_which_differ_by_geography_in_1_query(
+        self, fake_chart_plot_parameters: PlotParameters
+    ):
+        """
+        Given 2 timeseries plots which only differ by their `geography`
+        When `build_plots_data()` is called from an instance of the `PlotsInterface`
+        Then the data for both plots is fetched with 1 call
+            to `query_for_data_for_series()`
+        And no individual calls are made to `query_for_data()`
+        And a `PlotGenerationData` model is returned for each plot
+        """
+        # Given
+        plots = [
+            fake_chart_plot_parameters.model_copy(
+                update={
+                    "geography": geography,
+                    "geography_type": "Nation",
+                    "sex": "all",
+                    "age": "all",
+                }
+            )
+            for geography in ("England", "Wales")
+        ]
+        chart_request_params = ChartRequestParams(
+            plots=plots,
+            file_format="svg",
+            chart_width=123,
+            chart_height=456,
+            x_axis="date",
+            y_axis="metric",
+        )
+        spy_core_model_manager = mock.Mock(spec=CoreTimeSeriesManager)
+        fake_dates = [datetime.date(2023, 2, 1), datetime.date(2023, 2, 2)]
+        spy_core_model_manager.query_for_data_for_series.return_value = [
+            (
+                [
+                    {
+                        "date": date,
+                        "metric_value": Decimal(index),
+                        "in_reporting_delay_period": False,
+                    }
+                    for date in fake_dates
+                ],
+                fake_dates[-1],
+            )
+            for index in range(len(plots))
+        ]
+        plots_interface = PlotsInterface(
+            chart_request_params=chart_request_params,
+            core_model_manager=spy_core_model_manager,
+        )
+
+        # When
+        plots_data: list[PlotGenerationData] = plots_interface.build_plots_data()
+
+        # Then
+        spy_core_model_manager.query_for_data_for_series.assert_called_once()
+        spy_core_model_manager.query_for_data.assert_not_called()
+
+        assert [plot_data.parameters for plot_data in plots_data] == plots
+        for index, plot_data in enumerate(plots_data):
+            assert to_list(values=plot_data.x_axis_values) == fake_dates
+            assert to_list(values=plot_data.y_axis_values) == [Decimal(index)] * len(
+                fake_dates
+            )
+            assert plot_data.latest_date == fake_dates[-1]
+
     @mock.patch.object(
         PlotsInterface, "build_plot_data_from_parameters_with_complete_queryset"
     )
@@ -343,10 +414,10 @@ class TestPlotsInterface:
         assert plot_data.parameters == fake_chart_plot_parameters
 
         # Check the correct data is passed to the axis of the `PlotData` model
-        assert plot_data.x_axis_values == [
+        assert to_list(values=plot_data.x_axis_values) == [
             x.date for x in fake_core_time_series_for_plot
         ]
-        assert plot_data.y_axis_values == [
+        assert to_list(values=plot_data.y_axis_values) == [
             x.metric_value for x in fake_core_time_series_for_plot
         ]
 
@@ -424,10 +495,10 @@ class TestPlotsInterface:
                 plot_parameters=fake_chart_plot_parameters
             )
 
-    @mock.patch.object(PlotsInterface, "get_queryset_result_for_plot_parameters")
+    @mock.patch.object(PlotsInterface, "get_queryset_from_core_model_manager")
     def test_build_plot_data_from_parameters_with_complete_queryset_delegates_call(
         self,
-        spy_get_queryset_result_for_plot_parameters: mock.MagicMock,
+        spy_get_queryset_from_core_model_manager: mock.MagicMock,
         fake_chart_plot_parameters: PlotParameters,
     ):
         """
@@ -435,7 +506,7 @@ class TestPlotsInterface:
         When `build_plot_data_from_parameters_with_complete_queryset()`
             is called from an instance of `PlotsInterface`
         Then the call is delegated to the
-            `get_queryset_result_for_plot_parameters()` method to fetch the data
+            `get_queryset_from_core_model_manager()` method to fetch the data
         """
         # Given
         plots_interface = PlotsInterface(
@@ -451,13 +522,58 @@ class TestPlotsInterface:
         )
 
         # Then
-        spy_get_queryset_result_for_plot_parameters.assert_called_once_with(
-            plot_parameters=fake_chart_plot_parameters
+        spy_get_queryset_from_core_model_manager.assert_called_once_with(
+            plot_params={
+                **fake_chart_plot_parameters.to_dict_for_query(),
+                "use_current_view": True,
+            }
         )
         assert complete_plot_data.parameters == fake_chart_plot_parameters
         assert (
             complete_plot_data.queryset
-            == spy_get_queryset_result_for_plot_parameters.return_value.queryset
+            == spy_get_queryset_from_core_model_manager.return_value
+        )
+
+    @mock.patch.object(PlotsInterface, "get_queryset_from_core_model_manager")
+    def test_build_plot_data_from_parameters_with_complete_queryset_ignores_batched_query(
+        self,
+        spy_get_queryset_from_core_model_manager: mock.MagicMock,
+        fake_chart_plot_parameters: PlotParameters,
+    ):
+        """
+        Given a `PlotsInterface` which has its plots
+            registered with a `BatchedPlotsQuery`
+        When `build_plot_data_from_parameters_with_complete_queryset()`
+            is called from the `PlotsInterface`
+        Then the full queryset is fetched from the core model manager
+        And the batched results are not used
+
+        Patches:
+            `spy_get_queryset_from_core_model_manager`: For the main assertion
+        """
+        # Given
+        spy_batched_plots_query = mock.Mock()
+        spy_batched_plots_query.get_result.return_value = ([], None)
+        plots_interface = PlotsInterface(
+            chart_request_params=mock.Mock(plots=[]),
+            core_model_manager=mock.Mock(),
+        )
+        plots_interface.add_plots_to_batched_query(
+            batched_plots_query=spy_batched_plots_query
+        )
+
+        # When
+        complete_plot_data: CompletePlotData = (
+            plots_interface.build_plot_data_from_parameters_with_complete_queryset(
+                plot_parameters=fake_chart_plot_parameters
+            )
+        )
+
+        # Then
+        spy_batched_plots_query.get_result.assert_not_called()
+        assert (
+            complete_plot_data.queryset
+            == spy_get_queryset_from_core_model_manager.return_value
         )
 
     def test_build_plot_data_from_parameters_with_complete_queryset_raises_error_when_no_data_found(
@@ -793,8 +909,12 @@ class TestPlotsInterface:
 
         # The dict representation of the `PlotParameters` model
         # is unpacked into the `get_timeseries` method
+        # and the latest records are read from the current view
         mocked_get_queryset_from_core_model_manager.assert_called_once_with(
-            plot_params=fake_chart_plot_parameters.to_dict_for_query()
+            plot_params={
+                **fake_chart_plot_parameters.to_dict_for_query(),
+                "use_current_view": True,
+            }
         )
 
     @mock.patch.object(PlotsInterface, "get_queryset_from_core_model_manager")
@@ -1051,12 +1171,13 @@ class TestSortByAge:
         aggregated_results = aggregate_results_by_age(queryset=fake_queryset)
 
         # Then
-        assert aggregated_results["age__name"] == [
+        assert isinstance(aggregated_results, PlotColumns)
+        assert to_list(values=aggregated_results["age__name"]) == [
             "00 - 04",
             "55+",
             "all",
         ]
-        assert aggregated_results["metric_value"] == [1, 2, 3]
+        assert to_list(values=aggregated_results["metric_value"]) == [1, 2, 3]
 
 
 class TestBuildAgeDisplayName:
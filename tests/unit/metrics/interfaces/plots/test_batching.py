@@ -0,0 +1,263 @@
+import datetime
+from unittest import mock
+
+from metrics.data.managers.core_models.time_series import CoreTimeSeriesManager
+from metrics.domain.models import PlotParameters
+from metrics.interfaces.plots.batching import BatchedPlotsQuery
+
+MODULE_PATH = "metrics.interfaces.plots.batching"
+
+
+def _build_plot_parameters(**kwargs) -> PlotParameters:
+    params = {
+        "chart_type": "line_multi_coloured",
+        "topic": "COVID-19",
+        "metric": "COVID-19_cases_casesByDay",
+        "geography": "England",
+        "geography_type": "Nation",
+        "stratum": "default",
+        "sex": "all",
+        "age": "all",
+        "date_from": "2023-01-01",
+        "date_to": "2023-12-31",
+        "x_axis": "date",
+        "y_axis": "metric",
+    }
+    params.update(kwargs)
+    return PlotParameters(**params)
+
+
+class TestBatchedPlotsQuery:
+    @staticmethod
+    def _add_plots(
+        batched_plots_query: BatchedPlotsQuery, plots: list[PlotParameters]
+    ) -> None:
+        for plot_parameters in plots:
+            batched_plots_query.add_plot(
+                plot_parameters=plot_parameters,
+                plot_params=plot_parameters.to_dict_for_query(),
+            )
+
+    def test_fetches_plots_which_differ_by_geography_in_1_query(self):
+        """
+        Given 2 plots which only differ by their `geography`
+        When `get_result()` is called for each plot
+            from an instance of the `BatchedPlotsQuery`
+        Then 1 call is made to `query_for_data_for_series()`
+        And the result for each plot is returned in order
+        """
+        # Given
+        england_plot = _build_plot_parameters(geography="England")
+        london_plot = _build_plot_parameters(
+            geography="London", geography_type="UKHSA Region"
+        )
+        spy_core_model_manager = mock.Mock(spec=CoreTimeSeriesManager)
+        england_result = ([{"date": "2023-01-01"}], datetime.date(2023, 1, 1))
+        london_result = ([{"date": "2023-01-02"}], datetime.date(2023, 1, 2))
+        spy_core_model_manager.query_for_data_for_series.return_value = [
+            england_result,
+            london_result,
+        ]
+        batched_plots_query = BatchedPlotsQuery(
+            core_model_manager=spy_core_model_manager
+        )
+        self._add_plots(
+            batched_plots_query=batched_plots_query,
+            plots=[england_plot, london_plot],
+        )
+
+        # When
+        retrieved_england_result = batched_plots_query.get_result(
+            plot_parameters=england_plot
+        )
+        retrieved_london_result = batched_plots_query.get_result(
+            plot_parameters=london_plot
+        )
+
+        # Then
+        assert retrieved_england_result == england_result
+        assert retrieved_london_result == london_result
+
+        plot_params = england_plot.to_dict_for_query()
+        spy_core_model_manager.query_for_data_for_series.assert_called_once_with(
+            topic=plot_params["topic"],
+            metric=plot_params["metric"],
+            date_from=plot_params["date_from"],
+            date_to=plot_params["date_to"],
+            series=[
+                {
+                    "geography": "England",
+                    "geography_type": "Nation",
+                    "stratum": "default",
+                    "sex": "all",
+                    "age": "all",
+                },
+                {
+                    "geography": "London",
+                    "geography_type": "UKHSA Region",
+                    "stratum": "default",
+                    "sex": "all",
+                    "age": "all",
+                },
+            ],
+            fields_to_export=plot_params["fields_to_export"],
+            field_to_order_by=plot_params["field_to_order_by"],
+            theme="",
+            sub_theme="",
+            metric_value_ranges=[],
+            permission_sets=None,
+            use_current_view=True,
+        )
+
+    def test_plots_added_after_execution_are_not_batched(self):
+        """
+        Given a `BatchedPlotsQuery` which has already executed its queries
+        When 2 more plots which only differ by their `geography`
+            are added with `add_plot()`
+        Then None is returned for each of the late plots
+        And no call is made to `query_for_data_for_series()`
+        """
+        # Given
+        plots = [
+            _build_plot_parameters(geography="England"),
+            _build_plot_parameters(geography="London", geography_type="UKHSA Region"),
+        ]
+        spy_core_model_manager = mock.Mock(spec=CoreTimeSeriesManager)
+        batched_plots_query = BatchedPlotsQuery(
+            core_model_manager=spy_core_model_manager
+        )
+        batched_plots_query.get_result(plot_parameters=_build_plot_parameters())
+
+        # When
+        self._add_plots(batched_plots_query=batched_plots_query, plots=plots)
+        results = [
+            batched_plots_query.get_result(plot_parameters=plot_parameters)
+            for plot_parameters in plots
+        ]
+
+        # Then
+        assert results == [None, None]
+        spy_core_model_manager.query_for_data_for_series.assert_not_called()
+
+    def test_plots_for_different_metrics_are_not_batched(self):
+        """
+        Given 2 plots which are for different metrics
+        When `get_result()` is called for each plot
+            from an instance of the `BatchedPlotsQuery`
+        Then None is returned for each plot
+        And no call is made to `query_for_data_for_series()`
+        """
+        # Given
+        plots = [
+            _build_plot_parameters(metric="COVID-19_cases_casesByDay"),
+            _build_plot_parameters(metric="COVID-19_deaths_ONSByDay"),
+        ]
+        spy_core_model_manager = mock.Mock(spec=CoreTimeSeriesManager)
+        batched_plots_query = BatchedPlotsQuery(
+            core_model_manager=spy_core_model_manager
+        )
+        self._add_plots(batched_plots_query=batched_plots_query, plots=plots)
+
+        # When
+        results = [
+            batched_plots_query.get_result(plot_parameters=plot_parameters)
+            for plot_parameters in plots
+        ]
+
+        # Then
+        assert results == [None, None]
+        spy_core_model_manager.query_for_data_for_series.assert_not_called()
+
+    def test_plots_with_unspecified_optional_fields_are_not_batched(self):
+        """
+        Given 2 plots which do not specify an `age`
+        When `get_result()` is called for each plot
+            from an instance of the `BatchedPlotsQuery`
+        Then None is returned for each plot
+        And no call is made to `query_for_data_for_series()`
+        """
+        # Given
+        plots = [
+            _build_plot_parameters(geography="England", age=""),
+            _build_plot_parameters(geography="Wales", age=""),
+        ]
+        spy_core_model_manager = mock.Mock(spec=CoreTimeSeriesManager)
+        batched_plots_query = BatchedPlotsQuery(
+            core_model_manager=spy_core_model_manager
+        )
+        self._add_plots(batched_plots_query=batched_plots_query, plots=plots)
+
+        # When
+        results = [
+            batched_plots_query.get_result(plot_parameters=plot_parameters)
+            for plot_parameters in plots
+        ]
+
+        # Then
+        assert results == [None, None]
+        spy_core_model_manager.query_for_data_for_series.assert_not_called()
+
+    def test_does_not_batch_for_unsupported_core_model_manager(self):
+        """
+        Given 2 plots which only differ by their `geography`
+        And a core model manager which is not a `CoreTimeSeriesManager`
+        When `get_result()` is called
+            from an instance of the `BatchedPlotsQuery`
+        Then None is returned
+        """
+        # Given
+        plots = [
+            _build_plot_parameters(geography="England"),
+            _build_plot_parameters(geography="Wales"),
+        ]
+        spy_core_model_manager = mock.Mock()
+        batched_plots_query = BatchedPlotsQuery(
+            core_model_manager=spy_core_model_manager
+        )
+        self._add_plots(batched_plots_query=batched_plots_query, plots=plots)
+
+        # When
+        result = batched_plots_query.get_result(plot_parameters=plots[0])
+
+        # Then
+        assert result is None
+        spy_core_model_manager.query_for_data_for_series.assert_not_called()
+
+    @mock.patch(f"{MODULE_PATH}.auth.AUTH_ENABLED", True)
+    def test_looks_up_theme_and_sub_theme_once_per_group_when_auth_enabled(self):
+        """
+        Given 3 plots which only differ by their `geography`
+        And authentication is enabled
+        When `get_result()` is called
+            from an instance of the `BatchedPlotsQuery`
+        Then the topic is looked up once
+        And the theme and sub theme are passed to `query_for_data_for_series()`
+
+        Patches:
+            `auth.AUTH_ENABLED`: To enable the permissions checks
+        """
+        # Given
+        plots = [
+            _build_plot_parameters(geography=geography)
+            for geography in ("England", "Wales", "Scotland")
+        ]
+        spy_core_model_manager = mock.Mock(spec=CoreTimeSeriesManager)
+        spy_core_model_manager.query_for_data_for_series.return_value = [
+            mock.Mock()
+        ] * len(plots)
+        spy_topic_model_manager = mock.Mock()
+        batched_plots_query = BatchedPlotsQuery(
+            core_model_manager=spy_core_model_manager,
+            topic_model_manager=spy_topic_model_manager,
+        )
+        self._add_plots(batched_plots_query=batched_plots_query, plots=plots)
+
+        # When
+        batched_plots_query.get_result(plot_parameters=plots[0])
+
+        # Then
+        spy_topic_model_manager.get_by_name.assert_called_once_with(name="COVID-19")
+        topic = spy_topic_model_manager.get_by_name.return_value
+        query_kwargs = spy_core_model_manager.query_for_data_for_series.call_args.kwargs
+        assert query_kwargs["theme"] == topic.sub_theme.theme.name
+        assert query_kwargs["sub_theme"] == topic.sub_theme.name
@@ -1,6 +1,6 @@
 from unittest import mock
 
-from metrics.data.models.api_models import APITimeSeries
+from metrics.data.models.api_models import APITimeSeries, APITimeSeriesDimension
 from public_api.metrics_interface.interface import MetricsPublicAPIInterface
 
 
@@ -20,6 +20,23 @@ class TestMetricsInterface:
         # Then
         assert api_timeseries_model is APITimeSeries
 
+    def test_get_api_timeseries_dimension_model_returns_correct_model(self):
+        """
+        Given the `MetricsPublicAPIInterface` class
+        When `get_api_timeseries_dimension_model()` is called
+        Then the `APITimeSeriesDimension` model is returned
+        """
+        # Given
+        metrics_public_api_interface = MetricsPublicAPIInterface
+
+        # When
+        api_timeseries_dimension_model = (
+            metrics_public_api_interface.get_api_timeseries_dimension_model()
+        )
+
+        # Then
+        assert api_timeseries_dimension_model is APITimeSeriesDimension
+
     @mock.patch("public_api.metrics_interface.interface.AUTH_ENABLED")
     def test_is_auth_enabled_references_setting_in_metrics_app(
         self, mocked_auth_enabled: mock.MagicMock
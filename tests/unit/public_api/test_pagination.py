@@ -0,0 +1,132 @@
+import datetime
+from unittest import mock
+
+import pytest
+from rest_framework.exceptions import NotFound
+
+from public_api.pagination import (
+    CURSOR_MODE,
+    CURSOR_QUERY_PARAM,
+    INVALID_CURSOR_ERROR_MESSAGE,
+    PAGE_NUMBER_MODE,
+    PAGINATION_QUERY_PARAM,
+    SKIP_COUNT_QUERY_PARAM,
+    APITimeSeriesKeysetPagination,
+    Cursor,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class TestCursorEncoding:
+    @pytest.mark.parametrize("reverse", (True, False))
+    def test_decode_cursor_returns_encoded_cursor(self, reverse: bool):
+        """
+        Given a `Cursor` which has been encoded with `encode_cursor()`
+        When `decode_cursor()` is called
+        Then the original `Cursor` is returned
+        """
+        # Given
+        cursor = Cursor(date=datetime.date(2023, 1, 2), id=123, reverse=reverse)
+        encoded_cursor: str = encode_cursor(cursor=cursor)
+
+        # When
+        decoded_cursor: Cursor = decode_cursor(encoded_cursor=encoded_cursor)
+
+        # Then
+        assert decoded_cursor == cursor
+
+    @pytest.mark.parametrize("encoded_cursor", ("abc", "ZD0yMDIzJmk9MQ==", "%%%"))
+    def test_decode_cursor_raises_error_for_invalid_cursor(self, encoded_cursor: str):
+        """
+        Given a cursor token which was not created by `encode_cursor()`
+        When `decode_cursor()` is called
+        Then a `NotFound` error is raised
+        """
+        # Given / When / Then
+        with pytest.raises(NotFound, match=INVALID_CURSOR_ERROR_MESSAGE):
+            decode_cursor(encoded_cursor=encoded_cursor)
+
+
+class TestAPITimeSeriesKeysetPagination:
+    @pytest.mark.parametrize(
+        "default_mode, query_params, expected_uses_cursor",
+        (
+            [PAGE_NUMBER_MODE, {}, False],
+            [CURSOR_MODE, {}, True],
+            [PAGE_NUMBER_MODE, {"pagination": "cursor"}, True],
+            [CURSOR_MODE, {"pagination": "page"}, False],
+            [CURSOR_MODE, {"page": "2"}, False],
+            [PAGE_NUMBER_MODE, {"cursor": "abc"}, True],
+            [CURSOR_MODE, {"pagination": "invalid"}, True],
+        ),
+    )
+    def test_uses_cursor(
+        self,
+        default_mode: str,
+        query_params: dict[str, str],
+        expected_uses_cursor: bool,
+    ):
+        """
+        Given a request with a number of query parameters
+        When `uses_cursor()` is called
+            from an instance of `APITimeSeriesKeysetPagination`
+        Then the mode is chosen from the `pagination` query parameter
+        Or from the presence of the `cursor` or `page` query parameters
+        Or from the `default_mode` of the paginator otherwise
+        """
+        # Given
+        paginator = APITimeSeriesKeysetPagination()
+        paginator.default_mode = default_mode
+        mocked_request = mock.Mock(query_params=query_params)
+
+        # When
+        uses_cursor: bool = paginator.uses_cursor(request=mocked_request)
+
+        # Then
+        assert uses_cursor is expected_uses_cursor
+
+    def test_get_paginated_response_schema_allows_null_count(self):
+        """
+        Given an instance of `APITimeSeriesKeysetPagination`
+        When `get_paginated_response_schema()` is called
+        Then the `count` property is marked as nullable
+            since it is omitted when the count is skipped
+        """
+        # Given
+        paginator = APITimeSeriesKeysetPagination()
+
+        # When
+        paginated_response_schema: dict = paginator.get_paginated_response_schema(
+            schema={"type": "object"}
+        )
+
+        # Then
+        assert paginated_response_schema["properties"]["count"]["nullable"] is True
+        assert paginated_response_schema["properties"]["results"] == {"type": "object"}
+
+    def test_get_schema_operation_parameters_includes_cursor_parameters(self):
+        """
+        Given an instance of `APITimeSeriesKeysetPagination`
+        When `get_schema_operation_parameters()` is called
+        Then the page number parameters are returned
+        Along with the pagination mode, cursor and skip count parameters
+        """
+        # Given
+        paginator = APITimeSeriesKeysetPagination()
+        paginator.page_size_query_param = "page_size"
+
+        # When
+        parameters: list[dict] = paginator.get_schema_operation_parameters(
+            view=mock.Mock()
+        )
+
+        # Then
+        parameter_names: list[str] = [parameter["name"] for parameter in parameters]
+        assert parameter_names == [
+            "page",
+            "page_size",
+            PAGINATION_QUERY_PARAM,
+            CURSOR_QUERY_PARAM,
+            SKIP_COUNT_QUERY_PARAM,
+        ]